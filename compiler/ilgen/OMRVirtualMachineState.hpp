@@ -97,6 +97,12 @@ class VirtualMachineState
 
    public:
 
+   /**
+    * @brief Destroys the state. States are deleted through pointers to this
+    * class (for example by the C client API), so the destructor is virtual.
+    */
+   virtual ~VirtualMachineState() { }
+
    /**
     * @brief Cause all simulated aspects of the virtual machine state to become real.
     * @param b builder object where the operations will be added to change the virtual machine state.
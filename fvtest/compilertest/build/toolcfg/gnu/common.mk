@@ -46,6 +46,7 @@ M4_PATH?=m4
 SED_PATH?=sed
 AR_PATH?=ar
 PERL_PATH?=perl
+PYTHON_PATH?=python3
 
 # The default OS X `as` binary acts differently than clang's built-in
 # assembler, despite identifying as the same in `as --version`.
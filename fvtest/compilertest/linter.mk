@@ -133,8 +133,23 @@ omrchecker_cleanall:
 
 # The core linter bits.
 #
-# linter is the default target, and we construct a pre-req for each
-#  .cpp file.
+# linter is the default target. It runs the lint driver of OMRChecker on
+# all the .cpp files, linting LINTER_JOBS files at a time (0 for all the
+# CPUs). The driver keeps the time each file took in LINTER_HISTORY, to
+# lint the slowest files first on the next run, and prints each
+# diagnostic once, even when it is reported for many files. The results
+# are cached in LINTER_CACHE, and only the files whose own contents, or
+# the contents of a header they include, changed are linted again.
+#
+# Setting LINTER_PCH_HEADER to a header included by all the files, such
+# as one including the common OMR headers, precompiles it once under the
+# object directory and lints every file with it. It is not set by default,
+# as it is only correct for a header every file could include first.
+#
+# The files each file included are recorded in LINTER_INCLUDE_GRAPH.
+# Setting LINTER_SINCE to a git revision, as in
+# `make -f linter.mk LINTER_SINCE=origin/master`, only lints the files changed
+# since that revision, and the files including a changed header.
 #
 linter: omrchecker
 
@@ -152,24 +167,22 @@ linter: omrchecker
 # indicator that we really should be.
 EXCLUDED_DEFINES='-D__sync()=' '-D__lwsync()=' '-D__isync()='
 
-# The clang invocation magic line.
-LINTER_EXTRA=-Xclang -load -Xclang $(OMRCHECKER_OBJECT) -Xclang -add-plugin -Xclang omr-checker
+# The clang flags; the driver adds the ones loading the OMRChecker plugin.
 LINTER_FLAGS=-std=c++0x -w -fsyntax-only $(EXCLUDED_DEFINES) -ferror-limit=0 $(LINTER_FLAGS_EXTRA)
 
-define DEF_RULE.linter
-.PHONY: $(1).linted
-
-$(1).linted: $(1) omrchecker
-	$$(CXX_CMD) $(LINTER_FLAGS) $(LINTER_EXTRA)  $$(patsubst %,-D%,$$(CXX_DEFINES)) $$(patsubst %,-I'%',$$(CXX_INCLUDES)) -o $$@ -c $$<
-linter: $(1).linted
-
-endef # DEF_RULE.linter
-
-RULE.linter=$(eval $(DEF_RULE.linter))
+LINTER_JOBS?=0
+LINTER_HISTORY?=$(FIXED_OBJBASE)/linter_history.json
+LINTER_CACHE?=$(FIXED_OBJBASE)/linter_cache.json
+LINTER_PCH_HEADER?=
+LINTER_INCLUDE_GRAPH?=$(FIXED_OBJBASE)/linter_includes.json
+LINTER_SINCE?=
+LINTER_DRIVER=$(PYTHON_PATH) $(OMRCHECKER_DIR)/lint.py --checker $(OMRCHECKER_OBJECT) --jobs $(LINTER_JOBS) --history $(LINTER_HISTORY) \
+   --cache $(LINTER_CACHE) $(if $(LINTER_PCH_HEADER),--pch $(LINTER_PCH_HEADER) --pch-dir $(FIXED_OBJBASE)) \
+   --include-graph $(LINTER_INCLUDE_GRAPH) $(if $(LINTER_SINCE),--since $(LINTER_SINCE)) $(LINTER_DRIVER_FLAGS)
 
 # The list of sources.
 JIT_CPP_FILES=$(filter %.cpp,$(JIT_PRODUCT_SOURCE_FILES) $(JIT_PRODUCT_BACKEND_SOURCES))
 
-# Construct lint dependencies.
-$(foreach SRCFILE,$(JIT_CPP_FILES),\
-   $(call RULE.linter,$(FIXED_SRCBASE)/$(SRCFILE)))
+linter:
+	$(LINTER_DRIVER) $(patsubst %,$(FIXED_SRCBASE)/%,$(JIT_CPP_FILES)) \
+	   -- $(CXX_CMD) $(LINTER_FLAGS) $(patsubst %,-D%,$(CXX_DEFINES)) $(patsubst %,-I'%',$(CXX_INCLUDES))
@@ -0,0 +1,243 @@
+#! /usr/bin/env python
+
+###############################################################################
+# Copyright (c) 2026, 2026 IBM Corp. and others
+#
+# This program and the accompanying materials are made available under
+# the terms of the Eclipse Public License 2.0 which accompanies this
+# distribution and is available at https://www.eclipse.org/legal/epl-2.0/
+# or the Apache License, Version 2.0 which accompanies this distribution and
+# is available at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# This Source Code may also be made available under the following
+# Secondary Licenses when the conditions for such availability set
+# forth in the Eclipse Public License, v. 2.0 are satisfied: GNU
+# General Public License, version 2 with the GNU Classpath
+# Exception [1] and GNU General Public License, version 2 with the
+# OpenJDK Assembly Exception [2].
+#
+# [1] https://www.gnu.org/software/classpath/license.html
+# [2] http://openjdk.java.net/legal/assembly-exception.html
+#
+# SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+###############################################################################
+
+"""
+A module for reporting the size and complexity of a generated client API.
+
+A report has one row per generated file, one row per (top-level) class,
+and one row for the whole API. Each row has the following metrics:
+
+- `lines`, `bytes`: the size of the generated code
+- `includes`: the number of `#include` directives
+- `services`, `overloads`: the number of services, and how many of those
+  overload another service of the same name
+- `varargs`: the number of services with a vararg variant
+- `marshalling`: the number of array and in-out parameters, each of which
+  needs its arguments copied between client and implementation objects
+
+Class rows count the services of a class and of its nested classes, along
+with the size of the files generated for it. File rows only have the size
+metrics. Reports are written as JSON or CSV, and two reports can be diffed
+to see which files and classes grew.
+
+Reports are produced by `cppgen.py --report FILE`. This module's command
+line diffs two of them:
+
+    python apireport.py old.json new.json
+"""
+
+import os
+import sys
+import csv
+import json
+import argparse
+from collections import OrderedDict
+from genutils import *
+
+size_metrics = ["lines", "bytes", "includes"]
+api_metrics = ["services", "overloads", "varargs", "marshalling"]
+metrics = size_metrics + api_metrics
+
+def file_stats(path):
+    """Returns the size metrics of a file."""
+    with open(path, "rb") as f:
+        data = f.read()
+    lines = data.splitlines()
+    return OrderedDict([ ("lines", len(lines))
+                       , ("bytes", len(data))
+                       , ("includes", len([l for l in lines if l.lstrip().startswith(b"#include")]))
+                       ])
+
+def class_stats(class_desc):
+    """Returns the API metrics of a class, including its nested classes."""
+    stats = OrderedDict((m, 0) for m in api_metrics)
+    services = class_desc.services()
+    names = [s.name() for s in services]
+    stats["services"] = len(services)
+    stats["overloads"] = len(names) - len(set(names))
+    stats["varargs"] = len([s for s in services if s.is_vararg()])
+    for desc in services + class_desc.constructors() + class_desc.callbacks():
+        stats["marshalling"] += len([p for p in desc.parameters() if p.is_array() or p.is_in_out()])
+    for inner in class_desc.inner_classes():
+        for m, v in class_stats(inner).items():
+            stats[m] += v
+    return stats
+
+def make_row(kind, name, class_name=None, stats={}):
+    row = OrderedDict([("kind", kind), ("name", name), ("class", class_name)])
+    for m in metrics:
+        row[m] = stats.get(m)
+    return row
+
+def gen_report(api, files):
+    """
+    Generates the report of a client API, given its description and a
+    dictionary mapping each generated file to the name of the class it
+    was generated for (or None).
+
+    Returns the list of report rows: files, then classes, then the total.
+    """
+    file_rows = []
+    for path in sorted(files, key=lambda p: os.path.basename(p)):
+        file_rows.append(make_row("file", os.path.basename(path), files[path], file_stats(path)))
+
+    class_rows = []
+    total = OrderedDict((m, 0) for m in metrics)
+    for class_desc in api.classes():
+        stats = class_stats(class_desc)
+        for m in size_metrics:
+            stats[m] = sum([r[m] for r in file_rows if r["class"] == class_desc.name()])
+        class_rows.append(make_row("class", class_desc.name(), class_desc.name(), stats))
+
+    top_level = OrderedDict((m, 0) for m in api_metrics)
+    services = api.services()
+    top_level["services"] = len(services)
+    top_level["varargs"] = len([s for s in services if s.is_vararg()])
+    top_level["marshalling"] = sum([len([p for p in s.parameters() if p.is_array() or p.is_in_out()]) for s in services])
+
+    for m in size_metrics:
+        total[m] = sum([r[m] for r in file_rows])
+    for m in api_metrics:
+        total[m] = sum([r[m] for r in class_rows]) + top_level[m]
+    return file_rows + class_rows + [make_row("total", api.project(), None, total)]
+
+# report I/O #########################################################
+
+def is_csv(path):
+    return path.endswith(".csv")
+
+def write_report(f, rows, as_csv=False):
+    """Writes a report to a file-like object, as JSON or as CSV."""
+    if as_csv:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(list(rows[0].keys()) if rows else ["kind", "name", "class"] + metrics)
+        for r in rows:
+            writer.writerow(["" if v is None else v for v in r.values()])
+    else:
+        json.dump(rows, f, indent=2)
+        f.write("\n")
+
+def write_report_file(path, rows):
+    """Writes a report to a file, as CSV if its name ends with `.csv`, as JSON otherwise."""
+    with open(path, "w") as f:
+        write_report(f, rows, as_csv=is_csv(path))
+
+def read_report(f, as_csv=False):
+    """Reads a report written by `write_report()` from a file-like object."""
+    if not as_csv:
+        return json.load(f, object_pairs_hook=OrderedDict)
+    rows = []
+    for r in csv.DictReader(f):
+        row = OrderedDict([("kind", r["kind"]), ("name", r["name"]), ("class", r["class"] or None)])
+        for m in metrics:
+            row[m] = int(r[m]) if r.get(m) else None
+        rows.append(row)
+    return rows
+
+def read_report_file(path):
+    with open(path) as f:
+        return read_report(f, as_csv=is_csv(path))
+
+# report diffs #######################################################
+
+def diff_reports(old, new):
+    """
+    Compares two reports, returning one row per file, class, or total
+    that differs between them. Each row has the old value, new value,
+    and change of every metric; rows only present in one report have
+    None for the values from the other.
+    """
+    key = lambda r: (r["kind"], r["name"])
+    old_rows = OrderedDict((key(r), r) for r in old)
+    new_rows = OrderedDict((key(r), r) for r in new)
+    keys = list(old_rows.keys()) + [k for k in new_rows.keys() if k not in old_rows]
+
+    diff = []
+    for k in keys:
+        o, n = old_rows.get(k), new_rows.get(k)
+        row = OrderedDict([("kind", k[0]), ("name", k[1])])
+        changed = o is None or n is None
+        for m in metrics:
+            ov = None if o is None else o[m]
+            nv = None if n is None else n[m]
+            delta = None if ov is None or nv is None else nv - ov
+            changed = changed or (delta is not None and delta != 0)
+            row[m] = (ov, nv, delta)
+        if changed:
+            diff.append(row)
+    return diff
+
+def write_diff(f, diff, metrics_shown=metrics):
+    """Writes a report diff as a readable table."""
+    fmt_value = lambda v: "-" if v is None else str(v)
+    fmt_delta = lambda d: "" if d is None or d == 0 else "{:+d}".format(d)
+    width = max([len(r["name"]) for r in diff] + [4])
+    f.write("{:<6} {:<{w}}".format("kind", "name", w=width))
+    for m in metrics_shown:
+        f.write(" {:>20}".format(m))
+    f.write("\n")
+    for r in diff:
+        f.write("{:<6} {:<{w}}".format(r["kind"], r["name"], w=width))
+        for m in metrics_shown:
+            ov, nv, delta = r[m]
+            cell = fmt_value(nv) if ov == nv else "{}->{}".format(fmt_value(ov), fmt_value(nv))
+            f.write(" {:>20}".format("{} {}".format(cell, fmt_delta(delta)).strip()))
+        f.write("\n")
+
+def get_growth(diff, metric):
+    """Returns the relative growth of the total of a metric in a report diff, or None."""
+    for r in diff:
+        if r["kind"] == "total":
+            ov, nv, delta = r[metric]
+            if ov and delta is not None:
+                return float(delta) / ov
+    return None
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare two reports written by `cppgen.py --report`.")
+    parser.add_argument("--metrics", type=str, default=",".join(metrics),
+                        help="comma separated list of the metrics to show (default: all)")
+    parser.add_argument("--max-growth", type=float,
+                        help="exit with an error if the total number of lines or bytes grew by more than "
+                             "this percentage")
+    parser.add_argument("old", help="path to the old report")
+    parser.add_argument("new", help="path to the new report")
+    args = parser.parse_args()
+
+    shown = args.metrics.split(",")
+    for m in shown:
+        if m not in metrics:
+            sys.exit("error: unknown metric '{}'".format(m))
+
+    diff = diff_reports(read_report_file(args.old), read_report_file(args.new))
+    if diff:
+        write_diff(sys.stdout, diff, shown)
+    else:
+        print("no differences")
+
+    if args.max_growth is not None:
+        for m in ["lines", "bytes"]:
+            growth = get_growth(diff, m)
+            if growth is not None and growth * 100 > args.max_growth:
+                sys.exit("error: total {} grew by {:.1f}%".format(m, growth * 100))
@@ -0,0 +1,559 @@
+#! /usr/bin/env python
+
+###############################################################################
+# Copyright (c) 2026, 2026 IBM Corp. and others
+#
+# This program and the accompanying materials are made available under
+# the terms of the Eclipse Public License 2.0 which accompanies this
+# distribution and is available at https://www.eclipse.org/legal/epl-2.0/
+# or the Apache License, Version 2.0 which accompanies this distribution and
+# is available at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# This Source Code may also be made available under the following
+# Secondary Licenses when the conditions for such availability set
+# forth in the Eclipse Public License, v. 2.0 are satisfied: GNU
+# General Public License, version 2 with the GNU Classpath
+# Exception [1] and GNU General Public License, version 2 with the
+# OpenJDK Assembly Exception [2].
+#
+# [1] https://www.gnu.org/software/classpath/license.html
+# [2] http://openjdk.java.net/legal/assembly-exception.html
+#
+# SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+###############################################################################
+
+"""
+A module for generating the JitBuilder flat C client API.
+
+Unlike the C++ client API, which wraps every implementation object in a
+client object, the C API hands out opaque handles that are the
+implementation objects themselves. Every API function simply casts its
+handles back to implementation pointers and forwards the call, so no
+client object is ever allocated and arrays or in-out parameters of
+handles are passed through without being copied. This makes the C API
+the cheaper option for calling JitBuilder through a foreign function
+interface.
+
+Naming conventions, for a prefix `JB`:
+
+- `JB_<Class>` is the opaque handle type for an API class (nested
+  classes are named `JB_<Outer>_<Inner>`)
+- `JB_<Class>_new` creates an object (classes with several constructors
+  get one `JB_<Class>_new_<ParmType>...` function per constructor) and
+  `JB_<Class>_delete` destroys it
+- `JB_<Class>_<Service>` calls a service, taking the object as first
+  argument unless the service is static
+- `JB_<Class>_get<Field>` reads a class field
+- `JB_<Class>_as<Ancestor>` converts a handle to one of a base class
+- `JB_<Class>_setClientCallback_<Callback>` registers a callback
+- `JB_<Service>` calls a top-level service
+
+Callbacks are registered directly on the implementation object and
+receive the handle of the object they are called on. The C API does
+this by registering allocators that make each implementation object its
+own client object. The allocators are shared with the C++ client API, so
+only one of the two can be used in a process: whichever is initialized
+second fails to initialize (`JB_initializeJit()` returns false).
+
+By convention, functions in this module that start with "generate_"
+or "get_" return generated code as a string. Functions that start with
+"write_" take as first argument a writer-like object whose `write()`
+method is called to write the generated code.
+"""
+
+import os
+import argparse
+from genutils import *
+
+class CGenerator:
+
+    def __init__(self, api, headerdir, prefix="JB", copyright_year=None):
+        self.api = api
+
+        # Prefix of all the names declared in the generated header.
+        self.prefix = prefix
+
+        # Year in the copyright header of the generated files.
+        self.copyright_year = copyright_year or get_copyright_year()
+
+        self.builtin_type_map = { "none": "void"
+                                , "boolean": "bool"
+                                , "integer": "size_t"
+                                , "int8": "int8_t"
+                                , "int16": "int16_t"
+                                , "int32": "int32_t"
+                                , "int64": "int64_t"
+                                , "uint32": "uint32_t"
+                                , "float": "float"
+                                , "double": "double"
+                                , "pointer": "void *"
+                                , "ppointer": "void **"
+                                , "unsignedInteger": "size_t"
+                                , "constString": "const char *"
+                                , "string": "char *"
+                                }
+
+        self.header_name = "{}C.h".format(api.project())
+        self.header_path = os.path.join(headerdir, self.header_name)
+
+        self.allocator_setter_name = "setAllocators"
+        self.allocator_registrar_name = "registerAllocators"
+
+    # Generic utilities ##################################################
+
+    def get_copyright_header(self):
+        return """\
+/*******************************************************************************
+ * Copyright (c) {0}, {0} IBM Corp. and others
+ *
+ * This program and the accompanying materials are made available under
+ * the terms of the Eclipse Public License 2.0 which accompanies this
+ * distribution and is available at http://eclipse.org/legal/epl-2.0
+ * or the Apache License, Version 2.0 which accompanies this distribution
+ * and is available at https://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * This Source Code may also be made available under the following Secondary
+ * Licenses when the conditions for such availability set forth in the
+ * Eclipse Public License, v. 2.0 are satisfied: GNU General Public License,
+ * version 2 with the GNU Classpath Exception [1] and GNU General Public
+ * License, version 2 with the OpenJDK Assembly Exception [2].
+ *
+ * [1] https://www.gnu.org/software/classpath/license.html
+ * [2] http://openjdk.java.net/legal/assembly-exception.html
+ *
+ * SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+ *******************************************************************************/
+        """.format(self.copyright_year)
+
+    def generate_include(self, path):
+        """Returns an #include directive for a given path."""
+        return '#include "{}"\n'.format(path)
+
+    def gen_class_list(self, api):
+        """
+        Generates a list of all the classes in an API description,
+        with nested classes listed before their containing class.
+        """
+        classes = []
+        def add_class(class_desc):
+            for c in class_desc.inner_classes():
+                add_class(c)
+            classes.append(class_desc)
+        for c in api.classes():
+            add_class(c)
+        return classes
+
+    def get_handle_name(self, c):
+        """
+        Returns the name of the opaque handle type of a given class.
+
+        Nested classes are prefixed with the names of all containing
+        classes, separated by underscores.
+        """
+        return "_".join([self.prefix] + c.containing_classes() + [c.name()])
+
+    def get_impl_class_name(self, c):
+        """
+        Returns the name of a given class in the JitBuilder implementation,
+        prefixed with the name of all containing classes.
+        """
+        return "TR::{}".format("::".join(c.containing_classes() + [c.name()]))
+
+    def get_c_type(self, t):
+        """Returns the C type used in the API for a given type."""
+        return "{} *".format(self.get_handle_name(t.as_class())) if t.is_class() else self.builtin_type_map[t.name()]
+
+    def get_impl_type(self, t):
+        """Returns the C++ type used in the JitBuilder implementation for a given type."""
+        return "{} *".format(self.get_impl_class_name(t.as_class())) if t.is_class() else self.builtin_type_map[t.name()]
+
+    def to_impl_cast(self, t, v):
+        """
+        Constructs a cast of the value `v` from the C type of `t`
+        to its implementation type.
+
+        Handles point directly at implementation objects, so this is a
+        plain reinterpretation of the pointer. Values of builtin types
+        are returned as is.
+        """
+        return "reinterpret_cast<{}>({})".format(self.get_impl_type(t), v) if t.is_class() else v
+
+    def to_handle_cast(self, t, v):
+        """
+        Constructs a cast of the value `v` from the implementation
+        type of `t` to its C type.
+        """
+        return "reinterpret_cast<{}>({})".format(self.get_c_type(t), v) if t.is_class() else v
+
+    def generate_parm(self, parm_desc):
+        """
+        Produces a C parameter declaration from a given parameter description.
+
+        Array and in-out parameters are pointers to the handles (or values)
+        themselves, since they can be passed through to the implementation
+        without conversion.
+        """
+        fmt = "{t}* {n}" if parm_desc.is_in_out() or parm_desc.is_array() else "{t} {n}"
+        return fmt.format(t=self.get_c_type(parm_desc.type()), n=parm_desc.name())
+
+    def generate_parm_list(self, parms_desc, self_class=None):
+        """
+        Produces a comma separated list of C parameter declarations,
+        starting with a `self` handle if `self_class` is given.
+        """
+        parms = [self.generate_parm(p) for p in parms_desc]
+        if self_class is not None:
+            parms = ["{} * self".format(self.get_handle_name(self_class))] + parms
+        return ", ".join(parms) if parms else "void"
+
+    def generate_arg(self, parm_desc):
+        """
+        Produces the expression forwarding a C argument to the
+        implementation.
+        """
+        t = parm_desc.type()
+        n = parm_desc.name()
+        if t.is_class() and (parm_desc.is_in_out() or parm_desc.is_array()):
+            return "reinterpret_cast<{} *>({})".format(self.get_impl_type(t), n)
+        return self.to_impl_cast(t, n)
+
+    def generate_arg_list(self, parms_desc):
+        """Produces a comma separated list of forwarded arguments."""
+        return ", ".join([self.generate_arg(p) for p in parms_desc])
+
+    def generate_return(self, rtype, call):
+        """
+        Produces the statement that makes a call to the implementation
+        and returns its result, if any.
+        """
+        if "none" == rtype.name():
+            return "{};\n".format(call)
+        return "return {};\n".format(self.to_handle_cast(rtype, call))
+
+    def generate_function(self, rtype, name, parms):
+        """Produces the signature of a C API function."""
+        return "{rtype} {name}({parms})".format(rtype=rtype, name=name, parms=parms)
+
+    # API function naming ################################################
+
+    def get_service_function_name(self, class_desc, service):
+        """Returns the name of the C function for a class service."""
+        return "{}_{}".format(self.get_handle_name(class_desc), service.overload_name())
+
+    def get_ctor_function_name(self, class_desc, ctor):
+        """
+        Returns the name of the C function for a class constructor.
+
+        C has no overloading and constructors have no overload suffixes,
+        so when a class has several constructors, the type names of each
+        constructor's parameters are appended to its function name.
+        """
+        name = "{}_new".format(self.get_handle_name(class_desc))
+        if len(class_desc.constructors()) > 1:
+            name += "".join(["_" + p.type().name() for p in ctor.parameters()])
+        return name
+
+    def get_callback_type_name(self, class_desc, callback):
+        """Returns the name of the function pointer type of a callback."""
+        return "{}_{}Callback".format(self.get_handle_name(class_desc), callback.name())
+
+    def get_signature(self, service):
+        """
+        Returns a hashable description of the types of a service, used
+        to recognize services that only differ by their overload suffix.
+        """
+        parm_fmt = lambda p: (p.type().name(), p.is_array(), p.is_in_out())
+        return (service.return_type().name(), tuple([parm_fmt(p) for p in service.parameters()]))
+
+    def get_class_services(self, class_desc):
+        """
+        Returns the services of a class that get a C function.
+
+        Different services can share an overload name (e.g. `ConstInt32`
+        and `Const` with suffix `Int32`). As long as they have the same
+        signature they are equivalent, so only the first one is kept.
+        """
+        services = []
+        signatures = {}
+        for s in class_desc.services():
+            name = s.overload_name()
+            if name in signatures:
+                assert signatures[name] == self.get_signature(s), "overloads of '{}' in '{}' are not distinguishable in C".format(name, class_desc.name())
+                continue
+            signatures[name] = self.get_signature(s)
+            services.append(s)
+        return services
+
+    def get_ancestors(self, class_desc):
+        """Returns the list of classes a class extends, from nearest to farthest."""
+        ancestors = []
+        while class_desc.has_parent():
+            class_desc = class_desc.parent()
+            ancestors.append(class_desc)
+        return ancestors
+
+    # header utilities ###################################################
+
+    def write_class_decl(self, writer, class_desc):
+        """
+        Write the declarations of all the C functions of a given
+        API class (not including its nested classes).
+        """
+        handle = self.get_handle_name(class_desc)
+        writer.write("/* {} */\n".format(handle))
+
+        for callback in class_desc.callbacks():
+            rtype = self.get_c_type(callback.return_type())
+            parms = self.generate_parm_list(callback.parameters(), self_class=class_desc)
+            writer.write("typedef {rtype} (*{name})({parms});\n".format(rtype=rtype, name=self.get_callback_type_name(class_desc, callback), parms=parms))
+
+        for ancestor in self.get_ancestors(class_desc):
+            name = "{}_as{}".format(handle, ancestor.name())
+            writer.write(self.generate_function(self.get_c_type(ancestor.as_type()), name, self.generate_parm_list([], self_class=class_desc)) + ";\n")
+
+        for ctor in class_desc.constructors():
+            name = self.get_ctor_function_name(class_desc, ctor)
+            writer.write(self.generate_function(handle + " *", name, self.generate_parm_list(ctor.parameters())) + ";\n")
+        if class_desc.constructors():
+            writer.write(self.generate_function("void", handle + "_delete", self.generate_parm_list([], self_class=class_desc)) + ";\n")
+
+        for field in class_desc.fields():
+            name = "{}_get{}".format(handle, field.name())
+            writer.write(self.generate_function(self.get_c_type(field.type()), name, self.generate_parm_list([], self_class=class_desc)) + ";\n")
+
+        for callback in class_desc.callbacks():
+            name = "{}_{}".format(handle, callback_setter_name(callback))
+            parms = "{} * self, {} callback".format(handle, self.get_callback_type_name(class_desc, callback))
+            writer.write(self.generate_function("void", name, parms) + ";\n")
+
+        for service in self.get_class_services(class_desc):
+            rtype = self.get_c_type(service.return_type())
+            parms = self.generate_parm_list(service.parameters(), self_class=None if service.is_static() else class_desc)
+            writer.write(self.generate_function(rtype, self.get_service_function_name(class_desc, service), parms) + ";\n")
+
+        writer.write("\n")
+
+    def write_header(self, writer, api_desc):
+        """
+        Writes the header declaring the C API: the opaque handle types,
+        the callback types, and all API functions.
+        """
+        guard = "{}C_INCL".format(api_desc.project())
+
+        writer.write(self.get_copyright_header())
+        writer.write("\n")
+
+        writer.write("#ifndef {}\n".format(guard))
+        writer.write("#define {}\n\n".format(guard))
+
+        for h in ["stdbool.h", "stddef.h", "stdint.h"]:
+            writer.write("#include <{}>\n".format(h))
+        writer.write("\n")
+
+        writer.write("#ifdef __cplusplus\n")
+        writer.write('extern "C" {\n')
+        writer.write("#endif\n\n")
+
+        classes = self.gen_class_list(api_desc)
+        writer.write("/* opaque handles for all API classes */\n")
+        for c in classes:
+            writer.write("typedef struct {h} {h};\n".format(h=self.get_handle_name(c)))
+        writer.write("\n")
+
+        for c in classes:
+            self.write_class_decl(writer, c)
+
+        for service in api_desc.services():
+            rtype = self.get_c_type(service.return_type())
+            name = "{}_{}".format(self.prefix, service.name())
+            writer.write(self.generate_function(rtype, name, self.generate_parm_list(service.parameters())) + ";\n")
+        writer.write("\n")
+
+        writer.write("#ifdef __cplusplus\n")
+        writer.write('} /* extern "C" */\n')
+        writer.write("#endif\n\n")
+
+        writer.write("#endif /* {} */\n".format(guard))
+
+    # source utilities ###################################################
+
+    def write_function_impl(self, writer, signature, body):
+        """Writes the definition of a C API function with a one-statement body."""
+        writer.write(signature + " {\n")
+        writer.indent()
+        writer.write(body)
+        writer.outdent()
+        writer.write("}\n\n")
+
+    def write_class_impl(self, writer, class_desc):
+        """
+        Writes the definitions of all the C functions of a given
+        API class (not including its nested classes).
+        """
+        handle = self.get_handle_name(class_desc)
+        self_type = class_desc.as_type()
+        impl_self = self.to_impl_cast(self_type, "self")
+
+        for ancestor in self.get_ancestors(class_desc):
+            name = "{}_as{}".format(handle, ancestor.name())
+            signature = self.generate_function(self.get_c_type(ancestor.as_type()), name, self.generate_parm_list([], self_class=class_desc))
+            upcast = "static_cast<{}>({})".format(self.get_impl_type(ancestor.as_type()), impl_self)
+            self.write_function_impl(writer, signature, "return {};\n".format(self.to_handle_cast(ancestor.as_type(), upcast)))
+
+        for ctor in class_desc.constructors():
+            name = self.get_ctor_function_name(class_desc, ctor)
+            signature = self.generate_function(handle + " *", name, self.generate_parm_list(ctor.parameters()))
+            call = "::new {cname}({args})".format(cname=self.get_impl_class_name(class_desc), args=self.generate_arg_list(ctor.parameters()))
+            self.write_function_impl(writer, signature, self.generate_return(self_type, call))
+        if class_desc.constructors():
+            signature = self.generate_function("void", handle + "_delete", self.generate_parm_list([], self_class=class_desc))
+            self.write_function_impl(writer, signature, "::delete {};\n".format(impl_self))
+
+        for field in class_desc.fields():
+            name = "{}_get{}".format(handle, field.name())
+            signature = self.generate_function(self.get_c_type(field.type()), name, self.generate_parm_list([], self_class=class_desc))
+            self.write_function_impl(writer, signature, self.generate_return(field.type(), "{}->{}".format(impl_self, field.name())))
+
+        for callback in class_desc.callbacks():
+            setter = callback_setter_name(callback)
+            name = "{}_{}".format(handle, setter)
+            signature = self.generate_function("void", name, "{} * self, {} callback".format(handle, self.get_callback_type_name(class_desc, callback)))
+            self.write_function_impl(writer, signature, "{}->{}(reinterpret_cast<void *>(callback));\n".format(impl_self, setter))
+
+        for service in self.get_class_services(class_desc):
+            rtype = self.get_c_type(service.return_type())
+            receiver = None if service.is_static() else class_desc
+            signature = self.generate_function(rtype, self.get_service_function_name(class_desc, service), self.generate_parm_list(service.parameters(), self_class=receiver))
+            target = self.get_impl_class_name(class_desc) + "::" if service.is_static() else impl_self + "->"
+            call = "{target}{name}({args})".format(target=target, name=service.name(), args=self.generate_arg_list(service.parameters()))
+            self.write_function_impl(writer, signature, self.generate_return(service.return_type(), call))
+
+    def generate_impl_service_import(self, service_desc):
+        """
+        Generates an import for the implementation function
+        corresponding to a top-level API service.
+        """
+        rt = self.get_impl_type(service_desc.return_type())
+        n = get_impl_service_name(service_desc)
+        ps = ", ".join(["{t}{ptr} {n}".format(t=self.get_impl_type(p.type()), ptr="*" if p.is_in_out() or p.is_array() else "", n=p.name()) for p in service_desc.parameters()])
+        return "extern {rt} {n}({ps});\n".format(rt=rt, n=n, ps=ps)
+
+    def write_allocators_setter(self, writer, classes):
+        """
+        Writes the implementation of a function that makes every
+        implementation object its own client object.
+
+        Implementation objects pass their client object to callbacks
+        and use the impl getter to get back from a client object
+        returned by a callback, so making both identity functions is
+        what lets callbacks work directly with handles. As in the C++
+        client API, the function is called by any service that has the
+        `sets-allocators` flag and only sets the allocators once, unless
+        the C++ client API claimed them first.
+        """
+        writer.write(get_allocators_claim_import())
+        writer.write("\n")
+
+        writer.write("static void * getSelf(void * impl) {\n")
+        writer.indent()
+        writer.write("return impl;\n")
+        writer.outdent()
+        writer.write("}\n\n")
+
+        writer.write("static bool {}() {{\n".format(self.allocator_registrar_name))
+        writer.indent()
+        writer.write("if (!{}) {{\n".format(get_allocators_claim_call("C")))
+        writer.indent()
+        writer.write("return false;\n")
+        writer.outdent()
+        writer.write("}\n")
+        for c in classes:
+            writer.write("{}::setClientAllocator(getSelf);\n".format(self.get_impl_class_name(c)))
+            writer.write("{}::setGetImpl(getSelf);\n".format(self.get_impl_class_name(c)))
+        writer.write("return true;\n")
+        writer.outdent()
+        writer.write("}\n\n")
+
+        writer.write("static bool {}() {{\n".format(self.allocator_setter_name))
+        writer.indent()
+        writer.write("static const bool allocatorsSet = {}();\n".format(self.allocator_registrar_name))
+        writer.write("return allocatorsSet;\n")
+        writer.outdent()
+        writer.write("}\n\n")
+
+    def write_service_impl(self, writer, service):
+        """Writes the definition of the C function for a top-level service."""
+        rtype = self.get_c_type(service.return_type())
+        name = "{}_{}".format(self.prefix, service.name())
+        writer.write(self.generate_function(rtype, name, self.generate_parm_list(service.parameters())) + " {\n")
+        writer.indent()
+        if service.sets_allocators() and service.return_type().name() == "boolean":
+            writer.write("if (!{}()) {{\n".format(self.allocator_setter_name))
+            writer.indent()
+            writer.write("return false;\n")
+            writer.outdent()
+            writer.write("}\n")
+        elif service.sets_allocators():
+            writer.write("{}();\n".format(self.allocator_setter_name))
+        call = "{name}({args})".format(name=get_impl_service_name(service), args=self.generate_arg_list(service.parameters()))
+        writer.write(self.generate_return(service.return_type(), call))
+        writer.outdent()
+        writer.write("}\n\n")
+
+    def write_source(self, writer, api_desc):
+        """Writes the implementation of the C API."""
+        writer.write(self.get_copyright_header())
+        writer.write("\n")
+
+        for c in api_desc.classes():
+            writer.write(self.generate_include(os.path.join("ilgen", c.name() + ".hpp")))
+        writer.write(self.generate_include(self.header_path))
+        writer.write("\n")
+
+        for service in api_desc.services():
+            writer.write(self.generate_impl_service_import(service))
+        writer.write("\n")
+
+        classes = self.gen_class_list(api_desc)
+        self.write_allocators_setter(writer, classes)
+
+        writer.write('extern "C" {\n\n')
+
+        for c in classes:
+            self.write_class_impl(writer, c)
+
+        for service in api_desc.services():
+            self.write_service_impl(writer, service)
+
+        writer.write('} // extern "C"\n')
+
+# main generator #####################################################
+
+def generate(api_description, sourcedir, headerdir, prefix="JB"):
+    """
+    Generates the C client API for an API description, writing the
+    source to `sourcedir` and the header to `headerdir`.
+    """
+    generator = CGenerator(api_description, headerdir, prefix=prefix)
+
+    with open(generator.header_path, "w") as writer:
+        generator.write_header(PrettyPrinter(writer), api_description)
+    with open(os.path.join(sourcedir, "{}C.cpp".format(api_description.project())), "w") as writer:
+        generator.write_source(PrettyPrinter(writer), api_description)
+
+if __name__ == "__main__":
+    default_dest = os.path.join(os.getcwd(), "client")
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sourcedir", type=str, default=default_dest,
+                        help="destination directory for the generated source file")
+    parser.add_argument("--headerdir", type=str, default=default_dest,
+                        help="destination directory for the generated header file")
+    parser.add_argument("--prefix", type=str, default="JB",
+                        help="prefix of all the type and function names in the generated API")
+    parser.add_argument("description", help="path to the API description file")
+    args = parser.parse_args()
+
+    with open(args.description) as api_src:
+        api_description = APIDescription.load_json_file(api_src)
+
+    generate(api_description, args.sourcedir, args.headerdir, prefix=args.prefix)
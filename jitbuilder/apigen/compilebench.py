@@ -0,0 +1,318 @@
+#! /usr/bin/env python
+
+###############################################################################
+# Copyright (c) 2026, 2026 IBM Corp. and others
+#
+# This program and the accompanying materials are made available under
+# the terms of the Eclipse Public License 2.0 which accompanies this
+# distribution and is available at https://www.eclipse.org/legal/epl-2.0/
+# or the Apache License, Version 2.0 which accompanies this distribution and
+# is available at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# This Source Code may also be made available under the following
+# Secondary Licenses when the conditions for such availability set
+# forth in the Eclipse Public License, v. 2.0 are satisfied: GNU
+# General Public License, version 2 with the GNU Classpath
+# Exception [1] and GNU General Public License, version 2 with the
+# OpenJDK Assembly Exception [2].
+#
+# [1] https://www.gnu.org/software/classpath/license.html
+# [2] http://openjdk.java.net/legal/assembly-exception.html
+#
+# SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+###############################################################################
+
+"""
+A harness measuring how long the generated C++ client API takes to compile.
+
+The client API is generated from an API description in each of the
+following modes, and every translation unit (TU) of each mode is compiled
+against the JitBuilder implementation headers:
+
+- `per-file`: the default output, one TU per class plus `JitBuilder.cpp`
+- `unity`: the default output, compiled as a single TU that includes all
+  the generated sources
+- `minimal`: the output of `cppgen.py --minimal-includes`, where each class
+  source only includes the headers of the classes it refers to
+
+For every TU, the wall time and the peak resident set size of the compiler
+are recorded. With `--time-trace` (clang only), the compiler also writes a
+`-ftime-trace` profile, summarized by its "Total ..." events (time spent in
+the frontend, backend, parsing sources, instantiating templates, ...).
+
+Compiler flags are taken from a CMake `compile_commands.json` if one is
+given with `--compile-commands`, so the harness compiles the sources exactly
+as the build does. Otherwise, include paths and defines for an x86-64 Linux
+host are derived from the layout of the repository, and can be extended
+with `-I` and `-D`. Any other flags follow `--` on the command line:
+
+    python compilebench.py jitbuilder.api.json -- -O0 -g
+"""
+
+import os
+import sys
+import json
+import time
+import shlex
+import shutil
+import tempfile
+import argparse
+import subprocess
+from multiprocessing.pool import ThreadPool
+from genutils import *
+import cppgen
+
+modes = ["per-file", "unity", "minimal"]
+
+def split_args(argv):
+    """Splits the harness arguments from the compiler flags following `--`."""
+    if "--" in argv:
+        i = argv.index("--")
+        return argv[:i], argv[i + 1:]
+    return argv, []
+
+def get_default_flags():
+    """Returns the compiler flags needed to compile the client API on an x86-64 Linux host."""
+    root = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+    includes = ["include_core", "compiler", "jitbuilder", "", "jitbuilder/x/amd64", "compiler/x/amd64", "jitbuilder/x", "compiler/x"]
+    flags = ["-std=c++11", "-O2"]
+    flags += ["-I" + os.path.normpath(os.path.join(root, i)) for i in includes]
+    flags += ["-D" + d for d in ["TR_HOST_X86", "TR_HOST_64BIT", "TR_TARGET_X86", "TR_TARGET_64BIT", "LINUX"]]
+    return flags
+
+def get_configured_flags(compile_commands):
+    """
+    Returns the compiler and the flags used to compile a JitBuilder source
+    file according to a compilation database, or None if there is none.
+
+    The flags of a generated client API source are preferred. Flags naming
+    the source, the object file, or dependency files are dropped.
+    """
+    entries = [e for e in compile_commands if os.path.join("client", "cpp") in e["file"]]
+    entries = entries or [e for e in compile_commands if os.sep + "jitbuilder" + os.sep in e["file"]]
+    if not entries:
+        return None
+    entry = entries[0]
+    args = entry["arguments"] if "arguments" in entry else shlex.split(entry["command"])
+
+    flags = []
+    skip = False
+    for a in args[1:]:
+        if skip:
+            skip = False
+        elif a in ["-o", "-MF", "-MT", "-MQ"]:
+            skip = True
+        elif a in ["-c", "-MD", "-MMD"] or a == entry["file"] or a.startswith("-o"):
+            continue
+        elif a.startswith("-I") and not os.path.isabs(a[2:]):
+            flags.append("-I" + os.path.normpath(os.path.join(entry["directory"], a[2:])))
+        else:
+            flags.append(a)
+    return args[0], flags
+
+def summarize_time_trace(trace):
+    """
+    Summarizes a `-ftime-trace` profile, returning a dictionary mapping the
+    name of each "Total ..." event to its duration in milliseconds.
+    """
+    summary = {}
+    for e in trace.get("traceEvents", []):
+        name = e.get("name", "")
+        if name.startswith("Total ") and "dur" in e:
+            summary[name[len("Total "):]] = summary.get(name[len("Total "):], 0) + e["dur"] / 1000.0
+    return summary
+
+def generate_unity_source(sources):
+    """Returns the source of a TU that includes all the given sources."""
+    return "".join(['#include "{}"\n'.format(s) for s in sources])
+
+def get_peak_rss(rusage):
+    """Returns the peak resident set size in kilobytes from a resource usage structure."""
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return rusage.ru_maxrss // 1024 if sys.platform == "darwin" else rusage.ru_maxrss
+
+def run_compiler(cmd):
+    """
+    Runs a compiler command, returning its exit status, its output, the
+    time it took in seconds, and the peak resident set size of the
+    compiler in kilobytes (None where it cannot be measured).
+    """
+    start = time.time()
+    p = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    if not hasattr(os, "wait4"):
+        output = p.communicate()[0]
+        return p.returncode, output.decode("utf-8", "replace"), time.time() - start, None
+    output = p.stdout.read()
+    p.stdout.close()
+    # wait4 reports the peak RSS of the compiler driver and of the
+    # processes it waited for (the compiler proper, the assembler, ...)
+    _, status, rusage = os.wait4(p.pid, 0)
+    elapsed = time.time() - start
+    p.returncode = os.WEXITSTATUS(status) if os.WIFEXITED(status) else -os.WTERMSIG(status)
+    return p.returncode, output.decode("utf-8", "replace"), elapsed, get_peak_rss(rusage)
+
+class CompileBenchmark:
+
+    def __init__(self, api, workdir, compiler, flags, time_trace=False, repeat=1):
+        self.api = api
+        self.workdir = workdir
+        self.compiler = compiler
+        self.flags = flags
+        self.time_trace = time_trace
+        self.repeat = repeat
+
+    def generate(self, mode):
+        """Generates the client API for a mode, returning the list of TUs to compile."""
+        sourcedir = os.path.join(self.workdir, mode, "src")
+        headerdir = os.path.join(self.workdir, mode, "include")
+        for d in [sourcedir, headerdir]:
+            if not os.path.isdir(d): os.makedirs(d)
+        files = cppgen.generate(self.api, sourcedir, headerdir, minimal_includes=(mode == "minimal"))
+        sources = sorted([f for f in files if f.endswith(".cpp")])
+        if mode != "unity":
+            return sources
+        unity = os.path.join(self.workdir, mode, "Unity.cpp")
+        with open(unity, "w") as f:
+            f.write(generate_unity_source(sources))
+        return [unity]
+
+    def compile(self, mode, source):
+        """
+        Compiles a TU, returning a dictionary with its results. The time is
+        the fastest of all repetitions, the peak RSS the largest.
+        """
+        obj = os.path.join(self.workdir, mode, "obj", os.path.splitext(os.path.basename(source))[0] + ".o")
+        if not os.path.isdir(os.path.dirname(obj)): os.makedirs(os.path.dirname(obj))
+        cmd = [self.compiler] + self.flags + ["-I" + os.path.join(self.workdir, mode, "include"), "-c", source, "-o", obj]
+        if self.time_trace:
+            cmd.append("-ftime-trace")
+
+        result = { "mode": mode, "tu": os.path.basename(source), "time": None, "rss": None, "error": None }
+        for i in range(self.repeat):
+            status, output, elapsed, rss = run_compiler(cmd)
+            if status != 0:
+                result["error"] = output.strip() or "compiler exited with status {}".format(status)
+                return result
+            result["time"] = elapsed if result["time"] is None else min(result["time"], elapsed)
+            if rss is not None:
+                result["rss"] = rss if result["rss"] is None else max(result["rss"], rss)
+
+        if self.time_trace:
+            trace_path = os.path.splitext(obj)[0] + ".json"
+            if os.path.exists(trace_path):
+                with open(trace_path) as f:
+                    result["time_trace"] = summarize_time_trace(json.load(f))
+        return result
+
+    def run(self, selected_modes, jobs=1):
+        """Runs the benchmark for a list of modes, returning the results of all TUs."""
+        results = []
+        for mode in selected_modes:
+            tus = self.generate(mode)
+            pool = ThreadPool(max(1, jobs))
+            try:
+                results += pool.map(lambda tu: self.compile(mode, tu), tus)
+            finally:
+                pool.close()
+                pool.join()
+        return results
+
+def summarize(results, selected_modes):
+    """Returns the totals of each mode: number of TUs, total time, and largest peak RSS."""
+    summary = []
+    for mode in selected_modes:
+        rs = [r for r in results if r["mode"] == mode]
+        ok = [r for r in rs if r["error"] is None]
+        rss = [r["rss"] for r in ok if r["rss"] is not None]
+        summary.append({ "mode": mode
+                       , "tus": len(rs)
+                       , "failed": len(rs) - len(ok)
+                       , "time": sum([r["time"] for r in ok])
+                       , "rss": max(rss) if rss else None
+                       })
+    return summary
+
+def write_results(f, results, summary):
+    """Writes the results of a benchmark as readable tables."""
+    fmt_rss = lambda r: "-" if r is None else "{:.1f}".format(r / 1024.0)
+    width = max([len(r["tu"]) for r in results] + [2])
+    f.write("{:<10} {:<{w}} {:>10} {:>10}\n".format("mode", "TU", "time (s)", "RSS (MB)", w=width))
+    for r in results:
+        if r["error"] is not None:
+            f.write("{:<10} {:<{w}} {:>10} {:>10}\n".format(r["mode"], r["tu"], "failed", "-", w=width))
+            continue
+        f.write("{:<10} {:<{w}} {:>10.3f} {:>10}\n".format(r["mode"], r["tu"], r["time"], fmt_rss(r["rss"]), w=width))
+        for name, ms in sorted(r.get("time_trace", {}).items(), key=lambda t: -t[1])[:5]:
+            f.write("{:<10} {:<{w}}   {:>8.1f} ms  {}\n".format("", "", ms, name, w=width))
+    f.write("\n")
+
+    base = summary[0]["time"] if summary and summary[0]["time"] else None
+    f.write("{:<10} {:>5} {:>10} {:>10} {:>8}\n".format("mode", "TUs", "time (s)", "RSS (MB)", "speedup"))
+    for s in summary:
+        speedup = "{:.2f}x".format(base / s["time"]) if base and s["time"] else "-"
+        f.write("{:<10} {:>5} {:>10.3f} {:>10} {:>8}\n".format(s["mode"], s["tus"], s["time"], fmt_rss(s["rss"]), speedup))
+        if s["failed"]:
+            f.write("{:<10} ({} TUs failed to compile)\n".format("", s["failed"]))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure the compile time of the generated C++ client API.",
+                                     usage="%(prog)s [options] description [-- FLAG ...]")
+    parser.add_argument("--modes", type=str, default=",".join(modes),
+                        help="comma separated list of modes to compare (default: {})".format(",".join(modes)))
+    parser.add_argument("--cxx", type=str, default=os.environ.get("CXX", "c++"),
+                        help="compiler to use (default: $CXX, or c++)")
+    parser.add_argument("--compile-commands", type=str,
+                        help="compile_commands.json of a configured build, to take the compiler and its flags from")
+    parser.add_argument("-I", dest="includes", action="append", default=[], help="additional include directory")
+    parser.add_argument("-D", dest="defines", action="append", default=[], help="additional macro definition")
+    parser.add_argument("--flags", type=str, default="",
+                        help="additional compiler flags, as a single string (write --flags=\"-O0 -g\" for flags "
+                             "starting with -, or pass them after --)")
+    parser.add_argument("--time-trace", action="store_true",
+                        help="collect and summarize -ftime-trace profiles (requires clang)")
+    parser.add_argument("--repeat", type=int, default=1,
+                        help="number of times to compile each TU (the fastest time is kept)")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="number of TUs compiled in parallel (timings are less reliable above 1)")
+    parser.add_argument("--workdir", type=str,
+                        help="directory for the generated sources and objects (default: a temporary directory)")
+    parser.add_argument("--json", type=str, help="also write the results to a JSON file")
+    parser.add_argument("description", help="path to the API description file")
+    harness_args, extra_flags = split_args(sys.argv[1:])
+    args = parser.parse_args(harness_args)
+
+    selected = args.modes.split(",")
+    for m in selected:
+        if m not in modes:
+            sys.exit("error: unknown mode '{}'".format(m))
+
+    compiler, flags = args.cxx, get_default_flags()
+    if args.compile_commands:
+        with open(args.compile_commands) as f:
+            configured = get_configured_flags(json.load(f))
+        if configured is None:
+            sys.exit("error: {}: no JitBuilder source found".format(args.compile_commands))
+        compiler, flags = configured
+    flags += ["-I" + i for i in args.includes] + ["-D" + d for d in args.defines] + shlex.split(args.flags) + extra_flags
+
+    with open(args.description) as api_src:
+        api_description = APIDescription.load_json_file(api_src)
+
+    workdir = args.workdir or tempfile.mkdtemp(prefix="compilebench")
+    try:
+        bench = CompileBenchmark(api_description, workdir, compiler, flags, time_trace=args.time_trace, repeat=args.repeat)
+        results = bench.run(selected, jobs=args.jobs)
+    finally:
+        if not args.workdir:
+            shutil.rmtree(workdir)
+
+    summary = summarize(results, selected)
+    write_results(sys.stdout, results, summary)
+    for r in results:
+        if r["error"] is not None:
+            sys.stderr.write("error: {} ({}):\n{}\n".format(r["tu"], r["mode"], r["error"]))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({ "results": results, "summary": summary }, f, indent=2)
+    if any(r["error"] is not None for r in results):
+        sys.exit(1)
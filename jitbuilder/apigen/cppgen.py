@@ -35,17 +35,30 @@ also describes how the generated code works.
 """
 
 import os
-import datetime
 import json
-import shutil
 import argparse
+from collections import OrderedDict
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
 from genutils import *
+import apireport
 
 class CppGenerator:
 
-    def __init__(self, api, headerdir, extras):
+    def __init__(self, api, headerdir, extras, inline_services=False, profile=None, trace=False, minimal_includes=False, namespaces=None, copyright_year=None):
         self.api = api
 
+        # Namespaces of the client API, by default those of the description.
+        self.namespaces = api.namespaces() if namespaces is None else namespaces
+
+        # Namespaces of the runtime support headers (see `extras/cpp/`).
+        self.runtime_namespaces = ["OMR", "JitBuilder"]
+
+        # Year in the copyright header of the generated files.
+        self.copyright_year = copyright_year or get_copyright_year()
+
         # Mapping between API type descriptions and C++ data types
         self.builtin_type_map = { "none": "void"
                                 , "boolean": "bool"
@@ -70,7 +83,56 @@ class CppGenerator:
         # Classes that have extra APIs, not covered in the main description
         self.classes_with_extras = extras
 
+        # All generated entry points (services, constructors, and callback
+        # thunks) and all API classes. The position of an entry point or a
+        # class in these lists is used as its ID by profiling and tracing.
+        self.entry_points = self.gen_entry_points(api)
+        self.entry_point_names = [e[0] for e in self.entry_points]
+        self.entry_point_ids = dict((n, i) for i, n in enumerate(self.entry_point_names))
+        self.class_list = self.gen_class_list(api)
+        self.class_ids = dict((c.name(), i) for i, c in enumerate(self.class_list))
+
+        # Kind of call probes inserted at the start of every generated entry
+        # point: None (no probes), "counters", or "timers".
+        self.profile = profile
+
+        # Whether every generated entry point records its calls in a trace.
+        self.trace = trace
+
+        # Top-level services that also get an asynchronous variant.
+        self.async_services = [s for s in api.services() if s.is_async()]
+        for _, desc, class_desc, _ in self.entry_points:
+            assert class_desc is None or not desc.is_async(), "only top-level services can be async"
+        self.async_header = os.path.join(headerdir, "Async.hpp")
+
+        # Class services flagged batchable also get a bulk variant, which
+        # performs the service on an array of operand tuples in one call.
+        for _, desc, class_desc, _ in self.entry_points:
+            if desc.is_batchable():
+                assert class_desc is not None and desc in class_desc.services(), "only class services can be batchable"
+                assert not desc.is_static() and not desc.is_impl_default(), "static and impl-default services cannot be batchable"
+                assert desc.parameters() and not [p for p in desc.parameters() if p.is_in_out() or p.is_array()], \
+                       "batchable services must have parameters, and no in-out or array parameters"
+        for class_desc in self.class_list:
+            names = [self.get_bulk_operands_name(s) for s in class_desc.services() if s.is_batchable()]
+            assert len(set(names)) == len(names), "batchable services of a class must have distinct overload names"
+
+        runtime_headers = (["Profiling.hpp"] if profile else []) + (["Tracing.hpp"] if trace else [])
+        macros_index = self.impl_include_files.index(os.path.join(headerdir, "Macros.hpp"))
+        self.impl_include_files[macros_index + 1:macros_index + 1] = [os.path.join(headerdir, h) for h in runtime_headers]
+
+        # Whether simple services are defined inline in a `<class>-inl.hpp`
+        # header instead of out-of-line in the class source file.
+        self.inline_services = inline_services
+        if inline_services:
+            self.impl_include_files += [os.path.join(headerdir, self.get_inline_header_name(c)) for c in api.classes()]
+
+        # Whether class sources only include the headers of the classes
+        # they refer to, instead of the headers of all classes.
+        self.minimal_includes = minimal_includes
+
         self.allocator_setter_name = "setAllocators"
+        self.allocator_registrar_name = "registerAllocators"
 
     # Generic utilities ##################################################
 
@@ -96,7 +158,7 @@ class CppGenerator:
  *
  * SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
  *******************************************************************************/
-        """.format(datetime.datetime.now().year)
+        """.format(self.copyright_year)
 
     def get_common_system_includes(self):
         return ["stdint.h", "stddef.h"]
@@ -117,6 +179,193 @@ class CppGenerator:
         files += [os.path.join(api_headers_dir, c.name() + ".hpp") for c in classes_desc]
         return files
 
+    def gen_referenced_classes(self, class_desc):
+        """
+        Generates the set of names of the top-level classes whose headers
+        are needed by the generated code of a top-level class: the class
+        itself, the ancestors of the class and of its nested classes, and
+        the classes used in their services, constructors, callbacks, and
+        fields.
+        """
+        names = set()
+        def add_class(c):
+            names.add((c.containing_classes() + [c.name()])[0])
+            if c.has_parent():
+                add_class(c.parent())
+        def add_type(t):
+            if t.is_class():
+                add_class(t.as_class())
+        def add_signature(desc, returns=True):
+            if returns:
+                add_type(desc.return_type())
+            for p in desc.parameters():
+                add_type(p.type())
+        def visit(c):
+            add_class(c)
+            for f in c.fields():
+                add_type(f.type())
+            for s in c.services():
+                add_signature(s)
+            for ctor in c.constructors():
+                add_signature(ctor, returns=False)
+            for cb in c.callbacks():
+                add_signature(cb)
+            for inner in c.inner_classes():
+                visit(inner)
+        visit(class_desc)
+        return names
+
+    def gen_class_include_files(self, class_desc):
+        """
+        Generates the list of files included by the source of a top-level
+        class. Without minimal includes, this is the list of all files
+        included in the client API implementation. Otherwise, the headers
+        of classes not referenced by the class are left out.
+        """
+        if not self.minimal_includes:
+            return self.impl_include_files
+        referenced = self.gen_referenced_classes(class_desc)
+        class_names = set(c.name() for c in self.api.classes())
+        def is_needed(path):
+            name = os.path.splitext(os.path.basename(path))[0]
+            if name.endswith("-inl"):
+                name = name[:-len("-inl")]
+            return name not in class_names or name in referenced
+        return [f for f in self.impl_include_files if is_needed(f)]
+
+    def get_inline_header_name(self, class_desc):
+        """
+        Returns the name of the header containing the inline service
+        definitions of a top-level client API class.
+        """
+        return class_desc.name() + "-inl.hpp"
+
+    def is_inlined_service(self, service):
+        """
+        Returns true if the given class service is defined inline.
+
+        Only services that directly forward their arguments to the
+        implementation are inlined. Services with array or in-out
+        parameters (including vararg services) need argument setup and
+        reconstruction, so they are always defined out-of-line.
+        """
+        if not self.inline_services:
+            return False
+        return not any(p.is_array() or p.is_in_out() for p in service.parameters())
+
+    def get_entry_point_name(self, desc, class_desc=None, is_thunk=False):
+        """
+        Produces the name used to identify a generated entry point
+        (service, constructor, or callback thunk) in profiling reports.
+
+        Overload suffixes are not guaranteed to produce unique names
+        (e.g. `Const` with suffix `Int32` and `ConstInt32`), so the
+        parameter types are included in the name instead.
+        """
+        parm_fmt = lambda p: p.type().name() + ("[]" if p.is_array() else "*" if p.is_in_out() else "")
+        name = "{}({})".format(desc.name(), ", ".join([parm_fmt(p) for p in desc.parameters()]))
+        name = name if class_desc is None else "{}::{}".format(self.get_class_name(class_desc), name)
+        return name + " [thunk]" if is_thunk else name
+
+    def gen_class_list(self, api):
+        """
+        Generates a list of all the classes in an API description,
+        with nested classes listed before their containing class.
+        """
+        classes = []
+        def add_class(class_desc):
+            for c in class_desc.inner_classes():
+                add_class(c)
+            classes.append(class_desc)
+        for c in api.classes():
+            add_class(c)
+        return classes
+
+    def gen_entry_points(self, api):
+        """
+        Generates the list of all the generated entry points.
+
+        Each entry point is described by a tuple containing its name,
+        the description of the service (or constructor or callback), the
+        description of the owning class (None for top-level services),
+        and whether the entry point is a callback thunk.
+        """
+        entry_points = []
+        for class_desc in self.gen_class_list(api):
+            entry_points += [(self.get_entry_point_name(c, class_desc), c, class_desc, False) for c in class_desc.constructors()]
+            entry_points += [(self.get_entry_point_name(c, class_desc, is_thunk=True), c, class_desc, True) for c in class_desc.callbacks()]
+            entry_points += [(self.get_entry_point_name(c, class_desc), c, class_desc, False) for c in class_desc.callbacks()]
+            entry_points += [(self.get_entry_point_name(s, class_desc), s, class_desc, False) for s in class_desc.services()]
+        entry_points += [(self.get_entry_point_name(s), s, None, False) for s in api.services()]
+        names = [e[0] for e in entry_points]
+        assert len(set(names)) == len(names), "entry point names are not unique"
+        return entry_points
+
+    def write_profile_probe(self, writer, entry_point_name):
+        """
+        Writes the call probe for a generated entry point, if
+        profiling is enabled.
+
+        The probes are macros defined in `Profiling.hpp`. They update
+        the entry point's slot in a per-thread table, indexed by the
+        ID of the entry point.
+        """
+        if not self.profile:
+            return
+        probe = "PROFILE_TIMED_CALL" if self.profile == "timers" else "PROFILE_CALL"
+        writer.write("{probe}({id}); // {name}\n".format(probe=probe, id=self.entry_point_ids[entry_point_name], name=entry_point_name))
+
+    def generate_trace_value(self, t, v):
+        """
+        Generates the statement recording the value `v` of type `t`
+        in the call trace.
+        """
+        if t.is_class():
+            return "TRACE_OBJECT({});\n".format(v)
+        if t.name() in ["constString", "string"]:
+            return "TRACE_STRING({});\n".format(v)
+        if t.name() in ["pointer", "ppointer"]:
+            return "TRACE_POINTER({});\n".format(v)
+        trace_type = { "boolean": "uint8_t"
+                     , "integer": "uint64_t"
+                     , "unsignedInteger": "uint64_t"
+                     }.get(t.name(), self.builtin_type_map[t.name()])
+        return "TRACE_VALUE({}, {});\n".format(trace_type, v)
+
+    def write_trace_call(self, writer, entry_point_name, parms, receiver=None):
+        """
+        Writes the statements recording a call to a generated entry
+        point in the call trace, along with its receiver object (if
+        any) and its arguments.
+        """
+        if not self.trace:
+            return
+        writer.write("TRACE_CALL({id}); // {name}\n".format(id=self.entry_point_ids[entry_point_name], name=entry_point_name))
+        if receiver is not None:
+            writer.write("TRACE_OBJECT({});\n".format(receiver))
+        for parm in parms:
+            if parm.is_array():
+                writer.write("TRACE_ARRAY({n}, {a});\n".format(n=parm.array_len(), a=parm.name()))
+            elif parm.is_in_out():
+                writer.write("TRACE_IN_OUT({});\n".format(parm.name()))
+            else:
+                writer.write(self.generate_trace_value(parm.type(), parm.name()))
+
+    def write_trace_return(self, writer, parms, rtype=None, ret=None):
+        """
+        Writes the statements recording the return from a generated
+        entry point in the call trace, along with the returned value
+        (if any) and the final value of in-out arguments.
+        """
+        if not self.trace:
+            return
+        writer.write("TRACE_RETURN();\n")
+        if ret is not None:
+            writer.write(self.generate_trace_value(rtype, ret))
+        for parm in parms:
+            if parm.is_in_out():
+                writer.write("TRACE_IN_OUT({});\n".format(parm.name()))
+
     def generate_include(self, path):
         """Returns an #include directive for a given path."""
         return '#include "{}"\n'.format(path)
@@ -278,7 +527,8 @@ class CppGenerator:
         """
         vis = service.visibility() + ": "
         static = "static " if service.is_static() else ""
-        qual = ("virtual " if is_callback else "") + static
+        inline = "inline " if not is_callback and self.is_inlined_service(service) else ""
+        qual = ("virtual " if is_callback else "") + static + inline
         ret = self.get_client_type(service.return_type())
         name = service.name()
         parms = self.generate_parm_list(service.parameters())
@@ -290,6 +540,36 @@ class CppGenerator:
 
         return decl
 
+    def get_bulk_operands_name(self, service):
+        """
+        Returns the name of the struct holding the arguments of one
+        call to a batchable client API class service.
+        """
+        return service.overload_name() + "Operands"
+
+    def generate_bulk_parm_list(self, service):
+        """
+        Produces the parameter list of the bulk variant of a batchable
+        client API class service. Results, if any, are written to an
+        array provided by the caller, so the variant allocates nothing.
+        """
+        parms = ["size_t count", "const {} * operands".format(self.get_bulk_operands_name(service))]
+        if "none" != service.return_type().name():
+            parms.append("{}* results".format(self.get_client_type(service.return_type())))
+        return ", ".join(parms)
+
+    def generate_bulk_service_decl(self, service):
+        """
+        Produces the declarations of the bulk variant of a batchable
+        client API class service: the struct holding the arguments of
+        one call and the `<name>Bulk()` service taking an array of them.
+        """
+        vis = service.visibility() + ": "
+        fields = " ".join(["{};".format(self.generate_parm(p)) for p in service.parameters()])
+        decl = "{visibility}struct {operands} {{ {fields} }};\n".format(visibility=vis, operands=self.get_bulk_operands_name(service), fields=fields)
+        decl += "{visibility}void {name}Bulk({parms});\n".format(visibility=vis, name=service.name(), parms=self.generate_bulk_parm_list(service))
+        return decl
+
     def generate_ctor_decl(self, ctor_desc, class_name):
         """
         Produces the declaration of a client API class constructor
@@ -311,14 +591,19 @@ class CppGenerator:
         """Produces the declaration of a client API object allocator."""
         return 'extern "C" void * {alloc}(void * impl);\n'.format(alloc=self.get_allocator_name(class_desc))
 
+    def generate_impl_getter_decl(self, class_desc):
+        """Produces the declaration of the callback returning the implementation of a client object."""
+        return 'extern "C" void * {getter}(void * client);\n'.format(getter=self.impl_getter_name(class_desc))
+
     def write_allocator_decl(self, writer, class_desc):
         """
-        Write the allocator declarations for a given client API
-        class and its contained classes.
+        Write the allocator and implementation getter declarations
+        for a given client API class and its contained classes.
         """
         for c in class_desc.inner_classes():
             self.write_allocator_decl(writer, c)
         writer.write(self.generate_allocator_decl(class_desc))
+        writer.write(self.generate_impl_getter_decl(class_desc))
 
     def write_class_def(self, writer, class_desc):
         """Write the definition of a client API class from its description."""
@@ -365,6 +650,10 @@ class CppGenerator:
             decl = self.generate_class_service_decl(service)
             writer.write(decl)
 
+        for service in class_desc.services():
+            if service.is_batchable():
+                writer.write(self.generate_bulk_service_decl(service))
+
         if has_extras:
             writer.write(self.generate_include('{}ExtrasInsideClass.hpp'.format(class_desc.name())))
 
@@ -403,6 +692,8 @@ class CppGenerator:
 
         writer.write("{cname}::{name}({parms}){inherit} {{\n".format(cname=full_name, name=name, parms=parms, inherit=inherit))
         writer.indent()
+        self.write_profile_probe(writer, self.get_entry_point_name(ctor_desc, class_desc))
+        self.write_trace_call(writer, self.get_entry_point_name(ctor_desc, class_desc), ctor_desc.parameters())
         for parm in ctor_desc.parameters():
             self.write_arg_setup(writer, parm)
         args = self.generate_arg_list(ctor_desc.parameters())
@@ -411,6 +702,7 @@ class CppGenerator:
             self.write_arg_return(writer, parm)
         writer.write("{impl_cast}->setClient(this);\n".format(impl_cast=self.to_impl_cast(class_desc,"impl")))
         writer.write("initializeFromImpl({});\n".format(self.to_opaque_cast("impl",class_desc)))
+        self.write_trace_return(writer, ctor_desc.parameters(), class_desc.as_type(), "this")
         writer.outdent()
         writer.write("}\n")
 
@@ -470,16 +762,17 @@ class CppGenerator:
             writer.write(fmt.format(fname=field.name(), ftype=field.type().name(), impl_cast=impl_cast))
             writer.write("{fname} = clientObj_{fname};\n".format(fname=field.name()))
 
+        if self.trace and class_desc.fields():
+            writer.write("TRACE_FIELDS({}, this);\n".format(self.class_ids[class_desc.name()]))
+            for field in class_desc.fields():
+                writer.write(self.generate_trace_value(field.type(), field.name()))
+
         for callback in class_desc.callbacks():
             fmt = "{impl_cast}->{registrar}(reinterpret_cast<void*>(&{thunk}));\n"
             registrar = callback_setter_name(callback)
             thunk = self.callback_thunk_name(class_desc, callback)
             writer.write(fmt.format(impl_cast=impl_cast,registrar=registrar,thunk=thunk))
 
-        # write setting of the impl getter
-        impl_getter = self.impl_getter_name(class_desc)
-        writer.write("{impl_cast}->setGetImpl(&{impl_getter});\n".format(impl_cast=impl_cast,impl_getter=impl_getter))
-
         writer.outdent()
         writer.write("}\n")
 
@@ -532,7 +825,7 @@ class CppGenerator:
             t = self.get_class_name(parm.type().as_class())
             writer.write("ARRAY_ARG_RETURN({t}, {s}, {n}Arg, {n});\n".format(t=t, n=parm.name(), s=parm.array_len()))
 
-    def write_class_service_impl(self, writer, desc, class_desc):
+    def write_class_service_impl(self, writer, desc, class_desc, inline=False):
         """
         Writes the implementation of a client API class service.
 
@@ -546,10 +839,14 @@ class CppGenerator:
         name = desc.name()
         parms = self.generate_parm_list(desc.parameters())
         class_name = self.get_class_name(class_desc)
-        writer.write("{rtype} {cname}::{name}({parms}) {{\n".format(rtype=rtype, cname=class_name, name=name, parms=parms))
+        qual = "inline " if inline else ""
+        writer.write("{qual}{rtype} {cname}::{name}({parms}) {{\n".format(qual=qual, rtype=rtype, cname=class_name, name=name, parms=parms))
         writer.indent()
+        self.write_profile_probe(writer, self.get_entry_point_name(desc, class_desc))
+        self.write_trace_call(writer, self.get_entry_point_name(desc, class_desc), desc.parameters(), receiver=None if desc.is_static() else "this")
 
         if desc.is_impl_default():
+            self.write_trace_return(writer, desc.parameters(), desc.return_type(), "0")
             writer.write("return 0;\n")
         else:
             for parm in desc.parameters():
@@ -561,16 +858,19 @@ class CppGenerator:
                 writer.write(impl_call + ";\n")
                 for parm in desc.parameters():
                     self.write_arg_return(writer, parm)
+                self.write_trace_return(writer, desc.parameters())
             elif desc.return_type().is_class():
                 writer.write("{rtype} implRet = {call};\n".format(rtype=self.get_impl_type(desc.return_type()), call=impl_call))
                 for parm in desc.parameters():
                     self.write_arg_return(writer, parm)
                 writer.write("GET_CLIENT_OBJECT(clientObj, {t}, implRet);\n".format(t=desc.return_type().name()))
+                self.write_trace_return(writer, desc.parameters(), desc.return_type(), "clientObj")
                 writer.write("return clientObj;\n")
             else:
                 writer.write("auto ret = " + impl_call + ";\n")
                 for parm in desc.parameters():
                     self.write_arg_return(writer, parm)
+                self.write_trace_return(writer, desc.parameters(), desc.return_type(), "ret")
                 writer.write("return ret;\n")
 
         writer.outdent()
@@ -613,6 +913,42 @@ class CppGenerator:
         writer.outdent()
         writer.write("}\n")
 
+    def write_bulk_service_impl(self, writer, desc, class_desc):
+        """
+        Writes the implementation of the bulk variant of a batchable
+        client API class service.
+
+        The implementation object is looked up once, then the service is
+        performed on each operand tuple in turn. With profiling or tracing
+        enabled, each tuple is instead forwarded to the service itself, so
+        that every operation is still counted and recorded.
+        """
+        rtype = desc.return_type()
+        forward = self.profile or self.trace
+        writer.write("void {cname}::{name}Bulk({parms}) {{\n".format(cname=self.get_class_name(class_desc), name=desc.name(), parms=self.generate_bulk_parm_list(desc)))
+        writer.indent()
+        if forward:
+            call = "{name}({args})".format(name=desc.name(), args=", ".join([p.name() for p in desc.parameters()]))
+        else:
+            writer.write("{t} implSelf = {cast};\n".format(t=self.get_impl_type(class_desc.as_type()), cast=self.to_impl_cast(class_desc, "_impl")))
+            call = "implSelf->{name}({args})".format(name=desc.name(), args=self.generate_arg_list(desc.parameters()))
+        writer.write("for (size_t i = 0; i < count; ++i) {\n")
+        writer.indent()
+        for parm in desc.parameters():
+            writer.write("{parm} = operands[i].{name};\n".format(parm=self.generate_parm(parm), name=parm.name()))
+        if "none" == rtype.name():
+            writer.write(call + ";\n")
+        elif rtype.is_class() and not forward:
+            writer.write("{t} implRet = {call};\n".format(t=self.get_impl_type(rtype), call=call))
+            writer.write("GET_CLIENT_OBJECT(clientObj, {t}, implRet);\n".format(t=rtype.name()))
+            writer.write("results[i] = clientObj;\n")
+        else:
+            writer.write("results[i] = {call};\n".format(call=call))
+        writer.outdent()
+        writer.write("}\n")
+        writer.outdent()
+        writer.write("}\n")
+
     def generate_callback_parm_list(self, parm_descs):
         """
         Generates the parameter list declaration for a client
@@ -666,8 +1002,19 @@ class CppGenerator:
 
         writer.write('extern "C" {rtype} {thunk}({parms}) {{\n'.format(rtype=rtype,thunk=thunk,parms=parms))
         writer.indent()
+        self.write_profile_probe(writer, self.get_entry_point_name(callback_desc, class_desc, is_thunk=True))
         writer.write("{ctype} client = {clientObj};\n".format(ctype=ctype,clientObj=self.to_client_cast(class_desc,"clientObj")))
-        writer.write("return client->{callback}({args});\n".format(callback=callback,args=args))
+        if not self.trace:
+            writer.write("return client->{callback}({args});\n".format(callback=callback,args=args))
+        else:
+            self.write_trace_call(writer, self.get_entry_point_name(callback_desc, class_desc, is_thunk=True), callback_desc.parameters(), receiver="client")
+            if "none" == callback_desc.return_type().name():
+                writer.write("client->{callback}({args});\n".format(callback=callback,args=args))
+                self.write_trace_return(writer, callback_desc.parameters())
+            else:
+                writer.write("{rtype} ret = client->{callback}({args});\n".format(rtype=rtype,callback=callback,args=args))
+                self.write_trace_return(writer, callback_desc.parameters(), callback_desc.return_type(), "ret")
+                writer.write("return ret;\n")
         writer.outdent()
         writer.write("}\n")
 
@@ -740,11 +1087,19 @@ class CppGenerator:
         writer.write("{cname}::~{name}() {{}}\n".format(cname=full_name,name=name))
         writer.write("\n")
 
-        # write service definitions
+        # write service definitions (inlined services are in the -inl.hpp header)
         for s in class_desc.services():
+            if self.is_inlined_service(s):
+                continue
             self.write_class_service_impl(writer, s, class_desc)
             writer.write("\n")
 
+        # write bulk variants of batchable services
+        for s in class_desc.services():
+            if s.is_batchable():
+                self.write_bulk_service_impl(writer, s, class_desc)
+                writer.write("\n")
+
         # write service definitions
         for s in class_desc.callbacks():
             self.write_class_service_impl(writer, s, class_desc)
@@ -767,7 +1122,9 @@ class CppGenerator:
         registrations = []
         for c in class_desc.inner_classes():
             registrations += self.generate_allocator_setting(c)
-        registrations += "{iname}::setClientAllocator(OMR::JitBuilder::{alloc});\n".format(iname=self.get_impl_class_name(class_desc),cname=self.get_class_name(class_desc),alloc=self.get_allocator_name(class_desc))
+        ns = "::".join(self.namespaces)
+        registrations += "{iname}::setClientAllocator({ns}::{alloc});\n".format(iname=self.get_impl_class_name(class_desc),ns=ns,alloc=self.get_allocator_name(class_desc))
+        registrations += "{iname}::setGetImpl({ns}::{getter});\n".format(iname=self.get_impl_class_name(class_desc),ns=ns,getter=self.impl_getter_name(class_desc))
         return registrations
 
     def generate_service_decl(self, service, namespace=""):
@@ -783,6 +1140,28 @@ class CppGenerator:
 
         return decl
 
+    def get_async_callback_type(self, service, namespace=""):
+        """
+        Returns the type of the completion callback taken by the
+        asynchronous variant of a service.
+        """
+        rtype = service.return_type()
+        parm = "" if "none" == rtype.name() else self.get_client_type(rtype, namespace)
+        return "std::function<void({})>".format(parm)
+
+    def generate_async_service_decl(self, service, namespace=""):
+        """
+        Generates the declaration of the asynchronous variant of a
+        client API service from its description.
+
+        The variant takes the same parameters as the service (arrays are
+        never passed as varargs), plus an optional completion callback.
+        """
+        ret = self.get_client_type(service.return_type(), namespace)
+        parms = self.generate_parm_list(service.parameters(), namespace)
+        callback = self.get_async_callback_type(service, namespace)
+        return "std::future<{rtype}> {name}Async({parms}, {cb} onComplete = {cb}());\n".format(rtype=ret, name=service.name(), parms=parms, cb=callback)
+
     def write_common_decl(self, writer, api_desc):
         """
         Writes the declarations of all client API (non-class) services
@@ -790,7 +1169,7 @@ class CppGenerator:
         """
         writer.write(self.get_copyright_header())
         writer.write("\n")
-        namespaces = api_desc.namespaces()
+        namespaces = self.namespaces
 
         writer.write("#ifndef {}_INCL\n".format(api_desc.project()))
         writer.write("#define {}_INCL\n\n".format(api_desc.project()))
@@ -806,8 +1185,16 @@ class CppGenerator:
         # include headers for each defined class
         for c in api_desc.get_class_names():
             writer.write(self.generate_include(c + ".hpp"))
+        if self.async_services:
+            writer.write(self.generate_include("Async.hpp"))
         writer.write("\n")
 
+        # inline service definitions need all the classes to be defined first
+        if self.inline_services:
+            for c in api_desc.classes():
+                writer.write(self.generate_include(self.get_inline_header_name(c)))
+            writer.write("\n")
+
         # write declarations for all services
         ns = "::".join(namespaces) + "::"
         for service in api_desc.services():
@@ -815,6 +1202,24 @@ class CppGenerator:
             writer.write(decl)
         writer.write("\n")
 
+        if self.async_services:
+            for service in self.async_services:
+                writer.write(self.generate_async_service_decl(service, namespace=ns))
+            writer.write("void setAsyncWorkerCount(size_t count);\n")
+            writer.write("void waitForAsyncServices();\n")
+            writer.write("\n")
+
+        if self.profile:
+            writer.write(self.generate_include("stdio.h"))
+            writer.write("void dumpCallProfile(FILE * out, size_t count);\n")
+            writer.write("void resetCallProfile();\n")
+            writer.write("\n")
+
+        if self.trace:
+            writer.write("bool writeCallTrace(const char * path);\n")
+            writer.write("void clearCallTrace();\n")
+            writer.write("\n")
+
         writer.write("#endif // {}_INCL\n".format(api_desc.project()))
 
     def generate_impl_service_import(self, service_desc):
@@ -830,18 +1235,60 @@ class CppGenerator:
     def write_allocators_setter(self, writer, api_desc):
         """
         Writes the implementation of a function that sets the
-        allocator functions for all client API classes.
+        allocator and implementation getter functions for all
+        client API classes.
 
         The generated function will be called by any service
-        that has the `sets-allocators` flag.
-        """
-        writer.write("static void {}() {{\n".format(self.allocator_setter_name))
+        that has the `sets-allocators` flag. Because the functions
+        are stored in static fields shared by all threads, they are
+        only set the first time, using the initialization of a local
+        static (which C++11 guarantees to be thread-safe). This is
+        the only global state of the client API, so client objects can
+        otherwise be created and used on several threads concurrently.
+
+        The fields are shared with the other client APIs (such as the C
+        API) linked into the process. If another client API claimed them
+        first, they are left alone and the services setting them fail.
+        """
+        writer.write(get_allocators_claim_import())
+        writer.write("\n")
+
+        writer.write("static bool {}() {{\n".format(self.allocator_registrar_name))
+        writer.indent()
+        writer.write("if (!{}) {{\n".format(get_allocators_claim_call("C++")))
         writer.indent()
+        writer.write("return false;\n")
+        writer.outdent()
+        writer.write("}\n")
         for c in api_desc.classes():
             writer.write("".join(self.generate_allocator_setting(c)))
+        writer.write("return true;\n")
+        writer.outdent()
+        writer.write("}\n\n")
+
+        writer.write("static bool {}() {{\n".format(self.allocator_setter_name))
+        writer.indent()
+        writer.write("static const bool allocatorsSet = {}();\n".format(self.allocator_registrar_name))
+        writer.write("return allocatorsSet;\n")
         writer.outdent()
         writer.write("}\n")
 
+    def write_allocators_check(self, writer, desc):
+        """
+        Writes the call setting the allocators at the start of a service.
+        Services returning a boolean return false if the allocators are
+        claimed by another client API.
+        """
+        if desc.return_type().name() == "boolean":
+            writer.write("if (!{}()) {{\n".format(self.allocator_setter_name))
+            writer.indent()
+            self.write_trace_return(writer, desc.parameters(), desc.return_type(), "false")
+            writer.write("return false;\n")
+            writer.outdent()
+            writer.write("}\n")
+        else:
+            writer.write("{}();\n".format(self.allocator_setter_name))
+
     def write_service_impl(self, writer, desc, namespace=""):
         """
         Writes the implementation of client API (non-class) service.
@@ -854,9 +1301,11 @@ class CppGenerator:
         parms = self.generate_parm_list(desc.parameters(), namespace)
         writer.write("{rtype} {name}({parms}) {{\n".format(rtype=rtype, name=name, parms=parms))
         writer.indent()
+        self.write_profile_probe(writer, self.get_entry_point_name(desc))
+        self.write_trace_call(writer, self.get_entry_point_name(desc), desc.parameters())
 
         if desc.sets_allocators():
-            writer.write("{}();\n".format(self.allocator_setter_name))
+            self.write_allocators_check(writer, desc)
 
         for parm in desc.parameters():
             self.write_arg_setup(writer, parm)
@@ -867,16 +1316,19 @@ class CppGenerator:
             writer.write(impl_call + ";\n")
             for parm in desc.parameters():
                 self.write_arg_return(writer, parm)
+            self.write_trace_return(writer, desc.parameters())
         elif desc.return_type().is_class():
             writer.write("{rtype} implRet = {call};\n".format(rtype=self.get_impl_type(desc.return_type()), call=impl_call))
             for parm in desc.parameters():
                 self.write_arg_return(writer, parm)
             writer.write("GET_CLIENT_OBJECT(clientObj, {t}, implRet);\n".format(t=desc.return_type().name()))
+            self.write_trace_return(writer, desc.parameters(), desc.return_type(), "clientObj")
             writer.write("return clientObj;\n")
         else:
             writer.write("auto ret = " + impl_call + ";\n")
             for parm in desc.parameters():
                 self.write_arg_return(writer, parm)
+            self.write_trace_return(writer, desc.parameters(), desc.return_type(), "ret")
             writer.write("return ret;\n")
         writer.outdent()
         writer.write("}\n")
@@ -885,6 +1337,148 @@ class CppGenerator:
             writer.write("\n")
             self.write_vararg_service_impl(writer, desc, class_name)
 
+    def write_async_service_impl(self, writer, desc, namespace=""):
+        """
+        Writes the implementation of the asynchronous variant of a
+        client API (non-class) service.
+
+        The variant queues a call to the synchronous service on the
+        worker pool declared in `Async.hpp`, so profiling and tracing
+        record the call on the worker thread that runs it.
+        """
+        rtype = self.get_client_type(desc.return_type(), namespace)
+        parms = self.generate_parm_list(desc.parameters(), namespace)
+        callback = self.get_async_callback_type(desc, namespace)
+        args = ", ".join([p.name() for p in desc.parameters()])
+        call = "{name}({args})".format(name=desc.name(), args=args)
+        writer.write("std::future<{rtype}> {name}Async({parms}, {cb} onComplete) {{\n".format(rtype=rtype, name=desc.name(), parms=parms, cb=callback))
+        writer.indent()
+        if "none" == desc.return_type().name():
+            writer.write("return OMR::JitBuilder::submitAsync([=]() {{ {call}; }}, onComplete);\n".format(call=call))
+        else:
+            writer.write("return OMR::JitBuilder::submitAsync<{rtype}>([=]() {{ return {call}; }}, onComplete);\n".format(rtype=rtype, call=call))
+        writer.outdent()
+        writer.write("}\n")
+
+    def write_async_impl(self, writer, namespaces):
+        """
+        Writes the worker pool used by the asynchronous service
+        variants, along with the implementation of the functions
+        that configure and drain it.
+
+        Calls still queued or running when the JIT is shut down would
+        use a JIT that no longer exists, so clients must call
+        `waitForAsyncServices()` before shutting down.
+        """
+        for n in namespaces:
+            writer.write("namespace {} {{\n".format(n))
+        writer.write("\n")
+
+        writer.write("AsyncWorkerPool asyncWorkerPool;\n\n")
+
+        for n in reversed(namespaces):
+            writer.write("}} // {}\n".format(n))
+        writer.write("\n")
+
+        ns = "::".join(namespaces) + "::"
+        writer.write("void setAsyncWorkerCount(size_t count) {\n")
+        writer.indent()
+        writer.write("{ns}asyncWorkerPool.setMaxWorkers(count);\n".format(ns=ns))
+        writer.outdent()
+        writer.write("}\n\n")
+
+        writer.write("void waitForAsyncServices() {\n")
+        writer.indent()
+        writer.write("{ns}asyncWorkerPool.wait();\n".format(ns=ns))
+        writer.outdent()
+        writer.write("}\n\n")
+
+    def write_profile_impl(self, writer, namespaces):
+        """
+        Writes the per-thread table updated by the call probes, along
+        with the implementation of the functions that report and
+        reset the current thread's entries.
+
+        `dumpCallProfile()` prints the `count` most called entry points
+        (or the ones with the most accumulated time when timers are
+        enabled) that were called at least once. Calling
+        `resetCallProfile()` before each compilation and
+        `dumpCallProfile()` after it gives a per-compilation profile.
+        """
+        count = len(self.entry_point_names)
+        key = "cycles" if self.profile == "timers" else "calls"
+        ns = "::".join(namespaces) + "::"
+
+        for n in namespaces:
+            writer.write("namespace {} {{\n".format(n))
+        writer.write("\n")
+
+        writer.write("static const char * profileEntryNames[] = {\n")
+        writer.indent()
+        for name in self.entry_point_names:
+            writer.write('"{}",\n'.format(name))
+        writer.outdent()
+        writer.write("};\n\n")
+        writer.write("thread_local ProfileEntry profileEntries[{}] = {{}};\n\n".format(count))
+
+        for n in reversed(namespaces):
+            writer.write("}} // {}\n".format(n))
+        writer.write("\n")
+
+        writer.write("void dumpCallProfile(FILE * out, size_t count) {\n")
+        writer.indent()
+        writer.write("int32_t order[{}];\n".format(count))
+        writer.write("for (int32_t i = 0; i < {}; ++i) {{ order[i] = i; }}\n".format(count))
+        writer.write("std::stable_sort(order, order + {count}, [](int32_t l, int32_t r) {{ return {ns}profileEntries[l].{key} > {ns}profileEntries[r].{key}; }});\n".format(count=count, ns=ns, key=key))
+        writer.write('fprintf(out, "%-60s %12s %16s\\n", "entry point", "calls", "{}");\n'.format("cycles" if self.profile == "timers" else ""))
+        writer.write("for (size_t i = 0; i < count && i < {}; ++i) {{\n".format(count))
+        writer.indent()
+        writer.write("const {ns}ProfileEntry & entry = {ns}profileEntries[order[i]];\n".format(ns=ns))
+        writer.write("if (entry.calls == 0) break;\n")
+        writer.write('fprintf(out, "%-60s %12llu %16llu\\n", {ns}profileEntryNames[order[i]], (unsigned long long)entry.calls, (unsigned long long)entry.cycles);\n'.format(ns=ns))
+        writer.outdent()
+        writer.write("}\n")
+        writer.outdent()
+        writer.write("}\n\n")
+
+        writer.write("void resetCallProfile() {\n")
+        writer.indent()
+        writer.write("memset({ns}profileEntries, 0, sizeof({ns}ProfileEntry) * {count});\n".format(ns=ns, count=count))
+        writer.outdent()
+        writer.write("}\n\n")
+
+    def write_trace_impl(self, writer, namespaces):
+        """
+        Writes the per-thread call trace filled by the call recorders,
+        along with the implementation of the functions that save and
+        discard the current thread's trace.
+
+        The saved trace can be turned into a standalone replay driver
+        using `tracereplay.py`.
+        """
+        for n in namespaces:
+            writer.write("namespace {} {{\n".format(n))
+        writer.write("\n")
+
+        writer.write("thread_local CallTrace callTrace;\n\n")
+
+        for n in reversed(namespaces):
+            writer.write("}} // {}\n".format(n))
+        writer.write("\n")
+
+        ns = "::".join(namespaces) + "::"
+        writer.write("bool writeCallTrace(const char * path) {\n")
+        writer.indent()
+        writer.write("return {ns}callTrace.write(path, {count});\n".format(ns=ns, count=len(self.entry_point_names)))
+        writer.outdent()
+        writer.write("}\n\n")
+
+        writer.write("void clearCallTrace() {\n")
+        writer.indent()
+        writer.write("{ns}callTrace.clear();\n".format(ns=ns))
+        writer.outdent()
+        writer.write("}\n\n")
+
     def write_common_impl(self, writer, api_desc):
         """Writes the implementation of all client API (non-class) services."""
 
@@ -893,6 +1487,11 @@ class CppGenerator:
 
         for h in self.impl_include_files:
             writer.write(self.generate_include(h))
+        if self.async_services:
+            writer.write(self.generate_include(self.async_header))
+        if self.profile:
+            for h in ["algorithm", "stdio.h", "string.h"]:
+                writer.write("#include <{}>\n".format(h))
         writer.write("\n")
 
         for service in api_desc.services():
@@ -902,11 +1501,24 @@ class CppGenerator:
         self.write_allocators_setter(writer, api_desc)
         writer.write("\n")
 
-        ns = "::".join(api_desc.namespaces()) + "::"
+        ns = "::".join(self.namespaces) + "::"
         for service in api_desc.services():
             self.write_service_impl(writer, service, ns)
             writer.write("\n")
 
+        for service in self.async_services:
+            self.write_async_service_impl(writer, service, ns)
+            writer.write("\n")
+
+        if self.async_services:
+            self.write_async_impl(writer, self.runtime_namespaces)
+
+        if self.profile:
+            self.write_profile_impl(writer, self.runtime_namespaces)
+
+        if self.trace:
+            self.write_trace_impl(writer, self.runtime_namespaces)
+
     def write_class_header(self, writer, class_desc, namespaces, class_names):
         """Writes the header for a client API class from the class description."""
 
@@ -918,6 +1530,9 @@ class CppGenerator:
         writer.write("#ifndef {}_INCL\n".format(class_desc.name()))
         writer.write("#define {}_INCL\n\n".format(class_desc.name()))
 
+        if self.inline_services:
+            self.write_outermost_header_check(writer, class_desc)
+
         for header in self.get_common_system_includes():
             writer.write(self.generate_include(header))
 
@@ -949,8 +1564,44 @@ class CppGenerator:
             writer.write("}} // {}\n".format(n))
         writer.write("\n")
 
+        if self.inline_services:
+            self.write_inline_headers_include(writer, class_desc)
+
         writer.write("#endif // {}_INCL\n".format(class_desc.name()))
 
+    def get_open_header_macro(self):
+        """Returns the macro defined while the outermost client API class header is being included."""
+        return "{}_CLASS_HEADER_OPEN".format(self.api.project().upper())
+
+    def write_outermost_header_check(self, writer, class_desc):
+        """
+        Writes the preprocessor directives recording whether a class header
+        is the outermost client API class header being included, that is,
+        whether it was not included by another class header.
+        """
+        writer.write("#ifndef {}\n".format(self.get_open_header_macro()))
+        writer.write("#define {}\n".format(self.get_open_header_macro()))
+        writer.write("#define {}_INCL_OUTERMOST\n".format(class_desc.name()))
+        writer.write("#endif\n\n")
+
+    def write_inline_headers_include(self, writer, class_desc):
+        """
+        Writes the inclusion of the inline service definitions of all the
+        classes at the end of a class header, so that clients including any
+        class header get the definitions of the inline services they call.
+
+        The definitions need the classes they use to be defined, but a class
+        header includes the header of its parent class before defining its
+        class. Only the outermost class header includes the definitions,
+        once the classes of all the headers it included are defined.
+        """
+        writer.write("#ifdef {}_INCL_OUTERMOST\n".format(class_desc.name()))
+        writer.write("#undef {}_INCL_OUTERMOST\n".format(class_desc.name()))
+        writer.write("#undef {}\n".format(self.get_open_header_macro()))
+        for c in self.api.classes():
+            writer.write(self.generate_include(self.get_inline_header_name(c)))
+        writer.write("#endif\n\n")
+
     def write_class_source(self, writer, class_desc, namespaces, class_names):
         """
         Writes the implementation (source) for a client API class
@@ -959,8 +1610,7 @@ class CppGenerator:
         writer.write(self.get_copyright_header())
         writer.write("\n")
 
-        # don't bother checking what headers are needed, include everything
-        for h in self.impl_include_files:
+        for h in self.gen_class_include_files(class_desc):
             writer.write(self.generate_include(h))
         writer.write("\n")
 
@@ -975,19 +1625,164 @@ class CppGenerator:
         for n in reversed(namespaces):
             writer.write("}} // {}\n".format(n))
 
-    def write_class(self, header_dir, source_dir, class_desc, namespaces, class_names):
-        """Generates and writes a client API class from its description."""
+    def write_class_inline_impl(self, writer, class_desc):
+        """
+        Write the inline definitions of the services of a client API
+        class and its contained classes.
+        """
+        for c in class_desc.inner_classes():
+            self.write_class_inline_impl(writer, c)
+
+        for s in class_desc.services():
+            if self.is_inlined_service(s):
+                self.write_class_service_impl(writer, s, class_desc, inline=True)
+                writer.write("\n")
+
+    def write_class_inline_header(self, writer, class_desc, namespaces, class_names):
+        """
+        Writes the header containing the inline service definitions
+        of a client API class from the class description.
+
+        Because the inline definitions call into the implementation,
+        this header includes the implementation headers in `ilgen/`.
+        Clients using inline services must therefore have the
+        JitBuilder implementation headers on their include path.
+        """
+        guard = "{}_INL_INCL".format(class_desc.name())
+
+        writer.write(self.get_copyright_header())
+        writer.write("\n")
+
+        writer.write("#ifndef {}\n".format(guard))
+        writer.write("#define {}\n\n".format(guard))
+
+        for c in self.api.classes():
+            writer.write(self.generate_include(os.path.join("ilgen", c.name() + ".hpp")))
+        writer.write(self.generate_include("Macros.hpp"))
+        if self.profile:
+            writer.write(self.generate_include("Profiling.hpp"))
+        if self.trace:
+            writer.write(self.generate_include("Tracing.hpp"))
+        for c in class_names:
+            writer.write(self.generate_include(c + ".hpp"))
+        writer.write("\n")
+
+        # open each nested namespace
+        for n in namespaces:
+            writer.write("namespace {} {{\n".format(n))
+        writer.write("\n")
+
+        self.write_class_inline_impl(writer, class_desc)
+
+        # close each opened namespace
+        for n in reversed(namespaces):
+            writer.write("}} // {}\n".format(n))
+        writer.write("\n")
+
+        writer.write("#endif // {}\n".format(guard))
+
+    def render_class(self, header_dir, source_dir, class_desc, namespaces, class_names):
+        """
+        Generates a client API class from its description, returning a
+        list of `(path, contents)` pairs, one per generated file.
+        """
+        def render(write):
+            out = StringIO()
+            write(PrettyPrinter(out), class_desc, namespaces, class_names)
+            return out.getvalue()
 
         cname = class_desc.name()
-        header_path = os.path.join(header_dir, cname + ".hpp")
-        source_path = os.path.join(source_dir, cname + ".cpp")
-        with open(header_path, "w") as writer:
-            self.write_class_header(PrettyPrinter(writer), class_desc, namespaces, class_names)
-        with open(source_path, "w") as writer:
-            self.write_class_source(PrettyPrinter(writer), class_desc, namespaces, class_names)
+        files = [ (os.path.join(header_dir, cname + ".hpp"), render(self.write_class_header))
+                , (os.path.join(source_dir, cname + ".cpp"), render(self.write_class_source))
+                ]
+        if self.inline_services:
+            files.append((os.path.join(header_dir, self.get_inline_header_name(class_desc)), render(self.write_class_inline_header)))
+        return files
 
 # main generator #####################################################
 
+def render_files(api_description, sourcedir="", headerdir="", extras=None, namespaces=None, deterministic=False, copyright_year=None,
+                 inline_services=False, profile=None, trace=False, minimal_includes=False):
+    """
+    Renders the C++ client API for an API description, returning a list
+    of `(path, class name, contents)` tuples, one per generated file. The
+    class name is None for files common to all classes, and the contents
+    are bytes. The options are described in `render()`.
+    """
+    if deterministic and copyright_year is None and "SOURCE_DATE_EPOCH" not in os.environ:
+        raise ValueError("deterministic rendering needs a copyright year, or SOURCE_DATE_EPOCH to be set")
+    extras = ["TypeDictionary"] if extras is None else extras
+    generator = CppGenerator(api_description, headerdir, extras, inline_services=inline_services, profile=profile, trace=trace,
+                             minimal_includes=minimal_includes, namespaces=namespaces, copyright_year=copyright_year)
+    class_names = api_description.get_class_names()
+
+    files = []
+    for class_desc in api_description.classes():
+        for path, contents in generator.render_class(headerdir, sourcedir, class_desc, generator.namespaces, class_names):
+            files.append((path, class_desc.name(), contents.encode("utf-8")))
+    for path, write in [ (os.path.join(headerdir, "JitBuilder.hpp"), generator.write_common_decl)
+                       , (os.path.join(sourcedir, "JitBuilder.cpp"), generator.write_common_impl)
+                       ]:
+        out = StringIO()
+        write(PrettyPrinter(out), api_description)
+        files.append((path, None, out.getvalue().encode("utf-8")))
+
+    extras_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "extras", "cpp")
+    for name in sorted(os.listdir(extras_dir)):
+        if name.endswith(".hpp"):
+            with open(os.path.join(extras_dir, name), "rb") as f:
+                files.append((os.path.join(headerdir, name), None, f.read()))
+    return files
+
+def render(api_description, sourcedir="", headerdir="", **options):
+    """
+    Renders the C++ client API for an API description in memory, without
+    writing any file, so that build tools can generate the API in-process
+    and decide themselves what to write, cache, or hash.
+
+    Returns an ordered dictionary mapping the path of each generated file
+    to its contents as bytes. Paths are the ones `generate()` would write:
+    sources are in `sourcedir` and headers in `headerdir`. Generated
+    sources include headers by path, so `headerdir` should be where the
+    headers will be found when compiling (the default, an empty directory,
+    leaves the headers to be found through the include path).
+
+    The following options are accepted:
+
+    - `extras`: the classes that have hand-written extra APIs in
+      `extras/cpp/` (by default, `TypeDictionary`)
+    - `namespaces`: the namespaces of the client API (by default, those of
+      the API description)
+    - `deterministic`: when true, the output only depends on the arguments.
+      The copyright year must then be given, either by `copyright_year` or
+      by the `SOURCE_DATE_EPOCH` environment variable.
+    - `copyright_year`: the year in the copyright header of generated files
+    - `inline_services`, `profile`, `trace`, `minimal_includes`: the same
+      as the corresponding options of `CppGenerator`
+    """
+    return OrderedDict((path, contents) for path, _, contents in render_files(api_description, sourcedir, headerdir, **options))
+
+def generate(api_description, sourcedir, headerdir, inline_services=False, profile=None, trace=False, minimal_includes=False, report=None):
+    """
+    Generates the C++ client API for an API description, writing the
+    sources to `sourcedir` and the headers to `headerdir`.
+
+    Returns a dictionary mapping the path of each generated file to the
+    name of the class it was generated for (None for files common to all
+    classes). If `report` is given, a size report of the generated files
+    (see `apireport.py`) is also written to that path.
+    """
+    files = {}
+    for path, class_name, contents in render_files(api_description, sourcedir, headerdir, inline_services=inline_services,
+                                                   profile=profile, trace=trace, minimal_includes=minimal_includes):
+        with open(path, "wb") as f:
+            f.write(contents)
+        files[path] = class_name
+
+    if report is not None:
+        apireport.write_report_file(report, apireport.gen_report(api_description, files))
+    return files
+
 if __name__ == "__main__":
     default_dest = os.path.join(os.getcwd(), "client")
     parser = argparse.ArgumentParser()
@@ -995,27 +1790,24 @@ if __name__ == "__main__":
                         help="destination directory for the generated source files")
     parser.add_argument("--headerdir", type=str, default=default_dest,
                         help="destination directory for the generated header files")
+    parser.add_argument("--inline-services", action="store_true",
+                        help="define services that only forward their arguments inline, in a <class>-inl.hpp header "
+                             "included by the class headers (clients must then have the JitBuilder implementation "
+                             "headers on their include path)")
+    parser.add_argument("--profile", choices=["counters", "timers"],
+                        help="insert per-thread call counters (and optionally timers) in every generated entry point")
+    parser.add_argument("--trace", action="store_true",
+                        help="record every call to a generated entry point in a per-thread trace that "
+                             "tracereplay.py can turn into a standalone replay driver")
+    parser.add_argument("--minimal-includes", action="store_true",
+                        help="only include the headers of the classes each class source refers to")
+    parser.add_argument("--report", type=str,
+                        help="write a size report of the generated files to the given path "
+                             "(as CSV if the path ends with .csv, as JSON otherwise)")
     parser.add_argument("description", help="path to the API description file")
     args = parser.parse_args()
 
     with open(args.description) as api_src:
         api_description = APIDescription.load_json_file(api_src)
 
-    generator = CppGenerator(api_description, args.headerdir, ["TypeDictionary"])
-
-    namespaces = api_description.namespaces()
-    class_names = api_description.get_class_names()
-    # impl_include_files = gen_api_impl_includes(api_description.classes(), args.headerdir)
-
-    for class_desc in api_description.classes():
-        generator.write_class(args.headerdir, args.sourcedir, class_desc, namespaces, class_names)
-    with open(os.path.join(args.headerdir, "JitBuilder.hpp"), "w") as writer:
-        generator.write_common_decl(PrettyPrinter(writer), api_description)
-    with open(os.path.join(args.sourcedir, "JitBuilder.cpp"), "w") as writer:
-        generator.write_common_impl(PrettyPrinter(writer), api_description)
-
-    extras_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "extras", "cpp")
-    names = os.listdir(extras_dir)
-    for name in names:
-        if name.endswith(".hpp"):
-            shutil.copy(os.path.join(extras_dir,name), os.path.join(args.headerdir,name))
+    generate(api_description, args.sourcedir, args.headerdir, inline_services=args.inline_services, profile=args.profile, trace=args.trace, minimal_includes=args.minimal_includes, report=args.report)
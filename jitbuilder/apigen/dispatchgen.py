@@ -0,0 +1,415 @@
+#! /usr/bin/env python
+
+###############################################################################
+# Copyright (c) 2026, 2026 IBM Corp. and others
+#
+# This program and the accompanying materials are made available under
+# the terms of the Eclipse Public License 2.0 which accompanies this
+# distribution and is available at https://www.eclipse.org/legal/epl-2.0/
+# or the Apache License, Version 2.0 which accompanies this distribution and
+# is available at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# This Source Code may also be made available under the following
+# Secondary Licenses when the conditions for such availability set
+# forth in the Eclipse Public License, v. 2.0 are satisfied: GNU
+# General Public License, version 2 with the GNU Classpath
+# Exception [1] and GNU General Public License, version 2 with the
+# OpenJDK Assembly Exception [2].
+#
+# [1] https://www.gnu.org/software/classpath/license.html
+# [2] http://openjdk.java.net/legal/assembly-exception.html
+#
+# SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+###############################################################################
+
+"""
+A module for generating a name-based dispatch table for the flat C API.
+
+Dynamic language bindings resolve API functions by name at runtime. The
+dispatch table maps the name of every function of the flat C API (see
+`cgen.py`) to a *thunk* that calls it. All thunks have the same type: they
+take the arguments of the call packed in an array of `JB_Value`s (with
+the receiver first for non-static class services) and store its result
+in a `JB_Value`. Functions are named after the C API functions, with the
+handle name replaced by the class name:
+
+- `Class.overloadName` for class services (e.g. `IlBuilder.Add`)
+- `Class.new` (or `Class.new_<ParmType>...`), `Class.delete`,
+  `Class.get<Field>`, `Class.as<Ancestor>` and
+  `Class.setClientCallback_<Callback>` for the other class functions
+- `service` for top-level services (e.g. `compileMethodBuilder`)
+
+Each entry also has a signature string describing the types of the return
+value and arguments (see `type_codes`), so bindings can marshal arguments
+without knowing the API.
+
+Names are looked up through a minimal perfect hash computed when the table
+is generated, using the "hash, displace" scheme: names are first hashed
+into buckets, and every bucket gets a displacement (a hash seed) that
+sends all its names to distinct free slots of the table. A lookup hashes
+the name twice and compares it against the one entry it lands on, so it
+takes constant time regardless of the size of the API.
+
+By convention, functions in this module that start with "generate_"
+or "get_" return generated code as a string. Functions that start with
+"write_" take as first argument a writer-like object whose `write()`
+method is called to write the generated code.
+"""
+
+import os
+import argparse
+from genutils import *
+import cgen
+
+# Characters encoding the builtin types in entry signatures, and the
+# members of `JB_Value` holding values of those types. Class handles are
+# encoded as `o`, array parameters as `[` followed by the code of their
+# element type, and in-out parameters as `&` followed by the code of
+# their type. Handles, arrays and in-outs are all held in the `p` member.
+type_codes = { "none": ("v", None)
+             , "boolean": ("b", "b")
+             , "integer": ("z", "z")
+             , "int8": ("c", "i8")
+             , "int16": ("h", "i16")
+             , "int32": ("i", "i32")
+             , "int64": ("l", "i64")
+             , "uint32": ("I", "u32")
+             , "float": ("f", "f")
+             , "double": ("d", "d")
+             , "pointer": ("p", "p")
+             , "ppointer": ("P", "p")
+             , "unsignedInteger": ("z", "z")
+             , "constString": ("s", "cs")
+             , "string": ("S", "str")
+             }
+
+# perfect hashing ####################################################
+
+def hash_name(seed, name):
+    """
+    Hashes a name with a given seed. This must match `hashName()` in the
+    generated source: 32-bit FNV-1a, with the seed mixed into the offset
+    basis, followed by a finalizer that spreads the bits of the result.
+    """
+    h = (0x811C9DC5 ^ seed) & 0xFFFFFFFF
+    for b in bytearray(name.encode("utf-8")):
+        h = ((h ^ b) * 0x01000193) & 0xFFFFFFFF
+    h ^= h >> 16
+    h = (h * 0x85EBCA6B) & 0xFFFFFFFF
+    h ^= h >> 13
+    h = (h * 0xC2B2AE35) & 0xFFFFFFFF
+    h ^= h >> 16
+    return h
+
+def build_perfect_hash(names):
+    """
+    Computes a minimal perfect hash for a list of distinct names.
+
+    Returns the list of bucket displacements and the list of names in
+    table order, such that name `n` is in slot
+    `hash_name(displacements[hash_name(0, n) % len(displacements)], n) % len(names)`.
+    """
+    assert len(set(names)) == len(names), "names in a perfect hash must be distinct"
+    size = len(names)
+    num_buckets = max(1, (size + 1) // 2)
+    buckets = [[] for i in range(num_buckets)]
+    for n in names:
+        buckets[hash_name(0, n) % num_buckets].append(n)
+
+    displacements = [0] * num_buckets
+    slots = [None] * size
+    # place the largest buckets first, while most slots are still free
+    for b in sorted(range(num_buckets), key=lambda b: (-len(buckets[b]), b)):
+        if not buckets[b]:
+            continue
+        d = 1
+        while True:
+            positions = [hash_name(d, n) % size for n in buckets[b]]
+            if len(set(positions)) == len(positions) and all(slots[p] is None for p in positions):
+                break
+            d += 1
+        displacements[b] = d
+        for n, p in zip(buckets[b], positions):
+            slots[p] = n
+    return displacements, slots
+
+def lookup_perfect_hash(displacements, slots, name):
+    """Looks up a name in a perfect hash table, returning its slot or None."""
+    if not slots:
+        return None
+    d = displacements[hash_name(0, name) % len(displacements)]
+    slot = hash_name(d, name) % len(slots)
+    return slot if slots[slot] == name else None
+
+class DispatchFunction:
+    """
+    A C API function reachable through the dispatch table.
+
+    `rtype` is a tuple of the return type code, C type, and `JB_Value`
+    member, and `parms` is a list of such tuples, one per argument
+    (including the receiver).
+    """
+
+    def __init__(self, name, c_name, rtype, parms):
+        self.name = name
+        self.c_name = c_name
+        self.rtype = rtype
+        self.parms = parms
+
+    def signature(self):
+        return "{}:{}".format(self.rtype[0], "".join([p[0] for p in self.parms]))
+
+class DispatchGenerator:
+
+    def __init__(self, api, headerdir, prefix="JB"):
+        self.api = api
+        self.prefix = prefix
+        self.c = cgen.CGenerator(api, headerdir, prefix=prefix)
+
+        self.header_name = "{}Dispatch.h".format(api.project())
+        self.header_path = os.path.join(headerdir, self.header_name)
+
+        self.value_type = "{}_Value".format(prefix)
+        self.thunk_type = "{}_Thunk".format(prefix)
+        self.entry_type = "{}_DispatchEntry".format(prefix)
+        self.lookup_name = "{}_lookupDispatchEntry".format(prefix)
+        self.entries_name = "{}_getDispatchEntries".format(prefix)
+
+        self.functions = self.gen_functions(api)
+        self.displacements, names = build_perfect_hash([f.name for f in self.functions])
+        by_name = dict((f.name, f) for f in self.functions)
+        self.table = [by_name[n] for n in names]
+
+    # dispatch entries ###################################################
+
+    def get_type_code(self, t):
+        """Returns the code, C type, and `JB_Value` member of a value of a given type."""
+        if t.is_class():
+            return ("o", self.c.get_c_type(t), "p")
+        code, member = type_codes[t.name()]
+        return (code, self.c.get_c_type(t), member)
+
+    def get_parm_code(self, parm):
+        """Returns the code, C type, and `JB_Value` member of a parameter."""
+        code, ctype, member = self.get_type_code(parm.type())
+        if parm.is_array():
+            return ("[" + code, ctype + "*", "p")
+        if parm.is_in_out():
+            return ("&" + code, ctype + "*", "p")
+        return (code, ctype, member)
+
+    def get_self_code(self, class_desc):
+        return ("o", self.c.get_handle_name(class_desc) + " *", "p")
+
+    def gen_functions(self, api):
+        """
+        Generates the list of all the C API functions in the dispatch
+        table, in the order they are declared in the C API header.
+        """
+        functions = []
+        def add(class_desc, c_name, rtype, parms):
+            handle = self.c.get_handle_name(class_desc)
+            name = "{}.{}".format(class_desc.name(), c_name[len(handle) + 1:])
+            functions.append(DispatchFunction(name, c_name, rtype, parms))
+
+        for class_desc in self.c.gen_class_list(api):
+            handle = self.c.get_handle_name(class_desc)
+            self_code = self.get_self_code(class_desc)
+
+            for ancestor in self.c.get_ancestors(class_desc):
+                add(class_desc, "{}_as{}".format(handle, ancestor.name()), self.get_type_code(ancestor.as_type()), [self_code])
+            for ctor in class_desc.constructors():
+                add(class_desc, self.c.get_ctor_function_name(class_desc, ctor), self_code, [self.get_parm_code(p) for p in ctor.parameters()])
+            if class_desc.constructors():
+                add(class_desc, handle + "_delete", self.get_type_code(APIType("none", api)), [self_code])
+            for field in class_desc.fields():
+                add(class_desc, "{}_get{}".format(handle, field.name()), self.get_type_code(field.type()), [self_code])
+            for callback in class_desc.callbacks():
+                parms = [self_code, ("p", self.c.get_callback_type_name(class_desc, callback), "p")]
+                add(class_desc, "{}_{}".format(handle, callback_setter_name(callback)), self.get_type_code(APIType("none", api)), parms)
+            for service in self.c.get_class_services(class_desc):
+                parms = [self.get_parm_code(p) for p in service.parameters()]
+                if not service.is_static():
+                    parms = [self_code] + parms
+                add(class_desc, self.c.get_service_function_name(class_desc, service), self.get_type_code(service.return_type()), parms)
+
+        for service in api.services():
+            c_name = "{}_{}".format(self.prefix, service.name())
+            parms = [self.get_parm_code(p) for p in service.parameters()]
+            functions.append(DispatchFunction(service.name(), c_name, self.get_type_code(service.return_type()), parms))
+        return functions
+
+    # header utilities ###################################################
+
+    def write_header(self, writer):
+        """Writes the header declaring the dispatch table."""
+        guard = "{}DISPATCH_INCL".format(self.api.project())
+        v = self.value_type
+
+        writer.write(self.c.get_copyright_header())
+        writer.write("\n")
+        writer.write("#ifndef {}\n".format(guard))
+        writer.write("#define {}\n\n".format(guard))
+        writer.write(self.c.generate_include(self.c.header_name))
+        writer.write("\n")
+
+        writer.write("#ifdef __cplusplus\n")
+        writer.write('extern "C" {\n')
+        writer.write("#endif\n\n")
+
+        writer.write("/* a packed argument or result of a dispatched call */\n")
+        writer.write("typedef union {} {{\n".format(v))
+        writer.indent()
+        for ctype, member in [("bool", "b"), ("int8_t", "i8"), ("int16_t", "i16"), ("int32_t", "i32"), ("int64_t", "i64"),
+                              ("uint32_t", "u32"), ("size_t", "z"), ("float", "f"), ("double", "d"), ("void *", "p"),
+                              ("const char *", "cs"), ("char *", "str")]:
+            writer.write("{} {};\n".format(ctype, member))
+        writer.outdent()
+        writer.write("}} {};\n\n".format(v))
+
+        writer.write("typedef void (*{})(const {} * args, {} * result);\n\n".format(self.thunk_type, v, v))
+
+        writer.write("typedef struct {} {{\n".format(self.entry_type))
+        writer.indent()
+        writer.write("const char * name;\n")
+        writer.write("uint32_t nameLength;\n")
+        writer.write("uint32_t arity;\n")
+        writer.write("const char * signature;\n")
+        writer.write("{} thunk;\n".format(self.thunk_type))
+        writer.outdent()
+        writer.write("}} {};\n\n".format(self.entry_type))
+
+        writer.write("/* returns the entry of a function given its name, or NULL if there is none */\n")
+        writer.write("const {} * {}(const char * name, size_t length);\n".format(self.entry_type, self.lookup_name))
+        writer.write("/* returns all the entries of the table, and their number in `count` */\n")
+        writer.write("const {} * {}(size_t * count);\n\n".format(self.entry_type, self.entries_name))
+
+        writer.write("#ifdef __cplusplus\n")
+        writer.write('} /* extern "C" */\n')
+        writer.write("#endif\n\n")
+        writer.write("#endif /* {} */\n".format(guard))
+
+    # source utilities ###################################################
+
+    def get_thunk_name(self, function):
+        return "thunk_{}".format(function.c_name)
+
+    def generate_unpack(self, parm, i):
+        """Produces the expression unpacking the argument at index `i`."""
+        code, ctype, member = parm
+        arg = "args[{}].{}".format(i, member)
+        if member != "p" or ctype == "void *":
+            return arg
+        if code == "p":
+            # callback setters take function pointers
+            return "reinterpret_cast<{}>({})".format(ctype, arg)
+        return "static_cast<{}>({})".format(ctype, arg)
+
+    def write_thunk(self, writer, function):
+        writer.write("static void {}(const {} * args, {} * result) {{\n".format(self.get_thunk_name(function), self.value_type, self.value_type))
+        writer.indent()
+        args = [self.generate_unpack(p, i) for i, p in enumerate(function.parms)]
+        call = "{}({})".format(function.c_name, ", ".join(args))
+        member = function.rtype[2]
+        writer.write("{};\n".format(call) if member is None else "result->{} = {};\n".format(member, call))
+        writer.outdent()
+        writer.write("}\n\n")
+
+    def write_source(self, writer):
+        """Writes the thunks, the dispatch table, and the lookup function."""
+        writer.write(self.c.get_copyright_header())
+        writer.write("\n")
+        writer.write("#include <string.h>\n")
+        writer.write(self.c.generate_include(self.header_path))
+        writer.write("\n")
+
+        for f in self.functions:
+            self.write_thunk(writer, f)
+
+        count = len(self.table)
+        writer.write("// the displacement of each bucket of the perfect hash\n")
+        writer.write("static const uint32_t displacements[{}] = {{\n".format(len(self.displacements)))
+        writer.indent()
+        for i in range(0, len(self.displacements), 12):
+            writer.write(", ".join([str(d) for d in self.displacements[i:i + 12]]) + ",\n")
+        writer.outdent()
+        writer.write("};\n\n")
+
+        writer.write("static const {} entries[{}] = {{\n".format(self.entry_type, max(1, count)))
+        writer.indent()
+        for f in self.table:
+            writer.write('{{ "{}", {}, {}, "{}", {} }},\n'.format(f.name, len(f.name), len(f.parms), f.signature(), self.get_thunk_name(f)))
+        if not self.table:
+            writer.write("{ NULL, 0, 0, NULL, NULL },\n")
+        writer.outdent()
+        writer.write("};\n\n")
+
+        writer.write("static uint32_t hashName(uint32_t seed, const char * name, size_t length) {\n")
+        writer.indent()
+        writer.write("uint32_t h = 0x811C9DC5u ^ seed;\n")
+        writer.write("for (size_t i = 0; i < length; i++) {\n")
+        writer.indent()
+        writer.write("h = (h ^ static_cast<unsigned char>(name[i])) * 0x01000193u;\n")
+        writer.outdent()
+        writer.write("}\n")
+        writer.write("h ^= h >> 16;\n")
+        writer.write("h *= 0x85EBCA6Bu;\n")
+        writer.write("h ^= h >> 13;\n")
+        writer.write("h *= 0xC2B2AE35u;\n")
+        writer.write("h ^= h >> 16;\n")
+        writer.write("return h;\n")
+        writer.outdent()
+        writer.write("}\n\n")
+
+        writer.write('extern "C" {\n\n')
+        writer.write("const {} * {}(const char * name, size_t length) {{\n".format(self.entry_type, self.lookup_name))
+        writer.indent()
+        if self.table:
+            writer.write("uint32_t d = displacements[hashName(0, name, length) % {}];\n".format(len(self.displacements)))
+            writer.write("const {} * entry = &entries[hashName(d, name, length) % {}];\n".format(self.entry_type, count))
+            writer.write("return entry->nameLength == length && memcmp(entry->name, name, length) == 0 ? entry : NULL;\n")
+        else:
+            writer.write("return NULL;\n")
+        writer.outdent()
+        writer.write("}\n\n")
+
+        writer.write("const {} * {}(size_t * count) {{\n".format(self.entry_type, self.entries_name))
+        writer.indent()
+        writer.write("*count = {};\n".format(count))
+        writer.write("return entries;\n")
+        writer.outdent()
+        writer.write("}\n\n")
+        writer.write('} // extern "C"\n')
+
+# main generator #####################################################
+
+def generate(api_description, sourcedir, headerdir, prefix="JB"):
+    """
+    Generates the dispatch table of the C client API for an API description,
+    writing the source to `sourcedir` and the header to `headerdir`. The C
+    client API itself must be generated with the same prefix, and its header
+    must be in the same directory.
+    """
+    generator = DispatchGenerator(api_description, headerdir, prefix=prefix)
+
+    with open(generator.header_path, "w") as writer:
+        generator.write_header(PrettyPrinter(writer))
+    with open(os.path.join(sourcedir, "{}Dispatch.cpp".format(api_description.project())), "w") as writer:
+        generator.write_source(PrettyPrinter(writer))
+
+if __name__ == "__main__":
+    default_dest = os.path.join(os.getcwd(), "client")
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sourcedir", type=str, default=default_dest,
+                        help="destination directory for the generated source file")
+    parser.add_argument("--headerdir", type=str, default=default_dest,
+                        help="destination directory for the generated header file")
+    parser.add_argument("--prefix", type=str, default="JB",
+                        help="prefix of all the type and function names in the C API")
+    parser.add_argument("description", help="path to the API description file")
+    args = parser.parse_args()
+
+    with open(args.description) as api_src:
+        api_description = APIDescription.load_json_file(api_src)
+
+    generate(api_description, args.sourcedir, args.headerdir, prefix=args.prefix)
@@ -0,0 +1,197 @@
+/*******************************************************************************
+ * Copyright (c) 2026, 2026 IBM Corp. and others
+ *
+ * This program and the accompanying materials are made available under
+ * the terms of the Eclipse Public License 2.0 which accompanies this
+ * distribution and is available at http://eclipse.org/legal/epl-2.0
+ * or the Apache License, Version 2.0 which accompanies this distribution
+ * and is available at https://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * This Source Code may also be made available under the following Secondary
+ * Licenses when the conditions for such availability set forth in the
+ * Eclipse Public License, v. 2.0 are satisfied: GNU General Public License,
+ * version 2 with the GNU Classpath Exception [1] and GNU General Public
+ * License, version 2 with the OpenJDK Assembly Exception [2].
+ *
+ * [1] https://www.gnu.org/software/classpath/license.html
+ * [2] http://openjdk.java.net/legal/assembly-exception.html
+ *
+ * SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+ *******************************************************************************/
+
+
+
+#ifndef CPP_BINDING_TRACING_INCL
+#define CPP_BINDING_TRACING_INCL
+
+#include <stdint.h>
+#include <stdio.h>
+#include <string.h>
+#include <unordered_map>
+#include <vector>
+
+/**
+ * @brief Support for the call recorders inserted by the API generator
+ *
+ * When the client API is generated with tracing enabled, every generated
+ * service, constructor, and callback thunk records its calls in a per-thread
+ * binary trace. The trace can later be turned into a standalone replay driver
+ * by `tracereplay.py`, which reproduces the exact sequence of API calls made
+ * by the client without needing the client itself.
+ *
+ * A trace starts with the magic string "JBTRACE1", a 32-bit endianness marker
+ * (0x01020304 written in native byte order), and the number of entry points in
+ * the API the trace was recorded with. It is followed by a sequence of records:
+ *
+ * - 'C' u16 entry point ID, receiver object (class services only), arguments
+ * - 'R' return value (if any), final value of in-out arguments
+ * - 'F' u32 object, u16 class index, objects assigned to the fields of the class
+ *
+ * Any calls made while an entry point executes (for example, callbacks invoked
+ * by the JitBuilder implementation) are nested between its 'C' and 'R' records.
+ *
+ * Values are written in native format, with booleans as u8, `size_t` as u64,
+ * and pointers as u64 addresses. Strings are written as a u32 length followed
+ * by the characters, with a length of 0xFFFFFFFF for NULL. Objects are written
+ * as u32 IDs, assigned in order of first appearance, with 0 for NULL. Arrays
+ * are written as a u32 length (0xFFFFFFFF for NULL) followed by the objects,
+ * and in-out arguments as a u8 flag telling whether the reference is non-NULL
+ * followed by the referenced object if it is.
+ */
+
+namespace OMR {
+namespace JitBuilder {
+
+class CallTrace
+   {
+   public:
+   CallTrace() : _nextObjectID(1) {}
+
+   template <typename T>
+   void putValue(T v)
+      {
+      uint8_t bytes[sizeof(T)];
+      memcpy(bytes, &v, sizeof(T));
+      _buffer.insert(_buffer.end(), bytes, bytes + sizeof(T));
+      }
+
+   void putCall(uint16_t id)
+      {
+      putValue<uint8_t>('C');
+      putValue<uint16_t>(id);
+      }
+
+   void putReturn()
+      {
+      putValue<uint8_t>('R');
+      }
+
+   void putObject(const void * p)
+      {
+      putValue<uint32_t>(objectID(p));
+      }
+
+   void putString(const char * s)
+      {
+      if (s == NULL)
+         {
+         putValue<uint32_t>(0xFFFFFFFF);
+         return;
+         }
+      uint32_t len = static_cast<uint32_t>(strlen(s));
+      putValue<uint32_t>(len);
+      _buffer.insert(_buffer.end(), s, s + len);
+      }
+
+   template <typename T>
+   void putArray(size_t n, T * const * a)
+      {
+      if (a == NULL)
+         {
+         putValue<uint32_t>(0xFFFFFFFF);
+         return;
+         }
+      putValue<uint32_t>(static_cast<uint32_t>(n));
+      for (size_t i = 0; i < n; i++)
+         putObject(a[i]);
+      }
+
+   template <typename T>
+   void putInOut(T * const * p)
+      {
+      putValue<uint8_t>(p != NULL);
+      if (p != NULL)
+         putObject(*p);
+      }
+
+   void putFields(uint16_t classIndex, const void * p)
+      {
+      putValue<uint8_t>('F');
+      putObject(p);
+      putValue<uint16_t>(classIndex);
+      }
+
+   /**
+    * @brief Writes the trace recorded so far to a file
+    * @param path is the path of the file to write
+    * @param numEntryPoints is the number of entry points in the traced API
+    * @return true if the trace was written successfully, false otherwise
+    */
+   bool write(const char * path, uint32_t numEntryPoints)
+      {
+      FILE * out = fopen(path, "wb");
+      if (out == NULL)
+         return false;
+      uint32_t header[2] = { 0x01020304, numEntryPoints };
+      bool ok = fwrite("JBTRACE1", 1, 8, out) == 8
+             && fwrite(header, sizeof(header), 1, out) == 1
+             && (_buffer.empty() || fwrite(&_buffer[0], _buffer.size(), 1, out) == 1);
+      return fclose(out) == 0 && ok;
+      }
+
+   /**
+    * @brief Discards the trace recorded so far
+    *
+    * Object IDs are also reset, so a trace started after this call
+    * can be replayed on its own.
+    */
+   void clear()
+      {
+      _buffer.clear();
+      _objectIDs.clear();
+      _nextObjectID = 1;
+      }
+
+   private:
+   uint32_t objectID(const void * p)
+      {
+      if (p == NULL)
+         return 0;
+      std::unordered_map<const void *, uint32_t>::iterator it = _objectIDs.find(p);
+      if (it != _objectIDs.end())
+         return it->second;
+      _objectIDs[p] = _nextObjectID;
+      return _nextObjectID++;
+      }
+
+   std::vector<uint8_t> _buffer;
+   std::unordered_map<const void *, uint32_t> _objectIDs;
+   uint32_t _nextObjectID;
+   };
+
+extern thread_local CallTrace callTrace;
+
+} // JitBuilder
+} // OMR
+
+#define TRACE_CALL(id) OMR::JitBuilder::callTrace.putCall(id)
+#define TRACE_RETURN() OMR::JitBuilder::callTrace.putReturn()
+#define TRACE_VALUE(type, v) OMR::JitBuilder::callTrace.putValue<type>(static_cast<type>(v))
+#define TRACE_POINTER(p) OMR::JitBuilder::callTrace.putValue<uint64_t>(static_cast<uint64_t>(reinterpret_cast<uintptr_t>(p)))
+#define TRACE_STRING(s) OMR::JitBuilder::callTrace.putString(s)
+#define TRACE_OBJECT(p) OMR::JitBuilder::callTrace.putObject(p)
+#define TRACE_ARRAY(n, a) OMR::JitBuilder::callTrace.putArray(n, a)
+#define TRACE_IN_OUT(p) OMR::JitBuilder::callTrace.putInOut(p)
+#define TRACE_FIELDS(classIndex, p) OMR::JitBuilder::callTrace.putFields(classIndex, p)
+
+#endif // defined(CPP_BINDING_TRACING_INCL)
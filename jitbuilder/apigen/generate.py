@@ -0,0 +1,351 @@
+#! /usr/bin/env python
+
+###############################################################################
+# Copyright (c) 2026, 2026 IBM Corp. and others
+#
+# This program and the accompanying materials are made available under
+# the terms of the Eclipse Public License 2.0 which accompanies this
+# distribution and is available at https://www.eclipse.org/legal/epl-2.0/
+# or the Apache License, Version 2.0 which accompanies this distribution and
+# is available at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# This Source Code may also be made available under the following
+# Secondary Licenses when the conditions for such availability set
+# forth in the Eclipse Public License, v. 2.0 are satisfied: GNU
+# General Public License, version 2 with the GNU Classpath
+# Exception [1] and GNU General Public License, version 2 with the
+# OpenJDK Assembly Exception [2].
+#
+# [1] https://www.gnu.org/software/classpath/license.html
+# [2] http://openjdk.java.net/legal/assembly-exception.html
+#
+# SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+###############################################################################
+
+"""
+A driver that generates several client APIs from one API description.
+
+Each of the generators (`cppgen.py`, `cgen.py`, ...) can be run on its
+own, but doing so parses the API description once per generator. This
+driver instead loads and validates the description once, then runs every
+requested backend against the shared model, optionally in parallel.
+
+Backends are registered in `backends` by name, along with the options
+they accept. Every backend gets its own `--<name>-sourcedir` and
+`--<name>-headerdir` options, and its other options are prefixed with
+its name in the same way (e.g. `--cpp-profile`).
+
+Given a usage manifest (see `usage.py`), the description is pruned to the
+parts of the API the client requires before any backend is run.
+
+Validation happens in two steps. If the 'jsonschema' package is installed,
+the description is first validated against the schemas in `schema/`.
+The description is then checked for errors the schemas cannot catch, such
+as references to undefined classes.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import multiprocessing
+from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
+from genutils import *
+import cppgen
+import cgen
+import dispatchgen
+import usage
+
+class Backend:
+    """
+    A client API generator that can be run by the driver.
+
+    `generate` is called with the API description, the source and header
+    directories, and one keyword argument per option. `options` is a list
+    of `(name, argparse keyword arguments)` pairs, one per option.
+    """
+
+    def __init__(self, name, generate, help, options=[]):
+        self.name = name
+        self.generate = generate
+        self.help = help
+        self.options = options
+
+    def option_flag(self, option):
+        """Returns the command line flag of one of the backend options."""
+        return "--{}-{}".format(self.name, option.replace("_", "-"))
+
+    def option_dest(self, option):
+        """Returns the attribute holding one of the backend options in parsed arguments."""
+        return "{}_{}".format(self.name, option)
+
+backends = OrderedDict()
+
+def register_backend(backend):
+    """Registers a backend with the driver."""
+    assert backend.name not in backends, "backend '{}' is already registered".format(backend.name)
+    backends[backend.name] = backend
+
+register_backend(Backend("cpp", cppgen.generate, "C++ client API",
+                         [ ("inline_services", dict(action="store_true", help="define forwarding services inline")),
+                           ("profile", dict(choices=["counters", "timers"], help="insert call counters (and optionally timers)")),
+                           ("trace", dict(action="store_true", help="record calls in a per-thread trace")),
+                           ("minimal_includes", dict(action="store_true", help="only include the headers each class source needs")),
+                           ("report", dict(type=str, help="write a size report of the generated files (JSON, or CSV if the path ends with .csv)")),
+                         ]))
+register_backend(Backend("c", cgen.generate, "flat C client API",
+                         [ ("prefix", dict(type=str, default="JB", help="prefix of all the names in the generated API")),
+                         ]))
+register_backend(Backend("dispatch", dispatchgen.generate, "name-based dispatch table of the flat C client API",
+                         [ ("prefix", dict(type=str, default="JB", help="prefix of all the names in the C API")),
+                         ]))
+
+# validation #########################################################
+
+def get_schema_dir():
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), "schema")
+
+def check_schema(description):
+    """
+    Validates a raw API description against the API description schema,
+    returning a list of error messages.
+
+    The schemas reference each other by their `$id`. All references are
+    resolved against the local copies of the schemas, so validation never
+    has to fetch them.
+    """
+    from jsonschema import Draft6Validator, RefResolver
+
+    schema_dir = get_schema_dir()
+    store = {}
+    for name in os.listdir(schema_dir):
+        if name.endswith(".schema.json"):
+            with open(os.path.join(schema_dir, name)) as f:
+                schema = json.load(f)
+            store[schema["$id"]] = schema
+    root = [s for s in store.values() if s["$id"].endswith("/api.schema.json")][0]
+    validator = Draft6Validator(root, resolver=RefResolver(root["$id"], root, store=store))
+    return ["{}: {}".format("/".join(str(p) for p in e.absolute_path) or "<description>", e.message)
+            for e in validator.iter_errors(description)]
+
+def check_classes(description):
+    """
+    Checks that every class extended by a raw API description is defined,
+    returning a list of error messages.
+
+    This must be done before the description is loaded, as loading it
+    resolves parent classes.
+    """
+    names = set()
+    extends = []
+    def visit(classes):
+        for c in classes:
+            names.add(c["name"])
+            if "extends" in c: extends.append((c["name"], c["extends"]))
+            visit(c.get("types", []))
+    visit(description.get("classes", []))
+    return ["class '{}' extends undefined class '{}'".format(c, p) for c, p in extends if p not in names]
+
+def check_service(service, where, returns=True):
+    """Checks a service description, returning a list of error messages."""
+    errors = []
+    def check_type(t, what):
+        if not (t.is_builtin() or t.is_class()):
+            errors.append("{}: {} has undefined type '{}'".format(where, what, t.name()))
+
+    if returns:
+        check_type(service.return_type(), "return value")
+    parm_names = [p.name() for p in service.parameters()]
+    for p in service.parameters():
+        check_type(p.type(), "parameter '{}'".format(p.name()))
+        if p.is_array() and p.description.get("array-len") not in parm_names:
+            errors.append("{}: length of array parameter '{}' is not a parameter".format(where, p.name()))
+    return errors
+
+def check_api(api):
+    """
+    Checks a loaded API description for errors not caught by its schema,
+    returning a list of error messages.
+    """
+    errors = []
+    seen = set()
+
+    def check_class(c):
+        name = "::".join(c.containing_classes() + [c.name()])
+        if c.name() in seen:
+            errors.append("class '{}' is defined more than once".format(c.name()))
+        seen.add(c.name())
+        for f in c.fields():
+            if not (f.type().is_builtin() or f.type().is_class()):
+                errors.append("{}: field '{}' has undefined type '{}'".format(name, f.name(), f.type().name()))
+        for s in c.services():
+            errors.extend(check_service(s, "{}::{}".format(name, s.name())))
+            if s.is_async():
+                errors.append("{}::{}: only top-level services can be async".format(name, s.name()))
+            if s.is_batchable() and (s.is_static() or not s.parameters() or [p for p in s.parameters() if p.is_in_out() or p.is_array()]):
+                errors.append("{}::{}: batchable services must not be static, and must have parameters that are not in-out or arrays".format(name, s.name()))
+        for ctor in c.constructors():
+            errors.extend(check_service(ctor, "{}::{}".format(name, c.name()), returns=False))
+        for cb in c.callbacks():
+            errors.extend(check_service(cb, "{}::{}".format(name, cb.name())))
+        for inner in c.inner_classes():
+            check_class(inner)
+
+    for c in api.classes():
+        check_class(c)
+    for s in api.services():
+        errors.extend(check_service(s, s.name()))
+        if s.is_batchable():
+            errors.append("{}: only class services can be batchable".format(s.name()))
+    return errors
+
+def load_api(path, schema=True):
+    """
+    Loads and validates an API description file.
+
+    Returns the loaded description and a list of error messages. The
+    description is None if it could not be loaded.
+    """
+    with open(path) as f:
+        description = json.load(f)
+
+    errors = []
+    if schema:
+        try:
+            errors = check_schema(description)
+        except ImportError:
+            print("warning: The package 'jsonschema' is not installed so the API description will not be validated against its schema")
+    if errors:
+        return None, errors
+
+    errors = check_classes(description)
+    if errors:
+        return None, errors
+
+    api = APIDescription(description)
+    return api, check_api(api)
+
+# backend invocation #################################################
+
+# The description shared by all backends. It is set before worker
+# processes are forked so that they inherit it instead of reloading it.
+_api = None
+
+def make_dirs(path):
+    """
+    Creates a directory and its parents, unless it already exists. Backends
+    may share directories, so another worker may create it concurrently.
+    """
+    try:
+        os.makedirs(path)
+    except OSError:
+        if not os.path.isdir(path):
+            raise
+
+def run_backend(job):
+    """
+    Runs a backend on the shared API description, returning the backend
+    name, the time it took, and an error message if it failed.
+    """
+    name, sourcedir, headerdir, options = job
+    start = time.time()
+    try:
+        for d in set([sourcedir, headerdir]):
+            make_dirs(d)
+        backends[name].generate(_api, sourcedir, headerdir, **options)
+    except Exception as e:
+        return name, time.time() - start, "{}: {}".format(type(e).__name__, e)
+    return name, time.time() - start, None
+
+def run_backends(api, jobs, parallel=1):
+    """
+    Runs a list of `(name, sourcedir, headerdir, options)` backend jobs on
+    an API description, using up to `parallel` workers.
+
+    Workers are forked processes where possible, so that backends do not
+    contend for the interpreter lock. Elsewhere, including on Python 2,
+    they are threads. The
+    results of `run_backend` are returned in the order of `jobs`.
+    """
+    global _api
+    _api = api
+    if parallel <= 1 or len(jobs) <= 1:
+        return [run_backend(j) for j in jobs]
+    workers = min(parallel, len(jobs))
+    if hasattr(multiprocessing, "get_context") and "fork" in multiprocessing.get_all_start_methods():
+        pool = multiprocessing.get_context("fork").Pool(workers)
+    else:
+        pool = ThreadPool(workers)
+    try:
+        return pool.map(run_backend, jobs)
+    finally:
+        pool.close()
+        pool.join()
+
+def get_jobs(args):
+    """Builds the list of backend jobs requested by parsed arguments."""
+    names = args.backend or list(backends.keys())
+    jobs = []
+    for name in names:
+        backend = backends[name]
+        default_dest = os.path.join(os.getcwd(), "client", name)
+        sourcedir = getattr(args, "{}_sourcedir".format(name)) or default_dest
+        headerdir = getattr(args, "{}_headerdir".format(name)) or default_dest
+        options = dict((o, getattr(args, backend.option_dest(o))) for o, _ in backend.options)
+        jobs.append((name, sourcedir, headerdir, options))
+    return jobs
+
+def get_parser():
+    parser = argparse.ArgumentParser(description="Generate several client APIs from one API description.")
+    parser.add_argument("--backend", action="append", choices=list(backends.keys()),
+                        help="backend to run (may be repeated; all backends are run by default)")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="number of backends to run in parallel")
+    parser.add_argument("--no-schema", action="store_true",
+                        help="do not validate the API description against its schema")
+    parser.add_argument("--usage", type=str,
+                        help="usage manifest of the client; only the parts of the API it requires are generated")
+    parser.add_argument("--verbose", "-v", action="store_true",
+                        help="print the time taken by each backend")
+    for backend in backends.values():
+        group = parser.add_argument_group("{} backend".format(backend.name), "options for the {}".format(backend.help))
+        group.add_argument("--{}-sourcedir".format(backend.name), type=str,
+                           help="destination directory for the generated source files (default: client/{})".format(backend.name))
+        group.add_argument("--{}-headerdir".format(backend.name), type=str,
+                           help="destination directory for the generated header files (default: client/{})".format(backend.name))
+        for option, kwargs in backend.options:
+            group.add_argument(backend.option_flag(option), dest=backend.option_dest(option), **kwargs)
+    parser.add_argument("description", help="path to the API description file")
+    return parser
+
+def main(argv):
+    args = get_parser().parse_args(argv)
+
+    api, errors = load_api(args.description, schema=not args.no_schema)
+    for e in errors:
+        sys.stderr.write("{}: error: {}\n".format(args.description, e))
+    if errors:
+        return 1
+
+    if args.usage:
+        with open(args.usage) as f:
+            entries = usage.read_manifest(f)
+        try:
+            api = usage.prune_api(api, entries)
+        except usage.UsageError as e:
+            sys.stderr.write("{}: error: {}\n".format(args.usage, e))
+            return 1
+
+    failed = False
+    for name, elapsed, error in run_backends(api, get_jobs(args), args.jobs):
+        if error is not None:
+            sys.stderr.write("{}: error: {} backend failed: {}\n".format(args.description, name, error))
+            failed = True
+        elif args.verbose:
+            print("{}: {:.3f}s".format(name, elapsed))
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -39,8 +39,11 @@ In addition to these wrapper classes, a few helper functions
 are also included for use in generator implementations.
 """
 
+import os
 import sys
 import json
+import time
+import datetime
 from functools import reduce
 
 # API description wrappers
@@ -205,6 +208,14 @@ class APIService:
         """Returns true if this service has the 'impl-default' flag set."""
         return "impl-default" in self.__flags()
 
+    def is_async(self):
+        """Returns true if this service has the 'async' flag set."""
+        return "async" in self.__flags()
+
+    def is_batchable(self):
+        """Returns true if this service has the 'batchable' flag set."""
+        return "batchable" in self.__flags()
+
     def visibility(self):
         """
         Returns the visibility of the service as a string.
@@ -524,4 +535,29 @@ def get_impl_service_name(service):
     Produces the name of the JitBuilder implementation of a
     "stand-alone" service (not an API class member).
     """
-    return "internal_" + service.name()
\ No newline at end of file
+    return "internal_" + service.name()
+
+def get_allocators_claim_import():
+    """
+    Produces the declaration of the JitBuilder implementation function
+    that a client API calls before setting the allocators and impl
+    getters of the implementation classes. These are shared by all the
+    client APIs linked into a process, so only the first client API to
+    claim them may set them; the function returns false for any other.
+    """
+    return "extern bool internal_claimClientAllocators(const char * clientAPI);\n"
+
+def get_allocators_claim_call(client_api):
+    """Produces a call claiming the allocators for a client API."""
+    return 'internal_claimClientAllocators("{}")'.format(client_api)
+
+def get_copyright_year():
+    """
+    Produces the year used in the copyright header of generated
+    files. This is the year of `SOURCE_DATE_EPOCH` when it is set,
+    so that generated files can be reproduced, and the current year
+    otherwise.
+    """
+    if "SOURCE_DATE_EPOCH" in os.environ:
+        return time.gmtime(int(os.environ["SOURCE_DATE_EPOCH"])).tm_year
+    return datetime.datetime.now().year
@@ -22,10 +22,27 @@
 # SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
 ###############################################################################
 
+import sys
+import argparse
 import unittest
 from test.apidescriptiontests import *
 from test.genutilstests import *
 from test.cppgentests import *
+from test.cgentests import *
+from test.dispatchgentests import *
+from test.apireporttests import *
+from test.compilebenchtests import *
+from test.generatetests import *
+from test.usagetests import *
+from test.snapshottests import *
+import test.snapshottests
+from test.tracereplaytests import *
 
 if __name__ == '__main__':
-    unittest.main()
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--jobs", "-j", type=int, help="number of snapshot cases rendered in parallel")
+    parser.add_argument("--update-snapshots", action="store_true", help="rewrite the snapshots with the generated output")
+    args, argv = parser.parse_known_args()
+    test.snapshottests.jobs = args.jobs
+    test.snapshottests.update = args.update_snapshots
+    unittest.main(argv=sys.argv[:1] + argv)
@@ -0,0 +1,109 @@
+#! /usr/bin/env python
+
+###############################################################################
+# Copyright (c) 2018, 2018 IBM Corp. and others
+#
+# This program and the accompanying materials are made available under
+# the terms of the Eclipse Public License 2.0 which accompanies this
+# distribution and is available at https://www.eclipse.org/legal/epl-2.0/
+# or the Apache License, Version 2.0 which accompanies this distribution and
+# is available at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# This Source Code may also be made available under the following
+# Secondary Licenses when the conditions for such availability set
+# forth in the Eclipse Public License, v. 2.0 are satisfied: GNU
+# General Public License, version 2 with the GNU Classpath
+# Exception [1] and GNU General Public License, version 2 with the
+# OpenJDK Assembly Exception [2].
+#
+# [1] https://www.gnu.org/software/classpath/license.html
+# [2] http://openjdk.java.net/legal/assembly-exception.html
+#
+# SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+###############################################################################
+
+import os
+import shutil
+import tempfile
+import unittest
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+import genutils
+import apireport
+
+class APIReportTest(unittest.TestCase):
+    """Tests for generated code reports"""
+
+    def setUp(self):
+        with open("test/test_sample.json") as f:
+            self.api = genutils.APIDescription.load_json_file(f)
+        self.outdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.outdir)
+
+    def write_file(self, name, content):
+        path = os.path.join(self.outdir, name)
+        with open(path, "w") as f:
+            f.write(content)
+        return path
+
+    def gen_report(self):
+        files = { self.write_file("class_1.hpp", '#include "a.hpp"\n#include "b.hpp"\nclass class_1;\n'): "class_1"
+                , self.write_file("class_1.cpp", '#include "class_1.hpp"\n'): "class_1"
+                , self.write_file("common.hpp", "\n"): None
+                }
+        return apireport.gen_report(self.api, files)
+
+    def test_class_stats_1(self):
+        stats = apireport.class_stats(self.api.get_class_by_name("class_1"))
+        self.assertEqual([("services", 2), ("overloads", 0), ("varargs", 0), ("marshalling", 0)], list(stats.items()))
+
+    def test_gen_report_1(self):
+        rows = self.gen_report()
+        self.assertEqual([("file", "class_1.cpp"), ("file", "class_1.hpp"), ("file", "common.hpp"),
+                          ("class", "class_1"), ("class", "class_2"), ("total", "Project")],
+                         [(r["kind"], r["name"]) for r in rows])
+        class_1 = rows[3]
+        self.assertEqual((4, 3), (class_1["lines"], class_1["includes"]))
+        self.assertEqual(2, class_1["services"])
+        total = rows[-1]
+        self.assertEqual((5, 3, 3, 2), (total["lines"], total["includes"], total["services"], total["marshalling"]))
+
+    def test_read_report_1(self):
+        rows = self.gen_report()
+        for as_csv in [False, True]:
+            out = StringIO()
+            apireport.write_report(out, rows, as_csv=as_csv)
+            self.assertEqual(rows, apireport.read_report(StringIO(out.getvalue()), as_csv=as_csv))
+
+    def test_diff_reports_1(self):
+        old = self.gen_report()
+        self.assertEqual([], apireport.diff_reports(old, old))
+
+    def test_diff_reports_2(self):
+        old = self.gen_report()
+        self.write_file("class_1.cpp", '#include "class_1.hpp"\nvoid f() {}\n')
+        files = { os.path.join(self.outdir, "class_1.hpp"): "class_1"
+                , os.path.join(self.outdir, "class_1.cpp"): "class_1"
+                }
+        diff = apireport.diff_reports(old, apireport.gen_report(self.api, files))
+        self.assertEqual([("file", "class_1.cpp"), ("file", "common.hpp"), ("class", "class_1"), ("total", "Project")],
+                         [(r["kind"], r["name"]) for r in diff])
+        self.assertEqual((1, 2, 1), diff[0]["lines"])
+        self.assertEqual((1, None, None), diff[1]["lines"])
+        self.assertEqual((4, 5, 1), diff[2]["lines"])
+        self.assertEqual((2, 2, 0), diff[2]["services"])
+        self.assertAlmostEqual(0.0, apireport.get_growth(diff, "lines"))
+
+    def test_write_diff_1(self):
+        old = self.gen_report()
+        new = [dict(r) for r in old]
+        new[0]["lines"] += 2
+        out = StringIO()
+        apireport.write_diff(out, apireport.diff_reports(old, new), ["lines"])
+        self.assertEqual("kind   name                       lines\n"
+                         "file   class_1.cpp              1->3 +2\n", out.getvalue())
@@ -0,0 +1,96 @@
+#! /usr/bin/env python
+
+###############################################################################
+# Copyright (c) 2018, 2018 IBM Corp. and others
+#
+# This program and the accompanying materials are made available under
+# the terms of the Eclipse Public License 2.0 which accompanies this
+# distribution and is available at https://www.eclipse.org/legal/epl-2.0/
+# or the Apache License, Version 2.0 which accompanies this distribution and
+# is available at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# This Source Code may also be made available under the following
+# Secondary Licenses when the conditions for such availability set
+# forth in the Eclipse Public License, v. 2.0 are satisfied: GNU
+# General Public License, version 2 with the GNU Classpath
+# Exception [1] and GNU General Public License, version 2 with the
+# OpenJDK Assembly Exception [2].
+#
+# [1] https://www.gnu.org/software/classpath/license.html
+# [2] http://openjdk.java.net/legal/assembly-exception.html
+#
+# SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+###############################################################################
+
+
+import unittest
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+import genutils
+import cgen
+
+class CGeneratorTest(unittest.TestCase):
+    """Tests for CGenerator class"""
+
+    def setUp(self):
+        with open("test/test_sample.json") as f:
+            self.api = genutils.APIDescription.load_json_file(f)
+        self.generator = cgen.CGenerator(self.api, "")
+
+    def test_get_handle_name_1(self):
+        class_desc = self.api.get_class_by_name("class_1_inner_class_1")
+        self.assertEqual("JB_class_1_class_1_inner_class_1", self.generator.get_handle_name(class_desc))
+
+    def test_get_handle_name_2(self):
+        generator = cgen.CGenerator(self.api, "", prefix="P")
+        self.assertEqual("P_class_2", generator.get_handle_name(self.api.get_class_by_name("class_2")))
+
+    def test_generate_parm_1(self):
+        parm = self.api.services()[0].parameters()[1]
+        self.assertEqual("void ** Project_service_1_parm_2", self.generator.generate_parm(parm))
+
+    def test_generate_parm_list_1(self):
+        self.assertEqual("void", self.generator.generate_parm_list([]))
+
+    def test_generate_parm_list_2(self):
+        class_desc = self.api.get_class_by_name("class_1")
+        service = class_desc.services()[0]
+        self.assertEqual("JB_class_1 * self, const char * class_1_service_1_parm",
+                         self.generator.generate_parm_list(service.parameters(), self_class=class_desc))
+
+    def test_get_class_services_1(self):
+        class_desc = self.api.get_class_by_name("class_1")
+        services = class_desc.description["services"]
+        services.append(dict(services[1], name="class_1_service_2overload", overloadsuffix=""))
+        self.assertEqual(class_desc.services()[:2], self.generator.get_class_services(class_desc))
+
+    def test_get_class_services_2(self):
+        class_desc = self.api.get_class_by_name("class_1")
+        services = class_desc.description["services"]
+        services.append(dict(services[1], name="class_1_service_2overload", overloadsuffix="", parms=[{"name": "p", "type": "int32"}]))
+        self.assertRaises(AssertionError, self.generator.get_class_services, class_desc)
+
+    def test_write_header_1(self):
+        out = StringIO()
+        self.generator.write_header(genutils.PrettyPrinter(out), self.api)
+        header = out.getvalue()
+        self.assertIn("typedef struct JB_class_2 JB_class_2;", header)
+        self.assertIn("typedef bool (*JB_class_1_class_1_callback_1Callback)(JB_class_1 * self, bool class_1_callback_1_parm);", header)
+        self.assertIn("JB_class_1 * JB_class_2_asclass_1(JB_class_2 * self);", header)
+        self.assertIn("float JB_class_1_getclass_1_field_1(JB_class_1 * self);", header)
+
+    def test_write_class_impl_1(self):
+        class_desc = self.api.get_class_by_name("class_1")
+        out = StringIO()
+        self.generator.write_class_impl(genutils.PrettyPrinter(out), class_desc)
+        self.assertIn("return reinterpret_cast<TR::class_1 *>(self)->class_1_service_1(class_1_service_1_parm);", out.getvalue())
+        self.assertIn("reinterpret_cast<TR::class_1 *>(self)->setClientCallback_class_1_callback_1(reinterpret_cast<void *>(callback));", out.getvalue())
+
+    def test_write_service_impl_1(self):
+        out = StringIO()
+        self.generator.write_service_impl(genutils.PrettyPrinter(out), self.api.services()[0])
+        self.assertIn("internal_Project_service_1(Project_service_1_parm_1, Project_service_1_parm_2, Project_service_1_parm_3);", out.getvalue())
+        self.assertNotIn("setAllocators", out.getvalue())
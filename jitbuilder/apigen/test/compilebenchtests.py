@@ -0,0 +1,70 @@
+#! /usr/bin/env python
+
+###############################################################################
+# Copyright (c) 2018, 2018 IBM Corp. and others
+#
+# This program and the accompanying materials are made available under
+# the terms of the Eclipse Public License 2.0 which accompanies this
+# distribution and is available at https://www.eclipse.org/legal/epl-2.0/
+# or the Apache License, Version 2.0 which accompanies this distribution and
+# is available at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# This Source Code may also be made available under the following
+# Secondary Licenses when the conditions for such availability set
+# forth in the Eclipse Public License, v. 2.0 are satisfied: GNU
+# General Public License, version 2 with the GNU Classpath
+# Exception [1] and GNU General Public License, version 2 with the
+# OpenJDK Assembly Exception [2].
+#
+# [1] https://www.gnu.org/software/classpath/license.html
+# [2] http://openjdk.java.net/legal/assembly-exception.html
+#
+# SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+###############################################################################
+
+import unittest
+
+import compilebench
+
+class CompileBenchTest(unittest.TestCase):
+    """Tests for the compile-time benchmark harness"""
+
+    def test_generate_unity_source_1(self):
+        self.assertEqual('#include "/a/A.cpp"\n#include "/a/B.cpp"\n', compilebench.generate_unity_source(["/a/A.cpp", "/a/B.cpp"]))
+
+    def test_summarize_time_trace_1(self):
+        trace = { "traceEvents": [ { "name": "Total Frontend", "dur": 1500 }
+                                 , { "name": "Total Source", "dur": 500 }
+                                 , { "name": "Total Source", "dur": 250 }
+                                 , { "name": "Source", "dur": 500 }
+                                 , { "name": "Total Backend" }
+                                 ] }
+        self.assertEqual({ "Frontend": 1.5, "Source": 0.75 }, compilebench.summarize_time_trace(trace))
+
+    def test_split_args_1(self):
+        self.assertEqual((["--repeat", "3", "api.json"], ["-O0", "-g"]), compilebench.split_args(["--repeat", "3", "api.json", "--", "-O0", "-g"]))
+        self.assertEqual((["api.json"], []), compilebench.split_args(["api.json"]))
+
+    def test_get_configured_flags_1(self):
+        commands = [ { "directory": "/build", "file": "/src/compiler/il/Node.cpp", "command": "c++ -c /src/compiler/il/Node.cpp" }
+                   , { "directory": "/build/jitbuilder"
+                     , "file": "/src/jitbuilder/ilgen/IlBuilder.cpp"
+                     , "command": "/usr/bin/c++ -DLINUX -Iinclude -I/src/compiler -O2 -MD -MF dep.d -o IlBuilder.o -c /src/jitbuilder/ilgen/IlBuilder.cpp"
+                     }
+                   ]
+        self.assertEqual(("/usr/bin/c++", ["-DLINUX", "-I/build/jitbuilder/include", "-I/src/compiler", "-O2"]),
+                         compilebench.get_configured_flags(commands))
+
+    def test_get_configured_flags_2(self):
+        commands = [ { "directory": "/build", "file": "/src/compiler/il/Node.cpp", "arguments": ["c++", "-c", "/src/compiler/il/Node.cpp"] } ]
+        self.assertEqual(None, compilebench.get_configured_flags(commands))
+
+    def test_summarize_1(self):
+        results = [ { "mode": "per-file", "tu": "A.cpp", "time": 1.0, "rss": 100, "error": None }
+                  , { "mode": "per-file", "tu": "B.cpp", "time": 2.0, "rss": 200, "error": None }
+                  , { "mode": "per-file", "tu": "C.cpp", "time": None, "rss": None, "error": "failed" }
+                  , { "mode": "unity", "tu": "Unity.cpp", "time": 1.5, "rss": None, "error": None }
+                  ]
+        summary = compilebench.summarize(results, ["per-file", "unity"])
+        self.assertEqual([("per-file", 3, 1, 3.0, 200), ("unity", 1, 0, 1.5, None)],
+                         [(s["mode"], s["tus"], s["failed"], s["time"], s["rss"]) for s in summary])
@@ -22,8 +22,13 @@
 # SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
 ###############################################################################
 
+import os
 import re
 import unittest
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
 
 import genutils
 import cppgen
@@ -244,3 +249,314 @@ class CppGeneratorTest(unittest.TestCase):
         class_desc = self.api.get_class_by_name("class_1_inner_class_1")
         self.assertRegexpMatches(self.generator.generate_allocator_decl(class_desc),
                                 'extern\s*"C"\s*void\s*\*\s*allocateclass_1class_1_inner_class_1\(void\s*\*\s*impl\);')
+
+    def test_write_allocators_setter_1(self):
+        out = StringIO()
+        self.generator.write_allocators_setter(genutils.PrettyPrinter(out), self.api)
+        self.assertRegexpMatches(out.getvalue(), "static\s+const\s+bool\s+allocatorsSet\s*=\s*registerAllocators\(\);")
+        self.assertRegexpMatches(out.getvalue(), "TR::class_1::setGetImpl\(NS1::NS2::getImpl_class_1\);")
+
+    def test_write_impl_initializer_1(self):
+        class_desc = self.api.get_class_by_name("class_1")
+        out = StringIO()
+        self.generator.write_impl_initializer(genutils.PrettyPrinter(out), class_desc)
+        self.assertNotIn("setGetImpl", out.getvalue())
+
+class CppGeneratorInlineTest(unittest.TestCase):
+    """Tests for CppGenerator class with inline services enabled"""
+
+    def setUp(self):
+        with open("test/test_sample.json") as f:
+            self.api = genutils.APIDescription.load_json_file(f)
+        self.generator = cppgen.CppGenerator(self.api, "", [], inline_services=True)
+
+    def test_is_inlined_service_1(self):
+        service = self.api.get_class_by_name("class_1").services()[0]
+        self.assertTrue(self.generator.is_inlined_service(service))
+
+    def test_is_inlined_service_2(self):
+        service = self.api.services()[0]
+        self.assertFalse(self.generator.is_inlined_service(service))
+
+    def test_is_inlined_service_3(self):
+        generator = cppgen.CppGenerator(self.api, "", [])
+        service = self.api.get_class_by_name("class_1").services()[0]
+        self.assertFalse(generator.is_inlined_service(service))
+
+    def test_get_inline_header_name_1(self):
+        class_desc = self.api.get_class_by_name("class_2")
+        self.assertEqual("class_2-inl.hpp", self.generator.get_inline_header_name(class_desc))
+
+    def test_generate_class_service_decl_1(self):
+        service = self.api.get_class_by_name("class_1").services()[1]
+        self.assertRegexpMatches(self.generator.generate_class_service_decl(service),
+                                "protected:\s*inline\s+void\s*class_1_service_2\(\s*\);")
+
+    def test_generate_class_service_decl_2(self):
+        callback = self.api.get_class_by_name("class_1").callbacks()[0]
+        self.assertNotRegexpMatches(self.generator.generate_class_service_decl(callback, is_callback=True), "inline")
+
+    def test_write_class_impl_1(self):
+        class_desc = self.api.get_class_by_name("class_1")
+        out = StringIO()
+        self.generator.write_class_impl(genutils.PrettyPrinter(out), class_desc)
+        self.assertNotRegexpMatches(out.getvalue(), "class_1::class_1_service_1\(")
+
+    def test_write_class_inline_impl_1(self):
+        class_desc = self.api.get_class_by_name("class_1")
+        out = StringIO()
+        self.generator.write_class_inline_impl(genutils.PrettyPrinter(out), class_desc)
+        self.assertRegexpMatches(out.getvalue(), "inline\s+const\s+char\s*\*\s*class_1::class_1_service_1\(")
+
+class CppGeneratorProfileTest(unittest.TestCase):
+    """Tests for CppGenerator class with profiling enabled"""
+
+    def setUp(self):
+        with open("test/test_sample.json") as f:
+            self.api = genutils.APIDescription.load_json_file(f)
+        self.generator = cppgen.CppGenerator(self.api, "", [], profile="counters")
+
+    def test_get_entry_point_name_1(self):
+        service = self.api.services()[0]
+        self.assertEqual("Project_service_1(int16, pointer*, double[])", self.generator.get_entry_point_name(service))
+
+    def test_get_entry_point_name_2(self):
+        class_desc = self.api.get_class_by_name("class_1")
+        callback = class_desc.callbacks()[0]
+        self.assertEqual("class_1::class_1_callback_1(boolean) [thunk]",
+                         self.generator.get_entry_point_name(callback, class_desc, is_thunk=True))
+
+    def test_gen_entry_points_1(self):
+        names = self.generator.entry_point_names
+        self.assertEqual(len(names), len(set(names)))
+        self.assertIn("class_1::class_1_inner_class_1::class_1_inner_class_1()", names)
+        self.assertEqual("Project_service_1(int16, pointer*, double[])", names[-1])
+
+    def test_write_profile_probe_1(self):
+        out = StringIO()
+        self.generator.write_profile_probe(genutils.PrettyPrinter(out), "class_2::class_2()")
+        self.assertRegexpMatches(out.getvalue(), "PROFILE_CALL\(\d+\);")
+
+    def test_write_profile_probe_2(self):
+        generator = cppgen.CppGenerator(self.api, "", [], profile="timers")
+        out = StringIO()
+        generator.write_profile_probe(genutils.PrettyPrinter(out), "class_2::class_2()")
+        self.assertRegexpMatches(out.getvalue(), "PROFILE_TIMED_CALL\(\d+\);")
+
+    def test_write_profile_probe_3(self):
+        generator = cppgen.CppGenerator(self.api, "", [])
+        out = StringIO()
+        generator.write_profile_probe(genutils.PrettyPrinter(out), "class_2::class_2()")
+        self.assertEqual("", out.getvalue())
+
+    def test_write_callback_thunk_1(self):
+        class_desc = self.api.get_class_by_name("class_1")
+        callback = class_desc.callbacks()[0]
+        out = StringIO()
+        self.generator.write_callback_thunk(genutils.PrettyPrinter(out), class_desc, callback)
+        entry_id = self.generator.entry_point_ids["class_1::class_1_callback_1(boolean) [thunk]"]
+        self.assertIn("PROFILE_CALL({});".format(entry_id), out.getvalue())
+
+class CppGeneratorMinimalIncludesTest(unittest.TestCase):
+    """Tests for CppGenerator class with minimal includes"""
+
+    def setUp(self):
+        with open("test/test_sample.json") as f:
+            self.api = genutils.APIDescription.load_json_file(f)
+        self.generator = cppgen.CppGenerator(self.api, "", [], minimal_includes=True)
+
+    def test_gen_referenced_classes_1(self):
+        self.assertEqual(set(["class_1"]), self.generator.gen_referenced_classes(self.api.get_class_by_name("class_1")))
+
+    def test_gen_referenced_classes_2(self):
+        self.assertEqual(set(["class_1", "class_2"]), self.generator.gen_referenced_classes(self.api.get_class_by_name("class_2")))
+
+    def test_gen_class_include_files_1(self):
+        class_desc = self.api.get_class_by_name("class_1")
+        self.assertEqual(["ilgen/class_1.hpp", "Macros.hpp", "class_1.hpp"], self.generator.gen_class_include_files(class_desc))
+
+    def test_gen_class_include_files_2(self):
+        generator = cppgen.CppGenerator(self.api, "", [])
+        class_desc = self.api.get_class_by_name("class_1")
+        self.assertEqual(generator.impl_include_files, generator.gen_class_include_files(class_desc))
+
+class CppGeneratorBulkTest(unittest.TestCase):
+    """Tests for CppGenerator class with batchable services"""
+
+    def setUp(self):
+        with open("test/test_sample.json") as f:
+            self.api = genutils.APIDescription.load_json_file(f)
+        self.api.description["classes"][0]["services"][0]["flags"].append("batchable")
+        self.class_desc = self.api.get_class_by_name("class_1")
+        self.service = self.class_desc.services()[0]
+        self.generator = cppgen.CppGenerator(self.api, "", [])
+
+    def test_generate_bulk_service_decl_1(self):
+        decl = self.generator.generate_bulk_service_decl(self.service)
+        self.assertIn("public: struct class_1_service_1Operands { const char * class_1_service_1_parm; };", decl)
+        self.assertIn("public: void class_1_service_1Bulk(size_t count, const class_1_service_1Operands * operands, const char ** results);", decl)
+
+    def test_write_bulk_service_impl_1(self):
+        out = StringIO()
+        self.generator.write_bulk_service_impl(genutils.PrettyPrinter(out), self.service, self.class_desc)
+        self.assertIn("TR::class_1 * implSelf = static_cast<TR::class_1 *>(_impl);", out.getvalue())
+        self.assertIn("results[i] = implSelf->class_1_service_1(class_1_service_1_parm);", out.getvalue())
+
+    def test_write_bulk_service_impl_2(self):
+        generator = cppgen.CppGenerator(self.api, "", [], trace=True)
+        out = StringIO()
+        generator.write_bulk_service_impl(genutils.PrettyPrinter(out), self.service, self.class_desc)
+        self.assertNotIn("implSelf", out.getvalue())
+        self.assertIn("results[i] = class_1_service_1(class_1_service_1_parm);", out.getvalue())
+
+    def test_write_class_def_1(self):
+        out = StringIO()
+        self.generator.write_class_def(genutils.PrettyPrinter(out), self.class_desc)
+        self.assertIn("class_1_service_1Bulk(", out.getvalue())
+        self.assertNotIn("class_1_service_2Bulk(", out.getvalue())
+
+    def test_batchable_services_1(self):
+        self.api.description["services"][0]["flags"].append("batchable")
+        self.assertRaises(AssertionError, cppgen.CppGenerator, self.api, "", [])
+
+class CppGeneratorTraceTest(unittest.TestCase):
+    """Tests for CppGenerator class with tracing enabled"""
+
+    def setUp(self):
+        with open("test/test_sample.json") as f:
+            self.api = genutils.APIDescription.load_json_file(f)
+        self.generator = cppgen.CppGenerator(self.api, "", [], trace=True)
+
+    def test_impl_include_files_1(self):
+        self.assertIn("Tracing.hpp", self.generator.impl_include_files)
+
+    def test_generate_trace_value_1(self):
+        type_desc = genutils.APIType("boolean", self.api)
+        self.assertEqual("TRACE_VALUE(uint8_t, b);\n", self.generator.generate_trace_value(type_desc, "b"))
+
+    def test_generate_trace_value_2(self):
+        type_desc = genutils.APIType("class_2", self.api)
+        self.assertEqual("TRACE_OBJECT(c);\n", self.generator.generate_trace_value(type_desc, "c"))
+
+    def test_write_class_service_impl_1(self):
+        class_desc = self.api.get_class_by_name("class_1")
+        service = class_desc.services()[0]
+        out = StringIO()
+        self.generator.write_class_service_impl(genutils.PrettyPrinter(out), service, class_desc)
+        entry_id = self.generator.entry_point_ids["class_1::class_1_service_1(constString)"]
+        self.assertRegexpMatches(out.getvalue(), "TRACE_CALL\({}\);.*\n\s*TRACE_OBJECT\(this\);\n\s*TRACE_STRING\(class_1_service_1_parm\);".format(entry_id))
+        self.assertRegexpMatches(out.getvalue(), "TRACE_RETURN\(\);\n\s*TRACE_STRING\(ret\);\n\s*return ret;")
+
+    def test_write_callback_thunk_1(self):
+        class_desc = self.api.get_class_by_name("class_1")
+        callback = class_desc.callbacks()[0]
+        out = StringIO()
+        self.generator.write_callback_thunk(genutils.PrettyPrinter(out), class_desc, callback)
+        self.assertRegexpMatches(out.getvalue(), "TRACE_OBJECT\(client\);\n\s*TRACE_VALUE\(uint8_t, class_1_callback_1_parm\);")
+        self.assertRegexpMatches(out.getvalue(), "bool ret = client->class_1_callback_1\(class_1_callback_1_parm\);\n\s*TRACE_RETURN\(\);")
+
+    def test_write_impl_initializer_1(self):
+        class_desc = self.api.get_class_by_name("class_1")
+        out = StringIO()
+        self.generator.write_impl_initializer(genutils.PrettyPrinter(out), class_desc)
+        self.assertRegexpMatches(out.getvalue(), "TRACE_FIELDS\(1, this\);\n\s*TRACE_VALUE\(float, class_1_field_1\);\n\s*TRACE_VALUE\(double, class_1_field_2\);")
+
+    def test_write_impl_initializer_2(self):
+        class_desc = self.api.get_class_by_name("class_2")
+        out = StringIO()
+        self.generator.write_impl_initializer(genutils.PrettyPrinter(out), class_desc)
+        self.assertNotIn("TRACE_FIELDS", out.getvalue())
+
+    def test_write_common_decl_1(self):
+        out = StringIO()
+        self.generator.write_common_decl(genutils.PrettyPrinter(out), self.api)
+        self.assertRegexpMatches(out.getvalue(), "bool\s+writeCallTrace\(const char \* path\);")
+        self.assertRegexpMatches(out.getvalue(), "void\s+clearCallTrace\(\);")
+
+    def test_write_callback_thunk_2(self):
+        generator = cppgen.CppGenerator(self.api, "", [])
+        class_desc = self.api.get_class_by_name("class_1")
+        callback = class_desc.callbacks()[0]
+        out = StringIO()
+        generator.write_callback_thunk(genutils.PrettyPrinter(out), class_desc, callback)
+        self.assertNotIn("TRACE", out.getvalue())
+
+class CppGeneratorAsyncTest(unittest.TestCase):
+    """Tests for CppGenerator class with an async top-level service"""
+
+    def setUp(self):
+        with open("test/test_sample.json") as f:
+            self.api = genutils.APIDescription.load_json_file(f)
+        self.api.description["services"][0]["flags"].append("async")
+        self.generator = cppgen.CppGenerator(self.api, "", [])
+
+    def test_async_services_1(self):
+        self.assertEqual([self.api.services()[0]], self.generator.async_services)
+
+    def test_async_services_2(self):
+        self.api.description["classes"][0]["services"][0]["flags"].append("async")
+        self.assertRaises(AssertionError, cppgen.CppGenerator, self.api, "", [])
+
+    def test_generate_async_service_decl_1(self):
+        service = self.api.services()[0]
+        self.assertRegexpMatches(self.generator.generate_async_service_decl(service),
+                                 "std::future<void>\s+Project_service_1Async\(.*, std::function<void\(\)> onComplete = std::function<void\(\)>\(\)\);")
+
+    def test_write_async_service_impl_1(self):
+        service = self.api.services()[0]
+        out = StringIO()
+        self.generator.write_async_service_impl(genutils.PrettyPrinter(out), service)
+        self.assertIn("return OMR::JitBuilder::submitAsync([=]() { Project_service_1(Project_service_1_parm_1, Project_service_1_parm_2, Project_service_1_parm_3); }, onComplete);", out.getvalue())
+
+    def test_write_common_decl_1(self):
+        out = StringIO()
+        self.generator.write_common_decl(genutils.PrettyPrinter(out), self.api)
+        self.assertIn('#include "Async.hpp"', out.getvalue())
+        self.assertRegexpMatches(out.getvalue(), "void\s+waitForAsyncServices\(\);")
+
+    def test_write_common_decl_2(self):
+        with open("test/test_sample.json") as f:
+            api = genutils.APIDescription.load_json_file(f)
+        generator = cppgen.CppGenerator(api, "", [])
+        out = StringIO()
+        generator.write_common_decl(genutils.PrettyPrinter(out), api)
+        self.assertNotIn("Async", out.getvalue())
+
+class CppGeneratorRenderTest(unittest.TestCase):
+    """Tests for rendering the C++ client API in memory"""
+
+    def setUp(self):
+        with open("test/minimal_api.json") as f:
+            self.api = genutils.APIDescription.load_json_file(f)
+
+    def test_render_1(self):
+        files = cppgen.render(self.api)
+        self.assertIn("JitBuilder.hpp", files)
+        self.assertIn("JitBuilder.cpp", files)
+        self.assertIn("Macros.hpp", files)
+        self.assertTrue(all(isinstance(c, bytes) for c in files.values()))
+
+    def test_render_2(self):
+        files = cppgen.render(self.api, os.path.join("out", "src"), os.path.join("out", "include"))
+        self.assertIn(os.path.join("out", "src", "JitBuilder.cpp"), files)
+        self.assertIn(os.path.join("out", "include", "JitBuilder.hpp"), files)
+
+    def test_render_3(self):
+        with open("jitbuilder.api.json") as f:
+            api = genutils.APIDescription.load_json_file(f)
+        files = cppgen.render(api, namespaces=["A", "B"], copyright_year=2020, deterministic=True)
+        self.assertIn(b"Copyright (c) 2020, 2020 IBM Corp. and others", files["IlBuilder.hpp"])
+        self.assertIn(b"namespace A {\nnamespace B {\n", files["IlBuilder.hpp"])
+        self.assertIn(b"A::B::getImpl_", files["JitBuilder.cpp"])
+        self.assertEqual(files, cppgen.render(api, namespaces=["A", "B"], copyright_year=2020, deterministic=True))
+
+    def test_render_4(self):
+        environ = os.environ.copy()
+        try:
+            os.environ.pop("SOURCE_DATE_EPOCH", None)
+            self.assertRaises(ValueError, cppgen.render, self.api, deterministic=True)
+            os.environ["SOURCE_DATE_EPOCH"] = "1577836800"
+            self.assertIn(b"Copyright (c) 2020, 2020", cppgen.render(self.api, deterministic=True)["JitBuilder.cpp"])
+        finally:
+            os.environ.clear()
+            os.environ.update(environ)
@@ -0,0 +1,104 @@
+#! /usr/bin/env python
+
+###############################################################################
+# Copyright (c) 2018, 2018 IBM Corp. and others
+#
+# This program and the accompanying materials are made available under
+# the terms of the Eclipse Public License 2.0 which accompanies this
+# distribution and is available at https://www.eclipse.org/legal/epl-2.0/
+# or the Apache License, Version 2.0 which accompanies this distribution and
+# is available at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# This Source Code may also be made available under the following
+# Secondary Licenses when the conditions for such availability set
+# forth in the Eclipse Public License, v. 2.0 are satisfied: GNU
+# General Public License, version 2 with the GNU Classpath
+# Exception [1] and GNU General Public License, version 2 with the
+# OpenJDK Assembly Exception [2].
+#
+# [1] https://www.gnu.org/software/classpath/license.html
+# [2] http://openjdk.java.net/legal/assembly-exception.html
+#
+# SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+###############################################################################
+
+import unittest
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+import genutils
+import dispatchgen
+
+class PerfectHashTest(unittest.TestCase):
+    """Tests for the perfect hash used by the dispatch table"""
+
+    def test_hash_name_1(self):
+        # must match hashName() in the generated source
+        self.assertEqual(0x6e196e05, dispatchgen.hash_name(0, "IlBuilder.Add"))
+        self.assertNotEqual(dispatchgen.hash_name(0, "IlBuilder.Add"), dispatchgen.hash_name(1, "IlBuilder.Add"))
+
+    def test_build_perfect_hash_1(self):
+        names = ["name_{}".format(i) for i in range(500)]
+        displacements, slots = dispatchgen.build_perfect_hash(names)
+        self.assertEqual(sorted(names), sorted(slots))
+        for n in names:
+            self.assertEqual(n, slots[dispatchgen.lookup_perfect_hash(displacements, slots, n)])
+        self.assertIsNone(dispatchgen.lookup_perfect_hash(displacements, slots, "name_500"))
+
+    def test_build_perfect_hash_2(self):
+        displacements, slots = dispatchgen.build_perfect_hash([])
+        self.assertEqual([], slots)
+        self.assertIsNone(dispatchgen.lookup_perfect_hash(displacements, slots, "name"))
+
+class DispatchGeneratorTest(unittest.TestCase):
+    """Tests for DispatchGenerator class"""
+
+    def setUp(self):
+        with open("test/test_sample.json") as f:
+            self.api = genutils.APIDescription.load_json_file(f)
+        self.generator = dispatchgen.DispatchGenerator(self.api, "")
+
+    def get_function(self, name):
+        return [f for f in self.generator.functions if f.name == name][0]
+
+    def test_gen_functions_1(self):
+        names = [f.name for f in self.generator.functions]
+        self.assertEqual(["class_1_inner_class_1.new", "class_1_inner_class_1.delete",
+                          "class_1.new", "class_1.delete", "class_1.getclass_1_field_1", "class_1.getclass_1_field_2",
+                          "class_1.setClientCallback_class_1_callback_1",
+                          "class_1.class_1_service_1", "class_1.class_1_service_2overload",
+                          "class_2.asclass_1", "class_2.new", "class_2.delete",
+                          "Project_service_1"], names)
+        self.assertEqual(sorted(names), sorted(f.name for f in self.generator.table))
+
+    def test_signature_1(self):
+        self.assertEqual("s:os", self.get_function("class_1.class_1_service_1").signature())
+        self.assertEqual("v:h&p[d", self.get_function("Project_service_1").signature())
+        self.assertEqual("o:o", self.get_function("class_2.asclass_1").signature())
+
+    def test_write_thunk_1(self):
+        out = StringIO()
+        self.generator.write_thunk(genutils.PrettyPrinter(out), self.get_function("class_1.class_1_service_1"))
+        self.assertEqual("static void thunk_JB_class_1_class_1_service_1(const JB_Value * args, JB_Value * result) {\n"
+                         "    result->cs = JB_class_1_class_1_service_1(static_cast<JB_class_1 *>(args[0].p), args[1].cs);\n"
+                         "}\n\n", out.getvalue())
+
+    def test_write_thunk_2(self):
+        out = StringIO()
+        self.generator.write_thunk(genutils.PrettyPrinter(out), self.get_function("class_1.setClientCallback_class_1_callback_1"))
+        self.assertIn("reinterpret_cast<JB_class_1_class_1_callback_1Callback>(args[1].p)", out.getvalue())
+
+    def test_write_thunk_3(self):
+        out = StringIO()
+        self.generator.write_thunk(genutils.PrettyPrinter(out), self.get_function("Project_service_1"))
+        self.assertIn("    JB_Project_service_1(args[0].i16, static_cast<void **>(args[1].p), static_cast<double*>(args[2].p));\n", out.getvalue())
+
+    def test_write_source_1(self):
+        out = StringIO()
+        self.generator.write_source(genutils.PrettyPrinter(out))
+        source = out.getvalue()
+        self.assertIn("static const JB_DispatchEntry entries[13] = {", source)
+        self.assertIn('{ "class_2.new", 11, 0, "o:", thunk_JB_class_2_new },', source)
+        self.assertIn("uint32_t d = displacements[hashName(0, name, length) % 7];", source)
@@ -0,0 +1,130 @@
+#! /usr/bin/env python
+
+###############################################################################
+# Copyright (c) 2018, 2018 IBM Corp. and others
+#
+# This program and the accompanying materials are made available under
+# the terms of the Eclipse Public License 2.0 which accompanies this
+# distribution and is available at https://www.eclipse.org/legal/epl-2.0/
+# or the Apache License, Version 2.0 which accompanies this distribution and
+# is available at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# This Source Code may also be made available under the following
+# Secondary Licenses when the conditions for such availability set
+# forth in the Eclipse Public License, v. 2.0 are satisfied: GNU
+# General Public License, version 2 with the GNU Classpath
+# Exception [1] and GNU General Public License, version 2 with the
+# OpenJDK Assembly Exception [2].
+#
+# [1] https://www.gnu.org/software/classpath/license.html
+# [2] http://openjdk.java.net/legal/assembly-exception.html
+#
+# SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+###############################################################################
+
+import os
+import json
+import shutil
+import tempfile
+import unittest
+
+import genutils
+import generate
+
+class GenerateDriverTest(unittest.TestCase):
+    """Tests for the multi-backend generation driver"""
+
+    def setUp(self):
+        with open("test/test_sample.json") as f:
+            self.description = json.load(f)
+
+    def load(self):
+        return genutils.APIDescription(self.description)
+
+    def test_check_api_1(self):
+        self.assertEqual([], generate.check_api(self.load()))
+
+    def test_check_api_2(self):
+        self.description["services"][0]["return"] = "undefined_type"
+        self.assertEqual(["Project_service_1: return value has undefined type 'undefined_type'"],
+                         generate.check_api(self.load()))
+
+    def test_check_api_3(self):
+        self.description["classes"][0]["services"][0]["flags"] = ["async"]
+        errors = generate.check_api(self.load())
+        self.assertEqual(1, len(errors))
+        self.assertIn("only top-level services can be async", errors[0])
+
+    def test_check_api_4(self):
+        self.description["services"][0]["flags"] = ["batchable"]
+        self.assertEqual(["Project_service_1: only class services can be batchable"], generate.check_api(self.load()))
+
+    def test_check_api_5(self):
+        self.description["classes"][0]["services"][0]["flags"] = ["batchable"]
+        self.assertEqual([], generate.check_api(self.load()))
+        self.description["classes"][0]["services"][0]["flags"] = ["batchable", "static"]
+        errors = generate.check_api(self.load())
+        self.assertEqual(1, len(errors))
+        self.assertIn("batchable services must not be static", errors[0])
+
+    def test_check_classes_1(self):
+        self.description["classes"][1]["extends"] = "undefined_class"
+        self.assertEqual(["class 'class_2' extends undefined class 'undefined_class'"],
+                         generate.check_classes(self.description))
+
+    def test_get_jobs_1(self):
+        args = generate.get_parser().parse_args(["--backend", "c", "--c-sourcedir", "src", "--c-prefix", "P", "api.json"])
+        self.assertEqual([("c", "src", os.path.join(os.getcwd(), "client", "c"), {"prefix": "P"})],
+                         generate.get_jobs(args))
+
+    def test_get_jobs_2(self):
+        args = generate.get_parser().parse_args(["api.json"])
+        self.assertEqual(list(generate.backends.keys()), [j[0] for j in generate.get_jobs(args)])
+
+class GenerateDriverRunTest(unittest.TestCase):
+    """Tests running backends through the generation driver"""
+
+    def setUp(self):
+        with open("jitbuilder.api.json") as f:
+            self.api = genutils.APIDescription.load_json_file(f)
+        self.outdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.outdir)
+
+    def get_jobs(self, name):
+        return [ ("cpp", os.path.join(self.outdir, name, "cpp"), os.path.join(self.outdir, name, "cpp"), {})
+               , ("c", os.path.join(self.outdir, name, "c"), os.path.join(self.outdir, name, "c"), {"prefix": "JB"})
+               ]
+
+    def read_outputs(self, name):
+        outputs = {}
+        root = os.path.join(self.outdir, name)
+        for dirpath, _, filenames in os.walk(root):
+            for filename in filenames:
+                with open(os.path.join(dirpath, filename)) as f:
+                    outputs[os.path.relpath(os.path.join(dirpath, filename), root)] = f.read().replace(root, "")
+        return outputs
+
+    def test_run_backends_1(self):
+        serial = generate.run_backends(self.api, self.get_jobs("serial"))
+        parallel = generate.run_backends(self.api, self.get_jobs("parallel"), parallel=2)
+        self.assertEqual(["cpp", "c"], [r[0] for r in serial])
+        self.assertEqual([None] * 4, [r[2] for r in serial + parallel])
+        self.assertEqual(self.read_outputs("serial"), self.read_outputs("parallel"))
+
+    def test_run_backends_2(self):
+        jobs = [("c", self.outdir, self.outdir, {"prefix": "JB", "undefined_option": True})]
+        results = generate.run_backends(self.api, jobs)
+        self.assertIn("undefined_option", results[0][2])
+
+    def test_run_backends_3(self):
+        sourcedir = os.path.join(self.outdir, "shared", "src")
+        headerdir = os.path.join(self.outdir, "shared", "include")
+        jobs = [ ("c", sourcedir, headerdir, {"prefix": "JB"})
+               , ("dispatch", sourcedir, headerdir, {"prefix": "JB"})
+               ]
+        results = generate.run_backends(self.api, jobs, parallel=2)
+        self.assertEqual([None, None], [r[2] for r in results])
+        self.assertTrue(os.listdir(sourcedir))
+        self.assertTrue(os.listdir(headerdir))
@@ -165,6 +165,12 @@ class APIServiceTests(unittest.TestCase):
     def test_is_impl_default(self):
         self.assertFalse(self.service_2.is_impl_default())
 
+    def test_is_async(self):
+        self.assertFalse(self.service_1.is_async())
+
+    def test_is_batchable(self):
+        self.assertFalse(self.service_1.is_batchable())
+
     def test_visibility_1(self):
         self.assertEqual("public", self.service_1.visibility())
 
@@ -0,0 +1,410 @@
+/*******************************************************************************
+ * Copyright (c) 2026, 2026 IBM Corp. and others
+ *
+ * This program and the accompanying materials are made available under
+ * the terms of the Eclipse Public License 2.0 which accompanies this
+ * distribution and is available at http://eclipse.org/legal/epl-2.0
+ * or the Apache License, Version 2.0 which accompanies this distribution
+ * and is available at https://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * This Source Code may also be made available under the following Secondary
+ * Licenses when the conditions for such availability set forth in the
+ * Eclipse Public License, v. 2.0 are satisfied: GNU General Public License,
+ * version 2 with the GNU Classpath Exception [1] and GNU General Public
+ * License, version 2 with the OpenJDK Assembly Exception [2].
+ *
+ * [1] https://www.gnu.org/software/classpath/license.html
+ * [2] http://openjdk.java.net/legal/assembly-exception.html
+ *
+ * SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+ *******************************************************************************/
+        
+#ifndef JitBuilderC_INCL
+#define JitBuilderC_INCL
+
+#include <stdbool.h>
+#include <stddef.h>
+#include <stdint.h>
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* opaque handles for all API classes */
+typedef struct JB_BytecodeBuilder JB_BytecodeBuilder;
+typedef struct JB_IlBuilder_JBCase JB_IlBuilder_JBCase;
+typedef struct JB_IlBuilder_JBCondition JB_IlBuilder_JBCondition;
+typedef struct JB_IlBuilder JB_IlBuilder;
+typedef struct JB_MethodBuilder JB_MethodBuilder;
+typedef struct JB_IlType JB_IlType;
+typedef struct JB_IlValue JB_IlValue;
+typedef struct JB_ThunkBuilder JB_ThunkBuilder;
+typedef struct JB_TypeDictionary JB_TypeDictionary;
+typedef struct JB_VirtualMachineOperandArray JB_VirtualMachineOperandArray;
+typedef struct JB_VirtualMachineOperandStack JB_VirtualMachineOperandStack;
+typedef struct JB_VirtualMachineRegister JB_VirtualMachineRegister;
+typedef struct JB_VirtualMachineRegisterInStruct JB_VirtualMachineRegisterInStruct;
+typedef struct JB_VirtualMachineState JB_VirtualMachineState;
+
+/* JB_BytecodeBuilder */
+JB_IlBuilder * JB_BytecodeBuilder_asIlBuilder(JB_BytecodeBuilder * self);
+int32_t JB_BytecodeBuilder_bcIndex(JB_BytecodeBuilder * self);
+char * JB_BytecodeBuilder_name(JB_BytecodeBuilder * self);
+JB_VirtualMachineState * JB_BytecodeBuilder_vmState(JB_BytecodeBuilder * self);
+void JB_BytecodeBuilder_AddFallThroughBuilder(JB_BytecodeBuilder * self, JB_BytecodeBuilder * ftb);
+void JB_BytecodeBuilder_AddSuccessorBuildersWithArgArray(JB_BytecodeBuilder * self, uint32_t numBuilders, JB_BytecodeBuilder ** builders);
+void JB_BytecodeBuilder_AddSuccessorBuilder(JB_BytecodeBuilder * self, JB_BytecodeBuilder ** b);
+void JB_BytecodeBuilder_Goto(JB_BytecodeBuilder * self, JB_BytecodeBuilder * b);
+void JB_BytecodeBuilder_GotoNew(JB_BytecodeBuilder * self, JB_BytecodeBuilder ** b);
+void JB_BytecodeBuilder_IfCmpEqual(JB_BytecodeBuilder * self, JB_BytecodeBuilder * target, JB_IlValue * left, JB_IlValue * right);
+void JB_BytecodeBuilder_IfCmpEqualNew(JB_BytecodeBuilder * self, JB_BytecodeBuilder ** target, JB_IlValue * left, JB_IlValue * right);
+void JB_BytecodeBuilder_IfCmpLessOrEqual(JB_BytecodeBuilder * self, JB_BytecodeBuilder * target, JB_IlValue * left, JB_IlValue * right);
+void JB_BytecodeBuilder_IfCmpLessOrEqualNew(JB_BytecodeBuilder * self, JB_BytecodeBuilder ** target, JB_IlValue * left, JB_IlValue * right);
+void JB_BytecodeBuilder_IfCmpLessThan(JB_BytecodeBuilder * self, JB_BytecodeBuilder * target, JB_IlValue * left, JB_IlValue * right);
+void JB_BytecodeBuilder_IfCmpLessThanNew(JB_BytecodeBuilder * self, JB_BytecodeBuilder ** target, JB_IlValue * left, JB_IlValue * right);
+void JB_BytecodeBuilder_IfCmpGreaterOrEqual(JB_BytecodeBuilder * self, JB_BytecodeBuilder * target, JB_IlValue * left, JB_IlValue * right);
+void JB_BytecodeBuilder_IfCmpGreaterOrEqualNew(JB_BytecodeBuilder * self, JB_BytecodeBuilder ** target, JB_IlValue * left, JB_IlValue * right);
+void JB_BytecodeBuilder_IfCmpGreaterThan(JB_BytecodeBuilder * self, JB_BytecodeBuilder * target, JB_IlValue * left, JB_IlValue * right);
+void JB_BytecodeBuilder_IfCmpGreaterThanNew(JB_BytecodeBuilder * self, JB_BytecodeBuilder ** target, JB_IlValue * left, JB_IlValue * right);
+void JB_BytecodeBuilder_IfCmpNotEqual(JB_BytecodeBuilder * self, JB_BytecodeBuilder * target, JB_IlValue * left, JB_IlValue * right);
+void JB_BytecodeBuilder_IfCmpNotEqualNew(JB_BytecodeBuilder * self, JB_BytecodeBuilder ** target, JB_IlValue * left, JB_IlValue * right);
+void JB_BytecodeBuilder_IfCmpUnsignedLessOrEqual(JB_BytecodeBuilder * self, JB_BytecodeBuilder * target, JB_IlValue * left, JB_IlValue * right);
+void JB_BytecodeBuilder_IfCmpUnsignedLessOrEqualNew(JB_BytecodeBuilder * self, JB_BytecodeBuilder ** target, JB_IlValue * left, JB_IlValue * right);
+void JB_BytecodeBuilder_IfCmpUnsignedLessThan(JB_BytecodeBuilder * self, JB_BytecodeBuilder * target, JB_IlValue * left, JB_IlValue * right);
+void JB_BytecodeBuilder_IfCmpUnsignedLessThanNew(JB_BytecodeBuilder * self, JB_BytecodeBuilder ** target, JB_IlValue * left, JB_IlValue * right);
+void JB_BytecodeBuilder_IfCmpUnsignedGreaterOrEqual(JB_BytecodeBuilder * self, JB_BytecodeBuilder * target, JB_IlValue * left, JB_IlValue * right);
+void JB_BytecodeBuilder_IfCmpUnsignedGreaterOrEqualNew(JB_BytecodeBuilder * self, JB_BytecodeBuilder ** target, JB_IlValue * left, JB_IlValue * right);
+void JB_BytecodeBuilder_IfCmpUnsignedGreaterThan(JB_BytecodeBuilder * self, JB_BytecodeBuilder * target, JB_IlValue * left, JB_IlValue * right);
+void JB_BytecodeBuilder_IfCmpUnsignedGreaterThanNew(JB_BytecodeBuilder * self, JB_BytecodeBuilder ** target, JB_IlValue * left, JB_IlValue * right);
+void JB_BytecodeBuilder_IfCmpEqualZero(JB_BytecodeBuilder * self, JB_BytecodeBuilder * target, JB_IlValue * condition);
+void JB_BytecodeBuilder_IfCmpEqualZeroNew(JB_BytecodeBuilder * self, JB_BytecodeBuilder ** target, JB_IlValue * condition);
+void JB_BytecodeBuilder_IfCmpNotEqualZero(JB_BytecodeBuilder * self, JB_BytecodeBuilder * target, JB_IlValue * condition);
+void JB_BytecodeBuilder_IfCmpNotEqualZeroNew(JB_BytecodeBuilder * self, JB_BytecodeBuilder ** target, JB_IlValue * condition);
+
+/* JB_IlBuilder_JBCase */
+JB_IlBuilder_JBCase * JB_IlBuilder_JBCase_new(int32_t caseValue, JB_IlBuilder * caseBuilder, int32_t caseFallsThrough);
+void JB_IlBuilder_JBCase_delete(JB_IlBuilder_JBCase * self);
+
+/* JB_IlBuilder_JBCondition */
+JB_IlBuilder_JBCondition * JB_IlBuilder_JBCondition_new(JB_IlBuilder * conditionBuilder, JB_IlValue * conditionValue);
+void JB_IlBuilder_JBCondition_delete(JB_IlBuilder_JBCondition * self);
+
+/* JB_IlBuilder */
+typedef bool (*JB_IlBuilder_buildILCallback)(JB_IlBuilder * self);
+JB_IlType * JB_IlBuilder_getNoType(JB_IlBuilder * self);
+JB_IlType * JB_IlBuilder_getInt8(JB_IlBuilder * self);
+JB_IlType * JB_IlBuilder_getInt16(JB_IlBuilder * self);
+JB_IlType * JB_IlBuilder_getInt32(JB_IlBuilder * self);
+JB_IlType * JB_IlBuilder_getInt64(JB_IlBuilder * self);
+JB_IlType * JB_IlBuilder_getFloat(JB_IlBuilder * self);
+JB_IlType * JB_IlBuilder_getDouble(JB_IlBuilder * self);
+JB_IlType * JB_IlBuilder_getAddress(JB_IlBuilder * self);
+JB_IlType * JB_IlBuilder_getVectorInt8(JB_IlBuilder * self);
+JB_IlType * JB_IlBuilder_getVectorInt16(JB_IlBuilder * self);
+JB_IlType * JB_IlBuilder_getVectorInt32(JB_IlBuilder * self);
+JB_IlType * JB_IlBuilder_getVectorInt64(JB_IlBuilder * self);
+JB_IlType * JB_IlBuilder_getVectorFloat(JB_IlBuilder * self);
+JB_IlType * JB_IlBuilder_getVectorDouble(JB_IlBuilder * self);
+JB_IlType * JB_IlBuilder_getWord(JB_IlBuilder * self);
+void JB_IlBuilder_setClientCallback_buildIL(JB_IlBuilder * self, JB_IlBuilder_buildILCallback callback);
+JB_IlBuilder * JB_IlBuilder_OrphanBuilder(JB_IlBuilder * self);
+JB_BytecodeBuilder * JB_IlBuilder_OrphanBytecodeBuilder(JB_IlBuilder * self, int32_t bcIndex, char * name);
+JB_IlValue * JB_IlBuilder_Copy(JB_IlBuilder * self, JB_IlValue * value);
+JB_TypeDictionary * JB_IlBuilder_typeDictionary(JB_IlBuilder * self);
+JB_IlValue * JB_IlBuilder_ConstInteger(JB_IlBuilder * self, JB_IlType * type, int64_t value);
+JB_IlValue * JB_IlBuilder_ConstAddress(JB_IlBuilder * self, void * value);
+JB_IlValue * JB_IlBuilder_ConstDouble(JB_IlBuilder * self, double value);
+JB_IlValue * JB_IlBuilder_ConstFloat(JB_IlBuilder * self, float value);
+JB_IlValue * JB_IlBuilder_ConstInt8(JB_IlBuilder * self, int8_t value);
+JB_IlValue * JB_IlBuilder_ConstInt16(JB_IlBuilder * self, int16_t value);
+JB_IlValue * JB_IlBuilder_ConstInt32(JB_IlBuilder * self, int32_t value);
+JB_IlValue * JB_IlBuilder_ConstInt64(JB_IlBuilder * self, int64_t value);
+JB_IlValue * JB_IlBuilder_ConstString(JB_IlBuilder * self, char * value);
+JB_IlValue * JB_IlBuilder_NullAddress(JB_IlBuilder * self);
+JB_IlValue * JB_IlBuilder_Add(JB_IlBuilder * self, JB_IlValue * left, JB_IlValue * right);
+JB_IlValue * JB_IlBuilder_AddWithOverflow(JB_IlBuilder * self, JB_IlBuilder ** overflowHandler, JB_IlValue * left, JB_IlValue * right);
+JB_IlValue * JB_IlBuilder_AddWithUnsignedOverflow(JB_IlBuilder * self, JB_IlBuilder ** overflowHandler, JB_IlValue * left, JB_IlValue * right);
+JB_IlValue * JB_IlBuilder_And(JB_IlBuilder * self, JB_IlValue * left, JB_IlValue * right);
+JB_IlValue * JB_IlBuilder_Div(JB_IlBuilder * self, JB_IlValue * left, JB_IlValue * right);
+JB_IlValue * JB_IlBuilder_UnsignedDiv(JB_IlBuilder * self, JB_IlValue * left, JB_IlValue * right);
+JB_IlValue * JB_IlBuilder_IndexAt(JB_IlBuilder * self, JB_IlType * dt, JB_IlValue * base, JB_IlValue * index);
+JB_IlValue * JB_IlBuilder_Mul(JB_IlBuilder * self, JB_IlValue * left, JB_IlValue * right);
+JB_IlValue * JB_IlBuilder_MulWithOverflow(JB_IlBuilder * self, JB_IlBuilder ** overflowHandler, JB_IlValue * left, JB_IlValue * right);
+JB_IlValue * JB_IlBuilder_Negate(JB_IlBuilder * self, JB_IlValue * v);
+JB_IlValue * JB_IlBuilder_Or(JB_IlBuilder * self, JB_IlValue * left, JB_IlValue * right);
+JB_IlValue * JB_IlBuilder_Rem(JB_IlBuilder * self, JB_IlValue * left, JB_IlValue * right);
+JB_IlValue * JB_IlBuilder_UnsignedRem(JB_IlBuilder * self, JB_IlValue * left, JB_IlValue * right);
+JB_IlValue * JB_IlBuilder_ShiftL(JB_IlBuilder * self, JB_IlValue * left, JB_IlValue * right);
+JB_IlValue * JB_IlBuilder_ShiftR(JB_IlBuilder * self, JB_IlValue * left, JB_IlValue * right);
+JB_IlValue * JB_IlBuilder_Sub(JB_IlBuilder * self, JB_IlValue * left, JB_IlValue * right);
+JB_IlValue * JB_IlBuilder_SubWithOverflow(JB_IlBuilder * self, JB_IlBuilder ** overflowHandler, JB_IlValue * left, JB_IlValue * right);
+JB_IlValue * JB_IlBuilder_SubWithUnsignedOverflow(JB_IlBuilder * self, JB_IlBuilder ** overflowHandler, JB_IlValue * left, JB_IlValue * right);
+JB_IlValue * JB_IlBuilder_UnsignedShiftR(JB_IlBuilder * self, JB_IlValue * left, JB_IlValue * right);
+JB_IlValue * JB_IlBuilder_Xor(JB_IlBuilder * self, JB_IlValue * left, JB_IlValue * right);
+JB_IlValue * JB_IlBuilder_EqualTo(JB_IlBuilder * self, JB_IlValue * left, JB_IlValue * right);
+JB_IlValue * JB_IlBuilder_LessOrEqualTo(JB_IlBuilder * self, JB_IlValue * left, JB_IlValue * right);
+JB_IlValue * JB_IlBuilder_LessThan(JB_IlBuilder * self, JB_IlValue * left, JB_IlValue * right);
+JB_IlValue * JB_IlBuilder_GreaterOrEqualTo(JB_IlBuilder * self, JB_IlValue * left, JB_IlValue * right);
+JB_IlValue * JB_IlBuilder_GreaterThan(JB_IlBuilder * self, JB_IlValue * left, JB_IlValue * right);
+JB_IlValue * JB_IlBuilder_NotEqualTo(JB_IlBuilder * self, JB_IlValue * left, JB_IlValue * right);
+JB_IlValue * JB_IlBuilder_UnsignedLessOrEqualTo(JB_IlBuilder * self, JB_IlValue * left, JB_IlValue * right);
+JB_IlValue * JB_IlBuilder_UnsignedLessThan(JB_IlBuilder * self, JB_IlValue * left, JB_IlValue * right);
+JB_IlValue * JB_IlBuilder_UnsignedGreaterOrEqualTo(JB_IlBuilder * self, JB_IlValue * left, JB_IlValue * right);
+JB_IlValue * JB_IlBuilder_UnsignedGreaterThan(JB_IlBuilder * self, JB_IlValue * left, JB_IlValue * right);
+JB_IlValue * JB_IlBuilder_ConvertBitsTo(JB_IlBuilder * self, JB_IlType * type, JB_IlValue * value);
+JB_IlValue * JB_IlBuilder_ConvertTo(JB_IlBuilder * self, JB_IlType * type, JB_IlValue * value);
+JB_IlValue * JB_IlBuilder_UnsignedConvertTo(JB_IlBuilder * self, JB_IlType * type, JB_IlValue * value);
+JB_IlValue * JB_IlBuilder_AtomicAdd(JB_IlBuilder * self, JB_IlValue * baseAddress, JB_IlValue * value);
+JB_IlValue * JB_IlBuilder_CreateLocalArray(JB_IlBuilder * self, int32_t numElements, JB_IlType * elementType);
+JB_IlValue * JB_IlBuilder_CreateLocalStruct(JB_IlBuilder * self, JB_IlType * structType);
+JB_IlValue * JB_IlBuilder_Load(JB_IlBuilder * self, const char * name);
+JB_IlValue * JB_IlBuilder_LoadAt(JB_IlBuilder * self, JB_IlType * type, JB_IlValue * address);
+JB_IlValue * JB_IlBuilder_LoadIndirect(JB_IlBuilder * self, const char * type, const char * field, JB_IlValue * object);
+void JB_IlBuilder_Store(JB_IlBuilder * self, const char * name, JB_IlValue * value);
+void JB_IlBuilder_StoreAt(JB_IlBuilder * self, JB_IlValue * address, JB_IlValue * value);
+void JB_IlBuilder_StoreIndirect(JB_IlBuilder * self, const char * type, const char * field, JB_IlValue * object, JB_IlValue * value);
+void JB_IlBuilder_StoreOver(JB_IlBuilder * self, JB_IlValue * dest, JB_IlValue * value);
+void JB_IlBuilder_Transaction(JB_IlBuilder * self, JB_IlBuilder ** persistentFailureBuilder, JB_IlBuilder ** transientFailureBuilder, JB_IlBuilder ** transactionBuilder);
+void JB_IlBuilder_TransactionAbort(JB_IlBuilder * self);
+JB_IlValue * JB_IlBuilder_StructFieldInstanceAddress(JB_IlBuilder * self, const char * structName, const char * fieldName, JB_IlValue * obj);
+JB_IlValue * JB_IlBuilder_UnionFieldInstanceAddress(JB_IlBuilder * self, const char * unionName, const char * fieldName, JB_IlValue * obj);
+JB_IlValue * JB_IlBuilder_VectorLoad(JB_IlBuilder * self, char * name);
+JB_IlValue * JB_IlBuilder_VectorLoadAt(JB_IlBuilder * self, JB_IlType * type, JB_IlValue * address);
+void JB_IlBuilder_VectorStore(JB_IlBuilder * self, char * name, JB_IlValue * value);
+void JB_IlBuilder_VectorStoreAt(JB_IlBuilder * self, JB_IlValue * address, JB_IlValue * value);
+void JB_IlBuilder_AppendBuilder(JB_IlBuilder * self, JB_IlBuilder * b);
+JB_IlValue * JB_IlBuilder_CallWithArgArray(JB_IlBuilder * self, const char * name, int32_t numArgs, JB_IlValue ** arguments);
+JB_IlValue * JB_IlBuilder_CallMethodBuilder(JB_IlBuilder * self, JB_MethodBuilder * name, int32_t numArgs, JB_IlValue ** arguments);
+JB_IlValue * JB_IlBuilder_ComputedCallWithArgArray(JB_IlBuilder * self, char * name, int32_t numArgs, JB_IlValue ** arguments);
+void JB_IlBuilder_DoWhileLoop(JB_IlBuilder * self, char * exitCondition, JB_IlBuilder ** body);
+void JB_IlBuilder_DoWhileLoopWithBreakAndContinue(JB_IlBuilder * self, char * exitCondition, JB_IlBuilder ** body, JB_IlBuilder ** breakBuilder, JB_IlBuilder ** continueBuilder);
+void JB_IlBuilder_DoWhileLoopWithBreak(JB_IlBuilder * self, char * exitCondition, JB_IlBuilder ** body, JB_IlBuilder ** breakBuilder);
+void JB_IlBuilder_DoWhileLoopWithContinue(JB_IlBuilder * self, char * exitCondition, JB_IlBuilder ** body, JB_IlBuilder ** continueBuilder);
+void JB_IlBuilder_Goto(JB_IlBuilder * self, JB_IlBuilder * b);
+void JB_IlBuilder_GotoNew(JB_IlBuilder * self, JB_IlBuilder ** b);
+JB_IlBuilder_JBCondition * JB_IlBuilder_MakeCondition(JB_IlBuilder * self, JB_IlBuilder * conditionBuilder, JB_IlValue * conditionValue);
+void JB_IlBuilder_IfAndWithArgArray(JB_IlBuilder * self, JB_IlBuilder ** allTrueBuilder, JB_IlBuilder ** anyFalseBuilder, int32_t numTerms, JB_IlBuilder_JBCondition ** terms);
+void JB_IlBuilder_IfCmpEqual(JB_IlBuilder * self, JB_IlBuilder * target, JB_IlValue * left, JB_IlValue * right);
+void JB_IlBuilder_IfCmpEqualNew(JB_IlBuilder * self, JB_IlBuilder ** target, JB_IlValue * left, JB_IlValue * right);
+void JB_IlBuilder_IfCmpLessOrEqual(JB_IlBuilder * self, JB_IlBuilder * target, JB_IlValue * left, JB_IlValue * right);
+void JB_IlBuilder_IfCmpLessOrEqualNew(JB_IlBuilder * self, JB_IlBuilder ** target, JB_IlValue * left, JB_IlValue * right);
+void JB_IlBuilder_IfCmpLessThan(JB_IlBuilder * self, JB_IlBuilder * target, JB_IlValue * left, JB_IlValue * right);
+void JB_IlBuilder_IfCmpLessThanNew(JB_IlBuilder * self, JB_IlBuilder ** target, JB_IlValue * left, JB_IlValue * right);
+void JB_IlBuilder_IfCmpGreaterOrEqual(JB_IlBuilder * self, JB_IlBuilder * target, JB_IlValue * left, JB_IlValue * right);
+void JB_IlBuilder_IfCmpGreaterOrEqualNew(JB_IlBuilder * self, JB_IlBuilder ** target, JB_IlValue * left, JB_IlValue * right);
+void JB_IlBuilder_IfCmpGreaterThan(JB_IlBuilder * self, JB_IlBuilder * target, JB_IlValue * left, JB_IlValue * right);
+void JB_IlBuilder_IfCmpGreaterThanNew(JB_IlBuilder * self, JB_IlBuilder ** target, JB_IlValue * left, JB_IlValue * right);
+void JB_IlBuilder_IfCmpNotEqual(JB_IlBuilder * self, JB_IlBuilder * target, JB_IlValue * left, JB_IlValue * right);
+void JB_IlBuilder_IfCmpNotEqualNew(JB_IlBuilder * self, JB_IlBuilder ** target, JB_IlValue * left, JB_IlValue * right);
+void JB_IlBuilder_IfCmpUnsignedLessOrEqual(JB_IlBuilder * self, JB_IlBuilder * target, JB_IlValue * left, JB_IlValue * right);
+void JB_IlBuilder_IfCmpUnsignedLessOrEqualNew(JB_IlBuilder * self, JB_IlBuilder ** target, JB_IlValue * left, JB_IlValue * right);
+void JB_IlBuilder_IfCmpUnsignedLessThan(JB_IlBuilder * self, JB_IlBuilder * target, JB_IlValue * left, JB_IlValue * right);
+void JB_IlBuilder_IfCmpUnsignedLessThanNew(JB_IlBuilder * self, JB_IlBuilder ** target, JB_IlValue * left, JB_IlValue * right);
+void JB_IlBuilder_IfCmpUnsignedGreaterOrEqual(JB_IlBuilder * self, JB_IlBuilder * target, JB_IlValue * left, JB_IlValue * right);
+void JB_IlBuilder_IfCmpUnsignedGreaterOrEqualNew(JB_IlBuilder * self, JB_IlBuilder ** target, JB_IlValue * left, JB_IlValue * right);
+void JB_IlBuilder_IfCmpUnsignedGreaterThan(JB_IlBuilder * self, JB_IlBuilder * target, JB_IlValue * left, JB_IlValue * right);
+void JB_IlBuilder_IfCmpUnsignedGreaterThanNew(JB_IlBuilder * self, JB_IlBuilder ** target, JB_IlValue * left, JB_IlValue * right);
+void JB_IlBuilder_IfCmpEqualZero(JB_IlBuilder * self, JB_IlBuilder * target, JB_IlValue * condition);
+void JB_IlBuilder_IfCmpEqualZeroNew(JB_IlBuilder * self, JB_IlBuilder ** target, JB_IlValue * condition);
+void JB_IlBuilder_IfCmpNotEqualZero(JB_IlBuilder * self, JB_IlBuilder * target, JB_IlValue * condition);
+void JB_IlBuilder_IfCmpNotEqualZeroNew(JB_IlBuilder * self, JB_IlBuilder ** target, JB_IlValue * condition);
+void JB_IlBuilder_IfOrWithArgArray(JB_IlBuilder * self, JB_IlBuilder ** anyTrueBuilder, JB_IlBuilder ** allFalseBuilder, int32_t numTerms, JB_IlBuilder_JBCondition ** terms);
+void JB_IlBuilder_IfThen(JB_IlBuilder * self, JB_IlBuilder ** thenPath, JB_IlValue * condition);
+void JB_IlBuilder_IfThenElse(JB_IlBuilder * self, JB_IlBuilder ** thenPath, JB_IlBuilder ** elsePath, JB_IlValue * condition);
+JB_IlValue * JB_IlBuilder_Select(JB_IlBuilder * self, JB_IlValue * condition, JB_IlValue * trueValue, JB_IlValue * falseValue);
+void JB_IlBuilder_ForLoop(JB_IlBuilder * self, bool countsUp, char * indVar, JB_IlBuilder ** body, JB_IlBuilder ** breakBuilder, JB_IlBuilder ** continueBuilder, JB_IlValue * initial, JB_IlValue * iterateWhile, JB_IlValue * increment);
+void JB_IlBuilder_ForLoopDown(JB_IlBuilder * self, char * indVar, JB_IlBuilder ** body, JB_IlValue * initial, JB_IlValue * iterateWhile, JB_IlValue * increment);
+void JB_IlBuilder_ForLoopUp(JB_IlBuilder * self, char * indVar, JB_IlBuilder ** body, JB_IlValue * initial, JB_IlValue * iterateWhile, JB_IlValue * increment);
+void JB_IlBuilder_ForLoopWithBreak(JB_IlBuilder * self, bool countsUp, char * indVar, JB_IlBuilder ** body, JB_IlBuilder ** breakBuilder, JB_IlValue * initial, JB_IlValue * iterateWhile, JB_IlValue * increment);
+void JB_IlBuilder_ForLoopWithContinue(JB_IlBuilder * self, bool countsUp, char * indVar, JB_IlBuilder ** body, JB_IlBuilder ** continueBuilder, JB_IlValue * initial, JB_IlValue * iterateWhile, JB_IlValue * increment);
+void JB_IlBuilder_Return(JB_IlBuilder * self);
+void JB_IlBuilder_ReturnValue(JB_IlBuilder * self, JB_IlValue * value);
+void JB_IlBuilder_SwitchWithArgArray(JB_IlBuilder * self, JB_IlValue * selectorValue, JB_IlBuilder ** defaultBuilder, int32_t numCases, JB_IlBuilder_JBCase ** cases);
+void JB_IlBuilder_TableSwitchWithArgArray(JB_IlBuilder * self, JB_IlValue * selectorValue, JB_IlBuilder ** defaultBuilder, bool generateBoundsCheck, int32_t numCases, JB_IlBuilder_JBCase ** cases);
+JB_IlBuilder_JBCase * JB_IlBuilder_MakeCase(JB_IlBuilder * self, int32_t value, JB_IlBuilder ** builder, int32_t fallsThrough);
+void JB_IlBuilder_WhileDoLoop(JB_IlBuilder * self, char * exitCondition, JB_IlBuilder ** body);
+void JB_IlBuilder_WhileDoLoopWithBreak(JB_IlBuilder * self, char * exitCondition, JB_IlBuilder ** body, JB_IlBuilder ** breakBuilder);
+void JB_IlBuilder_WhileDoLoopWithContinue(JB_IlBuilder * self, char * exitCondition, JB_IlBuilder ** body, JB_IlBuilder ** continueBuilder);
+
+/* JB_MethodBuilder */
+typedef bool (*JB_MethodBuilder_RequestFunctionCallback)(JB_MethodBuilder * self, const char * name);
+JB_IlBuilder * JB_MethodBuilder_asIlBuilder(JB_MethodBuilder * self);
+JB_MethodBuilder * JB_MethodBuilder_new_TypeDictionary(JB_TypeDictionary * dict);
+JB_MethodBuilder * JB_MethodBuilder_new_TypeDictionary_VirtualMachineState(JB_TypeDictionary * dict, JB_VirtualMachineState * vmState);
+JB_MethodBuilder * JB_MethodBuilder_new_MethodBuilder(JB_MethodBuilder * callerMB);
+JB_MethodBuilder * JB_MethodBuilder_new_MethodBuilder_VirtualMachineState(JB_MethodBuilder * callerMB, JB_VirtualMachineState * vmState);
+void JB_MethodBuilder_delete(JB_MethodBuilder * self);
+void JB_MethodBuilder_setClientCallback_RequestFunction(JB_MethodBuilder * self, JB_MethodBuilder_RequestFunctionCallback callback);
+void JB_MethodBuilder_AllLocalsHaveBeenDefined(JB_MethodBuilder * self);
+void JB_MethodBuilder_AppendBuilder(JB_MethodBuilder * self, JB_IlBuilder * b);
+void JB_MethodBuilder_AppendBuilder_BytecodeBuilder(JB_MethodBuilder * self, JB_BytecodeBuilder * b);
+void JB_MethodBuilder_AppendBytecodeBuilder(JB_MethodBuilder * self, JB_BytecodeBuilder * b);
+void JB_MethodBuilder_DefineFile(JB_MethodBuilder * self, const char * fileName);
+void JB_MethodBuilder_DefineLineString(JB_MethodBuilder * self, const char * line);
+void JB_MethodBuilder_DefineLineInteger(JB_MethodBuilder * self, int32_t line);
+void JB_MethodBuilder_DefineName(JB_MethodBuilder * self, const char * name);
+void JB_MethodBuilder_DefineParameter(JB_MethodBuilder * self, const char * name, JB_IlType * type);
+void JB_MethodBuilder_DefineArrayParameter(JB_MethodBuilder * self, const char * name, JB_IlType * type);
+void JB_MethodBuilder_DefineReturnType(JB_MethodBuilder * self, JB_IlType * type);
+void JB_MethodBuilder_DefineLocal(JB_MethodBuilder * self, const char * name, JB_IlType * type);
+void JB_MethodBuilder_DefineGlobal(JB_MethodBuilder * self, const char * name, JB_IlType * type, void * location);
+void JB_MethodBuilder_DefineMemory(JB_MethodBuilder * self, const char * name, JB_IlType * type, void * location);
+void JB_MethodBuilder_DefineFunction(JB_MethodBuilder * self, const char * name, const char * fileName, const char * lineNumber, void * entryPoint, JB_IlType * returnType, int32_t numParms, JB_IlType ** parmTypes);
+const char * JB_MethodBuilder_GetMethodName(JB_MethodBuilder * self);
+int32_t JB_MethodBuilder_GetNextBytecodeFromWorklist(JB_MethodBuilder * self);
+void JB_MethodBuilder_setVMState(JB_MethodBuilder * self, JB_VirtualMachineState * vmState);
+
+/* JB_IlType */
+JB_IlType * JB_IlType_baseType(JB_IlType * self);
+const char * JB_IlType_getName(JB_IlType * self);
+JB_IlType * JB_IlType_primitiveType(JB_IlType * self, JB_TypeDictionary * d);
+size_t JB_IlType_getSize(JB_IlType * self);
+bool JB_IlType_isPointer(JB_IlType * self);
+
+/* JB_IlValue */
+int32_t JB_IlValue_getID(JB_IlValue * self);
+
+/* JB_ThunkBuilder */
+JB_MethodBuilder * JB_ThunkBuilder_asMethodBuilder(JB_ThunkBuilder * self);
+JB_IlBuilder * JB_ThunkBuilder_asIlBuilder(JB_ThunkBuilder * self);
+JB_ThunkBuilder * JB_ThunkBuilder_new(JB_TypeDictionary * dict, const char * name, JB_IlType * returnType, uint32_t numCalleeParms, JB_IlType ** calleeParms);
+void JB_ThunkBuilder_delete(JB_ThunkBuilder * self);
+
+/* JB_TypeDictionary */
+JB_TypeDictionary * JB_TypeDictionary_new(void);
+void JB_TypeDictionary_delete(JB_TypeDictionary * self);
+JB_IlType * JB_TypeDictionary_getNoType(JB_TypeDictionary * self);
+JB_IlType * JB_TypeDictionary_getInt8(JB_TypeDictionary * self);
+JB_IlType * JB_TypeDictionary_getInt16(JB_TypeDictionary * self);
+JB_IlType * JB_TypeDictionary_getInt32(JB_TypeDictionary * self);
+JB_IlType * JB_TypeDictionary_getInt64(JB_TypeDictionary * self);
+JB_IlType * JB_TypeDictionary_getFloat(JB_TypeDictionary * self);
+JB_IlType * JB_TypeDictionary_getDouble(JB_TypeDictionary * self);
+JB_IlType * JB_TypeDictionary_getAddress(JB_TypeDictionary * self);
+JB_IlType * JB_TypeDictionary_getVectorInt8(JB_TypeDictionary * self);
+JB_IlType * JB_TypeDictionary_getVectorInt16(JB_TypeDictionary * self);
+JB_IlType * JB_TypeDictionary_getVectorInt32(JB_TypeDictionary * self);
+JB_IlType * JB_TypeDictionary_getVectorInt64(JB_TypeDictionary * self);
+JB_IlType * JB_TypeDictionary_getVectorFloat(JB_TypeDictionary * self);
+JB_IlType * JB_TypeDictionary_getVectorDouble(JB_TypeDictionary * self);
+JB_IlType * JB_TypeDictionary_getWord(JB_TypeDictionary * self);
+JB_IlType * JB_TypeDictionary_getpNoType(JB_TypeDictionary * self);
+JB_IlType * JB_TypeDictionary_getpInt8(JB_TypeDictionary * self);
+JB_IlType * JB_TypeDictionary_getpInt16(JB_TypeDictionary * self);
+JB_IlType * JB_TypeDictionary_getpInt32(JB_TypeDictionary * self);
+JB_IlType * JB_TypeDictionary_getpInt64(JB_TypeDictionary * self);
+JB_IlType * JB_TypeDictionary_getpFloat(JB_TypeDictionary * self);
+JB_IlType * JB_TypeDictionary_getpDouble(JB_TypeDictionary * self);
+JB_IlType * JB_TypeDictionary_getpAddress(JB_TypeDictionary * self);
+JB_IlType * JB_TypeDictionary_getpVectorInt8(JB_TypeDictionary * self);
+JB_IlType * JB_TypeDictionary_getpVectorInt16(JB_TypeDictionary * self);
+JB_IlType * JB_TypeDictionary_getpVectorInt32(JB_TypeDictionary * self);
+JB_IlType * JB_TypeDictionary_getpVectorInt64(JB_TypeDictionary * self);
+JB_IlType * JB_TypeDictionary_getpVectorFloat(JB_TypeDictionary * self);
+JB_IlType * JB_TypeDictionary_getpVectorDouble(JB_TypeDictionary * self);
+JB_IlType * JB_TypeDictionary_getpWord(JB_TypeDictionary * self);
+void JB_TypeDictionary_CloseStruct(JB_TypeDictionary * self, const char * structName);
+void JB_TypeDictionary_CloseStructWithSize(JB_TypeDictionary * self, const char * structName, size_t size);
+void JB_TypeDictionary_CloseUnion(JB_TypeDictionary * self, const char * unionName);
+void JB_TypeDictionary_DefineField(JB_TypeDictionary * self, const char * structName, const char * fieldName, JB_IlType * type);
+void JB_TypeDictionary_DefineFieldAtOffset(JB_TypeDictionary * self, const char * structName, const char * fieldName, JB_IlType * type, size_t offset);
+JB_IlType * JB_TypeDictionary_DefineStruct(JB_TypeDictionary * self, const char * structName);
+JB_IlType * JB_TypeDictionary_DefineUnion(JB_TypeDictionary * self, const char * unionName);
+JB_IlType * JB_TypeDictionary_GetFieldType(JB_TypeDictionary * self, const char * structName, const char * fieldName);
+JB_IlType * JB_TypeDictionary_LookupStruct(JB_TypeDictionary * self, const char * structName);
+JB_IlType * JB_TypeDictionary_LookupUnion(JB_TypeDictionary * self, const char * unionName);
+size_t JB_TypeDictionary_OffsetOf(JB_TypeDictionary * self, const char * structName, const char * fieldName);
+JB_IlType * JB_TypeDictionary_PointerTo(JB_TypeDictionary * self, JB_IlType * baseType);
+JB_IlType * JB_TypeDictionary_PointerToStructName(JB_TypeDictionary * self, const char * structName);
+void JB_TypeDictionary_UnionField(JB_TypeDictionary * self, const char * unionName, const char * fieldName, JB_IlType * fieldType);
+JB_IlType * JB_TypeDictionary_UnionFieldType(JB_TypeDictionary * self, const char * unionName, const char * fieldName);
+
+/* JB_VirtualMachineOperandArray */
+typedef void (*JB_VirtualMachineOperandArray_CommitCallback)(JB_VirtualMachineOperandArray * self, JB_IlBuilder * b);
+typedef void (*JB_VirtualMachineOperandArray_ReloadCallback)(JB_VirtualMachineOperandArray * self, JB_IlBuilder * b);
+typedef JB_VirtualMachineState * (*JB_VirtualMachineOperandArray_MakeCopyCallback)(JB_VirtualMachineOperandArray * self);
+typedef void (*JB_VirtualMachineOperandArray_MergeIntoCallback)(JB_VirtualMachineOperandArray * self, JB_VirtualMachineState * vmState, JB_IlBuilder * b);
+JB_VirtualMachineState * JB_VirtualMachineOperandArray_asVirtualMachineState(JB_VirtualMachineOperandArray * self);
+JB_VirtualMachineOperandArray * JB_VirtualMachineOperandArray_new_MethodBuilder_int32_IlType_VirtualMachineRegister(JB_MethodBuilder * mb, int32_t numOfElements, JB_IlType * elementType, JB_VirtualMachineRegister * arrayBase);
+JB_VirtualMachineOperandArray * JB_VirtualMachineOperandArray_new_VirtualMachineOperandArray(JB_VirtualMachineOperandArray * other);
+void JB_VirtualMachineOperandArray_delete(JB_VirtualMachineOperandArray * self);
+void JB_VirtualMachineOperandArray_setClientCallback_Commit(JB_VirtualMachineOperandArray * self, JB_VirtualMachineOperandArray_CommitCallback callback);
+void JB_VirtualMachineOperandArray_setClientCallback_Reload(JB_VirtualMachineOperandArray * self, JB_VirtualMachineOperandArray_ReloadCallback callback);
+void JB_VirtualMachineOperandArray_setClientCallback_MakeCopy(JB_VirtualMachineOperandArray * self, JB_VirtualMachineOperandArray_MakeCopyCallback callback);
+void JB_VirtualMachineOperandArray_setClientCallback_MergeInto(JB_VirtualMachineOperandArray * self, JB_VirtualMachineOperandArray_MergeIntoCallback callback);
+JB_IlValue * JB_VirtualMachineOperandArray_Get(JB_VirtualMachineOperandArray * self, int32_t index);
+void JB_VirtualMachineOperandArray_Move(JB_VirtualMachineOperandArray * self, JB_IlBuilder * b, int32_t dstIndex, int32_t srcIndex);
+void JB_VirtualMachineOperandArray_Set(JB_VirtualMachineOperandArray * self, int32_t index, JB_IlValue * value);
+void JB_VirtualMachineOperandArray_UpdateArray(JB_VirtualMachineOperandArray * self, JB_IlBuilder * b, JB_IlValue * array);
+
+/* JB_VirtualMachineOperandStack */
+typedef void (*JB_VirtualMachineOperandStack_CommitCallback)(JB_VirtualMachineOperandStack * self, JB_IlBuilder * b);
+typedef void (*JB_VirtualMachineOperandStack_ReloadCallback)(JB_VirtualMachineOperandStack * self, JB_IlBuilder * b);
+typedef JB_VirtualMachineState * (*JB_VirtualMachineOperandStack_MakeCopyCallback)(JB_VirtualMachineOperandStack * self);
+typedef void (*JB_VirtualMachineOperandStack_MergeIntoCallback)(JB_VirtualMachineOperandStack * self, JB_VirtualMachineState * vmState, JB_IlBuilder * b);
+JB_VirtualMachineState * JB_VirtualMachineOperandStack_asVirtualMachineState(JB_VirtualMachineOperandStack * self);
+JB_VirtualMachineOperandStack * JB_VirtualMachineOperandStack_new_MethodBuilder_int32_IlType_VirtualMachineRegister(JB_MethodBuilder * mb, int32_t sizeHint, JB_IlType * elementType, JB_VirtualMachineRegister * stackTopRegister);
+JB_VirtualMachineOperandStack * JB_VirtualMachineOperandStack_new_MethodBuilder_int32_IlType_VirtualMachineRegister_boolean(JB_MethodBuilder * mb, int32_t sizeHint, JB_IlType * elementType, JB_VirtualMachineRegister * stackTopRegister, bool growsUp);
+JB_VirtualMachineOperandStack * JB_VirtualMachineOperandStack_new_MethodBuilder_int32_IlType_VirtualMachineRegister_boolean_int32(JB_MethodBuilder * mb, int32_t sizeHint, JB_IlType * elementType, JB_VirtualMachineRegister * stackTopRegister, bool growsUp, int32_t stackInitialOffset);
+void JB_VirtualMachineOperandStack_delete(JB_VirtualMachineOperandStack * self);
+void JB_VirtualMachineOperandStack_setClientCallback_Commit(JB_VirtualMachineOperandStack * self, JB_VirtualMachineOperandStack_CommitCallback callback);
+void JB_VirtualMachineOperandStack_setClientCallback_Reload(JB_VirtualMachineOperandStack * self, JB_VirtualMachineOperandStack_ReloadCallback callback);
+void JB_VirtualMachineOperandStack_setClientCallback_MakeCopy(JB_VirtualMachineOperandStack * self, JB_VirtualMachineOperandStack_MakeCopyCallback callback);
+void JB_VirtualMachineOperandStack_setClientCallback_MergeInto(JB_VirtualMachineOperandStack * self, JB_VirtualMachineOperandStack_MergeIntoCallback callback);
+void JB_VirtualMachineOperandStack_Drop(JB_VirtualMachineOperandStack * self, JB_IlBuilder * b, int32_t depth);
+void JB_VirtualMachineOperandStack_Dup(JB_VirtualMachineOperandStack * self, JB_IlBuilder * b);
+JB_IlValue * JB_VirtualMachineOperandStack_Pick(JB_VirtualMachineOperandStack * self, int32_t depth);
+JB_IlValue * JB_VirtualMachineOperandStack_Pop(JB_VirtualMachineOperandStack * self, JB_IlBuilder * b);
+void JB_VirtualMachineOperandStack_Push(JB_VirtualMachineOperandStack * self, JB_IlBuilder * b, JB_IlValue * value);
+JB_IlValue * JB_VirtualMachineOperandStack_Top(JB_VirtualMachineOperandStack * self);
+void JB_VirtualMachineOperandStack_UpdateStack(JB_VirtualMachineOperandStack * self, JB_IlBuilder * b, JB_IlValue * array);
+
+/* JB_VirtualMachineRegister */
+typedef void (*JB_VirtualMachineRegister_CommitCallback)(JB_VirtualMachineRegister * self, JB_IlBuilder * b);
+typedef void (*JB_VirtualMachineRegister_ReloadCallback)(JB_VirtualMachineRegister * self, JB_IlBuilder * b);
+typedef JB_VirtualMachineState * (*JB_VirtualMachineRegister_MakeCopyCallback)(JB_VirtualMachineRegister * self);
+JB_VirtualMachineState * JB_VirtualMachineRegister_asVirtualMachineState(JB_VirtualMachineRegister * self);
+JB_VirtualMachineRegister * JB_VirtualMachineRegister_new(JB_IlBuilder * b, const char * localName, JB_IlType * pointerToRegisterType, uint32_t adjustByStep, JB_IlValue * addressOfRegister);
+void JB_VirtualMachineRegister_delete(JB_VirtualMachineRegister * self);
+void JB_VirtualMachineRegister_setClientCallback_Commit(JB_VirtualMachineRegister * self, JB_VirtualMachineRegister_CommitCallback callback);
+void JB_VirtualMachineRegister_setClientCallback_Reload(JB_VirtualMachineRegister * self, JB_VirtualMachineRegister_ReloadCallback callback);
+void JB_VirtualMachineRegister_setClientCallback_MakeCopy(JB_VirtualMachineRegister * self, JB_VirtualMachineRegister_MakeCopyCallback callback);
+void JB_VirtualMachineRegister_Adjust(JB_VirtualMachineRegister * self, JB_IlBuilder * b, JB_IlValue * amount);
+void JB_VirtualMachineRegister_AdjustByConst(JB_VirtualMachineRegister * self, JB_IlBuilder * b, size_t amount);
+JB_IlValue * JB_VirtualMachineRegister_Load(JB_VirtualMachineRegister * self, JB_IlBuilder * b);
+void JB_VirtualMachineRegister_Store(JB_VirtualMachineRegister * self, JB_IlBuilder * b, JB_IlValue * value);
+
+/* JB_VirtualMachineRegisterInStruct */
+typedef void (*JB_VirtualMachineRegisterInStruct_CommitCallback)(JB_VirtualMachineRegisterInStruct * self, JB_IlBuilder * b);
+typedef void (*JB_VirtualMachineRegisterInStruct_ReloadCallback)(JB_VirtualMachineRegisterInStruct * self, JB_IlBuilder * b);
+typedef JB_VirtualMachineState * (*JB_VirtualMachineRegisterInStruct_MakeCopyCallback)(JB_VirtualMachineRegisterInStruct * self);
+JB_VirtualMachineRegister * JB_VirtualMachineRegisterInStruct_asVirtualMachineRegister(JB_VirtualMachineRegisterInStruct * self);
+JB_VirtualMachineState * JB_VirtualMachineRegisterInStruct_asVirtualMachineState(JB_VirtualMachineRegisterInStruct * self);
+JB_VirtualMachineRegisterInStruct * JB_VirtualMachineRegisterInStruct_new(JB_IlBuilder * b, const char * structName, const char * localNameHoldingStructAddress, const char * fieldName, const char * localName);
+void JB_VirtualMachineRegisterInStruct_delete(JB_VirtualMachineRegisterInStruct * self);
+void JB_VirtualMachineRegisterInStruct_setClientCallback_Commit(JB_VirtualMachineRegisterInStruct * self, JB_VirtualMachineRegisterInStruct_CommitCallback callback);
+void JB_VirtualMachineRegisterInStruct_setClientCallback_Reload(JB_VirtualMachineRegisterInStruct * self, JB_VirtualMachineRegisterInStruct_ReloadCallback callback);
+void JB_VirtualMachineRegisterInStruct_setClientCallback_MakeCopy(JB_VirtualMachineRegisterInStruct * self, JB_VirtualMachineRegisterInStruct_MakeCopyCallback callback);
+
+/* JB_VirtualMachineState */
+typedef void (*JB_VirtualMachineState_CommitCallback)(JB_VirtualMachineState * self, JB_IlBuilder * b);
+typedef void (*JB_VirtualMachineState_ReloadCallback)(JB_VirtualMachineState * self, JB_IlBuilder * b);
+typedef JB_VirtualMachineState * (*JB_VirtualMachineState_MakeCopyCallback)(JB_VirtualMachineState * self);
+typedef void (*JB_VirtualMachineState_MergeIntoCallback)(JB_VirtualMachineState * self, JB_VirtualMachineState * vmState, JB_IlBuilder * b);
+JB_VirtualMachineState * JB_VirtualMachineState_new(void);
+void JB_VirtualMachineState_delete(JB_VirtualMachineState * self);
+void JB_VirtualMachineState_setClientCallback_Commit(JB_VirtualMachineState * self, JB_VirtualMachineState_CommitCallback callback);
+void JB_VirtualMachineState_setClientCallback_Reload(JB_VirtualMachineState * self, JB_VirtualMachineState_ReloadCallback callback);
+void JB_VirtualMachineState_setClientCallback_MakeCopy(JB_VirtualMachineState * self, JB_VirtualMachineState_MakeCopyCallback callback);
+void JB_VirtualMachineState_setClientCallback_MergeInto(JB_VirtualMachineState * self, JB_VirtualMachineState_MergeIntoCallback callback);
+
+bool JB_initializeJit(void);
+bool JB_initializeJitWithOptions(char * options);
+int32_t JB_compileMethodBuilder(JB_MethodBuilder * methodBuilder, void ** entryPoint);
+void JB_shutdownJit(void);
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+
+#endif /* JitBuilderC_INCL */
@@ -0,0 +1,1327 @@
+/*******************************************************************************
+ * Copyright (c) 2026, 2026 IBM Corp. and others
+ *
+ * This program and the accompanying materials are made available under
+ * the terms of the Eclipse Public License 2.0 which accompanies this
+ * distribution and is available at http://eclipse.org/legal/epl-2.0
+ * or the Apache License, Version 2.0 which accompanies this distribution
+ * and is available at https://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * This Source Code may also be made available under the following Secondary
+ * Licenses when the conditions for such availability set forth in the
+ * Eclipse Public License, v. 2.0 are satisfied: GNU General Public License,
+ * version 2 with the GNU Classpath Exception [1] and GNU General Public
+ * License, version 2 with the OpenJDK Assembly Exception [2].
+ *
+ * [1] https://www.gnu.org/software/classpath/license.html
+ * [2] http://openjdk.java.net/legal/assembly-exception.html
+ *
+ * SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+ *******************************************************************************/
+        
+#include "ilgen/BytecodeBuilder.hpp"
+#include "ilgen/IlBuilder.hpp"
+#include "ilgen/MethodBuilder.hpp"
+#include "ilgen/IlType.hpp"
+#include "ilgen/IlValue.hpp"
+#include "ilgen/ThunkBuilder.hpp"
+#include "ilgen/TypeDictionary.hpp"
+#include "ilgen/VirtualMachineOperandArray.hpp"
+#include "ilgen/VirtualMachineOperandStack.hpp"
+#include "ilgen/VirtualMachineRegister.hpp"
+#include "ilgen/VirtualMachineRegisterInStruct.hpp"
+#include "ilgen/VirtualMachineState.hpp"
+#include "<output>/include/JitBuilderC.h"
+
+extern bool internal_initializeJit();
+extern bool internal_initializeJitWithOptions(char * options);
+extern int32_t internal_compileMethodBuilder(TR::MethodBuilder * methodBuilder, void ** entryPoint);
+extern void internal_shutdownJit();
+
+extern bool internal_claimClientAllocators(const char * clientAPI);
+
+static void * getSelf(void * impl) {
+    return impl;
+}
+
+static bool registerAllocators() {
+    if (!internal_claimClientAllocators("C")) {
+        return false;
+    }
+    TR::BytecodeBuilder::setClientAllocator(getSelf);
+    TR::BytecodeBuilder::setGetImpl(getSelf);
+    TR::IlBuilder::JBCase::setClientAllocator(getSelf);
+    TR::IlBuilder::JBCase::setGetImpl(getSelf);
+    TR::IlBuilder::JBCondition::setClientAllocator(getSelf);
+    TR::IlBuilder::JBCondition::setGetImpl(getSelf);
+    TR::IlBuilder::setClientAllocator(getSelf);
+    TR::IlBuilder::setGetImpl(getSelf);
+    TR::MethodBuilder::setClientAllocator(getSelf);
+    TR::MethodBuilder::setGetImpl(getSelf);
+    TR::IlType::setClientAllocator(getSelf);
+    TR::IlType::setGetImpl(getSelf);
+    TR::IlValue::setClientAllocator(getSelf);
+    TR::IlValue::setGetImpl(getSelf);
+    TR::ThunkBuilder::setClientAllocator(getSelf);
+    TR::ThunkBuilder::setGetImpl(getSelf);
+    TR::TypeDictionary::setClientAllocator(getSelf);
+    TR::TypeDictionary::setGetImpl(getSelf);
+    TR::VirtualMachineOperandArray::setClientAllocator(getSelf);
+    TR::VirtualMachineOperandArray::setGetImpl(getSelf);
+    TR::VirtualMachineOperandStack::setClientAllocator(getSelf);
+    TR::VirtualMachineOperandStack::setGetImpl(getSelf);
+    TR::VirtualMachineRegister::setClientAllocator(getSelf);
+    TR::VirtualMachineRegister::setGetImpl(getSelf);
+    TR::VirtualMachineRegisterInStruct::setClientAllocator(getSelf);
+    TR::VirtualMachineRegisterInStruct::setGetImpl(getSelf);
+    TR::VirtualMachineState::setClientAllocator(getSelf);
+    TR::VirtualMachineState::setGetImpl(getSelf);
+    return true;
+}
+
+static bool setAllocators() {
+    static const bool allocatorsSet = registerAllocators();
+    return allocatorsSet;
+}
+
+extern "C" {
+
+JB_IlBuilder * JB_BytecodeBuilder_asIlBuilder(JB_BytecodeBuilder * self) {
+    return reinterpret_cast<JB_IlBuilder *>(static_cast<TR::IlBuilder *>(reinterpret_cast<TR::BytecodeBuilder *>(self)));
+}
+
+int32_t JB_BytecodeBuilder_bcIndex(JB_BytecodeBuilder * self) {
+    return reinterpret_cast<TR::BytecodeBuilder *>(self)->bcIndex();
+}
+
+char * JB_BytecodeBuilder_name(JB_BytecodeBuilder * self) {
+    return reinterpret_cast<TR::BytecodeBuilder *>(self)->name();
+}
+
+JB_VirtualMachineState * JB_BytecodeBuilder_vmState(JB_BytecodeBuilder * self) {
+    return reinterpret_cast<JB_VirtualMachineState *>(reinterpret_cast<TR::BytecodeBuilder *>(self)->vmState());
+}
+
+void JB_BytecodeBuilder_AddFallThroughBuilder(JB_BytecodeBuilder * self, JB_BytecodeBuilder * ftb) {
+    reinterpret_cast<TR::BytecodeBuilder *>(self)->AddFallThroughBuilder(reinterpret_cast<TR::BytecodeBuilder *>(ftb));
+}
+
+void JB_BytecodeBuilder_AddSuccessorBuildersWithArgArray(JB_BytecodeBuilder * self, uint32_t numBuilders, JB_BytecodeBuilder ** builders) {
+    reinterpret_cast<TR::BytecodeBuilder *>(self)->AddSuccessorBuilders(numBuilders, reinterpret_cast<TR::BytecodeBuilder * *>(builders));
+}
+
+void JB_BytecodeBuilder_AddSuccessorBuilder(JB_BytecodeBuilder * self, JB_BytecodeBuilder ** b) {
+    reinterpret_cast<TR::BytecodeBuilder *>(self)->AddSuccessorBuilder(reinterpret_cast<TR::BytecodeBuilder * *>(b));
+}
+
+void JB_BytecodeBuilder_Goto(JB_BytecodeBuilder * self, JB_BytecodeBuilder * b) {
+    reinterpret_cast<TR::BytecodeBuilder *>(self)->Goto(reinterpret_cast<TR::BytecodeBuilder *>(b));
+}
+
+void JB_BytecodeBuilder_GotoNew(JB_BytecodeBuilder * self, JB_BytecodeBuilder ** b) {
+    reinterpret_cast<TR::BytecodeBuilder *>(self)->Goto(reinterpret_cast<TR::BytecodeBuilder * *>(b));
+}
+
+void JB_BytecodeBuilder_IfCmpEqual(JB_BytecodeBuilder * self, JB_BytecodeBuilder * target, JB_IlValue * left, JB_IlValue * right) {
+    reinterpret_cast<TR::BytecodeBuilder *>(self)->IfCmpEqual(reinterpret_cast<TR::BytecodeBuilder *>(target), reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right));
+}
+
+void JB_BytecodeBuilder_IfCmpEqualNew(JB_BytecodeBuilder * self, JB_BytecodeBuilder ** target, JB_IlValue * left, JB_IlValue * right) {
+    reinterpret_cast<TR::BytecodeBuilder *>(self)->IfCmpEqual(reinterpret_cast<TR::BytecodeBuilder * *>(target), reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right));
+}
+
+void JB_BytecodeBuilder_IfCmpLessOrEqual(JB_BytecodeBuilder * self, JB_BytecodeBuilder * target, JB_IlValue * left, JB_IlValue * right) {
+    reinterpret_cast<TR::BytecodeBuilder *>(self)->IfCmpLessOrEqual(reinterpret_cast<TR::BytecodeBuilder *>(target), reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right));
+}
+
+void JB_BytecodeBuilder_IfCmpLessOrEqualNew(JB_BytecodeBuilder * self, JB_BytecodeBuilder ** target, JB_IlValue * left, JB_IlValue * right) {
+    reinterpret_cast<TR::BytecodeBuilder *>(self)->IfCmpLessOrEqual(reinterpret_cast<TR::BytecodeBuilder * *>(target), reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right));
+}
+
+void JB_BytecodeBuilder_IfCmpLessThan(JB_BytecodeBuilder * self, JB_BytecodeBuilder * target, JB_IlValue * left, JB_IlValue * right) {
+    reinterpret_cast<TR::BytecodeBuilder *>(self)->IfCmpLessThan(reinterpret_cast<TR::BytecodeBuilder *>(target), reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right));
+}
+
+void JB_BytecodeBuilder_IfCmpLessThanNew(JB_BytecodeBuilder * self, JB_BytecodeBuilder ** target, JB_IlValue * left, JB_IlValue * right) {
+    reinterpret_cast<TR::BytecodeBuilder *>(self)->IfCmpLessThan(reinterpret_cast<TR::BytecodeBuilder * *>(target), reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right));
+}
+
+void JB_BytecodeBuilder_IfCmpGreaterOrEqual(JB_BytecodeBuilder * self, JB_BytecodeBuilder * target, JB_IlValue * left, JB_IlValue * right) {
+    reinterpret_cast<TR::BytecodeBuilder *>(self)->IfCmpGreaterOrEqual(reinterpret_cast<TR::BytecodeBuilder *>(target), reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right));
+}
+
+void JB_BytecodeBuilder_IfCmpGreaterOrEqualNew(JB_BytecodeBuilder * self, JB_BytecodeBuilder ** target, JB_IlValue * left, JB_IlValue * right) {
+    reinterpret_cast<TR::BytecodeBuilder *>(self)->IfCmpGreaterOrEqual(reinterpret_cast<TR::BytecodeBuilder * *>(target), reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right));
+}
+
+void JB_BytecodeBuilder_IfCmpGreaterThan(JB_BytecodeBuilder * self, JB_BytecodeBuilder * target, JB_IlValue * left, JB_IlValue * right) {
+    reinterpret_cast<TR::BytecodeBuilder *>(self)->IfCmpGreaterThan(reinterpret_cast<TR::BytecodeBuilder *>(target), reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right));
+}
+
+void JB_BytecodeBuilder_IfCmpGreaterThanNew(JB_BytecodeBuilder * self, JB_BytecodeBuilder ** target, JB_IlValue * left, JB_IlValue * right) {
+    reinterpret_cast<TR::BytecodeBuilder *>(self)->IfCmpGreaterThan(reinterpret_cast<TR::BytecodeBuilder * *>(target), reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right));
+}
+
+void JB_BytecodeBuilder_IfCmpNotEqual(JB_BytecodeBuilder * self, JB_BytecodeBuilder * target, JB_IlValue * left, JB_IlValue * right) {
+    reinterpret_cast<TR::BytecodeBuilder *>(self)->IfCmpNotEqual(reinterpret_cast<TR::BytecodeBuilder *>(target), reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right));
+}
+
+void JB_BytecodeBuilder_IfCmpNotEqualNew(JB_BytecodeBuilder * self, JB_BytecodeBuilder ** target, JB_IlValue * left, JB_IlValue * right) {
+    reinterpret_cast<TR::BytecodeBuilder *>(self)->IfCmpNotEqual(reinterpret_cast<TR::BytecodeBuilder * *>(target), reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right));
+}
+
+void JB_BytecodeBuilder_IfCmpUnsignedLessOrEqual(JB_BytecodeBuilder * self, JB_BytecodeBuilder * target, JB_IlValue * left, JB_IlValue * right) {
+    reinterpret_cast<TR::BytecodeBuilder *>(self)->IfCmpUnsignedLessOrEqual(reinterpret_cast<TR::BytecodeBuilder *>(target), reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right));
+}
+
+void JB_BytecodeBuilder_IfCmpUnsignedLessOrEqualNew(JB_BytecodeBuilder * self, JB_BytecodeBuilder ** target, JB_IlValue * left, JB_IlValue * right) {
+    reinterpret_cast<TR::BytecodeBuilder *>(self)->IfCmpUnsignedLessOrEqual(reinterpret_cast<TR::BytecodeBuilder * *>(target), reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right));
+}
+
+void JB_BytecodeBuilder_IfCmpUnsignedLessThan(JB_BytecodeBuilder * self, JB_BytecodeBuilder * target, JB_IlValue * left, JB_IlValue * right) {
+    reinterpret_cast<TR::BytecodeBuilder *>(self)->IfCmpUnsignedLessThan(reinterpret_cast<TR::BytecodeBuilder *>(target), reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right));
+}
+
+void JB_BytecodeBuilder_IfCmpUnsignedLessThanNew(JB_BytecodeBuilder * self, JB_BytecodeBuilder ** target, JB_IlValue * left, JB_IlValue * right) {
+    reinterpret_cast<TR::BytecodeBuilder *>(self)->IfCmpUnsignedLessThan(reinterpret_cast<TR::BytecodeBuilder * *>(target), reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right));
+}
+
+void JB_BytecodeBuilder_IfCmpUnsignedGreaterOrEqual(JB_BytecodeBuilder * self, JB_BytecodeBuilder * target, JB_IlValue * left, JB_IlValue * right) {
+    reinterpret_cast<TR::BytecodeBuilder *>(self)->IfCmpUnsignedGreaterOrEqual(reinterpret_cast<TR::BytecodeBuilder *>(target), reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right));
+}
+
+void JB_BytecodeBuilder_IfCmpUnsignedGreaterOrEqualNew(JB_BytecodeBuilder * self, JB_BytecodeBuilder ** target, JB_IlValue * left, JB_IlValue * right) {
+    reinterpret_cast<TR::BytecodeBuilder *>(self)->IfCmpUnsignedGreaterOrEqual(reinterpret_cast<TR::BytecodeBuilder * *>(target), reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right));
+}
+
+void JB_BytecodeBuilder_IfCmpUnsignedGreaterThan(JB_BytecodeBuilder * self, JB_BytecodeBuilder * target, JB_IlValue * left, JB_IlValue * right) {
+    reinterpret_cast<TR::BytecodeBuilder *>(self)->IfCmpUnsignedGreaterThan(reinterpret_cast<TR::BytecodeBuilder *>(target), reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right));
+}
+
+void JB_BytecodeBuilder_IfCmpUnsignedGreaterThanNew(JB_BytecodeBuilder * self, JB_BytecodeBuilder ** target, JB_IlValue * left, JB_IlValue * right) {
+    reinterpret_cast<TR::BytecodeBuilder *>(self)->IfCmpUnsignedGreaterThan(reinterpret_cast<TR::BytecodeBuilder * *>(target), reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right));
+}
+
+void JB_BytecodeBuilder_IfCmpEqualZero(JB_BytecodeBuilder * self, JB_BytecodeBuilder * target, JB_IlValue * condition) {
+    reinterpret_cast<TR::BytecodeBuilder *>(self)->IfCmpEqualZero(reinterpret_cast<TR::BytecodeBuilder *>(target), reinterpret_cast<TR::IlValue *>(condition));
+}
+
+void JB_BytecodeBuilder_IfCmpEqualZeroNew(JB_BytecodeBuilder * self, JB_BytecodeBuilder ** target, JB_IlValue * condition) {
+    reinterpret_cast<TR::BytecodeBuilder *>(self)->IfCmpEqualZero(reinterpret_cast<TR::BytecodeBuilder * *>(target), reinterpret_cast<TR::IlValue *>(condition));
+}
+
+void JB_BytecodeBuilder_IfCmpNotEqualZero(JB_BytecodeBuilder * self, JB_BytecodeBuilder * target, JB_IlValue * condition) {
+    reinterpret_cast<TR::BytecodeBuilder *>(self)->IfCmpNotEqualZero(reinterpret_cast<TR::BytecodeBuilder *>(target), reinterpret_cast<TR::IlValue *>(condition));
+}
+
+void JB_BytecodeBuilder_IfCmpNotEqualZeroNew(JB_BytecodeBuilder * self, JB_BytecodeBuilder ** target, JB_IlValue * condition) {
+    reinterpret_cast<TR::BytecodeBuilder *>(self)->IfCmpNotEqualZero(reinterpret_cast<TR::BytecodeBuilder * *>(target), reinterpret_cast<TR::IlValue *>(condition));
+}
+
+JB_IlBuilder_JBCase * JB_IlBuilder_JBCase_new(int32_t caseValue, JB_IlBuilder * caseBuilder, int32_t caseFallsThrough) {
+    return reinterpret_cast<JB_IlBuilder_JBCase *>(::new TR::IlBuilder::JBCase(caseValue, reinterpret_cast<TR::IlBuilder *>(caseBuilder), caseFallsThrough));
+}
+
+void JB_IlBuilder_JBCase_delete(JB_IlBuilder_JBCase * self) {
+    ::delete reinterpret_cast<TR::IlBuilder::JBCase *>(self);
+}
+
+JB_IlBuilder_JBCondition * JB_IlBuilder_JBCondition_new(JB_IlBuilder * conditionBuilder, JB_IlValue * conditionValue) {
+    return reinterpret_cast<JB_IlBuilder_JBCondition *>(::new TR::IlBuilder::JBCondition(reinterpret_cast<TR::IlBuilder *>(conditionBuilder), reinterpret_cast<TR::IlValue *>(conditionValue)));
+}
+
+void JB_IlBuilder_JBCondition_delete(JB_IlBuilder_JBCondition * self) {
+    ::delete reinterpret_cast<TR::IlBuilder::JBCondition *>(self);
+}
+
+JB_IlType * JB_IlBuilder_getNoType(JB_IlBuilder * self) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::IlBuilder *>(self)->NoType);
+}
+
+JB_IlType * JB_IlBuilder_getInt8(JB_IlBuilder * self) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::IlBuilder *>(self)->Int8);
+}
+
+JB_IlType * JB_IlBuilder_getInt16(JB_IlBuilder * self) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::IlBuilder *>(self)->Int16);
+}
+
+JB_IlType * JB_IlBuilder_getInt32(JB_IlBuilder * self) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::IlBuilder *>(self)->Int32);
+}
+
+JB_IlType * JB_IlBuilder_getInt64(JB_IlBuilder * self) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::IlBuilder *>(self)->Int64);
+}
+
+JB_IlType * JB_IlBuilder_getFloat(JB_IlBuilder * self) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::IlBuilder *>(self)->Float);
+}
+
+JB_IlType * JB_IlBuilder_getDouble(JB_IlBuilder * self) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::IlBuilder *>(self)->Double);
+}
+
+JB_IlType * JB_IlBuilder_getAddress(JB_IlBuilder * self) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::IlBuilder *>(self)->Address);
+}
+
+JB_IlType * JB_IlBuilder_getVectorInt8(JB_IlBuilder * self) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::IlBuilder *>(self)->VectorInt8);
+}
+
+JB_IlType * JB_IlBuilder_getVectorInt16(JB_IlBuilder * self) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::IlBuilder *>(self)->VectorInt16);
+}
+
+JB_IlType * JB_IlBuilder_getVectorInt32(JB_IlBuilder * self) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::IlBuilder *>(self)->VectorInt32);
+}
+
+JB_IlType * JB_IlBuilder_getVectorInt64(JB_IlBuilder * self) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::IlBuilder *>(self)->VectorInt64);
+}
+
+JB_IlType * JB_IlBuilder_getVectorFloat(JB_IlBuilder * self) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::IlBuilder *>(self)->VectorFloat);
+}
+
+JB_IlType * JB_IlBuilder_getVectorDouble(JB_IlBuilder * self) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::IlBuilder *>(self)->VectorDouble);
+}
+
+JB_IlType * JB_IlBuilder_getWord(JB_IlBuilder * self) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::IlBuilder *>(self)->Word);
+}
+
+void JB_IlBuilder_setClientCallback_buildIL(JB_IlBuilder * self, JB_IlBuilder_buildILCallback callback) {
+    reinterpret_cast<TR::IlBuilder *>(self)->setClientCallback_buildIL(reinterpret_cast<void *>(callback));
+}
+
+JB_IlBuilder * JB_IlBuilder_OrphanBuilder(JB_IlBuilder * self) {
+    return reinterpret_cast<JB_IlBuilder *>(reinterpret_cast<TR::IlBuilder *>(self)->OrphanBuilder());
+}
+
+JB_BytecodeBuilder * JB_IlBuilder_OrphanBytecodeBuilder(JB_IlBuilder * self, int32_t bcIndex, char * name) {
+    return reinterpret_cast<JB_BytecodeBuilder *>(reinterpret_cast<TR::IlBuilder *>(self)->OrphanBytecodeBuilder(bcIndex, name));
+}
+
+JB_IlValue * JB_IlBuilder_Copy(JB_IlBuilder * self, JB_IlValue * value) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->Copy(reinterpret_cast<TR::IlValue *>(value)));
+}
+
+JB_TypeDictionary * JB_IlBuilder_typeDictionary(JB_IlBuilder * self) {
+    return reinterpret_cast<JB_TypeDictionary *>(reinterpret_cast<TR::IlBuilder *>(self)->typeDictionary());
+}
+
+JB_IlValue * JB_IlBuilder_ConstInteger(JB_IlBuilder * self, JB_IlType * type, int64_t value) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->ConstInteger(reinterpret_cast<TR::IlType *>(type), value));
+}
+
+JB_IlValue * JB_IlBuilder_ConstAddress(JB_IlBuilder * self, void * value) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->ConstAddress(value));
+}
+
+JB_IlValue * JB_IlBuilder_ConstDouble(JB_IlBuilder * self, double value) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->ConstDouble(value));
+}
+
+JB_IlValue * JB_IlBuilder_ConstFloat(JB_IlBuilder * self, float value) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->ConstFloat(value));
+}
+
+JB_IlValue * JB_IlBuilder_ConstInt8(JB_IlBuilder * self, int8_t value) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->ConstInt8(value));
+}
+
+JB_IlValue * JB_IlBuilder_ConstInt16(JB_IlBuilder * self, int16_t value) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->ConstInt16(value));
+}
+
+JB_IlValue * JB_IlBuilder_ConstInt32(JB_IlBuilder * self, int32_t value) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->ConstInt32(value));
+}
+
+JB_IlValue * JB_IlBuilder_ConstInt64(JB_IlBuilder * self, int64_t value) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->ConstInt64(value));
+}
+
+JB_IlValue * JB_IlBuilder_ConstString(JB_IlBuilder * self, char * value) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->ConstString(value));
+}
+
+JB_IlValue * JB_IlBuilder_NullAddress(JB_IlBuilder * self) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->NullAddress());
+}
+
+JB_IlValue * JB_IlBuilder_Add(JB_IlBuilder * self, JB_IlValue * left, JB_IlValue * right) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->Add(reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right)));
+}
+
+JB_IlValue * JB_IlBuilder_AddWithOverflow(JB_IlBuilder * self, JB_IlBuilder ** overflowHandler, JB_IlValue * left, JB_IlValue * right) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->AddWithOverflow(reinterpret_cast<TR::IlBuilder * *>(overflowHandler), reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right)));
+}
+
+JB_IlValue * JB_IlBuilder_AddWithUnsignedOverflow(JB_IlBuilder * self, JB_IlBuilder ** overflowHandler, JB_IlValue * left, JB_IlValue * right) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->AddWithUnsignedOverflow(reinterpret_cast<TR::IlBuilder * *>(overflowHandler), reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right)));
+}
+
+JB_IlValue * JB_IlBuilder_And(JB_IlBuilder * self, JB_IlValue * left, JB_IlValue * right) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->And(reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right)));
+}
+
+JB_IlValue * JB_IlBuilder_Div(JB_IlBuilder * self, JB_IlValue * left, JB_IlValue * right) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->Div(reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right)));
+}
+
+JB_IlValue * JB_IlBuilder_UnsignedDiv(JB_IlBuilder * self, JB_IlValue * left, JB_IlValue * right) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->UnsignedDiv(reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right)));
+}
+
+JB_IlValue * JB_IlBuilder_IndexAt(JB_IlBuilder * self, JB_IlType * dt, JB_IlValue * base, JB_IlValue * index) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->IndexAt(reinterpret_cast<TR::IlType *>(dt), reinterpret_cast<TR::IlValue *>(base), reinterpret_cast<TR::IlValue *>(index)));
+}
+
+JB_IlValue * JB_IlBuilder_Mul(JB_IlBuilder * self, JB_IlValue * left, JB_IlValue * right) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->Mul(reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right)));
+}
+
+JB_IlValue * JB_IlBuilder_MulWithOverflow(JB_IlBuilder * self, JB_IlBuilder ** overflowHandler, JB_IlValue * left, JB_IlValue * right) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->MulWithOverflow(reinterpret_cast<TR::IlBuilder * *>(overflowHandler), reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right)));
+}
+
+JB_IlValue * JB_IlBuilder_Negate(JB_IlBuilder * self, JB_IlValue * v) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->Negate(reinterpret_cast<TR::IlValue *>(v)));
+}
+
+JB_IlValue * JB_IlBuilder_Or(JB_IlBuilder * self, JB_IlValue * left, JB_IlValue * right) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->Or(reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right)));
+}
+
+JB_IlValue * JB_IlBuilder_Rem(JB_IlBuilder * self, JB_IlValue * left, JB_IlValue * right) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->Rem(reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right)));
+}
+
+JB_IlValue * JB_IlBuilder_UnsignedRem(JB_IlBuilder * self, JB_IlValue * left, JB_IlValue * right) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->UnsignedRem(reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right)));
+}
+
+JB_IlValue * JB_IlBuilder_ShiftL(JB_IlBuilder * self, JB_IlValue * left, JB_IlValue * right) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->ShiftL(reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right)));
+}
+
+JB_IlValue * JB_IlBuilder_ShiftR(JB_IlBuilder * self, JB_IlValue * left, JB_IlValue * right) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->ShiftR(reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right)));
+}
+
+JB_IlValue * JB_IlBuilder_Sub(JB_IlBuilder * self, JB_IlValue * left, JB_IlValue * right) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->Sub(reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right)));
+}
+
+JB_IlValue * JB_IlBuilder_SubWithOverflow(JB_IlBuilder * self, JB_IlBuilder ** overflowHandler, JB_IlValue * left, JB_IlValue * right) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->SubWithOverflow(reinterpret_cast<TR::IlBuilder * *>(overflowHandler), reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right)));
+}
+
+JB_IlValue * JB_IlBuilder_SubWithUnsignedOverflow(JB_IlBuilder * self, JB_IlBuilder ** overflowHandler, JB_IlValue * left, JB_IlValue * right) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->SubWithUnsignedOverflow(reinterpret_cast<TR::IlBuilder * *>(overflowHandler), reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right)));
+}
+
+JB_IlValue * JB_IlBuilder_UnsignedShiftR(JB_IlBuilder * self, JB_IlValue * left, JB_IlValue * right) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->UnsignedShiftR(reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right)));
+}
+
+JB_IlValue * JB_IlBuilder_Xor(JB_IlBuilder * self, JB_IlValue * left, JB_IlValue * right) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->Xor(reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right)));
+}
+
+JB_IlValue * JB_IlBuilder_EqualTo(JB_IlBuilder * self, JB_IlValue * left, JB_IlValue * right) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->EqualTo(reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right)));
+}
+
+JB_IlValue * JB_IlBuilder_LessOrEqualTo(JB_IlBuilder * self, JB_IlValue * left, JB_IlValue * right) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->LessOrEqualTo(reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right)));
+}
+
+JB_IlValue * JB_IlBuilder_LessThan(JB_IlBuilder * self, JB_IlValue * left, JB_IlValue * right) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->LessThan(reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right)));
+}
+
+JB_IlValue * JB_IlBuilder_GreaterOrEqualTo(JB_IlBuilder * self, JB_IlValue * left, JB_IlValue * right) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->GreaterOrEqualTo(reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right)));
+}
+
+JB_IlValue * JB_IlBuilder_GreaterThan(JB_IlBuilder * self, JB_IlValue * left, JB_IlValue * right) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->GreaterThan(reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right)));
+}
+
+JB_IlValue * JB_IlBuilder_NotEqualTo(JB_IlBuilder * self, JB_IlValue * left, JB_IlValue * right) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->NotEqualTo(reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right)));
+}
+
+JB_IlValue * JB_IlBuilder_UnsignedLessOrEqualTo(JB_IlBuilder * self, JB_IlValue * left, JB_IlValue * right) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->UnsignedLessOrEqualTo(reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right)));
+}
+
+JB_IlValue * JB_IlBuilder_UnsignedLessThan(JB_IlBuilder * self, JB_IlValue * left, JB_IlValue * right) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->UnsignedLessThan(reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right)));
+}
+
+JB_IlValue * JB_IlBuilder_UnsignedGreaterOrEqualTo(JB_IlBuilder * self, JB_IlValue * left, JB_IlValue * right) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->UnsignedGreaterOrEqualTo(reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right)));
+}
+
+JB_IlValue * JB_IlBuilder_UnsignedGreaterThan(JB_IlBuilder * self, JB_IlValue * left, JB_IlValue * right) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->UnsignedGreaterThan(reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right)));
+}
+
+JB_IlValue * JB_IlBuilder_ConvertBitsTo(JB_IlBuilder * self, JB_IlType * type, JB_IlValue * value) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->ConvertBitsTo(reinterpret_cast<TR::IlType *>(type), reinterpret_cast<TR::IlValue *>(value)));
+}
+
+JB_IlValue * JB_IlBuilder_ConvertTo(JB_IlBuilder * self, JB_IlType * type, JB_IlValue * value) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->ConvertTo(reinterpret_cast<TR::IlType *>(type), reinterpret_cast<TR::IlValue *>(value)));
+}
+
+JB_IlValue * JB_IlBuilder_UnsignedConvertTo(JB_IlBuilder * self, JB_IlType * type, JB_IlValue * value) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->UnsignedConvertTo(reinterpret_cast<TR::IlType *>(type), reinterpret_cast<TR::IlValue *>(value)));
+}
+
+JB_IlValue * JB_IlBuilder_AtomicAdd(JB_IlBuilder * self, JB_IlValue * baseAddress, JB_IlValue * value) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->AtomicAdd(reinterpret_cast<TR::IlValue *>(baseAddress), reinterpret_cast<TR::IlValue *>(value)));
+}
+
+JB_IlValue * JB_IlBuilder_CreateLocalArray(JB_IlBuilder * self, int32_t numElements, JB_IlType * elementType) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->CreateLocalArray(numElements, reinterpret_cast<TR::IlType *>(elementType)));
+}
+
+JB_IlValue * JB_IlBuilder_CreateLocalStruct(JB_IlBuilder * self, JB_IlType * structType) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->CreateLocalStruct(reinterpret_cast<TR::IlType *>(structType)));
+}
+
+JB_IlValue * JB_IlBuilder_Load(JB_IlBuilder * self, const char * name) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->Load(name));
+}
+
+JB_IlValue * JB_IlBuilder_LoadAt(JB_IlBuilder * self, JB_IlType * type, JB_IlValue * address) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->LoadAt(reinterpret_cast<TR::IlType *>(type), reinterpret_cast<TR::IlValue *>(address)));
+}
+
+JB_IlValue * JB_IlBuilder_LoadIndirect(JB_IlBuilder * self, const char * type, const char * field, JB_IlValue * object) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->LoadIndirect(type, field, reinterpret_cast<TR::IlValue *>(object)));
+}
+
+void JB_IlBuilder_Store(JB_IlBuilder * self, const char * name, JB_IlValue * value) {
+    reinterpret_cast<TR::IlBuilder *>(self)->Store(name, reinterpret_cast<TR::IlValue *>(value));
+}
+
+void JB_IlBuilder_StoreAt(JB_IlBuilder * self, JB_IlValue * address, JB_IlValue * value) {
+    reinterpret_cast<TR::IlBuilder *>(self)->StoreAt(reinterpret_cast<TR::IlValue *>(address), reinterpret_cast<TR::IlValue *>(value));
+}
+
+void JB_IlBuilder_StoreIndirect(JB_IlBuilder * self, const char * type, const char * field, JB_IlValue * object, JB_IlValue * value) {
+    reinterpret_cast<TR::IlBuilder *>(self)->StoreIndirect(type, field, reinterpret_cast<TR::IlValue *>(object), reinterpret_cast<TR::IlValue *>(value));
+}
+
+void JB_IlBuilder_StoreOver(JB_IlBuilder * self, JB_IlValue * dest, JB_IlValue * value) {
+    reinterpret_cast<TR::IlBuilder *>(self)->StoreOver(reinterpret_cast<TR::IlValue *>(dest), reinterpret_cast<TR::IlValue *>(value));
+}
+
+void JB_IlBuilder_Transaction(JB_IlBuilder * self, JB_IlBuilder ** persistentFailureBuilder, JB_IlBuilder ** transientFailureBuilder, JB_IlBuilder ** transactionBuilder) {
+    reinterpret_cast<TR::IlBuilder *>(self)->Transaction(reinterpret_cast<TR::IlBuilder * *>(persistentFailureBuilder), reinterpret_cast<TR::IlBuilder * *>(transientFailureBuilder), reinterpret_cast<TR::IlBuilder * *>(transactionBuilder));
+}
+
+void JB_IlBuilder_TransactionAbort(JB_IlBuilder * self) {
+    reinterpret_cast<TR::IlBuilder *>(self)->TransactionAbort();
+}
+
+JB_IlValue * JB_IlBuilder_StructFieldInstanceAddress(JB_IlBuilder * self, const char * structName, const char * fieldName, JB_IlValue * obj) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->StructFieldInstanceAddress(structName, fieldName, reinterpret_cast<TR::IlValue *>(obj)));
+}
+
+JB_IlValue * JB_IlBuilder_UnionFieldInstanceAddress(JB_IlBuilder * self, const char * unionName, const char * fieldName, JB_IlValue * obj) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->UnionFieldInstanceAddress(unionName, fieldName, reinterpret_cast<TR::IlValue *>(obj)));
+}
+
+JB_IlValue * JB_IlBuilder_VectorLoad(JB_IlBuilder * self, char * name) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->VectorLoad(name));
+}
+
+JB_IlValue * JB_IlBuilder_VectorLoadAt(JB_IlBuilder * self, JB_IlType * type, JB_IlValue * address) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->VectorLoadAt(reinterpret_cast<TR::IlType *>(type), reinterpret_cast<TR::IlValue *>(address)));
+}
+
+void JB_IlBuilder_VectorStore(JB_IlBuilder * self, char * name, JB_IlValue * value) {
+    reinterpret_cast<TR::IlBuilder *>(self)->VectorStore(name, reinterpret_cast<TR::IlValue *>(value));
+}
+
+void JB_IlBuilder_VectorStoreAt(JB_IlBuilder * self, JB_IlValue * address, JB_IlValue * value) {
+    reinterpret_cast<TR::IlBuilder *>(self)->VectorStoreAt(reinterpret_cast<TR::IlValue *>(address), reinterpret_cast<TR::IlValue *>(value));
+}
+
+void JB_IlBuilder_AppendBuilder(JB_IlBuilder * self, JB_IlBuilder * b) {
+    reinterpret_cast<TR::IlBuilder *>(self)->AppendBuilder(reinterpret_cast<TR::IlBuilder *>(b));
+}
+
+JB_IlValue * JB_IlBuilder_CallWithArgArray(JB_IlBuilder * self, const char * name, int32_t numArgs, JB_IlValue ** arguments) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->Call(name, numArgs, reinterpret_cast<TR::IlValue * *>(arguments)));
+}
+
+JB_IlValue * JB_IlBuilder_CallMethodBuilder(JB_IlBuilder * self, JB_MethodBuilder * name, int32_t numArgs, JB_IlValue ** arguments) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->Call(reinterpret_cast<TR::MethodBuilder *>(name), numArgs, reinterpret_cast<TR::IlValue * *>(arguments)));
+}
+
+JB_IlValue * JB_IlBuilder_ComputedCallWithArgArray(JB_IlBuilder * self, char * name, int32_t numArgs, JB_IlValue ** arguments) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->ComputedCall(name, numArgs, reinterpret_cast<TR::IlValue * *>(arguments)));
+}
+
+void JB_IlBuilder_DoWhileLoop(JB_IlBuilder * self, char * exitCondition, JB_IlBuilder ** body) {
+    reinterpret_cast<TR::IlBuilder *>(self)->DoWhileLoop(exitCondition, reinterpret_cast<TR::IlBuilder * *>(body));
+}
+
+void JB_IlBuilder_DoWhileLoopWithBreakAndContinue(JB_IlBuilder * self, char * exitCondition, JB_IlBuilder ** body, JB_IlBuilder ** breakBuilder, JB_IlBuilder ** continueBuilder) {
+    reinterpret_cast<TR::IlBuilder *>(self)->DoWhileLoop(exitCondition, reinterpret_cast<TR::IlBuilder * *>(body), reinterpret_cast<TR::IlBuilder * *>(breakBuilder), reinterpret_cast<TR::IlBuilder * *>(continueBuilder));
+}
+
+void JB_IlBuilder_DoWhileLoopWithBreak(JB_IlBuilder * self, char * exitCondition, JB_IlBuilder ** body, JB_IlBuilder ** breakBuilder) {
+    reinterpret_cast<TR::IlBuilder *>(self)->DoWhileLoopWithBreak(exitCondition, reinterpret_cast<TR::IlBuilder * *>(body), reinterpret_cast<TR::IlBuilder * *>(breakBuilder));
+}
+
+void JB_IlBuilder_DoWhileLoopWithContinue(JB_IlBuilder * self, char * exitCondition, JB_IlBuilder ** body, JB_IlBuilder ** continueBuilder) {
+    reinterpret_cast<TR::IlBuilder *>(self)->DoWhileLoopWithContinue(exitCondition, reinterpret_cast<TR::IlBuilder * *>(body), reinterpret_cast<TR::IlBuilder * *>(continueBuilder));
+}
+
+void JB_IlBuilder_Goto(JB_IlBuilder * self, JB_IlBuilder * b) {
+    reinterpret_cast<TR::IlBuilder *>(self)->Goto(reinterpret_cast<TR::IlBuilder *>(b));
+}
+
+void JB_IlBuilder_GotoNew(JB_IlBuilder * self, JB_IlBuilder ** b) {
+    reinterpret_cast<TR::IlBuilder *>(self)->Goto(reinterpret_cast<TR::IlBuilder * *>(b));
+}
+
+JB_IlBuilder_JBCondition * JB_IlBuilder_MakeCondition(JB_IlBuilder * self, JB_IlBuilder * conditionBuilder, JB_IlValue * conditionValue) {
+    return reinterpret_cast<JB_IlBuilder_JBCondition *>(reinterpret_cast<TR::IlBuilder *>(self)->MakeCondition(reinterpret_cast<TR::IlBuilder *>(conditionBuilder), reinterpret_cast<TR::IlValue *>(conditionValue)));
+}
+
+void JB_IlBuilder_IfAndWithArgArray(JB_IlBuilder * self, JB_IlBuilder ** allTrueBuilder, JB_IlBuilder ** anyFalseBuilder, int32_t numTerms, JB_IlBuilder_JBCondition ** terms) {
+    reinterpret_cast<TR::IlBuilder *>(self)->IfAnd(reinterpret_cast<TR::IlBuilder * *>(allTrueBuilder), reinterpret_cast<TR::IlBuilder * *>(anyFalseBuilder), numTerms, reinterpret_cast<TR::IlBuilder::JBCondition * *>(terms));
+}
+
+void JB_IlBuilder_IfCmpEqual(JB_IlBuilder * self, JB_IlBuilder * target, JB_IlValue * left, JB_IlValue * right) {
+    reinterpret_cast<TR::IlBuilder *>(self)->IfCmpEqual(reinterpret_cast<TR::IlBuilder *>(target), reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right));
+}
+
+void JB_IlBuilder_IfCmpEqualNew(JB_IlBuilder * self, JB_IlBuilder ** target, JB_IlValue * left, JB_IlValue * right) {
+    reinterpret_cast<TR::IlBuilder *>(self)->IfCmpEqual(reinterpret_cast<TR::IlBuilder * *>(target), reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right));
+}
+
+void JB_IlBuilder_IfCmpLessOrEqual(JB_IlBuilder * self, JB_IlBuilder * target, JB_IlValue * left, JB_IlValue * right) {
+    reinterpret_cast<TR::IlBuilder *>(self)->IfCmpLessOrEqual(reinterpret_cast<TR::IlBuilder *>(target), reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right));
+}
+
+void JB_IlBuilder_IfCmpLessOrEqualNew(JB_IlBuilder * self, JB_IlBuilder ** target, JB_IlValue * left, JB_IlValue * right) {
+    reinterpret_cast<TR::IlBuilder *>(self)->IfCmpLessOrEqual(reinterpret_cast<TR::IlBuilder * *>(target), reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right));
+}
+
+void JB_IlBuilder_IfCmpLessThan(JB_IlBuilder * self, JB_IlBuilder * target, JB_IlValue * left, JB_IlValue * right) {
+    reinterpret_cast<TR::IlBuilder *>(self)->IfCmpLessThan(reinterpret_cast<TR::IlBuilder *>(target), reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right));
+}
+
+void JB_IlBuilder_IfCmpLessThanNew(JB_IlBuilder * self, JB_IlBuilder ** target, JB_IlValue * left, JB_IlValue * right) {
+    reinterpret_cast<TR::IlBuilder *>(self)->IfCmpLessThan(reinterpret_cast<TR::IlBuilder * *>(target), reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right));
+}
+
+void JB_IlBuilder_IfCmpGreaterOrEqual(JB_IlBuilder * self, JB_IlBuilder * target, JB_IlValue * left, JB_IlValue * right) {
+    reinterpret_cast<TR::IlBuilder *>(self)->IfCmpGreaterOrEqual(reinterpret_cast<TR::IlBuilder *>(target), reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right));
+}
+
+void JB_IlBuilder_IfCmpGreaterOrEqualNew(JB_IlBuilder * self, JB_IlBuilder ** target, JB_IlValue * left, JB_IlValue * right) {
+    reinterpret_cast<TR::IlBuilder *>(self)->IfCmpGreaterOrEqual(reinterpret_cast<TR::IlBuilder * *>(target), reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right));
+}
+
+void JB_IlBuilder_IfCmpGreaterThan(JB_IlBuilder * self, JB_IlBuilder * target, JB_IlValue * left, JB_IlValue * right) {
+    reinterpret_cast<TR::IlBuilder *>(self)->IfCmpGreaterThan(reinterpret_cast<TR::IlBuilder *>(target), reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right));
+}
+
+void JB_IlBuilder_IfCmpGreaterThanNew(JB_IlBuilder * self, JB_IlBuilder ** target, JB_IlValue * left, JB_IlValue * right) {
+    reinterpret_cast<TR::IlBuilder *>(self)->IfCmpGreaterThan(reinterpret_cast<TR::IlBuilder * *>(target), reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right));
+}
+
+void JB_IlBuilder_IfCmpNotEqual(JB_IlBuilder * self, JB_IlBuilder * target, JB_IlValue * left, JB_IlValue * right) {
+    reinterpret_cast<TR::IlBuilder *>(self)->IfCmpNotEqual(reinterpret_cast<TR::IlBuilder *>(target), reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right));
+}
+
+void JB_IlBuilder_IfCmpNotEqualNew(JB_IlBuilder * self, JB_IlBuilder ** target, JB_IlValue * left, JB_IlValue * right) {
+    reinterpret_cast<TR::IlBuilder *>(self)->IfCmpNotEqual(reinterpret_cast<TR::IlBuilder * *>(target), reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right));
+}
+
+void JB_IlBuilder_IfCmpUnsignedLessOrEqual(JB_IlBuilder * self, JB_IlBuilder * target, JB_IlValue * left, JB_IlValue * right) {
+    reinterpret_cast<TR::IlBuilder *>(self)->IfCmpUnsignedLessOrEqual(reinterpret_cast<TR::IlBuilder *>(target), reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right));
+}
+
+void JB_IlBuilder_IfCmpUnsignedLessOrEqualNew(JB_IlBuilder * self, JB_IlBuilder ** target, JB_IlValue * left, JB_IlValue * right) {
+    reinterpret_cast<TR::IlBuilder *>(self)->IfCmpUnsignedLessOrEqual(reinterpret_cast<TR::IlBuilder * *>(target), reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right));
+}
+
+void JB_IlBuilder_IfCmpUnsignedLessThan(JB_IlBuilder * self, JB_IlBuilder * target, JB_IlValue * left, JB_IlValue * right) {
+    reinterpret_cast<TR::IlBuilder *>(self)->IfCmpUnsignedLessThan(reinterpret_cast<TR::IlBuilder *>(target), reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right));
+}
+
+void JB_IlBuilder_IfCmpUnsignedLessThanNew(JB_IlBuilder * self, JB_IlBuilder ** target, JB_IlValue * left, JB_IlValue * right) {
+    reinterpret_cast<TR::IlBuilder *>(self)->IfCmpUnsignedLessThan(reinterpret_cast<TR::IlBuilder * *>(target), reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right));
+}
+
+void JB_IlBuilder_IfCmpUnsignedGreaterOrEqual(JB_IlBuilder * self, JB_IlBuilder * target, JB_IlValue * left, JB_IlValue * right) {
+    reinterpret_cast<TR::IlBuilder *>(self)->IfCmpUnsignedGreaterOrEqual(reinterpret_cast<TR::IlBuilder *>(target), reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right));
+}
+
+void JB_IlBuilder_IfCmpUnsignedGreaterOrEqualNew(JB_IlBuilder * self, JB_IlBuilder ** target, JB_IlValue * left, JB_IlValue * right) {
+    reinterpret_cast<TR::IlBuilder *>(self)->IfCmpUnsignedGreaterOrEqual(reinterpret_cast<TR::IlBuilder * *>(target), reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right));
+}
+
+void JB_IlBuilder_IfCmpUnsignedGreaterThan(JB_IlBuilder * self, JB_IlBuilder * target, JB_IlValue * left, JB_IlValue * right) {
+    reinterpret_cast<TR::IlBuilder *>(self)->IfCmpUnsignedGreaterThan(reinterpret_cast<TR::IlBuilder *>(target), reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right));
+}
+
+void JB_IlBuilder_IfCmpUnsignedGreaterThanNew(JB_IlBuilder * self, JB_IlBuilder ** target, JB_IlValue * left, JB_IlValue * right) {
+    reinterpret_cast<TR::IlBuilder *>(self)->IfCmpUnsignedGreaterThan(reinterpret_cast<TR::IlBuilder * *>(target), reinterpret_cast<TR::IlValue *>(left), reinterpret_cast<TR::IlValue *>(right));
+}
+
+void JB_IlBuilder_IfCmpEqualZero(JB_IlBuilder * self, JB_IlBuilder * target, JB_IlValue * condition) {
+    reinterpret_cast<TR::IlBuilder *>(self)->IfCmpEqualZero(reinterpret_cast<TR::IlBuilder *>(target), reinterpret_cast<TR::IlValue *>(condition));
+}
+
+void JB_IlBuilder_IfCmpEqualZeroNew(JB_IlBuilder * self, JB_IlBuilder ** target, JB_IlValue * condition) {
+    reinterpret_cast<TR::IlBuilder *>(self)->IfCmpEqualZero(reinterpret_cast<TR::IlBuilder * *>(target), reinterpret_cast<TR::IlValue *>(condition));
+}
+
+void JB_IlBuilder_IfCmpNotEqualZero(JB_IlBuilder * self, JB_IlBuilder * target, JB_IlValue * condition) {
+    reinterpret_cast<TR::IlBuilder *>(self)->IfCmpNotEqualZero(reinterpret_cast<TR::IlBuilder *>(target), reinterpret_cast<TR::IlValue *>(condition));
+}
+
+void JB_IlBuilder_IfCmpNotEqualZeroNew(JB_IlBuilder * self, JB_IlBuilder ** target, JB_IlValue * condition) {
+    reinterpret_cast<TR::IlBuilder *>(self)->IfCmpNotEqualZero(reinterpret_cast<TR::IlBuilder * *>(target), reinterpret_cast<TR::IlValue *>(condition));
+}
+
+void JB_IlBuilder_IfOrWithArgArray(JB_IlBuilder * self, JB_IlBuilder ** anyTrueBuilder, JB_IlBuilder ** allFalseBuilder, int32_t numTerms, JB_IlBuilder_JBCondition ** terms) {
+    reinterpret_cast<TR::IlBuilder *>(self)->IfOr(reinterpret_cast<TR::IlBuilder * *>(anyTrueBuilder), reinterpret_cast<TR::IlBuilder * *>(allFalseBuilder), numTerms, reinterpret_cast<TR::IlBuilder::JBCondition * *>(terms));
+}
+
+void JB_IlBuilder_IfThen(JB_IlBuilder * self, JB_IlBuilder ** thenPath, JB_IlValue * condition) {
+    reinterpret_cast<TR::IlBuilder *>(self)->IfThen(reinterpret_cast<TR::IlBuilder * *>(thenPath), reinterpret_cast<TR::IlValue *>(condition));
+}
+
+void JB_IlBuilder_IfThenElse(JB_IlBuilder * self, JB_IlBuilder ** thenPath, JB_IlBuilder ** elsePath, JB_IlValue * condition) {
+    reinterpret_cast<TR::IlBuilder *>(self)->IfThenElse(reinterpret_cast<TR::IlBuilder * *>(thenPath), reinterpret_cast<TR::IlBuilder * *>(elsePath), reinterpret_cast<TR::IlValue *>(condition));
+}
+
+JB_IlValue * JB_IlBuilder_Select(JB_IlBuilder * self, JB_IlValue * condition, JB_IlValue * trueValue, JB_IlValue * falseValue) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::IlBuilder *>(self)->Select(reinterpret_cast<TR::IlValue *>(condition), reinterpret_cast<TR::IlValue *>(trueValue), reinterpret_cast<TR::IlValue *>(falseValue)));
+}
+
+void JB_IlBuilder_ForLoop(JB_IlBuilder * self, bool countsUp, char * indVar, JB_IlBuilder ** body, JB_IlBuilder ** breakBuilder, JB_IlBuilder ** continueBuilder, JB_IlValue * initial, JB_IlValue * iterateWhile, JB_IlValue * increment) {
+    reinterpret_cast<TR::IlBuilder *>(self)->ForLoop(countsUp, indVar, reinterpret_cast<TR::IlBuilder * *>(body), reinterpret_cast<TR::IlBuilder * *>(breakBuilder), reinterpret_cast<TR::IlBuilder * *>(continueBuilder), reinterpret_cast<TR::IlValue *>(initial), reinterpret_cast<TR::IlValue *>(iterateWhile), reinterpret_cast<TR::IlValue *>(increment));
+}
+
+void JB_IlBuilder_ForLoopDown(JB_IlBuilder * self, char * indVar, JB_IlBuilder ** body, JB_IlValue * initial, JB_IlValue * iterateWhile, JB_IlValue * increment) {
+    reinterpret_cast<TR::IlBuilder *>(self)->ForLoopDown(indVar, reinterpret_cast<TR::IlBuilder * *>(body), reinterpret_cast<TR::IlValue *>(initial), reinterpret_cast<TR::IlValue *>(iterateWhile), reinterpret_cast<TR::IlValue *>(increment));
+}
+
+void JB_IlBuilder_ForLoopUp(JB_IlBuilder * self, char * indVar, JB_IlBuilder ** body, JB_IlValue * initial, JB_IlValue * iterateWhile, JB_IlValue * increment) {
+    reinterpret_cast<TR::IlBuilder *>(self)->ForLoopUp(indVar, reinterpret_cast<TR::IlBuilder * *>(body), reinterpret_cast<TR::IlValue *>(initial), reinterpret_cast<TR::IlValue *>(iterateWhile), reinterpret_cast<TR::IlValue *>(increment));
+}
+
+void JB_IlBuilder_ForLoopWithBreak(JB_IlBuilder * self, bool countsUp, char * indVar, JB_IlBuilder ** body, JB_IlBuilder ** breakBuilder, JB_IlValue * initial, JB_IlValue * iterateWhile, JB_IlValue * increment) {
+    reinterpret_cast<TR::IlBuilder *>(self)->ForLoopWithBreak(countsUp, indVar, reinterpret_cast<TR::IlBuilder * *>(body), reinterpret_cast<TR::IlBuilder * *>(breakBuilder), reinterpret_cast<TR::IlValue *>(initial), reinterpret_cast<TR::IlValue *>(iterateWhile), reinterpret_cast<TR::IlValue *>(increment));
+}
+
+void JB_IlBuilder_ForLoopWithContinue(JB_IlBuilder * self, bool countsUp, char * indVar, JB_IlBuilder ** body, JB_IlBuilder ** continueBuilder, JB_IlValue * initial, JB_IlValue * iterateWhile, JB_IlValue * increment) {
+    reinterpret_cast<TR::IlBuilder *>(self)->ForLoopWithContinue(countsUp, indVar, reinterpret_cast<TR::IlBuilder * *>(body), reinterpret_cast<TR::IlBuilder * *>(continueBuilder), reinterpret_cast<TR::IlValue *>(initial), reinterpret_cast<TR::IlValue *>(iterateWhile), reinterpret_cast<TR::IlValue *>(increment));
+}
+
+void JB_IlBuilder_Return(JB_IlBuilder * self) {
+    reinterpret_cast<TR::IlBuilder *>(self)->Return();
+}
+
+void JB_IlBuilder_ReturnValue(JB_IlBuilder * self, JB_IlValue * value) {
+    reinterpret_cast<TR::IlBuilder *>(self)->Return(reinterpret_cast<TR::IlValue *>(value));
+}
+
+void JB_IlBuilder_SwitchWithArgArray(JB_IlBuilder * self, JB_IlValue * selectorValue, JB_IlBuilder ** defaultBuilder, int32_t numCases, JB_IlBuilder_JBCase ** cases) {
+    reinterpret_cast<TR::IlBuilder *>(self)->Switch(reinterpret_cast<TR::IlValue *>(selectorValue), reinterpret_cast<TR::IlBuilder * *>(defaultBuilder), numCases, reinterpret_cast<TR::IlBuilder::JBCase * *>(cases));
+}
+
+void JB_IlBuilder_TableSwitchWithArgArray(JB_IlBuilder * self, JB_IlValue * selectorValue, JB_IlBuilder ** defaultBuilder, bool generateBoundsCheck, int32_t numCases, JB_IlBuilder_JBCase ** cases) {
+    reinterpret_cast<TR::IlBuilder *>(self)->TableSwitch(reinterpret_cast<TR::IlValue *>(selectorValue), reinterpret_cast<TR::IlBuilder * *>(defaultBuilder), generateBoundsCheck, numCases, reinterpret_cast<TR::IlBuilder::JBCase * *>(cases));
+}
+
+JB_IlBuilder_JBCase * JB_IlBuilder_MakeCase(JB_IlBuilder * self, int32_t value, JB_IlBuilder ** builder, int32_t fallsThrough) {
+    return reinterpret_cast<JB_IlBuilder_JBCase *>(reinterpret_cast<TR::IlBuilder *>(self)->MakeCase(value, reinterpret_cast<TR::IlBuilder * *>(builder), fallsThrough));
+}
+
+void JB_IlBuilder_WhileDoLoop(JB_IlBuilder * self, char * exitCondition, JB_IlBuilder ** body) {
+    reinterpret_cast<TR::IlBuilder *>(self)->WhileDoLoop(exitCondition, reinterpret_cast<TR::IlBuilder * *>(body));
+}
+
+void JB_IlBuilder_WhileDoLoopWithBreak(JB_IlBuilder * self, char * exitCondition, JB_IlBuilder ** body, JB_IlBuilder ** breakBuilder) {
+    reinterpret_cast<TR::IlBuilder *>(self)->WhileDoLoopWithBreak(exitCondition, reinterpret_cast<TR::IlBuilder * *>(body), reinterpret_cast<TR::IlBuilder * *>(breakBuilder));
+}
+
+void JB_IlBuilder_WhileDoLoopWithContinue(JB_IlBuilder * self, char * exitCondition, JB_IlBuilder ** body, JB_IlBuilder ** continueBuilder) {
+    reinterpret_cast<TR::IlBuilder *>(self)->WhileDoLoopWithContinue(exitCondition, reinterpret_cast<TR::IlBuilder * *>(body), reinterpret_cast<TR::IlBuilder * *>(continueBuilder));
+}
+
+JB_IlBuilder * JB_MethodBuilder_asIlBuilder(JB_MethodBuilder * self) {
+    return reinterpret_cast<JB_IlBuilder *>(static_cast<TR::IlBuilder *>(reinterpret_cast<TR::MethodBuilder *>(self)));
+}
+
+JB_MethodBuilder * JB_MethodBuilder_new_TypeDictionary(JB_TypeDictionary * dict) {
+    return reinterpret_cast<JB_MethodBuilder *>(::new TR::MethodBuilder(reinterpret_cast<TR::TypeDictionary *>(dict)));
+}
+
+JB_MethodBuilder * JB_MethodBuilder_new_TypeDictionary_VirtualMachineState(JB_TypeDictionary * dict, JB_VirtualMachineState * vmState) {
+    return reinterpret_cast<JB_MethodBuilder *>(::new TR::MethodBuilder(reinterpret_cast<TR::TypeDictionary *>(dict), reinterpret_cast<TR::VirtualMachineState *>(vmState)));
+}
+
+JB_MethodBuilder * JB_MethodBuilder_new_MethodBuilder(JB_MethodBuilder * callerMB) {
+    return reinterpret_cast<JB_MethodBuilder *>(::new TR::MethodBuilder(reinterpret_cast<TR::MethodBuilder *>(callerMB)));
+}
+
+JB_MethodBuilder * JB_MethodBuilder_new_MethodBuilder_VirtualMachineState(JB_MethodBuilder * callerMB, JB_VirtualMachineState * vmState) {
+    return reinterpret_cast<JB_MethodBuilder *>(::new TR::MethodBuilder(reinterpret_cast<TR::MethodBuilder *>(callerMB), reinterpret_cast<TR::VirtualMachineState *>(vmState)));
+}
+
+void JB_MethodBuilder_delete(JB_MethodBuilder * self) {
+    ::delete reinterpret_cast<TR::MethodBuilder *>(self);
+}
+
+void JB_MethodBuilder_setClientCallback_RequestFunction(JB_MethodBuilder * self, JB_MethodBuilder_RequestFunctionCallback callback) {
+    reinterpret_cast<TR::MethodBuilder *>(self)->setClientCallback_RequestFunction(reinterpret_cast<void *>(callback));
+}
+
+void JB_MethodBuilder_AllLocalsHaveBeenDefined(JB_MethodBuilder * self) {
+    reinterpret_cast<TR::MethodBuilder *>(self)->AllLocalsHaveBeenDefined();
+}
+
+void JB_MethodBuilder_AppendBuilder(JB_MethodBuilder * self, JB_IlBuilder * b) {
+    reinterpret_cast<TR::MethodBuilder *>(self)->AppendBuilder(reinterpret_cast<TR::IlBuilder *>(b));
+}
+
+void JB_MethodBuilder_AppendBuilder_BytecodeBuilder(JB_MethodBuilder * self, JB_BytecodeBuilder * b) {
+    reinterpret_cast<TR::MethodBuilder *>(self)->AppendBuilder(reinterpret_cast<TR::BytecodeBuilder *>(b));
+}
+
+void JB_MethodBuilder_AppendBytecodeBuilder(JB_MethodBuilder * self, JB_BytecodeBuilder * b) {
+    reinterpret_cast<TR::MethodBuilder *>(self)->AppendBytecodeBuilder(reinterpret_cast<TR::BytecodeBuilder *>(b));
+}
+
+void JB_MethodBuilder_DefineFile(JB_MethodBuilder * self, const char * fileName) {
+    reinterpret_cast<TR::MethodBuilder *>(self)->DefineFile(fileName);
+}
+
+void JB_MethodBuilder_DefineLineString(JB_MethodBuilder * self, const char * line) {
+    reinterpret_cast<TR::MethodBuilder *>(self)->DefineLine(line);
+}
+
+void JB_MethodBuilder_DefineLineInteger(JB_MethodBuilder * self, int32_t line) {
+    reinterpret_cast<TR::MethodBuilder *>(self)->DefineLine(line);
+}
+
+void JB_MethodBuilder_DefineName(JB_MethodBuilder * self, const char * name) {
+    reinterpret_cast<TR::MethodBuilder *>(self)->DefineName(name);
+}
+
+void JB_MethodBuilder_DefineParameter(JB_MethodBuilder * self, const char * name, JB_IlType * type) {
+    reinterpret_cast<TR::MethodBuilder *>(self)->DefineParameter(name, reinterpret_cast<TR::IlType *>(type));
+}
+
+void JB_MethodBuilder_DefineArrayParameter(JB_MethodBuilder * self, const char * name, JB_IlType * type) {
+    reinterpret_cast<TR::MethodBuilder *>(self)->DefineArrayParameter(name, reinterpret_cast<TR::IlType *>(type));
+}
+
+void JB_MethodBuilder_DefineReturnType(JB_MethodBuilder * self, JB_IlType * type) {
+    reinterpret_cast<TR::MethodBuilder *>(self)->DefineReturnType(reinterpret_cast<TR::IlType *>(type));
+}
+
+void JB_MethodBuilder_DefineLocal(JB_MethodBuilder * self, const char * name, JB_IlType * type) {
+    reinterpret_cast<TR::MethodBuilder *>(self)->DefineLocal(name, reinterpret_cast<TR::IlType *>(type));
+}
+
+void JB_MethodBuilder_DefineGlobal(JB_MethodBuilder * self, const char * name, JB_IlType * type, void * location) {
+    reinterpret_cast<TR::MethodBuilder *>(self)->DefineGlobal(name, reinterpret_cast<TR::IlType *>(type), location);
+}
+
+void JB_MethodBuilder_DefineMemory(JB_MethodBuilder * self, const char * name, JB_IlType * type, void * location) {
+    reinterpret_cast<TR::MethodBuilder *>(self)->DefineMemory(name, reinterpret_cast<TR::IlType *>(type), location);
+}
+
+void JB_MethodBuilder_DefineFunction(JB_MethodBuilder * self, const char * name, const char * fileName, const char * lineNumber, void * entryPoint, JB_IlType * returnType, int32_t numParms, JB_IlType ** parmTypes) {
+    reinterpret_cast<TR::MethodBuilder *>(self)->DefineFunction(name, fileName, lineNumber, entryPoint, reinterpret_cast<TR::IlType *>(returnType), numParms, reinterpret_cast<TR::IlType * *>(parmTypes));
+}
+
+const char * JB_MethodBuilder_GetMethodName(JB_MethodBuilder * self) {
+    return reinterpret_cast<TR::MethodBuilder *>(self)->GetMethodName();
+}
+
+int32_t JB_MethodBuilder_GetNextBytecodeFromWorklist(JB_MethodBuilder * self) {
+    return reinterpret_cast<TR::MethodBuilder *>(self)->GetNextBytecodeFromWorklist();
+}
+
+void JB_MethodBuilder_setVMState(JB_MethodBuilder * self, JB_VirtualMachineState * vmState) {
+    reinterpret_cast<TR::MethodBuilder *>(self)->setVMState(reinterpret_cast<TR::VirtualMachineState *>(vmState));
+}
+
+JB_IlType * JB_IlType_baseType(JB_IlType * self) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::IlType *>(self)->baseType());
+}
+
+const char * JB_IlType_getName(JB_IlType * self) {
+    return reinterpret_cast<TR::IlType *>(self)->getName();
+}
+
+JB_IlType * JB_IlType_primitiveType(JB_IlType * self, JB_TypeDictionary * d) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::IlType *>(self)->primitiveType(reinterpret_cast<TR::TypeDictionary *>(d)));
+}
+
+size_t JB_IlType_getSize(JB_IlType * self) {
+    return reinterpret_cast<TR::IlType *>(self)->getSize();
+}
+
+bool JB_IlType_isPointer(JB_IlType * self) {
+    return reinterpret_cast<TR::IlType *>(self)->isPointer();
+}
+
+int32_t JB_IlValue_getID(JB_IlValue * self) {
+    return reinterpret_cast<TR::IlValue *>(self)->getID();
+}
+
+JB_MethodBuilder * JB_ThunkBuilder_asMethodBuilder(JB_ThunkBuilder * self) {
+    return reinterpret_cast<JB_MethodBuilder *>(static_cast<TR::MethodBuilder *>(reinterpret_cast<TR::ThunkBuilder *>(self)));
+}
+
+JB_IlBuilder * JB_ThunkBuilder_asIlBuilder(JB_ThunkBuilder * self) {
+    return reinterpret_cast<JB_IlBuilder *>(static_cast<TR::IlBuilder *>(reinterpret_cast<TR::ThunkBuilder *>(self)));
+}
+
+JB_ThunkBuilder * JB_ThunkBuilder_new(JB_TypeDictionary * dict, const char * name, JB_IlType * returnType, uint32_t numCalleeParms, JB_IlType ** calleeParms) {
+    return reinterpret_cast<JB_ThunkBuilder *>(::new TR::ThunkBuilder(reinterpret_cast<TR::TypeDictionary *>(dict), name, reinterpret_cast<TR::IlType *>(returnType), numCalleeParms, reinterpret_cast<TR::IlType * *>(calleeParms)));
+}
+
+void JB_ThunkBuilder_delete(JB_ThunkBuilder * self) {
+    ::delete reinterpret_cast<TR::ThunkBuilder *>(self);
+}
+
+JB_TypeDictionary * JB_TypeDictionary_new(void) {
+    return reinterpret_cast<JB_TypeDictionary *>(::new TR::TypeDictionary());
+}
+
+void JB_TypeDictionary_delete(JB_TypeDictionary * self) {
+    ::delete reinterpret_cast<TR::TypeDictionary *>(self);
+}
+
+JB_IlType * JB_TypeDictionary_getNoType(JB_TypeDictionary * self) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::TypeDictionary *>(self)->NoType);
+}
+
+JB_IlType * JB_TypeDictionary_getInt8(JB_TypeDictionary * self) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::TypeDictionary *>(self)->Int8);
+}
+
+JB_IlType * JB_TypeDictionary_getInt16(JB_TypeDictionary * self) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::TypeDictionary *>(self)->Int16);
+}
+
+JB_IlType * JB_TypeDictionary_getInt32(JB_TypeDictionary * self) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::TypeDictionary *>(self)->Int32);
+}
+
+JB_IlType * JB_TypeDictionary_getInt64(JB_TypeDictionary * self) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::TypeDictionary *>(self)->Int64);
+}
+
+JB_IlType * JB_TypeDictionary_getFloat(JB_TypeDictionary * self) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::TypeDictionary *>(self)->Float);
+}
+
+JB_IlType * JB_TypeDictionary_getDouble(JB_TypeDictionary * self) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::TypeDictionary *>(self)->Double);
+}
+
+JB_IlType * JB_TypeDictionary_getAddress(JB_TypeDictionary * self) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::TypeDictionary *>(self)->Address);
+}
+
+JB_IlType * JB_TypeDictionary_getVectorInt8(JB_TypeDictionary * self) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::TypeDictionary *>(self)->VectorInt8);
+}
+
+JB_IlType * JB_TypeDictionary_getVectorInt16(JB_TypeDictionary * self) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::TypeDictionary *>(self)->VectorInt16);
+}
+
+JB_IlType * JB_TypeDictionary_getVectorInt32(JB_TypeDictionary * self) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::TypeDictionary *>(self)->VectorInt32);
+}
+
+JB_IlType * JB_TypeDictionary_getVectorInt64(JB_TypeDictionary * self) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::TypeDictionary *>(self)->VectorInt64);
+}
+
+JB_IlType * JB_TypeDictionary_getVectorFloat(JB_TypeDictionary * self) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::TypeDictionary *>(self)->VectorFloat);
+}
+
+JB_IlType * JB_TypeDictionary_getVectorDouble(JB_TypeDictionary * self) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::TypeDictionary *>(self)->VectorDouble);
+}
+
+JB_IlType * JB_TypeDictionary_getWord(JB_TypeDictionary * self) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::TypeDictionary *>(self)->Word);
+}
+
+JB_IlType * JB_TypeDictionary_getpNoType(JB_TypeDictionary * self) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::TypeDictionary *>(self)->pNoType);
+}
+
+JB_IlType * JB_TypeDictionary_getpInt8(JB_TypeDictionary * self) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::TypeDictionary *>(self)->pInt8);
+}
+
+JB_IlType * JB_TypeDictionary_getpInt16(JB_TypeDictionary * self) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::TypeDictionary *>(self)->pInt16);
+}
+
+JB_IlType * JB_TypeDictionary_getpInt32(JB_TypeDictionary * self) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::TypeDictionary *>(self)->pInt32);
+}
+
+JB_IlType * JB_TypeDictionary_getpInt64(JB_TypeDictionary * self) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::TypeDictionary *>(self)->pInt64);
+}
+
+JB_IlType * JB_TypeDictionary_getpFloat(JB_TypeDictionary * self) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::TypeDictionary *>(self)->pFloat);
+}
+
+JB_IlType * JB_TypeDictionary_getpDouble(JB_TypeDictionary * self) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::TypeDictionary *>(self)->pDouble);
+}
+
+JB_IlType * JB_TypeDictionary_getpAddress(JB_TypeDictionary * self) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::TypeDictionary *>(self)->pAddress);
+}
+
+JB_IlType * JB_TypeDictionary_getpVectorInt8(JB_TypeDictionary * self) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::TypeDictionary *>(self)->pVectorInt8);
+}
+
+JB_IlType * JB_TypeDictionary_getpVectorInt16(JB_TypeDictionary * self) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::TypeDictionary *>(self)->pVectorInt16);
+}
+
+JB_IlType * JB_TypeDictionary_getpVectorInt32(JB_TypeDictionary * self) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::TypeDictionary *>(self)->pVectorInt32);
+}
+
+JB_IlType * JB_TypeDictionary_getpVectorInt64(JB_TypeDictionary * self) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::TypeDictionary *>(self)->pVectorInt64);
+}
+
+JB_IlType * JB_TypeDictionary_getpVectorFloat(JB_TypeDictionary * self) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::TypeDictionary *>(self)->pVectorFloat);
+}
+
+JB_IlType * JB_TypeDictionary_getpVectorDouble(JB_TypeDictionary * self) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::TypeDictionary *>(self)->pVectorDouble);
+}
+
+JB_IlType * JB_TypeDictionary_getpWord(JB_TypeDictionary * self) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::TypeDictionary *>(self)->pWord);
+}
+
+void JB_TypeDictionary_CloseStruct(JB_TypeDictionary * self, const char * structName) {
+    reinterpret_cast<TR::TypeDictionary *>(self)->CloseStruct(structName);
+}
+
+void JB_TypeDictionary_CloseStructWithSize(JB_TypeDictionary * self, const char * structName, size_t size) {
+    reinterpret_cast<TR::TypeDictionary *>(self)->CloseStruct(structName, size);
+}
+
+void JB_TypeDictionary_CloseUnion(JB_TypeDictionary * self, const char * unionName) {
+    reinterpret_cast<TR::TypeDictionary *>(self)->CloseUnion(unionName);
+}
+
+void JB_TypeDictionary_DefineField(JB_TypeDictionary * self, const char * structName, const char * fieldName, JB_IlType * type) {
+    reinterpret_cast<TR::TypeDictionary *>(self)->DefineField(structName, fieldName, reinterpret_cast<TR::IlType *>(type));
+}
+
+void JB_TypeDictionary_DefineFieldAtOffset(JB_TypeDictionary * self, const char * structName, const char * fieldName, JB_IlType * type, size_t offset) {
+    reinterpret_cast<TR::TypeDictionary *>(self)->DefineField(structName, fieldName, reinterpret_cast<TR::IlType *>(type), offset);
+}
+
+JB_IlType * JB_TypeDictionary_DefineStruct(JB_TypeDictionary * self, const char * structName) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::TypeDictionary *>(self)->DefineStruct(structName));
+}
+
+JB_IlType * JB_TypeDictionary_DefineUnion(JB_TypeDictionary * self, const char * unionName) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::TypeDictionary *>(self)->DefineUnion(unionName));
+}
+
+JB_IlType * JB_TypeDictionary_GetFieldType(JB_TypeDictionary * self, const char * structName, const char * fieldName) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::TypeDictionary *>(self)->GetFieldType(structName, fieldName));
+}
+
+JB_IlType * JB_TypeDictionary_LookupStruct(JB_TypeDictionary * self, const char * structName) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::TypeDictionary *>(self)->LookupStruct(structName));
+}
+
+JB_IlType * JB_TypeDictionary_LookupUnion(JB_TypeDictionary * self, const char * unionName) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::TypeDictionary *>(self)->LookupUnion(unionName));
+}
+
+size_t JB_TypeDictionary_OffsetOf(JB_TypeDictionary * self, const char * structName, const char * fieldName) {
+    return reinterpret_cast<TR::TypeDictionary *>(self)->OffsetOf(structName, fieldName);
+}
+
+JB_IlType * JB_TypeDictionary_PointerTo(JB_TypeDictionary * self, JB_IlType * baseType) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::TypeDictionary *>(self)->PointerTo(reinterpret_cast<TR::IlType *>(baseType)));
+}
+
+JB_IlType * JB_TypeDictionary_PointerToStructName(JB_TypeDictionary * self, const char * structName) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::TypeDictionary *>(self)->PointerTo(structName));
+}
+
+void JB_TypeDictionary_UnionField(JB_TypeDictionary * self, const char * unionName, const char * fieldName, JB_IlType * fieldType) {
+    reinterpret_cast<TR::TypeDictionary *>(self)->UnionField(unionName, fieldName, reinterpret_cast<TR::IlType *>(fieldType));
+}
+
+JB_IlType * JB_TypeDictionary_UnionFieldType(JB_TypeDictionary * self, const char * unionName, const char * fieldName) {
+    return reinterpret_cast<JB_IlType *>(reinterpret_cast<TR::TypeDictionary *>(self)->UnionFieldType(unionName, fieldName));
+}
+
+JB_VirtualMachineState * JB_VirtualMachineOperandArray_asVirtualMachineState(JB_VirtualMachineOperandArray * self) {
+    return reinterpret_cast<JB_VirtualMachineState *>(static_cast<TR::VirtualMachineState *>(reinterpret_cast<TR::VirtualMachineOperandArray *>(self)));
+}
+
+JB_VirtualMachineOperandArray * JB_VirtualMachineOperandArray_new_MethodBuilder_int32_IlType_VirtualMachineRegister(JB_MethodBuilder * mb, int32_t numOfElements, JB_IlType * elementType, JB_VirtualMachineRegister * arrayBase) {
+    return reinterpret_cast<JB_VirtualMachineOperandArray *>(::new TR::VirtualMachineOperandArray(reinterpret_cast<TR::MethodBuilder *>(mb), numOfElements, reinterpret_cast<TR::IlType *>(elementType), reinterpret_cast<TR::VirtualMachineRegister *>(arrayBase)));
+}
+
+JB_VirtualMachineOperandArray * JB_VirtualMachineOperandArray_new_VirtualMachineOperandArray(JB_VirtualMachineOperandArray * other) {
+    return reinterpret_cast<JB_VirtualMachineOperandArray *>(::new TR::VirtualMachineOperandArray(reinterpret_cast<TR::VirtualMachineOperandArray *>(other)));
+}
+
+void JB_VirtualMachineOperandArray_delete(JB_VirtualMachineOperandArray * self) {
+    ::delete reinterpret_cast<TR::VirtualMachineOperandArray *>(self);
+}
+
+void JB_VirtualMachineOperandArray_setClientCallback_Commit(JB_VirtualMachineOperandArray * self, JB_VirtualMachineOperandArray_CommitCallback callback) {
+    reinterpret_cast<TR::VirtualMachineOperandArray *>(self)->setClientCallback_Commit(reinterpret_cast<void *>(callback));
+}
+
+void JB_VirtualMachineOperandArray_setClientCallback_Reload(JB_VirtualMachineOperandArray * self, JB_VirtualMachineOperandArray_ReloadCallback callback) {
+    reinterpret_cast<TR::VirtualMachineOperandArray *>(self)->setClientCallback_Reload(reinterpret_cast<void *>(callback));
+}
+
+void JB_VirtualMachineOperandArray_setClientCallback_MakeCopy(JB_VirtualMachineOperandArray * self, JB_VirtualMachineOperandArray_MakeCopyCallback callback) {
+    reinterpret_cast<TR::VirtualMachineOperandArray *>(self)->setClientCallback_MakeCopy(reinterpret_cast<void *>(callback));
+}
+
+void JB_VirtualMachineOperandArray_setClientCallback_MergeInto(JB_VirtualMachineOperandArray * self, JB_VirtualMachineOperandArray_MergeIntoCallback callback) {
+    reinterpret_cast<TR::VirtualMachineOperandArray *>(self)->setClientCallback_MergeInto(reinterpret_cast<void *>(callback));
+}
+
+JB_IlValue * JB_VirtualMachineOperandArray_Get(JB_VirtualMachineOperandArray * self, int32_t index) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::VirtualMachineOperandArray *>(self)->Get(index));
+}
+
+void JB_VirtualMachineOperandArray_Move(JB_VirtualMachineOperandArray * self, JB_IlBuilder * b, int32_t dstIndex, int32_t srcIndex) {
+    reinterpret_cast<TR::VirtualMachineOperandArray *>(self)->Move(reinterpret_cast<TR::IlBuilder *>(b), dstIndex, srcIndex);
+}
+
+void JB_VirtualMachineOperandArray_Set(JB_VirtualMachineOperandArray * self, int32_t index, JB_IlValue * value) {
+    reinterpret_cast<TR::VirtualMachineOperandArray *>(self)->Set(index, reinterpret_cast<TR::IlValue *>(value));
+}
+
+void JB_VirtualMachineOperandArray_UpdateArray(JB_VirtualMachineOperandArray * self, JB_IlBuilder * b, JB_IlValue * array) {
+    reinterpret_cast<TR::VirtualMachineOperandArray *>(self)->UpdateArray(reinterpret_cast<TR::IlBuilder *>(b), reinterpret_cast<TR::IlValue *>(array));
+}
+
+JB_VirtualMachineState * JB_VirtualMachineOperandStack_asVirtualMachineState(JB_VirtualMachineOperandStack * self) {
+    return reinterpret_cast<JB_VirtualMachineState *>(static_cast<TR::VirtualMachineState *>(reinterpret_cast<TR::VirtualMachineOperandStack *>(self)));
+}
+
+JB_VirtualMachineOperandStack * JB_VirtualMachineOperandStack_new_MethodBuilder_int32_IlType_VirtualMachineRegister(JB_MethodBuilder * mb, int32_t sizeHint, JB_IlType * elementType, JB_VirtualMachineRegister * stackTopRegister) {
+    return reinterpret_cast<JB_VirtualMachineOperandStack *>(::new TR::VirtualMachineOperandStack(reinterpret_cast<TR::MethodBuilder *>(mb), sizeHint, reinterpret_cast<TR::IlType *>(elementType), reinterpret_cast<TR::VirtualMachineRegister *>(stackTopRegister)));
+}
+
+JB_VirtualMachineOperandStack * JB_VirtualMachineOperandStack_new_MethodBuilder_int32_IlType_VirtualMachineRegister_boolean(JB_MethodBuilder * mb, int32_t sizeHint, JB_IlType * elementType, JB_VirtualMachineRegister * stackTopRegister, bool growsUp) {
+    return reinterpret_cast<JB_VirtualMachineOperandStack *>(::new TR::VirtualMachineOperandStack(reinterpret_cast<TR::MethodBuilder *>(mb), sizeHint, reinterpret_cast<TR::IlType *>(elementType), reinterpret_cast<TR::VirtualMachineRegister *>(stackTopRegister), growsUp));
+}
+
+JB_VirtualMachineOperandStack * JB_VirtualMachineOperandStack_new_MethodBuilder_int32_IlType_VirtualMachineRegister_boolean_int32(JB_MethodBuilder * mb, int32_t sizeHint, JB_IlType * elementType, JB_VirtualMachineRegister * stackTopRegister, bool growsUp, int32_t stackInitialOffset) {
+    return reinterpret_cast<JB_VirtualMachineOperandStack *>(::new TR::VirtualMachineOperandStack(reinterpret_cast<TR::MethodBuilder *>(mb), sizeHint, reinterpret_cast<TR::IlType *>(elementType), reinterpret_cast<TR::VirtualMachineRegister *>(stackTopRegister), growsUp, stackInitialOffset));
+}
+
+void JB_VirtualMachineOperandStack_delete(JB_VirtualMachineOperandStack * self) {
+    ::delete reinterpret_cast<TR::VirtualMachineOperandStack *>(self);
+}
+
+void JB_VirtualMachineOperandStack_setClientCallback_Commit(JB_VirtualMachineOperandStack * self, JB_VirtualMachineOperandStack_CommitCallback callback) {
+    reinterpret_cast<TR::VirtualMachineOperandStack *>(self)->setClientCallback_Commit(reinterpret_cast<void *>(callback));
+}
+
+void JB_VirtualMachineOperandStack_setClientCallback_Reload(JB_VirtualMachineOperandStack * self, JB_VirtualMachineOperandStack_ReloadCallback callback) {
+    reinterpret_cast<TR::VirtualMachineOperandStack *>(self)->setClientCallback_Reload(reinterpret_cast<void *>(callback));
+}
+
+void JB_VirtualMachineOperandStack_setClientCallback_MakeCopy(JB_VirtualMachineOperandStack * self, JB_VirtualMachineOperandStack_MakeCopyCallback callback) {
+    reinterpret_cast<TR::VirtualMachineOperandStack *>(self)->setClientCallback_MakeCopy(reinterpret_cast<void *>(callback));
+}
+
+void JB_VirtualMachineOperandStack_setClientCallback_MergeInto(JB_VirtualMachineOperandStack * self, JB_VirtualMachineOperandStack_MergeIntoCallback callback) {
+    reinterpret_cast<TR::VirtualMachineOperandStack *>(self)->setClientCallback_MergeInto(reinterpret_cast<void *>(callback));
+}
+
+void JB_VirtualMachineOperandStack_Drop(JB_VirtualMachineOperandStack * self, JB_IlBuilder * b, int32_t depth) {
+    reinterpret_cast<TR::VirtualMachineOperandStack *>(self)->Drop(reinterpret_cast<TR::IlBuilder *>(b), depth);
+}
+
+void JB_VirtualMachineOperandStack_Dup(JB_VirtualMachineOperandStack * self, JB_IlBuilder * b) {
+    reinterpret_cast<TR::VirtualMachineOperandStack *>(self)->Dup(reinterpret_cast<TR::IlBuilder *>(b));
+}
+
+JB_IlValue * JB_VirtualMachineOperandStack_Pick(JB_VirtualMachineOperandStack * self, int32_t depth) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::VirtualMachineOperandStack *>(self)->Pick(depth));
+}
+
+JB_IlValue * JB_VirtualMachineOperandStack_Pop(JB_VirtualMachineOperandStack * self, JB_IlBuilder * b) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::VirtualMachineOperandStack *>(self)->Pop(reinterpret_cast<TR::IlBuilder *>(b)));
+}
+
+void JB_VirtualMachineOperandStack_Push(JB_VirtualMachineOperandStack * self, JB_IlBuilder * b, JB_IlValue * value) {
+    reinterpret_cast<TR::VirtualMachineOperandStack *>(self)->Push(reinterpret_cast<TR::IlBuilder *>(b), reinterpret_cast<TR::IlValue *>(value));
+}
+
+JB_IlValue * JB_VirtualMachineOperandStack_Top(JB_VirtualMachineOperandStack * self) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::VirtualMachineOperandStack *>(self)->Top());
+}
+
+void JB_VirtualMachineOperandStack_UpdateStack(JB_VirtualMachineOperandStack * self, JB_IlBuilder * b, JB_IlValue * array) {
+    reinterpret_cast<TR::VirtualMachineOperandStack *>(self)->UpdateStack(reinterpret_cast<TR::IlBuilder *>(b), reinterpret_cast<TR::IlValue *>(array));
+}
+
+JB_VirtualMachineState * JB_VirtualMachineRegister_asVirtualMachineState(JB_VirtualMachineRegister * self) {
+    return reinterpret_cast<JB_VirtualMachineState *>(static_cast<TR::VirtualMachineState *>(reinterpret_cast<TR::VirtualMachineRegister *>(self)));
+}
+
+JB_VirtualMachineRegister * JB_VirtualMachineRegister_new(JB_IlBuilder * b, const char * localName, JB_IlType * pointerToRegisterType, uint32_t adjustByStep, JB_IlValue * addressOfRegister) {
+    return reinterpret_cast<JB_VirtualMachineRegister *>(::new TR::VirtualMachineRegister(reinterpret_cast<TR::IlBuilder *>(b), localName, reinterpret_cast<TR::IlType *>(pointerToRegisterType), adjustByStep, reinterpret_cast<TR::IlValue *>(addressOfRegister)));
+}
+
+void JB_VirtualMachineRegister_delete(JB_VirtualMachineRegister * self) {
+    ::delete reinterpret_cast<TR::VirtualMachineRegister *>(self);
+}
+
+void JB_VirtualMachineRegister_setClientCallback_Commit(JB_VirtualMachineRegister * self, JB_VirtualMachineRegister_CommitCallback callback) {
+    reinterpret_cast<TR::VirtualMachineRegister *>(self)->setClientCallback_Commit(reinterpret_cast<void *>(callback));
+}
+
+void JB_VirtualMachineRegister_setClientCallback_Reload(JB_VirtualMachineRegister * self, JB_VirtualMachineRegister_ReloadCallback callback) {
+    reinterpret_cast<TR::VirtualMachineRegister *>(self)->setClientCallback_Reload(reinterpret_cast<void *>(callback));
+}
+
+void JB_VirtualMachineRegister_setClientCallback_MakeCopy(JB_VirtualMachineRegister * self, JB_VirtualMachineRegister_MakeCopyCallback callback) {
+    reinterpret_cast<TR::VirtualMachineRegister *>(self)->setClientCallback_MakeCopy(reinterpret_cast<void *>(callback));
+}
+
+void JB_VirtualMachineRegister_Adjust(JB_VirtualMachineRegister * self, JB_IlBuilder * b, JB_IlValue * amount) {
+    reinterpret_cast<TR::VirtualMachineRegister *>(self)->Adjust(reinterpret_cast<TR::IlBuilder *>(b), reinterpret_cast<TR::IlValue *>(amount));
+}
+
+void JB_VirtualMachineRegister_AdjustByConst(JB_VirtualMachineRegister * self, JB_IlBuilder * b, size_t amount) {
+    reinterpret_cast<TR::VirtualMachineRegister *>(self)->Adjust(reinterpret_cast<TR::IlBuilder *>(b), amount);
+}
+
+JB_IlValue * JB_VirtualMachineRegister_Load(JB_VirtualMachineRegister * self, JB_IlBuilder * b) {
+    return reinterpret_cast<JB_IlValue *>(reinterpret_cast<TR::VirtualMachineRegister *>(self)->Load(reinterpret_cast<TR::IlBuilder *>(b)));
+}
+
+void JB_VirtualMachineRegister_Store(JB_VirtualMachineRegister * self, JB_IlBuilder * b, JB_IlValue * value) {
+    reinterpret_cast<TR::VirtualMachineRegister *>(self)->Store(reinterpret_cast<TR::IlBuilder *>(b), reinterpret_cast<TR::IlValue *>(value));
+}
+
+JB_VirtualMachineRegister * JB_VirtualMachineRegisterInStruct_asVirtualMachineRegister(JB_VirtualMachineRegisterInStruct * self) {
+    return reinterpret_cast<JB_VirtualMachineRegister *>(static_cast<TR::VirtualMachineRegister *>(reinterpret_cast<TR::VirtualMachineRegisterInStruct *>(self)));
+}
+
+JB_VirtualMachineState * JB_VirtualMachineRegisterInStruct_asVirtualMachineState(JB_VirtualMachineRegisterInStruct * self) {
+    return reinterpret_cast<JB_VirtualMachineState *>(static_cast<TR::VirtualMachineState *>(reinterpret_cast<TR::VirtualMachineRegisterInStruct *>(self)));
+}
+
+JB_VirtualMachineRegisterInStruct * JB_VirtualMachineRegisterInStruct_new(JB_IlBuilder * b, const char * structName, const char * localNameHoldingStructAddress, const char * fieldName, const char * localName) {
+    return reinterpret_cast<JB_VirtualMachineRegisterInStruct *>(::new TR::VirtualMachineRegisterInStruct(reinterpret_cast<TR::IlBuilder *>(b), structName, localNameHoldingStructAddress, fieldName, localName));
+}
+
+void JB_VirtualMachineRegisterInStruct_delete(JB_VirtualMachineRegisterInStruct * self) {
+    ::delete reinterpret_cast<TR::VirtualMachineRegisterInStruct *>(self);
+}
+
+void JB_VirtualMachineRegisterInStruct_setClientCallback_Commit(JB_VirtualMachineRegisterInStruct * self, JB_VirtualMachineRegisterInStruct_CommitCallback callback) {
+    reinterpret_cast<TR::VirtualMachineRegisterInStruct *>(self)->setClientCallback_Commit(reinterpret_cast<void *>(callback));
+}
+
+void JB_VirtualMachineRegisterInStruct_setClientCallback_Reload(JB_VirtualMachineRegisterInStruct * self, JB_VirtualMachineRegisterInStruct_ReloadCallback callback) {
+    reinterpret_cast<TR::VirtualMachineRegisterInStruct *>(self)->setClientCallback_Reload(reinterpret_cast<void *>(callback));
+}
+
+void JB_VirtualMachineRegisterInStruct_setClientCallback_MakeCopy(JB_VirtualMachineRegisterInStruct * self, JB_VirtualMachineRegisterInStruct_MakeCopyCallback callback) {
+    reinterpret_cast<TR::VirtualMachineRegisterInStruct *>(self)->setClientCallback_MakeCopy(reinterpret_cast<void *>(callback));
+}
+
+JB_VirtualMachineState * JB_VirtualMachineState_new(void) {
+    return reinterpret_cast<JB_VirtualMachineState *>(::new TR::VirtualMachineState());
+}
+
+void JB_VirtualMachineState_delete(JB_VirtualMachineState * self) {
+    ::delete reinterpret_cast<TR::VirtualMachineState *>(self);
+}
+
+void JB_VirtualMachineState_setClientCallback_Commit(JB_VirtualMachineState * self, JB_VirtualMachineState_CommitCallback callback) {
+    reinterpret_cast<TR::VirtualMachineState *>(self)->setClientCallback_Commit(reinterpret_cast<void *>(callback));
+}
+
+void JB_VirtualMachineState_setClientCallback_Reload(JB_VirtualMachineState * self, JB_VirtualMachineState_ReloadCallback callback) {
+    reinterpret_cast<TR::VirtualMachineState *>(self)->setClientCallback_Reload(reinterpret_cast<void *>(callback));
+}
+
+void JB_VirtualMachineState_setClientCallback_MakeCopy(JB_VirtualMachineState * self, JB_VirtualMachineState_MakeCopyCallback callback) {
+    reinterpret_cast<TR::VirtualMachineState *>(self)->setClientCallback_MakeCopy(reinterpret_cast<void *>(callback));
+}
+
+void JB_VirtualMachineState_setClientCallback_MergeInto(JB_VirtualMachineState * self, JB_VirtualMachineState_MergeIntoCallback callback) {
+    reinterpret_cast<TR::VirtualMachineState *>(self)->setClientCallback_MergeInto(reinterpret_cast<void *>(callback));
+}
+
+bool JB_initializeJit(void) {
+    if (!setAllocators()) {
+        return false;
+    }
+    return internal_initializeJit();
+}
+
+bool JB_initializeJitWithOptions(char * options) {
+    if (!setAllocators()) {
+        return false;
+    }
+    return internal_initializeJitWithOptions(options);
+}
+
+int32_t JB_compileMethodBuilder(JB_MethodBuilder * methodBuilder, void ** entryPoint) {
+    return internal_compileMethodBuilder(reinterpret_cast<TR::MethodBuilder *>(methodBuilder), entryPoint);
+}
+
+void JB_shutdownJit(void) {
+    internal_shutdownJit();
+}
+
+} // extern "C"
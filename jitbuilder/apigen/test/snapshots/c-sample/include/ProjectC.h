@@ -0,0 +1,63 @@
+/*******************************************************************************
+ * Copyright (c) 2026, 2026 IBM Corp. and others
+ *
+ * This program and the accompanying materials are made available under
+ * the terms of the Eclipse Public License 2.0 which accompanies this
+ * distribution and is available at http://eclipse.org/legal/epl-2.0
+ * or the Apache License, Version 2.0 which accompanies this distribution
+ * and is available at https://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * This Source Code may also be made available under the following Secondary
+ * Licenses when the conditions for such availability set forth in the
+ * Eclipse Public License, v. 2.0 are satisfied: GNU General Public License,
+ * version 2 with the GNU Classpath Exception [1] and GNU General Public
+ * License, version 2 with the OpenJDK Assembly Exception [2].
+ *
+ * [1] https://www.gnu.org/software/classpath/license.html
+ * [2] http://openjdk.java.net/legal/assembly-exception.html
+ *
+ * SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+ *******************************************************************************/
+        
+#ifndef ProjectC_INCL
+#define ProjectC_INCL
+
+#include <stdbool.h>
+#include <stddef.h>
+#include <stdint.h>
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* opaque handles for all API classes */
+typedef struct JB_class_1_class_1_inner_class_1 JB_class_1_class_1_inner_class_1;
+typedef struct JB_class_1 JB_class_1;
+typedef struct JB_class_2 JB_class_2;
+
+/* JB_class_1_class_1_inner_class_1 */
+JB_class_1_class_1_inner_class_1 * JB_class_1_class_1_inner_class_1_new(void);
+void JB_class_1_class_1_inner_class_1_delete(JB_class_1_class_1_inner_class_1 * self);
+
+/* JB_class_1 */
+typedef bool (*JB_class_1_class_1_callback_1Callback)(JB_class_1 * self, bool class_1_callback_1_parm);
+JB_class_1 * JB_class_1_new(void);
+void JB_class_1_delete(JB_class_1 * self);
+float JB_class_1_getclass_1_field_1(JB_class_1 * self);
+double JB_class_1_getclass_1_field_2(JB_class_1 * self);
+void JB_class_1_setClientCallback_class_1_callback_1(JB_class_1 * self, JB_class_1_class_1_callback_1Callback callback);
+const char * JB_class_1_class_1_service_1(JB_class_1 * self, const char * class_1_service_1_parm);
+void JB_class_1_class_1_service_2overload(JB_class_1 * self);
+
+/* JB_class_2 */
+JB_class_1 * JB_class_2_asclass_1(JB_class_2 * self);
+JB_class_2 * JB_class_2_new(void);
+void JB_class_2_delete(JB_class_2 * self);
+
+void JB_Project_service_1(int16_t Project_service_1_parm_1, void ** Project_service_1_parm_2, double* Project_service_1_parm_3);
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+
+#endif /* ProjectC_INCL */
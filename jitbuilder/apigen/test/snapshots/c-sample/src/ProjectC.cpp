@@ -0,0 +1,106 @@
+/*******************************************************************************
+ * Copyright (c) 2026, 2026 IBM Corp. and others
+ *
+ * This program and the accompanying materials are made available under
+ * the terms of the Eclipse Public License 2.0 which accompanies this
+ * distribution and is available at http://eclipse.org/legal/epl-2.0
+ * or the Apache License, Version 2.0 which accompanies this distribution
+ * and is available at https://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * This Source Code may also be made available under the following Secondary
+ * Licenses when the conditions for such availability set forth in the
+ * Eclipse Public License, v. 2.0 are satisfied: GNU General Public License,
+ * version 2 with the GNU Classpath Exception [1] and GNU General Public
+ * License, version 2 with the OpenJDK Assembly Exception [2].
+ *
+ * [1] https://www.gnu.org/software/classpath/license.html
+ * [2] http://openjdk.java.net/legal/assembly-exception.html
+ *
+ * SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+ *******************************************************************************/
+        
+#include "ilgen/class_1.hpp"
+#include "ilgen/class_2.hpp"
+#include "<output>/include/ProjectC.h"
+
+extern void internal_Project_service_1(int16_t Project_service_1_parm_1, void ** Project_service_1_parm_2, double* Project_service_1_parm_3);
+
+extern bool internal_claimClientAllocators(const char * clientAPI);
+
+static void * getSelf(void * impl) {
+    return impl;
+}
+
+static bool registerAllocators() {
+    if (!internal_claimClientAllocators("C")) {
+        return false;
+    }
+    TR::class_1::class_1_inner_class_1::setClientAllocator(getSelf);
+    TR::class_1::class_1_inner_class_1::setGetImpl(getSelf);
+    TR::class_1::setClientAllocator(getSelf);
+    TR::class_1::setGetImpl(getSelf);
+    TR::class_2::setClientAllocator(getSelf);
+    TR::class_2::setGetImpl(getSelf);
+    return true;
+}
+
+static bool setAllocators() {
+    static const bool allocatorsSet = registerAllocators();
+    return allocatorsSet;
+}
+
+extern "C" {
+
+JB_class_1_class_1_inner_class_1 * JB_class_1_class_1_inner_class_1_new(void) {
+    return reinterpret_cast<JB_class_1_class_1_inner_class_1 *>(::new TR::class_1::class_1_inner_class_1());
+}
+
+void JB_class_1_class_1_inner_class_1_delete(JB_class_1_class_1_inner_class_1 * self) {
+    ::delete reinterpret_cast<TR::class_1::class_1_inner_class_1 *>(self);
+}
+
+JB_class_1 * JB_class_1_new(void) {
+    return reinterpret_cast<JB_class_1 *>(::new TR::class_1());
+}
+
+void JB_class_1_delete(JB_class_1 * self) {
+    ::delete reinterpret_cast<TR::class_1 *>(self);
+}
+
+float JB_class_1_getclass_1_field_1(JB_class_1 * self) {
+    return reinterpret_cast<TR::class_1 *>(self)->class_1_field_1;
+}
+
+double JB_class_1_getclass_1_field_2(JB_class_1 * self) {
+    return reinterpret_cast<TR::class_1 *>(self)->class_1_field_2;
+}
+
+void JB_class_1_setClientCallback_class_1_callback_1(JB_class_1 * self, JB_class_1_class_1_callback_1Callback callback) {
+    reinterpret_cast<TR::class_1 *>(self)->setClientCallback_class_1_callback_1(reinterpret_cast<void *>(callback));
+}
+
+const char * JB_class_1_class_1_service_1(JB_class_1 * self, const char * class_1_service_1_parm) {
+    return reinterpret_cast<TR::class_1 *>(self)->class_1_service_1(class_1_service_1_parm);
+}
+
+void JB_class_1_class_1_service_2overload(JB_class_1 * self) {
+    reinterpret_cast<TR::class_1 *>(self)->class_1_service_2();
+}
+
+JB_class_1 * JB_class_2_asclass_1(JB_class_2 * self) {
+    return reinterpret_cast<JB_class_1 *>(static_cast<TR::class_1 *>(reinterpret_cast<TR::class_2 *>(self)));
+}
+
+JB_class_2 * JB_class_2_new(void) {
+    return reinterpret_cast<JB_class_2 *>(::new TR::class_2());
+}
+
+void JB_class_2_delete(JB_class_2 * self) {
+    ::delete reinterpret_cast<TR::class_2 *>(self);
+}
+
+void JB_Project_service_1(int16_t Project_service_1_parm_1, void ** Project_service_1_parm_2, double* Project_service_1_parm_3) {
+    internal_Project_service_1(Project_service_1_parm_1, Project_service_1_parm_2, Project_service_1_parm_3);
+}
+
+} // extern "C"
@@ -0,0 +1,238 @@
+/*******************************************************************************
+ * Copyright (c) 2026, 2026 IBM Corp. and others
+ *
+ * This program and the accompanying materials are made available under
+ * the terms of the Eclipse Public License 2.0 which accompanies this
+ * distribution and is available at http://eclipse.org/legal/epl-2.0
+ * or the Apache License, Version 2.0 which accompanies this distribution
+ * and is available at https://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * This Source Code may also be made available under the following Secondary
+ * Licenses when the conditions for such availability set forth in the
+ * Eclipse Public License, v. 2.0 are satisfied: GNU General Public License,
+ * version 2 with the GNU Classpath Exception [1] and GNU General Public
+ * License, version 2 with the OpenJDK Assembly Exception [2].
+ *
+ * [1] https://www.gnu.org/software/classpath/license.html
+ * [2] http://openjdk.java.net/legal/assembly-exception.html
+ *
+ * SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+ *******************************************************************************/
+        
+#ifndef BytecodeBuilder_INL_INCL
+#define BytecodeBuilder_INL_INCL
+
+#include "ilgen/BytecodeBuilder.hpp"
+#include "ilgen/IlBuilder.hpp"
+#include "ilgen/MethodBuilder.hpp"
+#include "ilgen/IlType.hpp"
+#include "ilgen/IlValue.hpp"
+#include "ilgen/ThunkBuilder.hpp"
+#include "ilgen/TypeDictionary.hpp"
+#include "ilgen/VirtualMachineOperandArray.hpp"
+#include "ilgen/VirtualMachineOperandStack.hpp"
+#include "ilgen/VirtualMachineRegister.hpp"
+#include "ilgen/VirtualMachineRegisterInStruct.hpp"
+#include "ilgen/VirtualMachineState.hpp"
+#include "Macros.hpp"
+#include "Profiling.hpp"
+#include "Tracing.hpp"
+#include "BytecodeBuilder.hpp"
+#include "IlBuilder.hpp"
+#include "MethodBuilder.hpp"
+#include "IlType.hpp"
+#include "IlValue.hpp"
+#include "ThunkBuilder.hpp"
+#include "TypeDictionary.hpp"
+#include "VirtualMachineOperandArray.hpp"
+#include "VirtualMachineOperandStack.hpp"
+#include "VirtualMachineRegister.hpp"
+#include "VirtualMachineRegisterInStruct.hpp"
+#include "VirtualMachineState.hpp"
+
+namespace OMR {
+namespace JitBuilder {
+
+inline int32_t BytecodeBuilder::bcIndex() {
+    PROFILE_TIMED_CALL(0); // BytecodeBuilder::bcIndex()
+    TRACE_CALL(0); // BytecodeBuilder::bcIndex()
+    TRACE_OBJECT(this);
+    auto ret = static_cast<TR::BytecodeBuilder *>(static_cast<TR::IlBuilder *>(_impl))->bcIndex();
+    TRACE_RETURN();
+    TRACE_VALUE(int32_t, ret);
+    return ret;
+}
+
+inline char * BytecodeBuilder::name() {
+    PROFILE_TIMED_CALL(1); // BytecodeBuilder::name()
+    TRACE_CALL(1); // BytecodeBuilder::name()
+    TRACE_OBJECT(this);
+    auto ret = static_cast<TR::BytecodeBuilder *>(static_cast<TR::IlBuilder *>(_impl))->name();
+    TRACE_RETURN();
+    TRACE_STRING(ret);
+    return ret;
+}
+
+inline VirtualMachineState * BytecodeBuilder::vmState() {
+    PROFILE_TIMED_CALL(2); // BytecodeBuilder::vmState()
+    TRACE_CALL(2); // BytecodeBuilder::vmState()
+    TRACE_OBJECT(this);
+    TR::VirtualMachineState * implRet = static_cast<TR::BytecodeBuilder *>(static_cast<TR::IlBuilder *>(_impl))->vmState();
+    GET_CLIENT_OBJECT(clientObj, VirtualMachineState, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline void BytecodeBuilder::AddFallThroughBuilder(BytecodeBuilder * ftb) {
+    PROFILE_TIMED_CALL(3); // BytecodeBuilder::AddFallThroughBuilder(BytecodeBuilder)
+    TRACE_CALL(3); // BytecodeBuilder::AddFallThroughBuilder(BytecodeBuilder)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(ftb);
+    static_cast<TR::BytecodeBuilder *>(static_cast<TR::IlBuilder *>(_impl))->AddFallThroughBuilder(static_cast<TR::BytecodeBuilder *>(static_cast<TR::IlBuilder *>(ftb != NULL ? ftb->_impl : NULL)));
+    TRACE_RETURN();
+}
+
+inline void BytecodeBuilder::Goto(BytecodeBuilder * b) {
+    PROFILE_TIMED_CALL(6); // BytecodeBuilder::Goto(BytecodeBuilder)
+    TRACE_CALL(6); // BytecodeBuilder::Goto(BytecodeBuilder)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(b);
+    static_cast<TR::BytecodeBuilder *>(static_cast<TR::IlBuilder *>(_impl))->Goto(static_cast<TR::BytecodeBuilder *>(static_cast<TR::IlBuilder *>(b != NULL ? b->_impl : NULL)));
+    TRACE_RETURN();
+}
+
+inline void BytecodeBuilder::IfCmpEqual(BytecodeBuilder * target, IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(8); // BytecodeBuilder::IfCmpEqual(BytecodeBuilder, IlValue, IlValue)
+    TRACE_CALL(8); // BytecodeBuilder::IfCmpEqual(BytecodeBuilder, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(target);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    static_cast<TR::BytecodeBuilder *>(static_cast<TR::IlBuilder *>(_impl))->IfCmpEqual(static_cast<TR::BytecodeBuilder *>(static_cast<TR::IlBuilder *>(target != NULL ? target->_impl : NULL)), static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    TRACE_RETURN();
+}
+
+inline void BytecodeBuilder::IfCmpLessOrEqual(BytecodeBuilder * target, IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(10); // BytecodeBuilder::IfCmpLessOrEqual(BytecodeBuilder, IlValue, IlValue)
+    TRACE_CALL(10); // BytecodeBuilder::IfCmpLessOrEqual(BytecodeBuilder, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(target);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    static_cast<TR::BytecodeBuilder *>(static_cast<TR::IlBuilder *>(_impl))->IfCmpLessOrEqual(static_cast<TR::BytecodeBuilder *>(static_cast<TR::IlBuilder *>(target != NULL ? target->_impl : NULL)), static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    TRACE_RETURN();
+}
+
+inline void BytecodeBuilder::IfCmpLessThan(BytecodeBuilder * target, IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(12); // BytecodeBuilder::IfCmpLessThan(BytecodeBuilder, IlValue, IlValue)
+    TRACE_CALL(12); // BytecodeBuilder::IfCmpLessThan(BytecodeBuilder, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(target);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    static_cast<TR::BytecodeBuilder *>(static_cast<TR::IlBuilder *>(_impl))->IfCmpLessThan(static_cast<TR::BytecodeBuilder *>(static_cast<TR::IlBuilder *>(target != NULL ? target->_impl : NULL)), static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    TRACE_RETURN();
+}
+
+inline void BytecodeBuilder::IfCmpGreaterOrEqual(BytecodeBuilder * target, IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(14); // BytecodeBuilder::IfCmpGreaterOrEqual(BytecodeBuilder, IlValue, IlValue)
+    TRACE_CALL(14); // BytecodeBuilder::IfCmpGreaterOrEqual(BytecodeBuilder, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(target);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    static_cast<TR::BytecodeBuilder *>(static_cast<TR::IlBuilder *>(_impl))->IfCmpGreaterOrEqual(static_cast<TR::BytecodeBuilder *>(static_cast<TR::IlBuilder *>(target != NULL ? target->_impl : NULL)), static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    TRACE_RETURN();
+}
+
+inline void BytecodeBuilder::IfCmpGreaterThan(BytecodeBuilder * target, IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(16); // BytecodeBuilder::IfCmpGreaterThan(BytecodeBuilder, IlValue, IlValue)
+    TRACE_CALL(16); // BytecodeBuilder::IfCmpGreaterThan(BytecodeBuilder, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(target);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    static_cast<TR::BytecodeBuilder *>(static_cast<TR::IlBuilder *>(_impl))->IfCmpGreaterThan(static_cast<TR::BytecodeBuilder *>(static_cast<TR::IlBuilder *>(target != NULL ? target->_impl : NULL)), static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    TRACE_RETURN();
+}
+
+inline void BytecodeBuilder::IfCmpNotEqual(BytecodeBuilder * target, IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(18); // BytecodeBuilder::IfCmpNotEqual(BytecodeBuilder, IlValue, IlValue)
+    TRACE_CALL(18); // BytecodeBuilder::IfCmpNotEqual(BytecodeBuilder, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(target);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    static_cast<TR::BytecodeBuilder *>(static_cast<TR::IlBuilder *>(_impl))->IfCmpNotEqual(static_cast<TR::BytecodeBuilder *>(static_cast<TR::IlBuilder *>(target != NULL ? target->_impl : NULL)), static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    TRACE_RETURN();
+}
+
+inline void BytecodeBuilder::IfCmpUnsignedLessOrEqual(BytecodeBuilder * target, IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(20); // BytecodeBuilder::IfCmpUnsignedLessOrEqual(BytecodeBuilder, IlValue, IlValue)
+    TRACE_CALL(20); // BytecodeBuilder::IfCmpUnsignedLessOrEqual(BytecodeBuilder, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(target);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    static_cast<TR::BytecodeBuilder *>(static_cast<TR::IlBuilder *>(_impl))->IfCmpUnsignedLessOrEqual(static_cast<TR::BytecodeBuilder *>(static_cast<TR::IlBuilder *>(target != NULL ? target->_impl : NULL)), static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    TRACE_RETURN();
+}
+
+inline void BytecodeBuilder::IfCmpUnsignedLessThan(BytecodeBuilder * target, IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(22); // BytecodeBuilder::IfCmpUnsignedLessThan(BytecodeBuilder, IlValue, IlValue)
+    TRACE_CALL(22); // BytecodeBuilder::IfCmpUnsignedLessThan(BytecodeBuilder, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(target);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    static_cast<TR::BytecodeBuilder *>(static_cast<TR::IlBuilder *>(_impl))->IfCmpUnsignedLessThan(static_cast<TR::BytecodeBuilder *>(static_cast<TR::IlBuilder *>(target != NULL ? target->_impl : NULL)), static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    TRACE_RETURN();
+}
+
+inline void BytecodeBuilder::IfCmpUnsignedGreaterOrEqual(BytecodeBuilder * target, IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(24); // BytecodeBuilder::IfCmpUnsignedGreaterOrEqual(BytecodeBuilder, IlValue, IlValue)
+    TRACE_CALL(24); // BytecodeBuilder::IfCmpUnsignedGreaterOrEqual(BytecodeBuilder, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(target);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    static_cast<TR::BytecodeBuilder *>(static_cast<TR::IlBuilder *>(_impl))->IfCmpUnsignedGreaterOrEqual(static_cast<TR::BytecodeBuilder *>(static_cast<TR::IlBuilder *>(target != NULL ? target->_impl : NULL)), static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    TRACE_RETURN();
+}
+
+inline void BytecodeBuilder::IfCmpUnsignedGreaterThan(BytecodeBuilder * target, IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(26); // BytecodeBuilder::IfCmpUnsignedGreaterThan(BytecodeBuilder, IlValue, IlValue)
+    TRACE_CALL(26); // BytecodeBuilder::IfCmpUnsignedGreaterThan(BytecodeBuilder, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(target);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    static_cast<TR::BytecodeBuilder *>(static_cast<TR::IlBuilder *>(_impl))->IfCmpUnsignedGreaterThan(static_cast<TR::BytecodeBuilder *>(static_cast<TR::IlBuilder *>(target != NULL ? target->_impl : NULL)), static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    TRACE_RETURN();
+}
+
+inline void BytecodeBuilder::IfCmpEqualZero(BytecodeBuilder * target, IlValue * condition) {
+    PROFILE_TIMED_CALL(28); // BytecodeBuilder::IfCmpEqualZero(BytecodeBuilder, IlValue)
+    TRACE_CALL(28); // BytecodeBuilder::IfCmpEqualZero(BytecodeBuilder, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(target);
+    TRACE_OBJECT(condition);
+    static_cast<TR::BytecodeBuilder *>(static_cast<TR::IlBuilder *>(_impl))->IfCmpEqualZero(static_cast<TR::BytecodeBuilder *>(static_cast<TR::IlBuilder *>(target != NULL ? target->_impl : NULL)), static_cast<TR::IlValue *>(condition != NULL ? condition->_impl : NULL));
+    TRACE_RETURN();
+}
+
+inline void BytecodeBuilder::IfCmpNotEqualZero(BytecodeBuilder * target, IlValue * condition) {
+    PROFILE_TIMED_CALL(30); // BytecodeBuilder::IfCmpNotEqualZero(BytecodeBuilder, IlValue)
+    TRACE_CALL(30); // BytecodeBuilder::IfCmpNotEqualZero(BytecodeBuilder, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(target);
+    TRACE_OBJECT(condition);
+    static_cast<TR::BytecodeBuilder *>(static_cast<TR::IlBuilder *>(_impl))->IfCmpNotEqualZero(static_cast<TR::BytecodeBuilder *>(static_cast<TR::IlBuilder *>(target != NULL ? target->_impl : NULL)), static_cast<TR::IlValue *>(condition != NULL ? condition->_impl : NULL));
+    TRACE_RETURN();
+}
+
+} // JitBuilder
+} // OMR
+
+#endif // BytecodeBuilder_INL_INCL
@@ -0,0 +1,114 @@
+/*******************************************************************************
+ * Copyright (c) 2026, 2026 IBM Corp. and others
+ *
+ * This program and the accompanying materials are made available under
+ * the terms of the Eclipse Public License 2.0 which accompanies this
+ * distribution and is available at http://eclipse.org/legal/epl-2.0
+ * or the Apache License, Version 2.0 which accompanies this distribution
+ * and is available at https://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * This Source Code may also be made available under the following Secondary
+ * Licenses when the conditions for such availability set forth in the
+ * Eclipse Public License, v. 2.0 are satisfied: GNU General Public License,
+ * version 2 with the GNU Classpath Exception [1] and GNU General Public
+ * License, version 2 with the OpenJDK Assembly Exception [2].
+ *
+ * [1] https://www.gnu.org/software/classpath/license.html
+ * [2] http://openjdk.java.net/legal/assembly-exception.html
+ *
+ * SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+ *******************************************************************************/
+        
+#ifndef BytecodeBuilder_INCL
+#define BytecodeBuilder_INCL
+
+#ifndef JITBUILDER_CLASS_HEADER_OPEN
+#define JITBUILDER_CLASS_HEADER_OPEN
+#define BytecodeBuilder_INCL_OUTERMOST
+#endif
+
+#include "stdint.h"
+#include "stddef.h"
+#include "IlBuilder.hpp"
+
+namespace OMR {
+namespace JitBuilder {
+
+// forward declarations for all API classes
+class BytecodeBuilder;
+class IlBuilder;
+class MethodBuilder;
+class IlType;
+class IlValue;
+class ThunkBuilder;
+class TypeDictionary;
+class VirtualMachineOperandArray;
+class VirtualMachineOperandStack;
+class VirtualMachineRegister;
+class VirtualMachineRegisterInStruct;
+class VirtualMachineState;
+
+class BytecodeBuilder: public IlBuilder {
+    public:
+    public: explicit BytecodeBuilder(void * impl);
+    protected: void initializeFromImpl(void * impl);
+    public: ~BytecodeBuilder();
+    public: inline int32_t bcIndex();
+    public: inline char * name();
+    public: inline VirtualMachineState * vmState();
+    public: inline void AddFallThroughBuilder(BytecodeBuilder * ftb);
+    public: void AddSuccessorBuilders(uint32_t numBuilders, BytecodeBuilder ** builders);
+    public: void AddSuccessorBuilders(uint32_t numBuilders, ...);
+    public: void AddSuccessorBuilder(BytecodeBuilder ** b);
+    public: inline void Goto(BytecodeBuilder * b);
+    public: void Goto(BytecodeBuilder ** b);
+    public: inline void IfCmpEqual(BytecodeBuilder * target, IlValue * left, IlValue * right);
+    public: void IfCmpEqual(BytecodeBuilder ** target, IlValue * left, IlValue * right);
+    public: inline void IfCmpLessOrEqual(BytecodeBuilder * target, IlValue * left, IlValue * right);
+    public: void IfCmpLessOrEqual(BytecodeBuilder ** target, IlValue * left, IlValue * right);
+    public: inline void IfCmpLessThan(BytecodeBuilder * target, IlValue * left, IlValue * right);
+    public: void IfCmpLessThan(BytecodeBuilder ** target, IlValue * left, IlValue * right);
+    public: inline void IfCmpGreaterOrEqual(BytecodeBuilder * target, IlValue * left, IlValue * right);
+    public: void IfCmpGreaterOrEqual(BytecodeBuilder ** target, IlValue * left, IlValue * right);
+    public: inline void IfCmpGreaterThan(BytecodeBuilder * target, IlValue * left, IlValue * right);
+    public: void IfCmpGreaterThan(BytecodeBuilder ** target, IlValue * left, IlValue * right);
+    public: inline void IfCmpNotEqual(BytecodeBuilder * target, IlValue * left, IlValue * right);
+    public: void IfCmpNotEqual(BytecodeBuilder ** target, IlValue * left, IlValue * right);
+    public: inline void IfCmpUnsignedLessOrEqual(BytecodeBuilder * target, IlValue * left, IlValue * right);
+    public: void IfCmpUnsignedLessOrEqual(BytecodeBuilder ** target, IlValue * left, IlValue * right);
+    public: inline void IfCmpUnsignedLessThan(BytecodeBuilder * target, IlValue * left, IlValue * right);
+    public: void IfCmpUnsignedLessThan(BytecodeBuilder ** target, IlValue * left, IlValue * right);
+    public: inline void IfCmpUnsignedGreaterOrEqual(BytecodeBuilder * target, IlValue * left, IlValue * right);
+    public: void IfCmpUnsignedGreaterOrEqual(BytecodeBuilder ** target, IlValue * left, IlValue * right);
+    public: inline void IfCmpUnsignedGreaterThan(BytecodeBuilder * target, IlValue * left, IlValue * right);
+    public: void IfCmpUnsignedGreaterThan(BytecodeBuilder ** target, IlValue * left, IlValue * right);
+    public: inline void IfCmpEqualZero(BytecodeBuilder * target, IlValue * condition);
+    public: void IfCmpEqualZero(BytecodeBuilder ** target, IlValue * condition);
+    public: inline void IfCmpNotEqualZero(BytecodeBuilder * target, IlValue * condition);
+    public: void IfCmpNotEqualZero(BytecodeBuilder ** target, IlValue * condition);
+};
+
+extern "C" void * allocateBytecodeBuilder(void * impl);
+extern "C" void * getImpl_BytecodeBuilder(void * client);
+
+} // JitBuilder
+} // OMR
+
+#ifdef BytecodeBuilder_INCL_OUTERMOST
+#undef BytecodeBuilder_INCL_OUTERMOST
+#undef JITBUILDER_CLASS_HEADER_OPEN
+#include "BytecodeBuilder-inl.hpp"
+#include "IlBuilder-inl.hpp"
+#include "MethodBuilder-inl.hpp"
+#include "IlType-inl.hpp"
+#include "IlValue-inl.hpp"
+#include "ThunkBuilder-inl.hpp"
+#include "TypeDictionary-inl.hpp"
+#include "VirtualMachineOperandArray-inl.hpp"
+#include "VirtualMachineOperandStack-inl.hpp"
+#include "VirtualMachineRegister-inl.hpp"
+#include "VirtualMachineRegisterInStruct-inl.hpp"
+#include "VirtualMachineState-inl.hpp"
+#endif
+
+#endif // BytecodeBuilder_INCL
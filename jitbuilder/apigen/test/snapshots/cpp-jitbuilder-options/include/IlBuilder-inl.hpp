@@ -0,0 +1,1066 @@
+/*******************************************************************************
+ * Copyright (c) 2026, 2026 IBM Corp. and others
+ *
+ * This program and the accompanying materials are made available under
+ * the terms of the Eclipse Public License 2.0 which accompanies this
+ * distribution and is available at http://eclipse.org/legal/epl-2.0
+ * or the Apache License, Version 2.0 which accompanies this distribution
+ * and is available at https://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * This Source Code may also be made available under the following Secondary
+ * Licenses when the conditions for such availability set forth in the
+ * Eclipse Public License, v. 2.0 are satisfied: GNU General Public License,
+ * version 2 with the GNU Classpath Exception [1] and GNU General Public
+ * License, version 2 with the OpenJDK Assembly Exception [2].
+ *
+ * [1] https://www.gnu.org/software/classpath/license.html
+ * [2] http://openjdk.java.net/legal/assembly-exception.html
+ *
+ * SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+ *******************************************************************************/
+        
+#ifndef IlBuilder_INL_INCL
+#define IlBuilder_INL_INCL
+
+#include "ilgen/BytecodeBuilder.hpp"
+#include "ilgen/IlBuilder.hpp"
+#include "ilgen/MethodBuilder.hpp"
+#include "ilgen/IlType.hpp"
+#include "ilgen/IlValue.hpp"
+#include "ilgen/ThunkBuilder.hpp"
+#include "ilgen/TypeDictionary.hpp"
+#include "ilgen/VirtualMachineOperandArray.hpp"
+#include "ilgen/VirtualMachineOperandStack.hpp"
+#include "ilgen/VirtualMachineRegister.hpp"
+#include "ilgen/VirtualMachineRegisterInStruct.hpp"
+#include "ilgen/VirtualMachineState.hpp"
+#include "Macros.hpp"
+#include "Profiling.hpp"
+#include "Tracing.hpp"
+#include "BytecodeBuilder.hpp"
+#include "IlBuilder.hpp"
+#include "MethodBuilder.hpp"
+#include "IlType.hpp"
+#include "IlValue.hpp"
+#include "ThunkBuilder.hpp"
+#include "TypeDictionary.hpp"
+#include "VirtualMachineOperandArray.hpp"
+#include "VirtualMachineOperandStack.hpp"
+#include "VirtualMachineRegister.hpp"
+#include "VirtualMachineRegisterInStruct.hpp"
+#include "VirtualMachineState.hpp"
+
+namespace OMR {
+namespace JitBuilder {
+
+inline IlBuilder * IlBuilder::OrphanBuilder() {
+    PROFILE_TIMED_CALL(36); // IlBuilder::OrphanBuilder()
+    TRACE_CALL(36); // IlBuilder::OrphanBuilder()
+    TRACE_OBJECT(this);
+    TR::IlBuilder * implRet = static_cast<TR::IlBuilder *>(_impl)->OrphanBuilder();
+    GET_CLIENT_OBJECT(clientObj, IlBuilder, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline BytecodeBuilder * IlBuilder::OrphanBytecodeBuilder(int32_t bcIndex, char * name) {
+    PROFILE_TIMED_CALL(37); // IlBuilder::OrphanBytecodeBuilder(int32, string)
+    TRACE_CALL(37); // IlBuilder::OrphanBytecodeBuilder(int32, string)
+    TRACE_OBJECT(this);
+    TRACE_VALUE(int32_t, bcIndex);
+    TRACE_STRING(name);
+    TR::BytecodeBuilder * implRet = static_cast<TR::IlBuilder *>(_impl)->OrphanBytecodeBuilder(bcIndex, name);
+    GET_CLIENT_OBJECT(clientObj, BytecodeBuilder, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::Copy(IlValue * value) {
+    PROFILE_TIMED_CALL(38); // IlBuilder::Copy(IlValue)
+    TRACE_CALL(38); // IlBuilder::Copy(IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(value);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->Copy(static_cast<TR::IlValue *>(value != NULL ? value->_impl : NULL));
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline TypeDictionary * IlBuilder::typeDictionary() {
+    PROFILE_TIMED_CALL(39); // IlBuilder::typeDictionary()
+    TRACE_CALL(39); // IlBuilder::typeDictionary()
+    TRACE_OBJECT(this);
+    TR::TypeDictionary * implRet = static_cast<TR::IlBuilder *>(_impl)->typeDictionary();
+    GET_CLIENT_OBJECT(clientObj, TypeDictionary, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::ConstInteger(IlType * type, int64_t value) {
+    PROFILE_TIMED_CALL(40); // IlBuilder::ConstInteger(IlType, int64)
+    TRACE_CALL(40); // IlBuilder::ConstInteger(IlType, int64)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(type);
+    TRACE_VALUE(int64_t, value);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->ConstInteger(static_cast<TR::IlType *>(type != NULL ? type->_impl : NULL), value);
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::ConstAddress(void * value) {
+    PROFILE_TIMED_CALL(41); // IlBuilder::ConstAddress(pointer)
+    TRACE_CALL(41); // IlBuilder::ConstAddress(pointer)
+    TRACE_OBJECT(this);
+    TRACE_POINTER(value);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->ConstAddress(value);
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::ConstDouble(double value) {
+    PROFILE_TIMED_CALL(42); // IlBuilder::ConstDouble(double)
+    TRACE_CALL(42); // IlBuilder::ConstDouble(double)
+    TRACE_OBJECT(this);
+    TRACE_VALUE(double, value);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->ConstDouble(value);
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::ConstFloat(float value) {
+    PROFILE_TIMED_CALL(43); // IlBuilder::ConstFloat(float)
+    TRACE_CALL(43); // IlBuilder::ConstFloat(float)
+    TRACE_OBJECT(this);
+    TRACE_VALUE(float, value);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->ConstFloat(value);
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::ConstInt8(int8_t value) {
+    PROFILE_TIMED_CALL(44); // IlBuilder::ConstInt8(int8)
+    TRACE_CALL(44); // IlBuilder::ConstInt8(int8)
+    TRACE_OBJECT(this);
+    TRACE_VALUE(int8_t, value);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->ConstInt8(value);
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::ConstInt16(int16_t value) {
+    PROFILE_TIMED_CALL(45); // IlBuilder::ConstInt16(int16)
+    TRACE_CALL(45); // IlBuilder::ConstInt16(int16)
+    TRACE_OBJECT(this);
+    TRACE_VALUE(int16_t, value);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->ConstInt16(value);
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::ConstInt32(int32_t value) {
+    PROFILE_TIMED_CALL(46); // IlBuilder::ConstInt32(int32)
+    TRACE_CALL(46); // IlBuilder::ConstInt32(int32)
+    TRACE_OBJECT(this);
+    TRACE_VALUE(int32_t, value);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->ConstInt32(value);
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::ConstInt64(int64_t value) {
+    PROFILE_TIMED_CALL(47); // IlBuilder::ConstInt64(int64)
+    TRACE_CALL(47); // IlBuilder::ConstInt64(int64)
+    TRACE_OBJECT(this);
+    TRACE_VALUE(int64_t, value);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->ConstInt64(value);
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::ConstString(char * value) {
+    PROFILE_TIMED_CALL(48); // IlBuilder::ConstString(string)
+    TRACE_CALL(48); // IlBuilder::ConstString(string)
+    TRACE_OBJECT(this);
+    TRACE_STRING(value);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->ConstString(value);
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::Const(void * value) {
+    PROFILE_TIMED_CALL(49); // IlBuilder::Const(pointer)
+    TRACE_CALL(49); // IlBuilder::Const(pointer)
+    TRACE_OBJECT(this);
+    TRACE_POINTER(value);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->Const(value);
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::Const(double value) {
+    PROFILE_TIMED_CALL(50); // IlBuilder::Const(double)
+    TRACE_CALL(50); // IlBuilder::Const(double)
+    TRACE_OBJECT(this);
+    TRACE_VALUE(double, value);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->Const(value);
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::Const(float value) {
+    PROFILE_TIMED_CALL(51); // IlBuilder::Const(float)
+    TRACE_CALL(51); // IlBuilder::Const(float)
+    TRACE_OBJECT(this);
+    TRACE_VALUE(float, value);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->Const(value);
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::Const(int8_t value) {
+    PROFILE_TIMED_CALL(52); // IlBuilder::Const(int8)
+    TRACE_CALL(52); // IlBuilder::Const(int8)
+    TRACE_OBJECT(this);
+    TRACE_VALUE(int8_t, value);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->Const(value);
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::Const(int16_t value) {
+    PROFILE_TIMED_CALL(53); // IlBuilder::Const(int16)
+    TRACE_CALL(53); // IlBuilder::Const(int16)
+    TRACE_OBJECT(this);
+    TRACE_VALUE(int16_t, value);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->Const(value);
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::Const(int32_t value) {
+    PROFILE_TIMED_CALL(54); // IlBuilder::Const(int32)
+    TRACE_CALL(54); // IlBuilder::Const(int32)
+    TRACE_OBJECT(this);
+    TRACE_VALUE(int32_t, value);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->Const(value);
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::Const(int64_t value) {
+    PROFILE_TIMED_CALL(55); // IlBuilder::Const(int64)
+    TRACE_CALL(55); // IlBuilder::Const(int64)
+    TRACE_OBJECT(this);
+    TRACE_VALUE(int64_t, value);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->Const(value);
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::NullAddress() {
+    PROFILE_TIMED_CALL(56); // IlBuilder::NullAddress()
+    TRACE_CALL(56); // IlBuilder::NullAddress()
+    TRACE_OBJECT(this);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->NullAddress();
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::Add(IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(57); // IlBuilder::Add(IlValue, IlValue)
+    TRACE_CALL(57); // IlBuilder::Add(IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->Add(static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::And(IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(60); // IlBuilder::And(IlValue, IlValue)
+    TRACE_CALL(60); // IlBuilder::And(IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->And(static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::Div(IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(61); // IlBuilder::Div(IlValue, IlValue)
+    TRACE_CALL(61); // IlBuilder::Div(IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->Div(static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::UnsignedDiv(IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(62); // IlBuilder::UnsignedDiv(IlValue, IlValue)
+    TRACE_CALL(62); // IlBuilder::UnsignedDiv(IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->UnsignedDiv(static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::IndexAt(IlType * dt, IlValue * base, IlValue * index) {
+    PROFILE_TIMED_CALL(63); // IlBuilder::IndexAt(IlType, IlValue, IlValue)
+    TRACE_CALL(63); // IlBuilder::IndexAt(IlType, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(dt);
+    TRACE_OBJECT(base);
+    TRACE_OBJECT(index);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->IndexAt(static_cast<TR::IlType *>(dt != NULL ? dt->_impl : NULL), static_cast<TR::IlValue *>(base != NULL ? base->_impl : NULL), static_cast<TR::IlValue *>(index != NULL ? index->_impl : NULL));
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::Mul(IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(64); // IlBuilder::Mul(IlValue, IlValue)
+    TRACE_CALL(64); // IlBuilder::Mul(IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->Mul(static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::Negate(IlValue * v) {
+    PROFILE_TIMED_CALL(66); // IlBuilder::Negate(IlValue)
+    TRACE_CALL(66); // IlBuilder::Negate(IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(v);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->Negate(static_cast<TR::IlValue *>(v != NULL ? v->_impl : NULL));
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::Or(IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(67); // IlBuilder::Or(IlValue, IlValue)
+    TRACE_CALL(67); // IlBuilder::Or(IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->Or(static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::Rem(IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(68); // IlBuilder::Rem(IlValue, IlValue)
+    TRACE_CALL(68); // IlBuilder::Rem(IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->Rem(static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::UnsignedRem(IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(69); // IlBuilder::UnsignedRem(IlValue, IlValue)
+    TRACE_CALL(69); // IlBuilder::UnsignedRem(IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->UnsignedRem(static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::ShiftL(IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(70); // IlBuilder::ShiftL(IlValue, IlValue)
+    TRACE_CALL(70); // IlBuilder::ShiftL(IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->ShiftL(static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::ShiftR(IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(71); // IlBuilder::ShiftR(IlValue, IlValue)
+    TRACE_CALL(71); // IlBuilder::ShiftR(IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->ShiftR(static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::Sub(IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(72); // IlBuilder::Sub(IlValue, IlValue)
+    TRACE_CALL(72); // IlBuilder::Sub(IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->Sub(static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::UnsignedShiftR(IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(75); // IlBuilder::UnsignedShiftR(IlValue, IlValue)
+    TRACE_CALL(75); // IlBuilder::UnsignedShiftR(IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->UnsignedShiftR(static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::Xor(IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(76); // IlBuilder::Xor(IlValue, IlValue)
+    TRACE_CALL(76); // IlBuilder::Xor(IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->Xor(static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::EqualTo(IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(77); // IlBuilder::EqualTo(IlValue, IlValue)
+    TRACE_CALL(77); // IlBuilder::EqualTo(IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->EqualTo(static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::LessOrEqualTo(IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(78); // IlBuilder::LessOrEqualTo(IlValue, IlValue)
+    TRACE_CALL(78); // IlBuilder::LessOrEqualTo(IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->LessOrEqualTo(static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::LessThan(IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(79); // IlBuilder::LessThan(IlValue, IlValue)
+    TRACE_CALL(79); // IlBuilder::LessThan(IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->LessThan(static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::GreaterOrEqualTo(IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(80); // IlBuilder::GreaterOrEqualTo(IlValue, IlValue)
+    TRACE_CALL(80); // IlBuilder::GreaterOrEqualTo(IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->GreaterOrEqualTo(static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::GreaterThan(IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(81); // IlBuilder::GreaterThan(IlValue, IlValue)
+    TRACE_CALL(81); // IlBuilder::GreaterThan(IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->GreaterThan(static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::NotEqualTo(IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(82); // IlBuilder::NotEqualTo(IlValue, IlValue)
+    TRACE_CALL(82); // IlBuilder::NotEqualTo(IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->NotEqualTo(static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::UnsignedLessOrEqualTo(IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(83); // IlBuilder::UnsignedLessOrEqualTo(IlValue, IlValue)
+    TRACE_CALL(83); // IlBuilder::UnsignedLessOrEqualTo(IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->UnsignedLessOrEqualTo(static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::UnsignedLessThan(IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(84); // IlBuilder::UnsignedLessThan(IlValue, IlValue)
+    TRACE_CALL(84); // IlBuilder::UnsignedLessThan(IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->UnsignedLessThan(static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::UnsignedGreaterOrEqualTo(IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(85); // IlBuilder::UnsignedGreaterOrEqualTo(IlValue, IlValue)
+    TRACE_CALL(85); // IlBuilder::UnsignedGreaterOrEqualTo(IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->UnsignedGreaterOrEqualTo(static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::UnsignedGreaterThan(IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(86); // IlBuilder::UnsignedGreaterThan(IlValue, IlValue)
+    TRACE_CALL(86); // IlBuilder::UnsignedGreaterThan(IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->UnsignedGreaterThan(static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::ConvertBitsTo(IlType * type, IlValue * value) {
+    PROFILE_TIMED_CALL(87); // IlBuilder::ConvertBitsTo(IlType, IlValue)
+    TRACE_CALL(87); // IlBuilder::ConvertBitsTo(IlType, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(type);
+    TRACE_OBJECT(value);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->ConvertBitsTo(static_cast<TR::IlType *>(type != NULL ? type->_impl : NULL), static_cast<TR::IlValue *>(value != NULL ? value->_impl : NULL));
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::ConvertTo(IlType * type, IlValue * value) {
+    PROFILE_TIMED_CALL(88); // IlBuilder::ConvertTo(IlType, IlValue)
+    TRACE_CALL(88); // IlBuilder::ConvertTo(IlType, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(type);
+    TRACE_OBJECT(value);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->ConvertTo(static_cast<TR::IlType *>(type != NULL ? type->_impl : NULL), static_cast<TR::IlValue *>(value != NULL ? value->_impl : NULL));
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::UnsignedConvertTo(IlType * type, IlValue * value) {
+    PROFILE_TIMED_CALL(89); // IlBuilder::UnsignedConvertTo(IlType, IlValue)
+    TRACE_CALL(89); // IlBuilder::UnsignedConvertTo(IlType, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(type);
+    TRACE_OBJECT(value);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->UnsignedConvertTo(static_cast<TR::IlType *>(type != NULL ? type->_impl : NULL), static_cast<TR::IlValue *>(value != NULL ? value->_impl : NULL));
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::AtomicAdd(IlValue * baseAddress, IlValue * value) {
+    PROFILE_TIMED_CALL(90); // IlBuilder::AtomicAdd(IlValue, IlValue)
+    TRACE_CALL(90); // IlBuilder::AtomicAdd(IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(baseAddress);
+    TRACE_OBJECT(value);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->AtomicAdd(static_cast<TR::IlValue *>(baseAddress != NULL ? baseAddress->_impl : NULL), static_cast<TR::IlValue *>(value != NULL ? value->_impl : NULL));
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::CreateLocalArray(int32_t numElements, IlType * elementType) {
+    PROFILE_TIMED_CALL(91); // IlBuilder::CreateLocalArray(int32, IlType)
+    TRACE_CALL(91); // IlBuilder::CreateLocalArray(int32, IlType)
+    TRACE_OBJECT(this);
+    TRACE_VALUE(int32_t, numElements);
+    TRACE_OBJECT(elementType);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->CreateLocalArray(numElements, static_cast<TR::IlType *>(elementType != NULL ? elementType->_impl : NULL));
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::CreateLocalStruct(IlType * structType) {
+    PROFILE_TIMED_CALL(92); // IlBuilder::CreateLocalStruct(IlType)
+    TRACE_CALL(92); // IlBuilder::CreateLocalStruct(IlType)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(structType);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->CreateLocalStruct(static_cast<TR::IlType *>(structType != NULL ? structType->_impl : NULL));
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::Load(const char * name) {
+    PROFILE_TIMED_CALL(93); // IlBuilder::Load(constString)
+    TRACE_CALL(93); // IlBuilder::Load(constString)
+    TRACE_OBJECT(this);
+    TRACE_STRING(name);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->Load(name);
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::LoadAt(IlType * type, IlValue * address) {
+    PROFILE_TIMED_CALL(94); // IlBuilder::LoadAt(IlType, IlValue)
+    TRACE_CALL(94); // IlBuilder::LoadAt(IlType, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(type);
+    TRACE_OBJECT(address);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->LoadAt(static_cast<TR::IlType *>(type != NULL ? type->_impl : NULL), static_cast<TR::IlValue *>(address != NULL ? address->_impl : NULL));
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::LoadIndirect(const char * type, const char * field, IlValue * object) {
+    PROFILE_TIMED_CALL(95); // IlBuilder::LoadIndirect(constString, constString, IlValue)
+    TRACE_CALL(95); // IlBuilder::LoadIndirect(constString, constString, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_STRING(type);
+    TRACE_STRING(field);
+    TRACE_OBJECT(object);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->LoadIndirect(type, field, static_cast<TR::IlValue *>(object != NULL ? object->_impl : NULL));
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline void IlBuilder::Store(const char * name, IlValue * value) {
+    PROFILE_TIMED_CALL(96); // IlBuilder::Store(constString, IlValue)
+    TRACE_CALL(96); // IlBuilder::Store(constString, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_STRING(name);
+    TRACE_OBJECT(value);
+    static_cast<TR::IlBuilder *>(_impl)->Store(name, static_cast<TR::IlValue *>(value != NULL ? value->_impl : NULL));
+    TRACE_RETURN();
+}
+
+inline void IlBuilder::StoreAt(IlValue * address, IlValue * value) {
+    PROFILE_TIMED_CALL(97); // IlBuilder::StoreAt(IlValue, IlValue)
+    TRACE_CALL(97); // IlBuilder::StoreAt(IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(address);
+    TRACE_OBJECT(value);
+    static_cast<TR::IlBuilder *>(_impl)->StoreAt(static_cast<TR::IlValue *>(address != NULL ? address->_impl : NULL), static_cast<TR::IlValue *>(value != NULL ? value->_impl : NULL));
+    TRACE_RETURN();
+}
+
+inline void IlBuilder::StoreIndirect(const char * type, const char * field, IlValue * object, IlValue * value) {
+    PROFILE_TIMED_CALL(98); // IlBuilder::StoreIndirect(constString, constString, IlValue, IlValue)
+    TRACE_CALL(98); // IlBuilder::StoreIndirect(constString, constString, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_STRING(type);
+    TRACE_STRING(field);
+    TRACE_OBJECT(object);
+    TRACE_OBJECT(value);
+    static_cast<TR::IlBuilder *>(_impl)->StoreIndirect(type, field, static_cast<TR::IlValue *>(object != NULL ? object->_impl : NULL), static_cast<TR::IlValue *>(value != NULL ? value->_impl : NULL));
+    TRACE_RETURN();
+}
+
+inline void IlBuilder::StoreOver(IlValue * dest, IlValue * value) {
+    PROFILE_TIMED_CALL(99); // IlBuilder::StoreOver(IlValue, IlValue)
+    TRACE_CALL(99); // IlBuilder::StoreOver(IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(dest);
+    TRACE_OBJECT(value);
+    static_cast<TR::IlBuilder *>(_impl)->StoreOver(static_cast<TR::IlValue *>(dest != NULL ? dest->_impl : NULL), static_cast<TR::IlValue *>(value != NULL ? value->_impl : NULL));
+    TRACE_RETURN();
+}
+
+inline void IlBuilder::TransactionAbort() {
+    PROFILE_TIMED_CALL(101); // IlBuilder::TransactionAbort()
+    TRACE_CALL(101); // IlBuilder::TransactionAbort()
+    TRACE_OBJECT(this);
+    static_cast<TR::IlBuilder *>(_impl)->TransactionAbort();
+    TRACE_RETURN();
+}
+
+inline IlValue * IlBuilder::StructFieldInstanceAddress(const char * structName, const char * fieldName, IlValue * obj) {
+    PROFILE_TIMED_CALL(102); // IlBuilder::StructFieldInstanceAddress(constString, constString, IlValue)
+    TRACE_CALL(102); // IlBuilder::StructFieldInstanceAddress(constString, constString, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_STRING(structName);
+    TRACE_STRING(fieldName);
+    TRACE_OBJECT(obj);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->StructFieldInstanceAddress(structName, fieldName, static_cast<TR::IlValue *>(obj != NULL ? obj->_impl : NULL));
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::UnionFieldInstanceAddress(const char * unionName, const char * fieldName, IlValue * obj) {
+    PROFILE_TIMED_CALL(103); // IlBuilder::UnionFieldInstanceAddress(constString, constString, IlValue)
+    TRACE_CALL(103); // IlBuilder::UnionFieldInstanceAddress(constString, constString, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_STRING(unionName);
+    TRACE_STRING(fieldName);
+    TRACE_OBJECT(obj);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->UnionFieldInstanceAddress(unionName, fieldName, static_cast<TR::IlValue *>(obj != NULL ? obj->_impl : NULL));
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::VectorLoad(char * name) {
+    PROFILE_TIMED_CALL(104); // IlBuilder::VectorLoad(string)
+    TRACE_CALL(104); // IlBuilder::VectorLoad(string)
+    TRACE_OBJECT(this);
+    TRACE_STRING(name);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->VectorLoad(name);
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * IlBuilder::VectorLoadAt(IlType * type, IlValue * address) {
+    PROFILE_TIMED_CALL(105); // IlBuilder::VectorLoadAt(IlType, IlValue)
+    TRACE_CALL(105); // IlBuilder::VectorLoadAt(IlType, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(type);
+    TRACE_OBJECT(address);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->VectorLoadAt(static_cast<TR::IlType *>(type != NULL ? type->_impl : NULL), static_cast<TR::IlValue *>(address != NULL ? address->_impl : NULL));
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline void IlBuilder::VectorStore(char * name, IlValue * value) {
+    PROFILE_TIMED_CALL(106); // IlBuilder::VectorStore(string, IlValue)
+    TRACE_CALL(106); // IlBuilder::VectorStore(string, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_STRING(name);
+    TRACE_OBJECT(value);
+    static_cast<TR::IlBuilder *>(_impl)->VectorStore(name, static_cast<TR::IlValue *>(value != NULL ? value->_impl : NULL));
+    TRACE_RETURN();
+}
+
+inline void IlBuilder::VectorStoreAt(IlValue * address, IlValue * value) {
+    PROFILE_TIMED_CALL(107); // IlBuilder::VectorStoreAt(IlValue, IlValue)
+    TRACE_CALL(107); // IlBuilder::VectorStoreAt(IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(address);
+    TRACE_OBJECT(value);
+    static_cast<TR::IlBuilder *>(_impl)->VectorStoreAt(static_cast<TR::IlValue *>(address != NULL ? address->_impl : NULL), static_cast<TR::IlValue *>(value != NULL ? value->_impl : NULL));
+    TRACE_RETURN();
+}
+
+inline void IlBuilder::AppendBuilder(IlBuilder * b) {
+    PROFILE_TIMED_CALL(108); // IlBuilder::AppendBuilder(IlBuilder)
+    TRACE_CALL(108); // IlBuilder::AppendBuilder(IlBuilder)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(b);
+    static_cast<TR::IlBuilder *>(_impl)->AppendBuilder(static_cast<TR::IlBuilder *>(b != NULL ? b->_impl : NULL));
+    TRACE_RETURN();
+}
+
+inline void IlBuilder::Goto(IlBuilder * b) {
+    PROFILE_TIMED_CALL(116); // IlBuilder::Goto(IlBuilder)
+    TRACE_CALL(116); // IlBuilder::Goto(IlBuilder)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(b);
+    static_cast<TR::IlBuilder *>(_impl)->Goto(static_cast<TR::IlBuilder *>(b != NULL ? b->_impl : NULL));
+    TRACE_RETURN();
+}
+
+inline IlBuilder::JBCondition * IlBuilder::MakeCondition(IlBuilder * conditionBuilder, IlValue * conditionValue) {
+    PROFILE_TIMED_CALL(118); // IlBuilder::MakeCondition(IlBuilder, IlValue)
+    TRACE_CALL(118); // IlBuilder::MakeCondition(IlBuilder, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(conditionBuilder);
+    TRACE_OBJECT(conditionValue);
+    TR::IlBuilder::JBCondition * implRet = static_cast<TR::IlBuilder *>(_impl)->MakeCondition(static_cast<TR::IlBuilder *>(conditionBuilder != NULL ? conditionBuilder->_impl : NULL), static_cast<TR::IlValue *>(conditionValue != NULL ? conditionValue->_impl : NULL));
+    GET_CLIENT_OBJECT(clientObj, JBCondition, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline void IlBuilder::IfCmpEqual(IlBuilder * target, IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(120); // IlBuilder::IfCmpEqual(IlBuilder, IlValue, IlValue)
+    TRACE_CALL(120); // IlBuilder::IfCmpEqual(IlBuilder, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(target);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    static_cast<TR::IlBuilder *>(_impl)->IfCmpEqual(static_cast<TR::IlBuilder *>(target != NULL ? target->_impl : NULL), static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    TRACE_RETURN();
+}
+
+inline void IlBuilder::IfCmpLessOrEqual(IlBuilder * target, IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(122); // IlBuilder::IfCmpLessOrEqual(IlBuilder, IlValue, IlValue)
+    TRACE_CALL(122); // IlBuilder::IfCmpLessOrEqual(IlBuilder, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(target);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    static_cast<TR::IlBuilder *>(_impl)->IfCmpLessOrEqual(static_cast<TR::IlBuilder *>(target != NULL ? target->_impl : NULL), static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    TRACE_RETURN();
+}
+
+inline void IlBuilder::IfCmpLessThan(IlBuilder * target, IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(124); // IlBuilder::IfCmpLessThan(IlBuilder, IlValue, IlValue)
+    TRACE_CALL(124); // IlBuilder::IfCmpLessThan(IlBuilder, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(target);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    static_cast<TR::IlBuilder *>(_impl)->IfCmpLessThan(static_cast<TR::IlBuilder *>(target != NULL ? target->_impl : NULL), static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    TRACE_RETURN();
+}
+
+inline void IlBuilder::IfCmpGreaterOrEqual(IlBuilder * target, IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(126); // IlBuilder::IfCmpGreaterOrEqual(IlBuilder, IlValue, IlValue)
+    TRACE_CALL(126); // IlBuilder::IfCmpGreaterOrEqual(IlBuilder, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(target);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    static_cast<TR::IlBuilder *>(_impl)->IfCmpGreaterOrEqual(static_cast<TR::IlBuilder *>(target != NULL ? target->_impl : NULL), static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    TRACE_RETURN();
+}
+
+inline void IlBuilder::IfCmpGreaterThan(IlBuilder * target, IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(128); // IlBuilder::IfCmpGreaterThan(IlBuilder, IlValue, IlValue)
+    TRACE_CALL(128); // IlBuilder::IfCmpGreaterThan(IlBuilder, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(target);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    static_cast<TR::IlBuilder *>(_impl)->IfCmpGreaterThan(static_cast<TR::IlBuilder *>(target != NULL ? target->_impl : NULL), static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    TRACE_RETURN();
+}
+
+inline void IlBuilder::IfCmpNotEqual(IlBuilder * target, IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(130); // IlBuilder::IfCmpNotEqual(IlBuilder, IlValue, IlValue)
+    TRACE_CALL(130); // IlBuilder::IfCmpNotEqual(IlBuilder, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(target);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    static_cast<TR::IlBuilder *>(_impl)->IfCmpNotEqual(static_cast<TR::IlBuilder *>(target != NULL ? target->_impl : NULL), static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    TRACE_RETURN();
+}
+
+inline void IlBuilder::IfCmpUnsignedLessOrEqual(IlBuilder * target, IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(132); // IlBuilder::IfCmpUnsignedLessOrEqual(IlBuilder, IlValue, IlValue)
+    TRACE_CALL(132); // IlBuilder::IfCmpUnsignedLessOrEqual(IlBuilder, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(target);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    static_cast<TR::IlBuilder *>(_impl)->IfCmpUnsignedLessOrEqual(static_cast<TR::IlBuilder *>(target != NULL ? target->_impl : NULL), static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    TRACE_RETURN();
+}
+
+inline void IlBuilder::IfCmpUnsignedLessThan(IlBuilder * target, IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(134); // IlBuilder::IfCmpUnsignedLessThan(IlBuilder, IlValue, IlValue)
+    TRACE_CALL(134); // IlBuilder::IfCmpUnsignedLessThan(IlBuilder, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(target);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    static_cast<TR::IlBuilder *>(_impl)->IfCmpUnsignedLessThan(static_cast<TR::IlBuilder *>(target != NULL ? target->_impl : NULL), static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    TRACE_RETURN();
+}
+
+inline void IlBuilder::IfCmpUnsignedGreaterOrEqual(IlBuilder * target, IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(136); // IlBuilder::IfCmpUnsignedGreaterOrEqual(IlBuilder, IlValue, IlValue)
+    TRACE_CALL(136); // IlBuilder::IfCmpUnsignedGreaterOrEqual(IlBuilder, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(target);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    static_cast<TR::IlBuilder *>(_impl)->IfCmpUnsignedGreaterOrEqual(static_cast<TR::IlBuilder *>(target != NULL ? target->_impl : NULL), static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    TRACE_RETURN();
+}
+
+inline void IlBuilder::IfCmpUnsignedGreaterThan(IlBuilder * target, IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(138); // IlBuilder::IfCmpUnsignedGreaterThan(IlBuilder, IlValue, IlValue)
+    TRACE_CALL(138); // IlBuilder::IfCmpUnsignedGreaterThan(IlBuilder, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(target);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    static_cast<TR::IlBuilder *>(_impl)->IfCmpUnsignedGreaterThan(static_cast<TR::IlBuilder *>(target != NULL ? target->_impl : NULL), static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    TRACE_RETURN();
+}
+
+inline void IlBuilder::IfCmpEqualZero(IlBuilder * target, IlValue * condition) {
+    PROFILE_TIMED_CALL(140); // IlBuilder::IfCmpEqualZero(IlBuilder, IlValue)
+    TRACE_CALL(140); // IlBuilder::IfCmpEqualZero(IlBuilder, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(target);
+    TRACE_OBJECT(condition);
+    static_cast<TR::IlBuilder *>(_impl)->IfCmpEqualZero(static_cast<TR::IlBuilder *>(target != NULL ? target->_impl : NULL), static_cast<TR::IlValue *>(condition != NULL ? condition->_impl : NULL));
+    TRACE_RETURN();
+}
+
+inline void IlBuilder::IfCmpNotEqualZero(IlBuilder * target, IlValue * condition) {
+    PROFILE_TIMED_CALL(142); // IlBuilder::IfCmpNotEqualZero(IlBuilder, IlValue)
+    TRACE_CALL(142); // IlBuilder::IfCmpNotEqualZero(IlBuilder, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(target);
+    TRACE_OBJECT(condition);
+    static_cast<TR::IlBuilder *>(_impl)->IfCmpNotEqualZero(static_cast<TR::IlBuilder *>(target != NULL ? target->_impl : NULL), static_cast<TR::IlValue *>(condition != NULL ? condition->_impl : NULL));
+    TRACE_RETURN();
+}
+
+inline IlValue * IlBuilder::Select(IlValue * condition, IlValue * trueValue, IlValue * falseValue) {
+    PROFILE_TIMED_CALL(147); // IlBuilder::Select(IlValue, IlValue, IlValue)
+    TRACE_CALL(147); // IlBuilder::Select(IlValue, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(condition);
+    TRACE_OBJECT(trueValue);
+    TRACE_OBJECT(falseValue);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->Select(static_cast<TR::IlValue *>(condition != NULL ? condition->_impl : NULL), static_cast<TR::IlValue *>(trueValue != NULL ? trueValue->_impl : NULL), static_cast<TR::IlValue *>(falseValue != NULL ? falseValue->_impl : NULL));
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline void IlBuilder::Return() {
+    PROFILE_TIMED_CALL(153); // IlBuilder::Return()
+    TRACE_CALL(153); // IlBuilder::Return()
+    TRACE_OBJECT(this);
+    static_cast<TR::IlBuilder *>(_impl)->Return();
+    TRACE_RETURN();
+}
+
+inline void IlBuilder::Return(IlValue * value) {
+    PROFILE_TIMED_CALL(154); // IlBuilder::Return(IlValue)
+    TRACE_CALL(154); // IlBuilder::Return(IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(value);
+    static_cast<TR::IlBuilder *>(_impl)->Return(static_cast<TR::IlValue *>(value != NULL ? value->_impl : NULL));
+    TRACE_RETURN();
+}
+
+} // JitBuilder
+} // OMR
+
+#endif // IlBuilder_INL_INCL
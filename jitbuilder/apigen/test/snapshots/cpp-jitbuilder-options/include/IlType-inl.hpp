@@ -0,0 +1,112 @@
+/*******************************************************************************
+ * Copyright (c) 2026, 2026 IBM Corp. and others
+ *
+ * This program and the accompanying materials are made available under
+ * the terms of the Eclipse Public License 2.0 which accompanies this
+ * distribution and is available at http://eclipse.org/legal/epl-2.0
+ * or the Apache License, Version 2.0 which accompanies this distribution
+ * and is available at https://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * This Source Code may also be made available under the following Secondary
+ * Licenses when the conditions for such availability set forth in the
+ * Eclipse Public License, v. 2.0 are satisfied: GNU General Public License,
+ * version 2 with the GNU Classpath Exception [1] and GNU General Public
+ * License, version 2 with the OpenJDK Assembly Exception [2].
+ *
+ * [1] https://www.gnu.org/software/classpath/license.html
+ * [2] http://openjdk.java.net/legal/assembly-exception.html
+ *
+ * SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+ *******************************************************************************/
+        
+#ifndef IlType_INL_INCL
+#define IlType_INL_INCL
+
+#include "ilgen/BytecodeBuilder.hpp"
+#include "ilgen/IlBuilder.hpp"
+#include "ilgen/MethodBuilder.hpp"
+#include "ilgen/IlType.hpp"
+#include "ilgen/IlValue.hpp"
+#include "ilgen/ThunkBuilder.hpp"
+#include "ilgen/TypeDictionary.hpp"
+#include "ilgen/VirtualMachineOperandArray.hpp"
+#include "ilgen/VirtualMachineOperandStack.hpp"
+#include "ilgen/VirtualMachineRegister.hpp"
+#include "ilgen/VirtualMachineRegisterInStruct.hpp"
+#include "ilgen/VirtualMachineState.hpp"
+#include "Macros.hpp"
+#include "Profiling.hpp"
+#include "Tracing.hpp"
+#include "BytecodeBuilder.hpp"
+#include "IlBuilder.hpp"
+#include "MethodBuilder.hpp"
+#include "IlType.hpp"
+#include "IlValue.hpp"
+#include "ThunkBuilder.hpp"
+#include "TypeDictionary.hpp"
+#include "VirtualMachineOperandArray.hpp"
+#include "VirtualMachineOperandStack.hpp"
+#include "VirtualMachineRegister.hpp"
+#include "VirtualMachineRegisterInStruct.hpp"
+#include "VirtualMachineState.hpp"
+
+namespace OMR {
+namespace JitBuilder {
+
+inline IlType * IlType::baseType() {
+    PROFILE_TIMED_CALL(185); // IlType::baseType()
+    TRACE_CALL(185); // IlType::baseType()
+    TRACE_OBJECT(this);
+    TR::IlType * implRet = static_cast<TR::IlType *>(_impl)->baseType();
+    GET_CLIENT_OBJECT(clientObj, IlType, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline const char * IlType::getName() {
+    PROFILE_TIMED_CALL(186); // IlType::getName()
+    TRACE_CALL(186); // IlType::getName()
+    TRACE_OBJECT(this);
+    auto ret = static_cast<TR::IlType *>(_impl)->getName();
+    TRACE_RETURN();
+    TRACE_STRING(ret);
+    return ret;
+}
+
+inline IlType * IlType::primitiveType(TypeDictionary * d) {
+    PROFILE_TIMED_CALL(187); // IlType::primitiveType(TypeDictionary)
+    TRACE_CALL(187); // IlType::primitiveType(TypeDictionary)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(d);
+    TR::IlType * implRet = static_cast<TR::IlType *>(_impl)->primitiveType(static_cast<TR::TypeDictionary *>(d != NULL ? d->_impl : NULL));
+    GET_CLIENT_OBJECT(clientObj, IlType, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline size_t IlType::getSize() {
+    PROFILE_TIMED_CALL(188); // IlType::getSize()
+    TRACE_CALL(188); // IlType::getSize()
+    TRACE_OBJECT(this);
+    auto ret = static_cast<TR::IlType *>(_impl)->getSize();
+    TRACE_RETURN();
+    TRACE_VALUE(uint64_t, ret);
+    return ret;
+}
+
+inline bool IlType::isPointer() {
+    PROFILE_TIMED_CALL(189); // IlType::isPointer()
+    TRACE_CALL(189); // IlType::isPointer()
+    TRACE_OBJECT(this);
+    auto ret = static_cast<TR::IlType *>(_impl)->isPointer();
+    TRACE_RETURN();
+    TRACE_VALUE(uint8_t, ret);
+    return ret;
+}
+
+} // JitBuilder
+} // OMR
+
+#endif // IlType_INL_INCL
@@ -0,0 +1,74 @@
+/*******************************************************************************
+ * Copyright (c) 2026, 2026 IBM Corp. and others
+ *
+ * This program and the accompanying materials are made available under
+ * the terms of the Eclipse Public License 2.0 which accompanies this
+ * distribution and is available at http://eclipse.org/legal/epl-2.0
+ * or the Apache License, Version 2.0 which accompanies this distribution
+ * and is available at https://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * This Source Code may also be made available under the following Secondary
+ * Licenses when the conditions for such availability set forth in the
+ * Eclipse Public License, v. 2.0 are satisfied: GNU General Public License,
+ * version 2 with the GNU Classpath Exception [1] and GNU General Public
+ * License, version 2 with the OpenJDK Assembly Exception [2].
+ *
+ * [1] https://www.gnu.org/software/classpath/license.html
+ * [2] http://openjdk.java.net/legal/assembly-exception.html
+ *
+ * SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+ *******************************************************************************/
+        
+#ifndef JitBuilder_INCL
+#define JitBuilder_INCL
+
+#include "stdint.h"
+#include "stddef.h"
+
+#define TOSTR(x) #x
+#define LINETOSTR(x) TOSTR(x)
+
+#include "BytecodeBuilder.hpp"
+#include "IlBuilder.hpp"
+#include "MethodBuilder.hpp"
+#include "IlType.hpp"
+#include "IlValue.hpp"
+#include "ThunkBuilder.hpp"
+#include "TypeDictionary.hpp"
+#include "VirtualMachineOperandArray.hpp"
+#include "VirtualMachineOperandStack.hpp"
+#include "VirtualMachineRegister.hpp"
+#include "VirtualMachineRegisterInStruct.hpp"
+#include "VirtualMachineState.hpp"
+#include "Async.hpp"
+
+#include "BytecodeBuilder-inl.hpp"
+#include "IlBuilder-inl.hpp"
+#include "MethodBuilder-inl.hpp"
+#include "IlType-inl.hpp"
+#include "IlValue-inl.hpp"
+#include "ThunkBuilder-inl.hpp"
+#include "TypeDictionary-inl.hpp"
+#include "VirtualMachineOperandArray-inl.hpp"
+#include "VirtualMachineOperandStack-inl.hpp"
+#include "VirtualMachineRegister-inl.hpp"
+#include "VirtualMachineRegisterInStruct-inl.hpp"
+#include "VirtualMachineState-inl.hpp"
+
+bool initializeJit();
+bool initializeJitWithOptions(char * options);
+int32_t compileMethodBuilder(OMR::JitBuilder::MethodBuilder * methodBuilder, void ** entryPoint);
+void shutdownJit();
+
+std::future<int32_t> compileMethodBuilderAsync(OMR::JitBuilder::MethodBuilder * methodBuilder, void ** entryPoint, std::function<void(int32_t)> onComplete = std::function<void(int32_t)>());
+void setAsyncWorkerCount(size_t count);
+void waitForAsyncServices();
+
+#include "stdio.h"
+void dumpCallProfile(FILE * out, size_t count);
+void resetCallProfile();
+
+bool writeCallTrace(const char * path);
+void clearCallTrace();
+
+#endif // JitBuilder_INCL
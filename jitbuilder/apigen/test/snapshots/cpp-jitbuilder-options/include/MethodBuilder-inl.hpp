@@ -0,0 +1,220 @@
+/*******************************************************************************
+ * Copyright (c) 2026, 2026 IBM Corp. and others
+ *
+ * This program and the accompanying materials are made available under
+ * the terms of the Eclipse Public License 2.0 which accompanies this
+ * distribution and is available at http://eclipse.org/legal/epl-2.0
+ * or the Apache License, Version 2.0 which accompanies this distribution
+ * and is available at https://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * This Source Code may also be made available under the following Secondary
+ * Licenses when the conditions for such availability set forth in the
+ * Eclipse Public License, v. 2.0 are satisfied: GNU General Public License,
+ * version 2 with the GNU Classpath Exception [1] and GNU General Public
+ * License, version 2 with the OpenJDK Assembly Exception [2].
+ *
+ * [1] https://www.gnu.org/software/classpath/license.html
+ * [2] http://openjdk.java.net/legal/assembly-exception.html
+ *
+ * SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+ *******************************************************************************/
+        
+#ifndef MethodBuilder_INL_INCL
+#define MethodBuilder_INL_INCL
+
+#include "ilgen/BytecodeBuilder.hpp"
+#include "ilgen/IlBuilder.hpp"
+#include "ilgen/MethodBuilder.hpp"
+#include "ilgen/IlType.hpp"
+#include "ilgen/IlValue.hpp"
+#include "ilgen/ThunkBuilder.hpp"
+#include "ilgen/TypeDictionary.hpp"
+#include "ilgen/VirtualMachineOperandArray.hpp"
+#include "ilgen/VirtualMachineOperandStack.hpp"
+#include "ilgen/VirtualMachineRegister.hpp"
+#include "ilgen/VirtualMachineRegisterInStruct.hpp"
+#include "ilgen/VirtualMachineState.hpp"
+#include "Macros.hpp"
+#include "Profiling.hpp"
+#include "Tracing.hpp"
+#include "BytecodeBuilder.hpp"
+#include "IlBuilder.hpp"
+#include "MethodBuilder.hpp"
+#include "IlType.hpp"
+#include "IlValue.hpp"
+#include "ThunkBuilder.hpp"
+#include "TypeDictionary.hpp"
+#include "VirtualMachineOperandArray.hpp"
+#include "VirtualMachineOperandStack.hpp"
+#include "VirtualMachineRegister.hpp"
+#include "VirtualMachineRegisterInStruct.hpp"
+#include "VirtualMachineState.hpp"
+
+namespace OMR {
+namespace JitBuilder {
+
+inline void MethodBuilder::AllLocalsHaveBeenDefined() {
+    PROFILE_TIMED_CALL(167); // MethodBuilder::AllLocalsHaveBeenDefined()
+    TRACE_CALL(167); // MethodBuilder::AllLocalsHaveBeenDefined()
+    TRACE_OBJECT(this);
+    static_cast<TR::MethodBuilder *>(static_cast<TR::IlBuilder *>(_impl))->AllLocalsHaveBeenDefined();
+    TRACE_RETURN();
+}
+
+inline void MethodBuilder::AppendBuilder(IlBuilder * b) {
+    PROFILE_TIMED_CALL(168); // MethodBuilder::AppendBuilder(IlBuilder)
+    TRACE_CALL(168); // MethodBuilder::AppendBuilder(IlBuilder)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(b);
+    static_cast<TR::MethodBuilder *>(static_cast<TR::IlBuilder *>(_impl))->AppendBuilder(static_cast<TR::IlBuilder *>(b != NULL ? b->_impl : NULL));
+    TRACE_RETURN();
+}
+
+inline void MethodBuilder::AppendBuilder(BytecodeBuilder * b) {
+    PROFILE_TIMED_CALL(169); // MethodBuilder::AppendBuilder(BytecodeBuilder)
+    TRACE_CALL(169); // MethodBuilder::AppendBuilder(BytecodeBuilder)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(b);
+    static_cast<TR::MethodBuilder *>(static_cast<TR::IlBuilder *>(_impl))->AppendBuilder(static_cast<TR::BytecodeBuilder *>(static_cast<TR::IlBuilder *>(b != NULL ? b->_impl : NULL)));
+    TRACE_RETURN();
+}
+
+inline void MethodBuilder::AppendBytecodeBuilder(BytecodeBuilder * b) {
+    PROFILE_TIMED_CALL(170); // MethodBuilder::AppendBytecodeBuilder(BytecodeBuilder)
+    TRACE_CALL(170); // MethodBuilder::AppendBytecodeBuilder(BytecodeBuilder)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(b);
+    static_cast<TR::MethodBuilder *>(static_cast<TR::IlBuilder *>(_impl))->AppendBytecodeBuilder(static_cast<TR::BytecodeBuilder *>(static_cast<TR::IlBuilder *>(b != NULL ? b->_impl : NULL)));
+    TRACE_RETURN();
+}
+
+inline void MethodBuilder::DefineFile(const char * fileName) {
+    PROFILE_TIMED_CALL(171); // MethodBuilder::DefineFile(constString)
+    TRACE_CALL(171); // MethodBuilder::DefineFile(constString)
+    TRACE_OBJECT(this);
+    TRACE_STRING(fileName);
+    static_cast<TR::MethodBuilder *>(static_cast<TR::IlBuilder *>(_impl))->DefineFile(fileName);
+    TRACE_RETURN();
+}
+
+inline void MethodBuilder::DefineLine(const char * line) {
+    PROFILE_TIMED_CALL(172); // MethodBuilder::DefineLine(constString)
+    TRACE_CALL(172); // MethodBuilder::DefineLine(constString)
+    TRACE_OBJECT(this);
+    TRACE_STRING(line);
+    static_cast<TR::MethodBuilder *>(static_cast<TR::IlBuilder *>(_impl))->DefineLine(line);
+    TRACE_RETURN();
+}
+
+inline void MethodBuilder::DefineLine(int32_t line) {
+    PROFILE_TIMED_CALL(173); // MethodBuilder::DefineLine(int32)
+    TRACE_CALL(173); // MethodBuilder::DefineLine(int32)
+    TRACE_OBJECT(this);
+    TRACE_VALUE(int32_t, line);
+    static_cast<TR::MethodBuilder *>(static_cast<TR::IlBuilder *>(_impl))->DefineLine(line);
+    TRACE_RETURN();
+}
+
+inline void MethodBuilder::DefineName(const char * name) {
+    PROFILE_TIMED_CALL(174); // MethodBuilder::DefineName(constString)
+    TRACE_CALL(174); // MethodBuilder::DefineName(constString)
+    TRACE_OBJECT(this);
+    TRACE_STRING(name);
+    static_cast<TR::MethodBuilder *>(static_cast<TR::IlBuilder *>(_impl))->DefineName(name);
+    TRACE_RETURN();
+}
+
+inline void MethodBuilder::DefineParameter(const char * name, IlType * type) {
+    PROFILE_TIMED_CALL(175); // MethodBuilder::DefineParameter(constString, IlType)
+    TRACE_CALL(175); // MethodBuilder::DefineParameter(constString, IlType)
+    TRACE_OBJECT(this);
+    TRACE_STRING(name);
+    TRACE_OBJECT(type);
+    static_cast<TR::MethodBuilder *>(static_cast<TR::IlBuilder *>(_impl))->DefineParameter(name, static_cast<TR::IlType *>(type != NULL ? type->_impl : NULL));
+    TRACE_RETURN();
+}
+
+inline void MethodBuilder::DefineArrayParameter(const char * name, IlType * type) {
+    PROFILE_TIMED_CALL(176); // MethodBuilder::DefineArrayParameter(constString, IlType)
+    TRACE_CALL(176); // MethodBuilder::DefineArrayParameter(constString, IlType)
+    TRACE_OBJECT(this);
+    TRACE_STRING(name);
+    TRACE_OBJECT(type);
+    static_cast<TR::MethodBuilder *>(static_cast<TR::IlBuilder *>(_impl))->DefineArrayParameter(name, static_cast<TR::IlType *>(type != NULL ? type->_impl : NULL));
+    TRACE_RETURN();
+}
+
+inline void MethodBuilder::DefineReturnType(IlType * type) {
+    PROFILE_TIMED_CALL(177); // MethodBuilder::DefineReturnType(IlType)
+    TRACE_CALL(177); // MethodBuilder::DefineReturnType(IlType)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(type);
+    static_cast<TR::MethodBuilder *>(static_cast<TR::IlBuilder *>(_impl))->DefineReturnType(static_cast<TR::IlType *>(type != NULL ? type->_impl : NULL));
+    TRACE_RETURN();
+}
+
+inline void MethodBuilder::DefineLocal(const char * name, IlType * type) {
+    PROFILE_TIMED_CALL(178); // MethodBuilder::DefineLocal(constString, IlType)
+    TRACE_CALL(178); // MethodBuilder::DefineLocal(constString, IlType)
+    TRACE_OBJECT(this);
+    TRACE_STRING(name);
+    TRACE_OBJECT(type);
+    static_cast<TR::MethodBuilder *>(static_cast<TR::IlBuilder *>(_impl))->DefineLocal(name, static_cast<TR::IlType *>(type != NULL ? type->_impl : NULL));
+    TRACE_RETURN();
+}
+
+inline void MethodBuilder::DefineGlobal(const char * name, IlType * type, void * location) {
+    PROFILE_TIMED_CALL(179); // MethodBuilder::DefineGlobal(constString, IlType, pointer)
+    TRACE_CALL(179); // MethodBuilder::DefineGlobal(constString, IlType, pointer)
+    TRACE_OBJECT(this);
+    TRACE_STRING(name);
+    TRACE_OBJECT(type);
+    TRACE_POINTER(location);
+    static_cast<TR::MethodBuilder *>(static_cast<TR::IlBuilder *>(_impl))->DefineGlobal(name, static_cast<TR::IlType *>(type != NULL ? type->_impl : NULL), location);
+    TRACE_RETURN();
+}
+
+inline void MethodBuilder::DefineMemory(const char * name, IlType * type, void * location) {
+    PROFILE_TIMED_CALL(180); // MethodBuilder::DefineMemory(constString, IlType, pointer)
+    TRACE_CALL(180); // MethodBuilder::DefineMemory(constString, IlType, pointer)
+    TRACE_OBJECT(this);
+    TRACE_STRING(name);
+    TRACE_OBJECT(type);
+    TRACE_POINTER(location);
+    static_cast<TR::MethodBuilder *>(static_cast<TR::IlBuilder *>(_impl))->DefineMemory(name, static_cast<TR::IlType *>(type != NULL ? type->_impl : NULL), location);
+    TRACE_RETURN();
+}
+
+inline const char * MethodBuilder::GetMethodName() {
+    PROFILE_TIMED_CALL(182); // MethodBuilder::GetMethodName()
+    TRACE_CALL(182); // MethodBuilder::GetMethodName()
+    TRACE_OBJECT(this);
+    auto ret = static_cast<TR::MethodBuilder *>(static_cast<TR::IlBuilder *>(_impl))->GetMethodName();
+    TRACE_RETURN();
+    TRACE_STRING(ret);
+    return ret;
+}
+
+inline int32_t MethodBuilder::GetNextBytecodeFromWorklist() {
+    PROFILE_TIMED_CALL(183); // MethodBuilder::GetNextBytecodeFromWorklist()
+    TRACE_CALL(183); // MethodBuilder::GetNextBytecodeFromWorklist()
+    TRACE_OBJECT(this);
+    auto ret = static_cast<TR::MethodBuilder *>(static_cast<TR::IlBuilder *>(_impl))->GetNextBytecodeFromWorklist();
+    TRACE_RETURN();
+    TRACE_VALUE(int32_t, ret);
+    return ret;
+}
+
+inline void MethodBuilder::setVMState(VirtualMachineState * vmState) {
+    PROFILE_TIMED_CALL(184); // MethodBuilder::setVMState(VirtualMachineState)
+    TRACE_CALL(184); // MethodBuilder::setVMState(VirtualMachineState)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(vmState);
+    static_cast<TR::MethodBuilder *>(static_cast<TR::IlBuilder *>(_impl))->setVMState(static_cast<TR::VirtualMachineState *>(vmState != NULL ? vmState->_impl : NULL));
+    TRACE_RETURN();
+}
+
+} // JitBuilder
+} // OMR
+
+#endif // MethodBuilder_INL_INCL
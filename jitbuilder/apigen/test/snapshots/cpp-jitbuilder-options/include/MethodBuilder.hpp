@@ -0,0 +1,105 @@
+/*******************************************************************************
+ * Copyright (c) 2026, 2026 IBM Corp. and others
+ *
+ * This program and the accompanying materials are made available under
+ * the terms of the Eclipse Public License 2.0 which accompanies this
+ * distribution and is available at http://eclipse.org/legal/epl-2.0
+ * or the Apache License, Version 2.0 which accompanies this distribution
+ * and is available at https://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * This Source Code may also be made available under the following Secondary
+ * Licenses when the conditions for such availability set forth in the
+ * Eclipse Public License, v. 2.0 are satisfied: GNU General Public License,
+ * version 2 with the GNU Classpath Exception [1] and GNU General Public
+ * License, version 2 with the OpenJDK Assembly Exception [2].
+ *
+ * [1] https://www.gnu.org/software/classpath/license.html
+ * [2] http://openjdk.java.net/legal/assembly-exception.html
+ *
+ * SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+ *******************************************************************************/
+        
+#ifndef MethodBuilder_INCL
+#define MethodBuilder_INCL
+
+#ifndef JITBUILDER_CLASS_HEADER_OPEN
+#define JITBUILDER_CLASS_HEADER_OPEN
+#define MethodBuilder_INCL_OUTERMOST
+#endif
+
+#include "stdint.h"
+#include "stddef.h"
+#include "IlBuilder.hpp"
+
+namespace OMR {
+namespace JitBuilder {
+
+// forward declarations for all API classes
+class BytecodeBuilder;
+class IlBuilder;
+class MethodBuilder;
+class IlType;
+class IlValue;
+class ThunkBuilder;
+class TypeDictionary;
+class VirtualMachineOperandArray;
+class VirtualMachineOperandStack;
+class VirtualMachineRegister;
+class VirtualMachineRegisterInStruct;
+class VirtualMachineState;
+
+class MethodBuilder: public IlBuilder {
+    public:
+    public: MethodBuilder(TypeDictionary * dict);
+    public: MethodBuilder(TypeDictionary * dict, VirtualMachineState * vmState);
+    public: MethodBuilder(MethodBuilder * callerMB);
+    public: MethodBuilder(MethodBuilder * callerMB, VirtualMachineState * vmState);
+    public: explicit MethodBuilder(void * impl);
+    protected: void initializeFromImpl(void * impl);
+    public: ~MethodBuilder();
+    public: virtual bool RequestFunction(const char * name);
+    public: inline void AllLocalsHaveBeenDefined();
+    public: inline void AppendBuilder(IlBuilder * b);
+    public: inline void AppendBuilder(BytecodeBuilder * b);
+    public: inline void AppendBytecodeBuilder(BytecodeBuilder * b);
+    public: inline void DefineFile(const char * fileName);
+    public: inline void DefineLine(const char * line);
+    public: inline void DefineLine(int32_t line);
+    public: inline void DefineName(const char * name);
+    public: inline void DefineParameter(const char * name, IlType * type);
+    public: inline void DefineArrayParameter(const char * name, IlType * type);
+    public: inline void DefineReturnType(IlType * type);
+    public: inline void DefineLocal(const char * name, IlType * type);
+    public: inline void DefineGlobal(const char * name, IlType * type, void * location);
+    public: inline void DefineMemory(const char * name, IlType * type, void * location);
+    public: void DefineFunction(const char * name, const char * fileName, const char * lineNumber, void * entryPoint, IlType * returnType, int32_t numParms, IlType ** parmTypes);
+    public: void DefineFunction(const char * name, const char * fileName, const char * lineNumber, void * entryPoint, IlType * returnType, int32_t numParms, ...);
+    public: inline const char * GetMethodName();
+    public: inline int32_t GetNextBytecodeFromWorklist();
+    public: inline void setVMState(VirtualMachineState * vmState);
+};
+
+extern "C" void * allocateMethodBuilder(void * impl);
+extern "C" void * getImpl_MethodBuilder(void * client);
+
+} // JitBuilder
+} // OMR
+
+#ifdef MethodBuilder_INCL_OUTERMOST
+#undef MethodBuilder_INCL_OUTERMOST
+#undef JITBUILDER_CLASS_HEADER_OPEN
+#include "BytecodeBuilder-inl.hpp"
+#include "IlBuilder-inl.hpp"
+#include "MethodBuilder-inl.hpp"
+#include "IlType-inl.hpp"
+#include "IlValue-inl.hpp"
+#include "ThunkBuilder-inl.hpp"
+#include "TypeDictionary-inl.hpp"
+#include "VirtualMachineOperandArray-inl.hpp"
+#include "VirtualMachineOperandStack-inl.hpp"
+#include "VirtualMachineRegister-inl.hpp"
+#include "VirtualMachineRegisterInStruct-inl.hpp"
+#include "VirtualMachineState-inl.hpp"
+#endif
+
+#endif // MethodBuilder_INCL
@@ -0,0 +1,231 @@
+/*******************************************************************************
+ * Copyright (c) 2026, 2026 IBM Corp. and others
+ *
+ * This program and the accompanying materials are made available under
+ * the terms of the Eclipse Public License 2.0 which accompanies this
+ * distribution and is available at http://eclipse.org/legal/epl-2.0
+ * or the Apache License, Version 2.0 which accompanies this distribution
+ * and is available at https://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * This Source Code may also be made available under the following Secondary
+ * Licenses when the conditions for such availability set forth in the
+ * Eclipse Public License, v. 2.0 are satisfied: GNU General Public License,
+ * version 2 with the GNU Classpath Exception [1] and GNU General Public
+ * License, version 2 with the OpenJDK Assembly Exception [2].
+ *
+ * [1] https://www.gnu.org/software/classpath/license.html
+ * [2] http://openjdk.java.net/legal/assembly-exception.html
+ *
+ * SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+ *******************************************************************************/
+        
+#ifndef TypeDictionary_INL_INCL
+#define TypeDictionary_INL_INCL
+
+#include "ilgen/BytecodeBuilder.hpp"
+#include "ilgen/IlBuilder.hpp"
+#include "ilgen/MethodBuilder.hpp"
+#include "ilgen/IlType.hpp"
+#include "ilgen/IlValue.hpp"
+#include "ilgen/ThunkBuilder.hpp"
+#include "ilgen/TypeDictionary.hpp"
+#include "ilgen/VirtualMachineOperandArray.hpp"
+#include "ilgen/VirtualMachineOperandStack.hpp"
+#include "ilgen/VirtualMachineRegister.hpp"
+#include "ilgen/VirtualMachineRegisterInStruct.hpp"
+#include "ilgen/VirtualMachineState.hpp"
+#include "Macros.hpp"
+#include "Profiling.hpp"
+#include "Tracing.hpp"
+#include "BytecodeBuilder.hpp"
+#include "IlBuilder.hpp"
+#include "MethodBuilder.hpp"
+#include "IlType.hpp"
+#include "IlValue.hpp"
+#include "ThunkBuilder.hpp"
+#include "TypeDictionary.hpp"
+#include "VirtualMachineOperandArray.hpp"
+#include "VirtualMachineOperandStack.hpp"
+#include "VirtualMachineRegister.hpp"
+#include "VirtualMachineRegisterInStruct.hpp"
+#include "VirtualMachineState.hpp"
+
+namespace OMR {
+namespace JitBuilder {
+
+inline void TypeDictionary::CloseStruct(const char * structName) {
+    PROFILE_TIMED_CALL(193); // TypeDictionary::CloseStruct(constString)
+    TRACE_CALL(193); // TypeDictionary::CloseStruct(constString)
+    TRACE_OBJECT(this);
+    TRACE_STRING(structName);
+    static_cast<TR::TypeDictionary *>(_impl)->CloseStruct(structName);
+    TRACE_RETURN();
+}
+
+inline void TypeDictionary::CloseStruct(const char * structName, size_t size) {
+    PROFILE_TIMED_CALL(194); // TypeDictionary::CloseStruct(constString, unsignedInteger)
+    TRACE_CALL(194); // TypeDictionary::CloseStruct(constString, unsignedInteger)
+    TRACE_OBJECT(this);
+    TRACE_STRING(structName);
+    TRACE_VALUE(uint64_t, size);
+    static_cast<TR::TypeDictionary *>(_impl)->CloseStruct(structName, size);
+    TRACE_RETURN();
+}
+
+inline void TypeDictionary::CloseUnion(const char * unionName) {
+    PROFILE_TIMED_CALL(195); // TypeDictionary::CloseUnion(constString)
+    TRACE_CALL(195); // TypeDictionary::CloseUnion(constString)
+    TRACE_OBJECT(this);
+    TRACE_STRING(unionName);
+    static_cast<TR::TypeDictionary *>(_impl)->CloseUnion(unionName);
+    TRACE_RETURN();
+}
+
+inline void TypeDictionary::DefineField(const char * structName, const char * fieldName, IlType * type) {
+    PROFILE_TIMED_CALL(196); // TypeDictionary::DefineField(constString, constString, IlType)
+    TRACE_CALL(196); // TypeDictionary::DefineField(constString, constString, IlType)
+    TRACE_OBJECT(this);
+    TRACE_STRING(structName);
+    TRACE_STRING(fieldName);
+    TRACE_OBJECT(type);
+    static_cast<TR::TypeDictionary *>(_impl)->DefineField(structName, fieldName, static_cast<TR::IlType *>(type != NULL ? type->_impl : NULL));
+    TRACE_RETURN();
+}
+
+inline void TypeDictionary::DefineField(const char * structName, const char * fieldName, IlType * type, size_t offset) {
+    PROFILE_TIMED_CALL(197); // TypeDictionary::DefineField(constString, constString, IlType, unsignedInteger)
+    TRACE_CALL(197); // TypeDictionary::DefineField(constString, constString, IlType, unsignedInteger)
+    TRACE_OBJECT(this);
+    TRACE_STRING(structName);
+    TRACE_STRING(fieldName);
+    TRACE_OBJECT(type);
+    TRACE_VALUE(uint64_t, offset);
+    static_cast<TR::TypeDictionary *>(_impl)->DefineField(structName, fieldName, static_cast<TR::IlType *>(type != NULL ? type->_impl : NULL), offset);
+    TRACE_RETURN();
+}
+
+inline IlType * TypeDictionary::DefineStruct(const char * structName) {
+    PROFILE_TIMED_CALL(198); // TypeDictionary::DefineStruct(constString)
+    TRACE_CALL(198); // TypeDictionary::DefineStruct(constString)
+    TRACE_OBJECT(this);
+    TRACE_STRING(structName);
+    TR::IlType * implRet = static_cast<TR::TypeDictionary *>(_impl)->DefineStruct(structName);
+    GET_CLIENT_OBJECT(clientObj, IlType, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlType * TypeDictionary::DefineUnion(const char * unionName) {
+    PROFILE_TIMED_CALL(199); // TypeDictionary::DefineUnion(constString)
+    TRACE_CALL(199); // TypeDictionary::DefineUnion(constString)
+    TRACE_OBJECT(this);
+    TRACE_STRING(unionName);
+    TR::IlType * implRet = static_cast<TR::TypeDictionary *>(_impl)->DefineUnion(unionName);
+    GET_CLIENT_OBJECT(clientObj, IlType, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlType * TypeDictionary::GetFieldType(const char * structName, const char * fieldName) {
+    PROFILE_TIMED_CALL(200); // TypeDictionary::GetFieldType(constString, constString)
+    TRACE_CALL(200); // TypeDictionary::GetFieldType(constString, constString)
+    TRACE_OBJECT(this);
+    TRACE_STRING(structName);
+    TRACE_STRING(fieldName);
+    TR::IlType * implRet = static_cast<TR::TypeDictionary *>(_impl)->GetFieldType(structName, fieldName);
+    GET_CLIENT_OBJECT(clientObj, IlType, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlType * TypeDictionary::LookupStruct(const char * structName) {
+    PROFILE_TIMED_CALL(201); // TypeDictionary::LookupStruct(constString)
+    TRACE_CALL(201); // TypeDictionary::LookupStruct(constString)
+    TRACE_OBJECT(this);
+    TRACE_STRING(structName);
+    TR::IlType * implRet = static_cast<TR::TypeDictionary *>(_impl)->LookupStruct(structName);
+    GET_CLIENT_OBJECT(clientObj, IlType, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlType * TypeDictionary::LookupUnion(const char * unionName) {
+    PROFILE_TIMED_CALL(202); // TypeDictionary::LookupUnion(constString)
+    TRACE_CALL(202); // TypeDictionary::LookupUnion(constString)
+    TRACE_OBJECT(this);
+    TRACE_STRING(unionName);
+    TR::IlType * implRet = static_cast<TR::TypeDictionary *>(_impl)->LookupUnion(unionName);
+    GET_CLIENT_OBJECT(clientObj, IlType, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline size_t TypeDictionary::OffsetOf(const char * structName, const char * fieldName) {
+    PROFILE_TIMED_CALL(203); // TypeDictionary::OffsetOf(constString, constString)
+    TRACE_CALL(203); // TypeDictionary::OffsetOf(constString, constString)
+    TRACE_OBJECT(this);
+    TRACE_STRING(structName);
+    TRACE_STRING(fieldName);
+    auto ret = static_cast<TR::TypeDictionary *>(_impl)->OffsetOf(structName, fieldName);
+    TRACE_RETURN();
+    TRACE_VALUE(uint64_t, ret);
+    return ret;
+}
+
+inline IlType * TypeDictionary::PointerTo(IlType * baseType) {
+    PROFILE_TIMED_CALL(204); // TypeDictionary::PointerTo(IlType)
+    TRACE_CALL(204); // TypeDictionary::PointerTo(IlType)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(baseType);
+    TR::IlType * implRet = static_cast<TR::TypeDictionary *>(_impl)->PointerTo(static_cast<TR::IlType *>(baseType != NULL ? baseType->_impl : NULL));
+    GET_CLIENT_OBJECT(clientObj, IlType, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlType * TypeDictionary::PointerTo(const char * structName) {
+    PROFILE_TIMED_CALL(205); // TypeDictionary::PointerTo(constString)
+    TRACE_CALL(205); // TypeDictionary::PointerTo(constString)
+    TRACE_OBJECT(this);
+    TRACE_STRING(structName);
+    TR::IlType * implRet = static_cast<TR::TypeDictionary *>(_impl)->PointerTo(structName);
+    GET_CLIENT_OBJECT(clientObj, IlType, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline void TypeDictionary::UnionField(const char * unionName, const char * fieldName, IlType * fieldType) {
+    PROFILE_TIMED_CALL(206); // TypeDictionary::UnionField(constString, constString, IlType)
+    TRACE_CALL(206); // TypeDictionary::UnionField(constString, constString, IlType)
+    TRACE_OBJECT(this);
+    TRACE_STRING(unionName);
+    TRACE_STRING(fieldName);
+    TRACE_OBJECT(fieldType);
+    static_cast<TR::TypeDictionary *>(_impl)->UnionField(unionName, fieldName, static_cast<TR::IlType *>(fieldType != NULL ? fieldType->_impl : NULL));
+    TRACE_RETURN();
+}
+
+inline IlType * TypeDictionary::UnionFieldType(const char * unionName, const char * fieldName) {
+    PROFILE_TIMED_CALL(207); // TypeDictionary::UnionFieldType(constString, constString)
+    TRACE_CALL(207); // TypeDictionary::UnionFieldType(constString, constString)
+    TRACE_OBJECT(this);
+    TRACE_STRING(unionName);
+    TRACE_STRING(fieldName);
+    TR::IlType * implRet = static_cast<TR::TypeDictionary *>(_impl)->UnionFieldType(unionName, fieldName);
+    GET_CLIENT_OBJECT(clientObj, IlType, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+} // JitBuilder
+} // OMR
+
+#endif // TypeDictionary_INL_INCL
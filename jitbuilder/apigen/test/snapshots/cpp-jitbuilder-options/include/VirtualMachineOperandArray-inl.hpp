@@ -0,0 +1,102 @@
+/*******************************************************************************
+ * Copyright (c) 2026, 2026 IBM Corp. and others
+ *
+ * This program and the accompanying materials are made available under
+ * the terms of the Eclipse Public License 2.0 which accompanies this
+ * distribution and is available at http://eclipse.org/legal/epl-2.0
+ * or the Apache License, Version 2.0 which accompanies this distribution
+ * and is available at https://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * This Source Code may also be made available under the following Secondary
+ * Licenses when the conditions for such availability set forth in the
+ * Eclipse Public License, v. 2.0 are satisfied: GNU General Public License,
+ * version 2 with the GNU Classpath Exception [1] and GNU General Public
+ * License, version 2 with the OpenJDK Assembly Exception [2].
+ *
+ * [1] https://www.gnu.org/software/classpath/license.html
+ * [2] http://openjdk.java.net/legal/assembly-exception.html
+ *
+ * SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+ *******************************************************************************/
+        
+#ifndef VirtualMachineOperandArray_INL_INCL
+#define VirtualMachineOperandArray_INL_INCL
+
+#include "ilgen/BytecodeBuilder.hpp"
+#include "ilgen/IlBuilder.hpp"
+#include "ilgen/MethodBuilder.hpp"
+#include "ilgen/IlType.hpp"
+#include "ilgen/IlValue.hpp"
+#include "ilgen/ThunkBuilder.hpp"
+#include "ilgen/TypeDictionary.hpp"
+#include "ilgen/VirtualMachineOperandArray.hpp"
+#include "ilgen/VirtualMachineOperandStack.hpp"
+#include "ilgen/VirtualMachineRegister.hpp"
+#include "ilgen/VirtualMachineRegisterInStruct.hpp"
+#include "ilgen/VirtualMachineState.hpp"
+#include "Macros.hpp"
+#include "Profiling.hpp"
+#include "Tracing.hpp"
+#include "BytecodeBuilder.hpp"
+#include "IlBuilder.hpp"
+#include "MethodBuilder.hpp"
+#include "IlType.hpp"
+#include "IlValue.hpp"
+#include "ThunkBuilder.hpp"
+#include "TypeDictionary.hpp"
+#include "VirtualMachineOperandArray.hpp"
+#include "VirtualMachineOperandStack.hpp"
+#include "VirtualMachineRegister.hpp"
+#include "VirtualMachineRegisterInStruct.hpp"
+#include "VirtualMachineState.hpp"
+
+namespace OMR {
+namespace JitBuilder {
+
+inline IlValue * VirtualMachineOperandArray::Get(int32_t index) {
+    PROFILE_TIMED_CALL(218); // VirtualMachineOperandArray::Get(int32)
+    TRACE_CALL(218); // VirtualMachineOperandArray::Get(int32)
+    TRACE_OBJECT(this);
+    TRACE_VALUE(int32_t, index);
+    TR::IlValue * implRet = static_cast<TR::VirtualMachineOperandArray *>(static_cast<TR::VirtualMachineState *>(_impl))->Get(index);
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline void VirtualMachineOperandArray::Move(IlBuilder * b, int32_t dstIndex, int32_t srcIndex) {
+    PROFILE_TIMED_CALL(219); // VirtualMachineOperandArray::Move(IlBuilder, int32, int32)
+    TRACE_CALL(219); // VirtualMachineOperandArray::Move(IlBuilder, int32, int32)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(b);
+    TRACE_VALUE(int32_t, dstIndex);
+    TRACE_VALUE(int32_t, srcIndex);
+    static_cast<TR::VirtualMachineOperandArray *>(static_cast<TR::VirtualMachineState *>(_impl))->Move(static_cast<TR::IlBuilder *>(b != NULL ? b->_impl : NULL), dstIndex, srcIndex);
+    TRACE_RETURN();
+}
+
+inline void VirtualMachineOperandArray::Set(int32_t index, IlValue * value) {
+    PROFILE_TIMED_CALL(220); // VirtualMachineOperandArray::Set(int32, IlValue)
+    TRACE_CALL(220); // VirtualMachineOperandArray::Set(int32, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_VALUE(int32_t, index);
+    TRACE_OBJECT(value);
+    static_cast<TR::VirtualMachineOperandArray *>(static_cast<TR::VirtualMachineState *>(_impl))->Set(index, static_cast<TR::IlValue *>(value != NULL ? value->_impl : NULL));
+    TRACE_RETURN();
+}
+
+inline void VirtualMachineOperandArray::UpdateArray(IlBuilder * b, IlValue * array) {
+    PROFILE_TIMED_CALL(221); // VirtualMachineOperandArray::UpdateArray(IlBuilder, IlValue)
+    TRACE_CALL(221); // VirtualMachineOperandArray::UpdateArray(IlBuilder, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(b);
+    TRACE_OBJECT(array);
+    static_cast<TR::VirtualMachineOperandArray *>(static_cast<TR::VirtualMachineState *>(_impl))->UpdateArray(static_cast<TR::IlBuilder *>(b != NULL ? b->_impl : NULL), static_cast<TR::IlValue *>(array != NULL ? array->_impl : NULL));
+    TRACE_RETURN();
+}
+
+} // JitBuilder
+} // OMR
+
+#endif // VirtualMachineOperandArray_INL_INCL
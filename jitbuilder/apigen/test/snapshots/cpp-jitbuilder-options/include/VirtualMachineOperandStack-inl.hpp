@@ -0,0 +1,133 @@
+/*******************************************************************************
+ * Copyright (c) 2026, 2026 IBM Corp. and others
+ *
+ * This program and the accompanying materials are made available under
+ * the terms of the Eclipse Public License 2.0 which accompanies this
+ * distribution and is available at http://eclipse.org/legal/epl-2.0
+ * or the Apache License, Version 2.0 which accompanies this distribution
+ * and is available at https://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * This Source Code may also be made available under the following Secondary
+ * Licenses when the conditions for such availability set forth in the
+ * Eclipse Public License, v. 2.0 are satisfied: GNU General Public License,
+ * version 2 with the GNU Classpath Exception [1] and GNU General Public
+ * License, version 2 with the OpenJDK Assembly Exception [2].
+ *
+ * [1] https://www.gnu.org/software/classpath/license.html
+ * [2] http://openjdk.java.net/legal/assembly-exception.html
+ *
+ * SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+ *******************************************************************************/
+        
+#ifndef VirtualMachineOperandStack_INL_INCL
+#define VirtualMachineOperandStack_INL_INCL
+
+#include "ilgen/BytecodeBuilder.hpp"
+#include "ilgen/IlBuilder.hpp"
+#include "ilgen/MethodBuilder.hpp"
+#include "ilgen/IlType.hpp"
+#include "ilgen/IlValue.hpp"
+#include "ilgen/ThunkBuilder.hpp"
+#include "ilgen/TypeDictionary.hpp"
+#include "ilgen/VirtualMachineOperandArray.hpp"
+#include "ilgen/VirtualMachineOperandStack.hpp"
+#include "ilgen/VirtualMachineRegister.hpp"
+#include "ilgen/VirtualMachineRegisterInStruct.hpp"
+#include "ilgen/VirtualMachineState.hpp"
+#include "Macros.hpp"
+#include "Profiling.hpp"
+#include "Tracing.hpp"
+#include "BytecodeBuilder.hpp"
+#include "IlBuilder.hpp"
+#include "MethodBuilder.hpp"
+#include "IlType.hpp"
+#include "IlValue.hpp"
+#include "ThunkBuilder.hpp"
+#include "TypeDictionary.hpp"
+#include "VirtualMachineOperandArray.hpp"
+#include "VirtualMachineOperandStack.hpp"
+#include "VirtualMachineRegister.hpp"
+#include "VirtualMachineRegisterInStruct.hpp"
+#include "VirtualMachineState.hpp"
+
+namespace OMR {
+namespace JitBuilder {
+
+inline void VirtualMachineOperandStack::Drop(IlBuilder * b, int32_t depth) {
+    PROFILE_TIMED_CALL(233); // VirtualMachineOperandStack::Drop(IlBuilder, int32)
+    TRACE_CALL(233); // VirtualMachineOperandStack::Drop(IlBuilder, int32)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(b);
+    TRACE_VALUE(int32_t, depth);
+    static_cast<TR::VirtualMachineOperandStack *>(static_cast<TR::VirtualMachineState *>(_impl))->Drop(static_cast<TR::IlBuilder *>(b != NULL ? b->_impl : NULL), depth);
+    TRACE_RETURN();
+}
+
+inline void VirtualMachineOperandStack::Dup(IlBuilder * b) {
+    PROFILE_TIMED_CALL(234); // VirtualMachineOperandStack::Dup(IlBuilder)
+    TRACE_CALL(234); // VirtualMachineOperandStack::Dup(IlBuilder)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(b);
+    static_cast<TR::VirtualMachineOperandStack *>(static_cast<TR::VirtualMachineState *>(_impl))->Dup(static_cast<TR::IlBuilder *>(b != NULL ? b->_impl : NULL));
+    TRACE_RETURN();
+}
+
+inline IlValue * VirtualMachineOperandStack::Pick(int32_t depth) {
+    PROFILE_TIMED_CALL(235); // VirtualMachineOperandStack::Pick(int32)
+    TRACE_CALL(235); // VirtualMachineOperandStack::Pick(int32)
+    TRACE_OBJECT(this);
+    TRACE_VALUE(int32_t, depth);
+    TR::IlValue * implRet = static_cast<TR::VirtualMachineOperandStack *>(static_cast<TR::VirtualMachineState *>(_impl))->Pick(depth);
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline IlValue * VirtualMachineOperandStack::Pop(IlBuilder * b) {
+    PROFILE_TIMED_CALL(236); // VirtualMachineOperandStack::Pop(IlBuilder)
+    TRACE_CALL(236); // VirtualMachineOperandStack::Pop(IlBuilder)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(b);
+    TR::IlValue * implRet = static_cast<TR::VirtualMachineOperandStack *>(static_cast<TR::VirtualMachineState *>(_impl))->Pop(static_cast<TR::IlBuilder *>(b != NULL ? b->_impl : NULL));
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline void VirtualMachineOperandStack::Push(IlBuilder * b, IlValue * value) {
+    PROFILE_TIMED_CALL(237); // VirtualMachineOperandStack::Push(IlBuilder, IlValue)
+    TRACE_CALL(237); // VirtualMachineOperandStack::Push(IlBuilder, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(b);
+    TRACE_OBJECT(value);
+    static_cast<TR::VirtualMachineOperandStack *>(static_cast<TR::VirtualMachineState *>(_impl))->Push(static_cast<TR::IlBuilder *>(b != NULL ? b->_impl : NULL), static_cast<TR::IlValue *>(value != NULL ? value->_impl : NULL));
+    TRACE_RETURN();
+}
+
+inline IlValue * VirtualMachineOperandStack::Top() {
+    PROFILE_TIMED_CALL(238); // VirtualMachineOperandStack::Top()
+    TRACE_CALL(238); // VirtualMachineOperandStack::Top()
+    TRACE_OBJECT(this);
+    TR::IlValue * implRet = static_cast<TR::VirtualMachineOperandStack *>(static_cast<TR::VirtualMachineState *>(_impl))->Top();
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline void VirtualMachineOperandStack::UpdateStack(IlBuilder * b, IlValue * array) {
+    PROFILE_TIMED_CALL(239); // VirtualMachineOperandStack::UpdateStack(IlBuilder, IlValue)
+    TRACE_CALL(239); // VirtualMachineOperandStack::UpdateStack(IlBuilder, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(b);
+    TRACE_OBJECT(array);
+    static_cast<TR::VirtualMachineOperandStack *>(static_cast<TR::VirtualMachineState *>(_impl))->UpdateStack(static_cast<TR::IlBuilder *>(b != NULL ? b->_impl : NULL), static_cast<TR::IlValue *>(array != NULL ? array->_impl : NULL));
+    TRACE_RETURN();
+}
+
+} // JitBuilder
+} // OMR
+
+#endif // VirtualMachineOperandStack_INL_INCL
@@ -0,0 +1,101 @@
+/*******************************************************************************
+ * Copyright (c) 2026, 2026 IBM Corp. and others
+ *
+ * This program and the accompanying materials are made available under
+ * the terms of the Eclipse Public License 2.0 which accompanies this
+ * distribution and is available at http://eclipse.org/legal/epl-2.0
+ * or the Apache License, Version 2.0 which accompanies this distribution
+ * and is available at https://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * This Source Code may also be made available under the following Secondary
+ * Licenses when the conditions for such availability set forth in the
+ * Eclipse Public License, v. 2.0 are satisfied: GNU General Public License,
+ * version 2 with the GNU Classpath Exception [1] and GNU General Public
+ * License, version 2 with the OpenJDK Assembly Exception [2].
+ *
+ * [1] https://www.gnu.org/software/classpath/license.html
+ * [2] http://openjdk.java.net/legal/assembly-exception.html
+ *
+ * SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+ *******************************************************************************/
+        
+#ifndef VirtualMachineRegister_INL_INCL
+#define VirtualMachineRegister_INL_INCL
+
+#include "ilgen/BytecodeBuilder.hpp"
+#include "ilgen/IlBuilder.hpp"
+#include "ilgen/MethodBuilder.hpp"
+#include "ilgen/IlType.hpp"
+#include "ilgen/IlValue.hpp"
+#include "ilgen/ThunkBuilder.hpp"
+#include "ilgen/TypeDictionary.hpp"
+#include "ilgen/VirtualMachineOperandArray.hpp"
+#include "ilgen/VirtualMachineOperandStack.hpp"
+#include "ilgen/VirtualMachineRegister.hpp"
+#include "ilgen/VirtualMachineRegisterInStruct.hpp"
+#include "ilgen/VirtualMachineState.hpp"
+#include "Macros.hpp"
+#include "Profiling.hpp"
+#include "Tracing.hpp"
+#include "BytecodeBuilder.hpp"
+#include "IlBuilder.hpp"
+#include "MethodBuilder.hpp"
+#include "IlType.hpp"
+#include "IlValue.hpp"
+#include "ThunkBuilder.hpp"
+#include "TypeDictionary.hpp"
+#include "VirtualMachineOperandArray.hpp"
+#include "VirtualMachineOperandStack.hpp"
+#include "VirtualMachineRegister.hpp"
+#include "VirtualMachineRegisterInStruct.hpp"
+#include "VirtualMachineState.hpp"
+
+namespace OMR {
+namespace JitBuilder {
+
+inline void VirtualMachineRegister::Adjust(IlBuilder * b, IlValue * amount) {
+    PROFILE_TIMED_CALL(247); // VirtualMachineRegister::Adjust(IlBuilder, IlValue)
+    TRACE_CALL(247); // VirtualMachineRegister::Adjust(IlBuilder, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(b);
+    TRACE_OBJECT(amount);
+    static_cast<TR::VirtualMachineRegister *>(static_cast<TR::VirtualMachineState *>(_impl))->Adjust(static_cast<TR::IlBuilder *>(b != NULL ? b->_impl : NULL), static_cast<TR::IlValue *>(amount != NULL ? amount->_impl : NULL));
+    TRACE_RETURN();
+}
+
+inline void VirtualMachineRegister::Adjust(IlBuilder * b, size_t amount) {
+    PROFILE_TIMED_CALL(248); // VirtualMachineRegister::Adjust(IlBuilder, unsignedInteger)
+    TRACE_CALL(248); // VirtualMachineRegister::Adjust(IlBuilder, unsignedInteger)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(b);
+    TRACE_VALUE(uint64_t, amount);
+    static_cast<TR::VirtualMachineRegister *>(static_cast<TR::VirtualMachineState *>(_impl))->Adjust(static_cast<TR::IlBuilder *>(b != NULL ? b->_impl : NULL), amount);
+    TRACE_RETURN();
+}
+
+inline IlValue * VirtualMachineRegister::Load(IlBuilder * b) {
+    PROFILE_TIMED_CALL(249); // VirtualMachineRegister::Load(IlBuilder)
+    TRACE_CALL(249); // VirtualMachineRegister::Load(IlBuilder)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(b);
+    TR::IlValue * implRet = static_cast<TR::VirtualMachineRegister *>(static_cast<TR::VirtualMachineState *>(_impl))->Load(static_cast<TR::IlBuilder *>(b != NULL ? b->_impl : NULL));
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+inline void VirtualMachineRegister::Store(IlBuilder * b, IlValue * value) {
+    PROFILE_TIMED_CALL(250); // VirtualMachineRegister::Store(IlBuilder, IlValue)
+    TRACE_CALL(250); // VirtualMachineRegister::Store(IlBuilder, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(b);
+    TRACE_OBJECT(value);
+    static_cast<TR::VirtualMachineRegister *>(static_cast<TR::VirtualMachineState *>(_impl))->Store(static_cast<TR::IlBuilder *>(b != NULL ? b->_impl : NULL), static_cast<TR::IlValue *>(value != NULL ? value->_impl : NULL));
+    TRACE_RETURN();
+}
+
+} // JitBuilder
+} // OMR
+
+#endif // VirtualMachineRegister_INL_INCL
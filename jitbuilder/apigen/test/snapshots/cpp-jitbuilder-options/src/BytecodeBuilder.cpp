@@ -0,0 +1,276 @@
+/*******************************************************************************
+ * Copyright (c) 2026, 2026 IBM Corp. and others
+ *
+ * This program and the accompanying materials are made available under
+ * the terms of the Eclipse Public License 2.0 which accompanies this
+ * distribution and is available at http://eclipse.org/legal/epl-2.0
+ * or the Apache License, Version 2.0 which accompanies this distribution
+ * and is available at https://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * This Source Code may also be made available under the following Secondary
+ * Licenses when the conditions for such availability set forth in the
+ * Eclipse Public License, v. 2.0 are satisfied: GNU General Public License,
+ * version 2 with the GNU Classpath Exception [1] and GNU General Public
+ * License, version 2 with the OpenJDK Assembly Exception [2].
+ *
+ * [1] https://www.gnu.org/software/classpath/license.html
+ * [2] http://openjdk.java.net/legal/assembly-exception.html
+ *
+ * SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+ *******************************************************************************/
+        
+#include "ilgen/BytecodeBuilder.hpp"
+#include "ilgen/IlBuilder.hpp"
+#include "ilgen/IlValue.hpp"
+#include "ilgen/VirtualMachineState.hpp"
+#include "<output>/include/Macros.hpp"
+#include "<output>/include/Profiling.hpp"
+#include "<output>/include/Tracing.hpp"
+#include "<output>/include/BytecodeBuilder.hpp"
+#include "<output>/include/IlBuilder.hpp"
+#include "<output>/include/IlValue.hpp"
+#include "<output>/include/VirtualMachineState.hpp"
+#include "<output>/include/BytecodeBuilder-inl.hpp"
+#include "<output>/include/IlBuilder-inl.hpp"
+#include "<output>/include/IlValue-inl.hpp"
+#include "<output>/include/VirtualMachineState-inl.hpp"
+
+namespace OMR {
+namespace JitBuilder {
+
+extern "C" void * getImpl_BytecodeBuilder(void * client) {
+    return static_cast<TR::BytecodeBuilder *>(static_cast<TR::IlBuilder *>(static_cast<BytecodeBuilder *>(client)->_impl));
+}
+
+
+BytecodeBuilder::BytecodeBuilder(void * impl): IlBuilder((void *)NULL) {
+    if (impl != NULL) {
+        static_cast<TR::BytecodeBuilder *>(static_cast<TR::IlBuilder *>(impl))->setClient(this);
+        initializeFromImpl(static_cast<void *>(static_cast<TR::IlBuilder *>(static_cast<TR::BytecodeBuilder *>(impl))));
+    }
+}
+
+void BytecodeBuilder::initializeFromImpl(void * impl) {
+    IlBuilder::initializeFromImpl(impl);
+}
+
+BytecodeBuilder::~BytecodeBuilder() {}
+
+void BytecodeBuilder::AddSuccessorBuilders(uint32_t numBuilders, BytecodeBuilder ** builders) {
+    PROFILE_TIMED_CALL(4); // BytecodeBuilder::AddSuccessorBuilders(uint32, BytecodeBuilder[])
+    TRACE_CALL(4); // BytecodeBuilder::AddSuccessorBuilders(uint32, BytecodeBuilder[])
+    TRACE_OBJECT(this);
+    TRACE_VALUE(uint32_t, numBuilders);
+    TRACE_ARRAY(numBuilders, builders);
+    ARRAY_ARG_SETUP(BytecodeBuilder, numBuilders, buildersArg, builders);
+    static_cast<TR::BytecodeBuilder *>(static_cast<TR::IlBuilder *>(_impl))->AddSuccessorBuilders(numBuilders, buildersArg);
+    ARRAY_ARG_RETURN(BytecodeBuilder, numBuilders, buildersArg, builders);
+    TRACE_RETURN();
+}
+
+void BytecodeBuilder::AddSuccessorBuilders(uint32_t numBuilders, ...) {
+    BytecodeBuilder ** builders = new BytecodeBuilder *[numBuilders];
+    va_list vararg;
+    va_start(vararg, numBuilders);
+    for (int i = 0; i < numBuilders; ++i) { builders[i] = va_arg(vararg, BytecodeBuilder *); }
+    va_end(vararg);
+    AddSuccessorBuilders(numBuilders, builders);
+    delete[] builders;
+}
+
+void BytecodeBuilder::AddSuccessorBuilder(BytecodeBuilder ** b) {
+    PROFILE_TIMED_CALL(5); // BytecodeBuilder::AddSuccessorBuilder(BytecodeBuilder*)
+    TRACE_CALL(5); // BytecodeBuilder::AddSuccessorBuilder(BytecodeBuilder*)
+    TRACE_OBJECT(this);
+    TRACE_IN_OUT(b);
+    ARG_SETUP(BytecodeBuilder, bImpl, bArg, b);
+    static_cast<TR::BytecodeBuilder *>(static_cast<TR::IlBuilder *>(_impl))->AddSuccessorBuilder(bArg);
+    ARG_RETURN(BytecodeBuilder, bImpl, b);
+    TRACE_RETURN();
+    TRACE_IN_OUT(b);
+}
+
+void BytecodeBuilder::Goto(BytecodeBuilder ** b) {
+    PROFILE_TIMED_CALL(7); // BytecodeBuilder::Goto(BytecodeBuilder*)
+    TRACE_CALL(7); // BytecodeBuilder::Goto(BytecodeBuilder*)
+    TRACE_OBJECT(this);
+    TRACE_IN_OUT(b);
+    ARG_SETUP(BytecodeBuilder, bImpl, bArg, b);
+    static_cast<TR::BytecodeBuilder *>(static_cast<TR::IlBuilder *>(_impl))->Goto(bArg);
+    ARG_RETURN(BytecodeBuilder, bImpl, b);
+    TRACE_RETURN();
+    TRACE_IN_OUT(b);
+}
+
+void BytecodeBuilder::IfCmpEqual(BytecodeBuilder ** target, IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(9); // BytecodeBuilder::IfCmpEqual(BytecodeBuilder*, IlValue, IlValue)
+    TRACE_CALL(9); // BytecodeBuilder::IfCmpEqual(BytecodeBuilder*, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_IN_OUT(target);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    ARG_SETUP(BytecodeBuilder, targetImpl, targetArg, target);
+    static_cast<TR::BytecodeBuilder *>(static_cast<TR::IlBuilder *>(_impl))->IfCmpEqual(targetArg, static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    ARG_RETURN(BytecodeBuilder, targetImpl, target);
+    TRACE_RETURN();
+    TRACE_IN_OUT(target);
+}
+
+void BytecodeBuilder::IfCmpLessOrEqual(BytecodeBuilder ** target, IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(11); // BytecodeBuilder::IfCmpLessOrEqual(BytecodeBuilder*, IlValue, IlValue)
+    TRACE_CALL(11); // BytecodeBuilder::IfCmpLessOrEqual(BytecodeBuilder*, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_IN_OUT(target);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    ARG_SETUP(BytecodeBuilder, targetImpl, targetArg, target);
+    static_cast<TR::BytecodeBuilder *>(static_cast<TR::IlBuilder *>(_impl))->IfCmpLessOrEqual(targetArg, static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    ARG_RETURN(BytecodeBuilder, targetImpl, target);
+    TRACE_RETURN();
+    TRACE_IN_OUT(target);
+}
+
+void BytecodeBuilder::IfCmpLessThan(BytecodeBuilder ** target, IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(13); // BytecodeBuilder::IfCmpLessThan(BytecodeBuilder*, IlValue, IlValue)
+    TRACE_CALL(13); // BytecodeBuilder::IfCmpLessThan(BytecodeBuilder*, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_IN_OUT(target);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    ARG_SETUP(BytecodeBuilder, targetImpl, targetArg, target);
+    static_cast<TR::BytecodeBuilder *>(static_cast<TR::IlBuilder *>(_impl))->IfCmpLessThan(targetArg, static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    ARG_RETURN(BytecodeBuilder, targetImpl, target);
+    TRACE_RETURN();
+    TRACE_IN_OUT(target);
+}
+
+void BytecodeBuilder::IfCmpGreaterOrEqual(BytecodeBuilder ** target, IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(15); // BytecodeBuilder::IfCmpGreaterOrEqual(BytecodeBuilder*, IlValue, IlValue)
+    TRACE_CALL(15); // BytecodeBuilder::IfCmpGreaterOrEqual(BytecodeBuilder*, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_IN_OUT(target);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    ARG_SETUP(BytecodeBuilder, targetImpl, targetArg, target);
+    static_cast<TR::BytecodeBuilder *>(static_cast<TR::IlBuilder *>(_impl))->IfCmpGreaterOrEqual(targetArg, static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    ARG_RETURN(BytecodeBuilder, targetImpl, target);
+    TRACE_RETURN();
+    TRACE_IN_OUT(target);
+}
+
+void BytecodeBuilder::IfCmpGreaterThan(BytecodeBuilder ** target, IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(17); // BytecodeBuilder::IfCmpGreaterThan(BytecodeBuilder*, IlValue, IlValue)
+    TRACE_CALL(17); // BytecodeBuilder::IfCmpGreaterThan(BytecodeBuilder*, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_IN_OUT(target);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    ARG_SETUP(BytecodeBuilder, targetImpl, targetArg, target);
+    static_cast<TR::BytecodeBuilder *>(static_cast<TR::IlBuilder *>(_impl))->IfCmpGreaterThan(targetArg, static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    ARG_RETURN(BytecodeBuilder, targetImpl, target);
+    TRACE_RETURN();
+    TRACE_IN_OUT(target);
+}
+
+void BytecodeBuilder::IfCmpNotEqual(BytecodeBuilder ** target, IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(19); // BytecodeBuilder::IfCmpNotEqual(BytecodeBuilder*, IlValue, IlValue)
+    TRACE_CALL(19); // BytecodeBuilder::IfCmpNotEqual(BytecodeBuilder*, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_IN_OUT(target);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    ARG_SETUP(BytecodeBuilder, targetImpl, targetArg, target);
+    static_cast<TR::BytecodeBuilder *>(static_cast<TR::IlBuilder *>(_impl))->IfCmpNotEqual(targetArg, static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    ARG_RETURN(BytecodeBuilder, targetImpl, target);
+    TRACE_RETURN();
+    TRACE_IN_OUT(target);
+}
+
+void BytecodeBuilder::IfCmpUnsignedLessOrEqual(BytecodeBuilder ** target, IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(21); // BytecodeBuilder::IfCmpUnsignedLessOrEqual(BytecodeBuilder*, IlValue, IlValue)
+    TRACE_CALL(21); // BytecodeBuilder::IfCmpUnsignedLessOrEqual(BytecodeBuilder*, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_IN_OUT(target);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    ARG_SETUP(BytecodeBuilder, targetImpl, targetArg, target);
+    static_cast<TR::BytecodeBuilder *>(static_cast<TR::IlBuilder *>(_impl))->IfCmpUnsignedLessOrEqual(targetArg, static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    ARG_RETURN(BytecodeBuilder, targetImpl, target);
+    TRACE_RETURN();
+    TRACE_IN_OUT(target);
+}
+
+void BytecodeBuilder::IfCmpUnsignedLessThan(BytecodeBuilder ** target, IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(23); // BytecodeBuilder::IfCmpUnsignedLessThan(BytecodeBuilder*, IlValue, IlValue)
+    TRACE_CALL(23); // BytecodeBuilder::IfCmpUnsignedLessThan(BytecodeBuilder*, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_IN_OUT(target);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    ARG_SETUP(BytecodeBuilder, targetImpl, targetArg, target);
+    static_cast<TR::BytecodeBuilder *>(static_cast<TR::IlBuilder *>(_impl))->IfCmpUnsignedLessThan(targetArg, static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    ARG_RETURN(BytecodeBuilder, targetImpl, target);
+    TRACE_RETURN();
+    TRACE_IN_OUT(target);
+}
+
+void BytecodeBuilder::IfCmpUnsignedGreaterOrEqual(BytecodeBuilder ** target, IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(25); // BytecodeBuilder::IfCmpUnsignedGreaterOrEqual(BytecodeBuilder*, IlValue, IlValue)
+    TRACE_CALL(25); // BytecodeBuilder::IfCmpUnsignedGreaterOrEqual(BytecodeBuilder*, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_IN_OUT(target);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    ARG_SETUP(BytecodeBuilder, targetImpl, targetArg, target);
+    static_cast<TR::BytecodeBuilder *>(static_cast<TR::IlBuilder *>(_impl))->IfCmpUnsignedGreaterOrEqual(targetArg, static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    ARG_RETURN(BytecodeBuilder, targetImpl, target);
+    TRACE_RETURN();
+    TRACE_IN_OUT(target);
+}
+
+void BytecodeBuilder::IfCmpUnsignedGreaterThan(BytecodeBuilder ** target, IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(27); // BytecodeBuilder::IfCmpUnsignedGreaterThan(BytecodeBuilder*, IlValue, IlValue)
+    TRACE_CALL(27); // BytecodeBuilder::IfCmpUnsignedGreaterThan(BytecodeBuilder*, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_IN_OUT(target);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    ARG_SETUP(BytecodeBuilder, targetImpl, targetArg, target);
+    static_cast<TR::BytecodeBuilder *>(static_cast<TR::IlBuilder *>(_impl))->IfCmpUnsignedGreaterThan(targetArg, static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    ARG_RETURN(BytecodeBuilder, targetImpl, target);
+    TRACE_RETURN();
+    TRACE_IN_OUT(target);
+}
+
+void BytecodeBuilder::IfCmpEqualZero(BytecodeBuilder ** target, IlValue * condition) {
+    PROFILE_TIMED_CALL(29); // BytecodeBuilder::IfCmpEqualZero(BytecodeBuilder*, IlValue)
+    TRACE_CALL(29); // BytecodeBuilder::IfCmpEqualZero(BytecodeBuilder*, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_IN_OUT(target);
+    TRACE_OBJECT(condition);
+    ARG_SETUP(BytecodeBuilder, targetImpl, targetArg, target);
+    static_cast<TR::BytecodeBuilder *>(static_cast<TR::IlBuilder *>(_impl))->IfCmpEqualZero(targetArg, static_cast<TR::IlValue *>(condition != NULL ? condition->_impl : NULL));
+    ARG_RETURN(BytecodeBuilder, targetImpl, target);
+    TRACE_RETURN();
+    TRACE_IN_OUT(target);
+}
+
+void BytecodeBuilder::IfCmpNotEqualZero(BytecodeBuilder ** target, IlValue * condition) {
+    PROFILE_TIMED_CALL(31); // BytecodeBuilder::IfCmpNotEqualZero(BytecodeBuilder*, IlValue)
+    TRACE_CALL(31); // BytecodeBuilder::IfCmpNotEqualZero(BytecodeBuilder*, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_IN_OUT(target);
+    TRACE_OBJECT(condition);
+    ARG_SETUP(BytecodeBuilder, targetImpl, targetArg, target);
+    static_cast<TR::BytecodeBuilder *>(static_cast<TR::IlBuilder *>(_impl))->IfCmpNotEqualZero(targetArg, static_cast<TR::IlValue *>(condition != NULL ? condition->_impl : NULL));
+    ARG_RETURN(BytecodeBuilder, targetImpl, target);
+    TRACE_RETURN();
+    TRACE_IN_OUT(target);
+}
+
+extern "C" void * allocateBytecodeBuilder(void * impl) {
+    return new BytecodeBuilder(impl);
+}
+
+} // JitBuilder
+} // OMR
@@ -0,0 +1,1203 @@
+/*******************************************************************************
+ * Copyright (c) 2026, 2026 IBM Corp. and others
+ *
+ * This program and the accompanying materials are made available under
+ * the terms of the Eclipse Public License 2.0 which accompanies this
+ * distribution and is available at http://eclipse.org/legal/epl-2.0
+ * or the Apache License, Version 2.0 which accompanies this distribution
+ * and is available at https://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * This Source Code may also be made available under the following Secondary
+ * Licenses when the conditions for such availability set forth in the
+ * Eclipse Public License, v. 2.0 are satisfied: GNU General Public License,
+ * version 2 with the GNU Classpath Exception [1] and GNU General Public
+ * License, version 2 with the OpenJDK Assembly Exception [2].
+ *
+ * [1] https://www.gnu.org/software/classpath/license.html
+ * [2] http://openjdk.java.net/legal/assembly-exception.html
+ *
+ * SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+ *******************************************************************************/
+        
+#include "ilgen/BytecodeBuilder.hpp"
+#include "ilgen/IlBuilder.hpp"
+#include "ilgen/MethodBuilder.hpp"
+#include "ilgen/IlType.hpp"
+#include "ilgen/IlValue.hpp"
+#include "ilgen/TypeDictionary.hpp"
+#include "<output>/include/Macros.hpp"
+#include "<output>/include/Profiling.hpp"
+#include "<output>/include/Tracing.hpp"
+#include "<output>/include/BytecodeBuilder.hpp"
+#include "<output>/include/IlBuilder.hpp"
+#include "<output>/include/MethodBuilder.hpp"
+#include "<output>/include/IlType.hpp"
+#include "<output>/include/IlValue.hpp"
+#include "<output>/include/TypeDictionary.hpp"
+#include "<output>/include/BytecodeBuilder-inl.hpp"
+#include "<output>/include/IlBuilder-inl.hpp"
+#include "<output>/include/MethodBuilder-inl.hpp"
+#include "<output>/include/IlType-inl.hpp"
+#include "<output>/include/IlValue-inl.hpp"
+#include "<output>/include/TypeDictionary-inl.hpp"
+
+namespace OMR {
+namespace JitBuilder {
+
+extern "C" void * getImpl_JBCase(void * client) {
+    return static_cast<TR::IlBuilder::JBCase *>(static_cast<IlBuilder::JBCase *>(client)->_impl);
+}
+
+IlBuilder::JBCase::JBCase(int32_t caseValue, IlBuilder * caseBuilder, int32_t caseFallsThrough) {
+    PROFILE_TIMED_CALL(32); // IlBuilder::JBCase::JBCase(int32, IlBuilder, int32)
+    TRACE_CALL(32); // IlBuilder::JBCase::JBCase(int32, IlBuilder, int32)
+    TRACE_VALUE(int32_t, caseValue);
+    TRACE_OBJECT(caseBuilder);
+    TRACE_VALUE(int32_t, caseFallsThrough);
+    auto * impl = ::new TR::IlBuilder::JBCase(caseValue, static_cast<TR::IlBuilder *>(caseBuilder != NULL ? caseBuilder->_impl : NULL), caseFallsThrough);
+    static_cast<TR::IlBuilder::JBCase *>(impl)->setClient(this);
+    initializeFromImpl(static_cast<void *>(impl));
+    TRACE_RETURN();
+    TRACE_OBJECT(this);
+}
+
+IlBuilder::JBCase::JBCase(void * impl) {
+    if (impl != NULL) {
+        static_cast<TR::IlBuilder::JBCase *>(impl)->setClient(this);
+        initializeFromImpl(impl);
+    }
+}
+
+void IlBuilder::JBCase::initializeFromImpl(void * impl) {
+    _impl = impl;
+}
+
+IlBuilder::JBCase::~JBCase() {}
+
+extern "C" void * allocateIlBuilderJBCase(void * impl) {
+    return new IlBuilder::JBCase(impl);
+}
+
+extern "C" void * getImpl_JBCondition(void * client) {
+    return static_cast<TR::IlBuilder::JBCondition *>(static_cast<IlBuilder::JBCondition *>(client)->_impl);
+}
+
+IlBuilder::JBCondition::JBCondition(IlBuilder * conditionBuilder, IlValue * conditionValue) {
+    PROFILE_TIMED_CALL(33); // IlBuilder::JBCondition::JBCondition(IlBuilder, IlValue)
+    TRACE_CALL(33); // IlBuilder::JBCondition::JBCondition(IlBuilder, IlValue)
+    TRACE_OBJECT(conditionBuilder);
+    TRACE_OBJECT(conditionValue);
+    auto * impl = ::new TR::IlBuilder::JBCondition(static_cast<TR::IlBuilder *>(conditionBuilder != NULL ? conditionBuilder->_impl : NULL), static_cast<TR::IlValue *>(conditionValue != NULL ? conditionValue->_impl : NULL));
+    static_cast<TR::IlBuilder::JBCondition *>(impl)->setClient(this);
+    initializeFromImpl(static_cast<void *>(impl));
+    TRACE_RETURN();
+    TRACE_OBJECT(this);
+}
+
+IlBuilder::JBCondition::JBCondition(void * impl) {
+    if (impl != NULL) {
+        static_cast<TR::IlBuilder::JBCondition *>(impl)->setClient(this);
+        initializeFromImpl(impl);
+    }
+}
+
+void IlBuilder::JBCondition::initializeFromImpl(void * impl) {
+    _impl = impl;
+}
+
+IlBuilder::JBCondition::~JBCondition() {}
+
+extern "C" void * allocateIlBuilderJBCondition(void * impl) {
+    return new IlBuilder::JBCondition(impl);
+}
+
+extern "C" bool IlBuilderCallback_buildIL(void * clientObj) {
+    PROFILE_TIMED_CALL(34); // IlBuilder::buildIL() [thunk]
+    IlBuilder * client = static_cast<IlBuilder *>(clientObj);
+    TRACE_CALL(34); // IlBuilder::buildIL() [thunk]
+    TRACE_OBJECT(client);
+    bool ret = client->buildIL();
+    TRACE_RETURN();
+    TRACE_VALUE(uint8_t, ret);
+    return ret;
+}
+
+extern "C" void * getImpl_IlBuilder(void * client) {
+    return static_cast<TR::IlBuilder *>(static_cast<IlBuilder *>(client)->_impl);
+}
+
+
+IlBuilder::IlBuilder(void * impl) {
+    if (impl != NULL) {
+        static_cast<TR::IlBuilder *>(impl)->setClient(this);
+        initializeFromImpl(impl);
+    }
+}
+
+void IlBuilder::initializeFromImpl(void * impl) {
+    _impl = impl;
+    GET_CLIENT_OBJECT(clientObj_NoType, IlType, static_cast<TR::IlBuilder *>(_impl)->NoType);
+    NoType = clientObj_NoType;
+    GET_CLIENT_OBJECT(clientObj_Int8, IlType, static_cast<TR::IlBuilder *>(_impl)->Int8);
+    Int8 = clientObj_Int8;
+    GET_CLIENT_OBJECT(clientObj_Int16, IlType, static_cast<TR::IlBuilder *>(_impl)->Int16);
+    Int16 = clientObj_Int16;
+    GET_CLIENT_OBJECT(clientObj_Int32, IlType, static_cast<TR::IlBuilder *>(_impl)->Int32);
+    Int32 = clientObj_Int32;
+    GET_CLIENT_OBJECT(clientObj_Int64, IlType, static_cast<TR::IlBuilder *>(_impl)->Int64);
+    Int64 = clientObj_Int64;
+    GET_CLIENT_OBJECT(clientObj_Float, IlType, static_cast<TR::IlBuilder *>(_impl)->Float);
+    Float = clientObj_Float;
+    GET_CLIENT_OBJECT(clientObj_Double, IlType, static_cast<TR::IlBuilder *>(_impl)->Double);
+    Double = clientObj_Double;
+    GET_CLIENT_OBJECT(clientObj_Address, IlType, static_cast<TR::IlBuilder *>(_impl)->Address);
+    Address = clientObj_Address;
+    GET_CLIENT_OBJECT(clientObj_VectorInt8, IlType, static_cast<TR::IlBuilder *>(_impl)->VectorInt8);
+    VectorInt8 = clientObj_VectorInt8;
+    GET_CLIENT_OBJECT(clientObj_VectorInt16, IlType, static_cast<TR::IlBuilder *>(_impl)->VectorInt16);
+    VectorInt16 = clientObj_VectorInt16;
+    GET_CLIENT_OBJECT(clientObj_VectorInt32, IlType, static_cast<TR::IlBuilder *>(_impl)->VectorInt32);
+    VectorInt32 = clientObj_VectorInt32;
+    GET_CLIENT_OBJECT(clientObj_VectorInt64, IlType, static_cast<TR::IlBuilder *>(_impl)->VectorInt64);
+    VectorInt64 = clientObj_VectorInt64;
+    GET_CLIENT_OBJECT(clientObj_VectorFloat, IlType, static_cast<TR::IlBuilder *>(_impl)->VectorFloat);
+    VectorFloat = clientObj_VectorFloat;
+    GET_CLIENT_OBJECT(clientObj_VectorDouble, IlType, static_cast<TR::IlBuilder *>(_impl)->VectorDouble);
+    VectorDouble = clientObj_VectorDouble;
+    GET_CLIENT_OBJECT(clientObj_Word, IlType, static_cast<TR::IlBuilder *>(_impl)->Word);
+    Word = clientObj_Word;
+    TRACE_FIELDS(3, this);
+    TRACE_OBJECT(NoType);
+    TRACE_OBJECT(Int8);
+    TRACE_OBJECT(Int16);
+    TRACE_OBJECT(Int32);
+    TRACE_OBJECT(Int64);
+    TRACE_OBJECT(Float);
+    TRACE_OBJECT(Double);
+    TRACE_OBJECT(Address);
+    TRACE_OBJECT(VectorInt8);
+    TRACE_OBJECT(VectorInt16);
+    TRACE_OBJECT(VectorInt32);
+    TRACE_OBJECT(VectorInt64);
+    TRACE_OBJECT(VectorFloat);
+    TRACE_OBJECT(VectorDouble);
+    TRACE_OBJECT(Word);
+    static_cast<TR::IlBuilder *>(_impl)->setClientCallback_buildIL(reinterpret_cast<void*>(&IlBuilderCallback_buildIL));
+}
+
+IlBuilder::~IlBuilder() {}
+
+IlValue * IlBuilder::AddWithOverflow(IlBuilder ** overflowHandler, IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(58); // IlBuilder::AddWithOverflow(IlBuilder*, IlValue, IlValue)
+    TRACE_CALL(58); // IlBuilder::AddWithOverflow(IlBuilder*, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_IN_OUT(overflowHandler);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    ARG_SETUP(IlBuilder, overflowHandlerImpl, overflowHandlerArg, overflowHandler);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->AddWithOverflow(overflowHandlerArg, static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    ARG_RETURN(IlBuilder, overflowHandlerImpl, overflowHandler);
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    TRACE_IN_OUT(overflowHandler);
+    return clientObj;
+}
+
+IlValue * IlBuilder::AddWithUnsignedOverflow(IlBuilder ** overflowHandler, IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(59); // IlBuilder::AddWithUnsignedOverflow(IlBuilder*, IlValue, IlValue)
+    TRACE_CALL(59); // IlBuilder::AddWithUnsignedOverflow(IlBuilder*, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_IN_OUT(overflowHandler);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    ARG_SETUP(IlBuilder, overflowHandlerImpl, overflowHandlerArg, overflowHandler);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->AddWithUnsignedOverflow(overflowHandlerArg, static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    ARG_RETURN(IlBuilder, overflowHandlerImpl, overflowHandler);
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    TRACE_IN_OUT(overflowHandler);
+    return clientObj;
+}
+
+IlValue * IlBuilder::MulWithOverflow(IlBuilder ** overflowHandler, IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(65); // IlBuilder::MulWithOverflow(IlBuilder*, IlValue, IlValue)
+    TRACE_CALL(65); // IlBuilder::MulWithOverflow(IlBuilder*, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_IN_OUT(overflowHandler);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    ARG_SETUP(IlBuilder, overflowHandlerImpl, overflowHandlerArg, overflowHandler);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->MulWithOverflow(overflowHandlerArg, static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    ARG_RETURN(IlBuilder, overflowHandlerImpl, overflowHandler);
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    TRACE_IN_OUT(overflowHandler);
+    return clientObj;
+}
+
+IlValue * IlBuilder::SubWithOverflow(IlBuilder ** overflowHandler, IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(73); // IlBuilder::SubWithOverflow(IlBuilder*, IlValue, IlValue)
+    TRACE_CALL(73); // IlBuilder::SubWithOverflow(IlBuilder*, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_IN_OUT(overflowHandler);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    ARG_SETUP(IlBuilder, overflowHandlerImpl, overflowHandlerArg, overflowHandler);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->SubWithOverflow(overflowHandlerArg, static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    ARG_RETURN(IlBuilder, overflowHandlerImpl, overflowHandler);
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    TRACE_IN_OUT(overflowHandler);
+    return clientObj;
+}
+
+IlValue * IlBuilder::SubWithUnsignedOverflow(IlBuilder ** overflowHandler, IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(74); // IlBuilder::SubWithUnsignedOverflow(IlBuilder*, IlValue, IlValue)
+    TRACE_CALL(74); // IlBuilder::SubWithUnsignedOverflow(IlBuilder*, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_IN_OUT(overflowHandler);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    ARG_SETUP(IlBuilder, overflowHandlerImpl, overflowHandlerArg, overflowHandler);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->SubWithUnsignedOverflow(overflowHandlerArg, static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    ARG_RETURN(IlBuilder, overflowHandlerImpl, overflowHandler);
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    TRACE_IN_OUT(overflowHandler);
+    return clientObj;
+}
+
+void IlBuilder::Transaction(IlBuilder ** persistentFailureBuilder, IlBuilder ** transientFailureBuilder, IlBuilder ** transactionBuilder) {
+    PROFILE_TIMED_CALL(100); // IlBuilder::Transaction(IlBuilder*, IlBuilder*, IlBuilder*)
+    TRACE_CALL(100); // IlBuilder::Transaction(IlBuilder*, IlBuilder*, IlBuilder*)
+    TRACE_OBJECT(this);
+    TRACE_IN_OUT(persistentFailureBuilder);
+    TRACE_IN_OUT(transientFailureBuilder);
+    TRACE_IN_OUT(transactionBuilder);
+    ARG_SETUP(IlBuilder, persistentFailureBuilderImpl, persistentFailureBuilderArg, persistentFailureBuilder);
+    ARG_SETUP(IlBuilder, transientFailureBuilderImpl, transientFailureBuilderArg, transientFailureBuilder);
+    ARG_SETUP(IlBuilder, transactionBuilderImpl, transactionBuilderArg, transactionBuilder);
+    static_cast<TR::IlBuilder *>(_impl)->Transaction(persistentFailureBuilderArg, transientFailureBuilderArg, transactionBuilderArg);
+    ARG_RETURN(IlBuilder, persistentFailureBuilderImpl, persistentFailureBuilder);
+    ARG_RETURN(IlBuilder, transientFailureBuilderImpl, transientFailureBuilder);
+    ARG_RETURN(IlBuilder, transactionBuilderImpl, transactionBuilder);
+    TRACE_RETURN();
+    TRACE_IN_OUT(persistentFailureBuilder);
+    TRACE_IN_OUT(transientFailureBuilder);
+    TRACE_IN_OUT(transactionBuilder);
+}
+
+IlValue * IlBuilder::Call(const char * name, int32_t numArgs, IlValue ** arguments) {
+    PROFILE_TIMED_CALL(109); // IlBuilder::Call(constString, int32, IlValue[])
+    TRACE_CALL(109); // IlBuilder::Call(constString, int32, IlValue[])
+    TRACE_OBJECT(this);
+    TRACE_STRING(name);
+    TRACE_VALUE(int32_t, numArgs);
+    TRACE_ARRAY(numArgs, arguments);
+    ARRAY_ARG_SETUP(IlValue, numArgs, argumentsArg, arguments);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->Call(name, numArgs, argumentsArg);
+    ARRAY_ARG_RETURN(IlValue, numArgs, argumentsArg, arguments);
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+IlValue * IlBuilder::Call(const char * name, int32_t numArgs, ...) {
+    IlValue ** arguments = new IlValue *[numArgs];
+    va_list vararg;
+    va_start(vararg, numArgs);
+    for (int i = 0; i < numArgs; ++i) { arguments[i] = va_arg(vararg, IlValue *); }
+    va_end(vararg);
+    IlValue * ret = Call(name, numArgs, arguments);
+    delete[] arguments;
+    return ret;
+}
+
+IlValue * IlBuilder::Call(MethodBuilder * name, int32_t numArgs, IlValue ** arguments) {
+    PROFILE_TIMED_CALL(110); // IlBuilder::Call(MethodBuilder, int32, IlValue[])
+    TRACE_CALL(110); // IlBuilder::Call(MethodBuilder, int32, IlValue[])
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(name);
+    TRACE_VALUE(int32_t, numArgs);
+    TRACE_ARRAY(numArgs, arguments);
+    ARRAY_ARG_SETUP(IlValue, numArgs, argumentsArg, arguments);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->Call(static_cast<TR::MethodBuilder *>(static_cast<TR::IlBuilder *>(name != NULL ? name->_impl : NULL)), numArgs, argumentsArg);
+    ARRAY_ARG_RETURN(IlValue, numArgs, argumentsArg, arguments);
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+IlValue * IlBuilder::Call(MethodBuilder * name, int32_t numArgs, ...) {
+    IlValue ** arguments = new IlValue *[numArgs];
+    va_list vararg;
+    va_start(vararg, numArgs);
+    for (int i = 0; i < numArgs; ++i) { arguments[i] = va_arg(vararg, IlValue *); }
+    va_end(vararg);
+    IlValue * ret = Call(name, numArgs, arguments);
+    delete[] arguments;
+    return ret;
+}
+
+IlValue * IlBuilder::ComputedCall(char * name, int32_t numArgs, IlValue ** arguments) {
+    PROFILE_TIMED_CALL(111); // IlBuilder::ComputedCall(string, int32, IlValue[])
+    TRACE_CALL(111); // IlBuilder::ComputedCall(string, int32, IlValue[])
+    TRACE_OBJECT(this);
+    TRACE_STRING(name);
+    TRACE_VALUE(int32_t, numArgs);
+    TRACE_ARRAY(numArgs, arguments);
+    ARRAY_ARG_SETUP(IlValue, numArgs, argumentsArg, arguments);
+    TR::IlValue * implRet = static_cast<TR::IlBuilder *>(_impl)->ComputedCall(name, numArgs, argumentsArg);
+    ARRAY_ARG_RETURN(IlValue, numArgs, argumentsArg, arguments);
+    GET_CLIENT_OBJECT(clientObj, IlValue, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+IlValue * IlBuilder::ComputedCall(char * name, int32_t numArgs, ...) {
+    IlValue ** arguments = new IlValue *[numArgs];
+    va_list vararg;
+    va_start(vararg, numArgs);
+    for (int i = 0; i < numArgs; ++i) { arguments[i] = va_arg(vararg, IlValue *); }
+    va_end(vararg);
+    IlValue * ret = ComputedCall(name, numArgs, arguments);
+    delete[] arguments;
+    return ret;
+}
+
+void IlBuilder::DoWhileLoop(char * exitCondition, IlBuilder ** body) {
+    PROFILE_TIMED_CALL(112); // IlBuilder::DoWhileLoop(string, IlBuilder*)
+    TRACE_CALL(112); // IlBuilder::DoWhileLoop(string, IlBuilder*)
+    TRACE_OBJECT(this);
+    TRACE_STRING(exitCondition);
+    TRACE_IN_OUT(body);
+    ARG_SETUP(IlBuilder, bodyImpl, bodyArg, body);
+    static_cast<TR::IlBuilder *>(_impl)->DoWhileLoop(exitCondition, bodyArg);
+    ARG_RETURN(IlBuilder, bodyImpl, body);
+    TRACE_RETURN();
+    TRACE_IN_OUT(body);
+}
+
+void IlBuilder::DoWhileLoop(char * exitCondition, IlBuilder ** body, IlBuilder ** breakBuilder, IlBuilder ** continueBuilder) {
+    PROFILE_TIMED_CALL(113); // IlBuilder::DoWhileLoop(string, IlBuilder*, IlBuilder*, IlBuilder*)
+    TRACE_CALL(113); // IlBuilder::DoWhileLoop(string, IlBuilder*, IlBuilder*, IlBuilder*)
+    TRACE_OBJECT(this);
+    TRACE_STRING(exitCondition);
+    TRACE_IN_OUT(body);
+    TRACE_IN_OUT(breakBuilder);
+    TRACE_IN_OUT(continueBuilder);
+    ARG_SETUP(IlBuilder, bodyImpl, bodyArg, body);
+    ARG_SETUP(IlBuilder, breakBuilderImpl, breakBuilderArg, breakBuilder);
+    ARG_SETUP(IlBuilder, continueBuilderImpl, continueBuilderArg, continueBuilder);
+    static_cast<TR::IlBuilder *>(_impl)->DoWhileLoop(exitCondition, bodyArg, breakBuilderArg, continueBuilderArg);
+    ARG_RETURN(IlBuilder, bodyImpl, body);
+    ARG_RETURN(IlBuilder, breakBuilderImpl, breakBuilder);
+    ARG_RETURN(IlBuilder, continueBuilderImpl, continueBuilder);
+    TRACE_RETURN();
+    TRACE_IN_OUT(body);
+    TRACE_IN_OUT(breakBuilder);
+    TRACE_IN_OUT(continueBuilder);
+}
+
+void IlBuilder::DoWhileLoopWithBreak(char * exitCondition, IlBuilder ** body, IlBuilder ** breakBuilder) {
+    PROFILE_TIMED_CALL(114); // IlBuilder::DoWhileLoopWithBreak(string, IlBuilder*, IlBuilder*)
+    TRACE_CALL(114); // IlBuilder::DoWhileLoopWithBreak(string, IlBuilder*, IlBuilder*)
+    TRACE_OBJECT(this);
+    TRACE_STRING(exitCondition);
+    TRACE_IN_OUT(body);
+    TRACE_IN_OUT(breakBuilder);
+    ARG_SETUP(IlBuilder, bodyImpl, bodyArg, body);
+    ARG_SETUP(IlBuilder, breakBuilderImpl, breakBuilderArg, breakBuilder);
+    static_cast<TR::IlBuilder *>(_impl)->DoWhileLoopWithBreak(exitCondition, bodyArg, breakBuilderArg);
+    ARG_RETURN(IlBuilder, bodyImpl, body);
+    ARG_RETURN(IlBuilder, breakBuilderImpl, breakBuilder);
+    TRACE_RETURN();
+    TRACE_IN_OUT(body);
+    TRACE_IN_OUT(breakBuilder);
+}
+
+void IlBuilder::DoWhileLoopWithContinue(char * exitCondition, IlBuilder ** body, IlBuilder ** continueBuilder) {
+    PROFILE_TIMED_CALL(115); // IlBuilder::DoWhileLoopWithContinue(string, IlBuilder*, IlBuilder*)
+    TRACE_CALL(115); // IlBuilder::DoWhileLoopWithContinue(string, IlBuilder*, IlBuilder*)
+    TRACE_OBJECT(this);
+    TRACE_STRING(exitCondition);
+    TRACE_IN_OUT(body);
+    TRACE_IN_OUT(continueBuilder);
+    ARG_SETUP(IlBuilder, bodyImpl, bodyArg, body);
+    ARG_SETUP(IlBuilder, continueBuilderImpl, continueBuilderArg, continueBuilder);
+    static_cast<TR::IlBuilder *>(_impl)->DoWhileLoopWithContinue(exitCondition, bodyArg, continueBuilderArg);
+    ARG_RETURN(IlBuilder, bodyImpl, body);
+    ARG_RETURN(IlBuilder, continueBuilderImpl, continueBuilder);
+    TRACE_RETURN();
+    TRACE_IN_OUT(body);
+    TRACE_IN_OUT(continueBuilder);
+}
+
+void IlBuilder::Goto(IlBuilder ** b) {
+    PROFILE_TIMED_CALL(117); // IlBuilder::Goto(IlBuilder*)
+    TRACE_CALL(117); // IlBuilder::Goto(IlBuilder*)
+    TRACE_OBJECT(this);
+    TRACE_IN_OUT(b);
+    ARG_SETUP(IlBuilder, bImpl, bArg, b);
+    static_cast<TR::IlBuilder *>(_impl)->Goto(bArg);
+    ARG_RETURN(IlBuilder, bImpl, b);
+    TRACE_RETURN();
+    TRACE_IN_OUT(b);
+}
+
+void IlBuilder::IfAnd(IlBuilder ** allTrueBuilder, IlBuilder ** anyFalseBuilder, int32_t numTerms, IlBuilder::JBCondition ** terms) {
+    PROFILE_TIMED_CALL(119); // IlBuilder::IfAnd(IlBuilder*, IlBuilder*, int32, JBCondition[])
+    TRACE_CALL(119); // IlBuilder::IfAnd(IlBuilder*, IlBuilder*, int32, JBCondition[])
+    TRACE_OBJECT(this);
+    TRACE_IN_OUT(allTrueBuilder);
+    TRACE_IN_OUT(anyFalseBuilder);
+    TRACE_VALUE(int32_t, numTerms);
+    TRACE_ARRAY(numTerms, terms);
+    ARG_SETUP(IlBuilder, allTrueBuilderImpl, allTrueBuilderArg, allTrueBuilder);
+    ARG_SETUP(IlBuilder, anyFalseBuilderImpl, anyFalseBuilderArg, anyFalseBuilder);
+    ARRAY_ARG_SETUP(IlBuilder::JBCondition, numTerms, termsArg, terms);
+    static_cast<TR::IlBuilder *>(_impl)->IfAnd(allTrueBuilderArg, anyFalseBuilderArg, numTerms, termsArg);
+    ARG_RETURN(IlBuilder, allTrueBuilderImpl, allTrueBuilder);
+    ARG_RETURN(IlBuilder, anyFalseBuilderImpl, anyFalseBuilder);
+    ARRAY_ARG_RETURN(IlBuilder::JBCondition, numTerms, termsArg, terms);
+    TRACE_RETURN();
+    TRACE_IN_OUT(allTrueBuilder);
+    TRACE_IN_OUT(anyFalseBuilder);
+}
+
+void IlBuilder::IfAnd(IlBuilder ** allTrueBuilder, IlBuilder ** anyFalseBuilder, int32_t numTerms, ...) {
+    IlBuilder::JBCondition ** terms = new IlBuilder::JBCondition *[numTerms];
+    va_list vararg;
+    va_start(vararg, numTerms);
+    for (int i = 0; i < numTerms; ++i) { terms[i] = va_arg(vararg, IlBuilder::JBCondition *); }
+    va_end(vararg);
+    IfAnd(allTrueBuilder, anyFalseBuilder, numTerms, terms);
+    delete[] terms;
+}
+
+void IlBuilder::IfCmpEqual(IlBuilder ** target, IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(121); // IlBuilder::IfCmpEqual(IlBuilder*, IlValue, IlValue)
+    TRACE_CALL(121); // IlBuilder::IfCmpEqual(IlBuilder*, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_IN_OUT(target);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    ARG_SETUP(IlBuilder, targetImpl, targetArg, target);
+    static_cast<TR::IlBuilder *>(_impl)->IfCmpEqual(targetArg, static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    ARG_RETURN(IlBuilder, targetImpl, target);
+    TRACE_RETURN();
+    TRACE_IN_OUT(target);
+}
+
+void IlBuilder::IfCmpLessOrEqual(IlBuilder ** target, IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(123); // IlBuilder::IfCmpLessOrEqual(IlBuilder*, IlValue, IlValue)
+    TRACE_CALL(123); // IlBuilder::IfCmpLessOrEqual(IlBuilder*, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_IN_OUT(target);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    ARG_SETUP(IlBuilder, targetImpl, targetArg, target);
+    static_cast<TR::IlBuilder *>(_impl)->IfCmpLessOrEqual(targetArg, static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    ARG_RETURN(IlBuilder, targetImpl, target);
+    TRACE_RETURN();
+    TRACE_IN_OUT(target);
+}
+
+void IlBuilder::IfCmpLessThan(IlBuilder ** target, IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(125); // IlBuilder::IfCmpLessThan(IlBuilder*, IlValue, IlValue)
+    TRACE_CALL(125); // IlBuilder::IfCmpLessThan(IlBuilder*, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_IN_OUT(target);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    ARG_SETUP(IlBuilder, targetImpl, targetArg, target);
+    static_cast<TR::IlBuilder *>(_impl)->IfCmpLessThan(targetArg, static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    ARG_RETURN(IlBuilder, targetImpl, target);
+    TRACE_RETURN();
+    TRACE_IN_OUT(target);
+}
+
+void IlBuilder::IfCmpGreaterOrEqual(IlBuilder ** target, IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(127); // IlBuilder::IfCmpGreaterOrEqual(IlBuilder*, IlValue, IlValue)
+    TRACE_CALL(127); // IlBuilder::IfCmpGreaterOrEqual(IlBuilder*, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_IN_OUT(target);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    ARG_SETUP(IlBuilder, targetImpl, targetArg, target);
+    static_cast<TR::IlBuilder *>(_impl)->IfCmpGreaterOrEqual(targetArg, static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    ARG_RETURN(IlBuilder, targetImpl, target);
+    TRACE_RETURN();
+    TRACE_IN_OUT(target);
+}
+
+void IlBuilder::IfCmpGreaterThan(IlBuilder ** target, IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(129); // IlBuilder::IfCmpGreaterThan(IlBuilder*, IlValue, IlValue)
+    TRACE_CALL(129); // IlBuilder::IfCmpGreaterThan(IlBuilder*, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_IN_OUT(target);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    ARG_SETUP(IlBuilder, targetImpl, targetArg, target);
+    static_cast<TR::IlBuilder *>(_impl)->IfCmpGreaterThan(targetArg, static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    ARG_RETURN(IlBuilder, targetImpl, target);
+    TRACE_RETURN();
+    TRACE_IN_OUT(target);
+}
+
+void IlBuilder::IfCmpNotEqual(IlBuilder ** target, IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(131); // IlBuilder::IfCmpNotEqual(IlBuilder*, IlValue, IlValue)
+    TRACE_CALL(131); // IlBuilder::IfCmpNotEqual(IlBuilder*, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_IN_OUT(target);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    ARG_SETUP(IlBuilder, targetImpl, targetArg, target);
+    static_cast<TR::IlBuilder *>(_impl)->IfCmpNotEqual(targetArg, static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    ARG_RETURN(IlBuilder, targetImpl, target);
+    TRACE_RETURN();
+    TRACE_IN_OUT(target);
+}
+
+void IlBuilder::IfCmpUnsignedLessOrEqual(IlBuilder ** target, IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(133); // IlBuilder::IfCmpUnsignedLessOrEqual(IlBuilder*, IlValue, IlValue)
+    TRACE_CALL(133); // IlBuilder::IfCmpUnsignedLessOrEqual(IlBuilder*, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_IN_OUT(target);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    ARG_SETUP(IlBuilder, targetImpl, targetArg, target);
+    static_cast<TR::IlBuilder *>(_impl)->IfCmpUnsignedLessOrEqual(targetArg, static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    ARG_RETURN(IlBuilder, targetImpl, target);
+    TRACE_RETURN();
+    TRACE_IN_OUT(target);
+}
+
+void IlBuilder::IfCmpUnsignedLessThan(IlBuilder ** target, IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(135); // IlBuilder::IfCmpUnsignedLessThan(IlBuilder*, IlValue, IlValue)
+    TRACE_CALL(135); // IlBuilder::IfCmpUnsignedLessThan(IlBuilder*, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_IN_OUT(target);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    ARG_SETUP(IlBuilder, targetImpl, targetArg, target);
+    static_cast<TR::IlBuilder *>(_impl)->IfCmpUnsignedLessThan(targetArg, static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    ARG_RETURN(IlBuilder, targetImpl, target);
+    TRACE_RETURN();
+    TRACE_IN_OUT(target);
+}
+
+void IlBuilder::IfCmpUnsignedGreaterOrEqual(IlBuilder ** target, IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(137); // IlBuilder::IfCmpUnsignedGreaterOrEqual(IlBuilder*, IlValue, IlValue)
+    TRACE_CALL(137); // IlBuilder::IfCmpUnsignedGreaterOrEqual(IlBuilder*, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_IN_OUT(target);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    ARG_SETUP(IlBuilder, targetImpl, targetArg, target);
+    static_cast<TR::IlBuilder *>(_impl)->IfCmpUnsignedGreaterOrEqual(targetArg, static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    ARG_RETURN(IlBuilder, targetImpl, target);
+    TRACE_RETURN();
+    TRACE_IN_OUT(target);
+}
+
+void IlBuilder::IfCmpUnsignedGreaterThan(IlBuilder ** target, IlValue * left, IlValue * right) {
+    PROFILE_TIMED_CALL(139); // IlBuilder::IfCmpUnsignedGreaterThan(IlBuilder*, IlValue, IlValue)
+    TRACE_CALL(139); // IlBuilder::IfCmpUnsignedGreaterThan(IlBuilder*, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_IN_OUT(target);
+    TRACE_OBJECT(left);
+    TRACE_OBJECT(right);
+    ARG_SETUP(IlBuilder, targetImpl, targetArg, target);
+    static_cast<TR::IlBuilder *>(_impl)->IfCmpUnsignedGreaterThan(targetArg, static_cast<TR::IlValue *>(left != NULL ? left->_impl : NULL), static_cast<TR::IlValue *>(right != NULL ? right->_impl : NULL));
+    ARG_RETURN(IlBuilder, targetImpl, target);
+    TRACE_RETURN();
+    TRACE_IN_OUT(target);
+}
+
+void IlBuilder::IfCmpEqualZero(IlBuilder ** target, IlValue * condition) {
+    PROFILE_TIMED_CALL(141); // IlBuilder::IfCmpEqualZero(IlBuilder*, IlValue)
+    TRACE_CALL(141); // IlBuilder::IfCmpEqualZero(IlBuilder*, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_IN_OUT(target);
+    TRACE_OBJECT(condition);
+    ARG_SETUP(IlBuilder, targetImpl, targetArg, target);
+    static_cast<TR::IlBuilder *>(_impl)->IfCmpEqualZero(targetArg, static_cast<TR::IlValue *>(condition != NULL ? condition->_impl : NULL));
+    ARG_RETURN(IlBuilder, targetImpl, target);
+    TRACE_RETURN();
+    TRACE_IN_OUT(target);
+}
+
+void IlBuilder::IfCmpNotEqualZero(IlBuilder ** target, IlValue * condition) {
+    PROFILE_TIMED_CALL(143); // IlBuilder::IfCmpNotEqualZero(IlBuilder*, IlValue)
+    TRACE_CALL(143); // IlBuilder::IfCmpNotEqualZero(IlBuilder*, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_IN_OUT(target);
+    TRACE_OBJECT(condition);
+    ARG_SETUP(IlBuilder, targetImpl, targetArg, target);
+    static_cast<TR::IlBuilder *>(_impl)->IfCmpNotEqualZero(targetArg, static_cast<TR::IlValue *>(condition != NULL ? condition->_impl : NULL));
+    ARG_RETURN(IlBuilder, targetImpl, target);
+    TRACE_RETURN();
+    TRACE_IN_OUT(target);
+}
+
+void IlBuilder::IfOr(IlBuilder ** anyTrueBuilder, IlBuilder ** allFalseBuilder, int32_t numTerms, IlBuilder::JBCondition ** terms) {
+    PROFILE_TIMED_CALL(144); // IlBuilder::IfOr(IlBuilder*, IlBuilder*, int32, JBCondition[])
+    TRACE_CALL(144); // IlBuilder::IfOr(IlBuilder*, IlBuilder*, int32, JBCondition[])
+    TRACE_OBJECT(this);
+    TRACE_IN_OUT(anyTrueBuilder);
+    TRACE_IN_OUT(allFalseBuilder);
+    TRACE_VALUE(int32_t, numTerms);
+    TRACE_ARRAY(numTerms, terms);
+    ARG_SETUP(IlBuilder, anyTrueBuilderImpl, anyTrueBuilderArg, anyTrueBuilder);
+    ARG_SETUP(IlBuilder, allFalseBuilderImpl, allFalseBuilderArg, allFalseBuilder);
+    ARRAY_ARG_SETUP(IlBuilder::JBCondition, numTerms, termsArg, terms);
+    static_cast<TR::IlBuilder *>(_impl)->IfOr(anyTrueBuilderArg, allFalseBuilderArg, numTerms, termsArg);
+    ARG_RETURN(IlBuilder, anyTrueBuilderImpl, anyTrueBuilder);
+    ARG_RETURN(IlBuilder, allFalseBuilderImpl, allFalseBuilder);
+    ARRAY_ARG_RETURN(IlBuilder::JBCondition, numTerms, termsArg, terms);
+    TRACE_RETURN();
+    TRACE_IN_OUT(anyTrueBuilder);
+    TRACE_IN_OUT(allFalseBuilder);
+}
+
+void IlBuilder::IfOr(IlBuilder ** anyTrueBuilder, IlBuilder ** allFalseBuilder, int32_t numTerms, ...) {
+    IlBuilder::JBCondition ** terms = new IlBuilder::JBCondition *[numTerms];
+    va_list vararg;
+    va_start(vararg, numTerms);
+    for (int i = 0; i < numTerms; ++i) { terms[i] = va_arg(vararg, IlBuilder::JBCondition *); }
+    va_end(vararg);
+    IfOr(anyTrueBuilder, allFalseBuilder, numTerms, terms);
+    delete[] terms;
+}
+
+void IlBuilder::IfThen(IlBuilder ** thenPath, IlValue * condition) {
+    PROFILE_TIMED_CALL(145); // IlBuilder::IfThen(IlBuilder*, IlValue)
+    TRACE_CALL(145); // IlBuilder::IfThen(IlBuilder*, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_IN_OUT(thenPath);
+    TRACE_OBJECT(condition);
+    ARG_SETUP(IlBuilder, thenPathImpl, thenPathArg, thenPath);
+    static_cast<TR::IlBuilder *>(_impl)->IfThen(thenPathArg, static_cast<TR::IlValue *>(condition != NULL ? condition->_impl : NULL));
+    ARG_RETURN(IlBuilder, thenPathImpl, thenPath);
+    TRACE_RETURN();
+    TRACE_IN_OUT(thenPath);
+}
+
+void IlBuilder::IfThenElse(IlBuilder ** thenPath, IlBuilder ** elsePath, IlValue * condition) {
+    PROFILE_TIMED_CALL(146); // IlBuilder::IfThenElse(IlBuilder*, IlBuilder*, IlValue)
+    TRACE_CALL(146); // IlBuilder::IfThenElse(IlBuilder*, IlBuilder*, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_IN_OUT(thenPath);
+    TRACE_IN_OUT(elsePath);
+    TRACE_OBJECT(condition);
+    ARG_SETUP(IlBuilder, thenPathImpl, thenPathArg, thenPath);
+    ARG_SETUP(IlBuilder, elsePathImpl, elsePathArg, elsePath);
+    static_cast<TR::IlBuilder *>(_impl)->IfThenElse(thenPathArg, elsePathArg, static_cast<TR::IlValue *>(condition != NULL ? condition->_impl : NULL));
+    ARG_RETURN(IlBuilder, thenPathImpl, thenPath);
+    ARG_RETURN(IlBuilder, elsePathImpl, elsePath);
+    TRACE_RETURN();
+    TRACE_IN_OUT(thenPath);
+    TRACE_IN_OUT(elsePath);
+}
+
+void IlBuilder::ForLoop(bool countsUp, char * indVar, IlBuilder ** body, IlBuilder ** breakBuilder, IlBuilder ** continueBuilder, IlValue * initial, IlValue * iterateWhile, IlValue * increment) {
+    PROFILE_TIMED_CALL(148); // IlBuilder::ForLoop(boolean, string, IlBuilder*, IlBuilder*, IlBuilder*, IlValue, IlValue, IlValue)
+    TRACE_CALL(148); // IlBuilder::ForLoop(boolean, string, IlBuilder*, IlBuilder*, IlBuilder*, IlValue, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_VALUE(uint8_t, countsUp);
+    TRACE_STRING(indVar);
+    TRACE_IN_OUT(body);
+    TRACE_IN_OUT(breakBuilder);
+    TRACE_IN_OUT(continueBuilder);
+    TRACE_OBJECT(initial);
+    TRACE_OBJECT(iterateWhile);
+    TRACE_OBJECT(increment);
+    ARG_SETUP(IlBuilder, bodyImpl, bodyArg, body);
+    ARG_SETUP(IlBuilder, breakBuilderImpl, breakBuilderArg, breakBuilder);
+    ARG_SETUP(IlBuilder, continueBuilderImpl, continueBuilderArg, continueBuilder);
+    static_cast<TR::IlBuilder *>(_impl)->ForLoop(countsUp, indVar, bodyArg, breakBuilderArg, continueBuilderArg, static_cast<TR::IlValue *>(initial != NULL ? initial->_impl : NULL), static_cast<TR::IlValue *>(iterateWhile != NULL ? iterateWhile->_impl : NULL), static_cast<TR::IlValue *>(increment != NULL ? increment->_impl : NULL));
+    ARG_RETURN(IlBuilder, bodyImpl, body);
+    ARG_RETURN(IlBuilder, breakBuilderImpl, breakBuilder);
+    ARG_RETURN(IlBuilder, continueBuilderImpl, continueBuilder);
+    TRACE_RETURN();
+    TRACE_IN_OUT(body);
+    TRACE_IN_OUT(breakBuilder);
+    TRACE_IN_OUT(continueBuilder);
+}
+
+void IlBuilder::ForLoopDown(char * indVar, IlBuilder ** body, IlValue * initial, IlValue * iterateWhile, IlValue * increment) {
+    PROFILE_TIMED_CALL(149); // IlBuilder::ForLoopDown(string, IlBuilder*, IlValue, IlValue, IlValue)
+    TRACE_CALL(149); // IlBuilder::ForLoopDown(string, IlBuilder*, IlValue, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_STRING(indVar);
+    TRACE_IN_OUT(body);
+    TRACE_OBJECT(initial);
+    TRACE_OBJECT(iterateWhile);
+    TRACE_OBJECT(increment);
+    ARG_SETUP(IlBuilder, bodyImpl, bodyArg, body);
+    static_cast<TR::IlBuilder *>(_impl)->ForLoopDown(indVar, bodyArg, static_cast<TR::IlValue *>(initial != NULL ? initial->_impl : NULL), static_cast<TR::IlValue *>(iterateWhile != NULL ? iterateWhile->_impl : NULL), static_cast<TR::IlValue *>(increment != NULL ? increment->_impl : NULL));
+    ARG_RETURN(IlBuilder, bodyImpl, body);
+    TRACE_RETURN();
+    TRACE_IN_OUT(body);
+}
+
+void IlBuilder::ForLoopUp(char * indVar, IlBuilder ** body, IlValue * initial, IlValue * iterateWhile, IlValue * increment) {
+    PROFILE_TIMED_CALL(150); // IlBuilder::ForLoopUp(string, IlBuilder*, IlValue, IlValue, IlValue)
+    TRACE_CALL(150); // IlBuilder::ForLoopUp(string, IlBuilder*, IlValue, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_STRING(indVar);
+    TRACE_IN_OUT(body);
+    TRACE_OBJECT(initial);
+    TRACE_OBJECT(iterateWhile);
+    TRACE_OBJECT(increment);
+    ARG_SETUP(IlBuilder, bodyImpl, bodyArg, body);
+    static_cast<TR::IlBuilder *>(_impl)->ForLoopUp(indVar, bodyArg, static_cast<TR::IlValue *>(initial != NULL ? initial->_impl : NULL), static_cast<TR::IlValue *>(iterateWhile != NULL ? iterateWhile->_impl : NULL), static_cast<TR::IlValue *>(increment != NULL ? increment->_impl : NULL));
+    ARG_RETURN(IlBuilder, bodyImpl, body);
+    TRACE_RETURN();
+    TRACE_IN_OUT(body);
+}
+
+void IlBuilder::ForLoopWithBreak(bool countsUp, char * indVar, IlBuilder ** body, IlBuilder ** breakBuilder, IlValue * initial, IlValue * iterateWhile, IlValue * increment) {
+    PROFILE_TIMED_CALL(151); // IlBuilder::ForLoopWithBreak(boolean, string, IlBuilder*, IlBuilder*, IlValue, IlValue, IlValue)
+    TRACE_CALL(151); // IlBuilder::ForLoopWithBreak(boolean, string, IlBuilder*, IlBuilder*, IlValue, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_VALUE(uint8_t, countsUp);
+    TRACE_STRING(indVar);
+    TRACE_IN_OUT(body);
+    TRACE_IN_OUT(breakBuilder);
+    TRACE_OBJECT(initial);
+    TRACE_OBJECT(iterateWhile);
+    TRACE_OBJECT(increment);
+    ARG_SETUP(IlBuilder, bodyImpl, bodyArg, body);
+    ARG_SETUP(IlBuilder, breakBuilderImpl, breakBuilderArg, breakBuilder);
+    static_cast<TR::IlBuilder *>(_impl)->ForLoopWithBreak(countsUp, indVar, bodyArg, breakBuilderArg, static_cast<TR::IlValue *>(initial != NULL ? initial->_impl : NULL), static_cast<TR::IlValue *>(iterateWhile != NULL ? iterateWhile->_impl : NULL), static_cast<TR::IlValue *>(increment != NULL ? increment->_impl : NULL));
+    ARG_RETURN(IlBuilder, bodyImpl, body);
+    ARG_RETURN(IlBuilder, breakBuilderImpl, breakBuilder);
+    TRACE_RETURN();
+    TRACE_IN_OUT(body);
+    TRACE_IN_OUT(breakBuilder);
+}
+
+void IlBuilder::ForLoopWithContinue(bool countsUp, char * indVar, IlBuilder ** body, IlBuilder ** continueBuilder, IlValue * initial, IlValue * iterateWhile, IlValue * increment) {
+    PROFILE_TIMED_CALL(152); // IlBuilder::ForLoopWithContinue(boolean, string, IlBuilder*, IlBuilder*, IlValue, IlValue, IlValue)
+    TRACE_CALL(152); // IlBuilder::ForLoopWithContinue(boolean, string, IlBuilder*, IlBuilder*, IlValue, IlValue, IlValue)
+    TRACE_OBJECT(this);
+    TRACE_VALUE(uint8_t, countsUp);
+    TRACE_STRING(indVar);
+    TRACE_IN_OUT(body);
+    TRACE_IN_OUT(continueBuilder);
+    TRACE_OBJECT(initial);
+    TRACE_OBJECT(iterateWhile);
+    TRACE_OBJECT(increment);
+    ARG_SETUP(IlBuilder, bodyImpl, bodyArg, body);
+    ARG_SETUP(IlBuilder, continueBuilderImpl, continueBuilderArg, continueBuilder);
+    static_cast<TR::IlBuilder *>(_impl)->ForLoopWithContinue(countsUp, indVar, bodyArg, continueBuilderArg, static_cast<TR::IlValue *>(initial != NULL ? initial->_impl : NULL), static_cast<TR::IlValue *>(iterateWhile != NULL ? iterateWhile->_impl : NULL), static_cast<TR::IlValue *>(increment != NULL ? increment->_impl : NULL));
+    ARG_RETURN(IlBuilder, bodyImpl, body);
+    ARG_RETURN(IlBuilder, continueBuilderImpl, continueBuilder);
+    TRACE_RETURN();
+    TRACE_IN_OUT(body);
+    TRACE_IN_OUT(continueBuilder);
+}
+
+void IlBuilder::Switch(IlValue * selectorValue, IlBuilder ** defaultBuilder, int32_t numCases, IlBuilder::JBCase ** cases) {
+    PROFILE_TIMED_CALL(155); // IlBuilder::Switch(IlValue, IlBuilder*, int32, JBCase[])
+    TRACE_CALL(155); // IlBuilder::Switch(IlValue, IlBuilder*, int32, JBCase[])
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(selectorValue);
+    TRACE_IN_OUT(defaultBuilder);
+    TRACE_VALUE(int32_t, numCases);
+    TRACE_ARRAY(numCases, cases);
+    ARG_SETUP(IlBuilder, defaultBuilderImpl, defaultBuilderArg, defaultBuilder);
+    ARRAY_ARG_SETUP(IlBuilder::JBCase, numCases, casesArg, cases);
+    static_cast<TR::IlBuilder *>(_impl)->Switch(static_cast<TR::IlValue *>(selectorValue != NULL ? selectorValue->_impl : NULL), defaultBuilderArg, numCases, casesArg);
+    ARG_RETURN(IlBuilder, defaultBuilderImpl, defaultBuilder);
+    ARRAY_ARG_RETURN(IlBuilder::JBCase, numCases, casesArg, cases);
+    TRACE_RETURN();
+    TRACE_IN_OUT(defaultBuilder);
+}
+
+void IlBuilder::Switch(IlValue * selectorValue, IlBuilder ** defaultBuilder, int32_t numCases, ...) {
+    IlBuilder::JBCase ** cases = new IlBuilder::JBCase *[numCases];
+    va_list vararg;
+    va_start(vararg, numCases);
+    for (int i = 0; i < numCases; ++i) { cases[i] = va_arg(vararg, IlBuilder::JBCase *); }
+    va_end(vararg);
+    Switch(selectorValue, defaultBuilder, numCases, cases);
+    delete[] cases;
+}
+
+void IlBuilder::TableSwitch(IlValue * selectorValue, IlBuilder ** defaultBuilder, bool generateBoundsCheck, int32_t numCases, IlBuilder::JBCase ** cases) {
+    PROFILE_TIMED_CALL(156); // IlBuilder::TableSwitch(IlValue, IlBuilder*, boolean, int32, JBCase[])
+    TRACE_CALL(156); // IlBuilder::TableSwitch(IlValue, IlBuilder*, boolean, int32, JBCase[])
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(selectorValue);
+    TRACE_IN_OUT(defaultBuilder);
+    TRACE_VALUE(uint8_t, generateBoundsCheck);
+    TRACE_VALUE(int32_t, numCases);
+    TRACE_ARRAY(numCases, cases);
+    ARG_SETUP(IlBuilder, defaultBuilderImpl, defaultBuilderArg, defaultBuilder);
+    ARRAY_ARG_SETUP(IlBuilder::JBCase, numCases, casesArg, cases);
+    static_cast<TR::IlBuilder *>(_impl)->TableSwitch(static_cast<TR::IlValue *>(selectorValue != NULL ? selectorValue->_impl : NULL), defaultBuilderArg, generateBoundsCheck, numCases, casesArg);
+    ARG_RETURN(IlBuilder, defaultBuilderImpl, defaultBuilder);
+    ARRAY_ARG_RETURN(IlBuilder::JBCase, numCases, casesArg, cases);
+    TRACE_RETURN();
+    TRACE_IN_OUT(defaultBuilder);
+}
+
+void IlBuilder::TableSwitch(IlValue * selectorValue, IlBuilder ** defaultBuilder, bool generateBoundsCheck, int32_t numCases, ...) {
+    IlBuilder::JBCase ** cases = new IlBuilder::JBCase *[numCases];
+    va_list vararg;
+    va_start(vararg, numCases);
+    for (int i = 0; i < numCases; ++i) { cases[i] = va_arg(vararg, IlBuilder::JBCase *); }
+    va_end(vararg);
+    TableSwitch(selectorValue, defaultBuilder, generateBoundsCheck, numCases, cases);
+    delete[] cases;
+}
+
+IlBuilder::JBCase * IlBuilder::MakeCase(int32_t value, IlBuilder ** builder, int32_t fallsThrough) {
+    PROFILE_TIMED_CALL(157); // IlBuilder::MakeCase(int32, IlBuilder*, int32)
+    TRACE_CALL(157); // IlBuilder::MakeCase(int32, IlBuilder*, int32)
+    TRACE_OBJECT(this);
+    TRACE_VALUE(int32_t, value);
+    TRACE_IN_OUT(builder);
+    TRACE_VALUE(int32_t, fallsThrough);
+    ARG_SETUP(IlBuilder, builderImpl, builderArg, builder);
+    TR::IlBuilder::JBCase * implRet = static_cast<TR::IlBuilder *>(_impl)->MakeCase(value, builderArg, fallsThrough);
+    ARG_RETURN(IlBuilder, builderImpl, builder);
+    GET_CLIENT_OBJECT(clientObj, JBCase, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    TRACE_IN_OUT(builder);
+    return clientObj;
+}
+
+void IlBuilder::WhileDoLoop(char * exitCondition, IlBuilder ** body) {
+    PROFILE_TIMED_CALL(158); // IlBuilder::WhileDoLoop(string, IlBuilder*)
+    TRACE_CALL(158); // IlBuilder::WhileDoLoop(string, IlBuilder*)
+    TRACE_OBJECT(this);
+    TRACE_STRING(exitCondition);
+    TRACE_IN_OUT(body);
+    ARG_SETUP(IlBuilder, bodyImpl, bodyArg, body);
+    static_cast<TR::IlBuilder *>(_impl)->WhileDoLoop(exitCondition, bodyArg);
+    ARG_RETURN(IlBuilder, bodyImpl, body);
+    TRACE_RETURN();
+    TRACE_IN_OUT(body);
+}
+
+void IlBuilder::WhileDoLoopWithBreak(char * exitCondition, IlBuilder ** body, IlBuilder ** breakBuilder) {
+    PROFILE_TIMED_CALL(159); // IlBuilder::WhileDoLoopWithBreak(string, IlBuilder*, IlBuilder*)
+    TRACE_CALL(159); // IlBuilder::WhileDoLoopWithBreak(string, IlBuilder*, IlBuilder*)
+    TRACE_OBJECT(this);
+    TRACE_STRING(exitCondition);
+    TRACE_IN_OUT(body);
+    TRACE_IN_OUT(breakBuilder);
+    ARG_SETUP(IlBuilder, bodyImpl, bodyArg, body);
+    ARG_SETUP(IlBuilder, breakBuilderImpl, breakBuilderArg, breakBuilder);
+    static_cast<TR::IlBuilder *>(_impl)->WhileDoLoopWithBreak(exitCondition, bodyArg, breakBuilderArg);
+    ARG_RETURN(IlBuilder, bodyImpl, body);
+    ARG_RETURN(IlBuilder, breakBuilderImpl, breakBuilder);
+    TRACE_RETURN();
+    TRACE_IN_OUT(body);
+    TRACE_IN_OUT(breakBuilder);
+}
+
+void IlBuilder::WhileDoLoopWithContinue(char * exitCondition, IlBuilder ** body, IlBuilder ** continueBuilder) {
+    PROFILE_TIMED_CALL(160); // IlBuilder::WhileDoLoopWithContinue(string, IlBuilder*, IlBuilder*)
+    TRACE_CALL(160); // IlBuilder::WhileDoLoopWithContinue(string, IlBuilder*, IlBuilder*)
+    TRACE_OBJECT(this);
+    TRACE_STRING(exitCondition);
+    TRACE_IN_OUT(body);
+    TRACE_IN_OUT(continueBuilder);
+    ARG_SETUP(IlBuilder, bodyImpl, bodyArg, body);
+    ARG_SETUP(IlBuilder, continueBuilderImpl, continueBuilderArg, continueBuilder);
+    static_cast<TR::IlBuilder *>(_impl)->WhileDoLoopWithContinue(exitCondition, bodyArg, continueBuilderArg);
+    ARG_RETURN(IlBuilder, bodyImpl, body);
+    ARG_RETURN(IlBuilder, continueBuilderImpl, continueBuilder);
+    TRACE_RETURN();
+    TRACE_IN_OUT(body);
+    TRACE_IN_OUT(continueBuilder);
+}
+
+void IlBuilder::ConstAddressBulk(size_t count, const ConstAddressOperands * operands, IlValue ** results) {
+    for (size_t i = 0; i < count; ++i) {
+        void * value = operands[i].value;
+        results[i] = ConstAddress(value);
+    }
+}
+
+void IlBuilder::ConstDoubleBulk(size_t count, const ConstDoubleOperands * operands, IlValue ** results) {
+    for (size_t i = 0; i < count; ++i) {
+        double value = operands[i].value;
+        results[i] = ConstDouble(value);
+    }
+}
+
+void IlBuilder::ConstFloatBulk(size_t count, const ConstFloatOperands * operands, IlValue ** results) {
+    for (size_t i = 0; i < count; ++i) {
+        float value = operands[i].value;
+        results[i] = ConstFloat(value);
+    }
+}
+
+void IlBuilder::ConstInt8Bulk(size_t count, const ConstInt8Operands * operands, IlValue ** results) {
+    for (size_t i = 0; i < count; ++i) {
+        int8_t value = operands[i].value;
+        results[i] = ConstInt8(value);
+    }
+}
+
+void IlBuilder::ConstInt16Bulk(size_t count, const ConstInt16Operands * operands, IlValue ** results) {
+    for (size_t i = 0; i < count; ++i) {
+        int16_t value = operands[i].value;
+        results[i] = ConstInt16(value);
+    }
+}
+
+void IlBuilder::ConstInt32Bulk(size_t count, const ConstInt32Operands * operands, IlValue ** results) {
+    for (size_t i = 0; i < count; ++i) {
+        int32_t value = operands[i].value;
+        results[i] = ConstInt32(value);
+    }
+}
+
+void IlBuilder::ConstInt64Bulk(size_t count, const ConstInt64Operands * operands, IlValue ** results) {
+    for (size_t i = 0; i < count; ++i) {
+        int64_t value = operands[i].value;
+        results[i] = ConstInt64(value);
+    }
+}
+
+void IlBuilder::AddBulk(size_t count, const AddOperands * operands, IlValue ** results) {
+    for (size_t i = 0; i < count; ++i) {
+        IlValue * left = operands[i].left;
+        IlValue * right = operands[i].right;
+        results[i] = Add(left, right);
+    }
+}
+
+void IlBuilder::AndBulk(size_t count, const AndOperands * operands, IlValue ** results) {
+    for (size_t i = 0; i < count; ++i) {
+        IlValue * left = operands[i].left;
+        IlValue * right = operands[i].right;
+        results[i] = And(left, right);
+    }
+}
+
+void IlBuilder::DivBulk(size_t count, const DivOperands * operands, IlValue ** results) {
+    for (size_t i = 0; i < count; ++i) {
+        IlValue * left = operands[i].left;
+        IlValue * right = operands[i].right;
+        results[i] = Div(left, right);
+    }
+}
+
+void IlBuilder::IndexAtBulk(size_t count, const IndexAtOperands * operands, IlValue ** results) {
+    for (size_t i = 0; i < count; ++i) {
+        IlType * dt = operands[i].dt;
+        IlValue * base = operands[i].base;
+        IlValue * index = operands[i].index;
+        results[i] = IndexAt(dt, base, index);
+    }
+}
+
+void IlBuilder::MulBulk(size_t count, const MulOperands * operands, IlValue ** results) {
+    for (size_t i = 0; i < count; ++i) {
+        IlValue * left = operands[i].left;
+        IlValue * right = operands[i].right;
+        results[i] = Mul(left, right);
+    }
+}
+
+void IlBuilder::NegateBulk(size_t count, const NegateOperands * operands, IlValue ** results) {
+    for (size_t i = 0; i < count; ++i) {
+        IlValue * v = operands[i].v;
+        results[i] = Negate(v);
+    }
+}
+
+void IlBuilder::OrBulk(size_t count, const OrOperands * operands, IlValue ** results) {
+    for (size_t i = 0; i < count; ++i) {
+        IlValue * left = operands[i].left;
+        IlValue * right = operands[i].right;
+        results[i] = Or(left, right);
+    }
+}
+
+void IlBuilder::RemBulk(size_t count, const RemOperands * operands, IlValue ** results) {
+    for (size_t i = 0; i < count; ++i) {
+        IlValue * left = operands[i].left;
+        IlValue * right = operands[i].right;
+        results[i] = Rem(left, right);
+    }
+}
+
+void IlBuilder::ShiftLBulk(size_t count, const ShiftLOperands * operands, IlValue ** results) {
+    for (size_t i = 0; i < count; ++i) {
+        IlValue * left = operands[i].left;
+        IlValue * right = operands[i].right;
+        results[i] = ShiftL(left, right);
+    }
+}
+
+void IlBuilder::ShiftRBulk(size_t count, const ShiftROperands * operands, IlValue ** results) {
+    for (size_t i = 0; i < count; ++i) {
+        IlValue * left = operands[i].left;
+        IlValue * right = operands[i].right;
+        results[i] = ShiftR(left, right);
+    }
+}
+
+void IlBuilder::SubBulk(size_t count, const SubOperands * operands, IlValue ** results) {
+    for (size_t i = 0; i < count; ++i) {
+        IlValue * left = operands[i].left;
+        IlValue * right = operands[i].right;
+        results[i] = Sub(left, right);
+    }
+}
+
+void IlBuilder::UnsignedShiftRBulk(size_t count, const UnsignedShiftROperands * operands, IlValue ** results) {
+    for (size_t i = 0; i < count; ++i) {
+        IlValue * left = operands[i].left;
+        IlValue * right = operands[i].right;
+        results[i] = UnsignedShiftR(left, right);
+    }
+}
+
+void IlBuilder::XorBulk(size_t count, const XorOperands * operands, IlValue ** results) {
+    for (size_t i = 0; i < count; ++i) {
+        IlValue * left = operands[i].left;
+        IlValue * right = operands[i].right;
+        results[i] = Xor(left, right);
+    }
+}
+
+void IlBuilder::EqualToBulk(size_t count, const EqualToOperands * operands, IlValue ** results) {
+    for (size_t i = 0; i < count; ++i) {
+        IlValue * left = operands[i].left;
+        IlValue * right = operands[i].right;
+        results[i] = EqualTo(left, right);
+    }
+}
+
+void IlBuilder::LessOrEqualToBulk(size_t count, const LessOrEqualToOperands * operands, IlValue ** results) {
+    for (size_t i = 0; i < count; ++i) {
+        IlValue * left = operands[i].left;
+        IlValue * right = operands[i].right;
+        results[i] = LessOrEqualTo(left, right);
+    }
+}
+
+void IlBuilder::LessThanBulk(size_t count, const LessThanOperands * operands, IlValue ** results) {
+    for (size_t i = 0; i < count; ++i) {
+        IlValue * left = operands[i].left;
+        IlValue * right = operands[i].right;
+        results[i] = LessThan(left, right);
+    }
+}
+
+void IlBuilder::GreaterOrEqualToBulk(size_t count, const GreaterOrEqualToOperands * operands, IlValue ** results) {
+    for (size_t i = 0; i < count; ++i) {
+        IlValue * left = operands[i].left;
+        IlValue * right = operands[i].right;
+        results[i] = GreaterOrEqualTo(left, right);
+    }
+}
+
+void IlBuilder::GreaterThanBulk(size_t count, const GreaterThanOperands * operands, IlValue ** results) {
+    for (size_t i = 0; i < count; ++i) {
+        IlValue * left = operands[i].left;
+        IlValue * right = operands[i].right;
+        results[i] = GreaterThan(left, right);
+    }
+}
+
+void IlBuilder::NotEqualToBulk(size_t count, const NotEqualToOperands * operands, IlValue ** results) {
+    for (size_t i = 0; i < count; ++i) {
+        IlValue * left = operands[i].left;
+        IlValue * right = operands[i].right;
+        results[i] = NotEqualTo(left, right);
+    }
+}
+
+void IlBuilder::ConvertToBulk(size_t count, const ConvertToOperands * operands, IlValue ** results) {
+    for (size_t i = 0; i < count; ++i) {
+        IlType * type = operands[i].type;
+        IlValue * value = operands[i].value;
+        results[i] = ConvertTo(type, value);
+    }
+}
+
+void IlBuilder::LoadBulk(size_t count, const LoadOperands * operands, IlValue ** results) {
+    for (size_t i = 0; i < count; ++i) {
+        const char * name = operands[i].name;
+        results[i] = Load(name);
+    }
+}
+
+void IlBuilder::LoadAtBulk(size_t count, const LoadAtOperands * operands, IlValue ** results) {
+    for (size_t i = 0; i < count; ++i) {
+        IlType * type = operands[i].type;
+        IlValue * address = operands[i].address;
+        results[i] = LoadAt(type, address);
+    }
+}
+
+void IlBuilder::LoadIndirectBulk(size_t count, const LoadIndirectOperands * operands, IlValue ** results) {
+    for (size_t i = 0; i < count; ++i) {
+        const char * type = operands[i].type;
+        const char * field = operands[i].field;
+        IlValue * object = operands[i].object;
+        results[i] = LoadIndirect(type, field, object);
+    }
+}
+
+void IlBuilder::StoreBulk(size_t count, const StoreOperands * operands) {
+    for (size_t i = 0; i < count; ++i) {
+        const char * name = operands[i].name;
+        IlValue * value = operands[i].value;
+        Store(name, value);
+    }
+}
+
+void IlBuilder::StoreAtBulk(size_t count, const StoreAtOperands * operands) {
+    for (size_t i = 0; i < count; ++i) {
+        IlValue * address = operands[i].address;
+        IlValue * value = operands[i].value;
+        StoreAt(address, value);
+    }
+}
+
+void IlBuilder::StoreIndirectBulk(size_t count, const StoreIndirectOperands * operands) {
+    for (size_t i = 0; i < count; ++i) {
+        const char * type = operands[i].type;
+        const char * field = operands[i].field;
+        IlValue * object = operands[i].object;
+        IlValue * value = operands[i].value;
+        StoreIndirect(type, field, object, value);
+    }
+}
+
+bool IlBuilder::buildIL() {
+    PROFILE_TIMED_CALL(35); // IlBuilder::buildIL()
+    TRACE_CALL(35); // IlBuilder::buildIL()
+    TRACE_OBJECT(this);
+    TRACE_RETURN();
+    TRACE_VALUE(uint8_t, 0);
+    return 0;
+}
+
+extern "C" void * allocateIlBuilder(void * impl) {
+    return new IlBuilder(impl);
+}
+
+} // JitBuilder
+} // OMR
@@ -0,0 +1,58 @@
+/*******************************************************************************
+ * Copyright (c) 2026, 2026 IBM Corp. and others
+ *
+ * This program and the accompanying materials are made available under
+ * the terms of the Eclipse Public License 2.0 which accompanies this
+ * distribution and is available at http://eclipse.org/legal/epl-2.0
+ * or the Apache License, Version 2.0 which accompanies this distribution
+ * and is available at https://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * This Source Code may also be made available under the following Secondary
+ * Licenses when the conditions for such availability set forth in the
+ * Eclipse Public License, v. 2.0 are satisfied: GNU General Public License,
+ * version 2 with the GNU Classpath Exception [1] and GNU General Public
+ * License, version 2 with the OpenJDK Assembly Exception [2].
+ *
+ * [1] https://www.gnu.org/software/classpath/license.html
+ * [2] http://openjdk.java.net/legal/assembly-exception.html
+ *
+ * SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+ *******************************************************************************/
+        
+#include "ilgen/IlType.hpp"
+#include "ilgen/TypeDictionary.hpp"
+#include "<output>/include/Macros.hpp"
+#include "<output>/include/Profiling.hpp"
+#include "<output>/include/Tracing.hpp"
+#include "<output>/include/IlType.hpp"
+#include "<output>/include/TypeDictionary.hpp"
+#include "<output>/include/IlType-inl.hpp"
+#include "<output>/include/TypeDictionary-inl.hpp"
+
+namespace OMR {
+namespace JitBuilder {
+
+extern "C" void * getImpl_IlType(void * client) {
+    return static_cast<TR::IlType *>(static_cast<IlType *>(client)->_impl);
+}
+
+
+IlType::IlType(void * impl) {
+    if (impl != NULL) {
+        static_cast<TR::IlType *>(impl)->setClient(this);
+        initializeFromImpl(impl);
+    }
+}
+
+void IlType::initializeFromImpl(void * impl) {
+    _impl = impl;
+}
+
+IlType::~IlType() {}
+
+extern "C" void * allocateIlType(void * impl) {
+    return new IlType(impl);
+}
+
+} // JitBuilder
+} // OMR
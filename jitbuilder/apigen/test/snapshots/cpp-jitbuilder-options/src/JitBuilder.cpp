@@ -0,0 +1,493 @@
+/*******************************************************************************
+ * Copyright (c) 2026, 2026 IBM Corp. and others
+ *
+ * This program and the accompanying materials are made available under
+ * the terms of the Eclipse Public License 2.0 which accompanies this
+ * distribution and is available at http://eclipse.org/legal/epl-2.0
+ * or the Apache License, Version 2.0 which accompanies this distribution
+ * and is available at https://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * This Source Code may also be made available under the following Secondary
+ * Licenses when the conditions for such availability set forth in the
+ * Eclipse Public License, v. 2.0 are satisfied: GNU General Public License,
+ * version 2 with the GNU Classpath Exception [1] and GNU General Public
+ * License, version 2 with the OpenJDK Assembly Exception [2].
+ *
+ * [1] https://www.gnu.org/software/classpath/license.html
+ * [2] http://openjdk.java.net/legal/assembly-exception.html
+ *
+ * SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+ *******************************************************************************/
+        
+#include "ilgen/BytecodeBuilder.hpp"
+#include "ilgen/IlBuilder.hpp"
+#include "ilgen/MethodBuilder.hpp"
+#include "ilgen/IlType.hpp"
+#include "ilgen/IlValue.hpp"
+#include "ilgen/ThunkBuilder.hpp"
+#include "ilgen/TypeDictionary.hpp"
+#include "ilgen/VirtualMachineOperandArray.hpp"
+#include "ilgen/VirtualMachineOperandStack.hpp"
+#include "ilgen/VirtualMachineRegister.hpp"
+#include "ilgen/VirtualMachineRegisterInStruct.hpp"
+#include "ilgen/VirtualMachineState.hpp"
+#include "<output>/include/Macros.hpp"
+#include "<output>/include/Profiling.hpp"
+#include "<output>/include/Tracing.hpp"
+#include "<output>/include/BytecodeBuilder.hpp"
+#include "<output>/include/IlBuilder.hpp"
+#include "<output>/include/MethodBuilder.hpp"
+#include "<output>/include/IlType.hpp"
+#include "<output>/include/IlValue.hpp"
+#include "<output>/include/ThunkBuilder.hpp"
+#include "<output>/include/TypeDictionary.hpp"
+#include "<output>/include/VirtualMachineOperandArray.hpp"
+#include "<output>/include/VirtualMachineOperandStack.hpp"
+#include "<output>/include/VirtualMachineRegister.hpp"
+#include "<output>/include/VirtualMachineRegisterInStruct.hpp"
+#include "<output>/include/VirtualMachineState.hpp"
+#include "<output>/include/BytecodeBuilder-inl.hpp"
+#include "<output>/include/IlBuilder-inl.hpp"
+#include "<output>/include/MethodBuilder-inl.hpp"
+#include "<output>/include/IlType-inl.hpp"
+#include "<output>/include/IlValue-inl.hpp"
+#include "<output>/include/ThunkBuilder-inl.hpp"
+#include "<output>/include/TypeDictionary-inl.hpp"
+#include "<output>/include/VirtualMachineOperandArray-inl.hpp"
+#include "<output>/include/VirtualMachineOperandStack-inl.hpp"
+#include "<output>/include/VirtualMachineRegister-inl.hpp"
+#include "<output>/include/VirtualMachineRegisterInStruct-inl.hpp"
+#include "<output>/include/VirtualMachineState-inl.hpp"
+#include "<output>/include/Async.hpp"
+#include <algorithm>
+#include <stdio.h>
+#include <string.h>
+
+extern bool internal_initializeJit();
+extern bool internal_initializeJitWithOptions(char * options);
+extern int32_t internal_compileMethodBuilder(TR::MethodBuilder * methodBuilder, void ** entryPoint);
+extern void internal_shutdownJit();
+
+extern bool internal_claimClientAllocators(const char * clientAPI);
+
+static bool registerAllocators() {
+    if (!internal_claimClientAllocators("C++")) {
+        return false;
+    }
+    TR::BytecodeBuilder::setClientAllocator(OMR::JitBuilder::allocateBytecodeBuilder);
+    TR::BytecodeBuilder::setGetImpl(OMR::JitBuilder::getImpl_BytecodeBuilder);
+    TR::IlBuilder::JBCase::setClientAllocator(OMR::JitBuilder::allocateIlBuilderJBCase);
+    TR::IlBuilder::JBCase::setGetImpl(OMR::JitBuilder::getImpl_JBCase);
+    TR::IlBuilder::JBCondition::setClientAllocator(OMR::JitBuilder::allocateIlBuilderJBCondition);
+    TR::IlBuilder::JBCondition::setGetImpl(OMR::JitBuilder::getImpl_JBCondition);
+    TR::IlBuilder::setClientAllocator(OMR::JitBuilder::allocateIlBuilder);
+    TR::IlBuilder::setGetImpl(OMR::JitBuilder::getImpl_IlBuilder);
+    TR::MethodBuilder::setClientAllocator(OMR::JitBuilder::allocateMethodBuilder);
+    TR::MethodBuilder::setGetImpl(OMR::JitBuilder::getImpl_MethodBuilder);
+    TR::IlType::setClientAllocator(OMR::JitBuilder::allocateIlType);
+    TR::IlType::setGetImpl(OMR::JitBuilder::getImpl_IlType);
+    TR::IlValue::setClientAllocator(OMR::JitBuilder::allocateIlValue);
+    TR::IlValue::setGetImpl(OMR::JitBuilder::getImpl_IlValue);
+    TR::ThunkBuilder::setClientAllocator(OMR::JitBuilder::allocateThunkBuilder);
+    TR::ThunkBuilder::setGetImpl(OMR::JitBuilder::getImpl_ThunkBuilder);
+    TR::TypeDictionary::setClientAllocator(OMR::JitBuilder::allocateTypeDictionary);
+    TR::TypeDictionary::setGetImpl(OMR::JitBuilder::getImpl_TypeDictionary);
+    TR::VirtualMachineOperandArray::setClientAllocator(OMR::JitBuilder::allocateVirtualMachineOperandArray);
+    TR::VirtualMachineOperandArray::setGetImpl(OMR::JitBuilder::getImpl_VirtualMachineOperandArray);
+    TR::VirtualMachineOperandStack::setClientAllocator(OMR::JitBuilder::allocateVirtualMachineOperandStack);
+    TR::VirtualMachineOperandStack::setGetImpl(OMR::JitBuilder::getImpl_VirtualMachineOperandStack);
+    TR::VirtualMachineRegister::setClientAllocator(OMR::JitBuilder::allocateVirtualMachineRegister);
+    TR::VirtualMachineRegister::setGetImpl(OMR::JitBuilder::getImpl_VirtualMachineRegister);
+    TR::VirtualMachineRegisterInStruct::setClientAllocator(OMR::JitBuilder::allocateVirtualMachineRegisterInStruct);
+    TR::VirtualMachineRegisterInStruct::setGetImpl(OMR::JitBuilder::getImpl_VirtualMachineRegisterInStruct);
+    TR::VirtualMachineState::setClientAllocator(OMR::JitBuilder::allocateVirtualMachineState);
+    TR::VirtualMachineState::setGetImpl(OMR::JitBuilder::getImpl_VirtualMachineState);
+    return true;
+}
+
+static bool setAllocators() {
+    static const bool allocatorsSet = registerAllocators();
+    return allocatorsSet;
+}
+
+bool initializeJit() {
+    PROFILE_TIMED_CALL(267); // initializeJit()
+    TRACE_CALL(267); // initializeJit()
+    if (!setAllocators()) {
+        TRACE_RETURN();
+        TRACE_VALUE(uint8_t, false);
+        return false;
+    }
+    auto ret = internal_initializeJit();
+    TRACE_RETURN();
+    TRACE_VALUE(uint8_t, ret);
+    return ret;
+}
+
+bool initializeJitWithOptions(char * options) {
+    PROFILE_TIMED_CALL(268); // initializeJitWithOptions(string)
+    TRACE_CALL(268); // initializeJitWithOptions(string)
+    TRACE_STRING(options);
+    if (!setAllocators()) {
+        TRACE_RETURN();
+        TRACE_VALUE(uint8_t, false);
+        return false;
+    }
+    auto ret = internal_initializeJitWithOptions(options);
+    TRACE_RETURN();
+    TRACE_VALUE(uint8_t, ret);
+    return ret;
+}
+
+int32_t compileMethodBuilder(OMR::JitBuilder::MethodBuilder * methodBuilder, void ** entryPoint) {
+    PROFILE_TIMED_CALL(269); // compileMethodBuilder(MethodBuilder, ppointer)
+    TRACE_CALL(269); // compileMethodBuilder(MethodBuilder, ppointer)
+    TRACE_OBJECT(methodBuilder);
+    TRACE_POINTER(entryPoint);
+    auto ret = internal_compileMethodBuilder(static_cast<TR::MethodBuilder *>(static_cast<TR::IlBuilder *>(methodBuilder != NULL ? methodBuilder->_impl : NULL)), entryPoint);
+    TRACE_RETURN();
+    TRACE_VALUE(int32_t, ret);
+    return ret;
+}
+
+void shutdownJit() {
+    PROFILE_TIMED_CALL(270); // shutdownJit()
+    TRACE_CALL(270); // shutdownJit()
+    internal_shutdownJit();
+    TRACE_RETURN();
+}
+
+std::future<int32_t> compileMethodBuilderAsync(OMR::JitBuilder::MethodBuilder * methodBuilder, void ** entryPoint, std::function<void(int32_t)> onComplete) {
+    return OMR::JitBuilder::submitAsync<int32_t>([=]() { return compileMethodBuilder(methodBuilder, entryPoint); }, onComplete);
+}
+
+namespace OMR {
+namespace JitBuilder {
+
+AsyncWorkerPool asyncWorkerPool;
+
+} // JitBuilder
+} // OMR
+
+void setAsyncWorkerCount(size_t count) {
+    OMR::JitBuilder::asyncWorkerPool.setMaxWorkers(count);
+}
+
+void waitForAsyncServices() {
+    OMR::JitBuilder::asyncWorkerPool.wait();
+}
+
+namespace OMR {
+namespace JitBuilder {
+
+static const char * profileEntryNames[] = {
+    "BytecodeBuilder::bcIndex()",
+    "BytecodeBuilder::name()",
+    "BytecodeBuilder::vmState()",
+    "BytecodeBuilder::AddFallThroughBuilder(BytecodeBuilder)",
+    "BytecodeBuilder::AddSuccessorBuilders(uint32, BytecodeBuilder[])",
+    "BytecodeBuilder::AddSuccessorBuilder(BytecodeBuilder*)",
+    "BytecodeBuilder::Goto(BytecodeBuilder)",
+    "BytecodeBuilder::Goto(BytecodeBuilder*)",
+    "BytecodeBuilder::IfCmpEqual(BytecodeBuilder, IlValue, IlValue)",
+    "BytecodeBuilder::IfCmpEqual(BytecodeBuilder*, IlValue, IlValue)",
+    "BytecodeBuilder::IfCmpLessOrEqual(BytecodeBuilder, IlValue, IlValue)",
+    "BytecodeBuilder::IfCmpLessOrEqual(BytecodeBuilder*, IlValue, IlValue)",
+    "BytecodeBuilder::IfCmpLessThan(BytecodeBuilder, IlValue, IlValue)",
+    "BytecodeBuilder::IfCmpLessThan(BytecodeBuilder*, IlValue, IlValue)",
+    "BytecodeBuilder::IfCmpGreaterOrEqual(BytecodeBuilder, IlValue, IlValue)",
+    "BytecodeBuilder::IfCmpGreaterOrEqual(BytecodeBuilder*, IlValue, IlValue)",
+    "BytecodeBuilder::IfCmpGreaterThan(BytecodeBuilder, IlValue, IlValue)",
+    "BytecodeBuilder::IfCmpGreaterThan(BytecodeBuilder*, IlValue, IlValue)",
+    "BytecodeBuilder::IfCmpNotEqual(BytecodeBuilder, IlValue, IlValue)",
+    "BytecodeBuilder::IfCmpNotEqual(BytecodeBuilder*, IlValue, IlValue)",
+    "BytecodeBuilder::IfCmpUnsignedLessOrEqual(BytecodeBuilder, IlValue, IlValue)",
+    "BytecodeBuilder::IfCmpUnsignedLessOrEqual(BytecodeBuilder*, IlValue, IlValue)",
+    "BytecodeBuilder::IfCmpUnsignedLessThan(BytecodeBuilder, IlValue, IlValue)",
+    "BytecodeBuilder::IfCmpUnsignedLessThan(BytecodeBuilder*, IlValue, IlValue)",
+    "BytecodeBuilder::IfCmpUnsignedGreaterOrEqual(BytecodeBuilder, IlValue, IlValue)",
+    "BytecodeBuilder::IfCmpUnsignedGreaterOrEqual(BytecodeBuilder*, IlValue, IlValue)",
+    "BytecodeBuilder::IfCmpUnsignedGreaterThan(BytecodeBuilder, IlValue, IlValue)",
+    "BytecodeBuilder::IfCmpUnsignedGreaterThan(BytecodeBuilder*, IlValue, IlValue)",
+    "BytecodeBuilder::IfCmpEqualZero(BytecodeBuilder, IlValue)",
+    "BytecodeBuilder::IfCmpEqualZero(BytecodeBuilder*, IlValue)",
+    "BytecodeBuilder::IfCmpNotEqualZero(BytecodeBuilder, IlValue)",
+    "BytecodeBuilder::IfCmpNotEqualZero(BytecodeBuilder*, IlValue)",
+    "IlBuilder::JBCase::JBCase(int32, IlBuilder, int32)",
+    "IlBuilder::JBCondition::JBCondition(IlBuilder, IlValue)",
+    "IlBuilder::buildIL() [thunk]",
+    "IlBuilder::buildIL()",
+    "IlBuilder::OrphanBuilder()",
+    "IlBuilder::OrphanBytecodeBuilder(int32, string)",
+    "IlBuilder::Copy(IlValue)",
+    "IlBuilder::typeDictionary()",
+    "IlBuilder::ConstInteger(IlType, int64)",
+    "IlBuilder::ConstAddress(pointer)",
+    "IlBuilder::ConstDouble(double)",
+    "IlBuilder::ConstFloat(float)",
+    "IlBuilder::ConstInt8(int8)",
+    "IlBuilder::ConstInt16(int16)",
+    "IlBuilder::ConstInt32(int32)",
+    "IlBuilder::ConstInt64(int64)",
+    "IlBuilder::ConstString(string)",
+    "IlBuilder::Const(pointer)",
+    "IlBuilder::Const(double)",
+    "IlBuilder::Const(float)",
+    "IlBuilder::Const(int8)",
+    "IlBuilder::Const(int16)",
+    "IlBuilder::Const(int32)",
+    "IlBuilder::Const(int64)",
+    "IlBuilder::NullAddress()",
+    "IlBuilder::Add(IlValue, IlValue)",
+    "IlBuilder::AddWithOverflow(IlBuilder*, IlValue, IlValue)",
+    "IlBuilder::AddWithUnsignedOverflow(IlBuilder*, IlValue, IlValue)",
+    "IlBuilder::And(IlValue, IlValue)",
+    "IlBuilder::Div(IlValue, IlValue)",
+    "IlBuilder::UnsignedDiv(IlValue, IlValue)",
+    "IlBuilder::IndexAt(IlType, IlValue, IlValue)",
+    "IlBuilder::Mul(IlValue, IlValue)",
+    "IlBuilder::MulWithOverflow(IlBuilder*, IlValue, IlValue)",
+    "IlBuilder::Negate(IlValue)",
+    "IlBuilder::Or(IlValue, IlValue)",
+    "IlBuilder::Rem(IlValue, IlValue)",
+    "IlBuilder::UnsignedRem(IlValue, IlValue)",
+    "IlBuilder::ShiftL(IlValue, IlValue)",
+    "IlBuilder::ShiftR(IlValue, IlValue)",
+    "IlBuilder::Sub(IlValue, IlValue)",
+    "IlBuilder::SubWithOverflow(IlBuilder*, IlValue, IlValue)",
+    "IlBuilder::SubWithUnsignedOverflow(IlBuilder*, IlValue, IlValue)",
+    "IlBuilder::UnsignedShiftR(IlValue, IlValue)",
+    "IlBuilder::Xor(IlValue, IlValue)",
+    "IlBuilder::EqualTo(IlValue, IlValue)",
+    "IlBuilder::LessOrEqualTo(IlValue, IlValue)",
+    "IlBuilder::LessThan(IlValue, IlValue)",
+    "IlBuilder::GreaterOrEqualTo(IlValue, IlValue)",
+    "IlBuilder::GreaterThan(IlValue, IlValue)",
+    "IlBuilder::NotEqualTo(IlValue, IlValue)",
+    "IlBuilder::UnsignedLessOrEqualTo(IlValue, IlValue)",
+    "IlBuilder::UnsignedLessThan(IlValue, IlValue)",
+    "IlBuilder::UnsignedGreaterOrEqualTo(IlValue, IlValue)",
+    "IlBuilder::UnsignedGreaterThan(IlValue, IlValue)",
+    "IlBuilder::ConvertBitsTo(IlType, IlValue)",
+    "IlBuilder::ConvertTo(IlType, IlValue)",
+    "IlBuilder::UnsignedConvertTo(IlType, IlValue)",
+    "IlBuilder::AtomicAdd(IlValue, IlValue)",
+    "IlBuilder::CreateLocalArray(int32, IlType)",
+    "IlBuilder::CreateLocalStruct(IlType)",
+    "IlBuilder::Load(constString)",
+    "IlBuilder::LoadAt(IlType, IlValue)",
+    "IlBuilder::LoadIndirect(constString, constString, IlValue)",
+    "IlBuilder::Store(constString, IlValue)",
+    "IlBuilder::StoreAt(IlValue, IlValue)",
+    "IlBuilder::StoreIndirect(constString, constString, IlValue, IlValue)",
+    "IlBuilder::StoreOver(IlValue, IlValue)",
+    "IlBuilder::Transaction(IlBuilder*, IlBuilder*, IlBuilder*)",
+    "IlBuilder::TransactionAbort()",
+    "IlBuilder::StructFieldInstanceAddress(constString, constString, IlValue)",
+    "IlBuilder::UnionFieldInstanceAddress(constString, constString, IlValue)",
+    "IlBuilder::VectorLoad(string)",
+    "IlBuilder::VectorLoadAt(IlType, IlValue)",
+    "IlBuilder::VectorStore(string, IlValue)",
+    "IlBuilder::VectorStoreAt(IlValue, IlValue)",
+    "IlBuilder::AppendBuilder(IlBuilder)",
+    "IlBuilder::Call(constString, int32, IlValue[])",
+    "IlBuilder::Call(MethodBuilder, int32, IlValue[])",
+    "IlBuilder::ComputedCall(string, int32, IlValue[])",
+    "IlBuilder::DoWhileLoop(string, IlBuilder*)",
+    "IlBuilder::DoWhileLoop(string, IlBuilder*, IlBuilder*, IlBuilder*)",
+    "IlBuilder::DoWhileLoopWithBreak(string, IlBuilder*, IlBuilder*)",
+    "IlBuilder::DoWhileLoopWithContinue(string, IlBuilder*, IlBuilder*)",
+    "IlBuilder::Goto(IlBuilder)",
+    "IlBuilder::Goto(IlBuilder*)",
+    "IlBuilder::MakeCondition(IlBuilder, IlValue)",
+    "IlBuilder::IfAnd(IlBuilder*, IlBuilder*, int32, JBCondition[])",
+    "IlBuilder::IfCmpEqual(IlBuilder, IlValue, IlValue)",
+    "IlBuilder::IfCmpEqual(IlBuilder*, IlValue, IlValue)",
+    "IlBuilder::IfCmpLessOrEqual(IlBuilder, IlValue, IlValue)",
+    "IlBuilder::IfCmpLessOrEqual(IlBuilder*, IlValue, IlValue)",
+    "IlBuilder::IfCmpLessThan(IlBuilder, IlValue, IlValue)",
+    "IlBuilder::IfCmpLessThan(IlBuilder*, IlValue, IlValue)",
+    "IlBuilder::IfCmpGreaterOrEqual(IlBuilder, IlValue, IlValue)",
+    "IlBuilder::IfCmpGreaterOrEqual(IlBuilder*, IlValue, IlValue)",
+    "IlBuilder::IfCmpGreaterThan(IlBuilder, IlValue, IlValue)",
+    "IlBuilder::IfCmpGreaterThan(IlBuilder*, IlValue, IlValue)",
+    "IlBuilder::IfCmpNotEqual(IlBuilder, IlValue, IlValue)",
+    "IlBuilder::IfCmpNotEqual(IlBuilder*, IlValue, IlValue)",
+    "IlBuilder::IfCmpUnsignedLessOrEqual(IlBuilder, IlValue, IlValue)",
+    "IlBuilder::IfCmpUnsignedLessOrEqual(IlBuilder*, IlValue, IlValue)",
+    "IlBuilder::IfCmpUnsignedLessThan(IlBuilder, IlValue, IlValue)",
+    "IlBuilder::IfCmpUnsignedLessThan(IlBuilder*, IlValue, IlValue)",
+    "IlBuilder::IfCmpUnsignedGreaterOrEqual(IlBuilder, IlValue, IlValue)",
+    "IlBuilder::IfCmpUnsignedGreaterOrEqual(IlBuilder*, IlValue, IlValue)",
+    "IlBuilder::IfCmpUnsignedGreaterThan(IlBuilder, IlValue, IlValue)",
+    "IlBuilder::IfCmpUnsignedGreaterThan(IlBuilder*, IlValue, IlValue)",
+    "IlBuilder::IfCmpEqualZero(IlBuilder, IlValue)",
+    "IlBuilder::IfCmpEqualZero(IlBuilder*, IlValue)",
+    "IlBuilder::IfCmpNotEqualZero(IlBuilder, IlValue)",
+    "IlBuilder::IfCmpNotEqualZero(IlBuilder*, IlValue)",
+    "IlBuilder::IfOr(IlBuilder*, IlBuilder*, int32, JBCondition[])",
+    "IlBuilder::IfThen(IlBuilder*, IlValue)",
+    "IlBuilder::IfThenElse(IlBuilder*, IlBuilder*, IlValue)",
+    "IlBuilder::Select(IlValue, IlValue, IlValue)",
+    "IlBuilder::ForLoop(boolean, string, IlBuilder*, IlBuilder*, IlBuilder*, IlValue, IlValue, IlValue)",
+    "IlBuilder::ForLoopDown(string, IlBuilder*, IlValue, IlValue, IlValue)",
+    "IlBuilder::ForLoopUp(string, IlBuilder*, IlValue, IlValue, IlValue)",
+    "IlBuilder::ForLoopWithBreak(boolean, string, IlBuilder*, IlBuilder*, IlValue, IlValue, IlValue)",
+    "IlBuilder::ForLoopWithContinue(boolean, string, IlBuilder*, IlBuilder*, IlValue, IlValue, IlValue)",
+    "IlBuilder::Return()",
+    "IlBuilder::Return(IlValue)",
+    "IlBuilder::Switch(IlValue, IlBuilder*, int32, JBCase[])",
+    "IlBuilder::TableSwitch(IlValue, IlBuilder*, boolean, int32, JBCase[])",
+    "IlBuilder::MakeCase(int32, IlBuilder*, int32)",
+    "IlBuilder::WhileDoLoop(string, IlBuilder*)",
+    "IlBuilder::WhileDoLoopWithBreak(string, IlBuilder*, IlBuilder*)",
+    "IlBuilder::WhileDoLoopWithContinue(string, IlBuilder*, IlBuilder*)",
+    "MethodBuilder::MethodBuilder(TypeDictionary)",
+    "MethodBuilder::MethodBuilder(TypeDictionary, VirtualMachineState)",
+    "MethodBuilder::MethodBuilder(MethodBuilder)",
+    "MethodBuilder::MethodBuilder(MethodBuilder, VirtualMachineState)",
+    "MethodBuilder::RequestFunction(constString) [thunk]",
+    "MethodBuilder::RequestFunction(constString)",
+    "MethodBuilder::AllLocalsHaveBeenDefined()",
+    "MethodBuilder::AppendBuilder(IlBuilder)",
+    "MethodBuilder::AppendBuilder(BytecodeBuilder)",
+    "MethodBuilder::AppendBytecodeBuilder(BytecodeBuilder)",
+    "MethodBuilder::DefineFile(constString)",
+    "MethodBuilder::DefineLine(constString)",
+    "MethodBuilder::DefineLine(int32)",
+    "MethodBuilder::DefineName(constString)",
+    "MethodBuilder::DefineParameter(constString, IlType)",
+    "MethodBuilder::DefineArrayParameter(constString, IlType)",
+    "MethodBuilder::DefineReturnType(IlType)",
+    "MethodBuilder::DefineLocal(constString, IlType)",
+    "MethodBuilder::DefineGlobal(constString, IlType, pointer)",
+    "MethodBuilder::DefineMemory(constString, IlType, pointer)",
+    "MethodBuilder::DefineFunction(constString, constString, constString, pointer, IlType, int32, IlType[])",
+    "MethodBuilder::GetMethodName()",
+    "MethodBuilder::GetNextBytecodeFromWorklist()",
+    "MethodBuilder::setVMState(VirtualMachineState)",
+    "IlType::baseType()",
+    "IlType::getName()",
+    "IlType::primitiveType(TypeDictionary)",
+    "IlType::getSize()",
+    "IlType::isPointer()",
+    "IlValue::getID()",
+    "ThunkBuilder::ThunkBuilder(TypeDictionary, constString, IlType, uint32, IlType[])",
+    "TypeDictionary::TypeDictionary()",
+    "TypeDictionary::CloseStruct(constString)",
+    "TypeDictionary::CloseStruct(constString, unsignedInteger)",
+    "TypeDictionary::CloseUnion(constString)",
+    "TypeDictionary::DefineField(constString, constString, IlType)",
+    "TypeDictionary::DefineField(constString, constString, IlType, unsignedInteger)",
+    "TypeDictionary::DefineStruct(constString)",
+    "TypeDictionary::DefineUnion(constString)",
+    "TypeDictionary::GetFieldType(constString, constString)",
+    "TypeDictionary::LookupStruct(constString)",
+    "TypeDictionary::LookupUnion(constString)",
+    "TypeDictionary::OffsetOf(constString, constString)",
+    "TypeDictionary::PointerTo(IlType)",
+    "TypeDictionary::PointerTo(constString)",
+    "TypeDictionary::UnionField(constString, constString, IlType)",
+    "TypeDictionary::UnionFieldType(constString, constString)",
+    "VirtualMachineOperandArray::VirtualMachineOperandArray(MethodBuilder, int32, IlType, VirtualMachineRegister)",
+    "VirtualMachineOperandArray::VirtualMachineOperandArray(VirtualMachineOperandArray)",
+    "VirtualMachineOperandArray::Commit(IlBuilder) [thunk]",
+    "VirtualMachineOperandArray::Reload(IlBuilder) [thunk]",
+    "VirtualMachineOperandArray::MakeCopy() [thunk]",
+    "VirtualMachineOperandArray::MergeInto(VirtualMachineState, IlBuilder) [thunk]",
+    "VirtualMachineOperandArray::Commit(IlBuilder)",
+    "VirtualMachineOperandArray::Reload(IlBuilder)",
+    "VirtualMachineOperandArray::MakeCopy()",
+    "VirtualMachineOperandArray::MergeInto(VirtualMachineState, IlBuilder)",
+    "VirtualMachineOperandArray::Get(int32)",
+    "VirtualMachineOperandArray::Move(IlBuilder, int32, int32)",
+    "VirtualMachineOperandArray::Set(int32, IlValue)",
+    "VirtualMachineOperandArray::UpdateArray(IlBuilder, IlValue)",
+    "VirtualMachineOperandStack::VirtualMachineOperandStack(MethodBuilder, int32, IlType, VirtualMachineRegister)",
+    "VirtualMachineOperandStack::VirtualMachineOperandStack(MethodBuilder, int32, IlType, VirtualMachineRegister, boolean)",
+    "VirtualMachineOperandStack::VirtualMachineOperandStack(MethodBuilder, int32, IlType, VirtualMachineRegister, boolean, int32)",
+    "VirtualMachineOperandStack::Commit(IlBuilder) [thunk]",
+    "VirtualMachineOperandStack::Reload(IlBuilder) [thunk]",
+    "VirtualMachineOperandStack::MakeCopy() [thunk]",
+    "VirtualMachineOperandStack::MergeInto(VirtualMachineState, IlBuilder) [thunk]",
+    "VirtualMachineOperandStack::Commit(IlBuilder)",
+    "VirtualMachineOperandStack::Reload(IlBuilder)",
+    "VirtualMachineOperandStack::MakeCopy()",
+    "VirtualMachineOperandStack::MergeInto(VirtualMachineState, IlBuilder)",
+    "VirtualMachineOperandStack::Drop(IlBuilder, int32)",
+    "VirtualMachineOperandStack::Dup(IlBuilder)",
+    "VirtualMachineOperandStack::Pick(int32)",
+    "VirtualMachineOperandStack::Pop(IlBuilder)",
+    "VirtualMachineOperandStack::Push(IlBuilder, IlValue)",
+    "VirtualMachineOperandStack::Top()",
+    "VirtualMachineOperandStack::UpdateStack(IlBuilder, IlValue)",
+    "VirtualMachineRegister::VirtualMachineRegister(IlBuilder, constString, IlType, uint32, IlValue)",
+    "VirtualMachineRegister::Commit(IlBuilder) [thunk]",
+    "VirtualMachineRegister::Reload(IlBuilder) [thunk]",
+    "VirtualMachineRegister::MakeCopy() [thunk]",
+    "VirtualMachineRegister::Commit(IlBuilder)",
+    "VirtualMachineRegister::Reload(IlBuilder)",
+    "VirtualMachineRegister::MakeCopy()",
+    "VirtualMachineRegister::Adjust(IlBuilder, IlValue)",
+    "VirtualMachineRegister::Adjust(IlBuilder, unsignedInteger)",
+    "VirtualMachineRegister::Load(IlBuilder)",
+    "VirtualMachineRegister::Store(IlBuilder, IlValue)",
+    "VirtualMachineRegisterInStruct::VirtualMachineRegisterInStruct(IlBuilder, constString, constString, constString, constString)",
+    "VirtualMachineRegisterInStruct::Commit(IlBuilder) [thunk]",
+    "VirtualMachineRegisterInStruct::Reload(IlBuilder) [thunk]",
+    "VirtualMachineRegisterInStruct::MakeCopy() [thunk]",
+    "VirtualMachineRegisterInStruct::Commit(IlBuilder)",
+    "VirtualMachineRegisterInStruct::Reload(IlBuilder)",
+    "VirtualMachineRegisterInStruct::MakeCopy()",
+    "VirtualMachineState::VirtualMachineState()",
+    "VirtualMachineState::Commit(IlBuilder) [thunk]",
+    "VirtualMachineState::Reload(IlBuilder) [thunk]",
+    "VirtualMachineState::MakeCopy() [thunk]",
+    "VirtualMachineState::MergeInto(VirtualMachineState, IlBuilder) [thunk]",
+    "VirtualMachineState::Commit(IlBuilder)",
+    "VirtualMachineState::Reload(IlBuilder)",
+    "VirtualMachineState::MakeCopy()",
+    "VirtualMachineState::MergeInto(VirtualMachineState, IlBuilder)",
+    "initializeJit()",
+    "initializeJitWithOptions(string)",
+    "compileMethodBuilder(MethodBuilder, ppointer)",
+    "shutdownJit()",
+};
+
+thread_local ProfileEntry profileEntries[271] = {};
+
+} // JitBuilder
+} // OMR
+
+void dumpCallProfile(FILE * out, size_t count) {
+    int32_t order[271];
+    for (int32_t i = 0; i < 271; ++i) { order[i] = i; }
+    std::stable_sort(order, order + 271, [](int32_t l, int32_t r) { return OMR::JitBuilder::profileEntries[l].cycles > OMR::JitBuilder::profileEntries[r].cycles; });
+    fprintf(out, "%-60s %12s %16s\n", "entry point", "calls", "cycles");
+    for (size_t i = 0; i < count && i < 271; ++i) {
+        const OMR::JitBuilder::ProfileEntry & entry = OMR::JitBuilder::profileEntries[order[i]];
+        if (entry.calls == 0) break;
+        fprintf(out, "%-60s %12llu %16llu\n", OMR::JitBuilder::profileEntryNames[order[i]], (unsigned long long)entry.calls, (unsigned long long)entry.cycles);
+    }
+}
+
+void resetCallProfile() {
+    memset(OMR::JitBuilder::profileEntries, 0, sizeof(OMR::JitBuilder::ProfileEntry) * 271);
+}
+
+namespace OMR {
+namespace JitBuilder {
+
+thread_local CallTrace callTrace;
+
+} // JitBuilder
+} // OMR
+
+bool writeCallTrace(const char * path) {
+    return OMR::JitBuilder::callTrace.write(path, 271);
+}
+
+void clearCallTrace() {
+    OMR::JitBuilder::callTrace.clear();
+}
+
@@ -0,0 +1,163 @@
+/*******************************************************************************
+ * Copyright (c) 2026, 2026 IBM Corp. and others
+ *
+ * This program and the accompanying materials are made available under
+ * the terms of the Eclipse Public License 2.0 which accompanies this
+ * distribution and is available at http://eclipse.org/legal/epl-2.0
+ * or the Apache License, Version 2.0 which accompanies this distribution
+ * and is available at https://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * This Source Code may also be made available under the following Secondary
+ * Licenses when the conditions for such availability set forth in the
+ * Eclipse Public License, v. 2.0 are satisfied: GNU General Public License,
+ * version 2 with the GNU Classpath Exception [1] and GNU General Public
+ * License, version 2 with the OpenJDK Assembly Exception [2].
+ *
+ * [1] https://www.gnu.org/software/classpath/license.html
+ * [2] http://openjdk.java.net/legal/assembly-exception.html
+ *
+ * SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+ *******************************************************************************/
+        
+#include "ilgen/BytecodeBuilder.hpp"
+#include "ilgen/IlBuilder.hpp"
+#include "ilgen/MethodBuilder.hpp"
+#include "ilgen/IlType.hpp"
+#include "ilgen/TypeDictionary.hpp"
+#include "ilgen/VirtualMachineState.hpp"
+#include "<output>/include/Macros.hpp"
+#include "<output>/include/Profiling.hpp"
+#include "<output>/include/Tracing.hpp"
+#include "<output>/include/BytecodeBuilder.hpp"
+#include "<output>/include/IlBuilder.hpp"
+#include "<output>/include/MethodBuilder.hpp"
+#include "<output>/include/IlType.hpp"
+#include "<output>/include/TypeDictionary.hpp"
+#include "<output>/include/VirtualMachineState.hpp"
+#include "<output>/include/BytecodeBuilder-inl.hpp"
+#include "<output>/include/IlBuilder-inl.hpp"
+#include "<output>/include/MethodBuilder-inl.hpp"
+#include "<output>/include/IlType-inl.hpp"
+#include "<output>/include/TypeDictionary-inl.hpp"
+#include "<output>/include/VirtualMachineState-inl.hpp"
+
+namespace OMR {
+namespace JitBuilder {
+
+extern "C" bool MethodBuilderCallback_RequestFunction(void * clientObj, const char * name) {
+    PROFILE_TIMED_CALL(165); // MethodBuilder::RequestFunction(constString) [thunk]
+    MethodBuilder * client = static_cast<MethodBuilder *>(clientObj);
+    TRACE_CALL(165); // MethodBuilder::RequestFunction(constString) [thunk]
+    TRACE_OBJECT(client);
+    TRACE_STRING(name);
+    bool ret = client->RequestFunction(name);
+    TRACE_RETURN();
+    TRACE_VALUE(uint8_t, ret);
+    return ret;
+}
+
+extern "C" void * getImpl_MethodBuilder(void * client) {
+    return static_cast<TR::MethodBuilder *>(static_cast<TR::IlBuilder *>(static_cast<MethodBuilder *>(client)->_impl));
+}
+
+MethodBuilder::MethodBuilder(TypeDictionary * dict): IlBuilder((void *)NULL) {
+    PROFILE_TIMED_CALL(161); // MethodBuilder::MethodBuilder(TypeDictionary)
+    TRACE_CALL(161); // MethodBuilder::MethodBuilder(TypeDictionary)
+    TRACE_OBJECT(dict);
+    auto * impl = ::new TR::MethodBuilder(static_cast<TR::TypeDictionary *>(dict != NULL ? dict->_impl : NULL));
+    static_cast<TR::MethodBuilder *>(static_cast<TR::IlBuilder *>(impl))->setClient(this);
+    initializeFromImpl(static_cast<void *>(static_cast<TR::IlBuilder *>(impl)));
+    TRACE_RETURN();
+    TRACE_OBJECT(this);
+}
+MethodBuilder::MethodBuilder(TypeDictionary * dict, VirtualMachineState * vmState): IlBuilder((void *)NULL) {
+    PROFILE_TIMED_CALL(162); // MethodBuilder::MethodBuilder(TypeDictionary, VirtualMachineState)
+    TRACE_CALL(162); // MethodBuilder::MethodBuilder(TypeDictionary, VirtualMachineState)
+    TRACE_OBJECT(dict);
+    TRACE_OBJECT(vmState);
+    auto * impl = ::new TR::MethodBuilder(static_cast<TR::TypeDictionary *>(dict != NULL ? dict->_impl : NULL), static_cast<TR::VirtualMachineState *>(vmState != NULL ? vmState->_impl : NULL));
+    static_cast<TR::MethodBuilder *>(static_cast<TR::IlBuilder *>(impl))->setClient(this);
+    initializeFromImpl(static_cast<void *>(static_cast<TR::IlBuilder *>(impl)));
+    TRACE_RETURN();
+    TRACE_OBJECT(this);
+}
+MethodBuilder::MethodBuilder(MethodBuilder * callerMB): IlBuilder((void *)NULL) {
+    PROFILE_TIMED_CALL(163); // MethodBuilder::MethodBuilder(MethodBuilder)
+    TRACE_CALL(163); // MethodBuilder::MethodBuilder(MethodBuilder)
+    TRACE_OBJECT(callerMB);
+    auto * impl = ::new TR::MethodBuilder(static_cast<TR::MethodBuilder *>(static_cast<TR::IlBuilder *>(callerMB != NULL ? callerMB->_impl : NULL)));
+    static_cast<TR::MethodBuilder *>(static_cast<TR::IlBuilder *>(impl))->setClient(this);
+    initializeFromImpl(static_cast<void *>(static_cast<TR::IlBuilder *>(impl)));
+    TRACE_RETURN();
+    TRACE_OBJECT(this);
+}
+MethodBuilder::MethodBuilder(MethodBuilder * callerMB, VirtualMachineState * vmState): IlBuilder((void *)NULL) {
+    PROFILE_TIMED_CALL(164); // MethodBuilder::MethodBuilder(MethodBuilder, VirtualMachineState)
+    TRACE_CALL(164); // MethodBuilder::MethodBuilder(MethodBuilder, VirtualMachineState)
+    TRACE_OBJECT(callerMB);
+    TRACE_OBJECT(vmState);
+    auto * impl = ::new TR::MethodBuilder(static_cast<TR::MethodBuilder *>(static_cast<TR::IlBuilder *>(callerMB != NULL ? callerMB->_impl : NULL)), static_cast<TR::VirtualMachineState *>(vmState != NULL ? vmState->_impl : NULL));
+    static_cast<TR::MethodBuilder *>(static_cast<TR::IlBuilder *>(impl))->setClient(this);
+    initializeFromImpl(static_cast<void *>(static_cast<TR::IlBuilder *>(impl)));
+    TRACE_RETURN();
+    TRACE_OBJECT(this);
+}
+
+MethodBuilder::MethodBuilder(void * impl): IlBuilder((void *)NULL) {
+    if (impl != NULL) {
+        static_cast<TR::MethodBuilder *>(static_cast<TR::IlBuilder *>(impl))->setClient(this);
+        initializeFromImpl(static_cast<void *>(static_cast<TR::IlBuilder *>(static_cast<TR::MethodBuilder *>(impl))));
+    }
+}
+
+void MethodBuilder::initializeFromImpl(void * impl) {
+    IlBuilder::initializeFromImpl(impl);
+    static_cast<TR::MethodBuilder *>(static_cast<TR::IlBuilder *>(_impl))->setClientCallback_RequestFunction(reinterpret_cast<void*>(&MethodBuilderCallback_RequestFunction));
+}
+
+MethodBuilder::~MethodBuilder() {}
+
+void MethodBuilder::DefineFunction(const char * name, const char * fileName, const char * lineNumber, void * entryPoint, IlType * returnType, int32_t numParms, IlType ** parmTypes) {
+    PROFILE_TIMED_CALL(181); // MethodBuilder::DefineFunction(constString, constString, constString, pointer, IlType, int32, IlType[])
+    TRACE_CALL(181); // MethodBuilder::DefineFunction(constString, constString, constString, pointer, IlType, int32, IlType[])
+    TRACE_OBJECT(this);
+    TRACE_STRING(name);
+    TRACE_STRING(fileName);
+    TRACE_STRING(lineNumber);
+    TRACE_POINTER(entryPoint);
+    TRACE_OBJECT(returnType);
+    TRACE_VALUE(int32_t, numParms);
+    TRACE_ARRAY(numParms, parmTypes);
+    ARRAY_ARG_SETUP(IlType, numParms, parmTypesArg, parmTypes);
+    static_cast<TR::MethodBuilder *>(static_cast<TR::IlBuilder *>(_impl))->DefineFunction(name, fileName, lineNumber, entryPoint, static_cast<TR::IlType *>(returnType != NULL ? returnType->_impl : NULL), numParms, parmTypesArg);
+    ARRAY_ARG_RETURN(IlType, numParms, parmTypesArg, parmTypes);
+    TRACE_RETURN();
+}
+
+void MethodBuilder::DefineFunction(const char * name, const char * fileName, const char * lineNumber, void * entryPoint, IlType * returnType, int32_t numParms, ...) {
+    IlType ** parmTypes = new IlType *[numParms];
+    va_list vararg;
+    va_start(vararg, numParms);
+    for (int i = 0; i < numParms; ++i) { parmTypes[i] = va_arg(vararg, IlType *); }
+    va_end(vararg);
+    DefineFunction(name, fileName, lineNumber, entryPoint, returnType, numParms, parmTypes);
+    delete[] parmTypes;
+}
+
+bool MethodBuilder::RequestFunction(const char * name) {
+    PROFILE_TIMED_CALL(166); // MethodBuilder::RequestFunction(constString)
+    TRACE_CALL(166); // MethodBuilder::RequestFunction(constString)
+    TRACE_OBJECT(this);
+    TRACE_STRING(name);
+    auto ret = static_cast<TR::MethodBuilder *>(static_cast<TR::IlBuilder *>(_impl))->RequestFunction(name);
+    TRACE_RETURN();
+    TRACE_VALUE(uint8_t, ret);
+    return ret;
+}
+
+extern "C" void * allocateMethodBuilder(void * impl) {
+    return new MethodBuilder(impl);
+}
+
+} // JitBuilder
+} // OMR
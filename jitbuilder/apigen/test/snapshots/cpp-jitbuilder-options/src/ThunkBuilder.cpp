@@ -0,0 +1,83 @@
+/*******************************************************************************
+ * Copyright (c) 2026, 2026 IBM Corp. and others
+ *
+ * This program and the accompanying materials are made available under
+ * the terms of the Eclipse Public License 2.0 which accompanies this
+ * distribution and is available at http://eclipse.org/legal/epl-2.0
+ * or the Apache License, Version 2.0 which accompanies this distribution
+ * and is available at https://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * This Source Code may also be made available under the following Secondary
+ * Licenses when the conditions for such availability set forth in the
+ * Eclipse Public License, v. 2.0 are satisfied: GNU General Public License,
+ * version 2 with the GNU Classpath Exception [1] and GNU General Public
+ * License, version 2 with the OpenJDK Assembly Exception [2].
+ *
+ * [1] https://www.gnu.org/software/classpath/license.html
+ * [2] http://openjdk.java.net/legal/assembly-exception.html
+ *
+ * SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+ *******************************************************************************/
+        
+#include "ilgen/IlBuilder.hpp"
+#include "ilgen/MethodBuilder.hpp"
+#include "ilgen/IlType.hpp"
+#include "ilgen/ThunkBuilder.hpp"
+#include "ilgen/TypeDictionary.hpp"
+#include "<output>/include/Macros.hpp"
+#include "<output>/include/Profiling.hpp"
+#include "<output>/include/Tracing.hpp"
+#include "<output>/include/IlBuilder.hpp"
+#include "<output>/include/MethodBuilder.hpp"
+#include "<output>/include/IlType.hpp"
+#include "<output>/include/ThunkBuilder.hpp"
+#include "<output>/include/TypeDictionary.hpp"
+#include "<output>/include/IlBuilder-inl.hpp"
+#include "<output>/include/MethodBuilder-inl.hpp"
+#include "<output>/include/IlType-inl.hpp"
+#include "<output>/include/ThunkBuilder-inl.hpp"
+#include "<output>/include/TypeDictionary-inl.hpp"
+
+namespace OMR {
+namespace JitBuilder {
+
+extern "C" void * getImpl_ThunkBuilder(void * client) {
+    return static_cast<TR::ThunkBuilder *>(static_cast<TR::IlBuilder *>(static_cast<ThunkBuilder *>(client)->_impl));
+}
+
+ThunkBuilder::ThunkBuilder(TypeDictionary * dict, const char * name, IlType * returnType, uint32_t numCalleeParms, IlType ** calleeParms): MethodBuilder((void *)NULL) {
+    PROFILE_TIMED_CALL(191); // ThunkBuilder::ThunkBuilder(TypeDictionary, constString, IlType, uint32, IlType[])
+    TRACE_CALL(191); // ThunkBuilder::ThunkBuilder(TypeDictionary, constString, IlType, uint32, IlType[])
+    TRACE_OBJECT(dict);
+    TRACE_STRING(name);
+    TRACE_OBJECT(returnType);
+    TRACE_VALUE(uint32_t, numCalleeParms);
+    TRACE_ARRAY(numCalleeParms, calleeParms);
+    ARRAY_ARG_SETUP(IlType, numCalleeParms, calleeParmsArg, calleeParms);
+    auto * impl = ::new TR::ThunkBuilder(static_cast<TR::TypeDictionary *>(dict != NULL ? dict->_impl : NULL), name, static_cast<TR::IlType *>(returnType != NULL ? returnType->_impl : NULL), numCalleeParms, calleeParmsArg);
+    ARRAY_ARG_RETURN(IlType, numCalleeParms, calleeParmsArg, calleeParms);
+    static_cast<TR::ThunkBuilder *>(static_cast<TR::IlBuilder *>(impl))->setClient(this);
+    initializeFromImpl(static_cast<void *>(static_cast<TR::IlBuilder *>(impl)));
+    TRACE_RETURN();
+    TRACE_OBJECT(this);
+}
+
+ThunkBuilder::ThunkBuilder(void * impl): MethodBuilder((void *)NULL) {
+    if (impl != NULL) {
+        static_cast<TR::ThunkBuilder *>(static_cast<TR::IlBuilder *>(impl))->setClient(this);
+        initializeFromImpl(static_cast<void *>(static_cast<TR::IlBuilder *>(static_cast<TR::ThunkBuilder *>(impl))));
+    }
+}
+
+void ThunkBuilder::initializeFromImpl(void * impl) {
+    MethodBuilder::initializeFromImpl(impl);
+}
+
+ThunkBuilder::~ThunkBuilder() {}
+
+extern "C" void * allocateThunkBuilder(void * impl) {
+    return new ThunkBuilder(impl);
+}
+
+} // JitBuilder
+} // OMR
@@ -0,0 +1,181 @@
+/*******************************************************************************
+ * Copyright (c) 2026, 2026 IBM Corp. and others
+ *
+ * This program and the accompanying materials are made available under
+ * the terms of the Eclipse Public License 2.0 which accompanies this
+ * distribution and is available at http://eclipse.org/legal/epl-2.0
+ * or the Apache License, Version 2.0 which accompanies this distribution
+ * and is available at https://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * This Source Code may also be made available under the following Secondary
+ * Licenses when the conditions for such availability set forth in the
+ * Eclipse Public License, v. 2.0 are satisfied: GNU General Public License,
+ * version 2 with the GNU Classpath Exception [1] and GNU General Public
+ * License, version 2 with the OpenJDK Assembly Exception [2].
+ *
+ * [1] https://www.gnu.org/software/classpath/license.html
+ * [2] http://openjdk.java.net/legal/assembly-exception.html
+ *
+ * SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+ *******************************************************************************/
+        
+#include "ilgen/IlBuilder.hpp"
+#include "ilgen/MethodBuilder.hpp"
+#include "ilgen/IlType.hpp"
+#include "ilgen/IlValue.hpp"
+#include "ilgen/VirtualMachineOperandArray.hpp"
+#include "ilgen/VirtualMachineRegister.hpp"
+#include "ilgen/VirtualMachineState.hpp"
+#include "<output>/include/Macros.hpp"
+#include "<output>/include/Profiling.hpp"
+#include "<output>/include/Tracing.hpp"
+#include "<output>/include/IlBuilder.hpp"
+#include "<output>/include/MethodBuilder.hpp"
+#include "<output>/include/IlType.hpp"
+#include "<output>/include/IlValue.hpp"
+#include "<output>/include/VirtualMachineOperandArray.hpp"
+#include "<output>/include/VirtualMachineRegister.hpp"
+#include "<output>/include/VirtualMachineState.hpp"
+#include "<output>/include/IlBuilder-inl.hpp"
+#include "<output>/include/MethodBuilder-inl.hpp"
+#include "<output>/include/IlType-inl.hpp"
+#include "<output>/include/IlValue-inl.hpp"
+#include "<output>/include/VirtualMachineOperandArray-inl.hpp"
+#include "<output>/include/VirtualMachineRegister-inl.hpp"
+#include "<output>/include/VirtualMachineState-inl.hpp"
+
+namespace OMR {
+namespace JitBuilder {
+
+extern "C" void VirtualMachineOperandArrayCallback_Commit(void * clientObj, void * b) {
+    PROFILE_TIMED_CALL(210); // VirtualMachineOperandArray::Commit(IlBuilder) [thunk]
+    VirtualMachineOperandArray * client = static_cast<VirtualMachineOperandArray *>(clientObj);
+    TRACE_CALL(210); // VirtualMachineOperandArray::Commit(IlBuilder) [thunk]
+    TRACE_OBJECT(client);
+    TRACE_OBJECT(b);
+    client->Commit(static_cast<IlBuilder *>(b));
+    TRACE_RETURN();
+}
+
+extern "C" void VirtualMachineOperandArrayCallback_Reload(void * clientObj, void * b) {
+    PROFILE_TIMED_CALL(211); // VirtualMachineOperandArray::Reload(IlBuilder) [thunk]
+    VirtualMachineOperandArray * client = static_cast<VirtualMachineOperandArray *>(clientObj);
+    TRACE_CALL(211); // VirtualMachineOperandArray::Reload(IlBuilder) [thunk]
+    TRACE_OBJECT(client);
+    TRACE_OBJECT(b);
+    client->Reload(static_cast<IlBuilder *>(b));
+    TRACE_RETURN();
+}
+
+extern "C" VirtualMachineState * VirtualMachineOperandArrayCallback_MakeCopy(void * clientObj) {
+    PROFILE_TIMED_CALL(212); // VirtualMachineOperandArray::MakeCopy() [thunk]
+    VirtualMachineOperandArray * client = static_cast<VirtualMachineOperandArray *>(clientObj);
+    TRACE_CALL(212); // VirtualMachineOperandArray::MakeCopy() [thunk]
+    TRACE_OBJECT(client);
+    VirtualMachineState * ret = client->MakeCopy();
+    TRACE_RETURN();
+    TRACE_OBJECT(ret);
+    return ret;
+}
+
+extern "C" void VirtualMachineOperandArrayCallback_MergeInto(void * clientObj, void * vmState, void * b) {
+    PROFILE_TIMED_CALL(213); // VirtualMachineOperandArray::MergeInto(VirtualMachineState, IlBuilder) [thunk]
+    VirtualMachineOperandArray * client = static_cast<VirtualMachineOperandArray *>(clientObj);
+    TRACE_CALL(213); // VirtualMachineOperandArray::MergeInto(VirtualMachineState, IlBuilder) [thunk]
+    TRACE_OBJECT(client);
+    TRACE_OBJECT(vmState);
+    TRACE_OBJECT(b);
+    client->MergeInto(static_cast<VirtualMachineState *>(vmState), static_cast<IlBuilder *>(b));
+    TRACE_RETURN();
+}
+
+extern "C" void * getImpl_VirtualMachineOperandArray(void * client) {
+    return static_cast<TR::VirtualMachineOperandArray *>(static_cast<TR::VirtualMachineState *>(static_cast<VirtualMachineOperandArray *>(client)->_impl));
+}
+
+VirtualMachineOperandArray::VirtualMachineOperandArray(MethodBuilder * mb, int32_t numOfElements, IlType * elementType, VirtualMachineRegister * arrayBase): VirtualMachineState((void *)NULL) {
+    PROFILE_TIMED_CALL(208); // VirtualMachineOperandArray::VirtualMachineOperandArray(MethodBuilder, int32, IlType, VirtualMachineRegister)
+    TRACE_CALL(208); // VirtualMachineOperandArray::VirtualMachineOperandArray(MethodBuilder, int32, IlType, VirtualMachineRegister)
+    TRACE_OBJECT(mb);
+    TRACE_VALUE(int32_t, numOfElements);
+    TRACE_OBJECT(elementType);
+    TRACE_OBJECT(arrayBase);
+    auto * impl = ::new TR::VirtualMachineOperandArray(static_cast<TR::MethodBuilder *>(static_cast<TR::IlBuilder *>(mb != NULL ? mb->_impl : NULL)), numOfElements, static_cast<TR::IlType *>(elementType != NULL ? elementType->_impl : NULL), static_cast<TR::VirtualMachineRegister *>(static_cast<TR::VirtualMachineState *>(arrayBase != NULL ? arrayBase->_impl : NULL)));
+    static_cast<TR::VirtualMachineOperandArray *>(static_cast<TR::VirtualMachineState *>(impl))->setClient(this);
+    initializeFromImpl(static_cast<void *>(static_cast<TR::VirtualMachineState *>(impl)));
+    TRACE_RETURN();
+    TRACE_OBJECT(this);
+}
+VirtualMachineOperandArray::VirtualMachineOperandArray(VirtualMachineOperandArray * other): VirtualMachineState((void *)NULL) {
+    PROFILE_TIMED_CALL(209); // VirtualMachineOperandArray::VirtualMachineOperandArray(VirtualMachineOperandArray)
+    TRACE_CALL(209); // VirtualMachineOperandArray::VirtualMachineOperandArray(VirtualMachineOperandArray)
+    TRACE_OBJECT(other);
+    auto * impl = ::new TR::VirtualMachineOperandArray(static_cast<TR::VirtualMachineOperandArray *>(static_cast<TR::VirtualMachineState *>(other != NULL ? other->_impl : NULL)));
+    static_cast<TR::VirtualMachineOperandArray *>(static_cast<TR::VirtualMachineState *>(impl))->setClient(this);
+    initializeFromImpl(static_cast<void *>(static_cast<TR::VirtualMachineState *>(impl)));
+    TRACE_RETURN();
+    TRACE_OBJECT(this);
+}
+
+VirtualMachineOperandArray::VirtualMachineOperandArray(void * impl): VirtualMachineState((void *)NULL) {
+    if (impl != NULL) {
+        static_cast<TR::VirtualMachineOperandArray *>(static_cast<TR::VirtualMachineState *>(impl))->setClient(this);
+        initializeFromImpl(static_cast<void *>(static_cast<TR::VirtualMachineState *>(static_cast<TR::VirtualMachineOperandArray *>(impl))));
+    }
+}
+
+void VirtualMachineOperandArray::initializeFromImpl(void * impl) {
+    VirtualMachineState::initializeFromImpl(impl);
+    static_cast<TR::VirtualMachineOperandArray *>(static_cast<TR::VirtualMachineState *>(_impl))->setClientCallback_Commit(reinterpret_cast<void*>(&VirtualMachineOperandArrayCallback_Commit));
+    static_cast<TR::VirtualMachineOperandArray *>(static_cast<TR::VirtualMachineState *>(_impl))->setClientCallback_Reload(reinterpret_cast<void*>(&VirtualMachineOperandArrayCallback_Reload));
+    static_cast<TR::VirtualMachineOperandArray *>(static_cast<TR::VirtualMachineState *>(_impl))->setClientCallback_MakeCopy(reinterpret_cast<void*>(&VirtualMachineOperandArrayCallback_MakeCopy));
+    static_cast<TR::VirtualMachineOperandArray *>(static_cast<TR::VirtualMachineState *>(_impl))->setClientCallback_MergeInto(reinterpret_cast<void*>(&VirtualMachineOperandArrayCallback_MergeInto));
+}
+
+VirtualMachineOperandArray::~VirtualMachineOperandArray() {}
+
+void VirtualMachineOperandArray::Commit(IlBuilder * b) {
+    PROFILE_TIMED_CALL(214); // VirtualMachineOperandArray::Commit(IlBuilder)
+    TRACE_CALL(214); // VirtualMachineOperandArray::Commit(IlBuilder)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(b);
+    static_cast<TR::VirtualMachineOperandArray *>(static_cast<TR::VirtualMachineState *>(_impl))->Commit(static_cast<TR::IlBuilder *>(b != NULL ? b->_impl : NULL));
+    TRACE_RETURN();
+}
+
+void VirtualMachineOperandArray::Reload(IlBuilder * b) {
+    PROFILE_TIMED_CALL(215); // VirtualMachineOperandArray::Reload(IlBuilder)
+    TRACE_CALL(215); // VirtualMachineOperandArray::Reload(IlBuilder)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(b);
+    static_cast<TR::VirtualMachineOperandArray *>(static_cast<TR::VirtualMachineState *>(_impl))->Reload(static_cast<TR::IlBuilder *>(b != NULL ? b->_impl : NULL));
+    TRACE_RETURN();
+}
+
+VirtualMachineState * VirtualMachineOperandArray::MakeCopy() {
+    PROFILE_TIMED_CALL(216); // VirtualMachineOperandArray::MakeCopy()
+    TRACE_CALL(216); // VirtualMachineOperandArray::MakeCopy()
+    TRACE_OBJECT(this);
+    TR::VirtualMachineState * implRet = static_cast<TR::VirtualMachineOperandArray *>(static_cast<TR::VirtualMachineState *>(_impl))->MakeCopy();
+    GET_CLIENT_OBJECT(clientObj, VirtualMachineState, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+void VirtualMachineOperandArray::MergeInto(VirtualMachineState * vmState, IlBuilder * b) {
+    PROFILE_TIMED_CALL(217); // VirtualMachineOperandArray::MergeInto(VirtualMachineState, IlBuilder)
+    TRACE_CALL(217); // VirtualMachineOperandArray::MergeInto(VirtualMachineState, IlBuilder)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(vmState);
+    TRACE_OBJECT(b);
+    static_cast<TR::VirtualMachineOperandArray *>(static_cast<TR::VirtualMachineState *>(_impl))->MergeInto(static_cast<TR::VirtualMachineState *>(vmState != NULL ? vmState->_impl : NULL), static_cast<TR::IlBuilder *>(b != NULL ? b->_impl : NULL));
+    TRACE_RETURN();
+}
+
+extern "C" void * allocateVirtualMachineOperandArray(void * impl) {
+    return new VirtualMachineOperandArray(impl);
+}
+
+} // JitBuilder
+} // OMR
@@ -0,0 +1,200 @@
+/*******************************************************************************
+ * Copyright (c) 2026, 2026 IBM Corp. and others
+ *
+ * This program and the accompanying materials are made available under
+ * the terms of the Eclipse Public License 2.0 which accompanies this
+ * distribution and is available at http://eclipse.org/legal/epl-2.0
+ * or the Apache License, Version 2.0 which accompanies this distribution
+ * and is available at https://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * This Source Code may also be made available under the following Secondary
+ * Licenses when the conditions for such availability set forth in the
+ * Eclipse Public License, v. 2.0 are satisfied: GNU General Public License,
+ * version 2 with the GNU Classpath Exception [1] and GNU General Public
+ * License, version 2 with the OpenJDK Assembly Exception [2].
+ *
+ * [1] https://www.gnu.org/software/classpath/license.html
+ * [2] http://openjdk.java.net/legal/assembly-exception.html
+ *
+ * SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+ *******************************************************************************/
+        
+#include "ilgen/IlBuilder.hpp"
+#include "ilgen/MethodBuilder.hpp"
+#include "ilgen/IlType.hpp"
+#include "ilgen/IlValue.hpp"
+#include "ilgen/VirtualMachineOperandStack.hpp"
+#include "ilgen/VirtualMachineRegister.hpp"
+#include "ilgen/VirtualMachineState.hpp"
+#include "<output>/include/Macros.hpp"
+#include "<output>/include/Profiling.hpp"
+#include "<output>/include/Tracing.hpp"
+#include "<output>/include/IlBuilder.hpp"
+#include "<output>/include/MethodBuilder.hpp"
+#include "<output>/include/IlType.hpp"
+#include "<output>/include/IlValue.hpp"
+#include "<output>/include/VirtualMachineOperandStack.hpp"
+#include "<output>/include/VirtualMachineRegister.hpp"
+#include "<output>/include/VirtualMachineState.hpp"
+#include "<output>/include/IlBuilder-inl.hpp"
+#include "<output>/include/MethodBuilder-inl.hpp"
+#include "<output>/include/IlType-inl.hpp"
+#include "<output>/include/IlValue-inl.hpp"
+#include "<output>/include/VirtualMachineOperandStack-inl.hpp"
+#include "<output>/include/VirtualMachineRegister-inl.hpp"
+#include "<output>/include/VirtualMachineState-inl.hpp"
+
+namespace OMR {
+namespace JitBuilder {
+
+extern "C" void VirtualMachineOperandStackCallback_Commit(void * clientObj, void * b) {
+    PROFILE_TIMED_CALL(225); // VirtualMachineOperandStack::Commit(IlBuilder) [thunk]
+    VirtualMachineOperandStack * client = static_cast<VirtualMachineOperandStack *>(clientObj);
+    TRACE_CALL(225); // VirtualMachineOperandStack::Commit(IlBuilder) [thunk]
+    TRACE_OBJECT(client);
+    TRACE_OBJECT(b);
+    client->Commit(static_cast<IlBuilder *>(b));
+    TRACE_RETURN();
+}
+
+extern "C" void VirtualMachineOperandStackCallback_Reload(void * clientObj, void * b) {
+    PROFILE_TIMED_CALL(226); // VirtualMachineOperandStack::Reload(IlBuilder) [thunk]
+    VirtualMachineOperandStack * client = static_cast<VirtualMachineOperandStack *>(clientObj);
+    TRACE_CALL(226); // VirtualMachineOperandStack::Reload(IlBuilder) [thunk]
+    TRACE_OBJECT(client);
+    TRACE_OBJECT(b);
+    client->Reload(static_cast<IlBuilder *>(b));
+    TRACE_RETURN();
+}
+
+extern "C" VirtualMachineState * VirtualMachineOperandStackCallback_MakeCopy(void * clientObj) {
+    PROFILE_TIMED_CALL(227); // VirtualMachineOperandStack::MakeCopy() [thunk]
+    VirtualMachineOperandStack * client = static_cast<VirtualMachineOperandStack *>(clientObj);
+    TRACE_CALL(227); // VirtualMachineOperandStack::MakeCopy() [thunk]
+    TRACE_OBJECT(client);
+    VirtualMachineState * ret = client->MakeCopy();
+    TRACE_RETURN();
+    TRACE_OBJECT(ret);
+    return ret;
+}
+
+extern "C" void VirtualMachineOperandStackCallback_MergeInto(void * clientObj, void * vmState, void * b) {
+    PROFILE_TIMED_CALL(228); // VirtualMachineOperandStack::MergeInto(VirtualMachineState, IlBuilder) [thunk]
+    VirtualMachineOperandStack * client = static_cast<VirtualMachineOperandStack *>(clientObj);
+    TRACE_CALL(228); // VirtualMachineOperandStack::MergeInto(VirtualMachineState, IlBuilder) [thunk]
+    TRACE_OBJECT(client);
+    TRACE_OBJECT(vmState);
+    TRACE_OBJECT(b);
+    client->MergeInto(static_cast<VirtualMachineState *>(vmState), static_cast<IlBuilder *>(b));
+    TRACE_RETURN();
+}
+
+extern "C" void * getImpl_VirtualMachineOperandStack(void * client) {
+    return static_cast<TR::VirtualMachineOperandStack *>(static_cast<TR::VirtualMachineState *>(static_cast<VirtualMachineOperandStack *>(client)->_impl));
+}
+
+VirtualMachineOperandStack::VirtualMachineOperandStack(MethodBuilder * mb, int32_t sizeHint, IlType * elementType, VirtualMachineRegister * stackTopRegister): VirtualMachineState((void *)NULL) {
+    PROFILE_TIMED_CALL(222); // VirtualMachineOperandStack::VirtualMachineOperandStack(MethodBuilder, int32, IlType, VirtualMachineRegister)
+    TRACE_CALL(222); // VirtualMachineOperandStack::VirtualMachineOperandStack(MethodBuilder, int32, IlType, VirtualMachineRegister)
+    TRACE_OBJECT(mb);
+    TRACE_VALUE(int32_t, sizeHint);
+    TRACE_OBJECT(elementType);
+    TRACE_OBJECT(stackTopRegister);
+    auto * impl = ::new TR::VirtualMachineOperandStack(static_cast<TR::MethodBuilder *>(static_cast<TR::IlBuilder *>(mb != NULL ? mb->_impl : NULL)), sizeHint, static_cast<TR::IlType *>(elementType != NULL ? elementType->_impl : NULL), static_cast<TR::VirtualMachineRegister *>(static_cast<TR::VirtualMachineState *>(stackTopRegister != NULL ? stackTopRegister->_impl : NULL)));
+    static_cast<TR::VirtualMachineOperandStack *>(static_cast<TR::VirtualMachineState *>(impl))->setClient(this);
+    initializeFromImpl(static_cast<void *>(static_cast<TR::VirtualMachineState *>(impl)));
+    TRACE_RETURN();
+    TRACE_OBJECT(this);
+}
+VirtualMachineOperandStack::VirtualMachineOperandStack(MethodBuilder * mb, int32_t sizeHint, IlType * elementType, VirtualMachineRegister * stackTopRegister, bool growsUp): VirtualMachineState((void *)NULL) {
+    PROFILE_TIMED_CALL(223); // VirtualMachineOperandStack::VirtualMachineOperandStack(MethodBuilder, int32, IlType, VirtualMachineRegister, boolean)
+    TRACE_CALL(223); // VirtualMachineOperandStack::VirtualMachineOperandStack(MethodBuilder, int32, IlType, VirtualMachineRegister, boolean)
+    TRACE_OBJECT(mb);
+    TRACE_VALUE(int32_t, sizeHint);
+    TRACE_OBJECT(elementType);
+    TRACE_OBJECT(stackTopRegister);
+    TRACE_VALUE(uint8_t, growsUp);
+    auto * impl = ::new TR::VirtualMachineOperandStack(static_cast<TR::MethodBuilder *>(static_cast<TR::IlBuilder *>(mb != NULL ? mb->_impl : NULL)), sizeHint, static_cast<TR::IlType *>(elementType != NULL ? elementType->_impl : NULL), static_cast<TR::VirtualMachineRegister *>(static_cast<TR::VirtualMachineState *>(stackTopRegister != NULL ? stackTopRegister->_impl : NULL)), growsUp);
+    static_cast<TR::VirtualMachineOperandStack *>(static_cast<TR::VirtualMachineState *>(impl))->setClient(this);
+    initializeFromImpl(static_cast<void *>(static_cast<TR::VirtualMachineState *>(impl)));
+    TRACE_RETURN();
+    TRACE_OBJECT(this);
+}
+VirtualMachineOperandStack::VirtualMachineOperandStack(MethodBuilder * mb, int32_t sizeHint, IlType * elementType, VirtualMachineRegister * stackTopRegister, bool growsUp, int32_t stackInitialOffset): VirtualMachineState((void *)NULL) {
+    PROFILE_TIMED_CALL(224); // VirtualMachineOperandStack::VirtualMachineOperandStack(MethodBuilder, int32, IlType, VirtualMachineRegister, boolean, int32)
+    TRACE_CALL(224); // VirtualMachineOperandStack::VirtualMachineOperandStack(MethodBuilder, int32, IlType, VirtualMachineRegister, boolean, int32)
+    TRACE_OBJECT(mb);
+    TRACE_VALUE(int32_t, sizeHint);
+    TRACE_OBJECT(elementType);
+    TRACE_OBJECT(stackTopRegister);
+    TRACE_VALUE(uint8_t, growsUp);
+    TRACE_VALUE(int32_t, stackInitialOffset);
+    auto * impl = ::new TR::VirtualMachineOperandStack(static_cast<TR::MethodBuilder *>(static_cast<TR::IlBuilder *>(mb != NULL ? mb->_impl : NULL)), sizeHint, static_cast<TR::IlType *>(elementType != NULL ? elementType->_impl : NULL), static_cast<TR::VirtualMachineRegister *>(static_cast<TR::VirtualMachineState *>(stackTopRegister != NULL ? stackTopRegister->_impl : NULL)), growsUp, stackInitialOffset);
+    static_cast<TR::VirtualMachineOperandStack *>(static_cast<TR::VirtualMachineState *>(impl))->setClient(this);
+    initializeFromImpl(static_cast<void *>(static_cast<TR::VirtualMachineState *>(impl)));
+    TRACE_RETURN();
+    TRACE_OBJECT(this);
+}
+
+VirtualMachineOperandStack::VirtualMachineOperandStack(void * impl): VirtualMachineState((void *)NULL) {
+    if (impl != NULL) {
+        static_cast<TR::VirtualMachineOperandStack *>(static_cast<TR::VirtualMachineState *>(impl))->setClient(this);
+        initializeFromImpl(static_cast<void *>(static_cast<TR::VirtualMachineState *>(static_cast<TR::VirtualMachineOperandStack *>(impl))));
+    }
+}
+
+void VirtualMachineOperandStack::initializeFromImpl(void * impl) {
+    VirtualMachineState::initializeFromImpl(impl);
+    static_cast<TR::VirtualMachineOperandStack *>(static_cast<TR::VirtualMachineState *>(_impl))->setClientCallback_Commit(reinterpret_cast<void*>(&VirtualMachineOperandStackCallback_Commit));
+    static_cast<TR::VirtualMachineOperandStack *>(static_cast<TR::VirtualMachineState *>(_impl))->setClientCallback_Reload(reinterpret_cast<void*>(&VirtualMachineOperandStackCallback_Reload));
+    static_cast<TR::VirtualMachineOperandStack *>(static_cast<TR::VirtualMachineState *>(_impl))->setClientCallback_MakeCopy(reinterpret_cast<void*>(&VirtualMachineOperandStackCallback_MakeCopy));
+    static_cast<TR::VirtualMachineOperandStack *>(static_cast<TR::VirtualMachineState *>(_impl))->setClientCallback_MergeInto(reinterpret_cast<void*>(&VirtualMachineOperandStackCallback_MergeInto));
+}
+
+VirtualMachineOperandStack::~VirtualMachineOperandStack() {}
+
+void VirtualMachineOperandStack::Commit(IlBuilder * b) {
+    PROFILE_TIMED_CALL(229); // VirtualMachineOperandStack::Commit(IlBuilder)
+    TRACE_CALL(229); // VirtualMachineOperandStack::Commit(IlBuilder)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(b);
+    static_cast<TR::VirtualMachineOperandStack *>(static_cast<TR::VirtualMachineState *>(_impl))->Commit(static_cast<TR::IlBuilder *>(b != NULL ? b->_impl : NULL));
+    TRACE_RETURN();
+}
+
+void VirtualMachineOperandStack::Reload(IlBuilder * b) {
+    PROFILE_TIMED_CALL(230); // VirtualMachineOperandStack::Reload(IlBuilder)
+    TRACE_CALL(230); // VirtualMachineOperandStack::Reload(IlBuilder)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(b);
+    static_cast<TR::VirtualMachineOperandStack *>(static_cast<TR::VirtualMachineState *>(_impl))->Reload(static_cast<TR::IlBuilder *>(b != NULL ? b->_impl : NULL));
+    TRACE_RETURN();
+}
+
+VirtualMachineState * VirtualMachineOperandStack::MakeCopy() {
+    PROFILE_TIMED_CALL(231); // VirtualMachineOperandStack::MakeCopy()
+    TRACE_CALL(231); // VirtualMachineOperandStack::MakeCopy()
+    TRACE_OBJECT(this);
+    TR::VirtualMachineState * implRet = static_cast<TR::VirtualMachineOperandStack *>(static_cast<TR::VirtualMachineState *>(_impl))->MakeCopy();
+    GET_CLIENT_OBJECT(clientObj, VirtualMachineState, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+void VirtualMachineOperandStack::MergeInto(VirtualMachineState * vmState, IlBuilder * b) {
+    PROFILE_TIMED_CALL(232); // VirtualMachineOperandStack::MergeInto(VirtualMachineState, IlBuilder)
+    TRACE_CALL(232); // VirtualMachineOperandStack::MergeInto(VirtualMachineState, IlBuilder)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(vmState);
+    TRACE_OBJECT(b);
+    static_cast<TR::VirtualMachineOperandStack *>(static_cast<TR::VirtualMachineState *>(_impl))->MergeInto(static_cast<TR::VirtualMachineState *>(vmState != NULL ? vmState->_impl : NULL), static_cast<TR::IlBuilder *>(b != NULL ? b->_impl : NULL));
+    TRACE_RETURN();
+}
+
+extern "C" void * allocateVirtualMachineOperandStack(void * impl) {
+    return new VirtualMachineOperandStack(impl);
+}
+
+} // JitBuilder
+} // OMR
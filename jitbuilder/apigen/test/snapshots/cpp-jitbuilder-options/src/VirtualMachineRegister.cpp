@@ -0,0 +1,144 @@
+/*******************************************************************************
+ * Copyright (c) 2026, 2026 IBM Corp. and others
+ *
+ * This program and the accompanying materials are made available under
+ * the terms of the Eclipse Public License 2.0 which accompanies this
+ * distribution and is available at http://eclipse.org/legal/epl-2.0
+ * or the Apache License, Version 2.0 which accompanies this distribution
+ * and is available at https://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * This Source Code may also be made available under the following Secondary
+ * Licenses when the conditions for such availability set forth in the
+ * Eclipse Public License, v. 2.0 are satisfied: GNU General Public License,
+ * version 2 with the GNU Classpath Exception [1] and GNU General Public
+ * License, version 2 with the OpenJDK Assembly Exception [2].
+ *
+ * [1] https://www.gnu.org/software/classpath/license.html
+ * [2] http://openjdk.java.net/legal/assembly-exception.html
+ *
+ * SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+ *******************************************************************************/
+        
+#include "ilgen/IlBuilder.hpp"
+#include "ilgen/IlType.hpp"
+#include "ilgen/IlValue.hpp"
+#include "ilgen/VirtualMachineRegister.hpp"
+#include "ilgen/VirtualMachineState.hpp"
+#include "<output>/include/Macros.hpp"
+#include "<output>/include/Profiling.hpp"
+#include "<output>/include/Tracing.hpp"
+#include "<output>/include/IlBuilder.hpp"
+#include "<output>/include/IlType.hpp"
+#include "<output>/include/IlValue.hpp"
+#include "<output>/include/VirtualMachineRegister.hpp"
+#include "<output>/include/VirtualMachineState.hpp"
+#include "<output>/include/IlBuilder-inl.hpp"
+#include "<output>/include/IlType-inl.hpp"
+#include "<output>/include/IlValue-inl.hpp"
+#include "<output>/include/VirtualMachineRegister-inl.hpp"
+#include "<output>/include/VirtualMachineState-inl.hpp"
+
+namespace OMR {
+namespace JitBuilder {
+
+extern "C" void VirtualMachineRegisterCallback_Commit(void * clientObj, void * b) {
+    PROFILE_TIMED_CALL(241); // VirtualMachineRegister::Commit(IlBuilder) [thunk]
+    VirtualMachineRegister * client = static_cast<VirtualMachineRegister *>(clientObj);
+    TRACE_CALL(241); // VirtualMachineRegister::Commit(IlBuilder) [thunk]
+    TRACE_OBJECT(client);
+    TRACE_OBJECT(b);
+    client->Commit(static_cast<IlBuilder *>(b));
+    TRACE_RETURN();
+}
+
+extern "C" void VirtualMachineRegisterCallback_Reload(void * clientObj, void * b) {
+    PROFILE_TIMED_CALL(242); // VirtualMachineRegister::Reload(IlBuilder) [thunk]
+    VirtualMachineRegister * client = static_cast<VirtualMachineRegister *>(clientObj);
+    TRACE_CALL(242); // VirtualMachineRegister::Reload(IlBuilder) [thunk]
+    TRACE_OBJECT(client);
+    TRACE_OBJECT(b);
+    client->Reload(static_cast<IlBuilder *>(b));
+    TRACE_RETURN();
+}
+
+extern "C" VirtualMachineState * VirtualMachineRegisterCallback_MakeCopy(void * clientObj) {
+    PROFILE_TIMED_CALL(243); // VirtualMachineRegister::MakeCopy() [thunk]
+    VirtualMachineRegister * client = static_cast<VirtualMachineRegister *>(clientObj);
+    TRACE_CALL(243); // VirtualMachineRegister::MakeCopy() [thunk]
+    TRACE_OBJECT(client);
+    VirtualMachineState * ret = client->MakeCopy();
+    TRACE_RETURN();
+    TRACE_OBJECT(ret);
+    return ret;
+}
+
+extern "C" void * getImpl_VirtualMachineRegister(void * client) {
+    return static_cast<TR::VirtualMachineRegister *>(static_cast<TR::VirtualMachineState *>(static_cast<VirtualMachineRegister *>(client)->_impl));
+}
+
+VirtualMachineRegister::VirtualMachineRegister(IlBuilder * b, const char * localName, IlType * pointerToRegisterType, uint32_t adjustByStep, IlValue * addressOfRegister): VirtualMachineState((void *)NULL) {
+    PROFILE_TIMED_CALL(240); // VirtualMachineRegister::VirtualMachineRegister(IlBuilder, constString, IlType, uint32, IlValue)
+    TRACE_CALL(240); // VirtualMachineRegister::VirtualMachineRegister(IlBuilder, constString, IlType, uint32, IlValue)
+    TRACE_OBJECT(b);
+    TRACE_STRING(localName);
+    TRACE_OBJECT(pointerToRegisterType);
+    TRACE_VALUE(uint32_t, adjustByStep);
+    TRACE_OBJECT(addressOfRegister);
+    auto * impl = ::new TR::VirtualMachineRegister(static_cast<TR::IlBuilder *>(b != NULL ? b->_impl : NULL), localName, static_cast<TR::IlType *>(pointerToRegisterType != NULL ? pointerToRegisterType->_impl : NULL), adjustByStep, static_cast<TR::IlValue *>(addressOfRegister != NULL ? addressOfRegister->_impl : NULL));
+    static_cast<TR::VirtualMachineRegister *>(static_cast<TR::VirtualMachineState *>(impl))->setClient(this);
+    initializeFromImpl(static_cast<void *>(static_cast<TR::VirtualMachineState *>(impl)));
+    TRACE_RETURN();
+    TRACE_OBJECT(this);
+}
+
+VirtualMachineRegister::VirtualMachineRegister(void * impl): VirtualMachineState((void *)NULL) {
+    if (impl != NULL) {
+        static_cast<TR::VirtualMachineRegister *>(static_cast<TR::VirtualMachineState *>(impl))->setClient(this);
+        initializeFromImpl(static_cast<void *>(static_cast<TR::VirtualMachineState *>(static_cast<TR::VirtualMachineRegister *>(impl))));
+    }
+}
+
+void VirtualMachineRegister::initializeFromImpl(void * impl) {
+    VirtualMachineState::initializeFromImpl(impl);
+    static_cast<TR::VirtualMachineRegister *>(static_cast<TR::VirtualMachineState *>(_impl))->setClientCallback_Commit(reinterpret_cast<void*>(&VirtualMachineRegisterCallback_Commit));
+    static_cast<TR::VirtualMachineRegister *>(static_cast<TR::VirtualMachineState *>(_impl))->setClientCallback_Reload(reinterpret_cast<void*>(&VirtualMachineRegisterCallback_Reload));
+    static_cast<TR::VirtualMachineRegister *>(static_cast<TR::VirtualMachineState *>(_impl))->setClientCallback_MakeCopy(reinterpret_cast<void*>(&VirtualMachineRegisterCallback_MakeCopy));
+}
+
+VirtualMachineRegister::~VirtualMachineRegister() {}
+
+void VirtualMachineRegister::Commit(IlBuilder * b) {
+    PROFILE_TIMED_CALL(244); // VirtualMachineRegister::Commit(IlBuilder)
+    TRACE_CALL(244); // VirtualMachineRegister::Commit(IlBuilder)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(b);
+    static_cast<TR::VirtualMachineRegister *>(static_cast<TR::VirtualMachineState *>(_impl))->Commit(static_cast<TR::IlBuilder *>(b != NULL ? b->_impl : NULL));
+    TRACE_RETURN();
+}
+
+void VirtualMachineRegister::Reload(IlBuilder * b) {
+    PROFILE_TIMED_CALL(245); // VirtualMachineRegister::Reload(IlBuilder)
+    TRACE_CALL(245); // VirtualMachineRegister::Reload(IlBuilder)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(b);
+    static_cast<TR::VirtualMachineRegister *>(static_cast<TR::VirtualMachineState *>(_impl))->Reload(static_cast<TR::IlBuilder *>(b != NULL ? b->_impl : NULL));
+    TRACE_RETURN();
+}
+
+VirtualMachineState * VirtualMachineRegister::MakeCopy() {
+    PROFILE_TIMED_CALL(246); // VirtualMachineRegister::MakeCopy()
+    TRACE_CALL(246); // VirtualMachineRegister::MakeCopy()
+    TRACE_OBJECT(this);
+    TR::VirtualMachineState * implRet = static_cast<TR::VirtualMachineRegister *>(static_cast<TR::VirtualMachineState *>(_impl))->MakeCopy();
+    GET_CLIENT_OBJECT(clientObj, VirtualMachineState, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+extern "C" void * allocateVirtualMachineRegister(void * impl) {
+    return new VirtualMachineRegister(impl);
+}
+
+} // JitBuilder
+} // OMR
@@ -0,0 +1,141 @@
+/*******************************************************************************
+ * Copyright (c) 2026, 2026 IBM Corp. and others
+ *
+ * This program and the accompanying materials are made available under
+ * the terms of the Eclipse Public License 2.0 which accompanies this
+ * distribution and is available at http://eclipse.org/legal/epl-2.0
+ * or the Apache License, Version 2.0 which accompanies this distribution
+ * and is available at https://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * This Source Code may also be made available under the following Secondary
+ * Licenses when the conditions for such availability set forth in the
+ * Eclipse Public License, v. 2.0 are satisfied: GNU General Public License,
+ * version 2 with the GNU Classpath Exception [1] and GNU General Public
+ * License, version 2 with the OpenJDK Assembly Exception [2].
+ *
+ * [1] https://www.gnu.org/software/classpath/license.html
+ * [2] http://openjdk.java.net/legal/assembly-exception.html
+ *
+ * SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+ *******************************************************************************/
+        
+#include "ilgen/IlBuilder.hpp"
+#include "ilgen/VirtualMachineRegister.hpp"
+#include "ilgen/VirtualMachineRegisterInStruct.hpp"
+#include "ilgen/VirtualMachineState.hpp"
+#include "<output>/include/Macros.hpp"
+#include "<output>/include/Profiling.hpp"
+#include "<output>/include/Tracing.hpp"
+#include "<output>/include/IlBuilder.hpp"
+#include "<output>/include/VirtualMachineRegister.hpp"
+#include "<output>/include/VirtualMachineRegisterInStruct.hpp"
+#include "<output>/include/VirtualMachineState.hpp"
+#include "<output>/include/IlBuilder-inl.hpp"
+#include "<output>/include/VirtualMachineRegister-inl.hpp"
+#include "<output>/include/VirtualMachineRegisterInStruct-inl.hpp"
+#include "<output>/include/VirtualMachineState-inl.hpp"
+
+namespace OMR {
+namespace JitBuilder {
+
+extern "C" void VirtualMachineRegisterInStructCallback_Commit(void * clientObj, void * b) {
+    PROFILE_TIMED_CALL(252); // VirtualMachineRegisterInStruct::Commit(IlBuilder) [thunk]
+    VirtualMachineRegisterInStruct * client = static_cast<VirtualMachineRegisterInStruct *>(clientObj);
+    TRACE_CALL(252); // VirtualMachineRegisterInStruct::Commit(IlBuilder) [thunk]
+    TRACE_OBJECT(client);
+    TRACE_OBJECT(b);
+    client->Commit(static_cast<IlBuilder *>(b));
+    TRACE_RETURN();
+}
+
+extern "C" void VirtualMachineRegisterInStructCallback_Reload(void * clientObj, void * b) {
+    PROFILE_TIMED_CALL(253); // VirtualMachineRegisterInStruct::Reload(IlBuilder) [thunk]
+    VirtualMachineRegisterInStruct * client = static_cast<VirtualMachineRegisterInStruct *>(clientObj);
+    TRACE_CALL(253); // VirtualMachineRegisterInStruct::Reload(IlBuilder) [thunk]
+    TRACE_OBJECT(client);
+    TRACE_OBJECT(b);
+    client->Reload(static_cast<IlBuilder *>(b));
+    TRACE_RETURN();
+}
+
+extern "C" VirtualMachineState * VirtualMachineRegisterInStructCallback_MakeCopy(void * clientObj) {
+    PROFILE_TIMED_CALL(254); // VirtualMachineRegisterInStruct::MakeCopy() [thunk]
+    VirtualMachineRegisterInStruct * client = static_cast<VirtualMachineRegisterInStruct *>(clientObj);
+    TRACE_CALL(254); // VirtualMachineRegisterInStruct::MakeCopy() [thunk]
+    TRACE_OBJECT(client);
+    VirtualMachineState * ret = client->MakeCopy();
+    TRACE_RETURN();
+    TRACE_OBJECT(ret);
+    return ret;
+}
+
+extern "C" void * getImpl_VirtualMachineRegisterInStruct(void * client) {
+    return static_cast<TR::VirtualMachineRegisterInStruct *>(static_cast<TR::VirtualMachineState *>(static_cast<VirtualMachineRegisterInStruct *>(client)->_impl));
+}
+
+VirtualMachineRegisterInStruct::VirtualMachineRegisterInStruct(IlBuilder * b, const char * structName, const char * localNameHoldingStructAddress, const char * fieldName, const char * localName): VirtualMachineRegister((void *)NULL) {
+    PROFILE_TIMED_CALL(251); // VirtualMachineRegisterInStruct::VirtualMachineRegisterInStruct(IlBuilder, constString, constString, constString, constString)
+    TRACE_CALL(251); // VirtualMachineRegisterInStruct::VirtualMachineRegisterInStruct(IlBuilder, constString, constString, constString, constString)
+    TRACE_OBJECT(b);
+    TRACE_STRING(structName);
+    TRACE_STRING(localNameHoldingStructAddress);
+    TRACE_STRING(fieldName);
+    TRACE_STRING(localName);
+    auto * impl = ::new TR::VirtualMachineRegisterInStruct(static_cast<TR::IlBuilder *>(b != NULL ? b->_impl : NULL), structName, localNameHoldingStructAddress, fieldName, localName);
+    static_cast<TR::VirtualMachineRegisterInStruct *>(static_cast<TR::VirtualMachineState *>(impl))->setClient(this);
+    initializeFromImpl(static_cast<void *>(static_cast<TR::VirtualMachineState *>(impl)));
+    TRACE_RETURN();
+    TRACE_OBJECT(this);
+}
+
+VirtualMachineRegisterInStruct::VirtualMachineRegisterInStruct(void * impl): VirtualMachineRegister((void *)NULL) {
+    if (impl != NULL) {
+        static_cast<TR::VirtualMachineRegisterInStruct *>(static_cast<TR::VirtualMachineState *>(impl))->setClient(this);
+        initializeFromImpl(static_cast<void *>(static_cast<TR::VirtualMachineState *>(static_cast<TR::VirtualMachineRegisterInStruct *>(impl))));
+    }
+}
+
+void VirtualMachineRegisterInStruct::initializeFromImpl(void * impl) {
+    VirtualMachineRegister::initializeFromImpl(impl);
+    static_cast<TR::VirtualMachineRegisterInStruct *>(static_cast<TR::VirtualMachineState *>(_impl))->setClientCallback_Commit(reinterpret_cast<void*>(&VirtualMachineRegisterInStructCallback_Commit));
+    static_cast<TR::VirtualMachineRegisterInStruct *>(static_cast<TR::VirtualMachineState *>(_impl))->setClientCallback_Reload(reinterpret_cast<void*>(&VirtualMachineRegisterInStructCallback_Reload));
+    static_cast<TR::VirtualMachineRegisterInStruct *>(static_cast<TR::VirtualMachineState *>(_impl))->setClientCallback_MakeCopy(reinterpret_cast<void*>(&VirtualMachineRegisterInStructCallback_MakeCopy));
+}
+
+VirtualMachineRegisterInStruct::~VirtualMachineRegisterInStruct() {}
+
+void VirtualMachineRegisterInStruct::Commit(IlBuilder * b) {
+    PROFILE_TIMED_CALL(255); // VirtualMachineRegisterInStruct::Commit(IlBuilder)
+    TRACE_CALL(255); // VirtualMachineRegisterInStruct::Commit(IlBuilder)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(b);
+    static_cast<TR::VirtualMachineRegisterInStruct *>(static_cast<TR::VirtualMachineState *>(_impl))->Commit(static_cast<TR::IlBuilder *>(b != NULL ? b->_impl : NULL));
+    TRACE_RETURN();
+}
+
+void VirtualMachineRegisterInStruct::Reload(IlBuilder * b) {
+    PROFILE_TIMED_CALL(256); // VirtualMachineRegisterInStruct::Reload(IlBuilder)
+    TRACE_CALL(256); // VirtualMachineRegisterInStruct::Reload(IlBuilder)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(b);
+    static_cast<TR::VirtualMachineRegisterInStruct *>(static_cast<TR::VirtualMachineState *>(_impl))->Reload(static_cast<TR::IlBuilder *>(b != NULL ? b->_impl : NULL));
+    TRACE_RETURN();
+}
+
+VirtualMachineState * VirtualMachineRegisterInStruct::MakeCopy() {
+    PROFILE_TIMED_CALL(257); // VirtualMachineRegisterInStruct::MakeCopy()
+    TRACE_CALL(257); // VirtualMachineRegisterInStruct::MakeCopy()
+    TRACE_OBJECT(this);
+    TR::VirtualMachineState * implRet = static_cast<TR::VirtualMachineRegisterInStruct *>(static_cast<TR::VirtualMachineState *>(_impl))->MakeCopy();
+    GET_CLIENT_OBJECT(clientObj, VirtualMachineState, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+extern "C" void * allocateVirtualMachineRegisterInStruct(void * impl) {
+    return new VirtualMachineRegisterInStruct(impl);
+}
+
+} // JitBuilder
+} // OMR
@@ -0,0 +1,152 @@
+/*******************************************************************************
+ * Copyright (c) 2026, 2026 IBM Corp. and others
+ *
+ * This program and the accompanying materials are made available under
+ * the terms of the Eclipse Public License 2.0 which accompanies this
+ * distribution and is available at http://eclipse.org/legal/epl-2.0
+ * or the Apache License, Version 2.0 which accompanies this distribution
+ * and is available at https://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * This Source Code may also be made available under the following Secondary
+ * Licenses when the conditions for such availability set forth in the
+ * Eclipse Public License, v. 2.0 are satisfied: GNU General Public License,
+ * version 2 with the GNU Classpath Exception [1] and GNU General Public
+ * License, version 2 with the OpenJDK Assembly Exception [2].
+ *
+ * [1] https://www.gnu.org/software/classpath/license.html
+ * [2] http://openjdk.java.net/legal/assembly-exception.html
+ *
+ * SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+ *******************************************************************************/
+        
+#include "ilgen/IlBuilder.hpp"
+#include "ilgen/VirtualMachineState.hpp"
+#include "<output>/include/Macros.hpp"
+#include "<output>/include/Profiling.hpp"
+#include "<output>/include/Tracing.hpp"
+#include "<output>/include/IlBuilder.hpp"
+#include "<output>/include/VirtualMachineState.hpp"
+#include "<output>/include/IlBuilder-inl.hpp"
+#include "<output>/include/VirtualMachineState-inl.hpp"
+
+namespace OMR {
+namespace JitBuilder {
+
+extern "C" void VirtualMachineStateCallback_Commit(void * clientObj, void * b) {
+    PROFILE_TIMED_CALL(259); // VirtualMachineState::Commit(IlBuilder) [thunk]
+    VirtualMachineState * client = static_cast<VirtualMachineState *>(clientObj);
+    TRACE_CALL(259); // VirtualMachineState::Commit(IlBuilder) [thunk]
+    TRACE_OBJECT(client);
+    TRACE_OBJECT(b);
+    client->Commit(static_cast<IlBuilder *>(b));
+    TRACE_RETURN();
+}
+
+extern "C" void VirtualMachineStateCallback_Reload(void * clientObj, void * b) {
+    PROFILE_TIMED_CALL(260); // VirtualMachineState::Reload(IlBuilder) [thunk]
+    VirtualMachineState * client = static_cast<VirtualMachineState *>(clientObj);
+    TRACE_CALL(260); // VirtualMachineState::Reload(IlBuilder) [thunk]
+    TRACE_OBJECT(client);
+    TRACE_OBJECT(b);
+    client->Reload(static_cast<IlBuilder *>(b));
+    TRACE_RETURN();
+}
+
+extern "C" VirtualMachineState * VirtualMachineStateCallback_MakeCopy(void * clientObj) {
+    PROFILE_TIMED_CALL(261); // VirtualMachineState::MakeCopy() [thunk]
+    VirtualMachineState * client = static_cast<VirtualMachineState *>(clientObj);
+    TRACE_CALL(261); // VirtualMachineState::MakeCopy() [thunk]
+    TRACE_OBJECT(client);
+    VirtualMachineState * ret = client->MakeCopy();
+    TRACE_RETURN();
+    TRACE_OBJECT(ret);
+    return ret;
+}
+
+extern "C" void VirtualMachineStateCallback_MergeInto(void * clientObj, void * vmState, void * b) {
+    PROFILE_TIMED_CALL(262); // VirtualMachineState::MergeInto(VirtualMachineState, IlBuilder) [thunk]
+    VirtualMachineState * client = static_cast<VirtualMachineState *>(clientObj);
+    TRACE_CALL(262); // VirtualMachineState::MergeInto(VirtualMachineState, IlBuilder) [thunk]
+    TRACE_OBJECT(client);
+    TRACE_OBJECT(vmState);
+    TRACE_OBJECT(b);
+    client->MergeInto(static_cast<VirtualMachineState *>(vmState), static_cast<IlBuilder *>(b));
+    TRACE_RETURN();
+}
+
+extern "C" void * getImpl_VirtualMachineState(void * client) {
+    return static_cast<TR::VirtualMachineState *>(static_cast<VirtualMachineState *>(client)->_impl);
+}
+
+VirtualMachineState::VirtualMachineState() {
+    PROFILE_TIMED_CALL(258); // VirtualMachineState::VirtualMachineState()
+    TRACE_CALL(258); // VirtualMachineState::VirtualMachineState()
+    auto * impl = ::new TR::VirtualMachineState();
+    static_cast<TR::VirtualMachineState *>(impl)->setClient(this);
+    initializeFromImpl(static_cast<void *>(impl));
+    TRACE_RETURN();
+    TRACE_OBJECT(this);
+}
+
+VirtualMachineState::VirtualMachineState(void * impl) {
+    if (impl != NULL) {
+        static_cast<TR::VirtualMachineState *>(impl)->setClient(this);
+        initializeFromImpl(impl);
+    }
+}
+
+void VirtualMachineState::initializeFromImpl(void * impl) {
+    _impl = impl;
+    static_cast<TR::VirtualMachineState *>(_impl)->setClientCallback_Commit(reinterpret_cast<void*>(&VirtualMachineStateCallback_Commit));
+    static_cast<TR::VirtualMachineState *>(_impl)->setClientCallback_Reload(reinterpret_cast<void*>(&VirtualMachineStateCallback_Reload));
+    static_cast<TR::VirtualMachineState *>(_impl)->setClientCallback_MakeCopy(reinterpret_cast<void*>(&VirtualMachineStateCallback_MakeCopy));
+    static_cast<TR::VirtualMachineState *>(_impl)->setClientCallback_MergeInto(reinterpret_cast<void*>(&VirtualMachineStateCallback_MergeInto));
+}
+
+VirtualMachineState::~VirtualMachineState() {}
+
+void VirtualMachineState::Commit(IlBuilder * b) {
+    PROFILE_TIMED_CALL(263); // VirtualMachineState::Commit(IlBuilder)
+    TRACE_CALL(263); // VirtualMachineState::Commit(IlBuilder)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(b);
+    static_cast<TR::VirtualMachineState *>(_impl)->Commit(static_cast<TR::IlBuilder *>(b != NULL ? b->_impl : NULL));
+    TRACE_RETURN();
+}
+
+void VirtualMachineState::Reload(IlBuilder * b) {
+    PROFILE_TIMED_CALL(264); // VirtualMachineState::Reload(IlBuilder)
+    TRACE_CALL(264); // VirtualMachineState::Reload(IlBuilder)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(b);
+    static_cast<TR::VirtualMachineState *>(_impl)->Reload(static_cast<TR::IlBuilder *>(b != NULL ? b->_impl : NULL));
+    TRACE_RETURN();
+}
+
+VirtualMachineState * VirtualMachineState::MakeCopy() {
+    PROFILE_TIMED_CALL(265); // VirtualMachineState::MakeCopy()
+    TRACE_CALL(265); // VirtualMachineState::MakeCopy()
+    TRACE_OBJECT(this);
+    TR::VirtualMachineState * implRet = static_cast<TR::VirtualMachineState *>(_impl)->MakeCopy();
+    GET_CLIENT_OBJECT(clientObj, VirtualMachineState, implRet);
+    TRACE_RETURN();
+    TRACE_OBJECT(clientObj);
+    return clientObj;
+}
+
+void VirtualMachineState::MergeInto(VirtualMachineState * vmState, IlBuilder * b) {
+    PROFILE_TIMED_CALL(266); // VirtualMachineState::MergeInto(VirtualMachineState, IlBuilder)
+    TRACE_CALL(266); // VirtualMachineState::MergeInto(VirtualMachineState, IlBuilder)
+    TRACE_OBJECT(this);
+    TRACE_OBJECT(vmState);
+    TRACE_OBJECT(b);
+    static_cast<TR::VirtualMachineState *>(_impl)->MergeInto(static_cast<TR::VirtualMachineState *>(vmState != NULL ? vmState->_impl : NULL), static_cast<TR::IlBuilder *>(b != NULL ? b->_impl : NULL));
+    TRACE_RETURN();
+}
+
+extern "C" void * allocateVirtualMachineState(void * impl) {
+    return new VirtualMachineState(impl);
+}
+
+} // JitBuilder
+} // OMR
@@ -0,0 +1,101 @@
+/*******************************************************************************
+ * Copyright (c) 2026, 2026 IBM Corp. and others
+ *
+ * This program and the accompanying materials are made available under
+ * the terms of the Eclipse Public License 2.0 which accompanies this
+ * distribution and is available at http://eclipse.org/legal/epl-2.0
+ * or the Apache License, Version 2.0 which accompanies this distribution
+ * and is available at https://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * This Source Code may also be made available under the following Secondary
+ * Licenses when the conditions for such availability set forth in the
+ * Eclipse Public License, v. 2.0 are satisfied: GNU General Public License,
+ * version 2 with the GNU Classpath Exception [1] and GNU General Public
+ * License, version 2 with the OpenJDK Assembly Exception [2].
+ *
+ * [1] https://www.gnu.org/software/classpath/license.html
+ * [2] http://openjdk.java.net/legal/assembly-exception.html
+ *
+ * SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+ *******************************************************************************/
+        
+#include "ilgen/BytecodeBuilder.hpp"
+#include "ilgen/IlBuilder.hpp"
+#include "ilgen/MethodBuilder.hpp"
+#include "ilgen/IlType.hpp"
+#include "ilgen/IlValue.hpp"
+#include "ilgen/ThunkBuilder.hpp"
+#include "ilgen/TypeDictionary.hpp"
+#include "ilgen/VirtualMachineOperandArray.hpp"
+#include "ilgen/VirtualMachineOperandStack.hpp"
+#include "ilgen/VirtualMachineRegister.hpp"
+#include "ilgen/VirtualMachineRegisterInStruct.hpp"
+#include "ilgen/VirtualMachineState.hpp"
+#include "<output>/include/Macros.hpp"
+#include "<output>/include/BytecodeBuilder.hpp"
+#include "<output>/include/IlBuilder.hpp"
+#include "<output>/include/MethodBuilder.hpp"
+#include "<output>/include/IlType.hpp"
+#include "<output>/include/IlValue.hpp"
+#include "<output>/include/ThunkBuilder.hpp"
+#include "<output>/include/TypeDictionary.hpp"
+#include "<output>/include/VirtualMachineOperandArray.hpp"
+#include "<output>/include/VirtualMachineOperandStack.hpp"
+#include "<output>/include/VirtualMachineRegister.hpp"
+#include "<output>/include/VirtualMachineRegisterInStruct.hpp"
+#include "<output>/include/VirtualMachineState.hpp"
+
+namespace OMR {
+namespace JitBuilder {
+
+extern "C" void * getImpl_IlType(void * client) {
+    return static_cast<TR::IlType *>(static_cast<IlType *>(client)->_impl);
+}
+
+
+IlType::IlType(void * impl) {
+    if (impl != NULL) {
+        static_cast<TR::IlType *>(impl)->setClient(this);
+        initializeFromImpl(impl);
+    }
+}
+
+void IlType::initializeFromImpl(void * impl) {
+    _impl = impl;
+}
+
+IlType::~IlType() {}
+
+IlType * IlType::baseType() {
+    TR::IlType * implRet = static_cast<TR::IlType *>(_impl)->baseType();
+    GET_CLIENT_OBJECT(clientObj, IlType, implRet);
+    return clientObj;
+}
+
+const char * IlType::getName() {
+    auto ret = static_cast<TR::IlType *>(_impl)->getName();
+    return ret;
+}
+
+IlType * IlType::primitiveType(TypeDictionary * d) {
+    TR::IlType * implRet = static_cast<TR::IlType *>(_impl)->primitiveType(static_cast<TR::TypeDictionary *>(d != NULL ? d->_impl : NULL));
+    GET_CLIENT_OBJECT(clientObj, IlType, implRet);
+    return clientObj;
+}
+
+size_t IlType::getSize() {
+    auto ret = static_cast<TR::IlType *>(_impl)->getSize();
+    return ret;
+}
+
+bool IlType::isPointer() {
+    auto ret = static_cast<TR::IlType *>(_impl)->isPointer();
+    return ret;
+}
+
+extern "C" void * allocateIlType(void * impl) {
+    return new IlType(impl);
+}
+
+} // JitBuilder
+} // OMR
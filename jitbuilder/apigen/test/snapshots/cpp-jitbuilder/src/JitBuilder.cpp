@@ -0,0 +1,140 @@
+/*******************************************************************************
+ * Copyright (c) 2026, 2026 IBM Corp. and others
+ *
+ * This program and the accompanying materials are made available under
+ * the terms of the Eclipse Public License 2.0 which accompanies this
+ * distribution and is available at http://eclipse.org/legal/epl-2.0
+ * or the Apache License, Version 2.0 which accompanies this distribution
+ * and is available at https://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * This Source Code may also be made available under the following Secondary
+ * Licenses when the conditions for such availability set forth in the
+ * Eclipse Public License, v. 2.0 are satisfied: GNU General Public License,
+ * version 2 with the GNU Classpath Exception [1] and GNU General Public
+ * License, version 2 with the OpenJDK Assembly Exception [2].
+ *
+ * [1] https://www.gnu.org/software/classpath/license.html
+ * [2] http://openjdk.java.net/legal/assembly-exception.html
+ *
+ * SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+ *******************************************************************************/
+        
+#include "ilgen/BytecodeBuilder.hpp"
+#include "ilgen/IlBuilder.hpp"
+#include "ilgen/MethodBuilder.hpp"
+#include "ilgen/IlType.hpp"
+#include "ilgen/IlValue.hpp"
+#include "ilgen/ThunkBuilder.hpp"
+#include "ilgen/TypeDictionary.hpp"
+#include "ilgen/VirtualMachineOperandArray.hpp"
+#include "ilgen/VirtualMachineOperandStack.hpp"
+#include "ilgen/VirtualMachineRegister.hpp"
+#include "ilgen/VirtualMachineRegisterInStruct.hpp"
+#include "ilgen/VirtualMachineState.hpp"
+#include "<output>/include/Macros.hpp"
+#include "<output>/include/BytecodeBuilder.hpp"
+#include "<output>/include/IlBuilder.hpp"
+#include "<output>/include/MethodBuilder.hpp"
+#include "<output>/include/IlType.hpp"
+#include "<output>/include/IlValue.hpp"
+#include "<output>/include/ThunkBuilder.hpp"
+#include "<output>/include/TypeDictionary.hpp"
+#include "<output>/include/VirtualMachineOperandArray.hpp"
+#include "<output>/include/VirtualMachineOperandStack.hpp"
+#include "<output>/include/VirtualMachineRegister.hpp"
+#include "<output>/include/VirtualMachineRegisterInStruct.hpp"
+#include "<output>/include/VirtualMachineState.hpp"
+#include "<output>/include/Async.hpp"
+
+extern bool internal_initializeJit();
+extern bool internal_initializeJitWithOptions(char * options);
+extern int32_t internal_compileMethodBuilder(TR::MethodBuilder * methodBuilder, void ** entryPoint);
+extern void internal_shutdownJit();
+
+extern bool internal_claimClientAllocators(const char * clientAPI);
+
+static bool registerAllocators() {
+    if (!internal_claimClientAllocators("C++")) {
+        return false;
+    }
+    TR::BytecodeBuilder::setClientAllocator(OMR::JitBuilder::allocateBytecodeBuilder);
+    TR::BytecodeBuilder::setGetImpl(OMR::JitBuilder::getImpl_BytecodeBuilder);
+    TR::IlBuilder::JBCase::setClientAllocator(OMR::JitBuilder::allocateIlBuilderJBCase);
+    TR::IlBuilder::JBCase::setGetImpl(OMR::JitBuilder::getImpl_JBCase);
+    TR::IlBuilder::JBCondition::setClientAllocator(OMR::JitBuilder::allocateIlBuilderJBCondition);
+    TR::IlBuilder::JBCondition::setGetImpl(OMR::JitBuilder::getImpl_JBCondition);
+    TR::IlBuilder::setClientAllocator(OMR::JitBuilder::allocateIlBuilder);
+    TR::IlBuilder::setGetImpl(OMR::JitBuilder::getImpl_IlBuilder);
+    TR::MethodBuilder::setClientAllocator(OMR::JitBuilder::allocateMethodBuilder);
+    TR::MethodBuilder::setGetImpl(OMR::JitBuilder::getImpl_MethodBuilder);
+    TR::IlType::setClientAllocator(OMR::JitBuilder::allocateIlType);
+    TR::IlType::setGetImpl(OMR::JitBuilder::getImpl_IlType);
+    TR::IlValue::setClientAllocator(OMR::JitBuilder::allocateIlValue);
+    TR::IlValue::setGetImpl(OMR::JitBuilder::getImpl_IlValue);
+    TR::ThunkBuilder::setClientAllocator(OMR::JitBuilder::allocateThunkBuilder);
+    TR::ThunkBuilder::setGetImpl(OMR::JitBuilder::getImpl_ThunkBuilder);
+    TR::TypeDictionary::setClientAllocator(OMR::JitBuilder::allocateTypeDictionary);
+    TR::TypeDictionary::setGetImpl(OMR::JitBuilder::getImpl_TypeDictionary);
+    TR::VirtualMachineOperandArray::setClientAllocator(OMR::JitBuilder::allocateVirtualMachineOperandArray);
+    TR::VirtualMachineOperandArray::setGetImpl(OMR::JitBuilder::getImpl_VirtualMachineOperandArray);
+    TR::VirtualMachineOperandStack::setClientAllocator(OMR::JitBuilder::allocateVirtualMachineOperandStack);
+    TR::VirtualMachineOperandStack::setGetImpl(OMR::JitBuilder::getImpl_VirtualMachineOperandStack);
+    TR::VirtualMachineRegister::setClientAllocator(OMR::JitBuilder::allocateVirtualMachineRegister);
+    TR::VirtualMachineRegister::setGetImpl(OMR::JitBuilder::getImpl_VirtualMachineRegister);
+    TR::VirtualMachineRegisterInStruct::setClientAllocator(OMR::JitBuilder::allocateVirtualMachineRegisterInStruct);
+    TR::VirtualMachineRegisterInStruct::setGetImpl(OMR::JitBuilder::getImpl_VirtualMachineRegisterInStruct);
+    TR::VirtualMachineState::setClientAllocator(OMR::JitBuilder::allocateVirtualMachineState);
+    TR::VirtualMachineState::setGetImpl(OMR::JitBuilder::getImpl_VirtualMachineState);
+    return true;
+}
+
+static bool setAllocators() {
+    static const bool allocatorsSet = registerAllocators();
+    return allocatorsSet;
+}
+
+bool initializeJit() {
+    if (!setAllocators()) {
+        return false;
+    }
+    auto ret = internal_initializeJit();
+    return ret;
+}
+
+bool initializeJitWithOptions(char * options) {
+    if (!setAllocators()) {
+        return false;
+    }
+    auto ret = internal_initializeJitWithOptions(options);
+    return ret;
+}
+
+int32_t compileMethodBuilder(OMR::JitBuilder::MethodBuilder * methodBuilder, void ** entryPoint) {
+    auto ret = internal_compileMethodBuilder(static_cast<TR::MethodBuilder *>(static_cast<TR::IlBuilder *>(methodBuilder != NULL ? methodBuilder->_impl : NULL)), entryPoint);
+    return ret;
+}
+
+void shutdownJit() {
+    internal_shutdownJit();
+}
+
+std::future<int32_t> compileMethodBuilderAsync(OMR::JitBuilder::MethodBuilder * methodBuilder, void ** entryPoint, std::function<void(int32_t)> onComplete) {
+    return OMR::JitBuilder::submitAsync<int32_t>([=]() { return compileMethodBuilder(methodBuilder, entryPoint); }, onComplete);
+}
+
+namespace OMR {
+namespace JitBuilder {
+
+AsyncWorkerPool asyncWorkerPool;
+
+} // JitBuilder
+} // OMR
+
+void setAsyncWorkerCount(size_t count) {
+    OMR::JitBuilder::asyncWorkerPool.setMaxWorkers(count);
+}
+
+void waitForAsyncServices() {
+    OMR::JitBuilder::asyncWorkerPool.wait();
+}
+
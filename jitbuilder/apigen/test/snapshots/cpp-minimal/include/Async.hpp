@@ -0,0 +1,179 @@
+/*******************************************************************************
+ * Copyright (c) 2026, 2026 IBM Corp. and others
+ *
+ * This program and the accompanying materials are made available under
+ * the terms of the Eclipse Public License 2.0 which accompanies this
+ * distribution and is available at http://eclipse.org/legal/epl-2.0
+ * or the Apache License, Version 2.0 which accompanies this distribution
+ * and is available at https://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * This Source Code may also be made available under the following Secondary
+ * Licenses when the conditions for such availability set forth in the
+ * Eclipse Public License, v. 2.0 are satisfied: GNU General Public License,
+ * version 2 with the GNU Classpath Exception [1] and GNU General Public
+ * License, version 2 with the OpenJDK Assembly Exception [2].
+ *
+ * [1] https://www.gnu.org/software/classpath/license.html
+ * [2] http://openjdk.java.net/legal/assembly-exception.html
+ *
+ * SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+ *******************************************************************************/
+
+
+#ifndef CPP_BINDING_ASYNC_INCL
+#define CPP_BINDING_ASYNC_INCL
+
+#include <condition_variable>
+#include <deque>
+#include <functional>
+#include <future>
+#include <memory>
+#include <mutex>
+#include <thread>
+#include <vector>
+
+/**
+ * @brief Support for the asynchronous service variants produced by the API generator
+ *
+ * For every service with the `async` flag, the generator adds a variant,
+ * suffixed with `Async`, that queues the call on a worker pool and returns
+ * immediately with a `std::future` for the result. An optional completion
+ * callback is invoked with the result, on the worker thread, once the call
+ * returns. Arguments are captured by value, so any array or pointer argument
+ * (e.g. the `entryPoint` of `compileMethodBuilder`) must stay valid until
+ * the call completes.
+ *
+ * The pool starts worker threads on demand, up to a fixed maximum, so
+ * calls made while all workers are busy wait in the queue. The pool itself
+ * is defined in `JitBuilder.cpp`.
+ */
+
+namespace OMR {
+namespace JitBuilder {
+
+class AsyncWorkerPool
+   {
+   public:
+   AsyncWorkerPool() : _maxWorkers(defaultWorkerCount()), _idleWorkers(0), _pending(0), _stopping(false) {}
+
+   ~AsyncWorkerPool()
+      {
+         {
+         std::lock_guard<std::mutex> guard(_lock);
+         _stopping = true;
+         }
+      _workAvailable.notify_all();
+      for (size_t i = 0; i < _workers.size(); ++i)
+         _workers[i].join();
+      }
+
+   /**
+    * @brief Sets the maximum number of worker threads
+    *
+    * Workers that are already running are not stopped, so the limit
+    * should be set before the first asynchronous call.
+    */
+   void setMaxWorkers(size_t count)
+      {
+      std::lock_guard<std::mutex> guard(_lock);
+      _maxWorkers = count > 0 ? count : 1;
+      }
+
+   void submit(std::function<void()> work)
+      {
+      std::lock_guard<std::mutex> guard(_lock);
+      _queue.push_back(std::move(work));
+      _pending++;
+      if (_idleWorkers < _queue.size() && _workers.size() < _maxWorkers)
+         _workers.push_back(std::thread(&AsyncWorkerPool::run, this));
+      else
+         _workAvailable.notify_one();
+      }
+
+   /** @brief Blocks until every queued call has completed */
+   void wait()
+      {
+      std::unique_lock<std::mutex> guard(_lock);
+      _allDone.wait(guard, [this]() { return _pending == 0; });
+      }
+
+   private:
+   static size_t defaultWorkerCount()
+      {
+      size_t count = std::thread::hardware_concurrency();
+      return count > 0 ? count : 1;
+      }
+
+   void run()
+      {
+      std::unique_lock<std::mutex> guard(_lock);
+      while (true)
+         {
+         _idleWorkers++;
+         _workAvailable.wait(guard, [this]() { return _stopping || !_queue.empty(); });
+         _idleWorkers--;
+         if (_queue.empty())
+            return;
+
+         std::function<void()> work = std::move(_queue.front());
+         _queue.pop_front();
+         guard.unlock();
+         work();
+         guard.lock();
+
+         if (--_pending == 0)
+            _allDone.notify_all();
+         }
+      }
+
+   std::mutex _lock;
+   std::condition_variable _workAvailable;
+   std::condition_variable _allDone;
+   std::deque<std::function<void()> > _queue;
+   std::vector<std::thread> _workers;
+   size_t _maxWorkers;
+   size_t _idleWorkers;
+   size_t _pending;
+   bool _stopping;
+   };
+
+extern AsyncWorkerPool asyncWorkerPool;
+
+/**
+ * @brief Queues a call on the worker pool
+ *
+ * The returned future receives the result of `call`, or the exception it
+ * throws. `onComplete`, if set, is only invoked when `call` returns normally.
+ */
+template <typename R>
+std::future<R> submitAsync(std::function<R()> call, std::function<void(R)> onComplete)
+   {
+   std::shared_ptr<std::packaged_task<R()> > task = std::make_shared<std::packaged_task<R()> >([call, onComplete]()
+      {
+      R ret = call();
+      if (onComplete)
+         onComplete(ret);
+      return ret;
+      });
+   std::future<R> result = task->get_future();
+   asyncWorkerPool.submit([task]() { (*task)(); });
+   return result;
+   }
+
+inline std::future<void> submitAsync(std::function<void()> call, std::function<void()> onComplete)
+   {
+   std::shared_ptr<std::packaged_task<void()> > task = std::make_shared<std::packaged_task<void()> >([call, onComplete]()
+      {
+      call();
+      if (onComplete)
+         onComplete();
+      });
+   std::future<void> result = task->get_future();
+   asyncWorkerPool.submit([task]() { (*task)(); });
+   return result;
+   }
+
+} // JitBuilder
+} // OMR
+
+#endif // defined(CPP_BINDING_ASYNC_INCL)
@@ -0,0 +1,97 @@
+/*******************************************************************************
+ * Copyright (c) 2026, 2026 IBM Corp. and others
+ *
+ * This program and the accompanying materials are made available under
+ * the terms of the Eclipse Public License 2.0 which accompanies this
+ * distribution and is available at http://eclipse.org/legal/epl-2.0
+ * or the Apache License, Version 2.0 which accompanies this distribution
+ * and is available at https://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * This Source Code may also be made available under the following Secondary
+ * Licenses when the conditions for such availability set forth in the
+ * Eclipse Public License, v. 2.0 are satisfied: GNU General Public License,
+ * version 2 with the GNU Classpath Exception [1] and GNU General Public
+ * License, version 2 with the OpenJDK Assembly Exception [2].
+ *
+ * [1] https://www.gnu.org/software/classpath/license.html
+ * [2] http://openjdk.java.net/legal/assembly-exception.html
+ *
+ * SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+ *******************************************************************************/
+
+
+#ifndef CPP_BINDING_PROFILING_INCL
+#define CPP_BINDING_PROFILING_INCL
+
+#include <stdint.h>
+
+#if defined(_MSC_VER) && (defined(_M_X64) || defined(_M_IX86))
+#include <intrin.h>
+#define PROFILE_USE_RDTSC
+#elif defined(__x86_64__) || defined(__i386__)
+#include <x86intrin.h>
+#define PROFILE_USE_RDTSC
+#else
+#include <chrono>
+#endif
+
+/**
+ * @brief Support for the call probes inserted by the API generator
+ *
+ * When the client API is generated with profiling enabled, every generated
+ * service, constructor, and callback thunk starts with one of the probes
+ * below. Each probe updates the entry for its entry point in a per-thread
+ * table, so no synchronization is needed on the hot path. The table itself,
+ * along with the functions used to report and reset it, are generated in
+ * `JitBuilder.cpp`.
+ *
+ * `PROFILE_CALL(id)` only counts calls. `PROFILE_TIMED_CALL(id)` also
+ * accumulates the time spent in the entry point (including any nested calls)
+ * in cycles where a cycle counter is available, and in nanoseconds otherwise.
+ */
+
+namespace OMR {
+namespace JitBuilder {
+
+struct ProfileEntry
+   {
+   uint64_t calls;
+   uint64_t cycles;
+   };
+
+extern thread_local ProfileEntry profileEntries[];
+
+inline uint64_t profileTimestamp()
+   {
+#if defined(PROFILE_USE_RDTSC)
+   return __rdtsc();
+#else
+   return std::chrono::duration_cast<std::chrono::nanoseconds>(std::chrono::steady_clock::now().time_since_epoch()).count();
+#endif
+   }
+
+class ProfileScope
+   {
+   public:
+   explicit ProfileScope(int32_t id) : _entry(profileEntries[id]), _start(profileTimestamp())
+      {
+      _entry.calls++;
+      }
+
+   ~ProfileScope()
+      {
+      _entry.cycles += profileTimestamp() - _start;
+      }
+
+   private:
+   ProfileEntry &_entry;
+   uint64_t _start;
+   };
+
+} // JitBuilder
+} // OMR
+
+#define PROFILE_CALL(id) ++OMR::JitBuilder::profileEntries[id].calls
+#define PROFILE_TIMED_CALL(id) OMR::JitBuilder::ProfileScope profileScope(id)
+
+#endif // defined(CPP_BINDING_PROFILING_INCL)
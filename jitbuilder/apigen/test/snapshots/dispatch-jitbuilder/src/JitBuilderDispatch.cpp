@@ -0,0 +1,1611 @@
+/*******************************************************************************
+ * Copyright (c) 2026, 2026 IBM Corp. and others
+ *
+ * This program and the accompanying materials are made available under
+ * the terms of the Eclipse Public License 2.0 which accompanies this
+ * distribution and is available at http://eclipse.org/legal/epl-2.0
+ * or the Apache License, Version 2.0 which accompanies this distribution
+ * and is available at https://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * This Source Code may also be made available under the following Secondary
+ * Licenses when the conditions for such availability set forth in the
+ * Eclipse Public License, v. 2.0 are satisfied: GNU General Public License,
+ * version 2 with the GNU Classpath Exception [1] and GNU General Public
+ * License, version 2 with the OpenJDK Assembly Exception [2].
+ *
+ * [1] https://www.gnu.org/software/classpath/license.html
+ * [2] http://openjdk.java.net/legal/assembly-exception.html
+ *
+ * SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+ *******************************************************************************/
+        
+#include <string.h>
+#include "<output>/include/JitBuilderDispatch.h"
+
+static void thunk_JB_BytecodeBuilder_asIlBuilder(const JB_Value * args, JB_Value * result) {
+    result->p = JB_BytecodeBuilder_asIlBuilder(static_cast<JB_BytecodeBuilder *>(args[0].p));
+}
+
+static void thunk_JB_BytecodeBuilder_bcIndex(const JB_Value * args, JB_Value * result) {
+    result->i32 = JB_BytecodeBuilder_bcIndex(static_cast<JB_BytecodeBuilder *>(args[0].p));
+}
+
+static void thunk_JB_BytecodeBuilder_name(const JB_Value * args, JB_Value * result) {
+    result->str = JB_BytecodeBuilder_name(static_cast<JB_BytecodeBuilder *>(args[0].p));
+}
+
+static void thunk_JB_BytecodeBuilder_vmState(const JB_Value * args, JB_Value * result) {
+    result->p = JB_BytecodeBuilder_vmState(static_cast<JB_BytecodeBuilder *>(args[0].p));
+}
+
+static void thunk_JB_BytecodeBuilder_AddFallThroughBuilder(const JB_Value * args, JB_Value * result) {
+    JB_BytecodeBuilder_AddFallThroughBuilder(static_cast<JB_BytecodeBuilder *>(args[0].p), static_cast<JB_BytecodeBuilder *>(args[1].p));
+}
+
+static void thunk_JB_BytecodeBuilder_AddSuccessorBuildersWithArgArray(const JB_Value * args, JB_Value * result) {
+    JB_BytecodeBuilder_AddSuccessorBuildersWithArgArray(static_cast<JB_BytecodeBuilder *>(args[0].p), args[1].u32, static_cast<JB_BytecodeBuilder **>(args[2].p));
+}
+
+static void thunk_JB_BytecodeBuilder_AddSuccessorBuilder(const JB_Value * args, JB_Value * result) {
+    JB_BytecodeBuilder_AddSuccessorBuilder(static_cast<JB_BytecodeBuilder *>(args[0].p), static_cast<JB_BytecodeBuilder **>(args[1].p));
+}
+
+static void thunk_JB_BytecodeBuilder_Goto(const JB_Value * args, JB_Value * result) {
+    JB_BytecodeBuilder_Goto(static_cast<JB_BytecodeBuilder *>(args[0].p), static_cast<JB_BytecodeBuilder *>(args[1].p));
+}
+
+static void thunk_JB_BytecodeBuilder_GotoNew(const JB_Value * args, JB_Value * result) {
+    JB_BytecodeBuilder_GotoNew(static_cast<JB_BytecodeBuilder *>(args[0].p), static_cast<JB_BytecodeBuilder **>(args[1].p));
+}
+
+static void thunk_JB_BytecodeBuilder_IfCmpEqual(const JB_Value * args, JB_Value * result) {
+    JB_BytecodeBuilder_IfCmpEqual(static_cast<JB_BytecodeBuilder *>(args[0].p), static_cast<JB_BytecodeBuilder *>(args[1].p), static_cast<JB_IlValue *>(args[2].p), static_cast<JB_IlValue *>(args[3].p));
+}
+
+static void thunk_JB_BytecodeBuilder_IfCmpEqualNew(const JB_Value * args, JB_Value * result) {
+    JB_BytecodeBuilder_IfCmpEqualNew(static_cast<JB_BytecodeBuilder *>(args[0].p), static_cast<JB_BytecodeBuilder **>(args[1].p), static_cast<JB_IlValue *>(args[2].p), static_cast<JB_IlValue *>(args[3].p));
+}
+
+static void thunk_JB_BytecodeBuilder_IfCmpLessOrEqual(const JB_Value * args, JB_Value * result) {
+    JB_BytecodeBuilder_IfCmpLessOrEqual(static_cast<JB_BytecodeBuilder *>(args[0].p), static_cast<JB_BytecodeBuilder *>(args[1].p), static_cast<JB_IlValue *>(args[2].p), static_cast<JB_IlValue *>(args[3].p));
+}
+
+static void thunk_JB_BytecodeBuilder_IfCmpLessOrEqualNew(const JB_Value * args, JB_Value * result) {
+    JB_BytecodeBuilder_IfCmpLessOrEqualNew(static_cast<JB_BytecodeBuilder *>(args[0].p), static_cast<JB_BytecodeBuilder **>(args[1].p), static_cast<JB_IlValue *>(args[2].p), static_cast<JB_IlValue *>(args[3].p));
+}
+
+static void thunk_JB_BytecodeBuilder_IfCmpLessThan(const JB_Value * args, JB_Value * result) {
+    JB_BytecodeBuilder_IfCmpLessThan(static_cast<JB_BytecodeBuilder *>(args[0].p), static_cast<JB_BytecodeBuilder *>(args[1].p), static_cast<JB_IlValue *>(args[2].p), static_cast<JB_IlValue *>(args[3].p));
+}
+
+static void thunk_JB_BytecodeBuilder_IfCmpLessThanNew(const JB_Value * args, JB_Value * result) {
+    JB_BytecodeBuilder_IfCmpLessThanNew(static_cast<JB_BytecodeBuilder *>(args[0].p), static_cast<JB_BytecodeBuilder **>(args[1].p), static_cast<JB_IlValue *>(args[2].p), static_cast<JB_IlValue *>(args[3].p));
+}
+
+static void thunk_JB_BytecodeBuilder_IfCmpGreaterOrEqual(const JB_Value * args, JB_Value * result) {
+    JB_BytecodeBuilder_IfCmpGreaterOrEqual(static_cast<JB_BytecodeBuilder *>(args[0].p), static_cast<JB_BytecodeBuilder *>(args[1].p), static_cast<JB_IlValue *>(args[2].p), static_cast<JB_IlValue *>(args[3].p));
+}
+
+static void thunk_JB_BytecodeBuilder_IfCmpGreaterOrEqualNew(const JB_Value * args, JB_Value * result) {
+    JB_BytecodeBuilder_IfCmpGreaterOrEqualNew(static_cast<JB_BytecodeBuilder *>(args[0].p), static_cast<JB_BytecodeBuilder **>(args[1].p), static_cast<JB_IlValue *>(args[2].p), static_cast<JB_IlValue *>(args[3].p));
+}
+
+static void thunk_JB_BytecodeBuilder_IfCmpGreaterThan(const JB_Value * args, JB_Value * result) {
+    JB_BytecodeBuilder_IfCmpGreaterThan(static_cast<JB_BytecodeBuilder *>(args[0].p), static_cast<JB_BytecodeBuilder *>(args[1].p), static_cast<JB_IlValue *>(args[2].p), static_cast<JB_IlValue *>(args[3].p));
+}
+
+static void thunk_JB_BytecodeBuilder_IfCmpGreaterThanNew(const JB_Value * args, JB_Value * result) {
+    JB_BytecodeBuilder_IfCmpGreaterThanNew(static_cast<JB_BytecodeBuilder *>(args[0].p), static_cast<JB_BytecodeBuilder **>(args[1].p), static_cast<JB_IlValue *>(args[2].p), static_cast<JB_IlValue *>(args[3].p));
+}
+
+static void thunk_JB_BytecodeBuilder_IfCmpNotEqual(const JB_Value * args, JB_Value * result) {
+    JB_BytecodeBuilder_IfCmpNotEqual(static_cast<JB_BytecodeBuilder *>(args[0].p), static_cast<JB_BytecodeBuilder *>(args[1].p), static_cast<JB_IlValue *>(args[2].p), static_cast<JB_IlValue *>(args[3].p));
+}
+
+static void thunk_JB_BytecodeBuilder_IfCmpNotEqualNew(const JB_Value * args, JB_Value * result) {
+    JB_BytecodeBuilder_IfCmpNotEqualNew(static_cast<JB_BytecodeBuilder *>(args[0].p), static_cast<JB_BytecodeBuilder **>(args[1].p), static_cast<JB_IlValue *>(args[2].p), static_cast<JB_IlValue *>(args[3].p));
+}
+
+static void thunk_JB_BytecodeBuilder_IfCmpUnsignedLessOrEqual(const JB_Value * args, JB_Value * result) {
+    JB_BytecodeBuilder_IfCmpUnsignedLessOrEqual(static_cast<JB_BytecodeBuilder *>(args[0].p), static_cast<JB_BytecodeBuilder *>(args[1].p), static_cast<JB_IlValue *>(args[2].p), static_cast<JB_IlValue *>(args[3].p));
+}
+
+static void thunk_JB_BytecodeBuilder_IfCmpUnsignedLessOrEqualNew(const JB_Value * args, JB_Value * result) {
+    JB_BytecodeBuilder_IfCmpUnsignedLessOrEqualNew(static_cast<JB_BytecodeBuilder *>(args[0].p), static_cast<JB_BytecodeBuilder **>(args[1].p), static_cast<JB_IlValue *>(args[2].p), static_cast<JB_IlValue *>(args[3].p));
+}
+
+static void thunk_JB_BytecodeBuilder_IfCmpUnsignedLessThan(const JB_Value * args, JB_Value * result) {
+    JB_BytecodeBuilder_IfCmpUnsignedLessThan(static_cast<JB_BytecodeBuilder *>(args[0].p), static_cast<JB_BytecodeBuilder *>(args[1].p), static_cast<JB_IlValue *>(args[2].p), static_cast<JB_IlValue *>(args[3].p));
+}
+
+static void thunk_JB_BytecodeBuilder_IfCmpUnsignedLessThanNew(const JB_Value * args, JB_Value * result) {
+    JB_BytecodeBuilder_IfCmpUnsignedLessThanNew(static_cast<JB_BytecodeBuilder *>(args[0].p), static_cast<JB_BytecodeBuilder **>(args[1].p), static_cast<JB_IlValue *>(args[2].p), static_cast<JB_IlValue *>(args[3].p));
+}
+
+static void thunk_JB_BytecodeBuilder_IfCmpUnsignedGreaterOrEqual(const JB_Value * args, JB_Value * result) {
+    JB_BytecodeBuilder_IfCmpUnsignedGreaterOrEqual(static_cast<JB_BytecodeBuilder *>(args[0].p), static_cast<JB_BytecodeBuilder *>(args[1].p), static_cast<JB_IlValue *>(args[2].p), static_cast<JB_IlValue *>(args[3].p));
+}
+
+static void thunk_JB_BytecodeBuilder_IfCmpUnsignedGreaterOrEqualNew(const JB_Value * args, JB_Value * result) {
+    JB_BytecodeBuilder_IfCmpUnsignedGreaterOrEqualNew(static_cast<JB_BytecodeBuilder *>(args[0].p), static_cast<JB_BytecodeBuilder **>(args[1].p), static_cast<JB_IlValue *>(args[2].p), static_cast<JB_IlValue *>(args[3].p));
+}
+
+static void thunk_JB_BytecodeBuilder_IfCmpUnsignedGreaterThan(const JB_Value * args, JB_Value * result) {
+    JB_BytecodeBuilder_IfCmpUnsignedGreaterThan(static_cast<JB_BytecodeBuilder *>(args[0].p), static_cast<JB_BytecodeBuilder *>(args[1].p), static_cast<JB_IlValue *>(args[2].p), static_cast<JB_IlValue *>(args[3].p));
+}
+
+static void thunk_JB_BytecodeBuilder_IfCmpUnsignedGreaterThanNew(const JB_Value * args, JB_Value * result) {
+    JB_BytecodeBuilder_IfCmpUnsignedGreaterThanNew(static_cast<JB_BytecodeBuilder *>(args[0].p), static_cast<JB_BytecodeBuilder **>(args[1].p), static_cast<JB_IlValue *>(args[2].p), static_cast<JB_IlValue *>(args[3].p));
+}
+
+static void thunk_JB_BytecodeBuilder_IfCmpEqualZero(const JB_Value * args, JB_Value * result) {
+    JB_BytecodeBuilder_IfCmpEqualZero(static_cast<JB_BytecodeBuilder *>(args[0].p), static_cast<JB_BytecodeBuilder *>(args[1].p), static_cast<JB_IlValue *>(args[2].p));
+}
+
+static void thunk_JB_BytecodeBuilder_IfCmpEqualZeroNew(const JB_Value * args, JB_Value * result) {
+    JB_BytecodeBuilder_IfCmpEqualZeroNew(static_cast<JB_BytecodeBuilder *>(args[0].p), static_cast<JB_BytecodeBuilder **>(args[1].p), static_cast<JB_IlValue *>(args[2].p));
+}
+
+static void thunk_JB_BytecodeBuilder_IfCmpNotEqualZero(const JB_Value * args, JB_Value * result) {
+    JB_BytecodeBuilder_IfCmpNotEqualZero(static_cast<JB_BytecodeBuilder *>(args[0].p), static_cast<JB_BytecodeBuilder *>(args[1].p), static_cast<JB_IlValue *>(args[2].p));
+}
+
+static void thunk_JB_BytecodeBuilder_IfCmpNotEqualZeroNew(const JB_Value * args, JB_Value * result) {
+    JB_BytecodeBuilder_IfCmpNotEqualZeroNew(static_cast<JB_BytecodeBuilder *>(args[0].p), static_cast<JB_BytecodeBuilder **>(args[1].p), static_cast<JB_IlValue *>(args[2].p));
+}
+
+static void thunk_JB_IlBuilder_JBCase_new(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_JBCase_new(args[0].i32, static_cast<JB_IlBuilder *>(args[1].p), args[2].i32);
+}
+
+static void thunk_JB_IlBuilder_JBCase_delete(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_JBCase_delete(static_cast<JB_IlBuilder_JBCase *>(args[0].p));
+}
+
+static void thunk_JB_IlBuilder_JBCondition_new(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_JBCondition_new(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlValue *>(args[1].p));
+}
+
+static void thunk_JB_IlBuilder_JBCondition_delete(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_JBCondition_delete(static_cast<JB_IlBuilder_JBCondition *>(args[0].p));
+}
+
+static void thunk_JB_IlBuilder_getNoType(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_getNoType(static_cast<JB_IlBuilder *>(args[0].p));
+}
+
+static void thunk_JB_IlBuilder_getInt8(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_getInt8(static_cast<JB_IlBuilder *>(args[0].p));
+}
+
+static void thunk_JB_IlBuilder_getInt16(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_getInt16(static_cast<JB_IlBuilder *>(args[0].p));
+}
+
+static void thunk_JB_IlBuilder_getInt32(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_getInt32(static_cast<JB_IlBuilder *>(args[0].p));
+}
+
+static void thunk_JB_IlBuilder_getInt64(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_getInt64(static_cast<JB_IlBuilder *>(args[0].p));
+}
+
+static void thunk_JB_IlBuilder_getFloat(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_getFloat(static_cast<JB_IlBuilder *>(args[0].p));
+}
+
+static void thunk_JB_IlBuilder_getDouble(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_getDouble(static_cast<JB_IlBuilder *>(args[0].p));
+}
+
+static void thunk_JB_IlBuilder_getAddress(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_getAddress(static_cast<JB_IlBuilder *>(args[0].p));
+}
+
+static void thunk_JB_IlBuilder_getVectorInt8(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_getVectorInt8(static_cast<JB_IlBuilder *>(args[0].p));
+}
+
+static void thunk_JB_IlBuilder_getVectorInt16(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_getVectorInt16(static_cast<JB_IlBuilder *>(args[0].p));
+}
+
+static void thunk_JB_IlBuilder_getVectorInt32(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_getVectorInt32(static_cast<JB_IlBuilder *>(args[0].p));
+}
+
+static void thunk_JB_IlBuilder_getVectorInt64(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_getVectorInt64(static_cast<JB_IlBuilder *>(args[0].p));
+}
+
+static void thunk_JB_IlBuilder_getVectorFloat(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_getVectorFloat(static_cast<JB_IlBuilder *>(args[0].p));
+}
+
+static void thunk_JB_IlBuilder_getVectorDouble(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_getVectorDouble(static_cast<JB_IlBuilder *>(args[0].p));
+}
+
+static void thunk_JB_IlBuilder_getWord(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_getWord(static_cast<JB_IlBuilder *>(args[0].p));
+}
+
+static void thunk_JB_IlBuilder_setClientCallback_buildIL(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_setClientCallback_buildIL(static_cast<JB_IlBuilder *>(args[0].p), reinterpret_cast<JB_IlBuilder_buildILCallback>(args[1].p));
+}
+
+static void thunk_JB_IlBuilder_OrphanBuilder(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_OrphanBuilder(static_cast<JB_IlBuilder *>(args[0].p));
+}
+
+static void thunk_JB_IlBuilder_OrphanBytecodeBuilder(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_OrphanBytecodeBuilder(static_cast<JB_IlBuilder *>(args[0].p), args[1].i32, args[2].str);
+}
+
+static void thunk_JB_IlBuilder_Copy(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_Copy(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlValue *>(args[1].p));
+}
+
+static void thunk_JB_IlBuilder_typeDictionary(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_typeDictionary(static_cast<JB_IlBuilder *>(args[0].p));
+}
+
+static void thunk_JB_IlBuilder_ConstInteger(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_ConstInteger(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlType *>(args[1].p), args[2].i64);
+}
+
+static void thunk_JB_IlBuilder_ConstAddress(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_ConstAddress(static_cast<JB_IlBuilder *>(args[0].p), args[1].p);
+}
+
+static void thunk_JB_IlBuilder_ConstDouble(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_ConstDouble(static_cast<JB_IlBuilder *>(args[0].p), args[1].d);
+}
+
+static void thunk_JB_IlBuilder_ConstFloat(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_ConstFloat(static_cast<JB_IlBuilder *>(args[0].p), args[1].f);
+}
+
+static void thunk_JB_IlBuilder_ConstInt8(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_ConstInt8(static_cast<JB_IlBuilder *>(args[0].p), args[1].i8);
+}
+
+static void thunk_JB_IlBuilder_ConstInt16(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_ConstInt16(static_cast<JB_IlBuilder *>(args[0].p), args[1].i16);
+}
+
+static void thunk_JB_IlBuilder_ConstInt32(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_ConstInt32(static_cast<JB_IlBuilder *>(args[0].p), args[1].i32);
+}
+
+static void thunk_JB_IlBuilder_ConstInt64(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_ConstInt64(static_cast<JB_IlBuilder *>(args[0].p), args[1].i64);
+}
+
+static void thunk_JB_IlBuilder_ConstString(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_ConstString(static_cast<JB_IlBuilder *>(args[0].p), args[1].str);
+}
+
+static void thunk_JB_IlBuilder_NullAddress(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_NullAddress(static_cast<JB_IlBuilder *>(args[0].p));
+}
+
+static void thunk_JB_IlBuilder_Add(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_Add(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlValue *>(args[1].p), static_cast<JB_IlValue *>(args[2].p));
+}
+
+static void thunk_JB_IlBuilder_AddWithOverflow(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_AddWithOverflow(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlBuilder **>(args[1].p), static_cast<JB_IlValue *>(args[2].p), static_cast<JB_IlValue *>(args[3].p));
+}
+
+static void thunk_JB_IlBuilder_AddWithUnsignedOverflow(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_AddWithUnsignedOverflow(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlBuilder **>(args[1].p), static_cast<JB_IlValue *>(args[2].p), static_cast<JB_IlValue *>(args[3].p));
+}
+
+static void thunk_JB_IlBuilder_And(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_And(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlValue *>(args[1].p), static_cast<JB_IlValue *>(args[2].p));
+}
+
+static void thunk_JB_IlBuilder_Div(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_Div(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlValue *>(args[1].p), static_cast<JB_IlValue *>(args[2].p));
+}
+
+static void thunk_JB_IlBuilder_UnsignedDiv(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_UnsignedDiv(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlValue *>(args[1].p), static_cast<JB_IlValue *>(args[2].p));
+}
+
+static void thunk_JB_IlBuilder_IndexAt(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_IndexAt(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlType *>(args[1].p), static_cast<JB_IlValue *>(args[2].p), static_cast<JB_IlValue *>(args[3].p));
+}
+
+static void thunk_JB_IlBuilder_Mul(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_Mul(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlValue *>(args[1].p), static_cast<JB_IlValue *>(args[2].p));
+}
+
+static void thunk_JB_IlBuilder_MulWithOverflow(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_MulWithOverflow(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlBuilder **>(args[1].p), static_cast<JB_IlValue *>(args[2].p), static_cast<JB_IlValue *>(args[3].p));
+}
+
+static void thunk_JB_IlBuilder_Negate(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_Negate(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlValue *>(args[1].p));
+}
+
+static void thunk_JB_IlBuilder_Or(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_Or(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlValue *>(args[1].p), static_cast<JB_IlValue *>(args[2].p));
+}
+
+static void thunk_JB_IlBuilder_Rem(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_Rem(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlValue *>(args[1].p), static_cast<JB_IlValue *>(args[2].p));
+}
+
+static void thunk_JB_IlBuilder_UnsignedRem(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_UnsignedRem(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlValue *>(args[1].p), static_cast<JB_IlValue *>(args[2].p));
+}
+
+static void thunk_JB_IlBuilder_ShiftL(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_ShiftL(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlValue *>(args[1].p), static_cast<JB_IlValue *>(args[2].p));
+}
+
+static void thunk_JB_IlBuilder_ShiftR(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_ShiftR(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlValue *>(args[1].p), static_cast<JB_IlValue *>(args[2].p));
+}
+
+static void thunk_JB_IlBuilder_Sub(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_Sub(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlValue *>(args[1].p), static_cast<JB_IlValue *>(args[2].p));
+}
+
+static void thunk_JB_IlBuilder_SubWithOverflow(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_SubWithOverflow(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlBuilder **>(args[1].p), static_cast<JB_IlValue *>(args[2].p), static_cast<JB_IlValue *>(args[3].p));
+}
+
+static void thunk_JB_IlBuilder_SubWithUnsignedOverflow(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_SubWithUnsignedOverflow(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlBuilder **>(args[1].p), static_cast<JB_IlValue *>(args[2].p), static_cast<JB_IlValue *>(args[3].p));
+}
+
+static void thunk_JB_IlBuilder_UnsignedShiftR(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_UnsignedShiftR(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlValue *>(args[1].p), static_cast<JB_IlValue *>(args[2].p));
+}
+
+static void thunk_JB_IlBuilder_Xor(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_Xor(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlValue *>(args[1].p), static_cast<JB_IlValue *>(args[2].p));
+}
+
+static void thunk_JB_IlBuilder_EqualTo(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_EqualTo(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlValue *>(args[1].p), static_cast<JB_IlValue *>(args[2].p));
+}
+
+static void thunk_JB_IlBuilder_LessOrEqualTo(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_LessOrEqualTo(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlValue *>(args[1].p), static_cast<JB_IlValue *>(args[2].p));
+}
+
+static void thunk_JB_IlBuilder_LessThan(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_LessThan(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlValue *>(args[1].p), static_cast<JB_IlValue *>(args[2].p));
+}
+
+static void thunk_JB_IlBuilder_GreaterOrEqualTo(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_GreaterOrEqualTo(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlValue *>(args[1].p), static_cast<JB_IlValue *>(args[2].p));
+}
+
+static void thunk_JB_IlBuilder_GreaterThan(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_GreaterThan(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlValue *>(args[1].p), static_cast<JB_IlValue *>(args[2].p));
+}
+
+static void thunk_JB_IlBuilder_NotEqualTo(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_NotEqualTo(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlValue *>(args[1].p), static_cast<JB_IlValue *>(args[2].p));
+}
+
+static void thunk_JB_IlBuilder_UnsignedLessOrEqualTo(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_UnsignedLessOrEqualTo(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlValue *>(args[1].p), static_cast<JB_IlValue *>(args[2].p));
+}
+
+static void thunk_JB_IlBuilder_UnsignedLessThan(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_UnsignedLessThan(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlValue *>(args[1].p), static_cast<JB_IlValue *>(args[2].p));
+}
+
+static void thunk_JB_IlBuilder_UnsignedGreaterOrEqualTo(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_UnsignedGreaterOrEqualTo(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlValue *>(args[1].p), static_cast<JB_IlValue *>(args[2].p));
+}
+
+static void thunk_JB_IlBuilder_UnsignedGreaterThan(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_UnsignedGreaterThan(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlValue *>(args[1].p), static_cast<JB_IlValue *>(args[2].p));
+}
+
+static void thunk_JB_IlBuilder_ConvertBitsTo(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_ConvertBitsTo(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlType *>(args[1].p), static_cast<JB_IlValue *>(args[2].p));
+}
+
+static void thunk_JB_IlBuilder_ConvertTo(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_ConvertTo(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlType *>(args[1].p), static_cast<JB_IlValue *>(args[2].p));
+}
+
+static void thunk_JB_IlBuilder_UnsignedConvertTo(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_UnsignedConvertTo(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlType *>(args[1].p), static_cast<JB_IlValue *>(args[2].p));
+}
+
+static void thunk_JB_IlBuilder_AtomicAdd(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_AtomicAdd(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlValue *>(args[1].p), static_cast<JB_IlValue *>(args[2].p));
+}
+
+static void thunk_JB_IlBuilder_CreateLocalArray(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_CreateLocalArray(static_cast<JB_IlBuilder *>(args[0].p), args[1].i32, static_cast<JB_IlType *>(args[2].p));
+}
+
+static void thunk_JB_IlBuilder_CreateLocalStruct(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_CreateLocalStruct(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlType *>(args[1].p));
+}
+
+static void thunk_JB_IlBuilder_Load(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_Load(static_cast<JB_IlBuilder *>(args[0].p), args[1].cs);
+}
+
+static void thunk_JB_IlBuilder_LoadAt(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_LoadAt(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlType *>(args[1].p), static_cast<JB_IlValue *>(args[2].p));
+}
+
+static void thunk_JB_IlBuilder_LoadIndirect(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_LoadIndirect(static_cast<JB_IlBuilder *>(args[0].p), args[1].cs, args[2].cs, static_cast<JB_IlValue *>(args[3].p));
+}
+
+static void thunk_JB_IlBuilder_Store(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_Store(static_cast<JB_IlBuilder *>(args[0].p), args[1].cs, static_cast<JB_IlValue *>(args[2].p));
+}
+
+static void thunk_JB_IlBuilder_StoreAt(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_StoreAt(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlValue *>(args[1].p), static_cast<JB_IlValue *>(args[2].p));
+}
+
+static void thunk_JB_IlBuilder_StoreIndirect(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_StoreIndirect(static_cast<JB_IlBuilder *>(args[0].p), args[1].cs, args[2].cs, static_cast<JB_IlValue *>(args[3].p), static_cast<JB_IlValue *>(args[4].p));
+}
+
+static void thunk_JB_IlBuilder_StoreOver(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_StoreOver(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlValue *>(args[1].p), static_cast<JB_IlValue *>(args[2].p));
+}
+
+static void thunk_JB_IlBuilder_Transaction(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_Transaction(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlBuilder **>(args[1].p), static_cast<JB_IlBuilder **>(args[2].p), static_cast<JB_IlBuilder **>(args[3].p));
+}
+
+static void thunk_JB_IlBuilder_TransactionAbort(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_TransactionAbort(static_cast<JB_IlBuilder *>(args[0].p));
+}
+
+static void thunk_JB_IlBuilder_StructFieldInstanceAddress(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_StructFieldInstanceAddress(static_cast<JB_IlBuilder *>(args[0].p), args[1].cs, args[2].cs, static_cast<JB_IlValue *>(args[3].p));
+}
+
+static void thunk_JB_IlBuilder_UnionFieldInstanceAddress(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_UnionFieldInstanceAddress(static_cast<JB_IlBuilder *>(args[0].p), args[1].cs, args[2].cs, static_cast<JB_IlValue *>(args[3].p));
+}
+
+static void thunk_JB_IlBuilder_VectorLoad(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_VectorLoad(static_cast<JB_IlBuilder *>(args[0].p), args[1].str);
+}
+
+static void thunk_JB_IlBuilder_VectorLoadAt(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_VectorLoadAt(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlType *>(args[1].p), static_cast<JB_IlValue *>(args[2].p));
+}
+
+static void thunk_JB_IlBuilder_VectorStore(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_VectorStore(static_cast<JB_IlBuilder *>(args[0].p), args[1].str, static_cast<JB_IlValue *>(args[2].p));
+}
+
+static void thunk_JB_IlBuilder_VectorStoreAt(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_VectorStoreAt(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlValue *>(args[1].p), static_cast<JB_IlValue *>(args[2].p));
+}
+
+static void thunk_JB_IlBuilder_AppendBuilder(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_AppendBuilder(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlBuilder *>(args[1].p));
+}
+
+static void thunk_JB_IlBuilder_CallWithArgArray(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_CallWithArgArray(static_cast<JB_IlBuilder *>(args[0].p), args[1].cs, args[2].i32, static_cast<JB_IlValue **>(args[3].p));
+}
+
+static void thunk_JB_IlBuilder_CallMethodBuilder(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_CallMethodBuilder(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_MethodBuilder *>(args[1].p), args[2].i32, static_cast<JB_IlValue **>(args[3].p));
+}
+
+static void thunk_JB_IlBuilder_ComputedCallWithArgArray(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_ComputedCallWithArgArray(static_cast<JB_IlBuilder *>(args[0].p), args[1].str, args[2].i32, static_cast<JB_IlValue **>(args[3].p));
+}
+
+static void thunk_JB_IlBuilder_DoWhileLoop(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_DoWhileLoop(static_cast<JB_IlBuilder *>(args[0].p), args[1].str, static_cast<JB_IlBuilder **>(args[2].p));
+}
+
+static void thunk_JB_IlBuilder_DoWhileLoopWithBreakAndContinue(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_DoWhileLoopWithBreakAndContinue(static_cast<JB_IlBuilder *>(args[0].p), args[1].str, static_cast<JB_IlBuilder **>(args[2].p), static_cast<JB_IlBuilder **>(args[3].p), static_cast<JB_IlBuilder **>(args[4].p));
+}
+
+static void thunk_JB_IlBuilder_DoWhileLoopWithBreak(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_DoWhileLoopWithBreak(static_cast<JB_IlBuilder *>(args[0].p), args[1].str, static_cast<JB_IlBuilder **>(args[2].p), static_cast<JB_IlBuilder **>(args[3].p));
+}
+
+static void thunk_JB_IlBuilder_DoWhileLoopWithContinue(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_DoWhileLoopWithContinue(static_cast<JB_IlBuilder *>(args[0].p), args[1].str, static_cast<JB_IlBuilder **>(args[2].p), static_cast<JB_IlBuilder **>(args[3].p));
+}
+
+static void thunk_JB_IlBuilder_Goto(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_Goto(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlBuilder *>(args[1].p));
+}
+
+static void thunk_JB_IlBuilder_GotoNew(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_GotoNew(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlBuilder **>(args[1].p));
+}
+
+static void thunk_JB_IlBuilder_MakeCondition(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_MakeCondition(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlBuilder *>(args[1].p), static_cast<JB_IlValue *>(args[2].p));
+}
+
+static void thunk_JB_IlBuilder_IfAndWithArgArray(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_IfAndWithArgArray(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlBuilder **>(args[1].p), static_cast<JB_IlBuilder **>(args[2].p), args[3].i32, static_cast<JB_IlBuilder_JBCondition **>(args[4].p));
+}
+
+static void thunk_JB_IlBuilder_IfCmpEqual(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_IfCmpEqual(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlBuilder *>(args[1].p), static_cast<JB_IlValue *>(args[2].p), static_cast<JB_IlValue *>(args[3].p));
+}
+
+static void thunk_JB_IlBuilder_IfCmpEqualNew(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_IfCmpEqualNew(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlBuilder **>(args[1].p), static_cast<JB_IlValue *>(args[2].p), static_cast<JB_IlValue *>(args[3].p));
+}
+
+static void thunk_JB_IlBuilder_IfCmpLessOrEqual(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_IfCmpLessOrEqual(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlBuilder *>(args[1].p), static_cast<JB_IlValue *>(args[2].p), static_cast<JB_IlValue *>(args[3].p));
+}
+
+static void thunk_JB_IlBuilder_IfCmpLessOrEqualNew(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_IfCmpLessOrEqualNew(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlBuilder **>(args[1].p), static_cast<JB_IlValue *>(args[2].p), static_cast<JB_IlValue *>(args[3].p));
+}
+
+static void thunk_JB_IlBuilder_IfCmpLessThan(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_IfCmpLessThan(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlBuilder *>(args[1].p), static_cast<JB_IlValue *>(args[2].p), static_cast<JB_IlValue *>(args[3].p));
+}
+
+static void thunk_JB_IlBuilder_IfCmpLessThanNew(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_IfCmpLessThanNew(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlBuilder **>(args[1].p), static_cast<JB_IlValue *>(args[2].p), static_cast<JB_IlValue *>(args[3].p));
+}
+
+static void thunk_JB_IlBuilder_IfCmpGreaterOrEqual(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_IfCmpGreaterOrEqual(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlBuilder *>(args[1].p), static_cast<JB_IlValue *>(args[2].p), static_cast<JB_IlValue *>(args[3].p));
+}
+
+static void thunk_JB_IlBuilder_IfCmpGreaterOrEqualNew(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_IfCmpGreaterOrEqualNew(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlBuilder **>(args[1].p), static_cast<JB_IlValue *>(args[2].p), static_cast<JB_IlValue *>(args[3].p));
+}
+
+static void thunk_JB_IlBuilder_IfCmpGreaterThan(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_IfCmpGreaterThan(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlBuilder *>(args[1].p), static_cast<JB_IlValue *>(args[2].p), static_cast<JB_IlValue *>(args[3].p));
+}
+
+static void thunk_JB_IlBuilder_IfCmpGreaterThanNew(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_IfCmpGreaterThanNew(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlBuilder **>(args[1].p), static_cast<JB_IlValue *>(args[2].p), static_cast<JB_IlValue *>(args[3].p));
+}
+
+static void thunk_JB_IlBuilder_IfCmpNotEqual(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_IfCmpNotEqual(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlBuilder *>(args[1].p), static_cast<JB_IlValue *>(args[2].p), static_cast<JB_IlValue *>(args[3].p));
+}
+
+static void thunk_JB_IlBuilder_IfCmpNotEqualNew(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_IfCmpNotEqualNew(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlBuilder **>(args[1].p), static_cast<JB_IlValue *>(args[2].p), static_cast<JB_IlValue *>(args[3].p));
+}
+
+static void thunk_JB_IlBuilder_IfCmpUnsignedLessOrEqual(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_IfCmpUnsignedLessOrEqual(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlBuilder *>(args[1].p), static_cast<JB_IlValue *>(args[2].p), static_cast<JB_IlValue *>(args[3].p));
+}
+
+static void thunk_JB_IlBuilder_IfCmpUnsignedLessOrEqualNew(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_IfCmpUnsignedLessOrEqualNew(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlBuilder **>(args[1].p), static_cast<JB_IlValue *>(args[2].p), static_cast<JB_IlValue *>(args[3].p));
+}
+
+static void thunk_JB_IlBuilder_IfCmpUnsignedLessThan(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_IfCmpUnsignedLessThan(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlBuilder *>(args[1].p), static_cast<JB_IlValue *>(args[2].p), static_cast<JB_IlValue *>(args[3].p));
+}
+
+static void thunk_JB_IlBuilder_IfCmpUnsignedLessThanNew(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_IfCmpUnsignedLessThanNew(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlBuilder **>(args[1].p), static_cast<JB_IlValue *>(args[2].p), static_cast<JB_IlValue *>(args[3].p));
+}
+
+static void thunk_JB_IlBuilder_IfCmpUnsignedGreaterOrEqual(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_IfCmpUnsignedGreaterOrEqual(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlBuilder *>(args[1].p), static_cast<JB_IlValue *>(args[2].p), static_cast<JB_IlValue *>(args[3].p));
+}
+
+static void thunk_JB_IlBuilder_IfCmpUnsignedGreaterOrEqualNew(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_IfCmpUnsignedGreaterOrEqualNew(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlBuilder **>(args[1].p), static_cast<JB_IlValue *>(args[2].p), static_cast<JB_IlValue *>(args[3].p));
+}
+
+static void thunk_JB_IlBuilder_IfCmpUnsignedGreaterThan(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_IfCmpUnsignedGreaterThan(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlBuilder *>(args[1].p), static_cast<JB_IlValue *>(args[2].p), static_cast<JB_IlValue *>(args[3].p));
+}
+
+static void thunk_JB_IlBuilder_IfCmpUnsignedGreaterThanNew(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_IfCmpUnsignedGreaterThanNew(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlBuilder **>(args[1].p), static_cast<JB_IlValue *>(args[2].p), static_cast<JB_IlValue *>(args[3].p));
+}
+
+static void thunk_JB_IlBuilder_IfCmpEqualZero(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_IfCmpEqualZero(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlBuilder *>(args[1].p), static_cast<JB_IlValue *>(args[2].p));
+}
+
+static void thunk_JB_IlBuilder_IfCmpEqualZeroNew(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_IfCmpEqualZeroNew(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlBuilder **>(args[1].p), static_cast<JB_IlValue *>(args[2].p));
+}
+
+static void thunk_JB_IlBuilder_IfCmpNotEqualZero(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_IfCmpNotEqualZero(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlBuilder *>(args[1].p), static_cast<JB_IlValue *>(args[2].p));
+}
+
+static void thunk_JB_IlBuilder_IfCmpNotEqualZeroNew(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_IfCmpNotEqualZeroNew(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlBuilder **>(args[1].p), static_cast<JB_IlValue *>(args[2].p));
+}
+
+static void thunk_JB_IlBuilder_IfOrWithArgArray(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_IfOrWithArgArray(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlBuilder **>(args[1].p), static_cast<JB_IlBuilder **>(args[2].p), args[3].i32, static_cast<JB_IlBuilder_JBCondition **>(args[4].p));
+}
+
+static void thunk_JB_IlBuilder_IfThen(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_IfThen(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlBuilder **>(args[1].p), static_cast<JB_IlValue *>(args[2].p));
+}
+
+static void thunk_JB_IlBuilder_IfThenElse(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_IfThenElse(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlBuilder **>(args[1].p), static_cast<JB_IlBuilder **>(args[2].p), static_cast<JB_IlValue *>(args[3].p));
+}
+
+static void thunk_JB_IlBuilder_Select(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_Select(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlValue *>(args[1].p), static_cast<JB_IlValue *>(args[2].p), static_cast<JB_IlValue *>(args[3].p));
+}
+
+static void thunk_JB_IlBuilder_ForLoop(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_ForLoop(static_cast<JB_IlBuilder *>(args[0].p), args[1].b, args[2].str, static_cast<JB_IlBuilder **>(args[3].p), static_cast<JB_IlBuilder **>(args[4].p), static_cast<JB_IlBuilder **>(args[5].p), static_cast<JB_IlValue *>(args[6].p), static_cast<JB_IlValue *>(args[7].p), static_cast<JB_IlValue *>(args[8].p));
+}
+
+static void thunk_JB_IlBuilder_ForLoopDown(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_ForLoopDown(static_cast<JB_IlBuilder *>(args[0].p), args[1].str, static_cast<JB_IlBuilder **>(args[2].p), static_cast<JB_IlValue *>(args[3].p), static_cast<JB_IlValue *>(args[4].p), static_cast<JB_IlValue *>(args[5].p));
+}
+
+static void thunk_JB_IlBuilder_ForLoopUp(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_ForLoopUp(static_cast<JB_IlBuilder *>(args[0].p), args[1].str, static_cast<JB_IlBuilder **>(args[2].p), static_cast<JB_IlValue *>(args[3].p), static_cast<JB_IlValue *>(args[4].p), static_cast<JB_IlValue *>(args[5].p));
+}
+
+static void thunk_JB_IlBuilder_ForLoopWithBreak(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_ForLoopWithBreak(static_cast<JB_IlBuilder *>(args[0].p), args[1].b, args[2].str, static_cast<JB_IlBuilder **>(args[3].p), static_cast<JB_IlBuilder **>(args[4].p), static_cast<JB_IlValue *>(args[5].p), static_cast<JB_IlValue *>(args[6].p), static_cast<JB_IlValue *>(args[7].p));
+}
+
+static void thunk_JB_IlBuilder_ForLoopWithContinue(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_ForLoopWithContinue(static_cast<JB_IlBuilder *>(args[0].p), args[1].b, args[2].str, static_cast<JB_IlBuilder **>(args[3].p), static_cast<JB_IlBuilder **>(args[4].p), static_cast<JB_IlValue *>(args[5].p), static_cast<JB_IlValue *>(args[6].p), static_cast<JB_IlValue *>(args[7].p));
+}
+
+static void thunk_JB_IlBuilder_Return(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_Return(static_cast<JB_IlBuilder *>(args[0].p));
+}
+
+static void thunk_JB_IlBuilder_ReturnValue(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_ReturnValue(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlValue *>(args[1].p));
+}
+
+static void thunk_JB_IlBuilder_SwitchWithArgArray(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_SwitchWithArgArray(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlValue *>(args[1].p), static_cast<JB_IlBuilder **>(args[2].p), args[3].i32, static_cast<JB_IlBuilder_JBCase **>(args[4].p));
+}
+
+static void thunk_JB_IlBuilder_TableSwitchWithArgArray(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_TableSwitchWithArgArray(static_cast<JB_IlBuilder *>(args[0].p), static_cast<JB_IlValue *>(args[1].p), static_cast<JB_IlBuilder **>(args[2].p), args[3].b, args[4].i32, static_cast<JB_IlBuilder_JBCase **>(args[5].p));
+}
+
+static void thunk_JB_IlBuilder_MakeCase(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlBuilder_MakeCase(static_cast<JB_IlBuilder *>(args[0].p), args[1].i32, static_cast<JB_IlBuilder **>(args[2].p), args[3].i32);
+}
+
+static void thunk_JB_IlBuilder_WhileDoLoop(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_WhileDoLoop(static_cast<JB_IlBuilder *>(args[0].p), args[1].str, static_cast<JB_IlBuilder **>(args[2].p));
+}
+
+static void thunk_JB_IlBuilder_WhileDoLoopWithBreak(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_WhileDoLoopWithBreak(static_cast<JB_IlBuilder *>(args[0].p), args[1].str, static_cast<JB_IlBuilder **>(args[2].p), static_cast<JB_IlBuilder **>(args[3].p));
+}
+
+static void thunk_JB_IlBuilder_WhileDoLoopWithContinue(const JB_Value * args, JB_Value * result) {
+    JB_IlBuilder_WhileDoLoopWithContinue(static_cast<JB_IlBuilder *>(args[0].p), args[1].str, static_cast<JB_IlBuilder **>(args[2].p), static_cast<JB_IlBuilder **>(args[3].p));
+}
+
+static void thunk_JB_MethodBuilder_asIlBuilder(const JB_Value * args, JB_Value * result) {
+    result->p = JB_MethodBuilder_asIlBuilder(static_cast<JB_MethodBuilder *>(args[0].p));
+}
+
+static void thunk_JB_MethodBuilder_new_TypeDictionary(const JB_Value * args, JB_Value * result) {
+    result->p = JB_MethodBuilder_new_TypeDictionary(static_cast<JB_TypeDictionary *>(args[0].p));
+}
+
+static void thunk_JB_MethodBuilder_new_TypeDictionary_VirtualMachineState(const JB_Value * args, JB_Value * result) {
+    result->p = JB_MethodBuilder_new_TypeDictionary_VirtualMachineState(static_cast<JB_TypeDictionary *>(args[0].p), static_cast<JB_VirtualMachineState *>(args[1].p));
+}
+
+static void thunk_JB_MethodBuilder_new_MethodBuilder(const JB_Value * args, JB_Value * result) {
+    result->p = JB_MethodBuilder_new_MethodBuilder(static_cast<JB_MethodBuilder *>(args[0].p));
+}
+
+static void thunk_JB_MethodBuilder_new_MethodBuilder_VirtualMachineState(const JB_Value * args, JB_Value * result) {
+    result->p = JB_MethodBuilder_new_MethodBuilder_VirtualMachineState(static_cast<JB_MethodBuilder *>(args[0].p), static_cast<JB_VirtualMachineState *>(args[1].p));
+}
+
+static void thunk_JB_MethodBuilder_delete(const JB_Value * args, JB_Value * result) {
+    JB_MethodBuilder_delete(static_cast<JB_MethodBuilder *>(args[0].p));
+}
+
+static void thunk_JB_MethodBuilder_setClientCallback_RequestFunction(const JB_Value * args, JB_Value * result) {
+    JB_MethodBuilder_setClientCallback_RequestFunction(static_cast<JB_MethodBuilder *>(args[0].p), reinterpret_cast<JB_MethodBuilder_RequestFunctionCallback>(args[1].p));
+}
+
+static void thunk_JB_MethodBuilder_AllLocalsHaveBeenDefined(const JB_Value * args, JB_Value * result) {
+    JB_MethodBuilder_AllLocalsHaveBeenDefined(static_cast<JB_MethodBuilder *>(args[0].p));
+}
+
+static void thunk_JB_MethodBuilder_AppendBuilder(const JB_Value * args, JB_Value * result) {
+    JB_MethodBuilder_AppendBuilder(static_cast<JB_MethodBuilder *>(args[0].p), static_cast<JB_IlBuilder *>(args[1].p));
+}
+
+static void thunk_JB_MethodBuilder_AppendBuilder_BytecodeBuilder(const JB_Value * args, JB_Value * result) {
+    JB_MethodBuilder_AppendBuilder_BytecodeBuilder(static_cast<JB_MethodBuilder *>(args[0].p), static_cast<JB_BytecodeBuilder *>(args[1].p));
+}
+
+static void thunk_JB_MethodBuilder_AppendBytecodeBuilder(const JB_Value * args, JB_Value * result) {
+    JB_MethodBuilder_AppendBytecodeBuilder(static_cast<JB_MethodBuilder *>(args[0].p), static_cast<JB_BytecodeBuilder *>(args[1].p));
+}
+
+static void thunk_JB_MethodBuilder_DefineFile(const JB_Value * args, JB_Value * result) {
+    JB_MethodBuilder_DefineFile(static_cast<JB_MethodBuilder *>(args[0].p), args[1].cs);
+}
+
+static void thunk_JB_MethodBuilder_DefineLineString(const JB_Value * args, JB_Value * result) {
+    JB_MethodBuilder_DefineLineString(static_cast<JB_MethodBuilder *>(args[0].p), args[1].cs);
+}
+
+static void thunk_JB_MethodBuilder_DefineLineInteger(const JB_Value * args, JB_Value * result) {
+    JB_MethodBuilder_DefineLineInteger(static_cast<JB_MethodBuilder *>(args[0].p), args[1].i32);
+}
+
+static void thunk_JB_MethodBuilder_DefineName(const JB_Value * args, JB_Value * result) {
+    JB_MethodBuilder_DefineName(static_cast<JB_MethodBuilder *>(args[0].p), args[1].cs);
+}
+
+static void thunk_JB_MethodBuilder_DefineParameter(const JB_Value * args, JB_Value * result) {
+    JB_MethodBuilder_DefineParameter(static_cast<JB_MethodBuilder *>(args[0].p), args[1].cs, static_cast<JB_IlType *>(args[2].p));
+}
+
+static void thunk_JB_MethodBuilder_DefineArrayParameter(const JB_Value * args, JB_Value * result) {
+    JB_MethodBuilder_DefineArrayParameter(static_cast<JB_MethodBuilder *>(args[0].p), args[1].cs, static_cast<JB_IlType *>(args[2].p));
+}
+
+static void thunk_JB_MethodBuilder_DefineReturnType(const JB_Value * args, JB_Value * result) {
+    JB_MethodBuilder_DefineReturnType(static_cast<JB_MethodBuilder *>(args[0].p), static_cast<JB_IlType *>(args[1].p));
+}
+
+static void thunk_JB_MethodBuilder_DefineLocal(const JB_Value * args, JB_Value * result) {
+    JB_MethodBuilder_DefineLocal(static_cast<JB_MethodBuilder *>(args[0].p), args[1].cs, static_cast<JB_IlType *>(args[2].p));
+}
+
+static void thunk_JB_MethodBuilder_DefineGlobal(const JB_Value * args, JB_Value * result) {
+    JB_MethodBuilder_DefineGlobal(static_cast<JB_MethodBuilder *>(args[0].p), args[1].cs, static_cast<JB_IlType *>(args[2].p), args[3].p);
+}
+
+static void thunk_JB_MethodBuilder_DefineMemory(const JB_Value * args, JB_Value * result) {
+    JB_MethodBuilder_DefineMemory(static_cast<JB_MethodBuilder *>(args[0].p), args[1].cs, static_cast<JB_IlType *>(args[2].p), args[3].p);
+}
+
+static void thunk_JB_MethodBuilder_DefineFunction(const JB_Value * args, JB_Value * result) {
+    JB_MethodBuilder_DefineFunction(static_cast<JB_MethodBuilder *>(args[0].p), args[1].cs, args[2].cs, args[3].cs, args[4].p, static_cast<JB_IlType *>(args[5].p), args[6].i32, static_cast<JB_IlType **>(args[7].p));
+}
+
+static void thunk_JB_MethodBuilder_GetMethodName(const JB_Value * args, JB_Value * result) {
+    result->cs = JB_MethodBuilder_GetMethodName(static_cast<JB_MethodBuilder *>(args[0].p));
+}
+
+static void thunk_JB_MethodBuilder_GetNextBytecodeFromWorklist(const JB_Value * args, JB_Value * result) {
+    result->i32 = JB_MethodBuilder_GetNextBytecodeFromWorklist(static_cast<JB_MethodBuilder *>(args[0].p));
+}
+
+static void thunk_JB_MethodBuilder_setVMState(const JB_Value * args, JB_Value * result) {
+    JB_MethodBuilder_setVMState(static_cast<JB_MethodBuilder *>(args[0].p), static_cast<JB_VirtualMachineState *>(args[1].p));
+}
+
+static void thunk_JB_IlType_baseType(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlType_baseType(static_cast<JB_IlType *>(args[0].p));
+}
+
+static void thunk_JB_IlType_getName(const JB_Value * args, JB_Value * result) {
+    result->cs = JB_IlType_getName(static_cast<JB_IlType *>(args[0].p));
+}
+
+static void thunk_JB_IlType_primitiveType(const JB_Value * args, JB_Value * result) {
+    result->p = JB_IlType_primitiveType(static_cast<JB_IlType *>(args[0].p), static_cast<JB_TypeDictionary *>(args[1].p));
+}
+
+static void thunk_JB_IlType_getSize(const JB_Value * args, JB_Value * result) {
+    result->z = JB_IlType_getSize(static_cast<JB_IlType *>(args[0].p));
+}
+
+static void thunk_JB_IlType_isPointer(const JB_Value * args, JB_Value * result) {
+    result->b = JB_IlType_isPointer(static_cast<JB_IlType *>(args[0].p));
+}
+
+static void thunk_JB_IlValue_getID(const JB_Value * args, JB_Value * result) {
+    result->i32 = JB_IlValue_getID(static_cast<JB_IlValue *>(args[0].p));
+}
+
+static void thunk_JB_ThunkBuilder_asMethodBuilder(const JB_Value * args, JB_Value * result) {
+    result->p = JB_ThunkBuilder_asMethodBuilder(static_cast<JB_ThunkBuilder *>(args[0].p));
+}
+
+static void thunk_JB_ThunkBuilder_asIlBuilder(const JB_Value * args, JB_Value * result) {
+    result->p = JB_ThunkBuilder_asIlBuilder(static_cast<JB_ThunkBuilder *>(args[0].p));
+}
+
+static void thunk_JB_ThunkBuilder_new(const JB_Value * args, JB_Value * result) {
+    result->p = JB_ThunkBuilder_new(static_cast<JB_TypeDictionary *>(args[0].p), args[1].cs, static_cast<JB_IlType *>(args[2].p), args[3].u32, static_cast<JB_IlType **>(args[4].p));
+}
+
+static void thunk_JB_ThunkBuilder_delete(const JB_Value * args, JB_Value * result) {
+    JB_ThunkBuilder_delete(static_cast<JB_ThunkBuilder *>(args[0].p));
+}
+
+static void thunk_JB_TypeDictionary_new(const JB_Value * args, JB_Value * result) {
+    result->p = JB_TypeDictionary_new();
+}
+
+static void thunk_JB_TypeDictionary_delete(const JB_Value * args, JB_Value * result) {
+    JB_TypeDictionary_delete(static_cast<JB_TypeDictionary *>(args[0].p));
+}
+
+static void thunk_JB_TypeDictionary_getNoType(const JB_Value * args, JB_Value * result) {
+    result->p = JB_TypeDictionary_getNoType(static_cast<JB_TypeDictionary *>(args[0].p));
+}
+
+static void thunk_JB_TypeDictionary_getInt8(const JB_Value * args, JB_Value * result) {
+    result->p = JB_TypeDictionary_getInt8(static_cast<JB_TypeDictionary *>(args[0].p));
+}
+
+static void thunk_JB_TypeDictionary_getInt16(const JB_Value * args, JB_Value * result) {
+    result->p = JB_TypeDictionary_getInt16(static_cast<JB_TypeDictionary *>(args[0].p));
+}
+
+static void thunk_JB_TypeDictionary_getInt32(const JB_Value * args, JB_Value * result) {
+    result->p = JB_TypeDictionary_getInt32(static_cast<JB_TypeDictionary *>(args[0].p));
+}
+
+static void thunk_JB_TypeDictionary_getInt64(const JB_Value * args, JB_Value * result) {
+    result->p = JB_TypeDictionary_getInt64(static_cast<JB_TypeDictionary *>(args[0].p));
+}
+
+static void thunk_JB_TypeDictionary_getFloat(const JB_Value * args, JB_Value * result) {
+    result->p = JB_TypeDictionary_getFloat(static_cast<JB_TypeDictionary *>(args[0].p));
+}
+
+static void thunk_JB_TypeDictionary_getDouble(const JB_Value * args, JB_Value * result) {
+    result->p = JB_TypeDictionary_getDouble(static_cast<JB_TypeDictionary *>(args[0].p));
+}
+
+static void thunk_JB_TypeDictionary_getAddress(const JB_Value * args, JB_Value * result) {
+    result->p = JB_TypeDictionary_getAddress(static_cast<JB_TypeDictionary *>(args[0].p));
+}
+
+static void thunk_JB_TypeDictionary_getVectorInt8(const JB_Value * args, JB_Value * result) {
+    result->p = JB_TypeDictionary_getVectorInt8(static_cast<JB_TypeDictionary *>(args[0].p));
+}
+
+static void thunk_JB_TypeDictionary_getVectorInt16(const JB_Value * args, JB_Value * result) {
+    result->p = JB_TypeDictionary_getVectorInt16(static_cast<JB_TypeDictionary *>(args[0].p));
+}
+
+static void thunk_JB_TypeDictionary_getVectorInt32(const JB_Value * args, JB_Value * result) {
+    result->p = JB_TypeDictionary_getVectorInt32(static_cast<JB_TypeDictionary *>(args[0].p));
+}
+
+static void thunk_JB_TypeDictionary_getVectorInt64(const JB_Value * args, JB_Value * result) {
+    result->p = JB_TypeDictionary_getVectorInt64(static_cast<JB_TypeDictionary *>(args[0].p));
+}
+
+static void thunk_JB_TypeDictionary_getVectorFloat(const JB_Value * args, JB_Value * result) {
+    result->p = JB_TypeDictionary_getVectorFloat(static_cast<JB_TypeDictionary *>(args[0].p));
+}
+
+static void thunk_JB_TypeDictionary_getVectorDouble(const JB_Value * args, JB_Value * result) {
+    result->p = JB_TypeDictionary_getVectorDouble(static_cast<JB_TypeDictionary *>(args[0].p));
+}
+
+static void thunk_JB_TypeDictionary_getWord(const JB_Value * args, JB_Value * result) {
+    result->p = JB_TypeDictionary_getWord(static_cast<JB_TypeDictionary *>(args[0].p));
+}
+
+static void thunk_JB_TypeDictionary_getpNoType(const JB_Value * args, JB_Value * result) {
+    result->p = JB_TypeDictionary_getpNoType(static_cast<JB_TypeDictionary *>(args[0].p));
+}
+
+static void thunk_JB_TypeDictionary_getpInt8(const JB_Value * args, JB_Value * result) {
+    result->p = JB_TypeDictionary_getpInt8(static_cast<JB_TypeDictionary *>(args[0].p));
+}
+
+static void thunk_JB_TypeDictionary_getpInt16(const JB_Value * args, JB_Value * result) {
+    result->p = JB_TypeDictionary_getpInt16(static_cast<JB_TypeDictionary *>(args[0].p));
+}
+
+static void thunk_JB_TypeDictionary_getpInt32(const JB_Value * args, JB_Value * result) {
+    result->p = JB_TypeDictionary_getpInt32(static_cast<JB_TypeDictionary *>(args[0].p));
+}
+
+static void thunk_JB_TypeDictionary_getpInt64(const JB_Value * args, JB_Value * result) {
+    result->p = JB_TypeDictionary_getpInt64(static_cast<JB_TypeDictionary *>(args[0].p));
+}
+
+static void thunk_JB_TypeDictionary_getpFloat(const JB_Value * args, JB_Value * result) {
+    result->p = JB_TypeDictionary_getpFloat(static_cast<JB_TypeDictionary *>(args[0].p));
+}
+
+static void thunk_JB_TypeDictionary_getpDouble(const JB_Value * args, JB_Value * result) {
+    result->p = JB_TypeDictionary_getpDouble(static_cast<JB_TypeDictionary *>(args[0].p));
+}
+
+static void thunk_JB_TypeDictionary_getpAddress(const JB_Value * args, JB_Value * result) {
+    result->p = JB_TypeDictionary_getpAddress(static_cast<JB_TypeDictionary *>(args[0].p));
+}
+
+static void thunk_JB_TypeDictionary_getpVectorInt8(const JB_Value * args, JB_Value * result) {
+    result->p = JB_TypeDictionary_getpVectorInt8(static_cast<JB_TypeDictionary *>(args[0].p));
+}
+
+static void thunk_JB_TypeDictionary_getpVectorInt16(const JB_Value * args, JB_Value * result) {
+    result->p = JB_TypeDictionary_getpVectorInt16(static_cast<JB_TypeDictionary *>(args[0].p));
+}
+
+static void thunk_JB_TypeDictionary_getpVectorInt32(const JB_Value * args, JB_Value * result) {
+    result->p = JB_TypeDictionary_getpVectorInt32(static_cast<JB_TypeDictionary *>(args[0].p));
+}
+
+static void thunk_JB_TypeDictionary_getpVectorInt64(const JB_Value * args, JB_Value * result) {
+    result->p = JB_TypeDictionary_getpVectorInt64(static_cast<JB_TypeDictionary *>(args[0].p));
+}
+
+static void thunk_JB_TypeDictionary_getpVectorFloat(const JB_Value * args, JB_Value * result) {
+    result->p = JB_TypeDictionary_getpVectorFloat(static_cast<JB_TypeDictionary *>(args[0].p));
+}
+
+static void thunk_JB_TypeDictionary_getpVectorDouble(const JB_Value * args, JB_Value * result) {
+    result->p = JB_TypeDictionary_getpVectorDouble(static_cast<JB_TypeDictionary *>(args[0].p));
+}
+
+static void thunk_JB_TypeDictionary_getpWord(const JB_Value * args, JB_Value * result) {
+    result->p = JB_TypeDictionary_getpWord(static_cast<JB_TypeDictionary *>(args[0].p));
+}
+
+static void thunk_JB_TypeDictionary_CloseStruct(const JB_Value * args, JB_Value * result) {
+    JB_TypeDictionary_CloseStruct(static_cast<JB_TypeDictionary *>(args[0].p), args[1].cs);
+}
+
+static void thunk_JB_TypeDictionary_CloseStructWithSize(const JB_Value * args, JB_Value * result) {
+    JB_TypeDictionary_CloseStructWithSize(static_cast<JB_TypeDictionary *>(args[0].p), args[1].cs, args[2].z);
+}
+
+static void thunk_JB_TypeDictionary_CloseUnion(const JB_Value * args, JB_Value * result) {
+    JB_TypeDictionary_CloseUnion(static_cast<JB_TypeDictionary *>(args[0].p), args[1].cs);
+}
+
+static void thunk_JB_TypeDictionary_DefineField(const JB_Value * args, JB_Value * result) {
+    JB_TypeDictionary_DefineField(static_cast<JB_TypeDictionary *>(args[0].p), args[1].cs, args[2].cs, static_cast<JB_IlType *>(args[3].p));
+}
+
+static void thunk_JB_TypeDictionary_DefineFieldAtOffset(const JB_Value * args, JB_Value * result) {
+    JB_TypeDictionary_DefineFieldAtOffset(static_cast<JB_TypeDictionary *>(args[0].p), args[1].cs, args[2].cs, static_cast<JB_IlType *>(args[3].p), args[4].z);
+}
+
+static void thunk_JB_TypeDictionary_DefineStruct(const JB_Value * args, JB_Value * result) {
+    result->p = JB_TypeDictionary_DefineStruct(static_cast<JB_TypeDictionary *>(args[0].p), args[1].cs);
+}
+
+static void thunk_JB_TypeDictionary_DefineUnion(const JB_Value * args, JB_Value * result) {
+    result->p = JB_TypeDictionary_DefineUnion(static_cast<JB_TypeDictionary *>(args[0].p), args[1].cs);
+}
+
+static void thunk_JB_TypeDictionary_GetFieldType(const JB_Value * args, JB_Value * result) {
+    result->p = JB_TypeDictionary_GetFieldType(static_cast<JB_TypeDictionary *>(args[0].p), args[1].cs, args[2].cs);
+}
+
+static void thunk_JB_TypeDictionary_LookupStruct(const JB_Value * args, JB_Value * result) {
+    result->p = JB_TypeDictionary_LookupStruct(static_cast<JB_TypeDictionary *>(args[0].p), args[1].cs);
+}
+
+static void thunk_JB_TypeDictionary_LookupUnion(const JB_Value * args, JB_Value * result) {
+    result->p = JB_TypeDictionary_LookupUnion(static_cast<JB_TypeDictionary *>(args[0].p), args[1].cs);
+}
+
+static void thunk_JB_TypeDictionary_OffsetOf(const JB_Value * args, JB_Value * result) {
+    result->z = JB_TypeDictionary_OffsetOf(static_cast<JB_TypeDictionary *>(args[0].p), args[1].cs, args[2].cs);
+}
+
+static void thunk_JB_TypeDictionary_PointerTo(const JB_Value * args, JB_Value * result) {
+    result->p = JB_TypeDictionary_PointerTo(static_cast<JB_TypeDictionary *>(args[0].p), static_cast<JB_IlType *>(args[1].p));
+}
+
+static void thunk_JB_TypeDictionary_PointerToStructName(const JB_Value * args, JB_Value * result) {
+    result->p = JB_TypeDictionary_PointerToStructName(static_cast<JB_TypeDictionary *>(args[0].p), args[1].cs);
+}
+
+static void thunk_JB_TypeDictionary_UnionField(const JB_Value * args, JB_Value * result) {
+    JB_TypeDictionary_UnionField(static_cast<JB_TypeDictionary *>(args[0].p), args[1].cs, args[2].cs, static_cast<JB_IlType *>(args[3].p));
+}
+
+static void thunk_JB_TypeDictionary_UnionFieldType(const JB_Value * args, JB_Value * result) {
+    result->p = JB_TypeDictionary_UnionFieldType(static_cast<JB_TypeDictionary *>(args[0].p), args[1].cs, args[2].cs);
+}
+
+static void thunk_JB_VirtualMachineOperandArray_asVirtualMachineState(const JB_Value * args, JB_Value * result) {
+    result->p = JB_VirtualMachineOperandArray_asVirtualMachineState(static_cast<JB_VirtualMachineOperandArray *>(args[0].p));
+}
+
+static void thunk_JB_VirtualMachineOperandArray_new_MethodBuilder_int32_IlType_VirtualMachineRegister(const JB_Value * args, JB_Value * result) {
+    result->p = JB_VirtualMachineOperandArray_new_MethodBuilder_int32_IlType_VirtualMachineRegister(static_cast<JB_MethodBuilder *>(args[0].p), args[1].i32, static_cast<JB_IlType *>(args[2].p), static_cast<JB_VirtualMachineRegister *>(args[3].p));
+}
+
+static void thunk_JB_VirtualMachineOperandArray_new_VirtualMachineOperandArray(const JB_Value * args, JB_Value * result) {
+    result->p = JB_VirtualMachineOperandArray_new_VirtualMachineOperandArray(static_cast<JB_VirtualMachineOperandArray *>(args[0].p));
+}
+
+static void thunk_JB_VirtualMachineOperandArray_delete(const JB_Value * args, JB_Value * result) {
+    JB_VirtualMachineOperandArray_delete(static_cast<JB_VirtualMachineOperandArray *>(args[0].p));
+}
+
+static void thunk_JB_VirtualMachineOperandArray_setClientCallback_Commit(const JB_Value * args, JB_Value * result) {
+    JB_VirtualMachineOperandArray_setClientCallback_Commit(static_cast<JB_VirtualMachineOperandArray *>(args[0].p), reinterpret_cast<JB_VirtualMachineOperandArray_CommitCallback>(args[1].p));
+}
+
+static void thunk_JB_VirtualMachineOperandArray_setClientCallback_Reload(const JB_Value * args, JB_Value * result) {
+    JB_VirtualMachineOperandArray_setClientCallback_Reload(static_cast<JB_VirtualMachineOperandArray *>(args[0].p), reinterpret_cast<JB_VirtualMachineOperandArray_ReloadCallback>(args[1].p));
+}
+
+static void thunk_JB_VirtualMachineOperandArray_setClientCallback_MakeCopy(const JB_Value * args, JB_Value * result) {
+    JB_VirtualMachineOperandArray_setClientCallback_MakeCopy(static_cast<JB_VirtualMachineOperandArray *>(args[0].p), reinterpret_cast<JB_VirtualMachineOperandArray_MakeCopyCallback>(args[1].p));
+}
+
+static void thunk_JB_VirtualMachineOperandArray_setClientCallback_MergeInto(const JB_Value * args, JB_Value * result) {
+    JB_VirtualMachineOperandArray_setClientCallback_MergeInto(static_cast<JB_VirtualMachineOperandArray *>(args[0].p), reinterpret_cast<JB_VirtualMachineOperandArray_MergeIntoCallback>(args[1].p));
+}
+
+static void thunk_JB_VirtualMachineOperandArray_Get(const JB_Value * args, JB_Value * result) {
+    result->p = JB_VirtualMachineOperandArray_Get(static_cast<JB_VirtualMachineOperandArray *>(args[0].p), args[1].i32);
+}
+
+static void thunk_JB_VirtualMachineOperandArray_Move(const JB_Value * args, JB_Value * result) {
+    JB_VirtualMachineOperandArray_Move(static_cast<JB_VirtualMachineOperandArray *>(args[0].p), static_cast<JB_IlBuilder *>(args[1].p), args[2].i32, args[3].i32);
+}
+
+static void thunk_JB_VirtualMachineOperandArray_Set(const JB_Value * args, JB_Value * result) {
+    JB_VirtualMachineOperandArray_Set(static_cast<JB_VirtualMachineOperandArray *>(args[0].p), args[1].i32, static_cast<JB_IlValue *>(args[2].p));
+}
+
+static void thunk_JB_VirtualMachineOperandArray_UpdateArray(const JB_Value * args, JB_Value * result) {
+    JB_VirtualMachineOperandArray_UpdateArray(static_cast<JB_VirtualMachineOperandArray *>(args[0].p), static_cast<JB_IlBuilder *>(args[1].p), static_cast<JB_IlValue *>(args[2].p));
+}
+
+static void thunk_JB_VirtualMachineOperandStack_asVirtualMachineState(const JB_Value * args, JB_Value * result) {
+    result->p = JB_VirtualMachineOperandStack_asVirtualMachineState(static_cast<JB_VirtualMachineOperandStack *>(args[0].p));
+}
+
+static void thunk_JB_VirtualMachineOperandStack_new_MethodBuilder_int32_IlType_VirtualMachineRegister(const JB_Value * args, JB_Value * result) {
+    result->p = JB_VirtualMachineOperandStack_new_MethodBuilder_int32_IlType_VirtualMachineRegister(static_cast<JB_MethodBuilder *>(args[0].p), args[1].i32, static_cast<JB_IlType *>(args[2].p), static_cast<JB_VirtualMachineRegister *>(args[3].p));
+}
+
+static void thunk_JB_VirtualMachineOperandStack_new_MethodBuilder_int32_IlType_VirtualMachineRegister_boolean(const JB_Value * args, JB_Value * result) {
+    result->p = JB_VirtualMachineOperandStack_new_MethodBuilder_int32_IlType_VirtualMachineRegister_boolean(static_cast<JB_MethodBuilder *>(args[0].p), args[1].i32, static_cast<JB_IlType *>(args[2].p), static_cast<JB_VirtualMachineRegister *>(args[3].p), args[4].b);
+}
+
+static void thunk_JB_VirtualMachineOperandStack_new_MethodBuilder_int32_IlType_VirtualMachineRegister_boolean_int32(const JB_Value * args, JB_Value * result) {
+    result->p = JB_VirtualMachineOperandStack_new_MethodBuilder_int32_IlType_VirtualMachineRegister_boolean_int32(static_cast<JB_MethodBuilder *>(args[0].p), args[1].i32, static_cast<JB_IlType *>(args[2].p), static_cast<JB_VirtualMachineRegister *>(args[3].p), args[4].b, args[5].i32);
+}
+
+static void thunk_JB_VirtualMachineOperandStack_delete(const JB_Value * args, JB_Value * result) {
+    JB_VirtualMachineOperandStack_delete(static_cast<JB_VirtualMachineOperandStack *>(args[0].p));
+}
+
+static void thunk_JB_VirtualMachineOperandStack_setClientCallback_Commit(const JB_Value * args, JB_Value * result) {
+    JB_VirtualMachineOperandStack_setClientCallback_Commit(static_cast<JB_VirtualMachineOperandStack *>(args[0].p), reinterpret_cast<JB_VirtualMachineOperandStack_CommitCallback>(args[1].p));
+}
+
+static void thunk_JB_VirtualMachineOperandStack_setClientCallback_Reload(const JB_Value * args, JB_Value * result) {
+    JB_VirtualMachineOperandStack_setClientCallback_Reload(static_cast<JB_VirtualMachineOperandStack *>(args[0].p), reinterpret_cast<JB_VirtualMachineOperandStack_ReloadCallback>(args[1].p));
+}
+
+static void thunk_JB_VirtualMachineOperandStack_setClientCallback_MakeCopy(const JB_Value * args, JB_Value * result) {
+    JB_VirtualMachineOperandStack_setClientCallback_MakeCopy(static_cast<JB_VirtualMachineOperandStack *>(args[0].p), reinterpret_cast<JB_VirtualMachineOperandStack_MakeCopyCallback>(args[1].p));
+}
+
+static void thunk_JB_VirtualMachineOperandStack_setClientCallback_MergeInto(const JB_Value * args, JB_Value * result) {
+    JB_VirtualMachineOperandStack_setClientCallback_MergeInto(static_cast<JB_VirtualMachineOperandStack *>(args[0].p), reinterpret_cast<JB_VirtualMachineOperandStack_MergeIntoCallback>(args[1].p));
+}
+
+static void thunk_JB_VirtualMachineOperandStack_Drop(const JB_Value * args, JB_Value * result) {
+    JB_VirtualMachineOperandStack_Drop(static_cast<JB_VirtualMachineOperandStack *>(args[0].p), static_cast<JB_IlBuilder *>(args[1].p), args[2].i32);
+}
+
+static void thunk_JB_VirtualMachineOperandStack_Dup(const JB_Value * args, JB_Value * result) {
+    JB_VirtualMachineOperandStack_Dup(static_cast<JB_VirtualMachineOperandStack *>(args[0].p), static_cast<JB_IlBuilder *>(args[1].p));
+}
+
+static void thunk_JB_VirtualMachineOperandStack_Pick(const JB_Value * args, JB_Value * result) {
+    result->p = JB_VirtualMachineOperandStack_Pick(static_cast<JB_VirtualMachineOperandStack *>(args[0].p), args[1].i32);
+}
+
+static void thunk_JB_VirtualMachineOperandStack_Pop(const JB_Value * args, JB_Value * result) {
+    result->p = JB_VirtualMachineOperandStack_Pop(static_cast<JB_VirtualMachineOperandStack *>(args[0].p), static_cast<JB_IlBuilder *>(args[1].p));
+}
+
+static void thunk_JB_VirtualMachineOperandStack_Push(const JB_Value * args, JB_Value * result) {
+    JB_VirtualMachineOperandStack_Push(static_cast<JB_VirtualMachineOperandStack *>(args[0].p), static_cast<JB_IlBuilder *>(args[1].p), static_cast<JB_IlValue *>(args[2].p));
+}
+
+static void thunk_JB_VirtualMachineOperandStack_Top(const JB_Value * args, JB_Value * result) {
+    result->p = JB_VirtualMachineOperandStack_Top(static_cast<JB_VirtualMachineOperandStack *>(args[0].p));
+}
+
+static void thunk_JB_VirtualMachineOperandStack_UpdateStack(const JB_Value * args, JB_Value * result) {
+    JB_VirtualMachineOperandStack_UpdateStack(static_cast<JB_VirtualMachineOperandStack *>(args[0].p), static_cast<JB_IlBuilder *>(args[1].p), static_cast<JB_IlValue *>(args[2].p));
+}
+
+static void thunk_JB_VirtualMachineRegister_asVirtualMachineState(const JB_Value * args, JB_Value * result) {
+    result->p = JB_VirtualMachineRegister_asVirtualMachineState(static_cast<JB_VirtualMachineRegister *>(args[0].p));
+}
+
+static void thunk_JB_VirtualMachineRegister_new(const JB_Value * args, JB_Value * result) {
+    result->p = JB_VirtualMachineRegister_new(static_cast<JB_IlBuilder *>(args[0].p), args[1].cs, static_cast<JB_IlType *>(args[2].p), args[3].u32, static_cast<JB_IlValue *>(args[4].p));
+}
+
+static void thunk_JB_VirtualMachineRegister_delete(const JB_Value * args, JB_Value * result) {
+    JB_VirtualMachineRegister_delete(static_cast<JB_VirtualMachineRegister *>(args[0].p));
+}
+
+static void thunk_JB_VirtualMachineRegister_setClientCallback_Commit(const JB_Value * args, JB_Value * result) {
+    JB_VirtualMachineRegister_setClientCallback_Commit(static_cast<JB_VirtualMachineRegister *>(args[0].p), reinterpret_cast<JB_VirtualMachineRegister_CommitCallback>(args[1].p));
+}
+
+static void thunk_JB_VirtualMachineRegister_setClientCallback_Reload(const JB_Value * args, JB_Value * result) {
+    JB_VirtualMachineRegister_setClientCallback_Reload(static_cast<JB_VirtualMachineRegister *>(args[0].p), reinterpret_cast<JB_VirtualMachineRegister_ReloadCallback>(args[1].p));
+}
+
+static void thunk_JB_VirtualMachineRegister_setClientCallback_MakeCopy(const JB_Value * args, JB_Value * result) {
+    JB_VirtualMachineRegister_setClientCallback_MakeCopy(static_cast<JB_VirtualMachineRegister *>(args[0].p), reinterpret_cast<JB_VirtualMachineRegister_MakeCopyCallback>(args[1].p));
+}
+
+static void thunk_JB_VirtualMachineRegister_Adjust(const JB_Value * args, JB_Value * result) {
+    JB_VirtualMachineRegister_Adjust(static_cast<JB_VirtualMachineRegister *>(args[0].p), static_cast<JB_IlBuilder *>(args[1].p), static_cast<JB_IlValue *>(args[2].p));
+}
+
+static void thunk_JB_VirtualMachineRegister_AdjustByConst(const JB_Value * args, JB_Value * result) {
+    JB_VirtualMachineRegister_AdjustByConst(static_cast<JB_VirtualMachineRegister *>(args[0].p), static_cast<JB_IlBuilder *>(args[1].p), args[2].z);
+}
+
+static void thunk_JB_VirtualMachineRegister_Load(const JB_Value * args, JB_Value * result) {
+    result->p = JB_VirtualMachineRegister_Load(static_cast<JB_VirtualMachineRegister *>(args[0].p), static_cast<JB_IlBuilder *>(args[1].p));
+}
+
+static void thunk_JB_VirtualMachineRegister_Store(const JB_Value * args, JB_Value * result) {
+    JB_VirtualMachineRegister_Store(static_cast<JB_VirtualMachineRegister *>(args[0].p), static_cast<JB_IlBuilder *>(args[1].p), static_cast<JB_IlValue *>(args[2].p));
+}
+
+static void thunk_JB_VirtualMachineRegisterInStruct_asVirtualMachineRegister(const JB_Value * args, JB_Value * result) {
+    result->p = JB_VirtualMachineRegisterInStruct_asVirtualMachineRegister(static_cast<JB_VirtualMachineRegisterInStruct *>(args[0].p));
+}
+
+static void thunk_JB_VirtualMachineRegisterInStruct_asVirtualMachineState(const JB_Value * args, JB_Value * result) {
+    result->p = JB_VirtualMachineRegisterInStruct_asVirtualMachineState(static_cast<JB_VirtualMachineRegisterInStruct *>(args[0].p));
+}
+
+static void thunk_JB_VirtualMachineRegisterInStruct_new(const JB_Value * args, JB_Value * result) {
+    result->p = JB_VirtualMachineRegisterInStruct_new(static_cast<JB_IlBuilder *>(args[0].p), args[1].cs, args[2].cs, args[3].cs, args[4].cs);
+}
+
+static void thunk_JB_VirtualMachineRegisterInStruct_delete(const JB_Value * args, JB_Value * result) {
+    JB_VirtualMachineRegisterInStruct_delete(static_cast<JB_VirtualMachineRegisterInStruct *>(args[0].p));
+}
+
+static void thunk_JB_VirtualMachineRegisterInStruct_setClientCallback_Commit(const JB_Value * args, JB_Value * result) {
+    JB_VirtualMachineRegisterInStruct_setClientCallback_Commit(static_cast<JB_VirtualMachineRegisterInStruct *>(args[0].p), reinterpret_cast<JB_VirtualMachineRegisterInStruct_CommitCallback>(args[1].p));
+}
+
+static void thunk_JB_VirtualMachineRegisterInStruct_setClientCallback_Reload(const JB_Value * args, JB_Value * result) {
+    JB_VirtualMachineRegisterInStruct_setClientCallback_Reload(static_cast<JB_VirtualMachineRegisterInStruct *>(args[0].p), reinterpret_cast<JB_VirtualMachineRegisterInStruct_ReloadCallback>(args[1].p));
+}
+
+static void thunk_JB_VirtualMachineRegisterInStruct_setClientCallback_MakeCopy(const JB_Value * args, JB_Value * result) {
+    JB_VirtualMachineRegisterInStruct_setClientCallback_MakeCopy(static_cast<JB_VirtualMachineRegisterInStruct *>(args[0].p), reinterpret_cast<JB_VirtualMachineRegisterInStruct_MakeCopyCallback>(args[1].p));
+}
+
+static void thunk_JB_VirtualMachineState_new(const JB_Value * args, JB_Value * result) {
+    result->p = JB_VirtualMachineState_new();
+}
+
+static void thunk_JB_VirtualMachineState_delete(const JB_Value * args, JB_Value * result) {
+    JB_VirtualMachineState_delete(static_cast<JB_VirtualMachineState *>(args[0].p));
+}
+
+static void thunk_JB_VirtualMachineState_setClientCallback_Commit(const JB_Value * args, JB_Value * result) {
+    JB_VirtualMachineState_setClientCallback_Commit(static_cast<JB_VirtualMachineState *>(args[0].p), reinterpret_cast<JB_VirtualMachineState_CommitCallback>(args[1].p));
+}
+
+static void thunk_JB_VirtualMachineState_setClientCallback_Reload(const JB_Value * args, JB_Value * result) {
+    JB_VirtualMachineState_setClientCallback_Reload(static_cast<JB_VirtualMachineState *>(args[0].p), reinterpret_cast<JB_VirtualMachineState_ReloadCallback>(args[1].p));
+}
+
+static void thunk_JB_VirtualMachineState_setClientCallback_MakeCopy(const JB_Value * args, JB_Value * result) {
+    JB_VirtualMachineState_setClientCallback_MakeCopy(static_cast<JB_VirtualMachineState *>(args[0].p), reinterpret_cast<JB_VirtualMachineState_MakeCopyCallback>(args[1].p));
+}
+
+static void thunk_JB_VirtualMachineState_setClientCallback_MergeInto(const JB_Value * args, JB_Value * result) {
+    JB_VirtualMachineState_setClientCallback_MergeInto(static_cast<JB_VirtualMachineState *>(args[0].p), reinterpret_cast<JB_VirtualMachineState_MergeIntoCallback>(args[1].p));
+}
+
+static void thunk_JB_initializeJit(const JB_Value * args, JB_Value * result) {
+    result->b = JB_initializeJit();
+}
+
+static void thunk_JB_initializeJitWithOptions(const JB_Value * args, JB_Value * result) {
+    result->b = JB_initializeJitWithOptions(args[0].str);
+}
+
+static void thunk_JB_compileMethodBuilder(const JB_Value * args, JB_Value * result) {
+    result->i32 = JB_compileMethodBuilder(static_cast<JB_MethodBuilder *>(args[0].p), static_cast<void **>(args[1].p));
+}
+
+static void thunk_JB_shutdownJit(const JB_Value * args, JB_Value * result) {
+    JB_shutdownJit();
+}
+
+// the displacement of each bucket of the perfect hash
+static const uint32_t displacements[154] = {
+    9, 4, 2, 3, 12, 0, 1, 8, 4, 6, 0, 0,
+    1, 3, 10, 17, 0, 2, 2, 16, 1, 1, 22, 25,
+    5, 1, 7, 2, 4, 3, 18, 2, 0, 9, 2, 1,
+    0, 4, 2, 5, 2, 0, 11, 12, 3, 9, 8, 1,
+    12, 24, 51, 0, 1, 7, 6, 1, 2, 54, 1, 2,
+    4, 0, 2, 20, 4, 17, 2, 2, 13, 0, 5, 18,
+    58, 32, 25, 2, 2, 0, 42, 2, 35, 0, 20, 4,
+    5, 21, 3, 4, 14, 0, 22, 4, 0, 32, 0, 0,
+    6, 24, 26, 78, 2, 1, 46, 2, 12, 13, 2, 9,
+    1, 16, 8, 0, 4, 3, 2, 0, 7, 21, 3, 4,
+    32, 17, 124, 91, 6, 17, 1, 12, 4, 0, 58, 1,
+    0, 2, 2, 13, 1, 4, 78, 3, 2, 61, 5, 112,
+    47, 67, 3, 8, 239, 45, 0, 1, 412, 15,
+};
+
+static const JB_DispatchEntry entries[308] = {
+    { "IlBuilder.VectorStore", 21, 3, "v:oSo", thunk_JB_IlBuilder_VectorStore },
+    { "TypeDictionary.CloseStruct", 26, 2, "v:os", thunk_JB_TypeDictionary_CloseStruct },
+    { "MethodBuilder.setClientCallback_RequestFunction", 47, 2, "v:op", thunk_JB_MethodBuilder_setClientCallback_RequestFunction },
+    { "VirtualMachineOperandStack.UpdateStack", 38, 3, "v:ooo", thunk_JB_VirtualMachineOperandStack_UpdateStack },
+    { "IlBuilder.And", 13, 3, "o:ooo", thunk_JB_IlBuilder_And },
+    { "IlBuilder.Goto", 14, 2, "v:oo", thunk_JB_IlBuilder_Goto },
+    { "BytecodeBuilder.asIlBuilder", 27, 1, "o:o", thunk_JB_BytecodeBuilder_asIlBuilder },
+    { "MethodBuilder.setVMState", 24, 2, "v:oo", thunk_JB_MethodBuilder_setVMState },
+    { "IlBuilder.CallMethodBuilder", 27, 4, "o:ooi[o", thunk_JB_IlBuilder_CallMethodBuilder },
+    { "initializeJitWithOptions", 24, 1, "b:S", thunk_JB_initializeJitWithOptions },
+    { "IlType.baseType", 15, 1, "o:o", thunk_JB_IlType_baseType },
+    { "JBCase.delete", 13, 1, "v:o", thunk_JB_IlBuilder_JBCase_delete },
+    { "TypeDictionary.getFloat", 23, 1, "o:o", thunk_JB_TypeDictionary_getFloat },
+    { "TypeDictionary.getInt64", 23, 1, "o:o", thunk_JB_TypeDictionary_getInt64 },
+    { "VirtualMachineState.delete", 26, 1, "v:o", thunk_JB_VirtualMachineState_delete },
+    { "IlBuilder.UnsignedConvertTo", 27, 3, "o:ooo", thunk_JB_IlBuilder_UnsignedConvertTo },
+    { "IlBuilder.EqualTo", 17, 3, "o:ooo", thunk_JB_IlBuilder_EqualTo },
+    { "VirtualMachineOperandStack.new_MethodBuilder_int32_IlType_VirtualMachineRegister_boolean", 88, 5, "o:oioob", thunk_JB_VirtualMachineOperandStack_new_MethodBuilder_int32_IlType_VirtualMachineRegister_boolean },
+    { "IlBuilder.SwitchWithArgArray", 28, 5, "v:oo&oi[o", thunk_JB_IlBuilder_SwitchWithArgArray },
+    { "IlBuilder.NotEqualTo", 20, 3, "o:ooo", thunk_JB_IlBuilder_NotEqualTo },
+    { "VirtualMachineRegisterInStruct.setClientCallback_MakeCopy", 57, 2, "v:op", thunk_JB_VirtualMachineRegisterInStruct_setClientCallback_MakeCopy },
+    { "MethodBuilder.GetMethodName", 27, 1, "s:o", thunk_JB_MethodBuilder_GetMethodName },
+    { "IlType.primitiveType", 20, 2, "o:oo", thunk_JB_IlType_primitiveType },
+    { "TypeDictionary.getDouble", 24, 1, "o:o", thunk_JB_TypeDictionary_getDouble },
+    { "compileMethodBuilder", 20, 2, "i:oP", thunk_JB_compileMethodBuilder },
+    { "IlBuilder.UnsignedGreaterThan", 29, 3, "o:ooo", thunk_JB_IlBuilder_UnsignedGreaterThan },
+    { "IlBuilder.IfCmpLessOrEqual", 26, 4, "v:oooo", thunk_JB_IlBuilder_IfCmpLessOrEqual },
+    { "IlBuilder.VectorStoreAt", 23, 3, "v:ooo", thunk_JB_IlBuilder_VectorStoreAt },
+    { "TypeDictionary.UnionField", 25, 4, "v:osso", thunk_JB_TypeDictionary_UnionField },
+    { "IlBuilder.IfCmpEqualZero", 24, 3, "v:ooo", thunk_JB_IlBuilder_IfCmpEqualZero },
+    { "VirtualMachineOperandArray.delete", 33, 1, "v:o", thunk_JB_VirtualMachineOperandArray_delete },
+    { "IlBuilder.CreateLocalArray", 26, 3, "o:oio", thunk_JB_IlBuilder_CreateLocalArray },
+    { "VirtualMachineOperandStack.setClientCallback_Commit", 51, 2, "v:op", thunk_JB_VirtualMachineOperandStack_setClientCallback_Commit },
+    { "IlBuilder.VectorLoadAt", 22, 3, "o:ooo", thunk_JB_IlBuilder_VectorLoadAt },
+    { "IlBuilder.ConstInt8", 19, 2, "o:oc", thunk_JB_IlBuilder_ConstInt8 },
+    { "IlBuilder.ShiftR", 16, 3, "o:ooo", thunk_JB_IlBuilder_ShiftR },
+    { "BytecodeBuilder.IfCmpEqualZero", 30, 3, "v:ooo", thunk_JB_BytecodeBuilder_IfCmpEqualZero },
+    { "TypeDictionary.LookupUnion", 26, 2, "o:os", thunk_JB_TypeDictionary_LookupUnion },
+    { "VirtualMachineState.setClientCallback_MakeCopy", 46, 2, "v:op", thunk_JB_VirtualMachineState_setClientCallback_MakeCopy },
+    { "IlBuilder.IfCmpEqualZeroNew", 27, 3, "v:o&oo", thunk_JB_IlBuilder_IfCmpEqualZeroNew },
+    { "BytecodeBuilder.name", 20, 1, "S:o", thunk_JB_BytecodeBuilder_name },
+    { "BytecodeBuilder.IfCmpUnsignedGreaterThan", 40, 4, "v:oooo", thunk_JB_BytecodeBuilder_IfCmpUnsignedGreaterThan },
+    { "IlBuilder.UnionFieldInstanceAddress", 35, 4, "o:osso", thunk_JB_IlBuilder_UnionFieldInstanceAddress },
+    { "IlBuilder.getAddress", 20, 1, "o:o", thunk_JB_IlBuilder_getAddress },
+    { "TypeDictionary.getpVectorInt16", 30, 1, "o:o", thunk_JB_TypeDictionary_getpVectorInt16 },
+    { "VirtualMachineOperandStack.Drop", 31, 3, "v:ooi", thunk_JB_VirtualMachineOperandStack_Drop },
+    { "VirtualMachineRegister.Adjust", 29, 3, "v:ooo", thunk_JB_VirtualMachineRegister_Adjust },
+    { "MethodBuilder.new_TypeDictionary", 32, 1, "o:o", thunk_JB_MethodBuilder_new_TypeDictionary },
+    { "IlBuilder.GreaterThan", 21, 3, "o:ooo", thunk_JB_IlBuilder_GreaterThan },
+    { "BytecodeBuilder.IfCmpEqualZeroNew", 33, 3, "v:o&oo", thunk_JB_BytecodeBuilder_IfCmpEqualZeroNew },
+    { "VirtualMachineOperandStack.asVirtualMachineState", 48, 1, "o:o", thunk_JB_VirtualMachineOperandStack_asVirtualMachineState },
+    { "VirtualMachineOperandStack.Pop", 30, 2, "o:oo", thunk_JB_VirtualMachineOperandStack_Pop },
+    { "IlBuilder.IfCmpLessThan", 23, 4, "v:oooo", thunk_JB_IlBuilder_IfCmpLessThan },
+    { "VirtualMachineOperandStack.setClientCallback_Reload", 51, 2, "v:op", thunk_JB_VirtualMachineOperandStack_setClientCallback_Reload },
+    { "IlBuilder.Negate", 16, 2, "o:oo", thunk_JB_IlBuilder_Negate },
+    { "MethodBuilder.DefineParameter", 29, 3, "v:oso", thunk_JB_MethodBuilder_DefineParameter },
+    { "MethodBuilder.asIlBuilder", 25, 1, "o:o", thunk_JB_MethodBuilder_asIlBuilder },
+    { "IlBuilder.IfOrWithArgArray", 26, 5, "v:o&o&oi[o", thunk_JB_IlBuilder_IfOrWithArgArray },
+    { "IlBuilder.getVectorInt32", 24, 1, "o:o", thunk_JB_IlBuilder_getVectorInt32 },
+    { "IlBuilder.IfCmpUnsignedGreaterThanNew", 37, 4, "v:o&ooo", thunk_JB_IlBuilder_IfCmpUnsignedGreaterThanNew },
+    { "BytecodeBuilder.IfCmpLessThan", 29, 4, "v:oooo", thunk_JB_BytecodeBuilder_IfCmpLessThan },
+    { "ThunkBuilder.asMethodBuilder", 28, 1, "o:o", thunk_JB_ThunkBuilder_asMethodBuilder },
+    { "TypeDictionary.DefineFieldAtOffset", 34, 5, "v:ossoz", thunk_JB_TypeDictionary_DefineFieldAtOffset },
+    { "MethodBuilder.DefineReturnType", 30, 2, "v:oo", thunk_JB_MethodBuilder_DefineReturnType },
+    { "TypeDictionary.getVectorDouble", 30, 1, "o:o", thunk_JB_TypeDictionary_getVectorDouble },
+    { "IlBuilder.Rem", 13, 3, "o:ooo", thunk_JB_IlBuilder_Rem },
+    { "VirtualMachineRegister.setClientCallback_Reload", 47, 2, "v:op", thunk_JB_VirtualMachineRegister_setClientCallback_Reload },
+    { "IlBuilder.IfCmpUnsignedLessOrEqualNew", 37, 4, "v:o&ooo", thunk_JB_IlBuilder_IfCmpUnsignedLessOrEqualNew },
+    { "TypeDictionary.getAddress", 25, 1, "o:o", thunk_JB_TypeDictionary_getAddress },
+    { "BytecodeBuilder.vmState", 23, 1, "o:o", thunk_JB_BytecodeBuilder_vmState },
+    { "IlBuilder.NullAddress", 21, 1, "o:o", thunk_JB_IlBuilder_NullAddress },
+    { "IlBuilder.Add", 13, 3, "o:ooo", thunk_JB_IlBuilder_Add },
+    { "TypeDictionary.getVectorFloat", 29, 1, "o:o", thunk_JB_TypeDictionary_getVectorFloat },
+    { "IlBuilder.ConvertBitsTo", 23, 3, "o:ooo", thunk_JB_IlBuilder_ConvertBitsTo },
+    { "IlBuilder.Transaction", 21, 4, "v:o&o&o&o", thunk_JB_IlBuilder_Transaction },
+    { "TypeDictionary.GetFieldType", 27, 3, "o:oss", thunk_JB_TypeDictionary_GetFieldType },
+    { "IlBuilder.getDouble", 19, 1, "o:o", thunk_JB_IlBuilder_getDouble },
+    { "VirtualMachineOperandArray.new_VirtualMachineOperandArray", 57, 1, "o:o", thunk_JB_VirtualMachineOperandArray_new_VirtualMachineOperandArray },
+    { "TypeDictionary.getVectorInt8", 28, 1, "o:o", thunk_JB_TypeDictionary_getVectorInt8 },
+    { "IlBuilder.getVectorInt8", 23, 1, "o:o", thunk_JB_IlBuilder_getVectorInt8 },
+    { "IlBuilder.CreateLocalStruct", 27, 2, "o:oo", thunk_JB_IlBuilder_CreateLocalStruct },
+    { "TypeDictionary.getpDouble", 25, 1, "o:o", thunk_JB_TypeDictionary_getpDouble },
+    { "IlValue.getID", 13, 1, "i:o", thunk_JB_IlValue_getID },
+    { "IlBuilder.UnsignedGreaterOrEqualTo", 34, 3, "o:ooo", thunk_JB_IlBuilder_UnsignedGreaterOrEqualTo },
+    { "IlBuilder.getVectorInt16", 24, 1, "o:o", thunk_JB_IlBuilder_getVectorInt16 },
+    { "VirtualMachineState.setClientCallback_Reload", 44, 2, "v:op", thunk_JB_VirtualMachineState_setClientCallback_Reload },
+    { "IlBuilder.DoWhileLoopWithBreakAndContinue", 41, 5, "v:oS&o&o&o", thunk_JB_IlBuilder_DoWhileLoopWithBreakAndContinue },
+    { "VirtualMachineRegister.Load", 27, 2, "o:oo", thunk_JB_VirtualMachineRegister_Load },
+    { "MethodBuilder.DefineMemory", 26, 4, "v:osop", thunk_JB_MethodBuilder_DefineMemory },
+    { "TypeDictionary.getpVectorInt32", 30, 1, "o:o", thunk_JB_TypeDictionary_getpVectorInt32 },
+    { "BytecodeBuilder.AddSuccessorBuilder", 35, 2, "v:o&o", thunk_JB_BytecodeBuilder_AddSuccessorBuilder },
+    { "initializeJit", 13, 0, "b:", thunk_JB_initializeJit },
+    { "BytecodeBuilder.AddFallThroughBuilder", 37, 2, "v:oo", thunk_JB_BytecodeBuilder_AddFallThroughBuilder },
+    { "IlBuilder.Mul", 13, 3, "o:ooo", thunk_JB_IlBuilder_Mul },
+    { "TypeDictionary.getpInt8", 23, 1, "o:o", thunk_JB_TypeDictionary_getpInt8 },
+    { "VirtualMachineOperandArray.Get", 30, 2, "o:oi", thunk_JB_VirtualMachineOperandArray_Get },
+    { "IlBuilder.ReturnValue", 21, 2, "v:oo", thunk_JB_IlBuilder_ReturnValue },
+    { "IlBuilder.OrphanBytecodeBuilder", 31, 3, "o:oiS", thunk_JB_IlBuilder_OrphanBytecodeBuilder },
+    { "TypeDictionary.getpVectorDouble", 31, 1, "o:o", thunk_JB_TypeDictionary_getpVectorDouble },
+    { "VirtualMachineRegisterInStruct.asVirtualMachineState", 52, 1, "o:o", thunk_JB_VirtualMachineRegisterInStruct_asVirtualMachineState },
+    { "VirtualMachineRegisterInStruct.setClientCallback_Reload", 55, 2, "v:op", thunk_JB_VirtualMachineRegisterInStruct_setClientCallback_Reload },
+    { "IlBuilder.DoWhileLoopWithContinue", 33, 4, "v:oS&o&o", thunk_JB_IlBuilder_DoWhileLoopWithContinue },
+    { "BytecodeBuilder.IfCmpUnsignedLessOrEqual", 40, 4, "v:oooo", thunk_JB_BytecodeBuilder_IfCmpUnsignedLessOrEqual },
+    { "IlBuilder.IfCmpEqualNew", 23, 4, "v:o&ooo", thunk_JB_IlBuilder_IfCmpEqualNew },
+    { "IlBuilder.IfCmpNotEqualZero", 27, 3, "v:ooo", thunk_JB_IlBuilder_IfCmpNotEqualZero },
+    { "IlBuilder.IfThenElse", 20, 4, "v:o&o&oo", thunk_JB_IlBuilder_IfThenElse },
+    { "IlBuilder.ConstInteger", 22, 3, "o:ool", thunk_JB_IlBuilder_ConstInteger },
+    { "IlType.isPointer", 16, 1, "b:o", thunk_JB_IlType_isPointer },
+    { "TypeDictionary.getInt8", 22, 1, "o:o", thunk_JB_TypeDictionary_getInt8 },
+    { "IlBuilder.DoWhileLoopWithBreak", 30, 4, "v:oS&o&o", thunk_JB_IlBuilder_DoWhileLoopWithBreak },
+    { "IlType.getSize", 14, 1, "z:o", thunk_JB_IlType_getSize },
+    { "IlBuilder.LoadAt", 16, 3, "o:ooo", thunk_JB_IlBuilder_LoadAt },
+    { "BytecodeBuilder.GotoNew", 23, 2, "v:o&o", thunk_JB_BytecodeBuilder_GotoNew },
+    { "BytecodeBuilder.IfCmpEqualNew", 29, 4, "v:o&ooo", thunk_JB_BytecodeBuilder_IfCmpEqualNew },
+    { "IlBuilder.UnsignedRem", 21, 3, "o:ooo", thunk_JB_IlBuilder_UnsignedRem },
+    { "VirtualMachineOperandStack.new_MethodBuilder_int32_IlType_VirtualMachineRegister", 80, 4, "o:oioo", thunk_JB_VirtualMachineOperandStack_new_MethodBuilder_int32_IlType_VirtualMachineRegister },
+    { "IlBuilder.IfCmpNotEqualZeroNew", 30, 3, "v:o&oo", thunk_JB_IlBuilder_IfCmpNotEqualZeroNew },
+    { "IlBuilder.Return", 16, 1, "v:o", thunk_JB_IlBuilder_Return },
+    { "VirtualMachineOperandArray.setClientCallback_MergeInto", 54, 2, "v:op", thunk_JB_VirtualMachineOperandArray_setClientCallback_MergeInto },
+    { "VirtualMachineRegister.asVirtualMachineState", 44, 1, "o:o", thunk_JB_VirtualMachineRegister_asVirtualMachineState },
+    { "BytecodeBuilder.IfCmpUnsignedLessThan", 37, 4, "v:oooo", thunk_JB_BytecodeBuilder_IfCmpUnsignedLessThan },
+    { "JBCondition.delete", 18, 1, "v:o", thunk_JB_IlBuilder_JBCondition_delete },
+    { "MethodBuilder.DefineLocal", 25, 3, "v:oso", thunk_JB_MethodBuilder_DefineLocal },
+    { "IlBuilder.IfCmpUnsignedGreaterOrEqual", 37, 4, "v:oooo", thunk_JB_IlBuilder_IfCmpUnsignedGreaterOrEqual },
+    { "VirtualMachineOperandArray.UpdateArray", 38, 3, "v:ooo", thunk_JB_VirtualMachineOperandArray_UpdateArray },
+    { "VirtualMachineRegister.new", 26, 5, "o:osoIo", thunk_JB_VirtualMachineRegister_new },
+    { "BytecodeBuilder.IfCmpEqual", 26, 4, "v:oooo", thunk_JB_BytecodeBuilder_IfCmpEqual },
+    { "IlBuilder.IfCmpGreaterThan", 26, 4, "v:oooo", thunk_JB_IlBuilder_IfCmpGreaterThan },
+    { "VirtualMachineOperandStack.delete", 33, 1, "v:o", thunk_JB_VirtualMachineOperandStack_delete },
+    { "MethodBuilder.DefineFunction", 28, 8, "v:ossspoi[o", thunk_JB_MethodBuilder_DefineFunction },
+    { "IlBuilder.StoreAt", 17, 3, "v:ooo", thunk_JB_IlBuilder_StoreAt },
+    { "IlBuilder.ConstAddress", 22, 2, "o:op", thunk_JB_IlBuilder_ConstAddress },
+    { "IlBuilder.AddWithUnsignedOverflow", 33, 4, "o:o&ooo", thunk_JB_IlBuilder_AddWithUnsignedOverflow },
+    { "MethodBuilder.AllLocalsHaveBeenDefined", 38, 1, "v:o", thunk_JB_MethodBuilder_AllLocalsHaveBeenDefined },
+    { "IlBuilder.UnsignedDiv", 21, 3, "o:ooo", thunk_JB_IlBuilder_UnsignedDiv },
+    { "IlBuilder.DoWhileLoop", 21, 3, "v:oS&o", thunk_JB_IlBuilder_DoWhileLoop },
+    { "MethodBuilder.DefineLineString", 30, 2, "v:os", thunk_JB_MethodBuilder_DefineLineString },
+    { "IlBuilder.Div", 13, 3, "o:ooo", thunk_JB_IlBuilder_Div },
+    { "TypeDictionary.getpInt32", 24, 1, "o:o", thunk_JB_TypeDictionary_getpInt32 },
+    { "TypeDictionary.getpVectorInt8", 29, 1, "o:o", thunk_JB_TypeDictionary_getpVectorInt8 },
+    { "VirtualMachineOperandArray.new_MethodBuilder_int32_IlType_VirtualMachineRegister", 80, 4, "o:oioo", thunk_JB_VirtualMachineOperandArray_new_MethodBuilder_int32_IlType_VirtualMachineRegister },
+    { "IlBuilder.TransactionAbort", 26, 1, "v:o", thunk_JB_IlBuilder_TransactionAbort },
+    { "MethodBuilder.delete", 20, 1, "v:o", thunk_JB_MethodBuilder_delete },
+    { "VirtualMachineRegisterInStruct.asVirtualMachineRegister", 55, 1, "o:o", thunk_JB_VirtualMachineRegisterInStruct_asVirtualMachineRegister },
+    { "TypeDictionary.LookupStruct", 27, 2, "o:os", thunk_JB_TypeDictionary_LookupStruct },
+    { "IlBuilder.getVectorDouble", 25, 1, "o:o", thunk_JB_IlBuilder_getVectorDouble },
+    { "IlBuilder.MakeCondition", 23, 3, "o:ooo", thunk_JB_IlBuilder_MakeCondition },
+    { "TypeDictionary.PointerTo", 24, 2, "o:oo", thunk_JB_TypeDictionary_PointerTo },
+    { "IlBuilder.getNoType", 19, 1, "o:o", thunk_JB_IlBuilder_getNoType },
+    { "VirtualMachineOperandStack.setClientCallback_MergeInto", 54, 2, "v:op", thunk_JB_VirtualMachineOperandStack_setClientCallback_MergeInto },
+    { "VirtualMachineRegister.AdjustByConst", 36, 3, "v:ooz", thunk_JB_VirtualMachineRegister_AdjustByConst },
+    { "BytecodeBuilder.bcIndex", 23, 1, "i:o", thunk_JB_BytecodeBuilder_bcIndex },
+    { "IlBuilder.StructFieldInstanceAddress", 36, 4, "o:osso", thunk_JB_IlBuilder_StructFieldInstanceAddress },
+    { "IlBuilder.getVectorInt64", 24, 1, "o:o", thunk_JB_IlBuilder_getVectorInt64 },
+    { "VirtualMachineOperandStack.Dup", 30, 2, "v:oo", thunk_JB_VirtualMachineOperandStack_Dup },
+    { "shutdownJit", 11, 0, "v:", thunk_JB_shutdownJit },
+    { "ThunkBuilder.new", 16, 5, "o:osoI[o", thunk_JB_ThunkBuilder_new },
+    { "IlBuilder.GreaterOrEqualTo", 26, 3, "o:ooo", thunk_JB_IlBuilder_GreaterOrEqualTo },
+    { "VirtualMachineState.setClientCallback_MergeInto", 47, 2, "v:op", thunk_JB_VirtualMachineState_setClientCallback_MergeInto },
+    { "IlBuilder.ConstFloat", 20, 2, "o:of", thunk_JB_IlBuilder_ConstFloat },
+    { "VirtualMachineOperandStack.setClientCallback_MakeCopy", 53, 2, "v:op", thunk_JB_VirtualMachineOperandStack_setClientCallback_MakeCopy },
+    { "VirtualMachineRegister.setClientCallback_Commit", 47, 2, "v:op", thunk_JB_VirtualMachineRegister_setClientCallback_Commit },
+    { "TypeDictionary.getpVectorFloat", 30, 1, "o:o", thunk_JB_TypeDictionary_getpVectorFloat },
+    { "TypeDictionary.getpInt16", 24, 1, "o:o", thunk_JB_TypeDictionary_getpInt16 },
+    { "MethodBuilder.DefineGlobal", 26, 4, "v:osop", thunk_JB_MethodBuilder_DefineGlobal },
+    { "MethodBuilder.AppendBuilder_BytecodeBuilder", 43, 2, "v:oo", thunk_JB_MethodBuilder_AppendBuilder_BytecodeBuilder },
+    { "VirtualMachineState.setClientCallback_Commit", 44, 2, "v:op", thunk_JB_VirtualMachineState_setClientCallback_Commit },
+    { "BytecodeBuilder.IfCmpGreaterOrEqual", 35, 4, "v:oooo", thunk_JB_BytecodeBuilder_IfCmpGreaterOrEqual },
+    { "IlBuilder.AtomicAdd", 19, 3, "o:ooo", thunk_JB_IlBuilder_AtomicAdd },
+    { "TypeDictionary.delete", 21, 1, "v:o", thunk_JB_TypeDictionary_delete },
+    { "IlBuilder.VectorLoad", 20, 2, "o:oS", thunk_JB_IlBuilder_VectorLoad },
+    { "IlBuilder.Store", 15, 3, "v:oso", thunk_JB_IlBuilder_Store },
+    { "IlBuilder.IfCmpUnsignedLessThanNew", 34, 4, "v:o&ooo", thunk_JB_IlBuilder_IfCmpUnsignedLessThanNew },
+    { "JBCase.new", 10, 3, "o:ioi", thunk_JB_IlBuilder_JBCase_new },
+    { "IlBuilder.LoadIndirect", 22, 4, "o:osso", thunk_JB_IlBuilder_LoadIndirect },
+    { "IlBuilder.ConstInt32", 20, 2, "o:oi", thunk_JB_IlBuilder_ConstInt32 },
+    { "IlType.getName", 14, 1, "s:o", thunk_JB_IlType_getName },
+    { "BytecodeBuilder.IfCmpUnsignedGreaterOrEqual", 43, 4, "v:oooo", thunk_JB_BytecodeBuilder_IfCmpUnsignedGreaterOrEqual },
+    { "TypeDictionary.DefineStruct", 27, 2, "o:os", thunk_JB_TypeDictionary_DefineStruct },
+    { "IlBuilder.LessThan", 18, 3, "o:ooo", thunk_JB_IlBuilder_LessThan },
+    { "BytecodeBuilder.IfCmpLessOrEqual", 32, 4, "v:oooo", thunk_JB_BytecodeBuilder_IfCmpLessOrEqual },
+    { "IlBuilder.ForLoop", 17, 9, "v:obS&o&o&oooo", thunk_JB_IlBuilder_ForLoop },
+    { "BytecodeBuilder.IfCmpGreaterThanNew", 35, 4, "v:o&ooo", thunk_JB_BytecodeBuilder_IfCmpGreaterThanNew },
+    { "IlBuilder.IfCmpUnsignedGreaterThan", 34, 4, "v:oooo", thunk_JB_IlBuilder_IfCmpUnsignedGreaterThan },
+    { "IlBuilder.StoreIndirect", 23, 5, "v:ossoo", thunk_JB_IlBuilder_StoreIndirect },
+    { "IlBuilder.IfCmpUnsignedGreaterOrEqualNew", 40, 4, "v:o&ooo", thunk_JB_IlBuilder_IfCmpUnsignedGreaterOrEqualNew },
+    { "IlBuilder.Select", 16, 4, "o:oooo", thunk_JB_IlBuilder_Select },
+    { "IlBuilder.IfCmpUnsignedLessThan", 31, 4, "v:oooo", thunk_JB_IlBuilder_IfCmpUnsignedLessThan },
+    { "IlBuilder.GotoNew", 17, 2, "v:o&o", thunk_JB_IlBuilder_GotoNew },
+    { "IlBuilder.ForLoopWithContinue", 29, 8, "v:obS&o&oooo", thunk_JB_IlBuilder_ForLoopWithContinue },
+    { "IlBuilder.LessOrEqualTo", 23, 3, "o:ooo", thunk_JB_IlBuilder_LessOrEqualTo },
+    { "IlBuilder.WhileDoLoopWithContinue", 33, 4, "v:oS&o&o", thunk_JB_IlBuilder_WhileDoLoopWithContinue },
+    { "MethodBuilder.AppendBuilder", 27, 2, "v:oo", thunk_JB_MethodBuilder_AppendBuilder },
+    { "BytecodeBuilder.IfCmpNotEqual", 29, 4, "v:oooo", thunk_JB_BytecodeBuilder_IfCmpNotEqual },
+    { "IlBuilder.ShiftL", 16, 3, "o:ooo", thunk_JB_IlBuilder_ShiftL },
+    { "TypeDictionary.getpAddress", 26, 1, "o:o", thunk_JB_TypeDictionary_getpAddress },
+    { "BytecodeBuilder.IfCmpNotEqualZero", 33, 3, "v:ooo", thunk_JB_BytecodeBuilder_IfCmpNotEqualZero },
+    { "MethodBuilder.DefineArrayParameter", 34, 3, "v:oso", thunk_JB_MethodBuilder_DefineArrayParameter },
+    { "IlBuilder.setClientCallback_buildIL", 35, 2, "v:op", thunk_JB_IlBuilder_setClientCallback_buildIL },
+    { "IlBuilder.StoreOver", 19, 3, "v:ooo", thunk_JB_IlBuilder_StoreOver },
+    { "VirtualMachineOperandStack.Pick", 31, 2, "o:oi", thunk_JB_VirtualMachineOperandStack_Pick },
+    { "VirtualMachineOperandArray.setClientCallback_Commit", 51, 2, "v:op", thunk_JB_VirtualMachineOperandArray_setClientCallback_Commit },
+    { "TypeDictionary.getpInt64", 24, 1, "o:o", thunk_JB_TypeDictionary_getpInt64 },
+    { "TypeDictionary.getpFloat", 24, 1, "o:o", thunk_JB_TypeDictionary_getpFloat },
+    { "VirtualMachineOperandArray.asVirtualMachineState", 48, 1, "o:o", thunk_JB_VirtualMachineOperandArray_asVirtualMachineState },
+    { "IlBuilder.getFloat", 18, 1, "o:o", thunk_JB_IlBuilder_getFloat },
+    { "IlBuilder.Sub", 13, 3, "o:ooo", thunk_JB_IlBuilder_Sub },
+    { "IlBuilder.Load", 14, 2, "o:os", thunk_JB_IlBuilder_Load },
+    { "IlBuilder.ConstDouble", 21, 2, "o:od", thunk_JB_IlBuilder_ConstDouble },
+    { "TypeDictionary.getInt32", 23, 1, "o:o", thunk_JB_TypeDictionary_getInt32 },
+    { "IlBuilder.TableSwitchWithArgArray", 33, 6, "v:oo&obi[o", thunk_JB_IlBuilder_TableSwitchWithArgArray },
+    { "TypeDictionary.getVectorInt16", 29, 1, "o:o", thunk_JB_TypeDictionary_getVectorInt16 },
+    { "TypeDictionary.OffsetOf", 23, 3, "z:oss", thunk_JB_TypeDictionary_OffsetOf },
+    { "VirtualMachineRegister.Store", 28, 3, "v:ooo", thunk_JB_VirtualMachineRegister_Store },
+    { "IlBuilder.getInt32", 18, 1, "o:o", thunk_JB_IlBuilder_getInt32 },
+    { "IlBuilder.WhileDoLoopWithBreak", 30, 4, "v:oS&o&o", thunk_JB_IlBuilder_WhileDoLoopWithBreak },
+    { "BytecodeBuilder.IfCmpUnsignedLessOrEqualNew", 43, 4, "v:o&ooo", thunk_JB_BytecodeBuilder_IfCmpUnsignedLessOrEqualNew },
+    { "TypeDictionary.UnionFieldType", 29, 3, "o:oss", thunk_JB_TypeDictionary_UnionFieldType },
+    { "BytecodeBuilder.IfCmpGreaterOrEqualNew", 38, 4, "v:o&ooo", thunk_JB_BytecodeBuilder_IfCmpGreaterOrEqualNew },
+    { "VirtualMachineOperandStack.Push", 31, 3, "v:ooo", thunk_JB_VirtualMachineOperandStack_Push },
+    { "MethodBuilder.new_MethodBuilder", 31, 1, "o:o", thunk_JB_MethodBuilder_new_MethodBuilder },
+    { "IlBuilder.typeDictionary", 24, 1, "o:o", thunk_JB_IlBuilder_typeDictionary },
+    { "TypeDictionary.DefineField", 26, 4, "v:osso", thunk_JB_TypeDictionary_DefineField },
+    { "BytecodeBuilder.Goto", 20, 2, "v:oo", thunk_JB_BytecodeBuilder_Goto },
+    { "IlBuilder.IfAndWithArgArray", 27, 5, "v:o&o&oi[o", thunk_JB_IlBuilder_IfAndWithArgArray },
+    { "IlBuilder.UnsignedLessThan", 26, 3, "o:ooo", thunk_JB_IlBuilder_UnsignedLessThan },
+    { "IlBuilder.CallWithArgArray", 26, 4, "o:osi[o", thunk_JB_IlBuilder_CallWithArgArray },
+    { "TypeDictionary.getVectorInt64", 29, 1, "o:o", thunk_JB_TypeDictionary_getVectorInt64 },
+    { "BytecodeBuilder.IfCmpLessThanNew", 32, 4, "v:o&ooo", thunk_JB_BytecodeBuilder_IfCmpLessThanNew },
+    { "IlBuilder.UnsignedLessOrEqualTo", 31, 3, "o:ooo", thunk_JB_IlBuilder_UnsignedLessOrEqualTo },
+    { "VirtualMachineRegisterInStruct.setClientCallback_Commit", 55, 2, "v:op", thunk_JB_VirtualMachineRegisterInStruct_setClientCallback_Commit },
+    { "IlBuilder.IfCmpEqual", 20, 4, "v:oooo", thunk_JB_IlBuilder_IfCmpEqual },
+    { "IlBuilder.getInt16", 18, 1, "o:o", thunk_JB_IlBuilder_getInt16 },
+    { "IlBuilder.getWord", 17, 1, "o:o", thunk_JB_IlBuilder_getWord },
+    { "VirtualMachineRegister.delete", 29, 1, "v:o", thunk_JB_VirtualMachineRegister_delete },
+    { "VirtualMachineOperandArray.setClientCallback_MakeCopy", 53, 2, "v:op", thunk_JB_VirtualMachineOperandArray_setClientCallback_MakeCopy },
+    { "TypeDictionary.PointerToStructName", 34, 2, "o:os", thunk_JB_TypeDictionary_PointerToStructName },
+    { "IlBuilder.ForLoopDown", 21, 6, "v:oS&oooo", thunk_JB_IlBuilder_ForLoopDown },
+    { "IlBuilder.UnsignedShiftR", 24, 3, "o:ooo", thunk_JB_IlBuilder_UnsignedShiftR },
+    { "MethodBuilder.AppendBytecodeBuilder", 35, 2, "v:oo", thunk_JB_MethodBuilder_AppendBytecodeBuilder },
+    { "IlBuilder.ForLoopWithBreak", 26, 8, "v:obS&o&oooo", thunk_JB_IlBuilder_ForLoopWithBreak },
+    { "IlBuilder.ConstString", 21, 2, "o:oS", thunk_JB_IlBuilder_ConstString },
+    { "IlBuilder.WhileDoLoop", 21, 3, "v:oS&o", thunk_JB_IlBuilder_WhileDoLoop },
+    { "VirtualMachineState.new", 23, 0, "o:", thunk_JB_VirtualMachineState_new },
+    { "VirtualMachineOperandArray.setClientCallback_Reload", 51, 2, "v:op", thunk_JB_VirtualMachineOperandArray_setClientCallback_Reload },
+    { "JBCondition.new", 15, 2, "o:oo", thunk_JB_IlBuilder_JBCondition_new },
+    { "IlBuilder.ConvertTo", 19, 3, "o:ooo", thunk_JB_IlBuilder_ConvertTo },
+    { "TypeDictionary.new", 18, 0, "o:", thunk_JB_TypeDictionary_new },
+    { "TypeDictionary.DefineUnion", 26, 2, "o:os", thunk_JB_TypeDictionary_DefineUnion },
+    { "IlBuilder.IndexAt", 17, 4, "o:oooo", thunk_JB_IlBuilder_IndexAt },
+    { "IlBuilder.IfCmpLessOrEqualNew", 29, 4, "v:o&ooo", thunk_JB_IlBuilder_IfCmpLessOrEqualNew },
+    { "ThunkBuilder.asIlBuilder", 24, 1, "o:o", thunk_JB_ThunkBuilder_asIlBuilder },
+    { "BytecodeBuilder.IfCmpNotEqualZeroNew", 36, 3, "v:o&oo", thunk_JB_BytecodeBuilder_IfCmpNotEqualZeroNew },
+    { "IlBuilder.getInt64", 18, 1, "o:o", thunk_JB_IlBuilder_getInt64 },
+    { "TypeDictionary.getInt16", 23, 1, "o:o", thunk_JB_TypeDictionary_getInt16 },
+    { "VirtualMachineRegister.setClientCallback_MakeCopy", 49, 2, "v:op", thunk_JB_VirtualMachineRegister_setClientCallback_MakeCopy },
+    { "IlBuilder.IfCmpGreaterThanNew", 29, 4, "v:o&ooo", thunk_JB_IlBuilder_IfCmpGreaterThanNew },
+    { "BytecodeBuilder.IfCmpUnsignedGreaterOrEqualNew", 46, 4, "v:o&ooo", thunk_JB_BytecodeBuilder_IfCmpUnsignedGreaterOrEqualNew },
+    { "IlBuilder.Xor", 13, 3, "o:ooo", thunk_JB_IlBuilder_Xor },
+    { "IlBuilder.MulWithOverflow", 25, 4, "o:o&ooo", thunk_JB_IlBuilder_MulWithOverflow },
+    { "IlBuilder.getVectorFloat", 24, 1, "o:o", thunk_JB_IlBuilder_getVectorFloat },
+    { "TypeDictionary.getWord", 22, 1, "o:o", thunk_JB_TypeDictionary_getWord },
+    { "BytecodeBuilder.IfCmpUnsignedLessThanNew", 40, 4, "v:o&ooo", thunk_JB_BytecodeBuilder_IfCmpUnsignedLessThanNew },
+    { "IlBuilder.IfThen", 16, 3, "v:o&oo", thunk_JB_IlBuilder_IfThen },
+    { "IlBuilder.OrphanBuilder", 23, 1, "o:o", thunk_JB_IlBuilder_OrphanBuilder },
+    { "VirtualMachineRegisterInStruct.new", 34, 5, "o:ossss", thunk_JB_VirtualMachineRegisterInStruct_new },
+    { "IlBuilder.Copy", 14, 2, "o:oo", thunk_JB_IlBuilder_Copy },
+    { "BytecodeBuilder.AddSuccessorBuildersWithArgArray", 48, 3, "v:oI[o", thunk_JB_BytecodeBuilder_AddSuccessorBuildersWithArgArray },
+    { "IlBuilder.AppendBuilder", 23, 2, "v:oo", thunk_JB_IlBuilder_AppendBuilder },
+    { "VirtualMachineOperandArray.Set", 30, 3, "v:oio", thunk_JB_VirtualMachineOperandArray_Set },
+    { "BytecodeBuilder.IfCmpUnsignedGreaterThanNew", 43, 4, "v:o&ooo", thunk_JB_BytecodeBuilder_IfCmpUnsignedGreaterThanNew },
+    { "IlBuilder.IfCmpNotEqual", 23, 4, "v:oooo", thunk_JB_IlBuilder_IfCmpNotEqual },
+    { "TypeDictionary.CloseUnion", 25, 2, "v:os", thunk_JB_TypeDictionary_CloseUnion },
+    { "IlBuilder.SubWithOverflow", 25, 4, "o:o&ooo", thunk_JB_IlBuilder_SubWithOverflow },
+    { "VirtualMachineOperandStack.Top", 30, 1, "o:o", thunk_JB_VirtualMachineOperandStack_Top },
+    { "IlBuilder.getInt8", 17, 1, "o:o", thunk_JB_IlBuilder_getInt8 },
+    { "BytecodeBuilder.IfCmpNotEqualNew", 32, 4, "v:o&ooo", thunk_JB_BytecodeBuilder_IfCmpNotEqualNew },
+    { "IlBuilder.IfCmpUnsignedLessOrEqual", 34, 4, "v:oooo", thunk_JB_IlBuilder_IfCmpUnsignedLessOrEqual },
+    { "IlBuilder.MakeCase", 18, 4, "o:oi&oi", thunk_JB_IlBuilder_MakeCase },
+    { "TypeDictionary.CloseStructWithSize", 34, 3, "v:osz", thunk_JB_TypeDictionary_CloseStructWithSize },
+    { "TypeDictionary.getpWord", 23, 1, "o:o", thunk_JB_TypeDictionary_getpWord },
+    { "IlBuilder.ComputedCallWithArgArray", 34, 4, "o:oSi[o", thunk_JB_IlBuilder_ComputedCallWithArgArray },
+    { "BytecodeBuilder.IfCmpLessOrEqualNew", 35, 4, "v:o&ooo", thunk_JB_BytecodeBuilder_IfCmpLessOrEqualNew },
+    { "BytecodeBuilder.IfCmpGreaterThan", 32, 4, "v:oooo", thunk_JB_BytecodeBuilder_IfCmpGreaterThan },
+    { "VirtualMachineOperandArray.Move", 31, 4, "v:ooii", thunk_JB_VirtualMachineOperandArray_Move },
+    { "VirtualMachineOperandStack.new_MethodBuilder_int32_IlType_VirtualMachineRegister_boolean_int32", 94, 6, "o:oioobi", thunk_JB_VirtualMachineOperandStack_new_MethodBuilder_int32_IlType_VirtualMachineRegister_boolean_int32 },
+    { "IlBuilder.IfCmpNotEqualNew", 26, 4, "v:o&ooo", thunk_JB_IlBuilder_IfCmpNotEqualNew },
+    { "TypeDictionary.getNoType", 24, 1, "o:o", thunk_JB_TypeDictionary_getNoType },
+    { "VirtualMachineRegisterInStruct.delete", 37, 1, "v:o", thunk_JB_VirtualMachineRegisterInStruct_delete },
+    { "IlBuilder.Or", 12, 3, "o:ooo", thunk_JB_IlBuilder_Or },
+    { "IlBuilder.ForLoopUp", 19, 6, "v:oS&oooo", thunk_JB_IlBuilder_ForLoopUp },
+    { "IlBuilder.IfCmpLessThanNew", 26, 4, "v:o&ooo", thunk_JB_IlBuilder_IfCmpLessThanNew },
+    { "IlBuilder.ConstInt16", 20, 2, "o:oh", thunk_JB_IlBuilder_ConstInt16 },
+    { "IlBuilder.SubWithUnsignedOverflow", 33, 4, "o:o&ooo", thunk_JB_IlBuilder_SubWithUnsignedOverflow },
+    { "MethodBuilder.DefineName", 24, 2, "v:os", thunk_JB_MethodBuilder_DefineName },
+    { "MethodBuilder.DefineFile", 24, 2, "v:os", thunk_JB_MethodBuilder_DefineFile },
+    { "MethodBuilder.DefineLineInteger", 31, 2, "v:oi", thunk_JB_MethodBuilder_DefineLineInteger },
+    { "TypeDictionary.getpVectorInt64", 30, 1, "o:o", thunk_JB_TypeDictionary_getpVectorInt64 },
+    { "TypeDictionary.getpNoType", 25, 1, "o:o", thunk_JB_TypeDictionary_getpNoType },
+    { "IlBuilder.IfCmpGreaterOrEqual", 29, 4, "v:oooo", thunk_JB_IlBuilder_IfCmpGreaterOrEqual },
+    { "MethodBuilder.new_MethodBuilder_VirtualMachineState", 51, 2, "o:oo", thunk_JB_MethodBuilder_new_MethodBuilder_VirtualMachineState },
+    { "IlBuilder.AddWithOverflow", 25, 4, "o:o&ooo", thunk_JB_IlBuilder_AddWithOverflow },
+    { "TypeDictionary.getVectorInt32", 29, 1, "o:o", thunk_JB_TypeDictionary_getVectorInt32 },
+    { "MethodBuilder.new_TypeDictionary_VirtualMachineState", 52, 2, "o:oo", thunk_JB_MethodBuilder_new_TypeDictionary_VirtualMachineState },
+    { "IlBuilder.IfCmpGreaterOrEqualNew", 32, 4, "v:o&ooo", thunk_JB_IlBuilder_IfCmpGreaterOrEqualNew },
+    { "IlBuilder.ConstInt64", 20, 2, "o:ol", thunk_JB_IlBuilder_ConstInt64 },
+    { "MethodBuilder.GetNextBytecodeFromWorklist", 41, 1, "i:o", thunk_JB_MethodBuilder_GetNextBytecodeFromWorklist },
+    { "ThunkBuilder.delete", 19, 1, "v:o", thunk_JB_ThunkBuilder_delete },
+};
+
+static uint32_t hashName(uint32_t seed, const char * name, size_t length) {
+    uint32_t h = 0x811C9DC5u ^ seed;
+    for (size_t i = 0; i < length; i++) {
+        h = (h ^ static_cast<unsigned char>(name[i])) * 0x01000193u;
+    }
+    h ^= h >> 16;
+    h *= 0x85EBCA6Bu;
+    h ^= h >> 13;
+    h *= 0xC2B2AE35u;
+    h ^= h >> 16;
+    return h;
+}
+
+extern "C" {
+
+const JB_DispatchEntry * JB_lookupDispatchEntry(const char * name, size_t length) {
+    uint32_t d = displacements[hashName(0, name, length) % 154];
+    const JB_DispatchEntry * entry = &entries[hashName(d, name, length) % 308];
+    return entry->nameLength == length && memcmp(entry->name, name, length) == 0 ? entry : NULL;
+}
+
+const JB_DispatchEntry * JB_getDispatchEntries(size_t * count) {
+    *count = 308;
+    return entries;
+}
+
+} // extern "C"
@@ -0,0 +1,66 @@
+/*******************************************************************************
+ * Copyright (c) 2026, 2026 IBM Corp. and others
+ *
+ * This program and the accompanying materials are made available under
+ * the terms of the Eclipse Public License 2.0 which accompanies this
+ * distribution and is available at http://eclipse.org/legal/epl-2.0
+ * or the Apache License, Version 2.0 which accompanies this distribution
+ * and is available at https://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * This Source Code may also be made available under the following Secondary
+ * Licenses when the conditions for such availability set forth in the
+ * Eclipse Public License, v. 2.0 are satisfied: GNU General Public License,
+ * version 2 with the GNU Classpath Exception [1] and GNU General Public
+ * License, version 2 with the OpenJDK Assembly Exception [2].
+ *
+ * [1] https://www.gnu.org/software/classpath/license.html
+ * [2] http://openjdk.java.net/legal/assembly-exception.html
+ *
+ * SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+ *******************************************************************************/
+        
+#ifndef ProjectDISPATCH_INCL
+#define ProjectDISPATCH_INCL
+
+#include "ProjectC.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* a packed argument or result of a dispatched call */
+typedef union JB_Value {
+    bool b;
+    int8_t i8;
+    int16_t i16;
+    int32_t i32;
+    int64_t i64;
+    uint32_t u32;
+    size_t z;
+    float f;
+    double d;
+    void * p;
+    const char * cs;
+    char * str;
+} JB_Value;
+
+typedef void (*JB_Thunk)(const JB_Value * args, JB_Value * result);
+
+typedef struct JB_DispatchEntry {
+    const char * name;
+    uint32_t nameLength;
+    uint32_t arity;
+    const char * signature;
+    JB_Thunk thunk;
+} JB_DispatchEntry;
+
+/* returns the entry of a function given its name, or NULL if there is none */
+const JB_DispatchEntry * JB_lookupDispatchEntry(const char * name, size_t length);
+/* returns all the entries of the table, and their number in `count` */
+const JB_DispatchEntry * JB_getDispatchEntries(size_t * count);
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+
+#endif /* ProjectDISPATCH_INCL */
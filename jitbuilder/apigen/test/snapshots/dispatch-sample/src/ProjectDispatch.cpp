@@ -0,0 +1,124 @@
+/*******************************************************************************
+ * Copyright (c) 2026, 2026 IBM Corp. and others
+ *
+ * This program and the accompanying materials are made available under
+ * the terms of the Eclipse Public License 2.0 which accompanies this
+ * distribution and is available at http://eclipse.org/legal/epl-2.0
+ * or the Apache License, Version 2.0 which accompanies this distribution
+ * and is available at https://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * This Source Code may also be made available under the following Secondary
+ * Licenses when the conditions for such availability set forth in the
+ * Eclipse Public License, v. 2.0 are satisfied: GNU General Public License,
+ * version 2 with the GNU Classpath Exception [1] and GNU General Public
+ * License, version 2 with the OpenJDK Assembly Exception [2].
+ *
+ * [1] https://www.gnu.org/software/classpath/license.html
+ * [2] http://openjdk.java.net/legal/assembly-exception.html
+ *
+ * SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+ *******************************************************************************/
+        
+#include <string.h>
+#include "<output>/include/ProjectDispatch.h"
+
+static void thunk_JB_class_1_class_1_inner_class_1_new(const JB_Value * args, JB_Value * result) {
+    result->p = JB_class_1_class_1_inner_class_1_new();
+}
+
+static void thunk_JB_class_1_class_1_inner_class_1_delete(const JB_Value * args, JB_Value * result) {
+    JB_class_1_class_1_inner_class_1_delete(static_cast<JB_class_1_class_1_inner_class_1 *>(args[0].p));
+}
+
+static void thunk_JB_class_1_new(const JB_Value * args, JB_Value * result) {
+    result->p = JB_class_1_new();
+}
+
+static void thunk_JB_class_1_delete(const JB_Value * args, JB_Value * result) {
+    JB_class_1_delete(static_cast<JB_class_1 *>(args[0].p));
+}
+
+static void thunk_JB_class_1_getclass_1_field_1(const JB_Value * args, JB_Value * result) {
+    result->f = JB_class_1_getclass_1_field_1(static_cast<JB_class_1 *>(args[0].p));
+}
+
+static void thunk_JB_class_1_getclass_1_field_2(const JB_Value * args, JB_Value * result) {
+    result->d = JB_class_1_getclass_1_field_2(static_cast<JB_class_1 *>(args[0].p));
+}
+
+static void thunk_JB_class_1_setClientCallback_class_1_callback_1(const JB_Value * args, JB_Value * result) {
+    JB_class_1_setClientCallback_class_1_callback_1(static_cast<JB_class_1 *>(args[0].p), reinterpret_cast<JB_class_1_class_1_callback_1Callback>(args[1].p));
+}
+
+static void thunk_JB_class_1_class_1_service_1(const JB_Value * args, JB_Value * result) {
+    result->cs = JB_class_1_class_1_service_1(static_cast<JB_class_1 *>(args[0].p), args[1].cs);
+}
+
+static void thunk_JB_class_1_class_1_service_2overload(const JB_Value * args, JB_Value * result) {
+    JB_class_1_class_1_service_2overload(static_cast<JB_class_1 *>(args[0].p));
+}
+
+static void thunk_JB_class_2_asclass_1(const JB_Value * args, JB_Value * result) {
+    result->p = JB_class_2_asclass_1(static_cast<JB_class_2 *>(args[0].p));
+}
+
+static void thunk_JB_class_2_new(const JB_Value * args, JB_Value * result) {
+    result->p = JB_class_2_new();
+}
+
+static void thunk_JB_class_2_delete(const JB_Value * args, JB_Value * result) {
+    JB_class_2_delete(static_cast<JB_class_2 *>(args[0].p));
+}
+
+static void thunk_JB_Project_service_1(const JB_Value * args, JB_Value * result) {
+    JB_Project_service_1(args[0].i16, static_cast<void **>(args[1].p), static_cast<double*>(args[2].p));
+}
+
+// the displacement of each bucket of the perfect hash
+static const uint32_t displacements[7] = {
+    1, 10, 12, 1, 7, 0, 4,
+};
+
+static const JB_DispatchEntry entries[13] = {
+    { "class_2.asclass_1", 17, 1, "o:o", thunk_JB_class_2_asclass_1 },
+    { "class_1.delete", 14, 1, "v:o", thunk_JB_class_1_delete },
+    { "class_1.class_1_service_1", 25, 2, "s:os", thunk_JB_class_1_class_1_service_1 },
+    { "class_1.new", 11, 0, "o:", thunk_JB_class_1_new },
+    { "class_1.getclass_1_field_2", 26, 1, "d:o", thunk_JB_class_1_getclass_1_field_2 },
+    { "class_1_inner_class_1.delete", 28, 1, "v:o", thunk_JB_class_1_class_1_inner_class_1_delete },
+    { "class_1.setClientCallback_class_1_callback_1", 44, 2, "v:op", thunk_JB_class_1_setClientCallback_class_1_callback_1 },
+    { "Project_service_1", 17, 3, "v:h&p[d", thunk_JB_Project_service_1 },
+    { "class_1_inner_class_1.new", 25, 0, "o:", thunk_JB_class_1_class_1_inner_class_1_new },
+    { "class_2.new", 11, 0, "o:", thunk_JB_class_2_new },
+    { "class_1.getclass_1_field_1", 26, 1, "f:o", thunk_JB_class_1_getclass_1_field_1 },
+    { "class_1.class_1_service_2overload", 33, 1, "v:o", thunk_JB_class_1_class_1_service_2overload },
+    { "class_2.delete", 14, 1, "v:o", thunk_JB_class_2_delete },
+};
+
+static uint32_t hashName(uint32_t seed, const char * name, size_t length) {
+    uint32_t h = 0x811C9DC5u ^ seed;
+    for (size_t i = 0; i < length; i++) {
+        h = (h ^ static_cast<unsigned char>(name[i])) * 0x01000193u;
+    }
+    h ^= h >> 16;
+    h *= 0x85EBCA6Bu;
+    h ^= h >> 13;
+    h *= 0xC2B2AE35u;
+    h ^= h >> 16;
+    return h;
+}
+
+extern "C" {
+
+const JB_DispatchEntry * JB_lookupDispatchEntry(const char * name, size_t length) {
+    uint32_t d = displacements[hashName(0, name, length) % 7];
+    const JB_DispatchEntry * entry = &entries[hashName(d, name, length) % 13];
+    return entry->nameLength == length && memcmp(entry->name, name, length) == 0 ? entry : NULL;
+}
+
+const JB_DispatchEntry * JB_getDispatchEntries(size_t * count) {
+    *count = 13;
+    return entries;
+}
+
+} // extern "C"
@@ -0,0 +1,196 @@
+#! /usr/bin/env python
+
+###############################################################################
+# Copyright (c) 2018, 2018 IBM Corp. and others
+#
+# This program and the accompanying materials are made available under
+# the terms of the Eclipse Public License 2.0 which accompanies this
+# distribution and is available at https://www.eclipse.org/legal/epl-2.0/
+# or the Apache License, Version 2.0 which accompanies this distribution and
+# is available at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# This Source Code may also be made available under the following
+# Secondary Licenses when the conditions for such availability set
+# forth in the Eclipse Public License, v. 2.0 are satisfied: GNU
+# General Public License, version 2 with the GNU Classpath
+# Exception [1] and GNU General Public License, version 2 with the
+# OpenJDK Assembly Exception [2].
+#
+# [1] https://www.gnu.org/software/classpath/license.html
+# [2] http://openjdk.java.net/legal/assembly-exception.html
+#
+# SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+###############################################################################
+
+"""
+Snapshot tests locking down the complete output of the generators.
+
+Every case renders the output of one backend for one API description and
+compares it with the expected output stored in `test/snapshots/<case>/`.
+Each snapshot directory has a `SHA256SUMS` manifest, so unchanged files are
+checked by hash alone and the expected files are only read to show a diff
+when their hash does not match.
+
+Cases are rendered in parallel when the test class is set up. After an
+intended change to the generated code, the snapshots are updated with:
+
+    python run_tests.py --update-snapshots
+"""
+
+import os
+import shutil
+import difflib
+import hashlib
+import tempfile
+import unittest
+import multiprocessing
+from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
+
+import genutils
+import cppgen
+import cgen
+import dispatchgen
+
+snapshot_dir = os.path.join("test", "snapshots")
+manifest_name = "SHA256SUMS"
+
+# Rendering options set by `run_tests.py`: the number of cases rendered in
+# parallel (None uses all the CPUs), and whether the snapshots are rewritten
+# with the rendered output instead of being checked.
+jobs = None
+update = False
+
+# The case name maps to the API description, backend, and backend options.
+cases = OrderedDict([ ("cpp-jitbuilder", ("jitbuilder.api.json", cppgen.generate, {}))
+                    , ("cpp-jitbuilder-options", ("jitbuilder.api.json", cppgen.generate,
+                                                  dict(inline_services=True, profile="timers", trace=True, minimal_includes=True)))
+                    , ("c-jitbuilder", ("jitbuilder.api.json", cgen.generate, {}))
+                    , ("dispatch-jitbuilder", ("jitbuilder.api.json", dispatchgen.generate, {}))
+                    , ("cpp-minimal", ("test/minimal_api.json", cppgen.generate, {}))
+                    , ("c-sample", ("test/test_sample.json", cgen.generate, {}))
+                    , ("dispatch-sample", ("test/test_sample.json", dispatchgen.generate, {}))
+                    ])
+
+# Generated files refer to each other by path, so the temporary output
+# directory is replaced with this placeholder in the rendered files.
+output_placeholder = b"<output>"
+
+# The copyright year of generated files comes from SOURCE_DATE_EPOCH when it
+# is set, so the snapshots are rendered at a fixed date (2026-01-01).
+source_date_epoch = "1767225600"
+
+def render_case(name):
+    """
+    Renders the output of a case, returning a dictionary mapping the path
+    of each generated file, relative to the output directory, to its
+    contents. Sources are under `src/` and headers under `include/`.
+    """
+    path, generate, options = cases[name]
+    with open(path) as f:
+        api = genutils.APIDescription.load_json_file(f)
+    outdir = tempfile.mkdtemp()
+    try:
+        sourcedir = os.path.join(outdir, "src")
+        headerdir = os.path.join(outdir, "include")
+        os.mkdir(sourcedir)
+        os.mkdir(headerdir)
+        generate(api, sourcedir, headerdir, **options)
+        files = {}
+        for d in ["src", "include"]:
+            for n in os.listdir(os.path.join(outdir, d)):
+                with open(os.path.join(outdir, d, n), "rb") as f:
+                    files[d + "/" + n] = f.read().replace(outdir.encode("utf-8"), output_placeholder)
+        return files
+    finally:
+        shutil.rmtree(outdir)
+
+def render_cases(names, parallel=None):
+    """Renders a list of cases in parallel, returning a dictionary mapping each case to its files."""
+    if hasattr(multiprocessing, "get_context") and "fork" in multiprocessing.get_all_start_methods():
+        pool = multiprocessing.get_context("fork").Pool(parallel)
+    else:
+        pool = ThreadPool(parallel)
+    try:
+        return dict(zip(names, pool.map(render_case, names)))
+    finally:
+        pool.close()
+        pool.join()
+
+def get_hash(data):
+    return hashlib.sha256(data).hexdigest()
+
+def read_manifest(name):
+    """Reads the manifest of a snapshot, returning a dictionary mapping each file to its hash."""
+    manifest = {}
+    path = os.path.join(snapshot_dir, name, manifest_name)
+    if os.path.exists(path):
+        with open(path) as f:
+            for line in f:
+                digest, file_name = line.rstrip("\n").split("  ", 1)
+                manifest[file_name] = digest
+    return manifest
+
+def write_snapshot(name, files):
+    """Replaces the snapshot of a case with the given files, and writes its manifest."""
+    case_dir = os.path.join(snapshot_dir, name)
+    if os.path.isdir(case_dir):
+        shutil.rmtree(case_dir)
+    for path, data in files.items():
+        dest = os.path.join(case_dir, *path.split("/"))
+        if not os.path.isdir(os.path.dirname(dest)):
+            os.makedirs(os.path.dirname(dest))
+        with open(dest, "wb") as f:
+            f.write(data)
+    with open(os.path.join(case_dir, manifest_name), "w") as f:
+        for path in sorted(files):
+            f.write("{}  {}\n".format(get_hash(files[path]), path))
+
+def diff_snapshot(name, path, data, context=100):
+    """Returns a unified diff between the snapshot of a file and its rendered contents."""
+    with open(os.path.join(snapshot_dir, name, *path.split("/")), "rb") as f:
+        expected = f.read().decode("utf-8").splitlines(True)
+    diff = list(difflib.unified_diff(expected, data.decode("utf-8").splitlines(True), "expected/" + path, "rendered/" + path))
+    if len(diff) > context:
+        diff = diff[:context] + ["... ({} more lines)\n".format(len(diff) - context)]
+    return "".join(diff)
+
+class SnapshotTest(unittest.TestCase):
+    """Snapshot tests for the complete output of the generators"""
+
+    rendered = {}
+
+    @classmethod
+    def setUpClass(cls):
+        previous = os.environ.get("SOURCE_DATE_EPOCH")
+        os.environ["SOURCE_DATE_EPOCH"] = source_date_epoch
+        try:
+            cls.rendered = render_cases(list(cases.keys()), jobs)
+        finally:
+            if previous is None:
+                del os.environ["SOURCE_DATE_EPOCH"]
+            else:
+                os.environ["SOURCE_DATE_EPOCH"] = previous
+        if update:
+            for name, files in cls.rendered.items():
+                write_snapshot(name, files)
+
+    def check_case(self, name):
+        files = self.rendered[name]
+        manifest = read_manifest(name)
+        hint = "run `python run_tests.py --update-snapshots` if the change is intended"
+        self.assertTrue(manifest, "no snapshot for '{}'; {}".format(name, hint))
+
+        missing = sorted(set(manifest) - set(files))
+        added = sorted(set(files) - set(manifest))
+        self.assertEqual(([], []), (missing, added), "files missing from or added to the output; {}".format(hint))
+        differing = [path for path in sorted(files) if get_hash(files[path]) != manifest[path]]
+        if differing:
+            self.fail("".join("{} differs from its snapshot; {}\n{}".format(path, hint, diff_snapshot(name, path, files[path]))
+                              for path in differing))
+
+def add_case_test(name):
+    setattr(SnapshotTest, "test_" + name.replace("-", "_"), lambda self: self.check_case(name))
+
+for name in cases:
+    add_case_test(name)
@@ -0,0 +1,195 @@
+#! /usr/bin/env python
+
+###############################################################################
+# Copyright (c) 2018, 2018 IBM Corp. and others
+#
+# This program and the accompanying materials are made available under
+# the terms of the Eclipse Public License 2.0 which accompanies this
+# distribution and is available at https://www.eclipse.org/legal/epl-2.0/
+# or the Apache License, Version 2.0 which accompanies this distribution and
+# is available at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# This Source Code may also be made available under the following
+# Secondary Licenses when the conditions for such availability set
+# forth in the Eclipse Public License, v. 2.0 are satisfied: GNU
+# General Public License, version 2 with the GNU Classpath
+# Exception [1] and GNU General Public License, version 2 with the
+# OpenJDK Assembly Exception [2].
+#
+# [1] https://www.gnu.org/software/classpath/license.html
+# [2] http://openjdk.java.net/legal/assembly-exception.html
+#
+# SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+###############################################################################
+
+
+import struct
+import unittest
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+import genutils
+import tracereplay
+
+class TraceBuilder:
+    """Helper for building call traces for the test API."""
+
+    def __init__(self, generator, num_entry_points=None):
+        self.generator = generator
+        count = len(generator.entry_point_names) if num_entry_points is None else num_entry_points
+        self.data = bytearray(b"JBTRACE1" + struct.pack("<II", 0x01020304, count))
+
+    def call(self, name):
+        self.data += b"C" + struct.pack("<H", self.generator.entry_point_ids[name])
+        return self
+
+    def ret(self):
+        self.data += b"R"
+        return self
+
+    def fields(self, obj, class_name):
+        self.data += b"F" + struct.pack("<IH", obj, self.generator.class_ids[class_name])
+        return self
+
+    def value(self, fmt, v):
+        self.data += struct.pack("<" + fmt, v)
+        return self
+
+    def string(self, s):
+        self.data += struct.pack("<I", len(s)) + s
+        return self
+
+    def build(self):
+        return bytes(self.data)
+
+class TraceReaderTest(unittest.TestCase):
+    """Tests for TraceReader class"""
+
+    def setUp(self):
+        with open("test/test_sample.json") as f:
+            self.api = genutils.APIDescription.load_json_file(f)
+        self.replay = tracereplay.ReplayGenerator(self.api)
+        self.trace = TraceBuilder(self.replay.cpp)
+
+    def test_read_1(self):
+        data = (self.trace.call("class_1::class_1()")
+                          .fields(1, "class_1").value("f", 1.5).value("d", 2.5)
+                          .ret().value("I", 1)
+                          .call("class_1::class_1_service_1(constString)").value("I", 1).string(b"abc")
+                          .ret().string(b"def")
+                          .build())
+        records = self.replay.read_trace(data)
+        self.assertEqual(2, len(records))
+        ctor, service = records
+        self.assertTrue(ctor.is_ctor())
+        self.assertEqual(1, ctor.ret)
+        self.assertEqual(1, ctor.children[0].obj)
+        self.assertEqual(2, len(ctor.children[0].field_ids))
+        self.assertEqual(1, service.receiver)
+        self.assertEqual([b"abc"], service.args)
+        self.assertEqual(b"def", service.ret)
+        self.assertEqual(2, self.replay.num_objects)
+
+    def test_read_2(self):
+        data = (self.trace.call("class_1::class_1_service_1(constString)").value("I", 1).value("I", 0xFFFFFFFF)
+                          .call("class_1::class_1_callback_1(boolean) [thunk]").value("I", 1).value("B", 1)
+                          .ret().value("B", 0)
+                          .ret().value("I", 0xFFFFFFFF)
+                          .build())
+        service = self.replay.read_trace(data)[0]
+        self.assertEqual([None], service.args)
+        self.assertIsNone(service.ret)
+        self.assertTrue(service.children[0].is_thunk)
+        self.assertEqual([1], service.children[0].args)
+        self.assertEqual(0, service.children[0].ret)
+
+    def test_read_3(self):
+        self.assertRaises(tracereplay.TraceError, self.replay.read_trace, b"JBTRACE0" + struct.pack("<II", 0x01020304, 8))
+
+    def test_read_4(self):
+        data = TraceBuilder(self.replay.cpp, num_entry_points=3).build()
+        self.assertRaises(tracereplay.TraceError, self.replay.read_trace, data)
+
+    def test_read_5(self):
+        data = self.trace.call("class_2::class_2()").build()
+        self.assertRaises(tracereplay.TraceError, self.replay.read_trace, data)
+
+    def test_read_6(self):
+        data = self.trace.build() + b"X"
+        self.assertRaises(tracereplay.TraceError, self.replay.read_trace, data)
+
+class ReplayGeneratorTest(unittest.TestCase):
+    """Tests for ReplayGenerator class"""
+
+    def setUp(self):
+        with open("test/test_sample.json") as f:
+            self.api = genutils.APIDescription.load_json_file(f)
+        self.replay = tracereplay.ReplayGenerator(self.api)
+        self.trace = TraceBuilder(self.replay.cpp)
+
+    def write_driver(self, data):
+        records = self.replay.read_trace(data)
+        out = StringIO()
+        self.replay.write_driver(genutils.PrettyPrinter(out), records, "test.trace")
+        return out.getvalue()
+
+    def test_generate_string_1(self):
+        self.assertEqual('"a\\042b\\134c\\012"', self.replay.generate_string(b'a"b\\c\n'))
+
+    def test_generate_value_1(self):
+        type_desc = genutils.APIType("int32", self.api)
+        self.assertEqual("(-2147483647 - 1)", self.replay.generate_value(type_desc, -2147483648))
+
+    def test_generate_value_2(self):
+        type_desc = genutils.APIType("double", self.api)
+        bits = struct.unpack("<Q", struct.pack("<d", 0.5))[0]
+        self.assertRegexpMatches(self.replay.generate_value(type_desc, bits), "bitsToDouble\(UINT64_C\(0x3fe0000000000000\)\)")
+
+    def test_generate_value_3(self):
+        type_desc = genutils.APIType("constString", self.api)
+        self.assertEqual("static_cast<const char *>(NULL)", self.replay.generate_value(type_desc, None))
+
+    def test_generate_value_4(self):
+        type_desc = genutils.APIType("class_2", self.api)
+        self.assertEqual("static_cast<class_2 *>(objects[3])", self.replay.generate_value(type_desc, 3))
+        self.assertEqual(1, len(self.replay.warnings))
+
+    def test_write_driver_1(self):
+        data = (self.trace.call("class_2::class_2()")
+                          .fields(1, "class_1").value("f", 1.5).value("d", 2.5)
+                          .ret().value("I", 1)
+                          .call("class_1::class_1_service_1(constString)").value("I", 1).string(b"abc")
+                          .call("class_1::class_1_callback_1(boolean) [thunk]").value("I", 1).value("B", 1)
+                          .call("class_1::class_1_callback_1(boolean)").value("I", 1).value("B", 0)
+                          .ret().value("B", 0)
+                          .ret().value("B", 1)
+                          .ret().string(b"def")
+                          .build())
+        driver = self.write_driver(data)
+        self.assertRegexpMatches(driver, "class Replay_class_2 : public class_2 {")
+        self.assertRegexpMatches(driver, "virtual bool class_1_callback_1\(bool class_1_callback_1_parm\) { return dispatch_class_1_class_1_callback_1\(this, class_1_callback_1_parm\); }")
+        self.assertRegexpMatches(driver, "case 0: return segment_0\(self, class_1_callback_1_parm\);")
+        self.assertRegexpMatches(driver, "static_cast<class_1 \*>\(objects\[1\]\)->class_1::class_1_callback_1\(false\);")
+        self.assertRegexpMatches(driver, "objects\[1\] = new Replay_class_2\(\);")
+        self.assertRegexpMatches(driver, 'static_cast<class_1 \*>\(objects\[1\]\)->class_1_service_1\("abc"\);')
+        self.assertEqual([], self.replay.warnings)
+
+    def test_write_driver_2(self):
+        data = (self.trace.call("class_1::class_1_inner_class_1::class_1_inner_class_1()").ret().value("I", 1)
+                          .call("class_1::class_1_service_2()").value("I", 1).ret()
+                          .build())
+        driver = self.write_driver(data)
+        self.assertRegexpMatches(driver, "objects\[1\] = new class_1::class_1_inner_class_1\(\);")
+        self.assertRegexpMatches(driver, "// not replayed \(protected\): class_1::class_1_service_2\(\)")
+        self.assertNotRegexpMatches(driver, "class Replay_")
+        self.assertEqual(1, len(self.replay.warnings))
+
+    def test_write_driver_3(self):
+        self.replay.chunk_size = 1
+        data = (self.trace.call("class_2::class_2()").ret().value("I", 1)
+                          .call("class_2::class_2()").ret().value("I", 2)
+                          .build())
+        driver = self.write_driver(data)
+        self.assertRegexpMatches(driver, "replay_part_0\(\);\n\s*replay_part_1\(\);\n")
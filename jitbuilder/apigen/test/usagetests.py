@@ -0,0 +1,116 @@
+#! /usr/bin/env python
+
+###############################################################################
+# Copyright (c) 2018, 2018 IBM Corp. and others
+#
+# This program and the accompanying materials are made available under
+# the terms of the Eclipse Public License 2.0 which accompanies this
+# distribution and is available at https://www.eclipse.org/legal/epl-2.0/
+# or the Apache License, Version 2.0 which accompanies this distribution and
+# is available at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# This Source Code may also be made available under the following
+# Secondary Licenses when the conditions for such availability set
+# forth in the Eclipse Public License, v. 2.0 are satisfied: GNU
+# General Public License, version 2 with the GNU Classpath
+# Exception [1] and GNU General Public License, version 2 with the
+# OpenJDK Assembly Exception [2].
+#
+# [1] https://www.gnu.org/software/classpath/license.html
+# [2] http://openjdk.java.net/legal/assembly-exception.html
+#
+# SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+###############################################################################
+
+import unittest
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+import genutils
+import tracereplay
+import usage
+from test.tracereplaytests import TraceBuilder
+
+class UsageTest(unittest.TestCase):
+    """Tests for usage manifests and API pruning"""
+
+    def setUp(self):
+        with open("test/test_sample.json") as f:
+            self.api = genutils.APIDescription.load_json_file(f)
+
+    def get_classes(self, api):
+        return sorted(c.name() for c in usage.UsageResolver(api).all_classes)
+
+    def test_read_manifest_1(self):
+        f = StringIO(u"# comment\nclass_1\n\n  class_2::class_1_service_1  # inherited\n")
+        self.assertEqual(["class_1", "class_2::class_1_service_1"], usage.read_manifest(f))
+
+    def test_prune_api_1(self):
+        pruned = usage.prune_api(self.api, [])
+        self.assertEqual([], self.get_classes(pruned))
+        self.assertEqual([], pruned.services())
+
+    def test_prune_api_2(self):
+        pruned = usage.prune_api(self.api, ["class_1_inner_class_1"])
+        self.assertEqual(["class_1", "class_1_inner_class_1"], self.get_classes(pruned))
+        self.assertEqual([], pruned.get_class_by_name("class_1").services())
+        self.assertEqual(1, len(pruned.get_class_by_name("class_1").callbacks()))
+
+    def test_prune_api_3(self):
+        pruned = usage.prune_api(self.api, ["class_2::class_1_service_1"])
+        self.assertEqual(["class_1", "class_2"], self.get_classes(pruned))
+        self.assertEqual(["class_1_service_1"], [s.name() for s in pruned.get_class_by_name("class_1").services()])
+
+    def test_prune_api_4(self):
+        pruned = usage.prune_api(self.api, ["class_2::*", "Project_service_1"])
+        self.assertEqual(2, len(pruned.get_class_by_name("class_1").services()))
+        self.assertEqual(["Project_service_1"], [s.name() for s in pruned.services()])
+
+    def test_prune_api_5(self):
+        self.api.description["services"][0]["flags"] = ["sets-allocators"]
+        pruned = usage.prune_api(self.api, [])
+        self.assertEqual(["Project_service_1"], [s.name() for s in pruned.services()])
+
+    def test_prune_api_6(self):
+        self.assertRaises(usage.UsageError, usage.prune_api, self.api, ["class_3"])
+        self.assertRaises(usage.UsageError, usage.prune_api, self.api, ["class_2::service"])
+        self.assertRaises(usage.UsageError, usage.prune_api, self.api, ["class_3::class_1_service_1"])
+
+    def test_prune_api_7(self):
+        usage.prune_api(self.api, ["class_1::*"])
+        self.assertEqual(2, len(self.api.get_class_by_name("class_1").services()))
+
+    def test_scan_sources_1(self):
+        source = u"""
+            class_2 * c = new class_2();
+            c->class_1_service_2();
+            int class_1_service_1 = 0;
+            Project_service_1(0, nullptr, 1.0);
+        """
+        self.assertEqual(["*::class_1_service_2", "Project_service_1", "class_2"], usage.scan_sources(self.api, [source]))
+
+    def test_scan_sources_2(self):
+        source = u"""
+            JB_class_1 * c = JB_class_1_new();
+            JB_class_1_class_1_service_2overload(c);
+            P_Project_service_1(0, NULL, 1.0);
+        """
+        self.assertEqual(["class_1", "class_1::class_1_service_2"], usage.scan_sources(self.api, [source]))
+        self.assertEqual(["Project_service_1"], usage.scan_sources(self.api, [source], c_prefix="P"))
+
+    def test_scan_sources_3(self):
+        self.api.description["classes"][0]["services"][0]["flags"].append("batchable")
+        source = u"c->class_1_service_1Bulk(2, operands, results);"
+        self.assertEqual(["*::class_1_service_1"], usage.scan_sources(self.api, [source]))
+
+    def test_scan_trace_1(self):
+        replay = tracereplay.ReplayGenerator(self.api)
+        data = (TraceBuilder(replay.cpp)
+                    .call("class_1::class_1_service_1(constString)").value("I", 1).value("I", 0xFFFFFFFF)
+                    .call("class_1::class_1_callback_1(boolean) [thunk]").value("I", 1).value("B", 1)
+                    .ret().value("B", 0)
+                    .ret().value("I", 0xFFFFFFFF)
+                    .build())
+        self.assertEqual(["class_1", "class_1::class_1_service_1"], usage.scan_trace(self.api, data))
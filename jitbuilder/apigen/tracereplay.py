@@ -0,0 +1,689 @@
+#! /usr/bin/env python
+
+###############################################################################
+# Copyright (c) 2026, 2026 IBM Corp. and others
+#
+# This program and the accompanying materials are made available under
+# the terms of the Eclipse Public License 2.0 which accompanies this
+# distribution and is available at https://www.eclipse.org/legal/epl-2.0/
+# or the Apache License, Version 2.0 which accompanies this distribution and
+# is available at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# This Source Code may also be made available under the following
+# Secondary Licenses when the conditions for such availability set
+# forth in the Eclipse Public License, v. 2.0 are satisfied: GNU
+# General Public License, version 2 with the GNU Classpath
+# Exception [1] and GNU General Public License, version 2 with the
+# OpenJDK Assembly Exception [2].
+#
+# [1] https://www.gnu.org/software/classpath/license.html
+# [2] http://openjdk.java.net/legal/assembly-exception.html
+#
+# SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+###############################################################################
+
+"""
+A tool for turning a call trace, recorded by a C++ client API generated
+with `cppgen.py --trace`, into a standalone C++ replay driver.
+
+The replay driver makes the exact same sequence of client API calls as
+the traced client, so it can be used to reproduce (and time) the
+compilation of the traced methods without needing the client itself.
+The format of the trace is documented in `extras/cpp/Tracing.hpp`.
+
+Objects are tracked by the IDs assigned to them in the trace. The driver
+keeps a table mapping each ID to the client object it currently refers
+to, which is updated whenever an object is created, returned, passed to
+a callback, or assigned to a field of another object.
+
+Calls made from callbacks (e.g. the body of `IlBuilder::buildIL()`) are
+replayed by subclassing every client API class instantiated by the traced
+client and overriding its callbacks. Each callback invocation recorded in
+the trace becomes a *segment* function. Since the JitBuilder implementation
+is deterministic, callbacks are invoked in the same order as when the trace
+was recorded, so segments are simply dispatched by counting invocations.
+"""
+
+import os
+import sys
+import struct
+import argparse
+from genutils import *
+import cppgen
+
+class TraceError(Exception):
+    """Raised when a call trace is malformed or does not match the API description."""
+    pass
+
+class TraceCall:
+    """A call to a generated entry point recorded in a call trace."""
+
+    def __init__(self, entry_point):
+        self.name, self.desc, self.class_desc, self.is_thunk = entry_point
+        self.receiver = None
+        self.args = []
+        self.children = []
+        self.ret = None
+        self.in_outs = []
+
+    def is_ctor(self):
+        """Returns whether the entry point is a constructor."""
+        return isinstance(self.desc, APIConstructor)
+
+    def is_callback_service(self):
+        """Returns whether the entry point is the client side default implementation of a callback."""
+        return isinstance(self.desc, APICallback) and not self.is_thunk
+
+class TraceFields:
+    """The objects assigned to the fields of a class when an object is initialized."""
+
+    def __init__(self, obj, class_desc, field_ids):
+        self.obj = obj
+        self.class_desc = class_desc
+        self.field_ids = field_ids
+
+class TraceReader:
+    """
+    A reader for call traces.
+
+    The entry points and classes of the API the trace was recorded with
+    are needed to decode the trace, since the records do not contain
+    any type information.
+    """
+
+    magic = b"JBTRACE1"
+
+    def __init__(self, data, entry_points, class_list):
+        self.data = data
+        self.entry_points = entry_points
+        self.class_list = class_list
+        self.pos = 0
+        self.endian = "<"
+        self.num_calls = 0
+        self.max_object_id = 0
+
+    def unpack(self, fmt):
+        """Reads a value of a given `struct` format from the trace."""
+        fmt = self.endian + fmt
+        size = struct.calcsize(fmt)
+        if self.pos + size > len(self.data):
+            raise TraceError("trace is truncated at offset {}".format(self.pos))
+        value = struct.unpack_from(fmt, self.data, self.pos)[0]
+        self.pos += size
+        return value
+
+    def read_object(self):
+        """Reads an object ID."""
+        obj = self.unpack("I")
+        self.max_object_id = max(self.max_object_id, obj)
+        return obj
+
+    def read_string(self):
+        """Reads a string, returned as bytes (or None for NULL)."""
+        n = self.unpack("I")
+        if n == 0xFFFFFFFF:
+            return None
+        if self.pos + n > len(self.data):
+            raise TraceError("trace is truncated at offset {}".format(self.pos))
+        s = self.data[self.pos:self.pos + n]
+        self.pos += n
+        return s
+
+    def read_in_out(self):
+        """Reads an in-out argument, returned as an object ID (or None for a NULL reference)."""
+        return self.read_object() if self.unpack("B") else None
+
+    def read_value(self, t):
+        """
+        Reads a value of a given type. Objects are returned as IDs, and
+        floating point values are returned as their bit patterns.
+        """
+        if t.is_class():
+            return self.read_object()
+        formats = { "boolean": "B"
+                  , "int8": "b"
+                  , "int16": "h"
+                  , "int32": "i"
+                  , "int64": "q"
+                  , "uint32": "I"
+                  , "integer": "Q"
+                  , "unsignedInteger": "Q"
+                  , "float": "I"
+                  , "double": "Q"
+                  , "pointer": "Q"
+                  , "ppointer": "Q"
+                  }
+        if t.name() in ["constString", "string"]:
+            return self.read_string()
+        return self.unpack(formats[t.name()])
+
+    def read_arg(self, parm):
+        """Reads the argument passed for a given parameter."""
+        if parm.is_array():
+            n = self.unpack("I")
+            return None if n == 0xFFFFFFFF else [self.read_object() for i in range(n)]
+        if parm.is_in_out():
+            return self.read_in_out()
+        return self.read_value(parm.type())
+
+    def read_fields(self):
+        """Reads a field record (the tag has already been read)."""
+        obj = self.read_object()
+        index = self.unpack("H")
+        if index >= len(self.class_list):
+            raise TraceError("invalid class index {} at offset {}".format(index, self.pos))
+        class_desc = self.class_list[index]
+        return TraceFields(obj, class_desc, [self.read_value(f.type()) for f in class_desc.fields()])
+
+    def read_call(self):
+        """Reads a call record and everything nested in it (the tag has already been read)."""
+        index = self.unpack("H")
+        if index >= len(self.entry_points):
+            raise TraceError("invalid entry point ID {} at offset {}".format(index, self.pos))
+        call = TraceCall(self.entry_points[index])
+        self.num_calls += 1
+        parms = call.desc.parameters()
+
+        if call.is_thunk or (call.class_desc is not None and not call.is_ctor() and not call.desc.is_static()):
+            call.receiver = self.read_object()
+        call.args = [self.read_arg(p) for p in parms]
+
+        while True:
+            tag = self.unpack("c")
+            if tag == b"C":
+                call.children.append(self.read_call())
+            elif tag == b"F":
+                call.children.append(self.read_fields())
+            elif tag == b"R":
+                break
+            else:
+                raise TraceError("invalid record tag {!r} at offset {}".format(tag, self.pos - 1))
+
+        if call.is_ctor():
+            call.ret = self.read_object()
+        elif not call.desc.return_type().is_none():
+            call.ret = self.read_value(call.desc.return_type())
+        call.in_outs = [self.read_in_out() if p.is_in_out() else None for p in parms]
+        return call
+
+    def read(self):
+        """Reads a complete trace, returning the list of top-level records."""
+        if self.data[:len(self.magic)] != self.magic:
+            raise TraceError("not a call trace (bad magic string)")
+        self.pos = len(self.magic)
+        marker = self.data[self.pos:self.pos + 4]
+        self.endian = "<" if marker == struct.pack("<I", 0x01020304) else ">"
+        self.unpack("I")
+        count = self.unpack("I")
+        if count != len(self.entry_points):
+            raise TraceError("trace was recorded with an API of {} entry points but the description has {}".format(count, len(self.entry_points)))
+
+        records = []
+        while self.pos < len(self.data):
+            tag = self.unpack("c")
+            if tag == b"C":
+                records.append(self.read_call())
+            elif tag == b"F":
+                records.append(self.read_fields())
+            else:
+                raise TraceError("invalid record tag {!r} at offset {}".format(tag, self.pos - 1))
+        return records
+
+class ReplayGenerator:
+    """A generator for the C++ replay driver of a call trace."""
+
+    def __init__(self, api, chunk_size=500):
+        self.api = api
+        self.cpp = cppgen.CppGenerator(api, "", [])
+
+        # Maximum number of statements in a single generated function
+        self.chunk_size = chunk_size
+
+        self.warnings = []
+        self.bound = set()
+        self.pending_fields = {}
+        self.replay_objects = set()
+        self.replay_classes = []
+        self.segments = []
+        self.num_objects = 1
+
+    def warn(self, message):
+        if message not in self.warnings:
+            self.warnings.append(message)
+
+    def read_trace(self, data):
+        """Decodes a call trace recorded with the API description of this generator."""
+        reader = TraceReader(data, self.cpp.entry_points, self.cpp.class_list)
+        records = reader.read()
+        self.num_objects = reader.max_object_id + 1
+        self.num_calls = reader.num_calls
+        return records
+
+    # naming utilities ###################################################
+
+    def mangle(self, class_desc):
+        """Returns the name of a class usable as part of a C++ identifier."""
+        return self.cpp.get_class_name(class_desc).replace("::", "_")
+
+    def replay_class_name(self, class_desc):
+        return "Replay_" + self.mangle(class_desc)
+
+    def dispatcher_name(self, class_desc, callback):
+        return "dispatch_{}_{}".format(self.mangle(class_desc), callback.name())
+
+    def get_callbacks(self, class_desc):
+        """
+        Returns the callbacks of a class, including the inherited ones,
+        as pairs of the callback description and the description of
+        the class that registers it. When a class redeclares a callback
+        of its parent class, only the redeclaration is returned since
+        it is the callback registered last.
+        """
+        callbacks = []
+        names = set()
+        c = class_desc
+        while True:
+            for cb in c.callbacks():
+                if cb.name() not in names:
+                    names.add(cb.name())
+                    callbacks.append((cb, c))
+            if not c.has_parent():
+                break
+            c = c.parent()
+        return callbacks
+
+    # value generation ###################################################
+
+    def generate_string(self, s):
+        """Generates a C++ string literal from bytes."""
+        chars = []
+        for b in bytearray(s):
+            if 32 <= b < 127 and chr(b) not in '"\\?':
+                chars.append(chr(b))
+            else:
+                chars.append("\\{:03o}".format(b))
+        return '"{}"'.format("".join(chars))
+
+    def generate_null(self, ctype):
+        """
+        Generates a NULL of a given type. NULL arguments are always typed
+        so they do not make calls to overloaded services ambiguous.
+        """
+        return "static_cast<{}>(NULL)".format(ctype)
+
+    def generate_object(self, t, obj):
+        """Generates the expression evaluating to the object with a given ID."""
+        if obj == 0:
+            return self.generate_null(self.cpp.get_client_type(t))
+        if obj not in self.bound:
+            self.warn("object {} is used before the replay driver can know what it refers to".format(obj))
+        return "static_cast<{}>(objects[{}])".format(self.cpp.get_client_type(t), obj)
+
+    def generate_value(self, t, v):
+        """Generates the C++ expression for a recorded value of a given type."""
+        if t.is_class():
+            return self.generate_object(t, v)
+        name = t.name()
+        if name == "boolean":
+            return "true" if v else "false"
+        if name in ["int8", "int16"]:
+            return "static_cast<{}>({})".format(self.cpp.builtin_type_map[name], v)
+        if name == "int32":
+            return str(v) if v != -(1 << 31) else "({} - 1)".format(v + 1)
+        if name == "int64":
+            return "INT64_C({})".format(v) if v != -(1 << 63) else "INT64_MIN"
+        if name == "uint32":
+            return "{}U".format(v)
+        if name in ["integer", "unsignedInteger"]:
+            return "static_cast<size_t>(UINT64_C({}))".format(v)
+        if name == "float":
+            return "bitsToFloat(0x{:08x}U) /* {!r} */".format(v, struct.unpack("<f", struct.pack("<I", v))[0])
+        if name == "double":
+            return "bitsToDouble(UINT64_C(0x{:016x})) /* {!r} */".format(v, struct.unpack("<d", struct.pack("<Q", v))[0])
+        if name == "pointer":
+            if v == 0:
+                return self.generate_null("void *")
+            self.warn("pointer arguments are replayed with the addresses recorded in the trace")
+            return "(void *)(uintptr_t)UINT64_C(0x{:x})".format(v)
+        if name == "ppointer":
+            return self.generate_null("void **") if v == 0 else "&ppointerScratch"
+        if name == "constString":
+            return self.generate_null("const char *") if v is None else self.generate_string(v)
+        if name == "string":
+            return self.generate_null("char *") if v is None else "const_cast<char *>({})".format(self.generate_string(v))
+        raise TraceError("unsupported type {}".format(name))
+
+    # object binding #####################################################
+
+    def bind(self, obj, lines):
+        """
+        Marks an object as known to the replay driver and applies any
+        pending field assignments recorded for it.
+        """
+        if obj == 0:
+            return
+        self.bound.add(obj)
+        for fields in self.pending_fields.pop(obj, []):
+            cname = self.cpp.get_class_name(fields.class_desc)
+            for field, fid in zip(fields.class_desc.fields(), fields.field_ids):
+                if not field.type().is_class() or fid == 0:
+                    continue
+                lines.append("objects[{fid}] = static_cast<{cname} *>(objects[{obj}])->{field};".format(fid=fid, cname=cname, obj=obj, field=field.name()))
+                self.bind(fid, lines)
+
+    def add_fields(self, fields):
+        self.pending_fields.setdefault(fields.obj, []).append(fields)
+
+    def flush_fields(self, lines):
+        """Applies the pending field assignments of objects already known to the driver."""
+        for obj in [o for o in self.pending_fields if o in self.bound]:
+            self.bind(obj, lines)
+
+    # trace processing ###################################################
+
+    def walk(self, call):
+        """
+        Processes the records nested in a call that is not replayed
+        directly by the driver.
+        """
+        for child in call.children:
+            if isinstance(child, TraceFields):
+                self.add_fields(child)
+            elif child.is_thunk:
+                self.process_thunk(child)
+            else:
+                self.walk(child)
+
+    def process_thunk(self, call):
+        """
+        Processes a callback invocation. Callbacks invoked on objects
+        created by the driver become segments, the rest are handled
+        by the client API default implementation during replay.
+        """
+        if call.receiver not in self.replay_objects:
+            self.walk(call)
+            return
+
+        segment = { "index": len(self.segments), "call": call }
+        self.segments.append(segment)
+
+        bindings = []
+        for parm, arg in zip(call.desc.parameters(), call.args):
+            if parm.type().is_class() and arg != 0:
+                bindings.append("objects[{}] = {};".format(arg, parm.name()))
+                self.bind(arg, bindings)
+
+        statements = []
+        self.process_records(call.children, statements)
+
+        rtype = call.desc.return_type()
+        segment["bindings"] = bindings
+        segment["statements"] = statements
+        segment["return"] = None if rtype.is_none() else self.generate_value(rtype, call.ret)
+
+    def process_records(self, records, statements):
+        """Generates the statements replaying a sequence of records."""
+        for record in records:
+            if isinstance(record, TraceFields):
+                self.add_fields(record)
+            elif record.is_thunk:
+                self.process_thunk(record)
+            else:
+                self.process_call(record, statements)
+            lines = []
+            self.flush_fields(lines)
+            statements.extend(lines)
+
+    def process_call(self, call, statements):
+        """Generates the statement replaying a call made by the traced client."""
+        if not call.is_ctor() and call.desc.visibility() == "protected":
+            self.warn("calls to protected service {} cannot be replayed".format(call.name))
+            statements.append("// not replayed (protected): {}".format(call.name))
+            self.walk(call)
+            return
+
+        locals_ = []
+        post = []
+        args = []
+        for i, (parm, arg) in enumerate(zip(call.desc.parameters(), call.args)):
+            t = parm.type()
+            ctype = self.cpp.get_client_type(t)
+            if parm.is_array():
+                if arg is None:
+                    args.append(self.generate_null(ctype + "*"))
+                    continue
+                elements = ", ".join([self.generate_object(t, a) for a in arg]) if arg else "NULL"
+                locals_.append("{t} {n}{i}[] = {{ {e} }};".format(t=ctype, n=parm.name(), i=i, e=elements))
+                args.append("{}{}".format(parm.name(), i))
+            elif parm.is_in_out():
+                if arg is None:
+                    args.append(self.generate_null(ctype + "*"))
+                    continue
+                locals_.append("{t} {n}{i} = {v};".format(t=ctype, n=parm.name(), i=i, v=self.generate_object(t, arg)))
+                args.append("&{}{}".format(parm.name(), i))
+                final = call.in_outs[i]
+                if final:
+                    post.append(("objects[{}] = {}{};".format(final, parm.name(), i), final))
+            else:
+                args.append(self.generate_value(t, arg))
+        args = ", ".join(args)
+
+        # callbacks invoked during the call run before it returns
+        self.walk(call)
+
+        if call.is_ctor():
+            class_desc = call.class_desc
+            if self.get_callbacks(class_desc):
+                cname = self.replay_class_name(class_desc)
+                self.replay_objects.add(call.ret)
+                if class_desc not in self.replay_classes:
+                    self.replay_classes.append(class_desc)
+            else:
+                cname = self.cpp.get_class_name(class_desc)
+            expr = "new {}({})".format(cname, args)
+        elif call.class_desc is None:
+            expr = "{}({})".format(call.desc.name(), args)
+        elif call.desc.is_static():
+            expr = "{}::{}({})".format(self.cpp.get_class_name(call.class_desc), call.desc.name(), args)
+        else:
+            receiver = self.generate_object(call.class_desc.as_type(), call.receiver)
+            # default callback implementations are called non-virtually
+            # to not dispatch back to the driver's overrides
+            qualifier = self.cpp.get_class_name(call.class_desc) + "::" if call.is_callback_service() else ""
+            expr = "{}->{}{}({})".format(receiver, qualifier, call.desc.name(), args)
+
+        returns_object = call.is_ctor() or call.desc.return_type().is_class()
+        lines = []
+        if returns_object and call.ret:
+            lines.append("objects[{}] = {};".format(call.ret, expr))
+        else:
+            lines.append("{};".format(expr))
+        for line, obj in post:
+            lines.append(line)
+
+        if returns_object and call.ret:
+            self.bind(call.ret, lines)
+        for line, obj in post:
+            self.bind(obj, lines)
+
+        if locals_:
+            statements.append("{\n" + "\n".join(["    " + l for l in locals_ + lines]) + "\n}")
+        else:
+            statements.extend(lines)
+
+    # driver generation ##################################################
+
+    def write_parts(self, writer, prefix, statements):
+        """
+        Writes a sequence of statements as functions of at most
+        `chunk_size` statements each, returning the names of the
+        functions in the order they should be called.
+        """
+        names = []
+        for i in range(0, len(statements), self.chunk_size):
+            name = "{}_part_{}".format(prefix, len(names))
+            names.append(name)
+            writer.write("static void {}() {{\n".format(name))
+            writer.indent()
+            for s in statements[i:i + self.chunk_size]:
+                writer.write(s + "\n")
+            writer.outdent()
+            writer.write("}\n\n")
+        return names
+
+    def write_replay_class(self, writer, class_desc):
+        """
+        Writes the subclass of a client API class used by the driver,
+        which dispatches all the callbacks to the recorded segments.
+        """
+        name = self.replay_class_name(class_desc)
+        base = self.cpp.get_class_name(class_desc)
+        writer.write("class {} : public {} {{\n".format(name, base))
+        writer.write("public:\n")
+        writer.indent()
+        writer.write("using {}::{};\n".format(base, class_desc.name()))
+        for cb, owner in self.get_callbacks(class_desc):
+            rtype = self.cpp.get_client_type(cb.return_type())
+            parms = self.cpp.generate_parm_list(cb.parameters())
+            args = list_str_prepend("this", ", ".join([p.name() for p in cb.parameters()]))
+            ret = "" if cb.return_type().is_none() else "return "
+            writer.write("virtual {rtype} {name}({parms}) {{ {ret}{dispatcher}({args}); }}\n".format(rtype=rtype, name=cb.name(), parms=parms, ret=ret, dispatcher=self.dispatcher_name(owner, cb), args=args))
+        writer.outdent()
+        writer.write("};\n\n")
+
+    def get_dispatched_callbacks(self):
+        """Returns the callbacks that must be dispatched by the driver."""
+        callbacks = []
+        for class_desc in self.replay_classes:
+            for cb, owner in self.get_callbacks(class_desc):
+                if (cb, owner) not in callbacks:
+                    callbacks.append((cb, owner))
+        return callbacks
+
+    def generate_dispatcher_signature(self, cb, owner):
+        rtype = self.cpp.get_client_type(cb.return_type())
+        parms = list_str_prepend("{} * self".format(self.cpp.get_class_name(owner)), self.cpp.generate_parm_list(cb.parameters()))
+        return "static {} {}({})".format(rtype, self.dispatcher_name(owner, cb), parms)
+
+    def write_segment(self, writer, segment):
+        """Writes the function replaying the calls made by a callback invocation."""
+        call = segment["call"]
+        parts = self.write_parts(writer, "segment_{}".format(segment["index"]), segment["statements"])
+        rtype = self.cpp.get_client_type(call.desc.return_type())
+        parms = list_str_prepend("{} * self".format(self.cpp.get_class_name(call.class_desc)), self.cpp.generate_parm_list(call.desc.parameters()))
+        writer.write("static {} segment_{}({}) {{\n".format(rtype, segment["index"], parms))
+        writer.indent()
+        writer.write("// {}\n".format(call.name))
+        for line in segment["bindings"]:
+            writer.write(line + "\n")
+        for p in parts:
+            writer.write("{}();\n".format(p))
+        if segment["return"] is not None:
+            writer.write("return {};\n".format(segment["return"]))
+        writer.outdent()
+        writer.write("}\n\n")
+
+    def write_dispatcher(self, writer, cb, owner):
+        """
+        Writes the function dispatching the invocations of a callback
+        to the corresponding segments.
+        """
+        args = list_str_prepend("self", ", ".join([p.name() for p in cb.parameters()]))
+        ret = "" if cb.return_type().is_none() else "return "
+        writer.write("{} {{\n".format(self.generate_dispatcher_signature(cb, owner)))
+        writer.indent()
+        writer.write("switch (nextSegment++) {\n")
+        writer.indent()
+        for segment in self.segments:
+            call = segment["call"]
+            if call.desc.name() == cb.name() and call.class_desc.name() == owner.name():
+                done = "" if ret else " return;"
+                writer.write("case {i}: {ret}segment_{i}({args});{done}\n".format(i=segment["index"], ret=ret, args=args, done=done))
+        writer.write("default:\n")
+        writer.indent()
+        writer.write('fprintf(stderr, "replay diverged from the trace: unexpected call to {}::{}\\n");\n'.format(self.cpp.get_class_name(owner), cb.name()))
+        writer.write("{}self->{}::{}({});\n".format(ret, self.cpp.get_class_name(owner), cb.name(), ", ".join([p.name() for p in cb.parameters()])))
+        if not ret:
+            writer.write("return;\n")
+        writer.outdent()
+        writer.outdent()
+        writer.write("}\n")
+        writer.outdent()
+        writer.write("}\n\n")
+
+    def write_driver(self, writer, records, trace_name):
+        """Writes the complete replay driver for a sequence of trace records."""
+        statements = []
+        traced = set([r.desc.name() for r in records if isinstance(r, TraceCall) and r.class_desc is None])
+        initializers = [s for s in self.api.services() if s.sets_allocators() and not s.parameters()]
+        if initializers and not [s for s in self.api.services() if s.sets_allocators() and s.name() in traced]:
+            statements.append("{}();".format(initializers[0].name()))
+        self.process_records(records, statements)
+        if "shutdownJit" not in traced and [s for s in self.api.services() if s.name() == "shutdownJit"]:
+            statements.append("shutdownJit();")
+        if self.pending_fields:
+            self.warn("fields of {} object(s) were never used by the driver".format(len(self.pending_fields)))
+
+        writer.write("// Replay driver generated by tracereplay.py from {}\n\n".format(trace_name))
+        for h in ["chrono", "stdint.h", "stdio.h", "string.h"]:
+            writer.write("#include <{}>\n".format(h))
+        writer.write(self.cpp.generate_include("JitBuilder.hpp"))
+        writer.write("\n")
+        writer.write("using namespace {};\n\n".format("::".join(self.api.namespaces())))
+
+        writer.write("static void * objects[{}];\n".format(self.num_objects))
+        writer.write("static void * ppointerScratch;\n")
+        writer.write("static int32_t nextSegment = 0;\n\n")
+        writer.write("static float bitsToFloat(uint32_t bits) { float f; memcpy(&f, &bits, sizeof(f)); return f; }\n")
+        writer.write("static double bitsToDouble(uint64_t bits) { double d; memcpy(&d, &bits, sizeof(d)); return d; }\n\n")
+
+        dispatched = self.get_dispatched_callbacks()
+        for cb, owner in dispatched:
+            writer.write("{};\n".format(self.generate_dispatcher_signature(cb, owner)))
+        writer.write("\n")
+        for c in self.replay_classes:
+            self.write_replay_class(writer, c)
+
+        for segment in self.segments:
+            self.write_segment(writer, segment)
+        for cb, owner in dispatched:
+            self.write_dispatcher(writer, cb, owner)
+
+        parts = self.write_parts(writer, "replay", statements)
+        writer.write("int main() {\n")
+        writer.indent()
+        writer.write("auto start = std::chrono::steady_clock::now();\n")
+        for p in parts:
+            writer.write("{}();\n".format(p))
+        writer.write("auto end = std::chrono::steady_clock::now();\n")
+        writer.write('printf("replayed {} calls in %.3f ms\\n", std::chrono::duration<double, std::milli>(end - start).count());\n'.format(self.num_calls))
+        writer.write("return 0;\n")
+        writer.outdent()
+        writer.write("}\n")
+
+# main generator #####################################################
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--output", type=str, default=os.path.join(os.getcwd(), "replay.cpp"),
+                        help="path of the generated replay driver")
+    parser.add_argument("--chunk-size", type=int, default=500,
+                        help="maximum number of statements in a generated function")
+    parser.add_argument("description", help="path to the API description file the trace was recorded with")
+    parser.add_argument("trace", help="path to the call trace")
+    args = parser.parse_args()
+
+    with open(args.description) as api_src:
+        api_description = APIDescription.load_json_file(api_src)
+    with open(args.trace, "rb") as trace_src:
+        data = trace_src.read()
+
+    generator = ReplayGenerator(api_description, chunk_size=args.chunk_size)
+    try:
+        records = generator.read_trace(data)
+    except TraceError as e:
+        sys.exit("error: {}: {}".format(args.trace, e))
+    with open(args.output, "w") as writer:
+        generator.write_driver(PrettyPrinter(writer), records, os.path.basename(args.trace))
+    for w in generator.warnings:
+        sys.stderr.write("warning: {}\n".format(w))
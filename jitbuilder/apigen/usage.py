@@ -0,0 +1,310 @@
+#! /usr/bin/env python
+
+###############################################################################
+# Copyright (c) 2026, 2026 IBM Corp. and others
+#
+# This program and the accompanying materials are made available under
+# the terms of the Eclipse Public License 2.0 which accompanies this
+# distribution and is available at https://www.eclipse.org/legal/epl-2.0/
+# or the Apache License, Version 2.0 which accompanies this distribution and
+# is available at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# This Source Code may also be made available under the following
+# Secondary Licenses when the conditions for such availability set
+# forth in the Eclipse Public License, v. 2.0 are satisfied: GNU
+# General Public License, version 2 with the GNU Classpath
+# Exception [1] and GNU General Public License, version 2 with the
+# OpenJDK Assembly Exception [2].
+#
+# [1] https://www.gnu.org/software/classpath/license.html
+# [2] http://openjdk.java.net/legal/assembly-exception.html
+#
+# SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+###############################################################################
+
+"""
+A module for pruning an API description down to the parts used by a client.
+
+A usage manifest lists the parts of an API a client uses. It is a text
+file with one entry per line, where `#` starts a comment:
+
+- `Class` uses a class (its constructors, callbacks, and fields)
+- `Class::service` uses all the overloads of a class service, which may be
+  inherited from a base class
+- `Class::*` uses all the services of a class
+- `*::service` uses all the overloads of a service in every class that has it
+- `service` uses all the overloads of a top-level service
+
+Pruning keeps the used parts of an API and everything they transitively
+require: the classes named in their signatures, base and containing
+classes, and the services used by the hand-written extras of the C++
+client API. Services that set the client allocators (e.g.
+`initializeJit()`) are always kept, since no client can do without them.
+
+Manifests can be written by hand or extracted from client sources or
+from a call trace recorded with `cppgen.py --trace`. Extraction from
+sources is purely lexical, so it over-approximates: a call to a service
+named `Add` uses `Add` in every class that has one.
+"""
+
+import re
+import sys
+import copy
+import argparse
+from genutils import *
+import cgen
+import tracereplay
+
+class UsageError(Exception):
+    """Raised when a usage manifest does not match the API description."""
+    pass
+
+# Services called by the hand-written extras of each class (see `extras/cpp/`).
+extras_services = { "TypeDictionary": ["PointerTo"] }
+
+def read_manifest(f):
+    """Reads a usage manifest from a file-like object, returning its list of entries."""
+    entries = []
+    for line in f:
+        line = line.split("#", 1)[0].strip()
+        if line:
+            entries.append(line)
+    return entries
+
+def write_manifest(f, entries):
+    """Writes a usage manifest, sorted and without duplicates, to a file-like object."""
+    for e in sorted(set(entries)):
+        f.write(e + "\n")
+
+class UsageResolver:
+    """
+    Computes the parts of an API required by a usage manifest.
+
+    Classes are tracked by name and services by the identity of their
+    description, so that only the used overloads of a service are kept.
+    """
+
+    def __init__(self, api):
+        self.api = api
+        self.classes = set()
+        self.services = set()
+        self.all_classes = self.gen_class_list(api)
+
+    def gen_class_list(self, api):
+        classes = []
+        def add_class(class_desc):
+            classes.append(class_desc)
+            for c in class_desc.inner_classes():
+                add_class(c)
+        for c in api.classes():
+            add_class(c)
+        return classes
+
+    def require_type(self, t):
+        if t.is_class():
+            self.require_class(t.as_class())
+
+    def require_signature(self, desc, returns=True):
+        if returns:
+            self.require_type(desc.return_type())
+        for p in desc.parameters():
+            self.require_type(p.type())
+
+    def require_class(self, class_desc):
+        """Marks a class, and everything it requires, as used."""
+        if class_desc.name() in self.classes:
+            return
+        self.classes.add(class_desc.name())
+
+        for c in class_desc.containing_classes():
+            self.require_class(self.api.get_class_by_name(c))
+        if class_desc.has_parent():
+            self.require_class(class_desc.parent())
+        for f in class_desc.fields():
+            self.require_type(f.type())
+        for ctor in class_desc.constructors():
+            self.require_signature(ctor, returns=False)
+        for cb in class_desc.callbacks():
+            self.require_signature(cb)
+        for s in class_desc.services():
+            if s.name() in extras_services.get(class_desc.name(), []):
+                self.require_service(s)
+
+    def require_service(self, service):
+        """Marks a service, and everything it requires, as used."""
+        if id(service.description) in self.services:
+            return
+        self.services.add(id(service.description))
+        if service.owning_class() is not None:
+            self.require_class(service.owning_class())
+        self.require_signature(service)
+
+    def find_class_services(self, class_desc, name):
+        """
+        Returns the services with a given name in a class or, if it has
+        none, in its closest base class that does. The name `*` returns
+        all the services of the class and of its base classes.
+        """
+        services = [s for s in class_desc.services() if name == "*" or s.name() == name]
+        if not class_desc.has_parent() or (services and name != "*"):
+            return services
+        return services + self.find_class_services(class_desc.parent(), name)
+
+    def require(self, entry):
+        """Marks a usage manifest entry, and everything it requires, as used."""
+        if "::" not in entry:
+            if self.api.is_class(entry):
+                self.require_class(self.api.get_class_by_name(entry))
+                return
+            services = [s for s in self.api.services() if s.name() == entry]
+            if not services:
+                raise UsageError("'{}' is neither a class nor a top-level service".format(entry))
+        else:
+            class_name, name = entry.rsplit("::", 1)
+            class_name = class_name.split("::")[-1]
+            if class_name == "*":
+                services = [s for c in self.all_classes for s in c.services() if s.name() == name]
+            elif self.api.is_class(class_name):
+                class_desc = self.api.get_class_by_name(class_name)
+                self.require_class(class_desc)
+                services = self.find_class_services(class_desc, name)
+            else:
+                raise UsageError("'{}' is not a class".format(class_name))
+            if not services and name != "*":
+                raise UsageError("no service named '{}' in '{}'".format(name, class_name))
+        for s in services:
+            self.require_service(s)
+
+    def resolve(self, entries):
+        for s in self.api.services():
+            if s.sets_allocators():
+                self.require_service(s)
+        for e in entries:
+            self.require(e)
+
+def prune_api(api, entries):
+    """
+    Returns a copy of an API description containing only the parts
+    required by a list of usage manifest entries.
+    """
+    resolver = UsageResolver(api)
+    resolver.resolve(entries)
+
+    def keep_services(services):
+        return [s for s in services if id(s) in resolver.services]
+
+    def prune_classes(classes):
+        pruned = []
+        for c in classes:
+            if c["name"] in resolver.classes:
+                c = dict(c, services=keep_services(c["services"]), types=prune_classes(c["types"]))
+                pruned.append(c)
+        return pruned
+
+    description = dict(api.description, classes=prune_classes(api.description["classes"]),
+                       services=keep_services(api.description["services"]))
+    return APIDescription(copy.deepcopy(description))
+
+# manifest extraction ################################################
+
+def scan_sources(api, sources, c_prefix="JB"):
+    """
+    Extracts the usage manifest entries of client sources, given as a list
+    of strings, written against the C++ or the flat C client API.
+    """
+    class_names = set(c.name() for c in UsageResolver(api).all_classes)
+    class_services = set(s.name() for c in UsageResolver(api).all_classes for s in c.services())
+    # the bulk variant of a batchable service uses the service
+    bulk_services = dict((s.name() + "Bulk", s.name()) for c in UsageResolver(api).all_classes for s in c.services() if s.is_batchable())
+    services = set(s.name() for s in api.services())
+
+    # C API functions are mapped back to the services they call. All the
+    # other functions of a class (constructors, field getters, ...) start
+    # with the name of its handle, and simply use the class.
+    c_gen = cgen.CGenerator(api, "", prefix=c_prefix)
+    c_functions = {}
+    for c in c_gen.gen_class_list(api):
+        for s in c_gen.get_class_services(c):
+            c_functions[c_gen.get_service_function_name(c, s)] = "{}::{}".format(c.name(), s.name())
+    for s in api.services():
+        c_functions["{}_{}".format(c_prefix, s.name())] = s.name()
+    c_handles = sorted(((c_gen.get_handle_name(c), c.name()) for c in c_gen.gen_class_list(api)),
+                       key=lambda h: len(h[0]), reverse=True)
+
+    def find_handle(name):
+        for handle, class_name in c_handles:
+            if name == handle or name.startswith(handle + "_"):
+                return class_name
+        return None
+
+    entries = set()
+    for source in sources:
+        for m in re.finditer(r"\b([A-Za-z_]\w*)(\s*\()?", source):
+            name, is_call = m.group(1), m.group(2) is not None
+            if name in c_functions:
+                entries.add(c_functions[name])
+            elif find_handle(name) is not None:
+                entries.add(find_handle(name))
+            elif name in class_names:
+                entries.add(name)
+            elif is_call and name in services:
+                entries.add(name)
+            elif is_call and name in class_services:
+                entries.add("*::{}".format(name))
+            elif is_call and name in bulk_services:
+                entries.add("*::{}".format(bulk_services[name]))
+    return sorted(entries)
+
+def scan_trace(api, data):
+    """Extracts the usage manifest entries of a call trace recorded with the API."""
+    generator = tracereplay.ReplayGenerator(api)
+    records = generator.read_trace(data)
+
+    entries = set()
+    def visit(call):
+        if not isinstance(call, tracereplay.TraceCall):
+            return
+        if call.class_desc is None:
+            entries.add(call.desc.name())
+        elif isinstance(call.desc, APIService) and not isinstance(call.desc, (APIConstructor, APICallback)):
+            entries.add("{}::{}".format(call.class_desc.name(), call.desc.name()))
+        else:
+            entries.add(call.class_desc.name())
+        for c in call.children:
+            visit(c)
+    for r in records:
+        visit(r)
+    return sorted(entries)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Extract the usage manifest of a client of an API.")
+    parser.add_argument("--output", type=str,
+                        help="path of the manifest to write (default: standard output)")
+    parser.add_argument("--trace", action="append", default=[],
+                        help="call trace recorded with the API (may be repeated)")
+    parser.add_argument("--c-prefix", type=str, default="JB",
+                        help="prefix of the flat C API used by the client sources")
+    parser.add_argument("description", help="path to the API description file")
+    parser.add_argument("sources", nargs="*", help="client source files to scan")
+    args = parser.parse_args()
+
+    with open(args.description) as api_src:
+        api_description = APIDescription.load_json_file(api_src)
+
+    sources = []
+    for path in args.sources:
+        with open(path) as f:
+            sources.append(f.read())
+    entries = scan_sources(api_description, sources, c_prefix=args.c_prefix)
+    for path in args.trace:
+        with open(path, "rb") as f:
+            try:
+                entries += scan_trace(api_description, f.read())
+            except tracereplay.TraceError as e:
+                sys.exit("error: {}: {}".format(path, e))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            write_manifest(f, entries)
+    else:
+        write_manifest(sys.stdout, entries)
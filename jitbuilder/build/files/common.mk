@@ -285,7 +285,19 @@ CPP_GENERATED_API_HEADERS+=\
     $(CPP_GENERATED_HEADER_DIR)/VirtualMachineState.hpp \
     $(CPP_GENERATED_HEADER_DIR)/JitBuilder.hpp
 
+C_GENERATED_SOURCE_DIR=$(JIT_PRODUCT_DIR)/client/c
+C_GENERATED_API_SOURCES+=\
+    $(C_GENERATED_SOURCE_DIR)/JitBuilderC.cpp \
+    $(C_GENERATED_SOURCE_DIR)/JitBuilderDispatch.cpp
+
+C_GENERATED_HEADER_DIR=$(JIT_PRODUCT_DIR)/release/c/include
+C_GENERATED_API_HEADERS+=\
+    $(C_GENERATED_HEADER_DIR)/JitBuilderC.h \
+    $(C_GENERATED_HEADER_DIR)/JitBuilderDispatch.h
+
 CPP_API_GENERATOR=$(JIT_PRODUCT_DIR)/apigen/cppgen.py
+C_API_GENERATOR=$(JIT_PRODUCT_DIR)/apigen/cgen.py
+C_DISPATCH_GENERATOR=$(JIT_PRODUCT_DIR)/apigen/dispatchgen.py
 JITBUILDER_API_DESCRIPTION=$(JIT_PRODUCT_DIR)/apigen/jitbuilder.api.json
 
 include $(JIT_MAKE_DIR)/files/host/$(HOST_ARCH).mk
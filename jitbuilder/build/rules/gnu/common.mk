@@ -33,6 +33,7 @@ JIT_PRODUCT_BACKEND_OBJECTS=$(patsubst %,$(FIXED_OBJBASE)/%.o,$(basename $(JIT_P
 JIT_PRODUCT_OBJECTS=$(patsubst %,$(FIXED_OBJBASE)/%.o,$(basename $(JIT_PRODUCT_SOURCE_FILES)))
 
 CPP_API_OBJECTS=$(patsubst %,$(FIXED_OBJBASE)/%.o,$(basename $(CPP_GENERATED_API_SOURCES)))
+C_API_OBJECTS=$(patsubst %,$(FIXED_OBJBASE)/%.o,$(basename $(C_GENERATED_API_SOURCES)))
 
 # build the jitbuilder library with all the object files
 CPP_JIT_PRODUCT_BACKEND_LIBRARY=$(FIXED_DLL_DIR)/cpp/$(LIBPREFIX)$(PRODUCT_NAME).a
@@ -45,12 +46,12 @@ JIT_PRODUCT_BUILDNAME_SRC=$(FIXED_OBJBASE)/$(JIT_OMR_DIRTY_DIR)/env/TRBuildName.
 JIT_PRODUCT_BUILDNAME_OBJ=$(FIXED_OBJBASE)/$(JIT_OMR_DIRTY_DIR)/env/TRBuildName.o
 JIT_PRODUCT_BACKEND_OBJECTS+=$(JIT_PRODUCT_BUILDNAME_OBJ)
 
-$(CPP_JIT_PRODUCT_BACKEND_LIBRARY): $(CPP_API_OBJECTS)
+$(CPP_JIT_PRODUCT_BACKEND_LIBRARY): $(CPP_API_OBJECTS) $(C_API_OBJECTS)
 jit: $(CPP_JIT_PRODUCT_BACKEND_LIBRARY)
 
-$(CPP_JIT_PRODUCT_BACKEND_LIBRARY): $(JIT_PRODUCT_BACKEND_OBJECTS) $(CPP_API_OBJECTS)
+$(CPP_JIT_PRODUCT_BACKEND_LIBRARY): $(JIT_PRODUCT_BACKEND_OBJECTS) $(CPP_API_OBJECTS) $(C_API_OBJECTS)
 	@mkdir -p $(dir $@)
-	$(AR_CMD) rcsv $@ $(JIT_PRODUCT_BACKEND_OBJECTS) $(CPP_API_OBJECTS)
+	$(AR_CMD) rcsv $@ $(JIT_PRODUCT_BACKEND_OBJECTS) $(CPP_API_OBJECTS) $(C_API_OBJECTS)
 
 jit_clean::
 	rm -f $(CPP_JIT_PRODUCT_BACKEND_LIBRARY)
@@ -101,9 +102,22 @@ $(firstword $(CPP_API_FILES)): $(FIXED_SRCBASE)/$(JITBUILDER_API_DESCRIPTION) $(
 
 $(wordlist 2, $(words $(CPP_API_FILES)), $(CPP_API_FILES)): $(firstword $(CPP_API_FILES))
 
+# The flat C API is generated the same way, into its own directories
+C_API_FILES=$(addprefix $(FIXED_OBJBASE)/, $(C_GENERATED_API_SOURCES)) $(addprefix $(FIXED_SRCBASE)/, $(C_GENERATED_API_HEADERS))
+C_API_SOURCE_DIR=$(FIXED_OBJBASE)/$(C_GENERATED_SOURCE_DIR)
+C_API_HEADER_DIR=$(FIXED_SRCBASE)/$(C_GENERATED_HEADER_DIR)
+
+$(firstword $(C_API_FILES)): $(FIXED_SRCBASE)/$(JITBUILDER_API_DESCRIPTION) $(FIXED_SRCBASE)/$(C_API_GENERATOR) $(FIXED_SRCBASE)/$(C_DISPATCH_GENERATOR)
+	@mkdir -p $(C_API_SOURCE_DIR)
+	@mkdir -p $(C_API_HEADER_DIR)
+	$(PYTHON_PATH) $(FIXED_SRCBASE)/$(C_API_GENERATOR) $(FIXED_SRCBASE)/$(JITBUILDER_API_DESCRIPTION) --sourcedir $(C_API_SOURCE_DIR) --headerdir $(C_API_HEADER_DIR)
+	$(PYTHON_PATH) $(FIXED_SRCBASE)/$(C_DISPATCH_GENERATOR) $(FIXED_SRCBASE)/$(JITBUILDER_API_DESCRIPTION) --sourcedir $(C_API_SOURCE_DIR) --headerdir $(C_API_HEADER_DIR)
+
+$(wordlist 2, $(words $(C_API_FILES)), $(C_API_FILES)): $(firstword $(C_API_FILES))
+
 # remove generated files
 jit_clean::
-	rm -f $(CPP_API_FILES)
+	rm -f $(CPP_API_FILES) $(C_API_FILES)
 
 #
 # This part calls the "RULE.x" macros for each source file
@@ -119,3 +133,7 @@ $(foreach SRCFILE,$(JIT_PRODUCT_SOURCE_FILES),\
 $(foreach SRCFILE,$(CPP_GENERATED_API_SOURCES),\
     $(call RULE$(suffix $(SRCFILE)),$(FIXED_OBJBASE)/$(basename $(SRCFILE))$(OBJSUFF),$(FIXED_OBJBASE)/$(SRCFILE)) \
  )
+
+$(foreach SRCFILE,$(C_GENERATED_API_SOURCES),\
+    $(call RULE$(suffix $(SRCFILE)),$(FIXED_OBJBASE)/$(basename $(SRCFILE))$(OBJSUFF),$(FIXED_OBJBASE)/$(SRCFILE)) \
+ )
@@ -21,6 +21,8 @@
  *******************************************************************************/
 
 #include <stdio.h>
+#include <string.h>
+#include "AtomicSupport.hpp"
 #include "codegen/CodeGenerator.hpp"
 #include "compile/CompilationTypes.hpp"
 #include "compile/Method.hpp"
@@ -184,6 +186,18 @@ internal_initializeJit()
    return initializeJitBuilder(0, 0, 0, (char *)"-Xjit:acceptHugeMethods,enableBasicBlockHoisting,omitFramePointer,useILValidator");
    }
 
+// The client APIs (C++ and C) set the allocators and impl getters of the
+// ilgen classes, which are static and so shared by all the client APIs
+// linked into a process. A client API claims them before setting them; only
+// the first one to do so may set them, and the others fail to initialize.
+bool
+internal_claimClientAllocators(const char *clientAPI)
+   {
+   static volatile uintptr_t owner = 0;
+   uintptr_t previous = VM_AtomicSupport::lockCompareExchange(&owner, 0, (uintptr_t)clientAPI);
+   return previous == 0 || strcmp((const char *)previous, clientAPI) == 0;
+   }
+
 int32_t
 internal_compileMethodBuilder(TR::MethodBuilder *m, void **entry)
    {
@@ -0,0 +1,329 @@
+###############################################################################
+# Copyright (c) 2026, 2026 IBM Corp. and others
+#
+# This program and the accompanying materials are made available under
+# the terms of the Eclipse Public License 2.0 which accompanies this
+# distribution and is available at https://www.eclipse.org/legal/epl-2.0/
+# or the Apache License, Version 2.0 which accompanies this distribution and
+# is available at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# This Source Code may also be made available under the following
+# Secondary Licenses when the conditions for such availability set
+# forth in the Eclipse Public License, v. 2.0 are satisfied: GNU
+# General Public License, version 2 with the GNU Classpath
+# Exception [1] and GNU General Public License, version 2 with the
+# OpenJDK Assembly Exception [2].
+#
+# [1] https://www.gnu.org/software/classpath/license.html
+# [2] http://openjdk.java.net/legal/assembly-exception.html
+#
+# SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+###############################################################################
+
+'''
+Runs the JitBuilder samples as a throughput benchmark suite.
+
+Every sample is run a number of times, after some warmup runs, and the time
+spent in each of its phases is recorded. The samples announce their phases
+on standard output with lines such as `Step 4: compile MatMult method
+builder`, so the runner runs each sample on a pseudo-terminal (which makes
+its output line buffered) and timestamps those lines as they arrive:
+
+- `compile`: the `define` and `compile` steps, that is building the type
+  dictionary and method builders, generating IL, and compiling it
+- `execute`: the `invoke` and `run` steps, which call the compiled code
+- `total`: the whole process, including JIT initialization and shutdown
+
+Results can be saved as JSON and compared against a saved baseline:
+
+   python benchmark.py --runs 20 --save baseline.json
+   python benchmark.py --runs 20 --baseline baseline.json --threshold 5
+
+The samples are built with the Makefile in this directory (`--build` runs
+`make` for the benchmarked samples first). Pass `--bindir` to use samples
+built elsewhere, for example by CMake.
+'''
+
+import os
+import re
+import sys
+import json
+import math
+import time
+import argparse
+import threading
+import subprocess
+
+try:
+   import pty
+except ImportError:
+   pty = None
+
+# The benchmark runner reuses the tool testing framework of the compiler tools.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..', 'tools', 'compiler', 'OMRChecker'))
+import testing.tool as tool
+import testing.tooltester as tooltester
+
+# Samples benchmarked by default, along with their arguments. Samples whose
+# phases interleave (the async and concurrent compile samples) or that do
+# not compile and run any code are left out.
+samples = [ ('call', [])
+          , ('conditionals', [])
+          , ('conststring', [])
+          , ('dotproduct', [])
+          , ('fieldaddress', [])
+          , ('iterfib', [])
+          , ('linkedlist', [])
+          , ('localarray', [])
+          , ('mandelbrot', ['1000', os.devnull])
+          , ('matmult', [])
+          , ('nestedloop', [])
+          , ('operandarraytests', [])
+          , ('operandstacktests', [])
+          , ('pointer', [])
+          , ('pow2', [])
+          , ('recfib', [])
+          , ('simple', [])
+          , ('structarray', [])
+          , ('switch', [])
+          , ('tableswitch', [])
+          , ('union', [])
+          , ('vmregister', [])
+          , ('worklist', [])
+          ]
+
+# Samples that print no PASS verdict; they only have to exit successfully.
+samplesWithoutVerdict = set(['simple', 'union', 'vmregister'])
+
+phases = ['compile', 'execute', 'total']
+
+stepPhases = { 'define': 'compile', 'create': 'compile', 'compile': 'compile', 'invoke': 'execute', 'run': 'execute' }
+
+stepPattern = re.compile(r'^Step \d+:\s*(\w+)')
+
+
+def getPhaseTimes(lines, start, end):
+   '''
+   Computes the time spent in each phase of a sample run from its output
+   lines, given as a list of `(timestamp, line)` pairs, and the start and end
+   times of the run. A step lasts from its `Step` line to the next one.
+   '''
+
+   times = dict((p, 0.0) for p in phases)
+   times['total'] = end - start
+   steps = [(t, stepPattern.match(l).group(1).lower()) for t, l in lines if stepPattern.match(l)]
+   for i, (t, verb) in enumerate(steps):
+      phase = stepPhases.get(verb)
+      if phase is not None:
+         times[phase] += (steps[i + 1][0] if i + 1 < len(steps) else end) - t
+   return times
+
+
+class SampleOutput(tool.ToolOutput):
+   '''Represents the output of a sample run, with the timing of its phases.'''
+
+   def __init__(self, returncode, stdout, times, timedOut=False):
+      # ToolOutput is an old-style class on Python 2
+      tool.ToolOutput.__init__(self, returncode, b'', stdout, timedOut)
+      self.times = times
+
+
+class SampleTool(tool.Tool):
+   '''
+   A wrapper running a sample and timing its phases. Where pseudo-terminals
+   are not available, only the total time of the sample is recorded.
+   '''
+
+   def __init__(self, binDir, **options):
+      super(SampleTool, self).__init__(lambda args: [os.path.join(binDir, args[0])] + args[1:], dict(os.environ), **options)
+
+   def call(self, args, timeout=None):
+      command = self.cmdBuilder(args)
+      timeout = timeout if timeout is not None else self.timeout
+      if pty is None:
+         start = time.time()
+         log = super(SampleTool, self).call(args, timeout)
+         times = dict((p, None) for p in phases)
+         times['total'] = time.time() - start
+         log.output = SampleOutput(log.output.returncode, log.output.stdout + log.output.stderr, times, log.output.timedOut)
+         return log
+
+      master, slave = pty.openpty()
+      start = time.time()
+      p = subprocess.Popen(command, stdin=open(os.devnull), stdout=slave, stderr=slave, env=self.env)
+      os.close(slave)
+      # as in `tool.Tool.call`, the timer checks that the sample was not
+      # reaped before killing it, as its pid may have been reused
+      timedOut = []
+      lock = threading.Lock()
+      timer = None
+      if timeout is not None:
+         def kill():
+            with lock:
+               if p.returncode is None:
+                  timedOut.append(True)
+                  p.kill()
+         timer = threading.Timer(timeout, kill)
+         timer.daemon = True
+         timer.start()
+
+      lines = []
+      pending = b''
+      while True:
+         try:
+            data = os.read(master, 65536)
+         except OSError:
+            # reading the master side of a closed pseudo-terminal fails with EIO
+            break
+         if not data:
+            break
+         now = time.time()
+         pending += data
+         while b'\n' in pending:
+            line, pending = pending.split(b'\n', 1)
+            lines.append((now, line.rstrip(b'\r').decode('utf-8', 'replace')))
+      try:
+         cpuTime, peakRss = tool.waitForProcess(p, lock)
+      finally:
+         if timer is not None:
+            timer.cancel()
+      end = time.time()
+      os.close(master)
+
+      stdout = '\n'.join(l for t, l in lines).encode('utf-8') + pending
+      output = SampleOutput(p.returncode, stdout, getPhaseTimes(lines, start, end), bool(timedOut))
+      return tool.ToolExecutionLog(args, command, output, end - start, cpuTime, peakRss)
+
+
+class SampleBenchmark(tooltester.TestCase):
+   '''Runs a sample a number of times, checking that every run passes.'''
+
+   def __init__(self, name, args, warmup, runs):
+      super(SampleBenchmark, self).__init__(name, None)
+      self.args = args
+      self.hasVerdict = name not in samplesWithoutVerdict
+      self.warmup = warmup
+      self.runs = runs
+      self.times = dict((p, []) for p in phases)
+
+   def runSample(self):
+      output = self.invokeTool([self.name] + self.args)
+      self.assertEqual(0, output.returncode, 'sample failed')
+      if self.hasVerdict:
+         self.assertOutput(lambda output: b'PASS' in output.stdout, 'sample did not pass')
+      return output
+
+   def run(self):
+      for i in range(self.warmup):
+         self.runSample()
+      # only keep the log of the last run, so failures show a single run
+      del self.log[:-1]
+      for i in range(self.runs):
+         output = self.runSample()
+         for p in phases:
+            if output.times[p] is not None:
+               self.times[p].append(output.times[p])
+         del self.log[:-1]
+
+
+# statistics ##################################################################
+
+def median(values):
+   s = sorted(values)
+   n = len(s)
+   return s[n // 2] if n % 2 else (s[n // 2 - 1] + s[n // 2]) / 2.0
+
+def getStats(values):
+   '''Returns the minimum, median, mean, and standard deviation of a list of times, or None.'''
+
+   if not values:
+      return None
+   mean = sum(values) / float(len(values))
+   stdev = math.sqrt(sum((v - mean) ** 2 for v in values) / (len(values) - 1)) if len(values) > 1 else 0.0
+   return { 'min': min(values), 'median': median(values), 'mean': mean, 'stdev': stdev }
+
+def printResults(results):
+   print('{:<20} {:>24} {:>24} {:>24}'.format('sample', *['{} (ms)'.format(p) for p in phases]))
+   for name in sorted(results):
+      cells = []
+      for p in phases:
+         s = getStats(results[name][p])
+         cells.append('-' if s is None else '{:.3f} +- {:.3f}'.format(s['median'] * 1000, s['stdev'] * 1000))
+      print('{:<20} {:>24} {:>24} {:>24}'.format(name, *cells))
+
+def compareResults(baseline, results, threshold):
+   '''
+   Prints the change of the median time of every phase of every sample
+   against a baseline, returning the list of `(sample, phase, change)`
+   regressions above a threshold percentage.
+   '''
+
+   regressions = []
+   print('{:<20} {:>24} {:>24} {:>24}'.format('sample', *['{} change'.format(p) for p in phases]))
+   for name in sorted(results):
+      if name not in baseline:
+         continue
+      cells = []
+      for p in phases:
+         old, new = getStats(baseline[name][p]), getStats(results[name][p])
+         if old is None or new is None or old['median'] == 0:
+            cells.append('-')
+            continue
+         change = (new['median'] - old['median']) / old['median'] * 100
+         # changes within the noise of either run are not reported as regressions
+         noise = max(old['stdev'], new['stdev']) / old['median'] * 100
+         cells.append('{:+.1f}%{}'.format(change, '' if abs(change) > noise else ' ~'))
+         if threshold is not None and change > max(threshold, noise):
+            regressions.append((name, p, change))
+      print('{:<20} {:>24} {:>24} {:>24}'.format(name, *cells))
+   return regressions
+
+
+if __name__ == '__main__':
+   argParser = argparse.ArgumentParser(description='Benchmark the JitBuilder samples.')
+   argParser.add_argument('--bindir', dest='BINDIR', type=str, default=os.path.dirname(os.path.abspath(__file__)),
+                          help='directory containing the sample executables')
+   argParser.add_argument('--build', dest='BUILD', action='store_true', help='build the samples with make first')
+   argParser.add_argument('--warmup', dest='WARMUP', type=int, default=2, help='number of untimed runs of each sample')
+   argParser.add_argument('--runs', dest='RUNS', type=int, default=10, help='number of timed runs of each sample')
+   argParser.add_argument('--filter', dest='FILTER', type=str, help='only run the samples matching this regular expression')
+   argParser.add_argument('--save', dest='SAVE', type=str, help='save the results to a JSON file')
+   argParser.add_argument('--baseline', dest='BASELINE', type=str, help='compare the results with those saved in a JSON file')
+   argParser.add_argument('--threshold', dest='THRESHOLD', type=float,
+                          help='fail if a median time regressed by more than this percentage of the baseline')
+   # samples are run one at a time, so that they do not compete for the CPUs,
+   # every time, and their output is kept whole to time their phases
+   tooltester.addTestArgs(argParser, parallel=False, cached=False, limitOutput=False)
+   args = vars(argParser.parse_args(sys.argv[1:]))
+
+   selected = [(n, a) for n, a in samples if args['FILTER'] is None or re.search(args['FILTER'], n)]
+   if args['BUILD']:
+      if subprocess.call(['make', '-C', os.path.dirname(os.path.abspath(__file__))] + [n for n, a in selected]) != 0:
+         exit(1)
+
+   benchmarks = [SampleBenchmark(n, a, args['WARMUP'], args['RUNS']) for n, a in selected]
+   testSuite = tooltester.TestSuite(SampleTool(os.path.abspath(args['BINDIR']), **tooltester.getToolOptions(args)), benchmarks)
+   runner = tooltester.SuiteRunner(testSuite, args['MCOMMAND'], args['MRETURN'], args['MSTDERR'], args['MSTDOUT'])
+   runner.runTests()
+   runner.printSummary()
+   tooltester.reportResults(runner, args, 'JitBuilderSamples')
+   print('')
+
+   results = dict((b.name, b.times) for b in benchmarks if b.times['total'])
+   printResults(results)
+
+   if args['SAVE']:
+      with open(args['SAVE'], 'w') as f:
+         json.dump(results, f, indent=2, sort_keys=True)
+
+   regressions = []
+   if args['BASELINE']:
+      with open(args['BASELINE']) as f:
+         baseline = json.load(f)
+      print('')
+      regressions = compareResults(baseline, results, args['THRESHOLD'])
+      for name, p, change in regressions:
+         print('Regression: ' + name + ' ' + p + ' time grew by {:.1f}%'.format(change))
+
+   if runner.testsFailed != 0 or regressions:
+      exit(1)
@@ -0,0 +1,141 @@
+/*******************************************************************************
+ * Copyright (c) 2026, 2026 IBM Corp. and others
+ *
+ * This program and the accompanying materials are made available under
+ * the terms of the Eclipse Public License 2.0 which accompanies this
+ * distribution and is available at https://www.eclipse.org/legal/epl-2.0/
+ * or the Apache License, Version 2.0 which accompanies this distribution and
+ * is available at https://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * This Source Code may also be made available under the following
+ * Secondary Licenses when the conditions for such availability set
+ * forth in the Eclipse Public License, v. 2.0 are satisfied: GNU
+ * General Public License, version 2 with the GNU Classpath
+ * Exception [1] and GNU General Public License, version 2 with the
+ * OpenJDK Assembly Exception [2].
+ *
+ * [1] https://www.gnu.org/software/classpath/license.html
+ * [2] http://openjdk.java.net/legal/assembly-exception.html
+ *
+ * SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+ *******************************************************************************/
+
+
+/*
+ * Example of compiling methods in the background with the asynchronous
+ * variant of compileMethodBuilder.
+ *
+ * All the basic samples are queued for compilation up front. While they are
+ * being compiled on the JIT's worker threads, the main thread keeps running
+ * (standing in for an interpreter) and picks up each compiled method as its
+ * future becomes ready. The completion callback is only used to count the
+ * finished compilations.
+ */
+
+#include <atomic>
+#include <chrono>
+#include <future>
+#include <iostream>
+#include <stdlib.h>
+#include <stdint.h>
+#include <vector>
+
+#include "Conditionals.hpp"
+#include "IterativeFib.hpp"
+#include "NestedLoop.hpp"
+#include "Pow2.hpp"
+#include "Simple.hpp"
+#include "Worklist.hpp"
+
+using std::cout;
+using std::cerr;
+
+struct PendingCompile
+   {
+   const char *name;
+   OMR::JitBuilder::TypeDictionary *types;
+   OMR::JitBuilder::MethodBuilder *method;
+   void *entry;
+   std::future<int32_t> result;
+   };
+
+template <typename M>
+static void
+queueCompile(std::vector<PendingCompile> &pending, const char *name, std::atomic<int32_t> &completed)
+   {
+   pending.push_back(PendingCompile());
+   PendingCompile &p = pending.back();
+   p.name = name;
+   p.types = new OMR::JitBuilder::TypeDictionary();
+   p.method = new M(p.types);
+   p.entry = 0;
+   p.result = compileMethodBuilderAsync(p.method, &p.entry, [&completed](int32_t rc) { completed++; });
+   }
+
+int
+main(int argc, char *argv[])
+   {
+   cout << "Step 1: initialize JIT\n";
+   bool initialized = initializeJit();
+   if (!initialized)
+      {
+      cerr << "FAIL: could not initialize JIT\n";
+      exit(-1);
+      }
+
+   cout << "Step 2: queue compilations\n";
+   std::atomic<int32_t> completed(0);
+   std::vector<PendingCompile> pending;
+   pending.reserve(6); // entries must not move while their compilation is queued
+   queueCompile<ConditionalMethod>(pending, "Conditionals", completed);
+   queueCompile<IterativeFibonnaciMethod>(pending, "IterativeFib", completed);
+   queueCompile<NestedLoopMethod>(pending, "NestedLoop", completed);
+   queueCompile<Pow2Method>(pending, "Pow2", completed);
+   queueCompile<SimpleMethod>(pending, "Simple", completed);
+   queueCompile<WorklistMethod>(pending, "Worklist", completed);
+
+   cout << "Step 3: keep running while the methods compile\n";
+   int32_t failures = 0;
+   size_t ready = 0;
+   uint64_t interpreterSteps = 0;
+   while (ready < pending.size())
+      {
+      interpreterSteps++;
+      for (size_t i = 0; i < pending.size(); i++)
+         {
+         PendingCompile &p = pending[i];
+         if (!p.result.valid() || p.result.wait_for(std::chrono::seconds(0)) != std::future_status::ready)
+            continue;
+         int32_t rc = p.result.get();
+         ready++;
+         if (rc != 0 || p.entry == NULL)
+            {
+            cerr << "FAIL: compilation of " << p.name << " returned " << rc << "\n";
+            failures++;
+            }
+         else
+            {
+            cout << p.name << " compiled after " << interpreterSteps << " interpreter steps\n";
+            }
+         }
+      }
+
+   cout << "Step 4: shutdown JIT\n";
+   waitForAsyncServices();
+   shutdownJit();
+
+   for (size_t i = 0; i < pending.size(); i++)
+      {
+      delete pending[i].method;
+      delete pending[i].types;
+      }
+
+   if (failures != 0 || completed != (int32_t) pending.size())
+      {
+      cerr << "FAIL: " << failures << " compilations failed, " << completed << " completion callbacks\n";
+      exit(-2);
+      }
+
+   cout << "PASS: " << pending.size() << " methods compiled in the background\n";
+   return 0;
+   }
@@ -0,0 +1,136 @@
+/*******************************************************************************
+ * Copyright (c) 2026, 2026 IBM Corp. and others
+ *
+ * This program and the accompanying materials are made available under
+ * the terms of the Eclipse Public License 2.0 which accompanies this
+ * distribution and is available at https://www.eclipse.org/legal/epl-2.0/
+ * or the Apache License, Version 2.0 which accompanies this distribution and
+ * is available at https://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * This Source Code may also be made available under the following
+ * Secondary Licenses when the conditions for such availability set
+ * forth in the Eclipse Public License, v. 2.0 are satisfied: GNU
+ * General Public License, version 2 with the GNU Classpath
+ * Exception [1] and GNU General Public License, version 2 with the
+ * OpenJDK Assembly Exception [2].
+ *
+ * [1] https://www.gnu.org/software/classpath/license.html
+ * [2] http://openjdk.java.net/legal/assembly-exception.html
+ *
+ * SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+ *******************************************************************************/
+
+
+/*
+ * Stress test for compiling methods from several threads at once.
+ *
+ * Each thread repeatedly picks one of the basic samples and compiles it with
+ * its own TypeDictionary and MethodBuilder; nothing but the JIT itself is
+ * shared between threads. The sample sources are compiled with `main` renamed
+ * so that their MethodBuilder classes can be linked into this program.
+ *
+ * Usage: concurrentcompile [threads [iterations]]
+ */
+
+#include <atomic>
+#include <iostream>
+#include <stdlib.h>
+#include <stdint.h>
+#include <thread>
+#include <vector>
+
+#include "Conditionals.hpp"
+#include "IterativeFib.hpp"
+#include "NestedLoop.hpp"
+#include "Pow2.hpp"
+#include "Simple.hpp"
+#include "Worklist.hpp"
+
+using std::cout;
+using std::cerr;
+
+typedef OMR::JitBuilder::MethodBuilder *(MethodFactory)(OMR::JitBuilder::TypeDictionary *);
+
+template <typename M>
+static OMR::JitBuilder::MethodBuilder *
+createMethod(OMR::JitBuilder::TypeDictionary *types)
+   {
+   return new M(types);
+   }
+
+static struct
+   {
+   const char *name;
+   MethodFactory *create;
+   } samples[] =
+   {
+   { "Conditionals", createMethod<ConditionalMethod> },
+   { "IterativeFib", createMethod<IterativeFibonnaciMethod> },
+   { "NestedLoop",   createMethod<NestedLoopMethod> },
+   { "Pow2",         createMethod<Pow2Method> },
+   { "Simple",       createMethod<SimpleMethod> },
+   { "Worklist",     createMethod<WorklistMethod> },
+   };
+
+static const int32_t numSamples = sizeof(samples) / sizeof(samples[0]);
+
+static std::atomic<int32_t> nextCompile(0);
+static std::atomic<int32_t> failures(0);
+
+static void
+compileSamples(int32_t totalCompiles)
+   {
+   for (int32_t i = nextCompile++; i < totalCompiles; i = nextCompile++)
+      {
+      int32_t s = i % numSamples;
+      OMR::JitBuilder::TypeDictionary types;
+      OMR::JitBuilder::MethodBuilder *method = samples[s].create(&types);
+      void *entry = 0;
+      int32_t rc = compileMethodBuilder(method, &entry);
+      if (rc != 0 || entry == NULL)
+         {
+         cerr << "FAIL: compilation " << i << " of " << samples[s].name << " returned " << rc << "\n";
+         failures++;
+         }
+      delete method;
+      }
+   }
+
+int
+main(int argc, char *argv[])
+   {
+   int32_t numThreads = argc > 1 ? atoi(argv[1]) : (int32_t) std::thread::hardware_concurrency();
+   int32_t iterations = argc > 2 ? atoi(argv[2]) : 4;
+   if (numThreads <= 0)
+      numThreads = 4;
+   if (iterations <= 0)
+      iterations = 1;
+
+   cout << "Step 1: initialize JIT\n";
+   bool initialized = initializeJit();
+   if (!initialized)
+      {
+      cerr << "FAIL: could not initialize JIT\n";
+      exit(-1);
+      }
+
+   int32_t totalCompiles = numThreads * iterations * numSamples;
+   cout << "Step 2: compile " << totalCompiles << " methods on " << numThreads << " threads\n";
+   std::vector<std::thread> threads;
+   for (int32_t t = 0; t < numThreads; t++)
+      threads.push_back(std::thread(compileSamples, totalCompiles));
+   for (int32_t t = 0; t < numThreads; t++)
+      threads[t].join();
+
+   cout << "Step 3: shutdown JIT\n";
+   shutdownJit();
+
+   if (failures != 0)
+      {
+      cerr << "FAIL: " << failures << " of " << totalCompiles << " compilations failed\n";
+      exit(-2);
+      }
+
+   cout << "PASS: " << totalCompiles << " compilations succeeded\n";
+   return 0;
+   }
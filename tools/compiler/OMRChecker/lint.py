@@ -0,0 +1,673 @@
+#! /usr/bin/python
+
+###############################################################################
+# Copyright (c) 2026, 2026 IBM Corp. and others
+#
+# This program and the accompanying materials are made available under
+# the terms of the Eclipse Public License 2.0 which accompanies this
+# distribution and is available at https://www.eclipse.org/legal/epl-2.0/
+# or the Apache License, Version 2.0 which accompanies this distribution and
+# is available at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# This Source Code may also be made available under the following
+# Secondary Licenses when the conditions for such availability set
+# forth in the Eclipse Public License, v. 2.0 are satisfied: GNU
+# General Public License, version 2 with the GNU Classpath
+# Exception [1] and GNU General Public License, version 2 with the
+# OpenJDK Assembly Exception [2].
+#
+# [1] https://www.gnu.org/software/classpath/license.html
+# [2] http://openjdk.java.net/legal/assembly-exception.html
+#
+# SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+###############################################################################
+
+
+'''
+Runs OMRChecker on the source files of a project.
+
+The files to lint, and the compiler command line of each, come either from
+a compilation database (`compile_commands.json`) or from the command line,
+as a list of files followed by `--` and the compiler command to lint them
+with (which is how the `linter.mk` makefiles call the driver):
+
+   python lint.py --checker OMRChecker.so --compile-commands build/compile_commands.json
+   python lint.py --checker OMRChecker.so a.cpp b.cpp -- clang++ -std=c++0x -Iinclude
+
+Files are linted on a pool of workers, the ones that took the longest in
+previous runs first (their times are kept in the `--history` file), so a
+long file does not end up running alone at the end of the run.
+Diagnostics are printed as files finish. A diagnostic in a header shared by
+many files is printed once, and the final report counts how many files it
+was reported for.
+
+With a `--cache` file, the result of each file is kept along with the
+hashes of all the files it included, which clang lists when given `-MD`.
+The next run reuses the result of a file as long as its command, the
+checker, the compiler and those files are unchanged.
+
+With `--pch HEADER`, a precompiled header of `HEADER` (which should include
+the headers most files include) is built once for each distinct compiler
+command, and included in each file with `-include-pch`, so those headers
+are not parsed again for every file. The checker walks the whole AST of a
+file, declarations loaded from the precompiled header included. `HEADER`
+must be safe to include before anything else in every file.
+
+With an `--include-graph` file, the files each file included are recorded
+as it is linted. `--since REV` then only lints the files changed since the
+git revision `REV`, along with the files including a changed header,
+directly or not. Files the graph knows nothing about, or that were linted
+with another command, are linted too, so that nothing is missed:
+
+   python lint.py --checker OMRChecker.so --include-graph includes.json --since origin/master a.cpp b.cpp -- clang++
+'''
+
+import os
+import re
+import sys
+import json
+import shlex
+import hashlib
+import argparse
+import tempfile
+import subprocess
+from collections import OrderedDict
+from multiprocessing import cpu_count
+from multiprocessing.pool import ThreadPool
+import testing.tool as tool
+
+# flags added to the compiler command of every file
+lintFlags = ['-fsyntax-only', '-w', '-ferror-limit=0']
+
+
+class LintJob(object):
+   '''
+   A source file to lint, with the compiler command used to lint it, the
+   directory to run it in, and the precompiled header to use, if any.
+   '''
+
+   def __init__(self, path, command, directory, pch=None):
+      self.path = path
+      self.command = command
+      self.directory = directory
+      self.pch = pch
+
+
+# compile command handling ####################################################
+
+# flags (and the number of arguments they take) that have no meaning when
+# only checking the syntax of a file
+outputFlags = { '-c': 0, '-o': 1, '-M': 0, '-MM': 0, '-MD': 0, '-MMD': 0, '-MP': 0, '-MF': 1, '-MT': 1, '-MQ': 1 }
+
+def getLintCommand(args, sourceFile, compiler=None):
+   '''
+   Returns the command to lint a file with, given the command compiling it:
+   the compiler output flags and the file itself are removed, and the
+   compiler is replaced by `compiler` if given.
+   '''
+
+   command = [compiler or args[0]]
+   skip = 0
+   for arg in args[1:]:
+      if skip:
+         skip -= 1
+      elif arg in outputFlags:
+         skip = outputFlags[arg]
+      elif arg.startswith('-o') or arg.startswith('-MF') or arg.startswith('-MT') or arg.startswith('-MQ'):
+         pass
+      elif arg == sourceFile:
+         pass
+      else:
+         command.append(arg)
+   return command
+
+def readCompileCommands(path, compiler=None):
+   '''Returns the lint jobs of the C++ files in a compilation database.'''
+
+   with open(path) as f:
+      entries = json.load(f)
+   jobs = []
+   for entry in entries:
+      if not re.search(r'\.(cpp|cc|cxx|C)$', entry['file']):
+         continue
+      args = entry['arguments'] if 'arguments' in entry else shlex.split(entry['command'])
+      directory = entry.get('directory', os.path.dirname(os.path.abspath(path)))
+      filePath = os.path.normpath(os.path.join(directory, entry['file']))
+      jobs.append(LintJob(filePath, getLintCommand(args, entry['file'], compiler), directory))
+   return jobs
+
+
+# diagnostics #################################################################
+
+locationPattern = re.compile(r'^(.+?):(\d+):(?:(\d+):)? (error|fatal error|warning|note|remark): (.*)$')
+includePattern = re.compile(r'^(?:In file included from|\s+from) .+:\d+[:,]$')
+unlocatedPattern = re.compile(r'^[^\s:]+: (error|fatal error|warning): ')
+countPattern = re.compile(r'^\d+ (?:errors?|warnings?)(?: and \d+ warnings?)? generated\.$')
+
+class Diagnostic(object):
+   '''
+   A diagnostic, with its first line (`line`), all the text clang printed
+   for it, and the files it was reported for.
+   '''
+
+   def __init__(self, key, severity, line, text):
+      self.key = key
+      self.severity = severity
+      self.line = line
+      self.text = text
+      self.files = []
+
+
+def parseDiagnostics(stderr, directory):
+   '''
+   Splits the output clang printed for a file into diagnostics, returning a
+   list of `(key, severity, line, text)` tuples, `line` being the first line
+   of the diagnostic itself. The key identifies a diagnostic
+   by its absolute location and message. The text of a diagnostic includes
+   its include stack, source excerpt and notes. Output that is not part of
+   a located diagnostic (such as driver errors) is keyed by its text.
+   '''
+
+   diagnostics = []
+   includes = []
+   for line in stderr.splitlines():
+      location = locationPattern.match(line)
+      if includePattern.match(line):
+         includes.append(line)
+      elif location and location.group(4) != 'note' or unlocatedPattern.match(line) or not diagnostics:
+         if location:
+            path = os.path.normpath(os.path.join(directory, location.group(1)))
+            key = (path, location.group(2), location.group(3), location.group(4), location.group(5))
+            severity = location.group(4)
+         elif countPattern.match(line):
+            continue
+         else:
+            key = (line,)
+            severity = 'warning' if ': warning: ' in line else 'error'
+         diagnostics.append((key, severity, line, includes + [line]))
+         includes = []
+      elif not countPattern.match(line):
+         diagnostics[-1][3].extend(includes + [line])
+         includes = []
+   return [(key, severity, line, '\n'.join(lines)) for key, severity, line, lines in diagnostics]
+
+
+class LintReport(object):
+   '''Collects the results of linting files, with their diagnostics deduplicated.'''
+
+   def __init__(self):
+      self.files = OrderedDict()
+      self.diagnostics = OrderedDict()
+
+   def add(self, job, log, cached=False):
+      '''Adds the result of linting a file, returning the diagnostics not reported for any file before.'''
+
+      self.files[job.path] = { 'returncode': log.output.returncode
+                             , 'cached': cached
+                             , 'timedOut': log.output.timedOut
+                             , 'wallTime': log.wallTime
+                             , 'cpuTime': log.cpuTime
+                             , 'peakRss': log.peakRss
+                             }
+      new = []
+      for key, severity, line, text in parseDiagnostics(log.output.stderr.decode('utf-8', 'replace'), job.directory):
+         if key not in self.diagnostics:
+            self.diagnostics[key] = Diagnostic(key, severity, line, text)
+            new.append(self.diagnostics[key])
+         if job.path not in self.diagnostics[key].files:
+            self.diagnostics[key].files.append(job.path)
+      return new
+
+   def getFailedFiles(self):
+      return [path for path, result in self.files.items() if result['returncode'] != 0]
+
+   def printSummary(self):
+      count = lambda severity: len([d for d in self.diagnostics.values() if d.severity == severity])
+      print('Files linted: ' + str(len(self.files)))
+      print('Files failed: ' + str(len(self.getFailedFiles())))
+      cached = len([r for r in self.files.values() if r['cached']])
+      if cached:
+         print('Files with cached results: ' + str(cached))
+      print('Unique errors: ' + str(count('error') + count('fatal error')))
+      print('Unique warnings: ' + str(count('warning')))
+      shared = [d for d in self.diagnostics.values() if len(d.files) > 1]
+      for d in sorted(shared, key=lambda d: len(d.files), reverse=True)[:10]:
+         print('   reported for ' + str(len(d.files)) + ' files: ' + d.line)
+
+   def write(self, path):
+      '''Writes the report as JSON.'''
+
+      diagnostics = [ { 'severity': d.severity, 'text': d.text, 'files': d.files } for d in self.diagnostics.values() ]
+      with open(path, 'w') as f:
+         json.dump({ 'files': self.files, 'diagnostics': diagnostics }, f, indent=2)
+
+
+# incremental linting #########################################################
+
+def readDependencies(path, directory):
+   '''
+   Reads a dependency file written by clang's `-MD` option, returning the
+   absolute paths of the files it lists as dependencies.
+   '''
+
+   with open(path) as f:
+      text = f.read().replace('\\\n', ' ')
+   # the dependencies follow the first ': ' (not a drive letter's colon)
+   text = text.split(': ', 1)[1] if ': ' in text else ''
+   deps = []
+   for dep in re.split(r'(?<!\\)\s+', text.strip()):
+      if dep:
+         deps.append(os.path.normpath(os.path.join(directory, dep.replace('\\ ', ' '))))
+   return deps
+
+
+def writeJsonAtomically(path, data, **dumpArgs):
+   '''
+   Writes data to a JSON file through a temporary file, so that an
+   interrupted write does not leave a corrupt file behind.
+   '''
+
+   directory = os.path.dirname(os.path.abspath(path))
+   if not os.path.isdir(directory):
+      os.makedirs(directory)
+   fd, tmp = tempfile.mkstemp(dir=directory, suffix='.tmp')
+   with os.fdopen(fd, 'w') as f:
+      json.dump(data, f, **dumpArgs)
+   os.rename(tmp, path)
+
+
+class LintCache(object):
+   '''
+   A cache of lint results, kept in a JSON file. The result of a file is
+   stored with a key hashing its lint command, the checker and the compiler
+   version, and with the hashes of all the files it included. It is valid
+   as long as the key and all those hashes are unchanged.
+
+   Files are only hashed again when their modification time or size changed
+   since they were last hashed, and at most once per run.
+   '''
+
+   def __init__(self, path):
+      self.path = path
+      self.results = {}
+      self.stamps = {}    # path -> [modification time, size, hash]
+      self.hashes = {}    # path -> hash, for the files hashed during this run
+      if os.path.exists(path):
+         try:
+            with open(path) as f:
+               data = json.load(f)
+            self.results = data['results']
+            self.stamps = data['stamps']
+         except (ValueError, KeyError):
+            pass
+
+   def getHash(self, path):
+      '''Returns the hash of a file, or None if it does not exist.'''
+
+      if path not in self.hashes:
+         try:
+            st = os.stat(path)
+         except OSError:
+            return None
+         stamp = [getattr(st, 'st_mtime_ns', st.st_mtime), st.st_size]
+         cached = self.stamps.get(path)
+         if cached is not None and cached[:2] == stamp:
+            self.hashes[path] = cached[2]
+         else:
+            self.hashes[path] = tool.hashFile(path)
+            self.stamps[path] = stamp + [self.hashes[path]]
+      return self.hashes[path]
+
+   def lookup(self, job, key):
+      '''Returns the cached result of a lint job, or None if it is missing or out of date.'''
+
+      entry = self.results.get(job.path)
+      if entry is None or entry['key'] != key:
+         return None
+      for dep, depHash in entry['deps'].items():
+         if self.getHash(dep) != depHash:
+            return None
+      return entry
+
+   def store(self, job, key, log, deps):
+      self.results[job.path] = { 'key': key
+                               , 'deps': dict((dep, self.getHash(dep)) for dep in deps)
+                               , 'returncode': log.output.returncode
+                               , 'stderr': log.output.stderr.decode('utf-8', 'replace')
+                               }
+
+   def save(self):
+      writeJsonAtomically(self.path, { 'results': self.results, 'stamps': self.stamps })
+
+
+# changed files ###############################################################
+
+def getCommandHash(job):
+   h = hashlib.sha256()
+   for part in [job.directory, str(job.pch)] + job.command:
+      h.update(part.encode('utf-8') + b'\0')
+   return h.hexdigest()
+
+class IncludeGraph(object):
+   '''
+   The files each source file included when it was last linted, kept in a
+   JSON file, along with a hash of the command it was linted with.
+   '''
+
+   def __init__(self, path):
+      self.path = path
+      self.files = {}    # path -> { 'command': hash, 'includes': [path, ...] }
+      if os.path.exists(path):
+         try:
+            with open(path) as f:
+               self.files = json.load(f)
+         except ValueError:
+            pass
+
+   def update(self, job, includes):
+      self.files[job.path] = { 'command': getCommandHash(job), 'includes': sorted(set(includes)) }
+
+   def getAffectedJobs(self, jobs, changed):
+      '''
+      Returns the jobs of the files that are among the changed files, that
+      include one of them, or that are not in the graph with their current
+      command. Paths are compared once resolved, as git lists them.
+      '''
+
+      changed = set(os.path.realpath(f) for f in changed)
+      resolved = {}
+      def isChanged(path):
+         if path not in resolved:
+            resolved[path] = os.path.realpath(path) in changed
+         return resolved[path]
+
+      affected = []
+      for job in jobs:
+         entry = self.files.get(job.path)
+         if entry is None or entry['command'] != getCommandHash(job) or isChanged(job.path) \
+               or any(isChanged(include) for include in entry['includes']):
+            affected.append(job)
+      return affected
+
+   def save(self):
+      writeJsonAtomically(self.path, self.files, indent=1, sort_keys=True)
+
+def getChangedFiles(revision):
+   '''
+   Returns the absolute paths of the files of the git work tree of the
+   current directory that changed since a revision, deleted ones included.
+   '''
+
+   top = subprocess.check_output(['git', 'rev-parse', '--show-toplevel']).decode('utf-8').strip()
+   names = subprocess.check_output(['git', 'diff', '--name-only', '--no-renames', revision, '--'], cwd=top)
+   return [os.path.join(top, name) for name in names.decode('utf-8').splitlines() if name]
+
+
+# precompiled headers #########################################################
+
+pchErrorPattern = re.compile(r'PCH file|precompiled header')
+
+def getPchPath(pchDir, command, header, directory):
+   '''Returns the path of the precompiled header of a header for a compiler command run in a directory.'''
+
+   h = hashlib.sha256()
+   for part in [os.path.abspath(header), directory, tool.getVersionOutput([command[0], '--version'])] + command:
+      h.update(part.encode('utf-8') + b'\0')
+   return os.path.join(pchDir, os.path.splitext(os.path.basename(header))[0] + '-' + h.hexdigest()[:16] + '.pch')
+
+def isPchUpToDate(pchPath, directory):
+   '''
+   Checks that a precompiled header exists and is newer than all the headers
+   it was built from. Relative dependencies are relative to `directory`, the
+   directory the header was built in.
+   '''
+
+   depFile = pchPath + '.d'
+   if not os.path.exists(pchPath) or not os.path.exists(depFile):
+      return False
+   built = os.path.getmtime(pchPath)
+   for dep in readDependencies(depFile, directory):
+      if not os.path.exists(dep) or os.path.getmtime(dep) > built:
+         return False
+   return True
+
+def buildPch(command, header, pchPath, directory=None):
+   '''
+   Builds the precompiled header of a header with a compiler command, run
+   in `directory`, unless it is up to date. The dependencies of the header
+   are written next to it, to check whether it is up to date. Returns the
+   log of the compiler invocation, or None if the header was up to date.
+   '''
+
+   directory = directory or os.getcwd()
+   if isPchUpToDate(pchPath, directory):
+      return None
+   if not os.path.isdir(os.path.dirname(pchPath)):
+      os.makedirs(os.path.dirname(pchPath))
+   compiler = tool.Tool(lambda args: args, dict(os.environ))
+   return compiler.call(command + ['-w', '-x', 'c++-header', os.path.abspath(header), '-o', pchPath,
+                                   '-MD', '-MF', pchPath + '.d', '-MT', 'pch'], cwd=directory)
+
+def addPrecompiledHeaders(jobs, header, pchDir, out=sys.stdout):
+   '''
+   Builds a precompiled header for each distinct compiler command of a list
+   of lint jobs, and sets it as the precompiled header of the jobs. Jobs
+   whose precompiled header fails to build are linted without one.
+   '''
+
+   built = {}
+   for job in jobs:
+      config = (job.directory,) + tuple(job.command)
+      if config not in built:
+         pchPath = getPchPath(pchDir, job.command, header, job.directory)
+         log = buildPch(job.command, header, pchPath, job.directory)
+         if log is not None and log.output.returncode != 0:
+            out.write('warning: could not build a precompiled header of ' + header + '; linting without it\n')
+            out.write(log.output.stderr.decode('utf-8', 'replace'))
+            pchPath = None
+         built[config] = pchPath
+      job.pch = built[config]
+
+
+# scheduling ##################################################################
+
+def readHistory(path):
+   '''Reads the time each file took to lint in previous runs.'''
+
+   if path is None or not os.path.exists(path):
+      return {}
+   try:
+      with open(path) as f:
+         return json.load(f)
+   except ValueError:
+      return {}
+
+def writeHistory(path, history, report):
+   for filePath, result in report.files.items():
+      if result['wallTime'] is not None and not result['timedOut']:
+         history[filePath] = result['wallTime']
+   if path is not None:
+      writeJsonAtomically(path, history, indent=1, sort_keys=True)
+
+def scheduleJobs(jobs, history):
+   '''
+   Orders jobs by decreasing historical cost. Files without a history are
+   scheduled first, as they may well be the most expensive.
+   '''
+
+   return sorted(jobs, key=lambda job: -history.get(job.path, float('inf')))
+
+
+class Linter(tool.Tool):
+   '''
+   A wrapper running the compiler command of a lint job with the OMRChecker
+   plugin loaded, reusing the results kept in a `LintCache` if given, and
+   recording the files each job included in an `IncludeGraph` if given.
+   '''
+
+   def __init__(self, checker, cache=None, graph=None, **options):
+      plugin = ['-Xclang', '-load', '-Xclang', checker, '-Xclang', '-add-plugin', '-Xclang', 'omr-checker']
+      super(Linter, self).__init__(lambda args: args[0].command + lintFlags + args[1] + plugin + [args[0].path], dict(os.environ), **options)
+      self.checker = checker
+      self.cache = cache
+      self.graph = graph
+      self.versions = {}
+
+   def getCacheKey(self, job):
+      compiler = job.command[0]
+      if compiler not in self.versions:
+         self.versions[compiler] = tool.getVersionOutput([compiler, '--version'])
+      h = hashlib.sha256()
+      for part in [job.path, self.cache.getHash(self.checker), self.versions[compiler], job.pch] + job.command + lintFlags:
+         h.update(str(part).encode('utf-8') + b'\0')
+      return h.hexdigest()
+
+   def lint(self, job):
+      '''Lints a file, returning the job, the log of the lint, and whether it was cached.'''
+
+      if self.cache is None and self.graph is None:
+         return job, self.run(job, []), False
+
+      if self.cache is not None:
+         key = self.getCacheKey(job)
+         entry = self.cache.lookup(job, key)
+         if entry is not None:
+            self.recordIncludes(job, list(entry['deps'].keys()))
+            output = tool.ToolOutput(entry['returncode'], entry['stderr'].encode('utf-8'), b'')
+            return job, tool.ToolExecutionLog((job, []), [], output), True
+
+      fd, depFile = tempfile.mkstemp(suffix='.d')
+      os.close(fd)
+      try:
+         log = self.run(job, ['-MD', '-MF', depFile, '-MT', 'lint'])
+         deps = readDependencies(depFile, job.directory) if os.path.getsize(depFile) else None
+      finally:
+         os.remove(depFile)
+      if deps and not log.output.timedOut and log.output.returncode >= 0:
+         self.recordIncludes(job, deps)
+         if self.cache is not None:
+            self.cache.store(job, key, log, deps + ([job.pch] if job.pch else []))
+      return job, log, False
+
+   def recordIncludes(self, job, deps):
+      '''Records the files a job included, those of its precompiled header included.'''
+
+      if self.graph is None:
+         return
+      if job.pch and os.path.exists(job.pch + '.d'):
+         deps = deps + readDependencies(job.pch + '.d', job.directory)
+      self.graph.update(job, [dep for dep in deps if dep != job.pch])
+
+   def run(self, job, extraArgs):
+      '''Runs the lint command of a job, without its precompiled header if clang rejects it.'''
+
+      log = self.call((job, (['-include-pch', job.pch] if job.pch else []) + extraArgs), cwd=job.directory)
+      if job.pch and log.output.returncode > 0 and pchErrorPattern.search(log.output.stderr.decode('utf-8', 'replace')):
+         log = self.call((job, extraArgs), cwd=job.directory)
+      return log
+
+
+def lintFiles(linter, jobs, parallel, report, out=sys.stdout):
+   '''Lints files on a pool of workers, printing new diagnostics as files are linted.'''
+
+   pool = ThreadPool(max(1, min(parallel, len(jobs))))
+   try:
+      for job, log, cached in pool.imap_unordered(linter.lint, jobs):
+         for d in report.add(job, log, cached):
+            out.write(d.text + '\n')
+         if log.output.returncode != 0 and not log.output.stderr:
+            out.write(job.path + ': error: the compiler exited with ' + str(log.output.returncode) + '\n')
+         out.flush()
+   finally:
+      pool.close()
+      pool.join()
+
+
+def splitArgs(argv):
+   '''Splits the driver arguments from the compiler command following `--`.'''
+
+   if '--' in argv:
+      i = argv.index('--')
+      return argv[:i], argv[i + 1:]
+   return argv, []
+
+
+if __name__ == '__main__':
+   argParser = argparse.ArgumentParser(description='Lint source files with OMRChecker.',
+                                       usage='%(prog)s [options] [FILE ...] [-- COMPILER [FLAG ...]]')
+   argParser.add_argument('--checker', dest='CHECKER', type=str, default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'OMRChecker.so'),
+                          help='path to the OMRChecker plugin')
+   argParser.add_argument('--compile-commands', dest='COMPILECOMMANDS', type=str,
+                          help='compilation database listing the files to lint and how to compile them')
+   argParser.add_argument('--cxx', dest='CXX', type=str, default=os.getenv('CXX_PATH', 'clang++'),
+                          help='clang compiler replacing the one of the compilation database')
+   argParser.add_argument('--extra-arg', dest='EXTRAARGS', action='append', default=[],
+                          help='additional compiler argument (may be repeated)')
+   argParser.add_argument('--filter', dest='FILTER', type=str, help='only lint the files matching this regular expression')
+   argParser.add_argument('--jobs', '-j', dest='JOBS', type=int, default=0, help='number of files linted in parallel (0 for the number of CPUs)')
+   argParser.add_argument('--history', dest='HISTORY', type=str, help='file keeping the time each file took to lint, to schedule the slowest first')
+   argParser.add_argument('--cache', dest='CACHE', type=str, help='file caching the results of files whose inputs did not change')
+   argParser.add_argument('--pch', dest='PCH', type=str, help='header of the headers most files include, to precompile')
+   argParser.add_argument('--pch-dir', dest='PCHDIR', type=str, default=tempfile.gettempdir(),
+                          help='directory keeping the precompiled headers between runs')
+   argParser.add_argument('--include-graph', dest='INCLUDEGRAPH', type=str, help='file recording the files each file included')
+   argParser.add_argument('--since', dest='SINCE', type=str,
+                          help='only lint the files changed since this git revision, and those including them (needs --include-graph)')
+   argParser.add_argument('--report', dest='REPORT', type=str, help='write the deduplicated diagnostics to a JSON file')
+   argParser.add_argument('--timeout', dest='TIMEOUT', type=float, help='give up on a file taking more than this many seconds')
+   argParser.add_argument('files', nargs='*', metavar='FILE', help='files to lint (all the files of the compilation database by default)')
+   driverArgs, compilerCommand = splitArgs(sys.argv[1:])
+   args = vars(argParser.parse_args(driverArgs))
+
+   if not os.path.exists(args['CHECKER']):
+      print("Could not find: " + args['CHECKER'])
+      exit(1)
+
+   if args['COMPILECOMMANDS']:
+      jobs = readCompileCommands(args['COMPILECOMMANDS'], args['CXX'])
+      if args['files']:
+         selected = set(os.path.abspath(f) for f in args['files'])
+         jobs = [job for job in jobs if job.path in selected]
+   elif compilerCommand:
+      jobs = [LintJob(os.path.abspath(f), list(compilerCommand), os.getcwd()) for f in args['files']]
+   else:
+      argParser.error('either --compile-commands or a compiler command after -- is required')
+   for job in jobs:
+      job.command += args['EXTRAARGS']
+   if args['FILTER']:
+      jobs = [job for job in jobs if re.search(args['FILTER'], job.path)]
+
+   if args['SINCE'] and not args['INCLUDEGRAPH']:
+      argParser.error('--since needs an --include-graph file')
+
+   if args['PCH']:
+      addPrecompiledHeaders(jobs, args['PCH'], os.path.abspath(args['PCHDIR']))
+
+   graph = IncludeGraph(args['INCLUDEGRAPH']) if args['INCLUDEGRAPH'] else None
+   if args['SINCE']:
+      try:
+         changed = getChangedFiles(args['SINCE'])
+      except (OSError, subprocess.CalledProcessError) as e:
+         print('Could not list the files changed since ' + args['SINCE'] + ': ' + str(e))
+         exit(1)
+      total = len(jobs)
+      jobs = graph.getAffectedJobs(jobs, changed)
+      print('Linting ' + str(len(jobs)) + ' of ' + str(total) + ' files, affected by ' + str(len(changed)) + ' changed files')
+
+   history = readHistory(args['HISTORY'])
+   cache = LintCache(args['CACHE']) if args['CACHE'] else None
+   linter = Linter(os.path.abspath(args['CHECKER']), cache, graph, timeout=args['TIMEOUT'], maxOutput=4 * 1024 * 1024)
+   report = LintReport()
+   lintFiles(linter, scheduleJobs(jobs, history), args['JOBS'] or cpu_count(), report)
+   writeHistory(args['HISTORY'], history, report)
+   if cache is not None:
+      cache.save()
+   if graph is not None:
+      graph.save()
+
+   print('')
+   report.printSummary()
+   if args['REPORT']:
+      report.write(args['REPORT'])
+   if report.getFailedFiles():
+      exit(1)
@@ -24,24 +24,149 @@
 
 import sys
 import os
+import re
 import argparse
+import tempfile
+import multiprocessing
+from multiprocessing.pool import ThreadPool
 import testing.gen_data as gen_data
 import testing.tool as tool
 import testing.tooltester as tooltester
+import lint
 
 # argument handling - general flags
 arg_parser = argparse.ArgumentParser(description='Test the OMR extensible class checker.')
 arg_parser.add_argument('--checker', dest='CHECKER', type=str, default=os.path.join(os.getcwd(), 'OMRChecker.so'))
+arg_parser.add_argument('--batch-size', dest='BATCHSIZE', type=int, default=1,
+                        help='number of input files checked by each clang invocation')
+arg_parser.add_argument('--pch', dest='PCH', type=str,
+                        help='header to precompile and include in every input file')
 tooltester.addTestArgs(arg_parser)
 
 
 class OMRChecker(tool.Tool):
    '''A wrapper providing an interface for interacting with OMRChecker.'''
 
-   def __init__(self, checker):
+   def __init__(self, checker, pch=None, **options):
       clang = os.getenv('CLANG', 'clang++')
       base = [clang, '-fsyntax-only', '-Xclang', '-load', '-Xclang', checker, '-Xclang', '-add-plugin', '-Xclang', 'omr-checker'] 
-      super(OMRChecker, self).__init__(lambda args: base + args)
+      if pch is not None:
+         base += ['-include-pch', pch]
+      super(OMRChecker, self).__init__(lambda args: base + args, **options)
+      self.clang = clang
+      self.checker = checker
+      self.pch = pch
+      self.base = base
+
+      self.batchLogs = {}
+
+   def getFingerprint(self):
+      pchHash = [tool.hashFile(self.pch)] if self.pch is not None else []
+      return '\n'.join([tool.hashFile(self.checker), tool.getVersionOutput([self.clang, '--version'])] + pchHash + self.base)
+
+   def call(self, args, timeout=None):
+      '''Calls the checker, or returns the log of a batch run having checked the file passed in `args`.'''
+
+      if len(args) == 1 and os.path.normpath(args[0]) in self.batchLogs:
+         return self.batchLogs.pop(os.path.normpath(args[0]))
+      return super(OMRChecker, self).call(args, timeout)
+
+   def runBatches(self, filePaths, batchSize, jobs=1):
+      '''
+      Checks files in batches of up to `batchSize` files per clang invocation,
+      up to `jobs` batches at a time, keeping the log of each file for `call`
+      to return. The files of a batch whose diagnostics cannot be split (see
+      `splitDiagnostics`) are not kept, so they are checked one at a time.
+      '''
+
+      batches = [filePaths[i:i + batchSize] for i in range(0, len(filePaths), batchSize)]
+      pool = ThreadPool(max(1, min(jobs, len(batches))))
+      try:
+         for logs in pool.imap_unordered(self.runBatch, batches):
+            self.batchLogs.update(logs)
+      finally:
+         pool.close()
+         pool.join()
+
+   def runBatch(self, filePaths):
+      '''Checks a batch of files, returning a dictionary mapping each file to the log of its own result.'''
+
+      log = super(OMRChecker, self).call(filePaths)
+      if log.output.timedOut or log.output.returncode < 0:
+         return {}
+      diagnostics = splitDiagnostics(log.output.stderr.decode('utf-8', 'replace'), filePaths)
+      if diagnostics is None:
+         return {}
+      failed = [path for path, (hasErrors, text) in diagnostics.items() if hasErrors]
+      if (log.output.returncode != 0) != bool(failed):
+         return {}
+
+      # each file gets its share of the batch's resource usage
+      share = lambda value: value / len(filePaths) if value is not None else None
+      logs = {}
+      for path, (hasErrors, text) in diagnostics.items():
+         output = tool.ToolOutput(1 if hasErrors else 0, text.encode('utf-8'), b'')
+         logs[path] = tool.ToolExecutionLog([path], log.cmd, output, share(log.wallTime), share(log.cpuTime), log.peakRss)
+      return logs
+
+
+locationPattern = re.compile(r'^(.+?):\d+:(?:\d+:)? (error|fatal error|warning|note|remark): ')
+includePattern = re.compile(r'^In file included from (.+?):\d+:')
+unlocatedPattern = re.compile(r'^[^\s:]+: (error|fatal error|warning|note|remark): ')
+
+def splitDiagnostics(stderr, filePaths):
+   '''
+   Splits the diagnostics printed by clang for several input files by file,
+   returning a dictionary mapping each (normalized) file path to whether it
+   had errors and to its diagnostics, or None if some diagnostics cannot be
+   attributed to a file.
+
+   clang checks the input files one after the other, going on with the
+   next ones when one of them fails to compile, so a diagnostic and
+   the lines following it (source excerpts, notes, error counts) belong to
+   the input file its location (or the first location of its include stack)
+   is in. clang only prints an include stack when it differs from the one
+   of the previous diagnostic, so a diagnostic located in a file that is
+   not an input belongs to the root of the last include stack printed
+   since the last diagnostic located in an input file. Any other
+   diagnostic, such as a driver error, makes the split ambiguous.
+   '''
+
+   inputs = set(os.path.normpath(p) for p in filePaths)
+   result = dict((p, [False, []]) for p in inputs)
+   current = None
+   includedFrom = None
+   includeRoot = None
+   for line in stderr.splitlines(True):
+      include = includePattern.match(line)
+      location = locationPattern.match(line)
+      if include:
+         if includedFrom is None:
+            includedFrom = os.path.normpath(include.group(1))
+            if includedFrom not in inputs:
+               return None
+         current = includeRoot = includedFrom
+      elif location:
+         path = os.path.normpath(location.group(1))
+         if includedFrom is not None:
+            path = includedFrom
+         elif path in inputs:
+            includeRoot = None
+         elif includeRoot is not None:
+            path = includeRoot
+         elif location.group(2) == 'note' and current is not None:
+            # notes may point anywhere, but they follow the diagnostic they are about
+            path = current
+         else:
+            return None
+         current = path
+         includedFrom = None
+         if location.group(2) in ['error', 'fatal error']:
+            result[current][0] = True
+      elif current is None or unlocatedPattern.match(line):
+         return None
+      result[current][1].append(line)
+   return dict((p, (hasErrors, ''.join(lines))) for p, (hasErrors, lines) in result.items())
 
 
 class CheckerTestCase(tooltester.TestCase):
@@ -49,6 +174,9 @@ class CheckerTestCase(tooltester.TestCase):
       super(CheckerTestCase, self).__init__('[' + inputFilePath  + ']', checker)
       self.inputFilePath = inputFilePath
    
+   def getCacheKey(self):
+      return [tool.hashFile(self.inputFilePath)]
+
    def invokeChecker(self, filePath):
       return self.invokeTool([filePath])
 
@@ -79,16 +207,31 @@ if __name__ == '__main__':
       print("Could not find: " + args['CHECKER'])
       exit(1)
 
-   checker = OMRChecker(os.path.abspath(args['CHECKER']))
+   pch = None
+   if args['PCH']:
+      clang = os.getenv('CLANG', 'clang++')
+      pch = lint.getPchPath(tempfile.gettempdir(), [clang], args['PCH'], os.getcwd())
+      log = lint.buildPch([clang], args['PCH'], pch)
+      if log is not None and log.output.returncode != 0:
+         print('Could not precompile ' + args['PCH'] + ':\n' + log.output.stderr.decode('utf-8'))
+         exit(1)
+
+   checker = OMRChecker(os.path.abspath(args['CHECKER']), pch, **tooltester.getToolOptions(args))
 
    goodFiles = gen_data.genFileList('testing/input/good')
    badFiles = gen_data.genFileList('testing/input/bad')
    tests = [TestReturnZero(inputFilePath) for inputFilePath in goodFiles] + [TestReturnNotZero(inputFilePath) for inputFilePath in badFiles]
 
    testSuite = tooltester.TestSuite(checker, tests)
-   runner = tooltester.SuiteRunner(testSuite, args['MCOMMAND'], args['MRETURN'], args['MSTDERR'], args['MSTDOUT'])
+   cache = tooltester.getResultCache(args)
+   if args['BATCHSIZE'] > 1:
+      pending = [t.inputFilePath for t in tests if cache is None or cache.get(cache.getKey(t)) is None]
+      checker.runBatches(pending, args['BATCHSIZE'], args['JOBS'] if args['JOBS'] > 0 else multiprocessing.cpu_count())
+   runner = tooltester.SuiteRunner(testSuite, args['MCOMMAND'], args['MRETURN'], args['MSTDERR'], args['MSTDOUT'], args['JOBS'],
+                                   cache)
    runner.runTests()
 
    runner.printSummary()
+   tooltester.reportResults(runner, args, 'OMRChecker')
    if runner.testsFailed != 0:
       exit(1)
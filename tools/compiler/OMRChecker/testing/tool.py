@@ -21,52 +21,292 @@
 ###############################################################################
 
 import os
+import sys
+import errno
+import time
+import atexit
+import hashlib
+import signal
+import tempfile
+import threading
 import subprocess
 
 class ToolOutput:
    '''Represents the output generated by a call to tool.'''
 
-   def __init__(self, returncode, stderr, stdout):
+   def __init__(self, returncode, stderr, stdout, timedOut=False, stderrFile=None, stdoutFile=None):
       self.returncode = returncode  # the return code of the command
       self.stderr = stderr          # the standard error output of the command
       self.stdout = stdout          # the standard output of the command
-
-   @staticmethod
-   def fromProcess(proc):
-      '''Constructs output object from process object'''
-
-      return ToolOutput(proc.returncode, proc.stderr.read(), proc.stdout.read())
+      self.timedOut = timedOut      # whether the command was killed for running too long
+      self.stderrFile = stderrFile  # the file holding the complete standard error output, if it was spilled
+      self.stdoutFile = stdoutFile  # the file holding the complete standard output, if it was spilled
 
 
 class ToolExecutionLog:
-   '''Represents a log of a tool invocation/execution.'''
+   '''
+   Represents a log of a tool invocation/execution, along with the
+   resources it used, where they are known: the wall and CPU time in
+   seconds, and the peak resident set size in KiB.
+   '''
 
-   def __init__(self, args, cmd, output):
+   def __init__(self, args, cmd, output, wallTime=None, cpuTime=None, peakRss=None):
       self.args = args
       self.cmd = cmd
       self.cmdstr = ' '.join(cmd)
       self.output = output
+      self.wallTime = wallTime
+      self.cpuTime = cpuTime
+      self.peakRss = peakRss
+
+
+def waitForProcess(p, lock=None):
+   '''
+   Waits for a process to exit, returning its CPU time in seconds and peak
+   resident set size in KiB, including those of the processes it waited
+   for. Both are None where they cannot be measured. The return code of the
+   process is set while holding `lock`, if given.
+   '''
+
+   if not hasattr(os, 'wait4'):
+      p.wait()
+      return None, None
+   while True:
+      try:
+         pid, status, usage = os.wait4(p.pid, 0)
+         break
+      except OSError as e:
+         if e.errno != errno.EINTR:
+            raise
+   with lock or threading.Lock():
+      p.returncode = -os.WTERMSIG(status) if os.WIFSIGNALED(status) else os.WEXITSTATUS(status)
+   # ru_maxrss is in bytes on macOS, and in KiB elsewhere
+   peakRss = usage.ru_maxrss // 1024 if sys.platform == 'darwin' else usage.ru_maxrss
+   return usage.ru_utime + usage.ru_stime, peakRss
+
+
+def waitForExit(p):
+   '''
+   Waits for a process to exit without reaping it, so that its pid is not
+   reused until `waitForProcess` is called. Returns False without waiting
+   where this is not possible (Python 2 has no `os.waitid`).
+   '''
+
+   if not hasattr(os, 'waitid'):
+      return False
+   while True:
+      try:
+         os.waitid(os.P_PID, p.pid, os.WEXITED | os.WNOWAIT)
+         return True
+      except OSError as e:
+         if e.errno != errno.EINTR:
+            raise
+
+
+# The process groups of the tools running in their own session. They do not
+# get the SIGINT of a Ctrl-C, so they are killed when the process exits.
+runningGroups = set()
+runningGroupsLock = threading.Lock()
+
+def killRunningGroups():
+   with runningGroupsLock:
+      for pgid in runningGroups:
+         try:
+            os.killpg(pgid, signal.SIGKILL)
+         except OSError:
+            pass
+      runningGroups.clear()
+
+atexit.register(killRunningGroups)
+
+
+class OutputCapture(object):
+   '''
+   Reads an output stream of a process on its own thread, so that a process
+   filling one pipe cannot block while the other one is being read.
+
+   At most `maxOutput` bytes are kept in memory (all of them if None). When
+   the stream is longer, a truncation marker is added after the bytes kept
+   and, if `spillDir` is set, the complete stream is written to a file in
+   that directory, which the marker names.
+   '''
+
+   chunkSize = 65536
+
+   def __init__(self, pipe, name, maxOutput=None, spillDir=None):
+      self.pipe = pipe
+      self.name = name
+      self.maxOutput = maxOutput
+      self.spillDir = spillDir
+      self.chunks = []
+      self.kept = 0
+      self.total = 0
+      self.spillFile = None
+      self.thread = threading.Thread(target=self.read)
+      self.thread.daemon = True
+      self.thread.start()
+
+   def read(self):
+      fd = self.pipe.fileno()
+      while True:
+         data = os.read(fd, self.chunkSize)
+         if not data:
+            break
+         self.total += len(data)
+         if self.maxOutput is not None and self.total > self.maxOutput and self.spillFile is None and self.spillDir is not None:
+            self.spillFile = tempfile.NamedTemporaryFile(prefix='tool-', suffix='.' + self.name, dir=self.spillDir, delete=False)
+            self.spillFile.writelines(self.chunks)
+         if self.spillFile is not None:
+            self.spillFile.write(data)
+         if self.maxOutput is None or self.kept < self.maxOutput:
+            data = data if self.maxOutput is None else data[:self.maxOutput - self.kept]
+            self.chunks.append(data)
+            self.kept += len(data)
+      self.pipe.close()
+      if self.spillFile is not None:
+         self.spillFile.close()
+
+   def getPath(self):
+      '''Returns the path of the file holding the complete stream, or None if it was not spilled.'''
+
+      return self.spillFile.name if self.spillFile is not None else None
+
+   def getOutput(self):
+      '''Waits for the end of the stream, returning the bytes kept in memory and the truncation marker.'''
+
+      self.thread.join()
+      output = b''.join(self.chunks)
+      if self.total > self.kept:
+         marker = '\n[' + self.name + ' truncated: ' + str(self.total - self.kept) + ' of ' + str(self.total) + ' bytes not shown'
+         if self.spillFile is not None:
+            marker += '; complete ' + self.name + ' in ' + self.spillFile.name
+         output += (marker + ']\n').encode('utf-8')
+      return output
+
+
+def hashFile(path):
+   '''Returns the SHA-256 hash of the contents of a file.'''
+
+   h = hashlib.sha256()
+   with open(path, 'rb') as f:
+      for chunk in iter(lambda: f.read(65536), b''):
+         h.update(chunk)
+   return h.hexdigest()
+
+
+def getVersionOutput(command):
+   '''Returns the output of a command printing the version of a program (such as `clang++ --version`).'''
+
+   p = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+   output = p.communicate()[0]
+   return output.decode('utf-8', 'replace').strip()
+
 
-      
 class Tool(object):
-   '''A wrapper providing an interface for interacting with a tool.'''
-   
-   def __init__(self, cmdBuilder, env={}):
+   '''
+   A wrapper providing an interface for interacting with a tool.
+
+   A tool that runs for more than `timeout` seconds is killed. The output
+   of a tool is captured as described in `OutputCapture`, using the
+   `maxOutput` and `spillDir` options.
+   '''
+
+   def __init__(self, cmdBuilder, env={}, timeout=None, maxOutput=None, spillDir=None):
       self.cmdBuilder = cmdBuilder
       self.env = env
-   
-   def call(self, args):
-      '''Calls the tool with the required arguments.'''
+      self.timeout = timeout
+      self.maxOutput = maxOutput
+      self.spillDir = spillDir
+
+   def getFingerprint(self):
+      '''
+      Returns a string identifying the tool and the way it is invoked (for
+      example, hashes of its binaries and its fixed arguments), used to
+      cache test results. Results of tools without a fingerprint (None)
+      are not cached.
+      '''
+
+      return None
+
+   def call(self, args, timeout=None, cwd=None):
+      '''
+      Calls the tool with the required arguments, in the directory `cwd` if
+      given, overriding the tool's timeout if `timeout` is given.
+      '''
 
       command = self.cmdBuilder(args)
+      timeout = timeout if timeout is not None else self.timeout
+      start = time.time()
 
-      p = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=self.env)
-      p.wait()
+      # A tool that can time out runs in its own process group, so that
+      # killing it also kills the processes it started (e.g. the compiler
+      # proper started by the clang driver), which would otherwise keep
+      # its output pipes open. The tool leads a new session, whose process
+      # group id is its pid. Python 2 has no `start_new_session`, and sets
+      # the group up in the child before exec instead.
+      group = timeout is not None and hasattr(os, 'setpgid')
+      groupOptions = {}
+      if group and sys.version_info >= (3, 2):
+         groupOptions['start_new_session'] = True
+      elif group:
+         groupOptions['preexec_fn'] = lambda: os.setpgid(0, 0)
+      p = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=self.env, cwd=cwd, **groupOptions)
+      stdout = OutputCapture(p.stdout, 'stdout', self.maxOutput, self.spillDir)
+      stderr = OutputCapture(p.stderr, 'stderr', self.maxOutput, self.spillDir)
 
-      output = ToolOutput.fromProcess(p)
-      log = ToolExecutionLog(args, command, output)
+      if group:
+         with runningGroupsLock:
+            runningGroups.add(p.pid)
 
-      p.stdout.close()
-      p.stderr.close()
+      # The timer must not signal the tool once it has been reaped, as its
+      # pid may have been reused. Where possible, the timer is stopped once
+      # the tool exited, before it is reaped. Otherwise it keeps running
+      # until the tool is reaped, and checks that it was not.
+      timedOut = []
+      exited = []
+      lock = threading.Lock()
+      timer = None
+      if timeout is not None:
+         def kill():
+            with lock:
+               if exited or p.returncode is not None:
+                  return
+               timedOut.append(True)
+               try:
+                  if group:
+                     os.killpg(p.pid, signal.SIGKILL)
+                  else:
+                     p.kill()
+               except OSError:
+                  pass # the tool's processes exited in the meantime
+         timer = threading.Timer(timeout, kill)
+         timer.daemon = True
+         timer.start()
+      try:
+         if timer is not None and waitForExit(p):
+            with lock:
+               exited.append(True)
+         cpuTime, peakRss = waitForProcess(p, lock)
+      except BaseException:
+         # interrupted (e.g. by Ctrl-C); do not leave the tool running
+         if p.returncode is None:
+            try:
+               if group:
+                  os.killpg(p.pid, signal.SIGKILL)
+               else:
+                  p.kill()
+            except OSError:
+               pass
+         raise
+      finally:
+         if timer is not None:
+            timer.cancel()
+         if group:
+            with runningGroupsLock:
+               runningGroups.discard(p.pid)
+      wallTime = time.time() - start
 
-      return log
+      output = ToolOutput(p.returncode, stderr.getOutput(), stdout.getOutput(), bool(timedOut), stderr.getPath(), stdout.getPath())
+      if output.timedOut:
+         output.stderr += ('\n[killed after ' + str(timeout) + ' seconds]\n').encode('utf-8')
+      return ToolExecutionLog(args, command, output, wallTime, cpuTime, peakRss)
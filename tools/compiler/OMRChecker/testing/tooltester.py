@@ -20,6 +20,14 @@
 # SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
 ###############################################################################
 
+import os
+import json
+import time
+import hashlib
+import tempfile
+import multiprocessing
+import xml.etree.ElementTree as ElementTree
+from multiprocessing.pool import ThreadPool
 import testing.tool
 
 
@@ -37,6 +45,14 @@ class TestCase(object):
       self.tool = tool
       self.log = []
 
+   def getCacheKey(self):
+      '''
+      Returns a list of strings identifying the inputs of the test, for its
+      result to be cached, or None if it must always be run. The tool and
+      the name of the test are part of the cache key already.
+      '''
+      return None
+
    def invokeTool(self, args):
       logEntry = self.tool.call(args)
       self.log += [logEntry]
@@ -64,44 +80,169 @@ class TestCase(object):
 
 
 class TestRunner(object):
-   '''Class for running a test case.'''
+   '''
+   Class for running a test case. The lines a runner prints are kept in
+   `lines`, and a buffered runner only keeps them, for them to be printed
+   later. After the test has run, `duration` is the time it took in
+   seconds, and `failureMessage` is the message of its failed assertion.
+
+   Given a `ResultCache`, the runner reports the cached result of the test
+   instead of running it, if there is one, setting `cached`.
+   '''
 
-   def __init__(self, test, mcommand=1, mreturn=1, mstderr=1, mstdout=1):
+   def __init__(self, test, mcommand=1, mreturn=1, mstderr=1, mstdout=1, buffered=False, cache=None):
       self.test = test
       self.mcommand = mcommand
       self.mreturn = mreturn
       self.mstderr = mstderr
       self.mstdout = mstdout
+      self.buffered = buffered
+      self.lines = []
       self.testPassed = True
+      self.duration = None
+      self.failureMessage = None
+      self.cache = cache
+      self.cached = False
+
+   def printLine(self, line):
+      self.lines.append(line)
+      if not self.buffered:
+         print(line)
 
    def runTest(self):
+      start = time.time()
+      key = self.cache.getKey(self.test) if self.cache is not None else None
+      result = self.cache.get(key) if key is not None else None
+      if result is not None:
+         self.cached = True
+         self.testPassed = result['passed']
+         self.failureMessage = result['message']
+         self.test.log = [logFromJson(l) for l in result['log']]
+         self.duration = time.time() - start
+         if self.testPassed:
+            self.printLine("Test " + self.test.name + " PASSED (cached).")
+         else:
+            self.printFailure(self.failureMessage, " (cached)")
+         self.printLog()
+         return self.testPassed
+
       try:
          self.test.run()
-         print("Test " + self.test.name + " PASSED.")
+         self.duration = time.time() - start
+         self.printLine("Test " + self.test.name + " PASSED.")
       except AssertFailure as e:
+         self.duration = time.time() - start
          self.testPassed = False
+         self.failureMessage = e.msg
          self.printFailure(e.msg)
 
+      # results of tests whose tool was killed are not cached, as the
+      # tool may well finish in time on another run
+      if key is not None and not [l for l in self.test.log if getattr(l.output, 'timedOut', False)]:
+         self.cache.put(key, { 'passed': self.testPassed
+                             , 'message': self.failureMessage
+                             , 'log': [logToJson(l) for l in self.test.log]
+                             })
+
       self.printLog()
       return self.testPassed
 
-   def printFailure(self, msg):
+   def printFailure(self, msg, note=""):
       if msg is not None:
-         print("Test " + self.test.name + " FAILED: " + msg)
+         self.printLine("Test " + self.test.name + " FAILED" + note + ": " + msg)
       else:
-         print("Test " + self.test.name + " FAILED.")
+         self.printLine("Test " + self.test.name + " FAILED" + note + ".")
 
    def printLog(self):
       outputLevel = 2  if self.testPassed else 1
       for logEntry in self.test.log:
          if self.mcommand >= outputLevel:
-            print('>Command: ' + logEntry.cmdstr)
+            self.printLine('>Command: ' + logEntry.cmdstr)
          if self.mreturn >= outputLevel:
-            print('>Return Code: ' + str(logEntry.output.returncode))
+            self.printLine('>Return Code: ' + str(logEntry.output.returncode))
          if self.mstderr >= outputLevel:
-            print('>Standard Error:\n' + logEntry.output.stderr.decode("utf-8"))
+            self.printLine('>Standard Error:\n' + logEntry.output.stderr.decode("utf-8"))
          if self.mstdout >= outputLevel:
-            print('>StandardOutput:\n' + logEntry.output.stdout.decode("utf-8"))
+            self.printLine('>StandardOutput:\n' + logEntry.output.stdout.decode("utf-8"))
+
+
+def logToJson(logEntry):
+   '''Returns a JSON serializable dictionary representing a tool execution log.'''
+
+   return { 'args': logEntry.args
+          , 'cmd': logEntry.cmd
+          , 'returncode': logEntry.output.returncode
+          , 'stderr': logEntry.output.stderr.decode('utf-8', 'replace')
+          , 'stdout': logEntry.output.stdout.decode('utf-8', 'replace')
+          , 'wallTime': logEntry.wallTime
+          , 'cpuTime': logEntry.cpuTime
+          , 'peakRss': logEntry.peakRss
+          }
+
+
+def logFromJson(entry):
+   '''Returns the tool execution log represented by a dictionary returned by `logToJson`.'''
+
+   output = testing.tool.ToolOutput(entry['returncode'], entry['stderr'].encode('utf-8'), entry['stdout'].encode('utf-8'))
+   return testing.tool.ToolExecutionLog(entry['args'], entry['cmd'], output, entry['wallTime'], entry['cpuTime'], entry['peakRss'])
+
+
+class ResultCache(object):
+   '''
+   A cache of test results, stored as JSON files in a directory.
+
+   A result is addressed by a hash of everything the outcome of the test
+   depends on: the kind and name of the test, the fingerprint of its tool
+   (see `testing.tool.Tool.getFingerprint`), and the cache key of the test
+   (see `TestCase.getCacheKey`). Entries are never invalidated; a change
+   to any of those inputs gives a different address instead.
+   '''
+
+   def __init__(self, directory):
+      self.directory = directory
+      self.fingerprints = {}
+
+   def getKey(self, test):
+      '''Returns the address of the result of a test, or None if it cannot be cached.'''
+
+      testKey = test.getCacheKey()
+      if testKey is None or test.tool is None:
+         return None
+      if id(test.tool) not in self.fingerprints:
+         self.fingerprints[id(test.tool)] = test.tool.getFingerprint()
+      fingerprint = self.fingerprints[id(test.tool)]
+      if fingerprint is None:
+         return None
+      h = hashlib.sha256()
+      for part in [type(test).__name__, test.name, fingerprint] + testKey:
+         h.update(part.encode('utf-8') + b'\0')
+      return h.hexdigest()
+
+   def getPath(self, key):
+      return os.path.join(self.directory, key[:2], key + '.json')
+
+   def get(self, key):
+      '''Returns the cached result with the given address, or None.'''
+
+      try:
+         with open(self.getPath(key)) as f:
+            return json.load(f)
+      except (IOError, OSError, ValueError):
+         return None
+
+   def put(self, key, result):
+      '''Caches a result. The entry is written to a temporary file first, so readers never see a partial entry.'''
+
+      path = self.getPath(key)
+      if not os.path.isdir(os.path.dirname(path)):
+         try:
+            os.makedirs(os.path.dirname(path))
+         except OSError:
+            pass # created by another runner in the meantime
+      fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+      with os.fdopen(fd, 'w') as f:
+         json.dump(result, f)
+      os.rename(tmp, path)
 
 
 class TestSuite(object):
@@ -123,36 +264,200 @@ class TestSuite(object):
 
 
 class SuiteRunner(object):
-   '''Class for running all tests in a test suite.'''
+   '''
+   Class for running all tests in a test suite.
+
+   With more than one job, tests are run by a pool of worker threads (the
+   tools they invoke run in their own processes). The output of each test
+   is buffered and printed once the test and all the tests before it have
+   run, so it is printed in the same order as when running one test at a
+   time.
+   '''
 
-   def __init__(self, testSuite, mcommand=1, mreturn=1, mstderr=1, mstdout=1):
+   def __init__(self, testSuite, mcommand=1, mreturn=1, mstderr=1, mstdout=1, jobs=1, cache=None):
       self.testSuite = testSuite
       self.mcommand = mcommand
       self.mreturn = mreturn
       self.mstderr = mstderr
       self.mstdout = mstdout
+      self.jobs = jobs if jobs > 0 else multiprocessing.cpu_count()
+      self.cache = cache
       self.testsRun = 0
       self.testsFailed = 0
+      self.testsCached = 0
+      self.runners = []   # the runners of the tests run, in suite order
+      self.duration = None
 
    def runTests(self):
-      for test in self.testSuite.getTests():
-         runner = TestRunner(test, self.mcommand, self.mreturn, self.mstderr, self.mstdout)
-         passed = runner.runTest()
-         self.testsRun += 1
-         if not passed:
-            self.testsFailed += 1
+      start = time.time()
+      tests = list(self.testSuite.getTests())
+      if self.jobs == 1 or len(tests) <= 1:
+         for test in tests:
+            runner = TestRunner(test, self.mcommand, self.mreturn, self.mstderr, self.mstdout, cache=self.cache)
+            self.addResult(runner, runner.runTest())
+      else:
+         runners = [TestRunner(test, self.mcommand, self.mreturn, self.mstderr, self.mstdout, buffered=True, cache=self.cache) for test in tests]
+         pool = ThreadPool(min(self.jobs, len(runners)))
+         try:
+            for runner, passed in zip(runners, pool.imap(lambda r: r.runTest(), runners)):
+               for line in runner.lines:
+                  print(line)
+               self.addResult(runner, passed)
+         finally:
+            pool.close()
+            pool.join()
+      self.duration = time.time() - start
+
+   def addResult(self, runner, passed):
+      self.runners.append(runner)
+      self.testsRun += 1
+      if runner.cached:
+         self.testsCached += 1
+      if not passed:
+         self.testsFailed += 1
 
    def printSummary(self):
       print("Total tests: " + str(len(self.testSuite.tests)))
       print("Total run: " + str(self.testsRun))
       print("Tests passed: " + str(self.testsRun -  self.testsFailed))
       print("Tests failed: " + str(self.testsFailed))
-
-
-def addTestArgs(argParser):
-   '''Adds command line arguments specific for this test framework to an argument parser.'''
+      if self.testsCached:
+         print("Tests with cached results: " + str(self.testsCached))
+
+   def printSlowest(self, count):
+      '''Prints the tests that took the longest, with the resources used by the tool invocations of each.'''
+
+      slowest = sorted([r for r in self.runners if not r.cached], key=lambda r: r.duration, reverse=True)[:count]
+      if not slowest:
+         return
+      print("Slowest tests:")
+      print('{:>10} {:>10} {:>12}  {}'.format('wall (s)', 'cpu (s)', 'rss (KiB)', 'test'))
+      for runner in slowest:
+         stats = getInvocationStats(runner.test.log)
+         print('{:>10.3f} {:>10} {:>12}  {}'.format(runner.duration,
+                                                    '-' if stats['cpuTime'] is None else '{:.3f}'.format(stats['cpuTime']),
+                                                    '-' if stats['peakRss'] is None else stats['peakRss'],
+                                                    runner.test.name))
+
+   def getResults(self, suiteName):
+      '''Returns the results of the tests run, as a JSON serializable dictionary.'''
+
+      tests = []
+      for runner in self.runners:
+         tests.append({ 'name': runner.test.name
+                      , 'passed': runner.testPassed
+                      , 'message': runner.failureMessage
+                      , 'time': runner.duration
+                      , 'cached': runner.cached
+                      , 'invocations': [ { 'command': logEntry.cmd
+                                         , 'returncode': logEntry.output.returncode
+                                         , 'timedOut': getattr(logEntry.output, 'timedOut', False)
+                                         , 'wallTime': logEntry.wallTime
+                                         , 'cpuTime': logEntry.cpuTime
+                                         , 'peakRss': logEntry.peakRss
+                                         } for logEntry in runner.test.log ]
+                      })
+      return { 'suite': suiteName
+             , 'time': self.duration
+             , 'total': len(self.testSuite.tests)
+             , 'run': self.testsRun
+             , 'passed': self.testsRun - self.testsFailed
+             , 'failed': self.testsFailed
+             , 'cached': self.testsCached
+             , 'tests': tests
+             }
+
+   def writeJson(self, path, suiteName):
+      '''Writes the results of the tests run to a JSON file.'''
+
+      with open(path, 'w') as f:
+         json.dump(self.getResults(suiteName), f, indent=2, sort_keys=True)
+
+   def writeJUnitXml(self, path, suiteName):
+      '''Writes the results of the tests run to a file in the JUnit XML format.'''
+
+      suite = ElementTree.Element('testsuite', name=suiteName, tests=str(self.testsRun), failures=str(self.testsFailed),
+                                  errors='0', skipped='0', time='{:.3f}'.format(self.duration or 0))
+      for runner in self.runners:
+         case = ElementTree.SubElement(suite, 'testcase', name=runner.test.name, classname=suiteName,
+                                       time='{:.3f}'.format(runner.duration or 0))
+         if not runner.testPassed:
+            failure = ElementTree.SubElement(case, 'failure', message=runner.failureMessage or 'FAILED')
+            failure.text = '\n'.join(runner.lines)
+         elif runner.lines:
+            ElementTree.SubElement(case, 'system-out').text = '\n'.join(runner.lines)
+      ElementTree.ElementTree(suite).write(path, encoding='utf-8', xml_declaration=True)
+
+
+def getInvocationStats(log):
+   '''
+   Returns the total wall and CPU time and the largest peak RSS of a list of
+   tool invocation logs. Values that were not measured are None.
+   '''
+
+   def total(values, combine):
+      values = [v for v in values if v is not None]
+      return combine(values) if values else None
+   return { 'wallTime': total([l.wallTime for l in log], sum)
+          , 'cpuTime': total([l.cpuTime for l in log], sum)
+          , 'peakRss': total([l.peakRss for l in log], max)
+          }
+
+
+def addTestArgs(argParser, parallel=True, cached=True, limitOutput=True):
+   '''
+   Adds command line arguments specific for this test framework to an
+   argument parser. Suites whose tests must run one at a time set
+   `parallel` to False, which leaves out `--jobs`. Suites that cannot cache
+   their results or limit the output kept from their tools set `cached` or
+   `limitOutput` to False, which leaves out `--cache-dir`, or `--max-output`
+   and `--spill-dir`, so that these options are rejected.
+   '''
 
    argParser.add_argument('--mcommand', dest='MCOMMAND', type=int, default=1)
    argParser.add_argument('--mreturn', dest='MRETURN', type=int, default=1)
    argParser.add_argument('--mstderr', dest='MSTDERR', type=int, default=1)
    argParser.add_argument('--mstdout', dest='MSTDOUT', type=int, default=1)
+   if parallel:
+      argParser.add_argument('--jobs', '-j', dest='JOBS', type=int, default=1,
+                             help='number of tests run in parallel (0 for the number of CPUs)')
+   argParser.add_argument('--slowest', dest='SLOWEST', type=int, default=0,
+                          help='print the N slowest tests')
+   argParser.add_argument('--json', dest='JSON', type=str, default=None,
+                          help='write the test results to a JSON file')
+   argParser.add_argument('--junit-xml', dest='JUNITXML', type=str, default=None,
+                          help='write the test results to a JUnit XML file')
+   if cached:
+      argParser.add_argument('--cache-dir', dest='CACHEDIR', type=str, default=None,
+                             help='directory caching test results; tests whose inputs did not change are not run again')
+   argParser.add_argument('--timeout', dest='TIMEOUT', type=float, default=None,
+                          help='kill a tool invocation running for more than this many seconds')
+   if limitOutput:
+      argParser.add_argument('--max-output', dest='MAXOUTPUT', type=int, default=1024 * 1024,
+                             help='maximum number of bytes of each output stream of a tool invocation kept in memory')
+      argParser.add_argument('--spill-dir', dest='SPILLDIR', type=str, default=None,
+                             help='directory to write the complete output of tool invocations exceeding --max-output to')
+
+
+def getToolOptions(args):
+   '''Returns the tool options set by the arguments added by `addTestArgs`, as keyword arguments of `testing.tool.Tool`.'''
+
+   return dict(timeout=args['TIMEOUT'], maxOutput=args.get('MAXOUTPUT'), spillDir=args.get('SPILLDIR'))
+
+
+def getResultCache(args):
+   '''Returns the result cache set by the arguments added by `addTestArgs`, or None.'''
+
+   return ResultCache(args['CACHEDIR']) if args.get('CACHEDIR') else None
+
+
+def reportResults(runner, args, suiteName):
+   '''Prints the slowest tests run by a suite runner and writes its results, as requested by the arguments added by `addTestArgs`.'''
+
+   if args['SLOWEST'] > 0:
+      print('')
+      runner.printSlowest(args['SLOWEST'])
+   if args['JSON']:
+      runner.writeJson(args['JSON'], suiteName)
+   if args['JUNITXML']:
+      runner.writeJUnitXml(args['JUNITXML'], suiteName)
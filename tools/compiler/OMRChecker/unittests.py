@@ -0,0 +1,213 @@
+#! /usr/bin/python
+
+###############################################################################
+# Copyright (c) 2026, 2026 IBM Corp. and others
+#
+# This program and the accompanying materials are made available under
+# the terms of the Eclipse Public License 2.0 which accompanies this
+# distribution and is available at https://www.eclipse.org/legal/epl-2.0/
+# or the Apache License, Version 2.0 which accompanies this distribution and
+# is available at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# This Source Code may also be made available under the following
+# Secondary Licenses when the conditions for such availability set
+# forth in the Eclipse Public License, v. 2.0 are satisfied: GNU
+# General Public License, version 2 with the GNU Classpath
+# Exception [1] and GNU General Public License, version 2 with the
+# OpenJDK Assembly Exception [2].
+#
+# [1] https://www.gnu.org/software/classpath/license.html
+# [2] http://openjdk.java.net/legal/assembly-exception.html
+#
+# SPDX-License-Identifier: EPL-2.0 OR Apache-2.0 OR GPL-2.0 WITH Classpath-exception-2.0 OR LicenseRef-GPL-2.0 WITH Assembly-exception
+###############################################################################
+
+'''Unit tests for the helpers of the checker test and lint drivers.'''
+
+import os
+import shutil
+import tempfile
+import unittest
+import test
+import lint
+import testing.tool as tool
+
+
+class SplitDiagnosticsTest(unittest.TestCase):
+   '''Tests for splitting the diagnostics of a batch of input files by file.'''
+
+   def split(self, lines, filePaths=['a.cpp', 'b.cpp']):
+      return test.splitDiagnostics(''.join(line + '\n' for line in lines), filePaths)
+
+   def test_located(self):
+      result = self.split(['a.cpp:1:2: error: bad', '  int x', '  ^',
+                           'b.cpp:3:1: warning: odd',
+                           '1 error generated.'])
+      self.assertEqual((True, 'a.cpp:1:2: error: bad\n  int x\n  ^\n'), result['a.cpp'])
+      self.assertEqual((False, 'b.cpp:3:1: warning: odd\n1 error generated.\n'), result['b.cpp'])
+
+   def test_include_stack(self):
+      result = self.split(['In file included from b.cpp:1:',
+                           'In file included from ./h1.hpp:2:',
+                           './h2.hpp:3:1: error: bad'])
+      self.assertEqual((False, ''), result['a.cpp'])
+      self.assertTrue(result['b.cpp'][0])
+      self.assertEqual(3, result['b.cpp'][1].count('\n'))
+
+   def test_repeated_include_stack(self):
+      # clang does not print the include stack again for a second
+      # diagnostic in the same header
+      result = self.split(['In file included from b.cpp:1:',
+                           './h.hpp:3:1: warning: odd',
+                           './h.hpp:4:1: error: bad',
+                           'a.cpp:5:1: error: bad'])
+      self.assertEqual((True, 'a.cpp:5:1: error: bad\n'), result['a.cpp'])
+      self.assertEqual((True, 'In file included from b.cpp:1:\n./h.hpp:3:1: warning: odd\n./h.hpp:4:1: error: bad\n'),
+                       result['b.cpp'])
+
+   def test_include_root_reset(self):
+      # a diagnostic in an input file ends the last include stack
+      self.assertEqual(None, self.split(['In file included from b.cpp:1:',
+                                         './h.hpp:3:1: error: bad',
+                                         'a.cpp:5:1: error: bad',
+                                         './h.hpp:4:1: error: bad']))
+
+   def test_note(self):
+      result = self.split(['a.cpp:1:2: error: bad', './h.hpp:3:1: note: declared here'])
+      self.assertEqual((True, 'a.cpp:1:2: error: bad\n./h.hpp:3:1: note: declared here\n'), result['a.cpp'])
+
+   def test_ambiguous(self):
+      self.assertEqual(None, self.split(['./h.hpp:3:1: error: bad']))
+      self.assertEqual(None, self.split(['In file included from c.cpp:1:', './h.hpp:3:1: error: bad']))
+      self.assertEqual(None, self.split(['a.cpp:1:2: error: bad', 'clang: error: linker command failed']))
+      self.assertEqual(None, self.split(['1 error generated.']))
+
+
+class LintCommandTest(unittest.TestCase):
+   '''Tests for reading compile commands and diagnostics.'''
+
+   def test_get_lint_command(self):
+      args = ['g++', '-c', '-o', 'a.o', '-MD', '-MF', 'a.d', '-Iinc', '-oa2.o', '-MTa.o', 'a.cpp', '-DX']
+      self.assertEqual(['g++', '-Iinc', '-DX'], lint.getLintCommand(args, 'a.cpp'))
+      self.assertEqual(['clang++', '-Iinc', '-DX'], lint.getLintCommand(args, 'a.cpp', 'clang++'))
+
+   def test_parse_diagnostics(self):
+      stderr = ('In file included from a.cpp:1:\n'
+                './h.hpp:2:3: warning: unused\n'
+                '  int x;\n'
+                '  ^\n'
+                './h.hpp:1:1: note: declared here\n'
+                'a.cpp:5:1: error: bad\n'
+                'clang: error: no such file\n'
+                '1 warning and 2 errors generated.\n')
+      diagnostics = lint.parseDiagnostics(stderr, '/src')
+      self.assertEqual([ (('/src/h.hpp', '2', '3', 'warning', 'unused'), 'warning')
+                       , (('/src/a.cpp', '5', '1', 'error', 'bad'), 'error')
+                       , (('clang: error: no such file',), 'error')
+                       ], [(key, severity) for key, severity, line, text in diagnostics])
+      self.assertEqual('./h.hpp:2:3: warning: unused', diagnostics[0][2])
+      self.assertEqual('In file included from a.cpp:1:\n./h.hpp:2:3: warning: unused\n  int x;\n  ^\n./h.hpp:1:1: note: declared here',
+                       diagnostics[0][3])
+      self.assertEqual('a.cpp:5:1: error: bad', diagnostics[1][3])
+
+
+class IncrementalLintTest(unittest.TestCase):
+   '''Tests for the lint cache, dependency files and include graph.'''
+
+   def setUp(self):
+      self.dir = tempfile.mkdtemp()
+
+   def tearDown(self):
+      shutil.rmtree(self.dir)
+
+   def writeFile(self, name, text):
+      path = os.path.join(self.dir, name)
+      with open(path, 'w') as f:
+         f.write(text)
+      return path
+
+   def test_read_dependencies(self):
+      path = self.writeFile('a.d', 'a.o: a.cpp foo\\ bar.h \\\n  ../inc/b.h\n')
+      self.assertEqual(['/src/a.cpp', '/src/foo bar.h', '/inc/b.h'], lint.readDependencies(path, '/src'))
+      self.assertEqual([], lint.readDependencies(self.writeFile('b.d', 'b.o:\n'), '/src'))
+
+   def test_lint_cache(self):
+      header = self.writeFile('a.hpp', 'int x;\n')
+      job = lint.LintJob(os.path.join(self.dir, 'a.cpp'), ['clang++'], self.dir)
+      log = tool.ToolExecutionLog([job.path], ['clang++'], tool.ToolOutput(1, b'a.cpp:1:1: error: bad\n', b''))
+      cache = lint.LintCache(os.path.join(self.dir, 'cache', 'lint.json'))
+      cache.store(job, 'key', log, [header])
+      cache.save()
+
+      cache = lint.LintCache(os.path.join(self.dir, 'cache', 'lint.json'))
+      self.assertEqual(1, cache.lookup(job, 'key')['returncode'])
+      self.assertEqual(None, cache.lookup(job, 'other key'))
+      self.writeFile('a.hpp', 'int y, z;\n')
+      cache = lint.LintCache(os.path.join(self.dir, 'cache', 'lint.json'))
+      self.assertEqual(None, cache.lookup(job, 'key'))
+
+   def test_lint_cache_hash(self):
+      header = self.writeFile('a.hpp', 'int x;\n')
+      cache = lint.LintCache(os.path.join(self.dir, 'lint.json'))
+      self.assertEqual(tool.hashFile(header), cache.getHash(header))
+      self.assertEqual(None, cache.getHash(os.path.join(self.dir, 'missing.hpp')))
+
+      # files whose modification time and size are unchanged are not hashed again
+      cache = lint.LintCache(os.path.join(self.dir, 'lint.json'))
+      st = os.stat(header)
+      cache.stamps[header] = [getattr(st, 'st_mtime_ns', st.st_mtime), st.st_size, 'stale']
+      self.assertEqual('stale', cache.getHash(header))
+
+   def test_affected_jobs(self):
+      a, b, c = [lint.LintJob(os.path.join(self.dir, name), ['clang++'], self.dir) for name in ['a.cpp', 'b.cpp', 'c.cpp']]
+      h1, h2 = os.path.join(self.dir, 'h1.hpp'), os.path.join(self.dir, 'h2.hpp')
+      graph = lint.IncludeGraph(os.path.join(self.dir, 'includes.json'))
+      graph.update(a, [h1])
+      graph.update(b, [h2])
+      graph.update(c, [])
+      graph.save()
+
+      graph = lint.IncludeGraph(os.path.join(self.dir, 'includes.json'))
+      self.assertEqual([], graph.getAffectedJobs([a, b, c], []))
+      self.assertEqual([a], graph.getAffectedJobs([a, b, c], [h1]))
+      self.assertEqual([b, c], graph.getAffectedJobs([a, b, c], [h2, c.path]))
+      b.command = ['clang++', '-DX']
+      d = lint.LintJob(os.path.join(self.dir, 'd.cpp'), ['clang++'], self.dir)
+      self.assertEqual([b, d], graph.getAffectedJobs([a, b, c, d], []))
+
+
+class OutputCaptureTest(unittest.TestCase):
+   '''Tests for capturing the output streams of a tool.'''
+
+   def setUp(self):
+      self.dir = tempfile.mkdtemp()
+
+   def tearDown(self):
+      shutil.rmtree(self.dir)
+
+   def capture(self, data, maxOutput=None, spillDir=None):
+      r, w = os.pipe()
+      capture = tool.OutputCapture(os.fdopen(r, 'rb'), 'stderr', maxOutput, spillDir)
+      os.write(w, data)
+      os.close(w)
+      return capture.getOutput(), capture.getPath()
+
+   def test_complete(self):
+      self.assertEqual((b'0123456789', None), self.capture(b'0123456789'))
+      self.assertEqual((b'0123456789', None), self.capture(b'0123456789', 10))
+
+   def test_truncated(self):
+      output, path = self.capture(b'0123456789', 4)
+      self.assertEqual(b'0123\n[stderr truncated: 6 of 10 bytes not shown]\n', output)
+      self.assertEqual(None, path)
+
+   def test_spilled(self):
+      output, path = self.capture(b'0123456789', 4, self.dir)
+      self.assertEqual(self.dir, os.path.dirname(path))
+      self.assertEqual(b'0123\n[stderr truncated: 6 of 10 bytes not shown; complete stderr in ' + path.encode('utf-8') + b']\n', output)
+      with open(path, 'rb') as f:
+         self.assertEqual(b'0123456789', f.read())
+
+
+if __name__ == '__main__':
+   unittest.main()
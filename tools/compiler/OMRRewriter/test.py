@@ -24,8 +24,10 @@
 
 import sys
 import os
+import shutil
+import difflib
 import argparse
-import subprocess
+import tempfile
 import testing.gen_data as gen_data
 import testing.tool as tool
 import testing.tooltester as tooltester
@@ -39,25 +41,61 @@ tooltester.addTestArgs(arg_parser)
 class OMRRewriter(tool.Tool):
    '''A wrapper providing an interface for interacting with OMRRewriter.'''
 
-   def __init__(self, rewriter):
+   def __init__(self, rewriter, **options):
       base = [rewriter]
-      super(OMRRewriter, self).__init__(lambda args: base + args[0] + ['--', '-std=c++0x', '-w'] + args[1], {'OMR_REWRITE_TRACE':'1'})
-      
-      
-class OMRRewriterOutputChecker(tool.Tool):
-   '''A wrapper providing an interface for interacting with the diff command.'''
+      super(OMRRewriter, self).__init__(lambda args: base + args[0] + ['--', '-std=c++0x', '-w'] + args[1], {'OMR_REWRITE_TRACE':'1'}, **options)
+      self.rewriter = rewriter
+
+   def getFingerprint(self):
+      return '\n'.join([tool.hashFile(self.rewriter)] + self.cmdBuilder([[], []]) + sorted(k + '=' + v for k, v in self.env.items()))
 
-   def __init__(self):
-      super(OMRRewriterOutputChecker, self).__init__(lambda f: ['diff', '-s', f + '.OMRRewritten', f + '.fixed'])
 
 
 class RewriterTestCase(tooltester.TestCase):
+   '''
+   Base class for rewriter test cases. The rewriter writes its output next
+   to the file it rewrites, so each test rewrites a copy of its input in a
+   temporary directory of its own (`workDir`), which `check` runs in. The
+   tests can then run concurrently, and do not write to the source tree.
+   '''
+
    def __init__(self, inputFilePath, checker):
       super(RewriterTestCase, self).__init__('[' + inputFilePath  + ']', checker)
       self.inputFilePath = inputFilePath
    
-   def invokeRewriter(self, filePath):
+   def getCacheKey(self):
+      # the expected output is an input of the test too
+      fixed = self.inputFilePath + '.fixed'
+      return [tool.hashFile(self.inputFilePath), tool.hashFile(fixed) if os.path.exists(fixed) else '']
+
+   def run(self):
+      self.workDir = tempfile.mkdtemp(prefix='OMRRewriter-')
+      try:
+         self.check()
+      finally:
+         shutil.rmtree(self.workDir)
+
+   def check(self):
+      pass
+
+   def invokeRewriter(self):
+      '''Runs the rewriter on a copy of the input, returning the path of the output it would write.'''
+
+      filePath = os.path.join(self.workDir, os.path.basename(self.inputFilePath))
+      shutil.copyfile(self.inputFilePath, filePath)
       self.invokeTool([[filePath],[]])
+      return filePath + '.OMRRewritten'
+
+   def assertSameContents(self, expectedPath, actualPath, msg=None):
+      with open(expectedPath, 'rb') as f:
+         expected = f.read()
+      with open(actualPath, 'rb') as f:
+         actual = f.read()
+      if expected != actual:
+         diff = difflib.unified_diff(expected.decode('utf-8', 'replace').splitlines(True),
+                                     actual.decode('utf-8', 'replace').splitlines(True),
+                                     os.path.basename(expectedPath), os.path.basename(actualPath))
+         self.assertTrue(False, (msg if msg is not None else "") + "\n" + "".join(diff))
 
 
 class TestOutputFile(RewriterTestCase):
@@ -66,14 +104,11 @@ class TestOutputFile(RewriterTestCase):
    def __init__(self, inputFilePath, rewriter=None):
       super(TestOutputFile, self).__init__(inputFilePath, rewriter)
 
-   def run(self):
-      self.invokeRewriter(self.inputFilePath)
+   def check(self):
+      outputFilePath = self.invokeRewriter()
       self.assertOutput(lambda output: 0 == output.returncode, 'return code was not zero.')
-      self.assertTrue(os.path.exists(self.inputFilePath + '.OMRRewritten'), 'expected ' + self.inputFilePath + '.OMRRewritten file to be generated.')
-      check = OMRRewriterOutputChecker()
-      log = check.call(self.inputFilePath)
-      self.assertEqual(0, log.output.returncode, 'output file was not same as expected.')
-      subprocess.call(['rm', '-f', self.inputFilePath + '.OMRRewritten'])
+      self.assertTrue(os.path.exists(outputFilePath), 'expected ' + self.inputFilePath + '.OMRRewritten file to be generated.')
+      self.assertSameContents(self.inputFilePath + '.fixed', outputFilePath, 'output file was not same as expected.')
       
       
 class TestNoOutputFile(RewriterTestCase):
@@ -82,17 +117,17 @@ class TestNoOutputFile(RewriterTestCase):
    def __init__(self, inputFilePath, rewriter=None):
       super(TestNoOutputFile, self).__init__(inputFilePath, rewriter)
 
-   def run(self):
-      self.invokeRewriter(self.inputFilePath)
+   def check(self):
+      outputFilePath = self.invokeRewriter()
       self.assertOutput(lambda output: 0 == output.returncode, 'return code was not zero.')
-      self.assertFalse(os.path.exists(self.inputFilePath + '.OMRRewritten'), 'unexpected file generated: ' + self.inputFilePath + '.OMRRewriter')
+      self.assertFalse(os.path.exists(outputFilePath), 'unexpected file generated: ' + self.inputFilePath + '.OMRRewritten')
 
 
 if __name__ == '__main__':
    args = arg_parser.parse_args(sys.argv[1:])
    args = vars(args)
 
-   checker = OMRRewriter(args['REWRITER'])
+   checker = OMRRewriter(args['REWRITER'], **tooltester.getToolOptions(args))
 
    iscpp = (lambda fileName: fileName[-3:] == 'cpp')
    goodNoFix = gen_data.genFileList('testing/input/good_no_fix', iscpp)
@@ -105,9 +140,11 @@ if __name__ == '__main__':
             [TestNoOutputFile(inputFilePath) for inputFilePath in badWithoutFix]
 
    testSuite = tooltester.TestSuite(checker, tests)
-   runner = tooltester.SuiteRunner(testSuite, args['MCOMMAND'], args['MRETURN'], args['MSTDERR'], args['MSTDOUT'])
+   runner = tooltester.SuiteRunner(testSuite, args['MCOMMAND'], args['MRETURN'], args['MSTDERR'], args['MSTDOUT'], args['JOBS'],
+                                   tooltester.getResultCache(args))
    runner.runTests()
 
    runner.printSummary()
+   tooltester.reportResults(runner, args, 'OMRRewriter')
    if runner.testsFailed != 0:
       exit(1)